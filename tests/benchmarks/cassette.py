@@ -0,0 +1,174 @@
+import base64
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from botocore.awsrequest import AWSResponse
+from botocore.httpsession import URLLib3Session
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPResponse
+
+from tests.clients import get_s3_client, get_session
+from tests.config import Config
+
+# Query parameters which are credentials, left out of the keys and never written to the cassette
+SENSITIVE_PARAMS = {'api_key', 'key', 'token', 'X-Amz-Credential', 'X-Amz-Signature', 'X-Amz-Security-Token'}
+# Settings naming the services, recorded with the cassette so a replay calls the same URLs
+CASSETTE_HOSTS = ['PENNSIEVE_API_HOST', 'SCICRUNCH_API_HOST', 'BIOLUCIDA_ENDPOINT', 'NEUROLUCIDA_HOST', 'AWS_S3_ENDPOINT']
+# Headers which no longer apply to the decoded body, or describe the connection
+SKIPPED_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding', 'connection'}
+
+def cassette_key(method, url, body=None):
+    parts = urlsplit(url)
+    query = urlencode(sorted((name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+                             if name not in SENSITIVE_PARAMS))
+    if isinstance(body, str):
+        body = body.encode('utf-8')
+    digest = hashlib.sha256(body or b'').hexdigest()[:16]
+    return f'{method.upper()} {parts.scheme}://{parts.netloc}{parts.path}?{query} {digest}'
+
+
+class CassetteMiss(Exception):
+    pass
+
+
+class RawBody(object):
+    # What botocore reads the body of an AWSResponse from
+    def __init__(self, body):
+        self.body = body
+
+    def stream(self, **kwargs):
+        yield self.body
+
+
+class Cassette(object):
+    '''
+    Recorded responses of the HTTP and S3 calls made by the suites, stored as
+    JSON lines in cassette.jsonl with the recorded hosts in cassette.json.
+    In record mode the calls go to the services and their responses are added,
+    in replay mode they are served from the cassette after the injected latency
+    and a call which was not recorded raises CassetteMiss.
+    '''
+
+    def __init__(self, path, mode='replay', latency=0):
+        self.path = path
+        self.mode = mode
+        self.latency = latency
+        self.entries = {}
+        self.recorded = []
+        self.hosts = {}
+        self.calls = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+        self.s3Session = None
+
+        if os.path.exists(os.path.join(path, 'cassette.json')):
+            with open(os.path.join(path, 'cassette.json')) as infile:
+                self.hosts = json.load(infile)['Hosts']
+        if os.path.exists(os.path.join(path, 'cassette.jsonl')):
+            with open(os.path.join(path, 'cassette.jsonl')) as infile:
+                for line in infile:
+                    entry = json.loads(line)
+                    self.entries[entry['Key']] = entry
+
+    def lookup(self, key):
+        with self.lock:
+            self.calls = self.calls + 1
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses = self.misses + 1
+        if entry is None:
+            raise CassetteMiss(f'Not in the cassette: {key}')
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        if 'Base64' in entry:
+            body = base64.b64decode(entry['Base64'])
+        else:
+            body = entry['Body'].encode('utf-8')
+
+        return entry['Status'], entry['Headers'], body
+
+    def record(self, key, status, headers, body):
+        entry = {
+            'Key': key,
+            'Status': status,
+            'Headers': {name: value for name, value in headers.items() if name.lower() not in SKIPPED_HEADERS}
+        }
+        try:
+            entry['Body'] = body.decode('utf-8')
+        except UnicodeDecodeError:
+            entry['Base64'] = base64.b64encode(body).decode('ascii')
+
+        with self.lock:
+            self.calls = self.calls + 1
+            if key not in self.entries:
+                self.recorded.append(entry)
+            self.entries[key] = entry
+
+    # S3 calls are intercepted just before botocore sends them
+    def send_s3(self, request, **kwargs):
+        key = cassette_key(request.method, request.url, request.body)
+        if self.mode == 'replay':
+            status, headers, body = self.lookup(key)
+            return AWSResponse(request.url, status, headers, RawBody(body))
+
+        if self.s3Session is None:
+            self.s3Session = URLLib3Session(max_pool_connections=Config.S3_POOL_CONNECTIONS)
+        response = self.s3Session.send(request)
+        self.record(key, response.status_code, dict(response.headers), response.content)
+        return response
+
+    def save(self):
+        os.makedirs(self.path, exist_ok=True)
+        with self.lock:
+            with open(os.path.join(self.path, 'cassette.jsonl'), 'a') as outfile:
+                for entry in self.recorded:
+                    outfile.write(json.dumps(entry) + '\n')
+            self.recorded = []
+            with open(os.path.join(self.path, 'cassette.json'), 'w') as outfile:
+                json.dump({'Hosts': {name: getattr(Config, name) for name in CASSETTE_HOSTS}}, outfile, indent=4)
+
+    def stats(self):
+        return {
+            'Calls': self.calls,
+            'Misses': self.misses,
+            'Entries': len(self.entries),
+            'InjectedLatency': round(self.calls * self.latency, 3) if self.mode == 'replay' else 0
+        }
+
+
+class CassetteAdapter(HTTPAdapter):
+    # Transport adapter of the shared session, records or replays every HTTP call
+    def __init__(self, cassette, **kwargs):
+        self.cassette = cassette
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        key = cassette_key(request.method, request.url, request.body)
+        if self.cassette.mode == 'replay':
+            status, headers, body = self.cassette.lookup(key)
+            raw = HTTPResponse(body=io.BytesIO(body), headers=headers, status=status, preload_content=False)
+            return self.build_response(request, raw)
+
+        response = super().send(request, **kwargs)
+        self.cassette.record(key, response.status_code, dict(response.headers), response.content)
+        return response
+
+# Route the calls of the shared HTTP session and S3 client through the cassette
+def install_cassette(cassette):
+    adapter = CassetteAdapter(
+        cassette,
+        pool_connections=Config.HTTP_POOL_CONNECTIONS,
+        pool_maxsize=Config.HTTP_POOL_MAXSIZE
+    )
+    session = get_session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    get_s3_client().meta.events.register('before-send.s3', cassette.send_s3)
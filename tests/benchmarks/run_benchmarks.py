@@ -0,0 +1,144 @@
+'''
+Offline benchmarks of the slow suites.
+
+Record the calls of the suites once against the live services:
+
+  python -m tests.benchmarks.run_benchmarks --mode record
+
+then time the suites against the recorded responses, with no network:
+
+  python -m tests.benchmarks.run_benchmarks --latency 20
+
+Every suite runs in its own process and working directory under
+reports/benchmarks/<suite>, the results are written to reports/benchmarks.json.
+'''
+
+import argparse
+import importlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+import unittest
+
+from contextlib import redirect_stdout
+
+from tests.benchmarks.cassette import Cassette, install_cassette
+from tests.config import REQUIRED, SETTINGS
+from tests.timing import StageTimer
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+SUITES = {
+    'datasets': ('tests.slow_tests.test_datasets_tests', 'SciCrunchDatasetFilesTest'),
+    'biolucida': ('tests.slow_tests.biolucida_tests', 'BiolucidaDatasetFilesTest'),
+    'segmentation': ('tests.slow_tests.segmentation_tests', 'SegmentationDatasetFilesTest'),
+    'plot': ('tests.slow_tests.plot_tests', 'PlotDatasetFilesTest'),
+}
+
+# Every run starts from scratch, without the snapshot, caches or reports of a previous run
+BENCHMARK_ENVIRONMENT = {
+    'SCICRUNCH_SNAPSHOT': 'reports/scicrunch_snapshot.jsonl',
+    'PENNSIEVE_CACHE': 'reports/pennsieve_cache.sqlite',
+    'INCREMENTAL_VALIDATION': '',
+    'REPORT_RESUME': '',
+}
+
+def prepare_environment(cassette):
+    os.environ.update(BENCHMARK_ENVIRONMENT)
+    if cassette.mode == 'replay':
+        # Nothing leaves the machine, the credentials only need to be set
+        for name, (default, _) in SETTINGS.items():
+            if default is REQUIRED:
+                os.environ.setdefault(name, 'benchmark')
+        for name, value in cassette.hosts.items():
+            os.environ[name] = value
+
+def run_suite(name, args):
+    cassette = Cassette(args.cassette, args.mode, args.latency / 1000)
+    prepare_environment(cassette)
+
+    workPath = os.path.join(args.output, name)
+    shutil.rmtree(workPath, ignore_errors=True)
+    os.makedirs(workPath)
+    os.chdir(workPath)
+
+    moduleName, caseName = SUITES[name]
+    module = importlib.import_module(moduleName)
+    install_cassette(cassette)
+    timer = StageTimer()
+    timer.wrap(module, module.PROFILED_FUNCTIONS)
+    timer.wrap_iterator(module, 'get_snapshot_datasets', 'Datasets')
+
+    suite = unittest.defaultTestLoader.loadTestsFromTestCase(getattr(module, caseName))
+    start = time.perf_counter()
+    with open('benchmark.log', 'w') as log, redirect_stdout(log):
+        result = unittest.TextTestRunner(stream=log, verbosity=2).run(suite)
+    seconds = time.perf_counter() - start
+
+    if args.mode == 'record':
+        cassette.save()
+
+    return {
+        'Suite': name,
+        'Mode': args.mode,
+        'Latency': args.latency,
+        'Seconds': round(seconds, 3),
+        'Failures': len(result.failures),
+        'Errors': len(result.errors),
+        'Stages': timer.stats(),
+        'Cassette': cassette.stats(),
+        'Log': os.path.join(workPath, 'benchmark.log')
+    }
+
+def print_result(result):
+    print(f"{result['Suite']}: {result['Seconds']}s, {result['Cassette']['Calls']} calls, "
+          f"{result['Cassette']['Misses']} misses, {result['Failures']} failures, {result['Errors']} errors")
+    for stage, stats in result['Stages'].items():
+        print(f"  {stage:<36} {stats['Count']:>8} {stats['Seconds']:>10.3f}s")
+
+def main():
+    parser = argparse.ArgumentParser(description='Time the slow suites against recorded responses.')
+    parser.add_argument('suites', nargs='*', help=f"Suites to run: {', '.join(SUITES)}, all of them by default")
+    parser.add_argument('--mode', choices=['replay', 'record'], default='replay')
+    parser.add_argument('--cassette', default='reports/cassette', help='Directory of the recorded responses')
+    parser.add_argument('--latency', type=float, default=0, help='Milliseconds added to every replayed call')
+    parser.add_argument('--output', default='reports/benchmarks', help='Directory of the suite runs')
+    parser.add_argument('--worker', choices=list(SUITES), help=argparse.SUPPRESS)
+    parser.add_argument('--result', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    unknown = [name for name in args.suites if name not in SUITES]
+    if unknown:
+        parser.error(f"unknown suites: {', '.join(unknown)}")
+    args.cassette = os.path.abspath(args.cassette)
+    args.output = os.path.abspath(args.output)
+
+    if args.worker:
+        with open(args.result, 'w') as outfile:
+            json.dump(run_suite(args.worker, args), outfile)
+        return
+
+    results = []
+    for name in args.suites or list(SUITES):
+        resultPath = os.path.join(args.output, f'{name}.json')
+        os.makedirs(args.output, exist_ok=True)
+        subprocess.run([
+            sys.executable, '-m', 'tests.benchmarks.run_benchmarks',
+            '--worker', name, '--result', resultPath,
+            '--mode', args.mode, '--cassette', args.cassette,
+            '--latency', str(args.latency), '--output', args.output
+        ], cwd=REPO_ROOT, check=True)
+        with open(resultPath) as infile:
+            result = json.load(infile)
+        print_result(result)
+        results.append(result)
+
+    reportOutput = os.path.join(os.path.dirname(args.output), 'benchmarks.json')
+    with open(reportOutput, 'w') as outfile:
+        json.dump(results, outfile, indent=4)
+    print(f"Benchmark results have been written to {reportOutput}")
+
+if __name__ == '__main__':
+    main()
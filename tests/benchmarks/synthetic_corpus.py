@@ -0,0 +1,221 @@
+'''
+Synthetic SciCrunch corpus for scaling the slow suites beyond the real corpus.
+
+  python -m tests.benchmarks.synthetic_corpus reports/synthetic --datasets 100000 --objects 10
+
+writes into the corpus directory:
+
+  scicrunch_snapshot.jsonl  SciCrunch hits in the snapshot format read by the slow suites
+  datasets.jsonl            per dataset, the files on Pennsieve and S3 and the images on Biolucida
+  corpus.json               the options and counts of the corpus
+
+Every dataset is generated from its own seeded random generator, so a corpus
+is reproducible and is written one dataset at a time whatever its size.
+'''
+
+import argparse
+import json
+import os
+import random
+import time
+
+from tests.scicrunch import SNAPSHOT_SOURCE, SNAPSHOT_VERSION
+
+BUCKET = 'pennsieve-prod-discover-publish-use1'
+
+PLAIN_MIMETYPES = ['text/csv', 'application/json', 'image/tiff', 'application/vnd.ms-excel']
+
+DEFAULT_OPTIONS = {
+    'datasets': 100,
+    'objects': 20,
+    # Share of the objects of each kind, the rest are plain files
+    'biolucida': 0.1,
+    'segmentation': 0.1,
+    'plot': 0.05,
+    'scaffold': 0.05,
+    # Share of the biolucida ids and segmentation paths used twice
+    'duplicates': 0.02,
+    # Share of the datacite relative paths pointing to no object
+    'broken': 0.02,
+    # Share of the files missing on Pennsieve and S3
+    'missing': 0.02,
+    # Share of the files stored under another name on Pennsieve or Biolucida
+    'mismatched': 0.02,
+    'seed': 0,
+}
+
+def mimetype(name, additional=None):
+    obj = {'mimetype': {'name': name}}
+    if additional:
+        obj['additional_mimetype'] = {'name': additional}
+    return obj
+
+def datacite(key, folder, names):
+    return {key: {
+        'path': [f'files/{folder}/{name}' for name in names],
+        'relative': {'path': names}
+    }}
+
+def file_object(folder, name, kind, **fields):
+    obj = {'name': name, 'dataset': {'path': f'{folder}/{name}'}}
+    obj.update(kind)
+    obj.update(fields)
+    return obj
+
+def scaffold_objects(folder, index):
+    meta = f'scaffold_{index}.json'
+    view = f'scaffold_{index}_view.json'
+    thumbnail = f'scaffold_{index}_thumbnail.jpeg'
+    return [
+        file_object(folder, meta, mimetype('application/json', 'inode/vnd.abi.scaffold+file'),
+                    datacite=datacite('isSourceOf', folder, [view])),
+        file_object(folder, view, mimetype('application/json', 'inode/vnd.abi.scaffold.view+file'),
+                    datacite={**datacite('isSourceOf', folder, [thumbnail]), **datacite('isDerivedFrom', folder, [meta])}),
+        file_object(folder, thumbnail, mimetype('image/jpeg', 'inode/vnd.abi.scaffold+thumbnail'),
+                    datacite=datacite('isDerivedFrom', folder, [view])),
+        file_object(folder, f'context_{index}.json', mimetype('application/json', 'application/x.vnd.abi.context-information+json')),
+    ]
+
+def plot_objects(folder, index):
+    plot = f'plot_{index}.csv'
+    thumbnail = f'plot_{index}_thumbnail.jpeg'
+    return [
+        file_object(folder, plot, mimetype('text/csv', 'text/vnd.abi.plot+csv'),
+                    datacite=datacite('isSourceOf', folder, [thumbnail])),
+        file_object(folder, thumbnail, mimetype('image/jpeg', 'image/x.vnd.abi.thumbnail+jpeg'),
+                    datacite=datacite('isDerivedFrom', folder, [plot])),
+    ]
+
+def break_paths(rng, options, obj):
+    for relation in obj.get('datacite', {}).values():
+        paths = relation['relative']['path']
+        for position in range(len(paths)):
+            if rng.random() < options['broken']:
+                paths[position] = f'missing_{rng.randrange(10 ** 6)}.jpeg'
+
+# The SciCrunch hit and the Pennsieve, S3 and Biolucida state of a dataset
+def generate_dataset(index, options):
+    rng = random.Random(f"{options['seed']}-{index}")
+    dataset_id = str(index + 1)
+    version = rng.randint(1, 5)
+    objects = []
+    images = []
+    segmentations = []
+    scaffold = False
+
+    count = max(1, int(rng.expovariate(1 / options['objects'])))
+    while len(objects) < count:
+        folder = f'primary/sub-{rng.randrange(10)}/sam-{rng.randrange(10)}'
+        kind = rng.random()
+        position = len(objects)
+        if kind < options['biolucida']:
+            name = f'image_{position}.{rng.choice(["jp2", "jpx"])}'
+            if images and rng.random() < options['duplicates']:
+                image_id = rng.choice(images)['image_id']
+            else:
+                image_id = f'{dataset_id}{position:06d}'
+                imageName = f'renamed_{name}' if rng.random() < options['mismatched'] else name
+                images.append({'image_id': image_id, 'name': imageName, 'status': 'success'})
+            objects.append(file_object(folder, name, mimetype(f'image/{name[-3:]}', f'image/vnd.ome.xml+{name[-3:]}'),
+                                       biolucida={'identifier': image_id}))
+        elif kind < options['biolucida'] + options['segmentation']:
+            name = f'segmentation_{position}.xml'
+            if segmentations and rng.random() < options['duplicates']:
+                folder, name = rng.choice(segmentations)
+            segmentations.append((folder, name))
+            objects.append(file_object(folder, name, mimetype('application/xml', 'application/vnd.mbfbioscience.neurolucida+xml')))
+        elif kind < options['biolucida'] + options['segmentation'] + options['plot']:
+            objects.extend(plot_objects(folder, position))
+        elif kind < options['biolucida'] + options['segmentation'] + options['plot'] + options['scaffold']:
+            objects.extend(scaffold_objects(folder, position))
+            scaffold = True
+        else:
+            name = f'file_{position}.dat'
+            objects.append(file_object(folder, name, mimetype(rng.choice(PLAIN_MIMETYPES))))
+
+    files = []
+    for obj in objects:
+        break_paths(rng, options, obj)
+        if rng.random() < options['missing']:
+            continue
+        path = f"files/{obj['dataset']['path']}"
+        if rng.random() < options['mismatched']:
+            path = path.replace('/sam-', '/sample-')
+        files.append({
+            'path': path,
+            'name': path.rsplit('/', 1)[-1],
+            'uri': f's3://{BUCKET}/{dataset_id}/{path}',
+            'fileType': 'XML' if path.endswith('.xml') else 'Other',
+            'size': rng.randrange(1, 10 ** 7)
+        })
+
+    curie = f'DOI:10.26275/synthetic-{dataset_id}'
+    hit = {
+        '_id': f'synthetic-{dataset_id}',
+        '_source': {
+            'item': {
+                'curie': curie,
+                'name': f'Synthetic dataset {dataset_id}',
+                'types': [{'name': 'scaffold'}] if scaffold else []
+            },
+            'objects': objects,
+            'pennsieve': {
+                'identifier': dataset_id,
+                'version': {'identifier': version},
+                'uri': f's3://{BUCKET}/{dataset_id}'
+            }
+        },
+        'sort': [dataset_id, curie, f'synthetic-{dataset_id}']
+    }
+    state = {
+        'Dataset': dataset_id,
+        'Version': version,
+        'Bucket': BUCKET,
+        'Files': files,
+        'Images': images
+    }
+    return hit, state
+
+def write_corpus(path, options):
+    os.makedirs(path, exist_ok=True)
+    counts = {'Datasets': 0, 'Objects': 0, 'Files': 0, 'Images': 0}
+    header = {
+        'Version': SNAPSHOT_VERSION,
+        'Created': time.time(),
+        'Host': 'synthetic',
+        'Source': SNAPSHOT_SOURCE
+    }
+
+    with open(os.path.join(path, 'scicrunch_snapshot.jsonl'), 'w') as snapshotFile, \
+         open(os.path.join(path, 'datasets.jsonl'), 'w') as stateFile:
+        snapshotFile.write(json.dumps(header) + '\n')
+        # The snapshot is in the SciCrunch sort order, i.e. by identifier as a string
+        for index in sorted(range(options['datasets']), key=lambda index: str(index + 1)):
+            hit, state = generate_dataset(index, options)
+            snapshotFile.write(json.dumps(hit) + '\n')
+            stateFile.write(json.dumps(state) + '\n')
+            counts['Datasets'] = counts['Datasets'] + 1
+            counts['Objects'] = counts['Objects'] + len(hit['_source']['objects'])
+            counts['Files'] = counts['Files'] + len(state['Files'])
+            counts['Images'] = counts['Images'] + len(state['Images'])
+
+    with open(os.path.join(path, 'corpus.json'), 'w') as outfile:
+        json.dump({'Options': options, 'Counts': counts, 'Bucket': BUCKET}, outfile, indent=4)
+
+    return counts
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate a synthetic SciCrunch corpus and the matching service state.')
+    parser.add_argument('path', help='Directory of the corpus')
+    for name, default in DEFAULT_OPTIONS.items():
+        parser.add_argument(f'--{name}', type=type(default), default=default)
+    options = vars(parser.parse_args())
+    path = options.pop('path')
+
+    start = time.perf_counter()
+    counts = write_corpus(path, options)
+    print(f"Generated {counts['Datasets']} datasets, {counts['Objects']} objects in {path} "
+          f"in {time.perf_counter() - start:.1f}s")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+import threading
+import boto3
+import requests
+
+from botocore.config import Config as BotoConfig
+
+from requests.adapters import HTTPAdapter
+
+from tests.config import Config
+from tests.timing import EndpointTimer
+
+# Every call made through the shared session and S3 client is timed per endpoint
+endpointTimer = EndpointTimer()
+session = None
+sessionLock = threading.Lock()
+s3Client = None
+s3ClientLock = threading.Lock()
+
+# Shared HTTP session, keeps a pool of keep-alive connections per host so calls
+# to SciCrunch, Pennsieve, Biolucida and Neurolucida reuse their TCP+TLS connections.
+def get_session():
+    global session
+
+    with sessionLock:
+        if session is None:
+            adapter = HTTPAdapter(
+                pool_connections=Config.HTTP_POOL_CONNECTIONS,
+                pool_maxsize=Config.HTTP_POOL_MAXSIZE
+            )
+            session = requests.Session()
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            session.headers.update({
+                'Accept-Encoding': 'gzip, deflate',
+                'Connection': 'keep-alive'
+            })
+            session.hooks['response'].append(endpointTimer.record_response)
+
+    return session
+
+# Shared S3 client, boto3 clients are thread safe so one pooled client serves all
+# the suites and validation workers. AWS_S3_ENDPOINT points it at a local S3
+# compatible server instead, which is addressed path style.
+def get_s3_client():
+    global s3Client
+
+    with s3ClientLock:
+        if s3Client is None:
+            options = {
+                'max_pool_connections': Config.S3_POOL_CONNECTIONS
+            }
+            endpoint = Config.AWS_S3_ENDPOINT or None
+            if endpoint:
+                options['s3'] = {'addressing_style': 'path'}
+            s3Client = boto3.client(
+                "s3",
+                aws_access_key_id=Config.AWS_KEY,
+                aws_secret_access_key=Config.AWS_SECRET,
+                region_name="us-east-1",
+                endpoint_url=endpoint,
+                config=BotoConfig(**options)
+            )
+            s3Client.meta.events.register('before-call.s3', endpointTimer.start_s3_call)
+            s3Client.meta.events.register('after-call.s3', endpointTimer.record_s3_call)
+            s3Client.meta.events.register('after-call-error.s3', endpointTimer.record_s3_error)
+
+    return s3Client
+
+def get_endpoint_timer():
+    return endpointTimer
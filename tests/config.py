@@ -1,18 +1,58 @@
 import os
 
 
-class Config(object):
-    PENNSIEVE_API_HOST = os.environ['PENNSIEVE_API_HOST']
-    PENNSIEVE_API_SECRET = os.environ['PENNSIEVE_API_SECRET']
-    PENNSIEVE_API_TOKEN = os.environ['PENNSIEVE_API_TOKEN']
-    BIOLUCIDA_ENDPOINT = os.environ.get("BIOLUCIDA_ENDPOINT", "https://sparc.biolucida.net/api/v1")
-    SCICRUNCH_API_HOST = os.environ['SCICRUNCH_API_HOST']
-    SCICRUNCH_API_KEY = os.environ['SCICRUNCH_API_KEY']
-    SCICRUNCH_API = os.environ.get('SCICRUNCH_API', 'https://scicrunch.org/api/1')
+REQUIRED = object()
+
+def flag(value):
+    return str(value).lower() in ("1", "true", "yes")
+
+# Environment settings as name: (default, type), the REQUIRED ones have no default
+SETTINGS = {
+    'PENNSIEVE_API_HOST': (REQUIRED, str),
+    'PENNSIEVE_API_SECRET': (REQUIRED, str),
+    'PENNSIEVE_API_TOKEN': (REQUIRED, str),
+    'BIOLUCIDA_ENDPOINT': ("https://sparc.biolucida.net/api/v1", str),
+    'SCICRUNCH_API_HOST': (REQUIRED, str),
+    'SCICRUNCH_API_KEY': (REQUIRED, str),
+    'SCICRUNCH_API': ('https://scicrunch.org/api/1', str),
+    'ALGOLIA_KEY': (REQUIRED, str),
+    'ALGOLIA_ID': (REQUIRED, str),
+    'ALGOLIA_INDEX': (REQUIRED, str),
+    'AWS_KEY': (REQUIRED, str),
+    'AWS_SECRET': (REQUIRED, str),
+    'AWS_S3_ENDPOINT': ("", str),
+    'S3_POOL_CONNECTIONS': (10, int),
+    'NEUROLUCIDA_HOST': ("https://sparc.biolucida.net:8081", str),
+    'SCICRUNCH_SNAPSHOT': ("reports/scicrunch_snapshot.jsonl", str),
+    'SCICRUNCH_SNAPSHOT_MAX_AGE': (24, float),
+    'INCREMENTAL_VALIDATION': ("", flag),
+    'REPORT_RESUME': ("", flag),
+    'HTTP_POOL_CONNECTIONS': (10, int),
+    'HTTP_POOL_MAXSIZE': (10, int),
+    'VALIDATION_WORKERS': (1, int),
+    'PENNSIEVE_CACHE': ("reports/pennsieve_cache.sqlite", str),
+    'PENNSIEVE_CACHE_SIZE': (100000, int),
+    'BIOLUCIDA_CONCURRENCY': (4, int),
+    'DISCOVER_FAN_OUT': (4, int),
+    'PROFILE_SUITES': ("", flag),
+}
+
+
+class LazyConfig(type):
+    # Settings are read from the environment on first use, so the modules
+    # using them can be imported without the credentials being set.
+    def __getattr__(cls, name):
+        if name not in SETTINGS:
+            raise AttributeError(name)
+
+        default, convert = SETTINGS[name]
+        if default is REQUIRED:
+            value = os.environ[name]
+        else:
+            value = convert(os.environ.get(name, default))
+        setattr(cls, name, value)
+        return value
+
+
+class Config(object, metaclass=LazyConfig):
     SPARC_PENNSIEVE_ORGANISATION_ID = 367
-    ALGOLIA_KEY=os.environ['ALGOLIA_KEY']
-    ALGOLIA_ID=os.environ['ALGOLIA_ID']
-    ALGOLIA_INDEX=os.environ['ALGOLIA_INDEX']
-    AWS_KEY=os.environ['AWS_KEY']
-    AWS_SECRET=os.environ['AWS_SECRET']
-    NEUROLUCIDA_HOST = os.environ.get("NEUROLUCIDA_HOST", "https://sparc.biolucida.net:8081")
@@ -0,0 +1,104 @@
+import json
+import os
+import threading
+
+from itertools import combinations
+
+DOI_PREFIXES = ['doi:', 'https://doi.org/', 'http://dx.doi.org/']
+
+# DOIs are case insensitive and each source writes them slightly differently,
+# None is returned for a dataset without DOI
+def normalise_doi(doi):
+    if doi is None or not doi.strip():
+        return None
+    doi = doi.strip().lower()
+    for prefix in DOI_PREFIXES:
+        if doi.startswith(prefix):
+            return doi[len(prefix):]
+    return doi
+
+
+class DoiReconciliation(object):
+    '''
+    Normalised DOI sets of the sources being compared, e.g. Pennsieve Discover,
+    Algolia and SciCrunch. Every difference is a set operation so the whole
+    comparison is linear in the number of DOIs.
+    '''
+
+    def __init__(self):
+        self.sources = {}
+        self.details = {}
+        # Details of the datasets of each source which have no DOI
+        self.withoutDoi = {}
+        # Sources may be added from different threads
+        self.lock = threading.Lock()
+
+    def add(self, source, doi, details=None):
+        doi = normalise_doi(doi)
+        if doi is None:
+            with self.lock:
+                self.withoutDoi.setdefault(source, []).append(details or {})
+            return
+
+        with self.lock:
+            self.sources.setdefault(source, set()).add(doi)
+            if details:
+                self.details.setdefault(source, {})[doi] = details
+
+    def add_all(self, source, dois):
+        for doi in dois:
+            self.add(source, doi)
+
+    # DOIs of source which cannot be found in target
+    def missing(self, source, target):
+        return sorted(self.sources.get(source, set()) - self.sources.get(target, set()))
+
+    def describe(self, source, dois):
+        details = self.details.get(source, {})
+        return [dict(details.get(doi, {}), doi=doi) for doi in dois]
+
+    def report(self):
+        names = sorted(self.sources)
+        report = {
+            'Sources': {name: len(self.sources[name]) for name in names},
+            'Missing': {},
+            'WithoutDoi': {name: self.withoutDoi[name] for name in sorted(self.withoutDoi)}
+        }
+
+        for source, target in combinations(names, 2):
+            for a, b in [(source, target), (target, source)]:
+                missing = self.missing(a, b)
+                report['Missing'][f'{a} vs {b}'] = {
+                    'Total': len(missing),
+                    'Datasets': self.describe(a, missing)
+                }
+
+        if len(names) > 2:
+            everywhere = set.intersection(*self.sources.values())
+            report['InAll'] = len(everywhere)
+            report['OnlyIn'] = {}
+            report['MissingFrom'] = {}
+            for name in names:
+                others = [self.sources[other] for other in names if other != name]
+                only = self.sources[name] - set.union(*others)
+                report['OnlyIn'][name] = self.describe(name, sorted(only))
+                # Found in all the other sources but this one
+                absent = set.intersection(*others) - self.sources[name]
+                report['MissingFrom'][name] = sorted(absent)
+
+        return report
+
+    # Sources which could not be fetched are listed under Failed with their error,
+    # the comparison then only covers part of the DOIs and is marked as not valid
+    def write(self, path, timing=None, failed=None):
+        report = self.report()
+        report['Valid'] = not failed
+        if failed:
+            report['Failed'] = failed
+        if timing:
+            # Seconds taken to fetch each source
+            report['Timing'] = timing
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as outfile:
+            json.dump(report, outfile, indent=4)
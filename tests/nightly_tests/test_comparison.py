@@ -1,141 +1,147 @@
 import json
+import time
 import unittest
-import requests
 
 from algoliasearch.search_client import SearchClient
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin
 
+from tests.clients import get_session
 from tests.config import Config
+from tests.scicrunch import iter_doi_curies
+from tests.nightly_tests.doi_reconciliation import DoiReconciliation
+
+PENNSIEVE = 'Pennsieve'
+ALGOLIA = 'Algolia'
+SCICRUNCH = 'SciCrunch'
+
+#break the call to datasets into multiple chunks as one single call
+#seems to be breaking the tests
+DISCOVER_PAGE_SIZE = 100
+ALGOLIA_ATTRIBUTES = [
+    'item.curie',
+    'item.name'
+]
+
+
+def get_discover_json(path, params=None):
+    pennsieve_host = Config.PENNSIEVE_API_HOST + '/'
+    headers = {'accept': 'application/json'}
+
+    response = get_session().get(urljoin(pennsieve_host, path), params=params, headers=headers)
+    response.raise_for_status()
+    return response.json()
+
+def get_discover_page(offset):
+    params = {'limit': DISCOVER_PAGE_SIZE, 'offset': offset, 'embargo': False}
+    return get_discover_json('datasets', params)
+
+# Fetch the Discover datasets listing, the total is known from the first page so
+# the remaining pages are requested concurrently, along with the SPARC metrics.
+def fetch_discover_datasets(workers=None):
+    workers = workers or Config.DISCOVER_FAN_OUT
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        metrics = executor.submit(get_discover_json, f'organizations/{Config.SPARC_PENNSIEVE_ORGANISATION_ID}/datasets/metrics')
+
+        first_page = get_discover_page(0)
+        total_count = first_page['totalCount']
+        # map keeps the pages in order
+        pages = [first_page] + list(executor.map(get_discover_page, range(DISCOVER_PAGE_SIZE, total_count, DISCOVER_PAGE_SIZE)))
+
+        sparc_dataset_ids = set()
+        for dataset in metrics.result()['datasets']:
+            sparc_dataset_ids.add(dataset['id'])
+
+    datasets = []
+    for page in pages:
+        datasets.extend(page['datasets'])
+
+    return {'TotalCount': total_count, 'Datasets': datasets, 'SparcDatasetIds': sparc_dataset_ids}
+
+# Browse the whole Algolia index with its cursor, only the attributes used for
+# the comparison are retrieved, objectID is always included.
+def iter_algolia_items():
+    client = SearchClient.create(Config.ALGOLIA_ID, Config.ALGOLIA_KEY)
+    try:
+        index = client.init_index(Config.ALGOLIA_INDEX)
+        for item in index.browse_objects({'query': '', 'attributesToRetrieve': ALGOLIA_ATTRIBUTES}):
+            yield item
+    finally:
+        client.close()
 
+def add_scicrunch_dois(reconciliation):
+    reconciliation.add_all(SCICRUNCH, iter_doi_curies())
 
-SCICRUNCH_DOI_AGGREGATION = {
-    "from": 0,
-    "size": 0,
-    "aggregations": {
-        "doi": {
-            "composite": {
-                "size": 1000,
-                "sources": [
-                    {
-                        "curie": {"terms": {"field": "item.curie.aggregate"}}
-                    }
-                ],
-                "after": {"curie": ""}
-            }
-        }
-    }
-}
-
-def checkResult(client, result1, result2, name_doi_map, name):
-    not_found_doi = []
-    for test_doi in result1:
-        if f'doi:{test_doi}' not in result2:
-            not_found_doi.append(test_doi)
+def add_discover_dois(reconciliation):
+    discover = fetch_discover_datasets()
+    for dataset in discover['Datasets']:
+        if dataset['id'] in discover['SparcDatasetIds']:
+            reconciliation.add(PENNSIEVE, dataset['doi'], {'name': dataset['name'], 'id': dataset['id']})
 
-    if len(not_found_doi):
-        print(f"{name}: Not found datasets report:")
-    for doi in not_found_doi:
-        print(f"  {name_doi_map[doi]['id']} - {doi} - {name_doi_map[doi]['name']}")
-    # Can everything in discover be found on SciCrunch?
-    client.assertEqual([], not_found_doi, name)
+    return {'TotalCount': discover['TotalCount'], 'Fetched': len(discover['Datasets'])}
 
+def add_algolia_dois(reconciliation):
+    for item in iter_algolia_items():
+        reconciliation.add(ALGOLIA, item['item']['curie'], {'name': item['item']['name'], 'id': item['objectID']})
 
-class ComparisonTestCase(unittest.TestCase):
+def timed(timing, source, fetch, reconciliation):
+    start = time.perf_counter()
+    try:
+        return fetch(reconciliation)
+    finally:
+        timing[source] = round(time.perf_counter() - start, 3)
+        print(f"{source} DOIs fetched in {timing[source]}s")
 
-    def __init__(self, *args, **kwds):
-        super().__init__(*args, **kwds)
-        self.__scicrunch_doi = []
-        headers = {'accept': 'application/json'}
-        params = {'api_key': Config.SCICRUNCH_API_KEY}
+def checkResult(client, reconciliation, source, target):
+    not_found = reconciliation.describe(source, reconciliation.missing(source, target))
+    # Can everything in source be found on target?
+    client.assertEqual([], not_found, f'{source} vs {target}')
 
-        scicrunch_host = Config.SCICRUNCH_API_HOST + '/'
 
-        scicrunch_response = requests.post(urljoin(scicrunch_host, '_search'), json=SCICRUNCH_DOI_AGGREGATION, params=params, headers=headers)
-        self.assertEqual(200, scicrunch_response.status_code)
+class ComparisonTestCase(unittest.TestCase):
 
-        json_data = scicrunch_response.json()
-        aggregations = json_data['aggregations']
-        buckets = aggregations['doi']['buckets']
-        for bucket in buckets:
-            self.__scicrunch_doi.append(bucket['key']['curie'])
+    @classmethod
+    def setUpClass(cls):
+        # The three independent sources are fetched concurrently, once for all the test methods
+        cls.reconciliation = DoiReconciliation()
+        cls.timing = {}
+        fetchers = {
+            SCICRUNCH: add_scicrunch_dois,
+            PENNSIEVE: add_discover_dois,
+            ALGOLIA: add_algolia_dois
+        }
+        with ThreadPoolExecutor(max_workers=len(fetchers)) as executor:
+            cls.fetched = {source: executor.submit(timed, cls.timing, source, fetch, cls.reconciliation) for source, fetch in fetchers.items()}
+
+    @classmethod
+    def tearDownClass(cls):
+        reportOutput = 'reports/doi_comparison.json'
+        failed = {}
+        for source, fetched in cls.fetched.items():
+            if fetched.exception():
+                failed[source] = repr(fetched.exception())
+        cls.reconciliation.write(reportOutput, cls.timing, failed)
+        if failed:
+            print(f"DOI comparison is incomplete, fetching {', '.join(failed)} failed")
+        print(f"DOI comparison report has been generated at {reportOutput}")
 
     def test_doi_information(self):
-        pennsieve_host = Config.PENNSIEVE_API_HOST + '/'
-
-        scicrunch_doi = self.__scicrunch_doi
-
-        headers = {'accept': 'application/json'}
-        params = {'limit': 0, 'embargo': False}
-        find_total_response = requests.get(urljoin(pennsieve_host, 'datasets'), params=params, headers=headers)
-        self.assertEqual(200, find_total_response.status_code)
-
-        test_response = requests.get(urljoin(pennsieve_host, f'organizations/{Config.SPARC_PENNSIEVE_ORGANISATION_ID}/datasets/metrics'), headers=headers)
-        json_data = test_response.json()
-        datasets = json_data['datasets']
-        sparc_dataset_ids = []
-        for dataset in datasets:
-            sparc_dataset_ids.append(dataset['id'])
-
-        json_data = find_total_response.json()
-        total_count = json_data['totalCount']
-
-        #break the call to datasets into multiple chunks as one single call
-        #seems to be breaking the tests
-        remain = total_count
-        offset = 0
-        count = 100
-        discover_doi = []
-        name_doi_map = {}
-        while remain > 0:
-            if count > remain:
-                remain = 0
-                count = remain
-            remain = remain - count
-
-            params = {'limit': count, 'offset': offset, 'embargo': False}
-            response = requests.get(urljoin(pennsieve_host, 'datasets'), params=params, headers=headers)
-            self.assertEqual(200, response.status_code)
-            json_data = response.json()
-            self.assertEqual(count, len(json_data['datasets']))
-            for dataset in json_data['datasets']:
-                if dataset['id'] in sparc_dataset_ids:
-                    discover_doi.append(dataset['doi'])
-                    name_doi_map[dataset['doi']] = {'name': dataset['name'], 'id': dataset['id']}
-            offset = offset + count
-        # self.assertEqual(total_count, len(discover_doi))
-
-        checkResult(self, discover_doi, scicrunch_doi, name_doi_map, 'Pennsieve vs SciCrunch')
+        # Raises any error from fetching the sources
+        self.fetched[SCICRUNCH].result()
+        discover = self.fetched[PENNSIEVE].result()
+        self.assertEqual(discover['TotalCount'], discover['Fetched'])
 
+        checkResult(self, self.reconciliation, PENNSIEVE, SCICRUNCH)
 
-    def test_aloglia_information(self):
-        scicrunch_doi = self.__scicrunch_doi
 
-        client = SearchClient.create(Config.ALGOLIA_ID, Config.ALGOLIA_KEY)
-        index = client.init_index(Config.ALGOLIA_INDEX)
-
-        res = index.search('', {
-            'attributesToRetrieve': [
-                'item.curie',
-                'item.name'
-            ],
-            'attributesToHighlight': [],
-            'length': 1000,
-            'offset': 0
-        })
-
-        self.assertFalse('status' in res)
-        self.assertTrue('hits' in res)
-
-        client.close()
-
-        algolia_doi = []
-        name_doi_map = {}
-        for item in res['hits']:
-            doi = item['item']['curie'].replace('DOI:', '', 1)
-            algolia_doi.append(doi)
-            name_doi_map[doi] = {'name': item['item']['name'], 'id': item['objectID']}
+    def test_aloglia_information(self):
+        # Raises any error from fetching the sources
+        self.fetched[SCICRUNCH].result()
+        self.fetched[ALGOLIA].result()
+        self.assertTrue(ALGOLIA in self.reconciliation.sources)
 
-        checkResult(self, algolia_doi, scicrunch_doi, name_doi_map, 'Algolia vs SciCrunch')
+        checkResult(self, self.reconciliation, ALGOLIA, SCICRUNCH)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,122 @@
+import cProfile
+import functools
+import io
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+
+from tests.config import Config
+from tests.timing import StageTimer
+
+# Number of functions listed in the text profile and the hot spots
+PROFILE_TOP = 50
+
+
+class SuiteProfiler(object):
+    '''
+    cProfile of a suite run, over the main thread and every thread started and
+    joined while it runs, such as the validation workers and the Biolucida
+    prefetch, merged into one profile. A profiler can only be disabled from its
+    own thread, the threads still running when the run stops are left out of the
+    profile and keep their profiler until they end, so the suites join the
+    threads they start. On Python 3.12 and later only one thread can be profiled
+    at a time, the worker threads are then left out.
+    '''
+
+    def __init__(self):
+        # (thread, profiler) of the main thread first, then of the threads started while profiling
+        self.profilers = []
+        self.running = []
+        self.lock = threading.Lock()
+
+    def start_thread(self, *args):
+        # Called once on the first event of each new thread, cProfile then replaces it
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            sys.setprofile(None)
+            return
+        with self.lock:
+            self.profilers.append((threading.current_thread(), profiler))
+
+    def start(self):
+        threading.setprofile(self.start_thread)
+        self.start_thread()
+
+    def stop(self):
+        threading.setprofile(None)
+        with self.lock:
+            _, profiler = self.profilers[0]
+            profiler.disable()
+            stats = pstats.Stats(profiler)
+            for thread, profiler in self.profilers[1:]:
+                if thread.is_alive():
+                    self.running.append(thread.name)
+                else:
+                    stats.add(profiler)
+        return stats
+
+def hot_spots(stats):
+    spots = []
+    for (filename, line, name), (_, calls, total, cumulative, _) in sorted(stats.stats.items(), key=lambda item: -item[1][2])[:PROFILE_TOP]:
+        spots.append({
+            'Function': f'{filename}:{line}({name})',
+            'Calls': calls,
+            'Seconds': round(total, 3),
+            'Cumulative': round(cumulative, 3)
+        })
+    return spots
+
+def write_profile(output, stats, timer, seconds, threads):
+    os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+    stats.dump_stats(f'{output}.pstats')
+
+    text = io.StringIO()
+    stats.stream = text
+    stats.sort_stats('cumulative').print_stats(PROFILE_TOP)
+    with open(f'{output}.txt', 'w') as outfile:
+        outfile.write(text.getvalue())
+
+    with open(f'{output}.json', 'w') as outfile:
+        json.dump({
+            'Seconds': round(seconds, 3),
+            'Threads': threads,
+            'Functions': timer.stats(),
+            'HotSpots': hot_spots(stats)
+        }, outfile, indent=4)
+
+# Profile a suite when PROFILE_SUITES is set, into <output>.pstats, <output>.txt and <output>.json
+# along with the wall clock time of the named functions of its module
+def profiled(output, functions):
+    def decorator(test):
+        @functools.wraps(test)
+        def wrapper(*args, **kwargs):
+            if not Config.PROFILE_SUITES:
+                return test(*args, **kwargs)
+
+            module = sys.modules[test.__module__]
+            originals = {name: getattr(module, name) for name in functions}
+            timer = StageTimer()
+            timer.wrap(module, functions)
+            profiler = SuiteProfiler()
+            start = time.perf_counter()
+            profiler.start()
+            try:
+                return test(*args, **kwargs)
+            finally:
+                stats = profiler.stop()
+                seconds = time.perf_counter() - start
+                for name, function in originals.items():
+                    setattr(module, name, function)
+                write_profile(output, stats, timer, seconds, len(profiler.profilers) - len(profiler.running))
+                if profiler.running:
+                    print(f'Threads still running were left out of the profile: {", ".join(profiler.running)}')
+                print(f'Profile has been written to {output}.pstats, {output}.txt and {output}.json')
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,202 @@
+import copy
+import json
+import os
+import time
+
+from urllib.parse import urljoin
+
+from tests.clients import get_session
+from tests.config import Config
+
+# Sort used to walk the index with search_after, the identifier gives a stable
+# order so pages do not drift when the index is re-indexed during a run.
+# The document _id comes last as the unique tiebreaker, hits without identifier
+# and curie would otherwise tie and be skipped or repeated at page boundaries.
+SCICRUNCH_SORT = [
+    {"pennsieve.identifier.aggregate": {"order": "asc", "missing": "_last"}},
+    {"item.curie.aggregate": {"order": "asc", "missing": "_last"}},
+    {"_id": {"order": "asc"}}
+]
+
+def search_datasets(scicrunch_request):
+
+    headers = {'accept': 'application/json'}
+    params = {'api_key': Config.SCICRUNCH_API_KEY}
+
+    scicrunch_host = Config.SCICRUNCH_API_HOST + '/'
+
+    return get_session().post(urljoin(scicrunch_host, '_search?preference=abiknowledgetesting'), json=scicrunch_request, params=params, headers=headers)
+
+# Stream the datasets from SciCrunch page by page, each hit is yielded as soon
+# as its page arrives so validation can start before the last page is fetched.
+# search_after is the sort of the hit to continue after, to resume a run.
+def iter_datasets(source, size=20, query=None, search_after=None):
+    keepGoing = True
+
+    while keepGoing:
+        scicrunch_request = {
+            "size": size,
+            "sort": SCICRUNCH_SORT,
+            "_source": source
+        }
+        if query:
+            scicrunch_request["query"] = query
+        if search_after:
+            scicrunch_request["search_after"] = search_after
+
+        scicrunch_response = search_datasets(scicrunch_request)
+        scicrunch_response.raise_for_status()
+
+        hits = scicrunch_response.json()['hits']['hits']
+
+        #No more result, stop
+        if size > len(hits):
+            keepGoing = False
+        else:
+            search_after = hits[-1]['sort']
+
+        for dataset in hits:
+            yield dataset
+
+# Union of the fields used by the slow suites, fetched once into a local snapshot
+# which every suite reads from.
+SNAPSHOT_SOURCE = [
+    "item.curie",
+    "item.name",
+    "item.types",
+    "objects.biolucida",
+    "objects.datacite",
+    "objects.additional_mimetype",
+    "objects.mimetype",
+    "objects.dataset",
+    "objects.name",
+    "pennsieve.version",
+    "pennsieve.identifier",
+    "pennsieve.uri"
+]
+# Increase when the snapshot format or SNAPSHOT_SOURCE changes
+SNAPSHOT_VERSION = 2
+
+def snapshot_header(path):
+    try:
+        with open(path) as infile:
+            header = json.loads(infile.readline())
+    except (OSError, ValueError):
+        return None
+
+    if header.get('Version') != SNAPSHOT_VERSION or header.get('Source') != SNAPSHOT_SOURCE:
+        return None
+    # A snapshot of another index, e.g. dev rather than prod
+    if header.get('Host') != Config.SCICRUNCH_API_HOST:
+        return None
+    if time.time() - header.get('Created', 0) > Config.SCICRUNCH_SNAPSHOT_MAX_AGE * 3600:
+        return None
+
+    return header
+
+def read_snapshot(path):
+    with open(path) as infile:
+        # Skip the header
+        infile.readline()
+        for line in infile:
+            yield json.loads(line)
+
+# Fetch the whole corpus once, writing it to the snapshot as the hits stream in.
+# The snapshot is only put in place once the last page has been written, when
+# the suite stops early, e.g. at its testSize, the remaining pages are still
+# fetched so the following suites can read the whole corpus from the snapshot.
+def fetch_snapshot(path, size=20):
+    header = {
+        'Version': SNAPSHOT_VERSION,
+        'Created': time.time(),
+        'Host': Config.SCICRUNCH_API_HOST,
+        'Source': SNAPSHOT_SOURCE
+    }
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmpPath = f'{path}.{os.getpid()}.tmp'
+    completed = False
+    try:
+        with open(tmpPath, 'w') as outfile:
+            outfile.write(json.dumps(header) + '\n')
+            datasets = iter_datasets(SNAPSHOT_SOURCE, size)
+            try:
+                for dataset in datasets:
+                    outfile.write(json.dumps(dataset) + '\n')
+                    yield dataset
+            except GeneratorExit:
+                for dataset in datasets:
+                    outfile.write(json.dumps(dataset) + '\n')
+        completed = True
+    finally:
+        if completed:
+            os.replace(tmpPath, path)
+        elif os.path.exists(tmpPath):
+            os.remove(tmpPath)
+
+# Datasets for the slow suites, served from the local snapshot when a fresh one
+# exists, otherwise fetched from SciCrunch and written to the snapshot.
+# Queries for specific datasets always go to SciCrunch.
+# A resumed run passes the sort of the last dataset it reported as search_after,
+# without a fresh snapshot the remaining datasets are then fetched from SciCrunch.
+def get_snapshot_datasets(size=20, query=None, search_after=None):
+    if query:
+        return iter_datasets(SNAPSHOT_SOURCE, size, query, search_after)
+
+    path = Config.SCICRUNCH_SNAPSHOT
+    if snapshot_header(path):
+        print(f"Reading SciCrunch datasets from snapshot {path}")
+        return read_snapshot(path)
+
+    # A cursor written with another sort cannot be continued from, the datasets
+    # are fetched from the start and those already reported are skipped
+    if search_after and len(search_after) != len(SCICRUNCH_SORT):
+        search_after = None
+    if search_after:
+        print(f"Resuming SciCrunch datasets after {search_after}")
+        return iter_datasets(SNAPSHOT_SOURCE, size, search_after=search_after)
+
+    return fetch_snapshot(path, size)
+
+SCICRUNCH_DOI_AGGREGATION = {
+    "from": 0,
+    "size": 0,
+    "aggregations": {
+        "doi": {
+            "composite": {
+                "size": 1000,
+                "sources": [
+                    {
+                        "curie": {"terms": {"field": "item.curie.aggregate"}}
+                    }
+                ]
+            }
+        }
+    }
+}
+
+# Stream all the curies in the index, following the composite aggregation
+# after_key page by page until the aggregation is exhausted.
+def iter_doi_curies():
+    headers = {'accept': 'application/json'}
+    params = {'api_key': Config.SCICRUNCH_API_KEY}
+
+    scicrunch_host = Config.SCICRUNCH_API_HOST + '/'
+
+    scicrunch_request = copy.deepcopy(SCICRUNCH_DOI_AGGREGATION)
+    composite = scicrunch_request['aggregations']['doi']['composite']
+    keepGoing = True
+
+    while keepGoing:
+        scicrunch_response = get_session().post(urljoin(scicrunch_host, '_search'), json=scicrunch_request, params=params, headers=headers)
+        scicrunch_response.raise_for_status()
+
+        aggregation = scicrunch_response.json()['aggregations']['doi']
+        buckets = aggregation['buckets']
+        for bucket in buckets:
+            yield bucket['key']['curie']
+
+        #No more result, stop
+        if 'after_key' in aggregation and len(buckets) > 0:
+            composite['after'] = aggregation['after_key']
+        else:
+            keepGoing = False
@@ -1,17 +1,39 @@
 import unittest
-import requests
 import json
-import urllib.parse
 import os
-import re
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 from urllib.parse import urljoin
 
+from tests.clients import get_endpoint_timer, get_session
 from tests.config import Config
+from tests.profiling import profiled
+from tests.scicrunch import get_snapshot_datasets
+from tests.slow_tests.incremental import FingerprintStore, validate_dataset
+from tests.slow_tests.report_stream import ReportStream, dataset_failed, dump_report
+from tests.slow_tests.metadata_index import MetadataIndex
+from tests.slow_tests.pennsieve_cache import fetch_browse_files, get_pennsieve_cache
+from tests.slow_tests.runner import validate_datasets
 from tests.slow_tests.manifest_name_to_discover_name import name_map, biolucida_name_map
 
-pennsieveCache = {}
+# Functions timed when the suite is profiled or benchmarked
+PROFILED_FUNCTIONS = ['test_datasets_information', 'test_biolucida_list', 'prefetchBiolucidaImageInfo', 'testBiolucida',
+                      'testBiolucidaAndScicrunch', 'testScicrunchAndPennsieve', 'compareWithMetadataFromPennsieve']
+
+# Module state is shared by the validation workers, guard it with the locks below
 pennsieveMetadataCache = {}
+biolucidaImageCache = {} # {biolucida_id: (status_code, image_info)}
+cacheLock = threading.Lock()
+mappingLock = threading.Lock()
+# Made on first use, see get_biolucida_semaphore and get_biolucida_executor
+biolucidaSemaphore = None
+biolucidaExecutor = None
+biolucidaLock = threading.Lock()
+# Responses which may succeed when requested again, they are not memoised
+BIOLUCIDA_RETRY_STATUS = (408, 429)
 nameMapping = {
     'Note': {
         'Format': {
@@ -66,33 +88,7 @@ def get_dataset_info_pennsieve_identifier(dataset_id):
         ]
     }
 
-    return requests.post(urljoin(scicrunch_host, '_search?preference=abiknowledgetesting'), json=scicrunch_request, params=params, headers=headers)
-
-def getDatasets(start, size):
-
-    headers = {'accept': 'application/json'}
-    params = {'api_key': Config.SCICRUNCH_API_KEY}
-
-    scicrunch_host = Config.SCICRUNCH_API_HOST + '/'
-
-    scicrunch_request = {
-        "from": start,
-        "size": size,
-        "_source": [
-            "item.curie",
-            "item.name",
-            "item.types",
-            "objects.biolucida",
-            "objects.additional_mimetype",
-            "objects.mimetype",
-            "objects.dataset",
-            "pennsieve.version",
-            "pennsieve.identifier",
-            "pennsieve.uri"
-        ]
-    }
-
-    return requests.post(urljoin(scicrunch_host, '_search?preference=abiknowledgetesting'), json=scicrunch_request, params=params, headers=headers)
+    return get_session().post(urljoin(scicrunch_host, '_search?preference=abiknowledgetesting'), json=scicrunch_request, params=params, headers=headers)
 
 def extract_bucket_name(original_name):
     return original_name.split('/')[2]
@@ -122,13 +118,14 @@ def testBiolucidaAndScicrunch(imageName, localPath, dataset_id, biolucida_id, mi
             })
 
         # Then generate the name mapping between Biolucida and Scicrunch
-        if dataset_id not in nameMapping:
-            nameMapping[dataset_id] = {}
-        if biolucida_id not in nameMapping[dataset_id]:
-            nameMapping[dataset_id][biolucida_id] = {}
-        if filePath not in nameMapping[dataset_id][biolucida_id]:
-            nameMapping[dataset_id][biolucida_id][filePath] = {}
-        nameMapping[dataset_id][biolucida_id][filePath][imageName] = filePath.split("/")[-1]
+        with mappingLock:
+            if dataset_id not in nameMapping:
+                nameMapping[dataset_id] = {}
+            if biolucida_id not in nameMapping[dataset_id]:
+                nameMapping[dataset_id][biolucida_id] = {}
+            if filePath not in nameMapping[dataset_id][biolucida_id]:
+                nameMapping[dataset_id][biolucida_id][filePath] = {}
+            nameMapping[dataset_id][biolucida_id][filePath][imageName] = filePath.split("/")[-1]
 
         error_response['NameMappingRequired'] = 'Please check the name mapping file output for more information.'
         if imageName in biolucida_name_map:
@@ -140,59 +137,44 @@ def compareWithMetadataFromPennsieve(dataset_id, version, fileName, filePath):
     global pennsieveMetadataCache
     global pathMapping
 
-    files_metadata = []
+    metadata_index = None
 
+    # The metadata of a version is indexed once and shared by all its objects
     key = f'{dataset_id}_{version}'
-    if key in pennsieveMetadataCache:
-        files_metadata = pennsieveMetadataCache[key]
-    else:
-        metadata_response = requests.get(f'{Config.PENNSIEVE_API_HOST}/datasets/{dataset_id}/versions/{version}/metadata')
+    with cacheLock:
+        metadata_index = pennsieveMetadataCache.get(key)
+    if metadata_index is None:
+        metadata_response = get_session().get(f'{Config.PENNSIEVE_API_HOST}/datasets/{dataset_id}/versions/{version}/metadata')
         metadata_info = metadata_response.json()
         #print(metadata_info)
         if 'files' in metadata_info:
             files_metadata = metadata_info['files']
             if len(files_metadata) > 0:
-                pennsieveMetadataCache[key] = files_metadata
+                metadata_index = MetadataIndex(files_metadata)
+                with cacheLock:
+                    pennsieveMetadataCache[key] = metadata_index
 
     # If the file path is exist in the metadata, add it to the mapping file
-    if len(files_metadata) > 0:
-        for file_metadata in files_metadata:
-            modified_fileName = ' '.join(re.findall('[.a-zA-Z0-9]+', fileName))
-            modified_metadata_path = ' '.join(re.findall('[.a-zA-Z0-9]+', file_metadata['path']))
-
-            if fileName in file_metadata['path'] or modified_fileName in modified_metadata_path:
+    if metadata_index:
+        metadata_path = metadata_index.find(fileName)
+        if metadata_path is not None:
+            with mappingLock:
                 if dataset_id not in pathMapping:
                     pathMapping[dataset_id] = {}
-                pathMapping[dataset_id][filePath] = file_metadata['path']
+                pathMapping[dataset_id][filePath] = metadata_path
 
-                error_response = {
-                    'PathMappingRequired': 'Please check the path mapping file output for more information.',
-                    'Further': 'Correct file path is found through Pennsieve metadata.',
-                }
-                if filePath in name_map:
-                    error_response['PathMappingSolved'] = 'This is a known inconsistency issue which has been manually mapped in the sparc api.'
+            error_response = {
+                'PathMappingRequired': 'Please check the path mapping file output for more information.',
+                'Further': 'Correct file path is found through Pennsieve metadata.',
+            }
+            if filePath in name_map:
+                error_response['PathMappingSolved'] = 'This is a known inconsistency issue which has been manually mapped in the sparc api.'
 
-                return error_response
+            return error_response
 
 
 def fetchFilesFromPennsieve(dataset_id, version, folderPath):
-    global pennsieveCache
-
-    files = []
-
-    if folderPath in pennsieveCache:
-        files = pennsieveCache[folderPath]
-    else:
-        fileUrl = f'{Config.PENNSIEVE_API_HOST}/datasets/{dataset_id}/versions/{version}/files/browse?path={folderPath}'
-        file_response = requests.get(fileUrl)
-        files_info = file_response.json()
-        #print(files_info)
-        if 'files' in files_info:
-            files = files_info['files']
-            if len(files) > 0:
-                pennsieveCache[folderPath] = files
-
-    return files
+    return fetch_browse_files(dataset_id, version, folderPath)
     
 def testScicrunchAndPennsieve(localPath, dataset_id, version, biolucida_id):
     error_response = {
@@ -235,6 +217,73 @@ def testScicrunchAndPennsieve(localPath, dataset_id, version, biolucida_id):
 
         return error_response
 
+# Caps the number of concurrent requests to Biolucida over all the datasets
+def get_biolucida_semaphore():
+    global biolucidaSemaphore
+
+    with biolucidaLock:
+        if biolucidaSemaphore is None:
+            biolucidaSemaphore = threading.BoundedSemaphore(Config.BIOLUCIDA_CONCURRENCY)
+
+    return biolucidaSemaphore
+
+# Prefetches the image information of the datasets, shared by all the validation workers
+def get_biolucida_executor():
+    global biolucidaExecutor
+
+    with biolucidaLock:
+        if biolucidaExecutor is None:
+            biolucidaExecutor = ThreadPoolExecutor(max_workers=Config.BIOLUCIDA_CONCURRENCY, thread_name_prefix='biolucida')
+
+    return biolucidaExecutor
+
+# The prefetch threads are joined at the end of a suite run, the next prefetch starts them again
+def shutdown_biolucida_executor():
+    global biolucidaExecutor
+
+    with biolucidaLock:
+        executor = biolucidaExecutor
+        biolucidaExecutor = None
+    if executor:
+        executor.shutdown()
+
+def fetchBiolucidaImageInfo(biolucida_id):
+    with get_biolucida_semaphore():
+        biolucida_response = get_session().get(f'{Config.BIOLUCIDA_ENDPOINT}/image/info/{biolucida_id}')
+    if not biolucida_response.status_code == 200:
+        return (biolucida_response.status_code, None)
+
+    return (biolucida_response.status_code, biolucida_response.json())
+
+# Image information is memoised so each image is requested at most once per run.
+# Only the successful and the definitive client error responses are, a request
+# raising an exception or answered with a server error, 408 or 429 is made again
+# on the next call.
+def getBiolucidaImageInfo(biolucida_id):
+    with cacheLock:
+        result = biolucidaImageCache.get(biolucida_id)
+
+    if result is None:
+        result = fetchBiolucidaImageInfo(biolucida_id)
+        status_code = result[0]
+        if status_code == 200 or (400 <= status_code < 500 and status_code not in BIOLUCIDA_RETRY_STATUS):
+            with cacheLock:
+                biolucidaImageCache[biolucida_id] = result
+
+    return result
+
+# Fetch the image information of all the images of a dataset concurrently
+def prefetchBiolucidaImageInfo(biolucida_ids):
+    with cacheLock:
+        missing_ids = [biolucida_id for biolucida_id in set(biolucida_ids) if biolucida_id not in biolucidaImageCache]
+
+    if len(missing_ids) > 1:
+        executor = get_biolucida_executor()
+        futures = [executor.submit(getBiolucidaImageInfo, biolucida_id) for biolucida_id in missing_ids]
+        # Failures are requested again and reported when the object is tested
+        for future in futures:
+            future.exception()
+
 #Test object to check for any possible error
 def testBiolucida(dataset_id, version, biolucida_object, biolucida_id, bucket, mimetype):
     responses = []
@@ -251,15 +300,13 @@ def testBiolucida(dataset_id, version, biolucida_object, biolucida_id, bucket, m
         localPath = name_map[localPath]
 
     try:
-        biolucida_response = requests.get(f'{Config.BIOLUCIDA_ENDPOINT}/image/info/{biolucida_id}')
-        if not biolucida_response.status_code == 200:
+        status_code, image_info = getBiolucidaImageInfo(biolucida_id)
+        if not status_code == 200:
             return [{
                 'ScicrunchPath': localPath,
                 'BiolucidaId': biolucida_id,
                 'Reason': 'Cannot get a valid request from Biolucida.',
             }]
-            
-        image_info = biolucida_response.json()
 
         if image_info['status'] == "permission denied":
             return [{
@@ -315,9 +362,6 @@ def get_mimietype_from_object(biolucida_object):
     return mime_type
 
 def test_biolucida_list(dataset_id, version, object_list, bucket):
-    global pennsieveCache
-
-    pennsieveCache = {}
     datasetWarnings = []
     datasetErrors = []
     objectErrors = []
@@ -333,7 +377,7 @@ def test_biolucida_list(dataset_id, version, object_list, bucket):
     biolucidaFound = False
     duplicateFound = False
 
-    biolucida_response = requests.get(f'{Config.BIOLUCIDA_ENDPOINT}/imagemap/search_dataset/discover/{dataset_id}')
+    biolucida_response = get_session().get(f'{Config.BIOLUCIDA_ENDPOINT}/imagemap/search_dataset/discover/{dataset_id}')
     if biolucida_response.status_code == 200:
         dataset_info = biolucida_response.json()
         if 'status' in dataset_info and dataset_info['status'] == "success":
@@ -361,6 +405,8 @@ def test_biolucida_list(dataset_id, version, object_list, bucket):
                     biolucidaIDMatch = False
                     scicrunch_ids.append(biolucida_id)
 
+    prefetchBiolucidaImageInfo(bipresence_ids)
+
     duplicate_cache = {}
     # Check all the unique biolucida objects
     for biolucida_object in object_list:
@@ -415,10 +461,11 @@ def test_biolucida_list(dataset_id, version, object_list, bucket):
                 objectErrors.append(error)
 
             # Remove mapping if one of duplicate object testing is passed
-            if dataset_id in nameMapping and biolucida_id in nameMapping[dataset_id]:
-                del nameMapping[dataset_id][biolucida_id]
-                if len(nameMapping[dataset_id]) == 0:
-                    del nameMapping[dataset_id]
+            with mappingLock:
+                if dataset_id in nameMapping and biolucida_id in nameMapping[dataset_id]:
+                    del nameMapping[dataset_id][biolucida_id]
+                    if len(nameMapping[dataset_id]) == 0:
+                        del nameMapping[dataset_id]
 
     if biolucidaObjectFound or biolucidaImageFound:
         biolucidaFound = True
@@ -490,6 +537,21 @@ def test_biolucida_list(dataset_id, version, object_list, bucket):
 
     return {"FileReports": fileReports, "DatasetWarnings": datasetWarnings, "DatasetErrors": datasetErrors, "BiolucidaFound": biolucidaFound}
                 
+# Mapping entries generated while validating a dataset, recorded with its report
+def get_mapping_state(dataset_id):
+    with mappingLock:
+        return {
+            'NameMapping': nameMapping.get(dataset_id),
+            'PathMapping': pathMapping.get(dataset_id)
+        }
+
+def restore_mapping_state(dataset_id, state):
+    with mappingLock:
+        if state and state['NameMapping']:
+            nameMapping[dataset_id] = state['NameMapping']
+        if state and state['PathMapping']:
+            pathMapping[dataset_id] = state['PathMapping']
+
 #Test the dataset 
 def test_datasets_information(dataset):
     report = {
@@ -527,24 +589,33 @@ def test_datasets_information(dataset):
 
     return report
 
+def dataset_warned(report):
+    return not dataset_failed(report) and len(report['Warnings']) > 0
+
 
 class BiolucidaDatasetFilesTest(unittest.TestCase):
 
     def __init__(self, *args, **kwds):
         super().__init__(*args, **kwds)
 
+    @profiled('reports/biolucida_profile', PROFILED_FUNCTIONS)
     def test_files_information(self):
 
-        start = 0
         size = 20
-        keepGoing = True
         totalSize = 0
         reportOutput = 'reports/biolucida_reports.json'
+        reportStreamOutput = 'reports/biolucida_reports.jsonl'
+        summaryOutput = 'reports/biolucida_reports_summary.json'
         nameMappingOutput = 'reports/biolucida_name_mapping.json' # replace Biolucida name with Scicrunch filename
         pathMappingOutput = 'reports/biolucida_path_mapping.json' # replace Scicrunch file path with Pennsieve file path
+        fingerprintOutput = 'reports/biolucida_fingerprints.json'
         reports = {'Tested': 0, 'Warned': 0, 'Failed': 0, 'WarnedIds':[], 'FailedIds':[], 'WarnedDatasets':[], 'FailedDatasets':[]}
         testSize = 2000
         totalBiolucida = 0
+        fingerprints = FingerprintStore(fingerprintOutput, reportStreamOutput)
+        stream = ReportStream(reportStreamOutput, fingerprints=fingerprints)
+        # Only the calls of this suite are in its Timing section
+        get_endpoint_timer().reset()
 
         # '''
         # Test selected datasets
@@ -649,39 +720,32 @@ class BiolucidaDatasetFilesTest(unittest.TestCase):
         '''
         Test all the datasets
         '''
-        while keepGoing :
-            scicrunch_response = getDatasets(start, size)
-            self.assertEqual(200, scicrunch_response.status_code)
-
-            data = scicrunch_response.json()
-
-            #No more result, stop
-            if size > len(data['hits']['hits']):
-                keepGoing = False
-
-            #keepGoing= False
-
-            start = start + size
+        # Each report is on disk as soon as its dataset is validated, the mappings
+        # found by a previous run are restored for the datasets it already reported
+        for report, state in stream.entries():
+            restore_mapping_state(report['Id'], state)
+        totalSize = len(stream.ids)
+        validate = partial(validate_dataset, fingerprints, test_datasets_information, restore_state=restore_mapping_state)
+        try:
+            for report in validate_datasets(stream.pending(get_snapshot_datasets(size, search_after=stream.cursor)), validate):
+                stream.write(report, get_mapping_state(report['Id']))
+                totalSize = totalSize + 1
+
+                if totalSize >= testSize:
+                    break
+        finally:
+            stream.close()
+            shutdown_biolucida_executor()
+
+        # Generate the report from the stream
+        for report in stream.reports():
+            if 'Biolucida' in report and report['Biolucida']:
+                totalBiolucida = totalBiolucida + 1
+            if dataset_failed(report):
+                reports['FailedIds'].append(report['Id'])
+            elif dataset_warned(report):
+                reports['WarnedIds'].append(report['Id'])
 
-            for dataset in data['hits']['hits']:
-                report = test_datasets_information(dataset)
-                if 'Biolucida' in report and report['Biolucida']:
-                    totalBiolucida = totalBiolucida + 1
-                print(f"Reports generated for {report['Id']}")
-                if len(report['Errors']) > 0 or report['ObjectErrors']['Total'] > 0:
-                    reports['FailedIds'].append(report['Id'])
-                    reports['FailedDatasets'].append(report)
-                else:
-                    if len(report['Warnings']) > 0:
-                        reports['WarnedIds'].append(report['Id'])
-                        reports['WarnedDatasets'].append(report)
-
-            totalSize = totalSize + len(data['hits']['hits'])
-
-            if totalSize >= testSize:
-                keepGoing = False
-
-        # Generate the report
         reports['Tested'] = totalSize
         reports['Tested Datasets with Biolucida'] = totalBiolucida
         print(f"Number of datasets tested: {reports['Tested']}")
@@ -694,9 +758,11 @@ class BiolucidaDatasetFilesTest(unittest.TestCase):
         if reports['Failed'] > 0:
             print(f"Failed Datasets: {reports['FailedIds']}")
             
-        os.makedirs(os.path.dirname(reportOutput), exist_ok=True)
-        with open(reportOutput, 'w') as outfile:
-            json.dump(reports, outfile, indent=4)
+        reports['WarnedDatasets'] = stream.reports(dataset_warned)
+        reports['FailedDatasets'] = stream.reports(dataset_failed)
+        reports['Timing'] = get_endpoint_timer().stats()
+        stream.write_summary(summaryOutput, reports)
+        dump_report(reports, reportOutput)
 
         os.makedirs(os.path.dirname(nameMappingOutput), exist_ok=True)
         with open(nameMappingOutput, 'w') as outfile:
@@ -705,7 +771,10 @@ class BiolucidaDatasetFilesTest(unittest.TestCase):
         os.makedirs(os.path.dirname(pathMappingOutput), exist_ok=True)
         with open(pathMappingOutput, 'w') as outfile:
             json.dump(pathMapping, outfile, indent=4)
+
+        fingerprints.save()
     
+        print(f"Pennsieve cache: {get_pennsieve_cache().stats()}")
         print(f"Full report has been generated at {reportOutput}")
 
         self.assertEqual(0, len(reports['FailedIds']))
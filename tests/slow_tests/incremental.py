@@ -0,0 +1,128 @@
+import hashlib
+import json
+import os
+import threading
+
+from tests.config import Config
+
+# Fingerprint of a dataset, a dataset is only re-validated when one of these changes
+def dataset_fingerprint(dataset):
+    source = dataset.get('_source', {})
+    pennsieve = source.get('pennsieve', {})
+    objects = json.dumps(source.get('objects', []), sort_keys=True)
+
+    return {
+        'Identifier': pennsieve.get('identifier'),
+        'Version': pennsieve.get('version', {}).get('identifier'),
+        'ObjectsHash': hashlib.sha256(objects.encode('utf-8')).hexdigest()
+    }
+
+
+# Validate the dataset, or reuse its previous report if it has not changed.
+# Suites keeping state beyond the report, such as their mappings, pass restore_state
+# to put the state recorded with a reused report back, the report stream records
+# the state of every dataset along with its fingerprint.
+def validate_dataset(fingerprints, validate, dataset, restore_state=None):
+    entry = fingerprints.lookup(dataset)
+    if entry:
+        report = entry['Report']
+        if restore_state:
+            restore_state(report['Id'], entry['State'])
+        print(f"Reports reused for {report['Id']}")
+    else:
+        report = validate(dataset)
+        print(f"Reports generated for {report['Id']}")
+
+    return report
+
+
+class FingerprintStore(object):
+    '''
+    Fingerprints of the datasets of the previous run, only used when
+    INCREMENTAL_VALIDATION is set. Only the offset of the line of each dataset in
+    the JSON lines reports of that run is kept in memory, the report itself is
+    read from there when it is reused. The reports of the previous run are kept
+    at <reports>.prev, moved there before the report stream starts a new file.
+    '''
+
+    def __init__(self, path, reportsPath):
+        self.path = path
+        self.reportsPath = reportsPath
+        # Reports file the offsets of the previous run point into
+        self.previousPath = None
+        self.previous = {}
+        self.current = {}
+        self.lock = threading.Lock()
+        if Config.INCREMENTAL_VALIDATION:
+            self.load()
+
+    def load(self):
+        try:
+            with open(self.path) as infile:
+                data = json.load(infile)
+        except (OSError, ValueError):
+            return
+
+        # Files written before the offsets were recorded hold no usable entry
+        if 'Fingerprints' in data and os.path.exists(data['Reports']):
+            self.previousPath = data['Reports']
+            self.previous = data['Fingerprints']
+
+    # Called by the report stream before it starts a new reports file
+    def rotate(self):
+        if self.previousPath != self.reportsPath:
+            return
+
+        self.previousPath = f'{self.reportsPath}.prev'
+        os.replace(self.reportsPath, self.previousPath)
+        # Point the fingerprints at the moved reports, in case this run is interrupted
+        self.write(self.previousPath, self.previous)
+
+    def lookup(self, dataset):
+        if not Config.INCREMENTAL_VALIDATION:
+            return None
+
+        fingerprint = dataset_fingerprint(dataset)
+        entry = self.previous.get(str(fingerprint['Identifier']))
+        if not entry or entry['Fingerprint'] != fingerprint:
+            return None
+
+        with open(self.previousPath, 'rb') as infile:
+            infile.seek(entry['Offset'])
+            line = infile.readline()
+        try:
+            previous = json.loads(line)
+        except ValueError:
+            return None
+        # The reports file may have been written again since, e.g. by a run without incremental validation
+        if previous.get('Fingerprint') != fingerprint:
+            return None
+
+        return previous
+
+    # Called by the report stream with the offset of the line of each report it writes
+    def record(self, fingerprint, offset):
+        if not Config.INCREMENTAL_VALIDATION:
+            return
+        if not fingerprint or fingerprint['Identifier'] is None or not fingerprint['Version']:
+            return
+
+        with self.lock:
+            self.current[str(fingerprint['Identifier'])] = {
+                'Fingerprint': fingerprint,
+                'Offset': offset
+            }
+
+    def write(self, reportsPath, fingerprints):
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmpPath = f'{self.path}.{os.getpid()}.tmp'
+        with open(tmpPath, 'w') as outfile:
+            json.dump({'Reports': reportsPath, 'Fingerprints': fingerprints}, outfile)
+        os.replace(tmpPath, self.path)
+
+    def save(self):
+        if not Config.INCREMENTAL_VALIDATION:
+            return
+
+        with self.lock:
+            self.write(self.reportsPath, self.current)
@@ -1,5216 +1,75 @@
-name_map = {'files/primary/sub-PR1705/pool-PR1705/PR1705_Blockface_1-531_Shaina-scaling50umx50um.jpx': 'files/primary/sub-PR1705/pool-PR1705/PR1705_Blockface_scaling50umx50um.jpx',
-            'files/derivative/sub-1705/pool-1705/PR1705_Blockface_1-531_Shaina-scaling50umX50um_2019-07-16_Blackfynn.xml': 'files/derivative/sub-1705/pool-1705/PR1705_All_Sampled_Points.xml',
-            'files/primary/pool-1/Metabolic_data.xlsx': 'files/primary/pool-1/Metabolic data.xlsx',
-            'files/primary/pool-1/Body_composition_data.xlsx': 'files/primary/pool-1/Body composition data.xlsx',
-            'files/primary/pool-1/Insulin__leptin__glucagon_assay_data.xlsx': 'files/primary/pool-1/Insulin%2C leptin%2C glucagon assay data.xlsx',
-            'files/primary/pool-1/Body_weight_data.xlsx': 'files/primary/pool-1/Body weight data.xlsx',
-            'files/primary/pool-1/Fatty_acid_oxidation_data.xlsx': 'files/primary/pool-1/Fatty acid oxidation data.xlsx',
-            'files/primary/pool-1/Glucose_tolerance_test_data.xlsx': 'files/primary/pool-1/Glucose tolerance test data.xlsx',
-            'files/protocol/Surgery_AAV6_injection_into_iBAT_Protocol.io.docx': 'files/protocol/Surgery_AAV6 injection into iBAT_Protocol.io',
-            'files/primary/Whole heart innervation by tissue clearing and antibody staining/H-4/20180308_heart4_iDISCO_PGPCy3_5X_01_Stitch.czi': 'files/primary/Whole heart innervation by tissue clearing and antibody staining/H-4/20180308_heart4_iDISCO_heartventral_PGPCy3_5X_01_Stitch.czi',
-            'files/derivative/H-4/20180319_heart4_iDISCO_heartdorsal_ventricle_PGPCy3_10X_02.tif': 'files/derivative/H-4/20180319_heart4_iDISCO_heartdorsal_ventricle_PGPCy3_10X_02 (2).tif',
-            'files/derivative/H-4/20180319_heart4_iDISCO_heartdorsal_ICganglion_PGPCy3_10X_01.jpx': 'files/derivative/H-4/20180319_heart4_iDISCO_heartdorsal_ICganglion_PGPCy3_10X_01 (1).jpx',
-            'files/derivative/H-4/20180308_heart4_iDISCO_heartventral_PGPCy3_5X_01_Stitch.jpx': 'files/derivative/H-4/20180308_heart4_iDISCO_heartventral_PGPCy3_5X_01_Stitch (1).jpx',
-            'files/derivative/H-4/20180308_heart4_iDISCO_heartventral_PGPCy3_5X_01_Stitch.tif': 'files/derivative/H-4/20180308_heart4_iDISCO_heartventral_PGPCy3_5X_01_Stitch (2).tif',
-            'files/derivative/H-4/20180319_heart4_iDISCO_heartdorsal_PGPCy3_5X_01_Stitch.tif': 'files/derivative/H-4/20180319_heart4_iDISCO_heartdorsal_PGPCy3_5X_01_Stitch (2).tif',
-            'files/derivative/H-4/20180319_heart4_iDISCO_heartdorsal_PGPCy3_5X_01_Stitch.jpx': 'files/derivative/H-4/20180319_heart4_iDISCO_heartdorsal_PGPCy3_5X_01_Stitch (1).jpx',
-            'files/derivative/H-4/20180319_heart4_iDISCO_heartdorsal_ventricle_PGPCy3_10X_02.jpx': 'files/derivative/H-4/20180319_heart4_iDISCO_heartdorsal_ventricle_PGPCy3_10X_02 (1).jpx',
-            'files/derivative/H-4/20180319_heart4_iDISCO_heartdorsal_ICganglion_PGPCy3_10X_01.tif': 'files/derivative/H-4/20180319_heart4_iDISCO_heartdorsal_ICganglion_PGPCy3_10X_01 (2).tif',
-            'files/docs/Cardiac_ANS-Structure-Function-Figure5-CTB_Stellate_FINAL_.pdf': 'files/docs/Cardiac_ANS-Structure-Function-Figure5-CTB_Stellate(FINAL).pdf',
-            'files/docs/Cardiac_ANS-Structure-Function-Figure2-ChAT_Tracing_FINAL_.pdf': 'files/docs/Cardiac_ANS-Structure-Function-Figure2-ChAT_Tracing(FINAL).pdf',
-            'files/docs/Identification_of_peripheral_neural_circuits_that_regulate_heart_rate_using_optogenetic_and_viral_vector_strategies_-_Response_-_20200210.docx': 'files/docs/Identification of peripheral neural circuits that regulate heart rate using optogenetic and viral vector strategies - Response - 20200210.docx',
-            'files/docs/Cardiac_ANS-Structure-Function-Figure6-TH-ChR2_RSGS_FINAL_.pdf': 'files/docs/Cardiac_ANS-Structure-Function-Figure6-TH-ChR2_RSGS(FINAL).pdf',
-            'files/docs/Cardiac_ANS-Structure-Function-Figure3-ChAT-ChR2_GPStim_FINAL_.pdf': 'files/docs/Cardiac_ANS-Structure-Function-Figure3-ChAT-ChR2_GPStim(FINAL).pdf',
-            'files/docs/Cardiac_ANS-Structure-Function-Figure4-ChAT-ChR2_VNS_FINAL_.pdf': 'files/docs/Cardiac_ANS-Structure-Function-Figure4-ChAT-ChR2_VNS(FINAL).pdf',
-            'files/docs/Cardiac_ANS-Structure-Function-Figure1-Tissue_Clearing_FINAL_.pdf': 'files/docs/Cardiac_ANS-Structure-Function-Figure1-Tissue_Clearing(FINAL).pdf',
-            'files/code/upload_blackfynn for Windows/upload_blackfynn/working/win_upload_test-local.xlsx': 'files/code/upload_blackfynn for Windows/upload_blackfynn/working/win_upload_test-local (1).xlsx',
-            'files/code/upload_blackfynn for Windows/upload_blackfynn/working/win_upload_test.xlsx': 'files/code/upload_blackfynn for Windows/upload_blackfynn/working/win_upload_test (1).xlsx',
-            'files/code/upload_blackfynn for Windows/upload_blackfynn/working/win_upload_verbose_test.xlsx': 'files/code/upload_blackfynn for Windows/upload_blackfynn/working/win_upload_verbose_test (1).xlsx',
-            'files/code/manifest-for-upload-bfynn.xlsx': 'files/code/manifest.xlsx',
-            'files/code/upload_blackfynn for Windows/upload_blackfynn_1.0.17.zip': 'files/code/upload_blackfynn for Windows/upload_blackfynn_1.0.17',
-            'files/code/upload_blackfynn for Linux/NeuroLabUploadBlackfynn-master/upload-bfynn/TEMPLATE-for-SPARC-list-of-files-to-upload.xlsx': 'files/code/upload_blackfynn for Linux/NeuroLabUploadBlackfynn-master/upload-bfynn/TEMPLATE-for-SPARC-list-of-files-to-upload (1).xlsx',
-            'files/primary/sub-2014-05-13/2014-05-13.s2cx': 'files/primary/sub-2014-05-13/sub-2014-05-13_2014-05-13.s2cx',
-            'files/primary/sub-2014-07-01/2014-07-01.s2cx': 'files/primary/sub-2014-07-01/sub-2014-07-01_2014-07-01.s2cx',
-            'files/primary/sub-2013-08-29/2013-08-29.s2cx': 'files/primary/sub-2013-08-29/sub-2013-08-29_2013-08-29.s2cx',
-            'files/primary/sub-2014-07-08/2014-07-08.s2cx': 'files/primary/sub-2014-07-08/sub-2014-07-08_2014-07-08.s2cx',
-            'files/primary/sub-2014-06-03/2014-06-03.s2cx': 'files/primary/sub-2014-06-03/sub-2014-06-03_2014-06-03.s2cx',
-            'files/primary/sub-2013-06-25/2013-06-25.s2cx': 'files/primary/sub-2013-06-25/sub-2013-06-25_2013-06-25.s2cx',
-            'files/primary/sub-2014-06-24/2014-06-24.s2cx': 'files/primary/sub-2014-06-24/sub-2014-06-24_2014-06-24.s2cx',
-            'files/primary/sub-2013-08-13/2013-08-13.s2cx': 'files/primary/sub-2013-08-13/sub-2013-08-13_2013-08-13.s2cx',
-            'files/source/sub-2013-06-25/2013-06-25_001_65-128.daq': 'files/source/sub-2013-06-25/sub-2013-06-25_2013-06-25_001_65-128.daq',
-            'files/source/sub-2013-08-29/2013-08-29_001_65-128.daq': 'files/source/sub-2013-08-29/sub-2013-08-29_2013-08-29_001_65-128.daq',
-            'files/primary/sub-2014-05-20/2014-05-20.s2cx': 'files/primary/sub-2014-05-20/sub-2014-05-20_2014-05-20.s2cx',
-            'files/source/sub-2013-08-29/2013-08-29_001_1-64.daq': 'files/source/sub-2013-08-29/sub-2013-08-29_2013-08-29_001_1-64.daq',
-            'files/primary/sub-2013-08-01/2013-08-01.s2cx': 'files/primary/sub-2013-08-01/sub-2013-08-01_2013-08-01.s2cx',
-            'files/source/sub-2013-06-25/2013-06-25_001_1-64.daq': 'files/source/sub-2013-06-25/sub-2013-06-25_2013-06-25_001_1-64.daq',
-            'files/source/sub-2013-06-18/2013-06-18_001_1-64.daq': 'files/source/sub-2013-06-18/sub-2013-06-18_2013-06-18_001_1-64.daq',
-            'files/source/sub-2013-06-18/2013-06-18_001_65-128.daq': 'files/source/sub-2013-06-18/sub-2013-06-18_2013-06-18_001_65-128.daq',
-            'files/source/sub-2013-06-06/2013-06-06_001_65-128.daq': 'files/source/sub-2013-06-06/sub-2013-06-06_2013-06-06_001_65-128.daq',
-            'files/source/sub-2013-08-13/2013-08-13_001_1-64.daq': 'files/source/sub-2013-08-13/sub-2013-08-13_2013-08-13_001_1-64.daq',
-            'files/source/sub-2013-08-13/2013-08-13_001_65-128.daq': 'files/source/sub-2013-08-13/sub-2013-08-13_2013-08-13_001_65-128.daq',
-            'files/source/sub-2013-06-06/2013-06-06_001_1-64.daq': 'files/source/sub-2013-06-06/sub-2013-06-06_2013-06-06_001_1-64.daq',
-            'files/source/sub-2014-05-13/2014-05-13_001_65-128.daq': 'files/source/sub-2014-05-13/sub-2014-05-13_2014-05-13_001_65-128.daq',
-            'files/source/sub-2013-05-21/2013-05-21_001_1-64.daq': 'files/source/sub-2013-05-21/sub-2013-05-21_2013-05-21_001_1-64.daq',
-            'files/source/sub-2014-05-13/2014-05-13_001_1-64.daq': 'files/source/sub-2014-05-13/sub-2014-05-13_2014-05-13_001_1-64.daq',
-            'files/source/sub-2014-06-03/2014-06-03_001_1-64.daq': 'files/source/sub-2014-06-03/sub-2014-06-03_2014-06-03_001_1-64.daq',
-            'files/source/sub-2014-07-08/2014-07-08_001_1-64.daq': 'files/source/sub-2014-07-08/sub-2014-07-08_2014-07-08_001_1-64.daq',
-            'files/source/sub-2014-06-03/2014-06-03_001_65-128.daq': 'files/source/sub-2014-06-03/sub-2014-06-03_2014-06-03_001_65-128.daq',
-            'files/source/sub-2014-07-01/2014-07-01_001_1-64.daq': 'files/source/sub-2014-07-01/sub-2014-07-01_2014-07-01_001_1-64.daq',
-            'files/source/sub-2014-06-24/2014-06-24_001_65-128.daq': 'files/source/sub-2014-06-24/sub-2014-06-24_2014-06-24_001_65-128.daq',
-            'files/source/sub-2014-07-01/2014-07-01_001_65-128.daq': 'files/source/sub-2014-07-01/sub-2014-07-01_2014-07-01_001_65-128.daq',
-            'files/source/sub-2013-05-21/2013-05-21_001_65-128.daq': 'files/source/sub-2013-05-21/sub-2013-05-21_2013-05-21_001_65-128.daq',
-            'files/source/sub-2014-07-08/2014-07-08_001_65-128.daq': 'files/source/sub-2014-07-08/sub-2014-07-08_2014-07-08_001_65-128.daq',
-            'files/source/sub-2013-08-01/2013-08-01_001_65-128.daq': 'files/source/sub-2013-08-01/sub-2013-08-01_2013-08-01_001_65-128.daq',
-            'files/source/sub-2013-08-01/2013-08-01_001_1-64.daq': 'files/source/sub-2013-08-01/sub-2013-08-01_2013-08-01_001_1-64.daq',
-            'files/source/sub-2014-05-20/2014-05-20_001_1-64.daq': 'files/source/sub-2014-05-20/sub-2014-05-20_2014-05-20_001_1-64.daq',
-            'files/source/sub-2014-05-20/2014-05-20_001_65-128.daq': 'files/source/sub-2014-05-20/sub-2014-05-20_2014-05-20_001_65-128.daq',
-            'files/derivative/sub-2013-06-25/2013-06-25_001-v6f.edt': 'files/derivative/sub-2013-06-25/sub-2013-06-25_2013-06-25_001-v6f.edt',
-            'files/source/sub-2014-06-24/2014-06-24_001_1-64.daq': 'files/source/sub-2014-06-24/sub-2014-06-24_2014-06-24_001_1-64.daq',
-            'files/derivative/sub-2013-06-18/2013-06-18_001-v8f.edt': 'files/derivative/sub-2013-06-18/sub-2013-06-18_2013-06-18_001-v8f.edt',
-            'files/derivative/sub-2013-08-13/2013-08-13_001-v12f.edt': 'files/derivative/sub-2013-08-13/sub-2013-08-13_2013-08-13_001-v12f.edt',
-            'files/derivative/sub-2013-08-29/2013-08-29_001-v7f.edt': 'files/derivative/sub-2013-08-29/sub-2013-08-29_2013-08-29_001-v7f.edt',
-            'files/derivative/sub-2013-06-06/2013-06-06_001-FULLFILE-v2f.edt': 'files/derivative/sub-2013-06-06/sub-2013-06-06_2013-06-06_001-FULLFILE-v2f.edt',
-            'files/derivative/sub-2014-05-13/2014-05-13_001-v9f.edt': 'files/derivative/sub-2014-05-13/sub-2014-05-13_2014-05-13_001-v9f.edt',
-            'files/derivative/sub-2013-05-21/2013-05-21_001-v6f.edt': 'files/derivative/sub-2013-05-21/sub-2013-05-21_2013-05-21_001-v6f.edt',
-            'files/derivative/sub-2014-06-03/2014-06-03_001-v7f.edt': 'files/derivative/sub-2014-06-03/sub-2014-06-03_2014-06-03_001-v7f.edt',
-            'files/derivative/sub-2014-07-08/2014-07-08_001-v13f.edt': 'files/derivative/sub-2014-07-08/sub-2014-07-08_2014-07-08_001-v13f.edt',
-            'files/derivative/sub-2014-07-01/2014-07-01_001-v8f.edt': 'files/derivative/sub-2014-07-01/sub-2014-07-01_2014-07-01_001-v8f.edt',
-            'files/derivative/sub-2014-06-24/2014-06-24_001-v7f.edt': 'files/derivative/sub-2014-06-24/sub-2014-06-24_2014-06-24_001-v7f.edt',
-            'files/derivative/sub-2013-08-01/2013-08-01_001-v6f.edt': 'files/derivative/sub-2013-08-01/sub-2013-08-01_2013-08-01_001-v6f.edt',
-            'files/derivative/sub-2013-08-01/2013-08-01_001-PRE-v1.edt': 'files/derivative/sub-2013-08-01/sub-2013-08-01_2013-08-01_001-PRE-v1.edt',
-            'files/derivative/sub-2014-05-20/2014-05-20_001-v12f.edt': 'files/derivative/sub-2014-05-20/sub-2014-05-20_2014-05-20_001-v12f.edt',
-            'files/primary/sub-2013-08-29/2013-08-29_daq_001.smr': 'files/primary/sub-2013-08-29/sub-2013-08-29_2013-08-29_daq_001_smr.smr',
-            'files/primary/sub-2013-08-29/2013-08-29-recording-metadata.xlsx': 'files/primary/sub-2013-08-29/sub-2013-08-29_2013-08-29-recording-metadata_xlsx.xlsx',
-            'files/primary/sub-2013-08-29/2013-08-29_daq_001.s2rx': 'files/primary/sub-2013-08-29/sub-2013-08-29_2013-08-29_daq_001.s2rx',
-            'files/primary/sub-2013-08-29/2013-08-29_001_from_daq.smr': 'files/primary/sub-2013-08-29/sub-2013-08-29_2013-08-29_001_from_daq.smr',
-            'files/primary/sub-2013-08-29/2013-08-29-prep-annotations.xls': 'files/primary/sub-2013-08-29/sub-2013-08-29_2013-08-29-prep-annotations_xls.xls',
-            'files/primary/sub-2013-08-29/2013-08-29-DAQ-annotations.xls': 'files/primary/sub-2013-08-29/sub-2013-08-29_2013-08-29-DAQ-annotations_xls.xls',
-            'files/primary/sub-2013-06-25/2013-06-25-DAQ-annotations.xlsx': 'files/primary/sub-2013-06-25/sub-2013-06-25_2013-06-25-DAQ-annotations_xlsx.xlsx',
-            'files/primary/sub-2013-06-25/manifest.xlsx': 'files/primary/sub-2013-06-25/sub-2013-06-25_manifest_xlsx.xlsx',
-            'files/primary/sub-2013-06-25/2013-06-25_000.smr': 'files/primary/sub-2013-06-25/sub-2013-06-25_2013-06-25_000_smr.smr',
-            'files/primary/sub-2013-06-25/2013-06-25_000.s2rx': 'files/primary/sub-2013-06-25/sub-2013-06-25_2013-06-25_000.s2rx',
-            'files/primary/sub-2013-06-25/2013-06-25-recording-metadata.xlsx': 'files/primary/sub-2013-06-25/sub-2013-06-25_2013-06-25-recording-metadata_xlsx.xlsx',
-            'files/primary/sub-2013-06-25/2013-06-25-prep-annotations.xlsx': 'files/primary/sub-2013-06-25/sub-2013-06-25_2013-06-25-prep-annotations_xlsx.xlsx',
-            'files/primary/sub-2013-06-18/2013-06-18-recording-metadata.xlsx': 'files/primary/sub-2013-06-18/sub-2013-06-18_2013-06-18-recording-metadata_xlsx.xlsx',
-            'files/primary/sub-2013-06-18/2013-06-18_002.s2rx': 'files/primary/sub-2013-06-18/sub-2013-06-18_2013-06-18_002.s2rx',
-            'files/primary/sub-2013-06-25/2013-06-25_001_from_daq.smr': 'files/primary/sub-2013-06-25/sub-2013-06-25_2013-06-25_001_from_daq.smr',
-            'files/primary/sub-2013-06-18/2013-06-18-prep-annotations.xlsx': 'files/primary/sub-2013-06-18/sub-2013-06-18_2013-06-18-prep-annotations_xlsx.xlsx',
-            'files/primary/sub-2013-06-18/2013-06-18_002.smr': 'files/primary/sub-2013-06-18/sub-2013-06-18_2013-06-18_002.smr',
-            'files/primary/sub-2013-06-18/2013-06-18_001_from_daq.smr': 'files/primary/sub-2013-06-18/sub-2013-06-18_2013-06-18_001_from_daq.smr',
-            'files/primary/sub-2013-08-13/2013-08-13_daq_001.s2rx': 'files/primary/sub-2013-08-13/sub-2013-08-13_2013-08-13_daq_001.s2rx',
-            'files/primary/sub-2013-06-18/2013-06-18-DAQ-annotations.xlsx': 'files/primary/sub-2013-06-18/sub-2013-06-18_2013-06-18-DAQ-annotations_xlsx.xlsx',
-            'files/primary/sub-2013-08-13/2013-08-13_001_from_daq.smr': 'files/primary/sub-2013-08-13/sub-2013-08-13_2013-08-13_001_from_daq.smr',
-            'files/primary/sub-2013-08-13/2013-08-13_daq_001.smr': 'files/primary/sub-2013-08-13/sub-2013-08-13_2013-08-13_daq_001_smr.smr',
-            'files/primary/sub-2013-08-13/2013-08-13-recording-metadata.xlsx': 'files/primary/sub-2013-08-13/sub-2013-08-13_2013-08-13-recording-metadata_xlsx.xlsx',
-            'files/primary/sub-2013-08-13/2013-08-13-DAQ-annotations.xls': 'files/primary/sub-2013-08-13/sub-2013-08-13_2013-08-13-DAQ-annotations_xls.xls',
-            'files/primary/sub-2013-06-06/2013-06-06-recording-metadata.xlsx': 'files/primary/sub-2013-06-06/sub-2013-06-06_2013-06-06-recording-metadata_xls.xlsx',
-            'files/primary/sub-2013-08-13/2013-08-13-prep-annotations.xls': 'files/primary/sub-2013-08-13/sub-2013-08-13_2013-08-13-prep-annotations_xls.xls',
-            'files/primary/sub-2013-06-06/2013-06-06_001_from_daq.smr': 'files/primary/sub-2013-06-06/sub-2013-06-06_2013-06-06_001_from_daq_smr.smr',
-            'files/primary/sub-2013-06-06/2013-06-06-DAQ-annotations.xls': 'files/primary/sub-2013-06-06/sub-2013-06-06_2013-06-06-DAQ-annotations_xls.xls',
-            'files/primary/sub-2014-05-13/2014-05-13-prep-annotations.xls': 'files/primary/sub-2014-05-13/sub-2014-05-13_2014-05-13-prep-annotations_xls.xls',
-            'files/primary/sub-2014-05-13/2014-05-13_001_from_daq.smr': 'files/primary/sub-2014-05-13/sub-2014-05-13_2014-05-13_001_from_daq.smr',
-            'files/primary/sub-2014-05-13/2014-05-13_daq_001.smr': 'files/primary/sub-2014-05-13/sub-2014-05-13_2014-05-13_daq_001_smr.smr',
-            'files/primary/sub-2014-05-13/2014-05-13-recording-metadata.xlsx': 'files/primary/sub-2014-05-13/sub-2014-05-13_2014-05-13-recording-metadata_xlsx.xlsx',
-            'files/primary/sub-2014-05-13/2014-05-13-DAQ-annotations.xls': 'files/primary/sub-2014-05-13/sub-2014-05-13_2014-05-13-DAQ-annotations_xls.xls',
-            'files/primary/sub-2013-06-06/2013-06-06-prep-annotations.xls': 'files/primary/sub-2013-06-06/sub-2013-06-06_2013-06-06-prep-annotations_xls.xls',
-            'files/primary/sub-2013-05-21/2013-05-21_001_from_daq.smr': 'files/primary/sub-2013-05-21/sub-2013-05-21_2013-05-21_001_from_daq_smr.smr',
-            'files/primary/sub-2014-05-13/2014-05-13_daq_001.s2rx': 'files/primary/sub-2014-05-13/sub-2014-05-13_2014-05-13_daq_001.s2rx',
-            'files/primary/sub-2013-05-21/2013-05-21-prep-annotations.xls': 'files/primary/sub-2013-05-21/sub-2013-05-21_2013-05-21-prep-annotations_xls.xls',
-            'files/primary/sub-2013-05-21/2013-05-21-DAQ-annotations.xlsx': 'files/primary/sub-2013-05-21/sub-2013-05-21_2013-05-21-DAQ-annotations_xls.xlsx',
-            'files/primary/sub-2014-06-03/2014-06-03-recording-metadata.xlsx': 'files/primary/sub-2014-06-03/sub-2014-06-03_2014-06-03-recording-metadata_xlsx.xlsx',
-            'files/primary/sub-2013-05-21/2013-05-21-recording-metadata.xlsx': 'files/primary/sub-2013-05-21/sub-2013-05-21_2013-05-21-recording-metadata_xls.xlsx',
-            'files/primary/sub-2014-06-03/2014-06-03_001_from_daq.smr': 'files/primary/sub-2014-06-03/sub-2014-06-03_2014-06-03_001_from_daq_smr.smr',
-            'files/primary/sub-2014-07-08/2014-07-08_001_from_daq.smr': 'files/primary/sub-2014-07-08/sub-2014-07-08_2014-07-08_001_from_daq.smr',
-            'files/primary/sub-2014-06-03/2014-06-03-daq-annotations.xls': 'files/primary/sub-2014-06-03/sub-2014-06-03_2014-06-03-daq-annotations_xls.xls',
-            'files/primary/sub-2014-06-03/2014-06-03_daq_001.smr': 'files/primary/sub-2014-06-03/sub-2014-06-03_2014-06-03_daq_001_smr.smr',
-            'files/primary/sub-2014-06-03/2014-06-03-prep-annotations.xls': 'files/primary/sub-2014-06-03/sub-2014-06-03_2014-06-03-prep-annotations_xls.xls',
-            'files/primary/sub-2014-06-03/2014-06-03_daq_001.s2rx': 'files/primary/sub-2014-06-03/sub-2014-06-03_2014-06-03_daq_001.s2rx',
-            'files/primary/sub-2014-07-08/2014-07-08_daq_001.smr': 'files/primary/sub-2014-07-08/sub-2014-07-08_2014-07-08_daq_001_smr.smr',
-            'files/primary/sub-2014-07-08/2014-07-08-prep-annotation.xls': 'files/primary/sub-2014-07-08/sub-2014-07-08_2014-07-08-prep-annotation_xls.xls',
-            'files/primary/sub-2014-07-08/2014-07-08_daq_001.s2rx': 'files/primary/sub-2014-07-08/sub-2014-07-08_2014-07-08_daq_001.s2rx',
-            'files/primary/sub-2014-07-08/2014-07-08_001-recording-metadata.xlsx': 'files/primary/sub-2014-07-08/sub-2014-07-08_2014-07-08_001-recording-metadata_xlsx.xlsx',
-            'files/primary/sub-2014-07-01/2014-07-01-prep-annotation.xls': 'files/primary/sub-2014-07-01/sub-2014-07-01_2014-07-01-prep-annotation_xls.xls',
-            'files/primary/sub-2014-07-01/2014-07-01_daq_001.s2rx': 'files/primary/sub-2014-07-01/sub-2014-07-01_2014-07-01_daq_001.s2rx',
-            'files/primary/sub-2014-07-08/2014-07-08-DAQ-annotation.xls': 'files/primary/sub-2014-07-08/sub-2014-07-08_2014-07-08-DAQ-annotation_xls.xls',
-            'files/primary/sub-2014-07-01/2014-07-01_001_from_daq.smr': 'files/primary/sub-2014-07-01/sub-2014-07-01_2014-07-01_001_from_daq.smr',
-            'files/primary/sub-2014-07-01/2014-07-01-recording-metadata.xlsx': 'files/primary/sub-2014-07-01/sub-2014-07-01_2014-07-01-recording-metadata_xlsx.xlsx',
-            'files/primary/sub-2014-07-01/2014-07-01-DAQ-annotation.xls': 'files/primary/sub-2014-07-01/sub-2014-07-01_2014-07-01-DAQ-annotation_xls.xls',
-            'files/primary/sub-2014-07-01/2014-07-01_daq_001.smr': 'files/primary/sub-2014-07-01/sub-2014-07-01_2014-07-01_daq_001_smr.smr',
-            'files/primary/sub-2014-06-24/2014-06-24_001_from_daq.smr': 'files/primary/sub-2014-06-24/sub-2014-06-24_2014-06-24_001_from_daq.smr',
-            'files/primary/sub-2014-06-24/2014-06-24_daq_001.s2rx': 'files/primary/sub-2014-06-24/sub-2014-06-24_2014-06-24_daq_001.s2rx',
-            'files/primary/sub-2014-06-24/2014-06-24-DAQ-annotations.xls': 'files/primary/sub-2014-06-24/sub-2014-06-24_2014-06-24-DAQ-annotations_xls.xls',
-            'files/primary/sub-2014-06-24/2014-06-24-recording-metadata.xlsx': 'files/primary/sub-2014-06-24/sub-2014-06-24_2014-06-24-recording-metadata_xlsx.xlsx',
-            'files/primary/sub-2014-06-24/2014-06-24_daq_001.smr': 'files/primary/sub-2014-06-24/sub-2014-06-24_2014-06-24_daq_001_smr.smr',
-            'files/primary/sub-2014-06-24/2014-06-24-prep-annotations.xlsx': 'files/primary/sub-2014-06-24/sub-2014-06-24_2014-06-24-prep-annotations_xlsx.xlsx',
-            'files/primary/sub-2013-08-01/2013-08-01_daq_001.smr': 'files/primary/sub-2013-08-01/sub-2013-08-01_2013-08-01_daq_001_smr.smr',
-            'files/primary/sub-2013-08-01/2013-08-01_daq_001.s2rx': 'files/primary/sub-2013-08-01/sub-2013-08-01_2013-08-01_daq_001.s2rx',
-            'files/primary/sub-2013-08-01/2013-08-01-prep-annotations.xls': 'files/primary/sub-2013-08-01/sub-2013-08-01_2013-08-01-prep-annotations_xls.xls',
-            'files/primary/sub-2013-08-01/2013-08-01-recording-metadata.xlsx': 'files/primary/sub-2013-08-01/sub-2013-08-01_2013-08-01-recording-metadata_xlsx.xlsx',
-            'files/primary/sub-2013-08-01/2013-08-01_001_from_daq.s2rx': 'files/primary/sub-2013-08-01/sub-2013-08-01_2013-08-01_001_from_daq.s2rx',
-            'files/primary/sub-2013-08-01/2013-08-01-DAQ-annotations.xls': 'files/primary/sub-2013-08-01/sub-2013-08-01_2013-08-01-DAQ-annotations_xls.xls',
-            'files/primary/sub-2013-08-01/2013-08-01_001_from_daq.smr': 'files/primary/sub-2013-08-01/sub-2013-08-01_2013-08-01_001_from_daq.smr',
-            'files/primary/sub-2014-05-20/2014-05-20_daq_001.s2rx': 'files/primary/sub-2014-05-20/sub-2014-05-20_2014-05-20_daq_001.s2rx',
-            'files/primary/sub-2014-05-20/2014-05-20_daq_001.smr': 'files/primary/sub-2014-05-20/sub-2014-05-20_2014-05-20_daq_001_smr.smr',
-            'files/primary/sub-2014-05-20/2014-05-20_001_from_daq.smr': 'files/primary/sub-2014-05-20/sub-2014-05-20_2014-05-20_001_from_daq.smr',
-            'files/primary/sub-2014-05-20/2014-05-20-DAQ-annotations.xls': 'files/primary/sub-2014-05-20/sub-2014-05-20_2014-05-20-DAQ-annotations_xls.xls',
-            'files/primary/sub-2014-05-20/2014-05-20-prep-annotations.xls': 'files/primary/sub-2014-05-20/sub-2014-05-20_2014-05-20-prep-annotations_xls.xls',
-            'files/primary/sub-2014-05-20/2014-05-20-recording-metadata.xlsx': 'files/primary/sub-2014-05-20/sub-2014-05-20_2014-05-20-recording-metadata_xlsx.xlsx',
-            'files/derivative/sub-2013-06-18/2013-06-18_001-v8f_from_edt.smr': 'files/derivative/sub-2013-06-18/sub-2013-06-18_2013-06-18_001-v8f_from_edt_smr.smr',
-            'files/derivative/sub-2013-08-29/2013-08-29_001-v7f_from_edt.smr': 'files/derivative/sub-2013-08-29/sub-2013-08-29_2013-08-29_001-v7f_from_edt_smr.smr',
-            'files/derivative/sub-2013-06-06/2013-06-06_001-FULLFILE-v2f_from_edt.smr': 'files/derivative/sub-2013-06-06/sub-2013-06-06_2013-06-06_001-FULLFILE-v2f_from_edt_smr.smr',
-            'files/derivative/sub-2013-06-06/2013-06-06_001-PREVX_from_edt.smr': 'files/derivative/sub-2013-06-06/sub-2013-06-06_2013-06-06_001-PREVX_from_edt_smr.smr',
-            'files/derivative/sub-2013-06-25/2013-06-25_001-v6f_from_edt.smr': 'files/derivative/sub-2013-06-25/sub-2013-06-25_2013-06-25_001-v6f_from_edt_smr.smr',
-            'files/derivative/sub-2014-06-03/2014-06-03_001-v7f_from_edt.smr': 'files/derivative/sub-2014-06-03/sub-2014-06-03_2014-06-03_001-v7f_from_edt_smr.smr',
-            'files/derivative/sub-2013-08-01/2013-08-01_001-v6f_from_edt.smr': 'files/derivative/sub-2013-08-01/sub-2013-08-01_2013-08-01_001-v6f_from_edt_smr.smr',
-            'files/derivative/sub-2014-05-13/2014-05-13_001-v9f_from_edt.smr': 'files/derivative/sub-2014-05-13/sub-2014-05-13_2014-05-13_001-v9f_from_edt_smr.smr',
-            'files/derivative/sub-2013-08-13/2013-08-13_001-v12f_from_edt.smr': 'files/derivative/sub-2013-08-13/sub-2013-08-13_2013-08-13_001-v12f_from_edt_smr.smr',
-            'files/derivative/sub-2014-07-01/2014-07-01_001-v8f_from_edt.smr': 'files/derivative/sub-2014-07-01/sub-2014-07-01_2014-07-01_001-v8f_from_edt_smr.smr',
-            'files/derivative/sub-2013-05-21/2013-05-21_001-v6f_from_edt.smr': 'files/derivative/sub-2013-05-21/sub-2013-05-21_2013-05-21_001-v6f_from_edt_smr.smr',
-            'files/derivative/sub-2014-07-08/2014-07-08_001-v13f_from_edt.smr': 'files/derivative/sub-2014-07-08/sub-2014-07-08_2014-07-08_001-v13f_from_edt_smr.smr',
-            'files/derivative/sub-2014-06-24/2014-06-24_001-v7f_from_edt.smr': 'files/derivative/sub-2014-06-24/sub-2014-06-24_2014-06-24_001-v7f_from_edt_smr.smr',
-            'files/derivative/sub-2014-05-20/2014-05-20_001-v12f_from_edt.smr': 'files/derivative/sub-2014-05-20/sub-2014-05-20_2014-05-20_001-v12f_from_edt_smr.smr',
-            'files/derivative/sub-2013-08-01/2013-08-01_001-PRE-v1_from_edt.smr': 'files/derivative/sub-2013-08-01/sub-2013-08-01_2013-08-01_001-PRE-v1_from_edt_smr.smr',
-            'files/docs/Sparc_datasets_9046_.xlsx': 'files/docs/Sparc datasets(9046).xlsx',
-            'files/protocol/Vagotomy___PRV_Protocol.pdf': 'files/protocol/Vagotomy %26 PRV Protocol.pdf',
-            'files/protocol/Vagal_Nerve_Stimulation.docx': 'files/protocol/Vagal Nerve Stimulation.docx',
-            'files/primary/Cholinergic Distribution Raw Data/ChAT Sample 7/Cholinergic_Sample_7_part_1.zip': 'files/primary/Cholinergic Distribution Raw Data/ChAT Sample 7/Cholinergic Sample 7 part 1.zip',
-            'files/primary/Cholinergic Distribution Raw Data/ChAT Sample 7/Cholinergic_Sample_7_part_3.zip': 'files/primary/Cholinergic Distribution Raw Data/ChAT Sample 7/Cholinergic Sample 7 part 3.zip',
-            'files/primary/Cholinergic Distribution Raw Data/ChAT Sample 5/Cholinergic_Sample_5_part_1.zip': 'files/primary/Cholinergic Distribution Raw Data/ChAT Sample 5/Cholinergic Sample 5 part 1.zip',
-            'files/primary/Cholinergic Distribution Raw Data/ChAT Sample 7/Cholinergic_Sample_7_part_2.zip': 'files/primary/Cholinergic Distribution Raw Data/ChAT Sample 7/Cholinergic Sample 7 part 2.zip',
-            'files/primary/Cholinergic Distribution Raw Data/ChAT Sample 1/Cholinergic_Sample_1_part_2.zip': 'files/primary/Cholinergic Distribution Raw Data/ChAT Sample 1/Cholinergic Sample 1 part 2.zip',
-            'files/primary/Cholinergic Distribution Raw Data/ChAT Sample 5/Cholinergic_Sample_5_part_3.zip': 'files/primary/Cholinergic Distribution Raw Data/ChAT Sample 5/Cholinergic Sample 5 part 3.zip',
-            'files/primary/Cholinergic Distribution Raw Data/ChAT Sample 1/Cholinergic_Sample_1_part_3.zip': 'files/primary/Cholinergic Distribution Raw Data/ChAT Sample 1/Cholinergic Sample 1 part 3.zip',
-            'files/primary/Cholinergic Distribution Raw Data/ChAT Sample 1/Cholinergic_Sample_1_part_1.zip': 'files/primary/Cholinergic Distribution Raw Data/ChAT Sample 1/Cholinergic Sample 1 part 1.zip',
-            'files/primary/Cholinergic Distribution Raw Data/ChAT Sample 2/Cholinergic_Sample_2_part_3.zip': 'files/primary/Cholinergic Distribution Raw Data/ChAT Sample 2/Cholinergic Sample 2 part 3.zip',
-            'files/primary/Cholinergic Distribution Raw Data/ChAT Sample 5/Cholinergic_Sample_5_part_2.zip': 'files/primary/Cholinergic Distribution Raw Data/ChAT Sample 5/Cholinergic Sample 5 part 2.zip',
-            'files/primary/Cholinergic Distribution Raw Data/ChAT Sample 2/Cholinergic_Sample_2_part_1.zip': 'files/primary/Cholinergic Distribution Raw Data/ChAT Sample 2/Cholinergic Sample 2 part 1.zip',
-            'files/primary/Cholinergic Distribution Raw Data/ChAT Sample 2/Cholinergic_Sample_2_part_2.zip': 'files/primary/Cholinergic Distribution Raw Data/ChAT Sample 2/Cholinergic Sample 2 part 2.zip',
-            'files/primary/Cholinergic Distribution Raw Data/ChAT Sample 4/Cholinergic_Sample_4_part_2.zip': 'files/primary/Cholinergic Distribution Raw Data/ChAT Sample 4/Cholinergic Sample 4 part 2.zip',
-            'files/primary/Cholinergic Distribution Raw Data/ChAT Sample 4/Cholinergic_Sample_4_part_1.zip': 'files/primary/Cholinergic Distribution Raw Data/ChAT Sample 4/Cholinergic Sample 4 part 1.zip',
-            'files/primary/Cholinergic Distribution Raw Data/ChAT Sample 6/Cholinergic_Sample_6_part_2.zip': 'files/primary/Cholinergic Distribution Raw Data/ChAT Sample 6/Cholinergic Sample 6 part 2.zip',
-            'files/primary/Cholinergic Distribution Raw Data/ChAT Sample 6/Cholinergic_Sample_6_part_3.zip': 'files/primary/Cholinergic Distribution Raw Data/ChAT Sample 6/Cholinergic Sample 6 part 3.zip',
-            'files/primary/Cholinergic Distribution Raw Data/ChAT Sample 4/Cholinergic_Sample_4_part_3.zip': 'files/primary/Cholinergic Distribution Raw Data/ChAT Sample 4/Cholinergic Sample 4 part 3.zip',
-            'files/primary/Cholinergic Distribution Raw Data/ChAT Sample 6/Cholinergic_Sample_6_part_1.zip': 'files/primary/Cholinergic Distribution Raw Data/ChAT Sample 6/Cholinergic Sample 6 part 1.zip',
-            'files/primary/Wnt-1 Distribution Raw Data/Sample 5/Wnt-1_Sample_5_part_3.zip': 'files/primary/Wnt-1 Distribution Raw Data/Sample 5/Wnt-1 Sample 5 part 3.zip',
-            'files/primary/Cholinergic Distribution Raw Data/ChAT Sample 3/Cholinergic_Sample_3_part_3.zip': 'files/primary/Cholinergic Distribution Raw Data/ChAT Sample 3/Cholinergic Sample 3 part 3.zip',
-            'files/primary/Wnt-1 Distribution Raw Data/Sample 6/Wnt-1_Sample_6_part_1.zip': 'files/primary/Wnt-1 Distribution Raw Data/Sample 6/Wnt-1 Sample 6 part 1.zip',
-            'files/primary/Cholinergic Distribution Raw Data/ChAT Sample 3/Cholinergic_Sample_3_part_2.zip': 'files/primary/Cholinergic Distribution Raw Data/ChAT Sample 3/Cholinergic Sample 3 part 2.zip',
-            'files/primary/Wnt-1 Distribution Raw Data/Sample 6/Wnt-1_Sample_6_part_2.zip': 'files/primary/Wnt-1 Distribution Raw Data/Sample 6/Wnt-1 Sample 6 part 2.zip',
-            'files/primary/Wnt-1 Distribution Raw Data/Sample 6/Wnt-1_Sample_6_part_3.zip': 'files/primary/Wnt-1 Distribution Raw Data/Sample 6/Wnt-1 Sample 6 part 3.zip',
-            'files/primary/Cholinergic Distribution Raw Data/ChAT Sample 3/Cholinergic_Sample_3_part_1.zip': 'files/primary/Cholinergic Distribution Raw Data/ChAT Sample 3/Cholinergic Sample 3 part 1.zip',
-            'files/primary/Wnt-1 Distribution Raw Data/Sample 5/Wnt-1_Sample_5_part_2.zip': 'files/primary/Wnt-1 Distribution Raw Data/Sample 5/Wnt-1 Sample 5 part 2.zip',
-            'files/primary/Wnt-1 Distribution Raw Data/Sample 5/Wnt-1_Sample_5_part_1.zip': 'files/primary/Wnt-1 Distribution Raw Data/Sample 5/Wnt-1 Sample 5 part 1.zip',
-            'files/primary/Wnt-1 Distribution Raw Data/Sample 7/Wnt-1_Sample_7_part_1.zip': 'files/primary/Wnt-1 Distribution Raw Data/Sample 7/Wnt-1 Sample 7 part 1.zip',
-            'files/primary/Wnt-1 Distribution Raw Data/Sample 4/Wnt-1_Sample_4_part_2.zip': 'files/primary/Wnt-1 Distribution Raw Data/Sample 4/Wnt-1 Sample 4 part 2.zip',
-            'files/primary/Wnt-1 Distribution Raw Data/Sample 4/Wnt-1_Sample_4_part_1.zip': 'files/primary/Wnt-1 Distribution Raw Data/Sample 4/Wnt-1 Sample 4 part 1.zip',
-            'files/primary/Wnt-1 Distribution Raw Data/Sample 7/Wnt-1_Sample_7_part_2.zip': 'files/primary/Wnt-1 Distribution Raw Data/Sample 7/Wnt-1 Sample 7 part 2.zip',
-            'files/primary/Wnt-1 Distribution Raw Data/Sample 7/Wnt-1_Sample_7_part_3.zip': 'files/primary/Wnt-1 Distribution Raw Data/Sample 7/Wnt-1 Sample 7 part 3.zip',
-            'files/primary/Wnt-1 Distribution Raw Data/Sample 4/Wnt-1_Sample_4_part_3.zip': 'files/primary/Wnt-1 Distribution Raw Data/Sample 4/Wnt-1 Sample 4 part 3.zip',
-            'files/primary/Wnt-1 Distribution Raw Data/Sample 1/Wnt-1_Sample_1_Part_1.zip': 'files/primary/Wnt-1 Distribution Raw Data/Sample 1/Wnt-1 Sample 1 Part 1.zip',
-            'files/primary/Wnt-1 Distribution Raw Data/Sample 1/Wnt-1_Sample_1_Part_2.zip': 'files/primary/Wnt-1 Distribution Raw Data/Sample 1/Wnt-1 Sample 1 Part 2.zip',
-            'files/primary/Wnt-1 Distribution Raw Data/Sample 2/Wnt-1_Sample_2_Part_2.zip': 'files/primary/Wnt-1 Distribution Raw Data/Sample 2/Wnt-1 Sample 2 Part 2.zip',
-            'files/primary/Wnt-1 Distribution Raw Data/Sample 1/Wnt-1_Sample_1_Part_3.zip': 'files/primary/Wnt-1 Distribution Raw Data/Sample 1/Wnt-1 Sample 1 Part 3.zip',
-            'files/primary/Wnt-1 Distribution Raw Data/Sample 2/Wnt-1_Sample_2_Part_3.zip': 'files/primary/Wnt-1 Distribution Raw Data/Sample 2/Wnt-1 Sample 2 Part 3.zip',
-            'files/primary/Wnt-1 Distribution Raw Data/Sample 2/Wnt-1_Sample_2_Part_1.zip': 'files/primary/Wnt-1 Distribution Raw Data/Sample 2/Wnt-1 Sample 2 Part 1.zip',
-            'files/primary/Wnt-1 Distribution Raw Data/Sample 8/Wnt-1_Sample_8_part_1.zip': 'files/primary/Wnt-1 Distribution Raw Data/Sample 8/Wnt-1 Sample 8 part 1.zip',
-            'files/primary/Wnt-1 Distribution Raw Data/Sample 8/Wnt-1_Sample_8_part_3.zip': 'files/primary/Wnt-1 Distribution Raw Data/Sample 8/Wnt-1 Sample 8 part 3.zip',
-            'files/primary/Wnt-1 Distribution Raw Data/Sample 3/Wnt-1_Sample_3_Part_2.zip': 'files/primary/Wnt-1 Distribution Raw Data/Sample 3/Wnt-1 Sample 3 Part 2.zip',
-            'files/primary/Wnt-1 Distribution Raw Data/Sample 8/Wnt-1_Sample_8_part_2.zip': 'files/primary/Wnt-1 Distribution Raw Data/Sample 8/Wnt-1 Sample 8 part 2.zip',
-            'files/primary/Wnt-1 Distribution Raw Data/Sample 3/Wnt-1_Sample_3_Part_1.zip': 'files/primary/Wnt-1 Distribution Raw Data/Sample 3/Wnt-1 Sample 3 Part 1.zip',
-            'files/primary/nNOS Distribution Raw Data/nNOS Sample 2/nNOS_Sample_2_part_3.zip': 'files/primary/nNOS Distribution Raw Data/nNOS Sample 2/nNOS Sample 2 part 3 (1).zip',
-            'files/primary/Wnt-1 Distribution Raw Data/Sample 3/Wnt-1_Sample_3_Part_3.zip': 'files/primary/Wnt-1 Distribution Raw Data/Sample 3/Wnt-1 Sample 3 Part 3.zip',
-            'files/primary/nNOS Distribution Raw Data/nNOS Sample 2/nNOS_Sample_2_part_1.zip': 'files/primary/nNOS Distribution Raw Data/nNOS Sample 2/nNOS Sample 2 part 1.zip',
-            'files/primary/nNOS Distribution Raw Data/nNOS Sample 4/nNOS_Sample_4_part_2.zip': 'files/primary/nNOS Distribution Raw Data/nNOS Sample 4/nNOS Sample 4 part 2.zip',
-            'files/primary/nNOS Distribution Raw Data/nNOS Sample 2/nNOS_Sample_2_part_2.zip': 'files/primary/nNOS Distribution Raw Data/nNOS Sample 2/nNOS Sample 2 part 2.zip',
-            'files/primary/nNOS Distribution Raw Data/nNOS Sample 4/nNOS_Sample_4_part_1.zip': 'files/primary/nNOS Distribution Raw Data/nNOS Sample 4/nNOS Sample 4 part 1.zip',
-            'files/primary/nNOS Distribution Raw Data/nNOS Sample 7/nNOS_Sample_7_part_3.zip': 'files/primary/nNOS Distribution Raw Data/nNOS Sample 7/nNOS Sample 7 part 3.zip',
-            'files/primary/nNOS Distribution Raw Data/nNOS Sample 5/nNOS_Sample_5_part_2.zip': 'files/primary/nNOS Distribution Raw Data/nNOS Sample 5/nNOS Sample 5 part 2.zip',
-            'files/primary/nNOS Distribution Raw Data/nNOS Sample 4/nNOS_Sample_4_part_3.zip': 'files/primary/nNOS Distribution Raw Data/nNOS Sample 4/nNOS Sample 4 part 3.zip',
-            'files/primary/nNOS Distribution Raw Data/nNOS Sample 7/nNOS_Sample_7_part_2.zip': 'files/primary/nNOS Distribution Raw Data/nNOS Sample 7/nNOS Sample 7 part 2.zip',
-            'files/primary/nNOS Distribution Raw Data/nNOS Sample 7/nNOS_Sample_7_part_1.zip': 'files/primary/nNOS Distribution Raw Data/nNOS Sample 7/nNOS Sample 7 part 1.zip',
-            'files/primary/nNOS Distribution Raw Data/nNOS Sample 1/nNOS_Sample_1_part_1.zip': 'files/primary/nNOS Distribution Raw Data/nNOS Sample 1/nNOS Sample 1 part 1.zip',
-            'files/primary/nNOS Distribution Raw Data/nNOS Sample 1/nNOS_Sample_1_part_3.zip': 'files/primary/nNOS Distribution Raw Data/nNOS Sample 1/nNOS Sample 1 part 3.zip',
-            'files/primary/nNOS Distribution Raw Data/nNOS Sample 5/nNOS_Sample_5_part_3.zip': 'files/primary/nNOS Distribution Raw Data/nNOS Sample 5/nNOS Sample 5 part 3.zip',
-            'files/primary/nNOS Distribution Raw Data/nNOS Sample 5/nNOS_Sample_5_part_1.zip': 'files/primary/nNOS Distribution Raw Data/nNOS Sample 5/nNOS Sample 5 part 1.zip',
-            'files/primary/nNOS Distribution Raw Data/nNOS Sample 6/nNOS_Sample_6_part_1.zip': 'files/primary/nNOS Distribution Raw Data/nNOS Sample 6/nNOS Sample 6 part 1.zip',
-            'files/primary/nNOS Distribution Raw Data/nNOS Sample 1/nNOS_Sample_1_part_2.zip': 'files/primary/nNOS Distribution Raw Data/nNOS Sample 1/nNOS Sample 1 part 2.zip',
-            'files/primary/nNOS Distribution Raw Data/nNOS Sample 3/nNOS_Sample_3_part_2.zip': 'files/primary/nNOS Distribution Raw Data/nNOS Sample 3/nNOS Sample 3 part 2.zip',
-            'files/primary/nNOS Distribution Raw Data/nNOS Sample 3/nNOS_Sample_3_part_1.zip': 'files/primary/nNOS Distribution Raw Data/nNOS Sample 3/nNOS Sample 3 part 1.zip',
-            'files/primary/nNOS Distribution Raw Data/nNOS Sample 6/nNOS_Sample_6_part_2.zip': 'files/primary/nNOS Distribution Raw Data/nNOS Sample 6/nNOS Sample 6 part 2.zip',
-            'files/primary/nNOS Distribution Raw Data/nNOS Sample 6/nNOS_Sample_6_part_3.zip': 'files/primary/nNOS Distribution Raw Data/nNOS Sample 6/nNOS Sample 6 part 3.zip',
-            'files/primary/nNOS Distribution Raw Data/nNOS Sample 3/nNOS_Sample_3_part_3.zip': 'files/primary/nNOS Distribution Raw Data/nNOS Sample 3/nNOS Sample 3 part 3.zip',
-            'files/derivative/nNOS Distribution Derivative Data/nNOS Sample 2/nNOS_Sample_2_Proximal.tif': 'files/derivative/nNOS Distribution Derivative Data/nNOS Sample 2/nNOS Sample 2 Proximal.tif',
-            'files/derivative/nNOS Distribution Derivative Data/nNOS Sample 2/nNOS_sample_2_Distal.tif': 'files/derivative/nNOS Distribution Derivative Data/nNOS Sample 2/nNOS sample 2 Distal.tif',
-            'files/derivative/nNOS Distribution Derivative Data/nNOS Sample 2/nNOS_Sample_2_Middle.tif': 'files/derivative/nNOS Distribution Derivative Data/nNOS Sample 2/nNOS Sample 2 Middle.tif',
-            'files/derivative/nNOS Distribution Derivative Data/nNOS Sample 4/nNOS_Sample_4_Distal.tif': 'files/derivative/nNOS Distribution Derivative Data/nNOS Sample 4/nNOS Sample 4 Distal.tif',
-            'files/derivative/nNOS Distribution Derivative Data/nNOS Sample 4/nNOS_Sample_4_Proximal.tif': 'files/derivative/nNOS Distribution Derivative Data/nNOS Sample 4/nNOS Sample 4 Proximal.tif',
-            'files/derivative/nNOS Distribution Derivative Data/nNOS Sample 4/nNOS_Sample_4_Middle.tif': 'files/derivative/nNOS Distribution Derivative Data/nNOS Sample 4/nNOS Sample 4 Middle.tif',
-            'files/derivative/nNOS Distribution Derivative Data/nNOS Sample 7/Sample_7_nNOS_anal.tif': 'files/derivative/nNOS Distribution Derivative Data/nNOS Sample 7/nNOS Sample 7 Distal.tif',
-            'files/derivative/nNOS Distribution Derivative Data/nNOS Sample 7/Sample_7_nNOS_mid.tif': 'files/derivative/nNOS Distribution Derivative Data/nNOS Sample 7/nNOS Sample 7 Middle.tif',
-            'files/derivative/nNOS Distribution Derivative Data/nNOS Sample 7/Sample_7_nNOS_oral.tif': 'files/derivative/nNOS Distribution Derivative Data/nNOS Sample 7/nNOS Sample 7 Proximal.tif',
-            'files/derivative/nNOS Distribution Derivative Data/nNOS Sample 5/nNOS_Sample_5_Proximal.tif': 'files/derivative/nNOS Distribution Derivative Data/nNOS Sample 5/nNOS Sample 5 Proximal.tif',
-            'files/derivative/nNOS Distribution Derivative Data/nNOS Sample 5/nNOS_Sample_5_Middle.tif': 'files/derivative/nNOS Distribution Derivative Data/nNOS Sample 5/nNOS Sample 5 Middle.tif',
-            'files/derivative/nNOS Distribution Derivative Data/nNOS Sample 1/nNOS_Sample_1_Distal.tif': 'files/derivative/nNOS Distribution Derivative Data/nNOS Sample 1/nNOS Sample 1 Distal.tif',
-            'files/derivative/nNOS Distribution Derivative Data/nNOS Sample 5/nNOS_Sample_5_Distal.tif': 'files/derivative/nNOS Distribution Derivative Data/nNOS Sample 5/nNOS Sample 5 Distal.tif',
-            'files/derivative/nNOS Distribution Derivative Data/nNOS Sample 1/nNOS_Sample_1_Proximal.tif': 'files/derivative/nNOS Distribution Derivative Data/nNOS Sample 1/nNOS Sample 1 Proximal.tif',
-            'files/derivative/nNOS Distribution Derivative Data/nNOS Sample 1/nNOS_Sample_1_Middle.tif': 'files/derivative/nNOS Distribution Derivative Data/nNOS Sample 1/nNOS Sample 1 Middle.tif',
-            'files/derivative/nNOS Distribution Derivative Data/nNOS Sample 6/nNOS_Sample_6_Distal.jp2': 'files/derivative/nNOS Distribution Derivative Data/nNOS Sample 6/nNOS Sample 6 Distal (1).jp2',
-            'files/derivative/nNOS Distribution Derivative Data/nNOS Sample 6/nNOS_Sample_6_Middle.jp2': 'files/derivative/nNOS Distribution Derivative Data/nNOS Sample 6/nNOS Sample 6 Middle (1).jp2',
-            'files/derivative/nNOS Distribution Derivative Data/nNOS Sample 6/Sample_6_nNOS_oral.tif': 'files/derivative/nNOS Distribution Derivative Data/nNOS Sample 6/nNOS Sample 6 Proximal.tif',
-            'files/derivative/nNOS Distribution Derivative Data/nNOS Sample 6/Sample_6_nNOS_anal.tif': 'files/derivative/nNOS Distribution Derivative Data/nNOS Sample 6/nNOS Sample 6 Distal.tif',
-            'files/derivative/nNOS Distribution Derivative Data/nNOS Sample 6/Sample_6_nNOS_mid.tif': 'files/derivative/nNOS Distribution Derivative Data/nNOS Sample 6/nNOS Sample 6 Middle.tif',
-            'files/derivative/nNOS Distribution Derivative Data/nNOS Sample 6/nNOS_Sample_6_Proximal.jp2': 'files/derivative/nNOS Distribution Derivative Data/nNOS Sample 6/nNOS Sample 6 Proximal (1).jp2',
-            'files/derivative/nNOS Distribution Derivative Data/nNOS Sample 3/nNOS_Sample_3_Middle.tif': 'files/derivative/nNOS Distribution Derivative Data/nNOS Sample 3/nNOS Sample 3 Middle.tif',
-            'files/derivative/nNOS Distribution Derivative Data/nNOS Sample 3/nNOS_Sample_3_Proximal.tif': 'files/derivative/nNOS Distribution Derivative Data/nNOS Sample 3/nNOS Sample 3 Proximal.tif',
-            'files/derivative/nNOS Distribution Derivative Data/nNOS Sample 3/nNOS_Sample_3_Distal.tif': 'files/derivative/nNOS Distribution Derivative Data/nNOS Sample 3/nNOS Sample 3 Distal.tif',
-            'files/derivative/Cholinergic Distribution Derivative Data/ChAT Sample 7/ChAT_Sample_7_anal.tif': 'files/derivative/Cholinergic Distribution Derivative Data/ChAT Sample 7/ChAT Sample 7 Distal.tif',
-            'files/derivative/Cholinergic Distribution Derivative Data/ChAT Sample 7/ChAT_sample_7_mid.tif': 'files/derivative/Cholinergic Distribution Derivative Data/ChAT Sample 7/ChAT Sample 7 Middle.tif',
-            'files/derivative/Cholinergic Distribution Derivative Data/ChAT Sample 7/ChAT_sample_7_oral.tif': 'files/derivative/Cholinergic Distribution Derivative Data/ChAT Sample 7/ChAT Sample 7 Proximal.tif',
-            'files/derivative/Cholinergic Distribution Derivative Data/ChAT Sample 1/ChAT_Sample_1_Middle.tif': 'files/derivative/Cholinergic Distribution Derivative Data/ChAT Sample 1/ChAT Sample 1 Middle.tif',
-            'files/derivative/Cholinergic Distribution Derivative Data/ChAT Sample 1/ChAT_Sample_1_Proximal.tif': 'files/derivative/Cholinergic Distribution Derivative Data/ChAT Sample 1/ChAT Sample 1 Proximal.tif',
-            'files/derivative/Cholinergic Distribution Derivative Data/ChAT Sample 1/ChAT_Sample_1_Distal.tif': 'files/derivative/Cholinergic Distribution Derivative Data/ChAT Sample 1/ChAT Sample 1 Distal.tif',
-            'files/derivative/Cholinergic Distribution Derivative Data/ChAT Sample 5/Cholinergic_Sample_5_Distal.tif': 'files/derivative/Cholinergic Distribution Derivative Data/ChAT Sample 5/ChAT Sample 5 Distal.tif',
-            'files/derivative/Cholinergic Distribution Derivative Data/ChAT Sample 5/Cholinergic_Sample_5_Middle.tif': 'files/derivative/Cholinergic Distribution Derivative Data/ChAT Sample 5/ChAT Sample 5 Middle.tif',
-            'files/derivative/Cholinergic Distribution Derivative Data/ChAT Sample 2/ChAT_Sample_2_Middle.tif': 'files/derivative/Cholinergic Distribution Derivative Data/ChAT Sample 2/ChAT Sample 2 Middle.tif',
-            'files/derivative/Cholinergic Distribution Derivative Data/ChAT Sample 2/ChAT_Sample_2_Distal.tif': 'files/derivative/Cholinergic Distribution Derivative Data/ChAT Sample 2/ChAT Sample 2 Distal.tif',
-            'files/derivative/Cholinergic Distribution Derivative Data/ChAT Sample 5/Cholinergic_Sample_5_Proximal.tif': 'files/derivative/Cholinergic Distribution Derivative Data/ChAT Sample 5/ChAT Sample 5 Proximal.tif',
-            'files/derivative/Cholinergic Distribution Derivative Data/ChAT Sample 2/ChAT_Sample_2_Proximal.tif': 'files/derivative/Cholinergic Distribution Derivative Data/ChAT Sample 2/ChAT Sample 2 Proximal.tif',
-            'files/derivative/Cholinergic Distribution Derivative Data/ChAT Sample 4/ChAT_Sample_4_Middle.tif': 'files/derivative/Cholinergic Distribution Derivative Data/ChAT Sample 4/ChAT Sample 4 Middle.tif',
-            'files/derivative/Cholinergic Distribution Derivative Data/ChAT Sample 4/ChAT_Sample_4_Distal.tif': 'files/derivative/Cholinergic Distribution Derivative Data/ChAT Sample 4/ChAT Sample 4 Distal.tif',
-            'files/derivative/Cholinergic Distribution Derivative Data/ChAT Sample 6/ChAT_Sample_6_Distal.jp2': 'files/derivative/Cholinergic Distribution Derivative Data/ChAT Sample 6/ChAT Sample 6 Distal (1).jp2',
-            'files/derivative/Cholinergic Distribution Derivative Data/ChAT Sample 6/CHaT_Sample_6_Oral.tif': 'files/derivative/Cholinergic Distribution Derivative Data/ChAT Sample 6/ChAT Sample 6 Proximal.tif',
-            'files/derivative/Cholinergic Distribution Derivative Data/ChAT Sample 4/ChAT_Sample_4_Proximal.tif': 'files/derivative/Cholinergic Distribution Derivative Data/ChAT Sample 4/ChAT Sample 4 Proximal.tif',
-            'files/derivative/Cholinergic Distribution Derivative Data/ChAT Sample 6/ChAT_Sample_6_Middle.jp2': 'files/derivative/Cholinergic Distribution Derivative Data/ChAT Sample 6/ChAT Sample 6 Middle (1).jp2',
-            'files/derivative/Cholinergic Distribution Derivative Data/ChAT Sample 6/CHaT_Sample_6_Mid.tif': 'files/derivative/Cholinergic Distribution Derivative Data/ChAT Sample 6/ChAT Sample 6 Middle.tif',
-            'files/derivative/Cholinergic Distribution Derivative Data/ChAT Sample 6/CHaT_sample_6_Anal.tif': 'files/derivative/Cholinergic Distribution Derivative Data/ChAT Sample 6/ChAT Sample 6 Distal.tif',
-            'files/derivative/Cholinergic Distribution Derivative Data/ChAT Sample 3/ChAT_Sample_3_Middle.tif': 'files/derivative/Cholinergic Distribution Derivative Data/ChAT Sample 3/ChAT Sample 3 Middle.tif',
-            'files/derivative/Cholinergic Distribution Derivative Data/ChAT Sample 3/ChAT_Sample_3_Distal.tif': 'files/derivative/Cholinergic Distribution Derivative Data/ChAT Sample 3/ChAT Sample 3 Distal.tif',
-            'files/derivative/Cholinergic Distribution Derivative Data/ChAT Sample 3/ChAT_Sample_3_Proximal.tif': 'files/derivative/Cholinergic Distribution Derivative Data/ChAT Sample 3/ChAT Sample 3 Proximal.tif',
-            'files/derivative/Cholinergic Distribution Derivative Data/ChAT Sample 6/ChAT_Sample_6_Proximal.jp2': 'files/derivative/Cholinergic Distribution Derivative Data/ChAT Sample 6/ChAT Sample 6 Proximal (1).jp2',
-            'files/derivative/Wnt-1 Distribution Derivative Data/Wnt-1 Sample 3/Wnt-1_Sample_3_Middle.tif': 'files/derivative/Wnt-1 Distribution Derivative Data/Wnt-1 Sample 3/Wnt-1 Sample 3 Middle.tif',
-            'files/derivative/Wnt-1 Distribution Derivative Data/Wnt-1 Sample 7/Wnt-1_sample_7_Anal.tif': 'files/derivative/Wnt-1 Distribution Derivative Data/Wnt-1 Sample 7/Wnt-1 Sample 7 Distal.tif',
-            'files/derivative/Wnt-1 Distribution Derivative Data/Wnt-1 Sample 3/Wnt-1_Sample_3_Distal.tif': 'files/derivative/Wnt-1 Distribution Derivative Data/Wnt-1 Sample 3/Wnt-1 Sample 3 Distal.tif',
-            'files/derivative/Wnt-1 Distribution Derivative Data/Wnt-1 Sample 7/Wnt-1_sample_7_Mid.tif': 'files/derivative/Wnt-1 Distribution Derivative Data/Wnt-1 Sample 7/Wnt-1 Sample 7 Middle.tif',
-            'files/derivative/Wnt-1 Distribution Derivative Data/Wnt-1 Sample 3/Wnt-1_Sample_3_Proximal.tif': 'files/derivative/Wnt-1 Distribution Derivative Data/Wnt-1 Sample 3/Wnt-1 Sample 3 Proximal.tif',
-            'files/derivative/Wnt-1 Distribution Derivative Data/Wnt-1 Sample 4/Wnt-1_Sample_4_Mid.tif': 'files/derivative/Wnt-1 Distribution Derivative Data/Wnt-1 Sample 4/Wnt-1 Sample 4 Middle.tif',
-            'files/derivative/Wnt-1 Distribution Derivative Data/Wnt-1 Sample 7/Wnt-1_sample_7_Oral.tif': 'files/derivative/Wnt-1 Distribution Derivative Data/Wnt-1 Sample 7/Wnt-1 Sample 7 Proximal.tif',
-            'files/derivative/Wnt-1 Distribution Derivative Data/Wnt-1 Sample 4/Wnt-1_Sample_4_Oral.tif': 'files/derivative/Wnt-1 Distribution Derivative Data/Wnt-1 Sample 4/Wnt-1 Sample 4 Proximal.tif',
-            'files/derivative/Wnt-1 Distribution Derivative Data/Wnt-1 Sample 2/Wnt-1_Sample_2_Middle.tif': 'files/derivative/Wnt-1 Distribution Derivative Data/Wnt-1 Sample 2/Wnt-1 Sample 2 Middle.tif',
-            'files/derivative/Wnt-1 Distribution Derivative Data/Wnt-1 Sample 4/Wnt-1_Sample_4_Anal.tif': 'files/derivative/Wnt-1 Distribution Derivative Data/Wnt-1 Sample 4/Wnt-1 Sample 4 Distal.tif',
-            'files/derivative/Wnt-1 Distribution Derivative Data/Wnt-1 Sample 8/Wnt-1_sample_8_Oral.tif': 'files/derivative/Wnt-1 Distribution Derivative Data/Wnt-1 Sample 8/Wnt-1 Sample 8 Proximal.tif',
-            'files/derivative/Wnt-1 Distribution Derivative Data/Wnt-1 Sample 8/Wnt-1_Sample_8_Oral.jp2': 'files/derivative/Wnt-1 Distribution Derivative Data/Wnt-1 Sample 8/Wnt-1 Sample 8 Proximal (1).jp2',
-            'files/derivative/Wnt-1 Distribution Derivative Data/Wnt-1 Sample 8/Wnt-1_Sample_8_Distal.jp2': 'files/derivative/Wnt-1 Distribution Derivative Data/Wnt-1 Sample 8/Wnt-1 Sample 8 Distal (1).jp2',
-            'files/derivative/Wnt-1 Distribution Derivative Data/Wnt-1 Sample 8/Wnt-1_sample_8_Mid.tif': 'files/derivative/Wnt-1 Distribution Derivative Data/Wnt-1 Sample 8/Wnt-1 Sample 8 Middle.tif',
-            'files/derivative/Wnt-1 Distribution Derivative Data/Wnt-1 Sample 2/Wnt-1_Sample_2_Proximal.tif': 'files/derivative/Wnt-1 Distribution Derivative Data/Wnt-1 Sample 2/Wnt-1 Sample 2 Proximal.tif',
-            'files/derivative/Wnt-1 Distribution Derivative Data/Wnt-1 Sample 2/Wnt-1_Sample_2_Distal.tif': 'files/derivative/Wnt-1 Distribution Derivative Data/Wnt-1 Sample 2/Wnt-1 Sample 2 Distal.tif',
-            'files/derivative/Wnt-1 Distribution Derivative Data/Wnt-1 Sample 8/Wnt-1_sample_8_Anal.tif': 'files/derivative/Wnt-1 Distribution Derivative Data/Wnt-1 Sample 8/Wnt-1 Sample 8 Distal.tif',
-            'files/derivative/Wnt-1 Distribution Derivative Data/Wnt-1 Sample 1/Wnt-1_Sample_1_Proximal.tif': 'files/derivative/Wnt-1 Distribution Derivative Data/Wnt-1 Sample 1/Wnt-1 Sample 1 Proximal.tif',
-            'files/derivative/Wnt-1 Distribution Derivative Data/Wnt-1 Sample 1/Wnt-1_Sample_1_Middle.tif': 'files/derivative/Wnt-1 Distribution Derivative Data/Wnt-1 Sample 1/Wnt-1 Sample 1 Middle.tif',
-            'files/derivative/Wnt-1 Distribution Derivative Data/Wnt-1 Sample 6/Wnt-1_sample_6_Anal.tif': 'files/derivative/Wnt-1 Distribution Derivative Data/Wnt-1 Sample 6/Wnt-1 Sample 6 Distal.tif',
-            'files/derivative/Wnt-1 Distribution Derivative Data/Wnt-1 Sample 1/Wnt-1_Sample_1_Distal.tif': 'files/derivative/Wnt-1 Distribution Derivative Data/Wnt-1 Sample 1/Wnt-1 Sample 1 Distal.tif',
-            'files/derivative/Wnt-1 Distribution Derivative Data/Wnt-1 Sample 8/Wnt-1_Sample_8_Middle.jp2': 'files/derivative/Wnt-1 Distribution Derivative Data/Wnt-1 Sample 8/Wnt-1 Sample 8 Middle (1).jp2',
-            'files/derivative/Wnt-1 Distribution Derivative Data/Wnt-1 Sample 6/Wnt-1_sample_6_Mid.tif': 'files/derivative/Wnt-1 Distribution Derivative Data/Wnt-1 Sample 6/Wnt-1 Sample 6 Middle.tif',
-            'files/derivative/Wnt-1 Distribution Derivative Data/Wnt-1 Sample 5/Wnt-1_sample_5_Oral.tif': 'files/derivative/Wnt-1 Distribution Derivative Data/Wnt-1 Sample 5/Wnt-1 Sample 5 Proximal.tif',
-            'files/derivative/Wnt-1 Distribution Derivative Data/Wnt-1 Sample 6/Wnt-1_sample_6_Oral.tif': 'files/derivative/Wnt-1 Distribution Derivative Data/Wnt-1 Sample 6/Wnt-1 Sample 6 Proximal.tif',
-            'files/derivative/Wnt-1 Distribution Derivative Data/Wnt-1 Sample 5/Wnt-1_sample_5_Mid.tif': 'files/derivative/Wnt-1 Distribution Derivative Data/Wnt-1 Sample 5/Wnt-1 Sample 5 Middle.tif',
-            'files/derivative/Wnt-1 Distribution Derivative Data/Wnt-1 Sample 5/Wnt-1_sample_5_Anal.tif': 'files/derivative/Wnt-1 Distribution Derivative Data/Wnt-1 Sample 5/Wnt-1 Sample 5 Distal.tif',
-            'files/protocol/Protocols.io-dissection_and_fixation_of_murine_colonic_tissue.pdf': 'files/protocol/Protocols.io-dissection and fixation of murine colonic tissue.pdf',
-            'files/docs/Nodose_image_multipart_.tiff': 'files/docs/Nodose image(multipart).tiff',
-            'files/primary/Pig-820_Nodose-002.mat': 'files/primary/Pig-820_Nodose-002 (1).mat',
-            'files/primary/sub-6/sam-7/sub-6_sam-7_Fibronectin.tif': 'files/primary/sub-6/sam-7/sub-6_sam-7_Fibronectin (1).tif',
-            'files/primary/sub-10/sam-1/sub-10_sam-1_Fibronectin.tif': 'files/primary/sub-10/sam-1/sub-10_sam-1_Fibronectin (1).tif',
-            'files/primary/sub-6/sam-1/sub-6_sam-1_Fibronectin_NP.nd2': 'files/primary/sub-6/sam-1/sub-6_sam-1_Fibronectin_NP (1).nd2',
-            'files/primary/sub-6/sam-1/sub-6_sam-1_Fibronectin_NP_NS.nd2': 'files/primary/sub-6/sam-1/sub-6_sam-1_Fibronectin_NP_NS (1).nd2',
-            'files/primary/sub-13/sam-3/sub-13_sam-3_Fibronectin.tif': 'files/primary/sub-13/sam-3/sub-13_sam-3_Fibronectin (1).tif',
-            'files/primary/sub-12/sam-3/sub-12_sam-3_Fibronectin.tif': 'files/primary/sub-12/sam-3/sub-12_sam-3_Fibronectin (1).tif',
-            'files/primary/sub-13/sam-1/sub-13_sam-1_Fibronectin.nd2': 'files/primary/sub-13/sam-1/sub-13_sam-1_Fibronectin (1).nd2',
-            'files/primary/sub-12/sam-1/sub-12_sam-1_Fibronectin.nd2': 'files/primary/sub-12/sam-1/sub-12_sam-1_Fibronectin (1).nd2',
-            'files/primary/sub-9/sam-3/sub-9_sam-3_Fibronectin.tif': 'files/primary/sub-9/sam-3/sub-9_sam-3_Fibronectin (1).tif',
-            'files/primary/sub-14/sam-3/sub-14_sam-3_Fibronectin.tif': 'files/primary/sub-14/sam-3/sub-14_sam-3_Fibronectin (1).tif',
-            'files/primary/sub-14/sam-2/sub-14_sam-2_Fibronectin.nd2': 'files/primary/sub-14/sam-2/sub-14_sam-2_Fibronectin (1).nd2',
-            'files/primary/sub-7/sam-7/sub-7_sam-7_Fibronectin_NP.tif': 'files/primary/sub-7/sam-7/sub-7_sam-7_Fibronectin_NP (1).tif',
-            'files/primary/sub-7/sam-7/sub-7_sam-7_Fibronectin_NP_NS.tif': 'files/primary/sub-7/sam-7/sub-7_sam-7_Fibronectin_NP_NS (1).tif',
-            'files/primary/sub-15/sam-3/sub-15_sam-3_Fibronectin.tif': 'files/primary/sub-15/sam-3/sub-15_sam-3_Fibronectin (1).tif',
-            'files/primary/sub-15/sam-2/sub-15_sam-2_Fibronectin.nd2': 'files/primary/sub-15/sam-2/sub-15_sam-2_Fibronectin (1).nd2',
-            'files/primary/sub-11/sam-3/sub-11_sam-3_Fibronectin.tif': 'files/primary/sub-11/sam-3/sub-11_sam-3_Fibronectin (1).tif',
-            'files/primary/sub-11/sam-1/sub-11_sam-1_Fibronectin.nd2': 'files/primary/sub-11/sam-1/sub-11_sam-1_Fibronectin (1).nd2',
-            'files/primary/sub-8/sam-7/sub-8_sam-7_Fibronectin.nd2': 'files/primary/sub-8/sam-7/sub-8_sam-7_Fibronectin (1).nd2',
-            'files/primary/sub-8/sam-1/sub-8_sam-1_Fibronectin.tif': 'files/primary/sub-8/sam-1/sub-8_sam-1_Fibronectin (1).tif',
-            'files/primary/sub-4/sam-3/sub-4_sam-3_Fibronectin.nd2': 'files/primary/sub-4/sam-3/sub-4_sam-3_Fibronectin (1).nd2',
-            'files/primary/sub-5/sam-3/sub-5_sam-3_Fibronectin.tif': 'files/primary/sub-5/sam-3/sub-5_sam-3_Fibronectin (1).tif',
-            'files/primary/sub-5/sam-1/sub-5_sam-1_Fibronectin.tif': 'files/primary/sub-5/sam-1/sub-5_sam-1_Fibronectin (1).tif',
-            'files/derivative/sub-10/sam-1/sub-10_sam-1_Fibronectin.tif': 'files/derivative/sub-10/sam-1/sub-10_sam-1_Fibronectin (1).tif',
-            'files/derivative/sub-6/sam-7/sub-6_sam-7_Fibronectin.tif': 'files/derivative/sub-6/sam-7/sub-6_sam-7_Fibronectin (1).tif',
-            'files/derivative/sub-6/sam-1/sub-6_sam-1_Fibronectin_NP_NS.tif': 'files/derivative/sub-6/sam-1/sub-6_sam-1_Fibronectin_NP_NS (1).tif',
-            'files/derivative/sub-13/sam-3/sub-13_sam-3_Fibronectin.tif': 'files/derivative/sub-13/sam-3/sub-13_sam-3_Fibronectin (1).tif',
-            'files/derivative/sub-6/sam-1/sub-6_sam-1_Fibronectin_NP.tif': 'files/derivative/sub-6/sam-1/sub-6_sam-1_Fibronectin_NP (1).tif',
-            'files/derivative/sub-12/sam-3/sub-12_sam-3_Fibronectin.tif': 'files/derivative/sub-12/sam-3/sub-12_sam-3_Fibronectin (1).tif',
-            'files/derivative/sub-9/sam-3/sub-9_sam-3_Fibronectin.tif': 'files/derivative/sub-9/sam-3/sub-9_sam-3_Fibronectin (1).tif',
-            'files/derivative/sub-13/sam-1/sub-13_sam-1_Fibronectin.tif': 'files/derivative/sub-13/sam-1/sub-13_sam-1_Fibronectin (1).tif',
-            'files/derivative/sub-12/sam-1/sub-12_sam-1_Fibronectin.tif': 'files/derivative/sub-12/sam-1/sub-12_sam-1_Fibronectin (1).tif',
-            'files/derivative/sub-14/sam-3/sub-14_sam-3_Fibronectin.tif': 'files/derivative/sub-14/sam-3/sub-14_sam-3_Fibronectin (1).tif',
-            'files/derivative/sub-7/sub-7_sam-7_Fibronectin_NP.tif': 'files/derivative/sub-7/sub-7_sam-7_Fibronectin_NP (1).tif',
-            'files/derivative/sub-7/sub-7_sam-7_Fibronectin_NP_NS.tif': 'files/derivative/sub-7/sub-7_sam-7_Fibronectin_NP_NS (1).tif',
-            'files/derivative/sub-14/sam-2/sub-14_sam-2_Fibronectin.tif': 'files/derivative/sub-14/sam-2/sub-14_sam-2_Fibronectin (1).tif',
-            'files/derivative/sub-15/sam-3/sub-15_sam-3_Fibronectin.tif': 'files/derivative/sub-15/sam-3/sub-15_sam-3_Fibronectin (1).tif',
-            'files/derivative/sub-11/sam-3/sub-11_sam-3_Fibronectin.tif': 'files/derivative/sub-11/sam-3/sub-11_sam-3_Fibronectin (1).tif',
-            'files/derivative/sub-15/sam-2/sub-15_sam-2_Fibronectin.tif': 'files/derivative/sub-15/sam-2/sub-15_sam-2_Fibronectin (1).tif',
-            'files/derivative/sub-8/sam-7/sub-8_sam-7_Fibronectin.tif': 'files/derivative/sub-8/sam-7/sub-8_sam-7_Fibronectin (1).tif',
-            'files/derivative/sub-11/sam-1/sub-11_sam-1_Fibronectin.tif': 'files/derivative/sub-11/sam-1/sub-11_sam-1_Fibronectin (1).tif',
-            'files/derivative/sub-8/sam-1/sub-8_sam-1_Fibronectin.tif': 'files/derivative/sub-8/sam-1/sub-8_sam-1_Fibronectin (1).tif',
-            'files/derivative/sub-4/sam-3/sub-4_sam-3_Fibronectin.tif': 'files/derivative/sub-4/sam-3/sub-4_sam-3_Fibronectin (1).tif',
-            'files/derivative/sub-5/sam-3/sub-5_sam-3_Fibronectin.tif': 'files/derivative/sub-5/sam-3/sub-5_sam-3_Fibronectin (1).tif',
-            'files/derivative/sub-5/sam-1/sub-5_sam-1_Fibronectin.tif': 'files/derivative/sub-5/sam-1/sub-5_sam-1_Fibronectin (1).tif',
-            'files/primary/Optogenetic_activation/sub-ChAT_Female_Subject_3/sam-200521/20_0521.acq': 'files/primary/Optogenetic_activation/sub-ChAT_Female_Subject_3/sam-200521/20 0521.acq',
-            'files/primary/Optogenetic_activation/sub-ChAT_Male_Subject_3/sam-200518/20_0518.acq': 'files/primary/Optogenetic_activation/sub-ChAT_Male_Subject_3/sam-200518/20 0518.acq',
-            'files/primary/Optogenetic_activation/sub-nNOS_Male_Subject_1/sam-190829/19_0829.acq': 'files/primary/Optogenetic_activation/sub-nNOS_Male_Subject_1/sam-190829/19 0829.acq',
-            'files/primary/Optogenetic_activation/sub-ChAT_Male_Subject_2/sam-200515/20_0515.acq': 'files/primary/Optogenetic_activation/sub-ChAT_Male_Subject_2/sam-200515/20 0515.acq',
-            'files/primary/Optogenetic_activation/sub-ChAT_Female_Subject_1/sam-200519/20_0519.acq': 'files/primary/Optogenetic_activation/sub-ChAT_Female_Subject_1/sam-200519/20 0519.acq',
-            'files/primary/Optogenetic_activation/sub-nNOS_Male_Subject_2/sam-190917/19_0917.acq': 'files/primary/Optogenetic_activation/sub-nNOS_Male_Subject_2/sam-190917/19 0917.acq',
-            'files/primary/Optogenetic_activation/sub-nNOS_Male_Subject_3/sam-191016/19_1016.acq': 'files/primary/Optogenetic_activation/sub-nNOS_Male_Subject_3/sam-191016/19 1016.acq',
-            'files/primary/Optogenetic_activation/sub-ChAT_Female_Subject_2/sam-200520/20_0520.acq': 'files/primary/Optogenetic_activation/sub-ChAT_Female_Subject_2/sam-200520/20 0520.acq',
-            'files/primary/Optogenetic_activation/sub-nNOS_Female_Subject_3/sam-200324/20_0324.acq': 'files/primary/Optogenetic_activation/sub-nNOS_Female_Subject_3/sam-200324/20 0324.acq',
-            'files/primary/Optogenetic_activation/sub-nNOS_Female_Subject_1/sam-191018/19_1018.acq': 'files/primary/Optogenetic_activation/sub-nNOS_Female_Subject_1/sam-191018/19 1018.acq',
-            'files/primary/Optogenetic_activation/sub-ChAT_Male_Subject_1/sam-200309/20_0309.acq': 'files/primary/Optogenetic_activation/sub-ChAT_Male_Subject_1/sam-200309/20 0309.acq',
-            'files/primary/Optogenetic_activation/sub-nNOS_Female_Subject_2/sam-200303/20_0303.acq': 'files/primary/Optogenetic_activation/sub-nNOS_Female_Subject_2/sam-200303/20 0303.acq',
-            'files/derivative/Optogenetic_summary.pptx': 'files/derivative/Optogenetic summary.pptx',
-            'files/primary/C2Hx_Nx28/sub-37A/ephys/110917_002_cropped.smrx': 'files/primary/C2Hx_Nx28/sub-37A/ephys/C2Hx_Nx28_110917_002_cropped.smrx',
-            'files/primary/C2Hx_Nx28/sub-31A/ephys/110717_001_cropped.smrx': 'files/primary/C2Hx_Nx28/sub-31A/ephys/C2Hx_Nx28_110717_001_cropped.smrx',
-            'files/primary/C2Hx_Nx28/sub-38A/ephys/110917_000_cropped.smrx': 'files/primary/C2Hx_Nx28/sub-38A/ephys/C2Hx_Nx28_110917_000_cropped.smrx',
-            'files/primary/C2Hx_Nx28/sub-39A/ephys/110817_001_cropped.smrx': 'files/primary/C2Hx_Nx28/sub-39A/ephys/C2Hx_Nx28_110817_001_cropped.smrx',
-            'files/primary/C2Hx_Nx28/sub-33A/ephys/111717_001_cropped.smrx': 'files/primary/C2Hx_Nx28/sub-33A/ephys/C2Hx_Nx28_111717_001_cropped.smrx',
-            'files/primary/C2Hx_Nx28/sub-41A/ephys/111117_001_cropped.smrx': 'files/primary/C2Hx_Nx28/sub-41A/ephys/C2Hx_Nx28_111117_001_cropped.smrx',
-            'files/primary/C2Hx_Nx28/sub-42A/ephys/110617_000_cropped.smrx': 'files/primary/C2Hx_Nx28/sub-42A/ephys/C2Hx_Nx28_110617_000_cropped.smrx',
-            'files/primary/C2Hx_Nx28/sub-29A/ephys/110717_003_cropped.smrx': 'files/primary/C2Hx_Nx28/sub-29A/ephys/C2Hx_Nx28_110717_003_cropped.smrx',
-            'files/primary/C2Hx_dAIH28/sub-35B/ephys/111517_001_cropped.smrx': 'files/primary/C2Hx_dAIH28/sub-35B/ephys/C2Hx_dAIH28_111517_001_cropped.smrx',
-            'files/primary/C2Hx_dAIH28/sub-30B/ephys/111417_003_cropped.smrx': 'files/primary/C2Hx_dAIH28/sub-30B/ephys/C2Hx_dAIH28_111417_003_cropped.smrx',
-            'files/primary/C2Hx_dAIH28/sub-26C/ephys/012518_003_cropped.smrx': 'files/primary/C2Hx_dAIH28/sub-26C/ephys/C2Hx_dAIH28_012518_003_cropped.smrx',
-            'files/primary/C2Hx_dAIH28/sub-27C/ephys/012418_004_cropped.smrx': 'files/primary/C2Hx_dAIH28/sub-27C/ephys/C2Hx_dAIH28_012418_004_cropped.smrx',
-            'files/primary/C2Hx_dAIH28/sub-25C/ephys/012518_001_cropped.smrx': 'files/primary/C2Hx_dAIH28/sub-25C/ephys/C2Hx_dAIH28_012518_001_cropped.smrx',
-            'files/primary/C2Hx_dAIH28/sub-37B/ephys/111317_004_cropped.smrx': 'files/primary/C2Hx_dAIH28/sub-37B/ephys/C2Hx_dAIH28_111317_004_cropped.smrx',
-            'files/primary/C2Hx_dAIH28/sub-24C/ephys/012218_003_cropped.smrx': 'files/primary/C2Hx_dAIH28/sub-24C/ephys/C2Hx_dAIH28_012218_003_cropped.smrx',
-            'files/primary/C2Hx_dAIH28/sub-33B/ephys/111717_001_cropped.smrx': 'files/primary/C2Hx_dAIH28/sub-33B/ephys/C2Hx_dAIH28_111717_001_cropped.smrx',
-            'files/primary/C2Hx_dAIH28/sub-24B/ephys/111617_001_cropped.smrx': 'files/primary/C2Hx_dAIH28/sub-24B/ephys/C2Hx_dAIH28_111617_001_cropped.smrx',
-            'files/primary/Intact_Nx/sub-102/ephys/012918_002_cropped.smrx': 'files/primary/Intact_Nx/sub-102/ephys/Intact_Nx_012918_002_cropped.smrx',
-            'files/primary/Intact_Nx/sub-004/ephys/101717_000_cropped.smrx': 'files/primary/Intact_Nx/sub-004/ephys/Intact_Nx_101717_000_cropped.smrx',
-            'files/primary/C2Hx_dAIH28/sub-21C/ephys/012418_001_cropped.smrx': 'files/primary/C2Hx_dAIH28/sub-21C/ephys/C2Hx_dAIH28_012418_001_cropped.smrx',
-            'files/primary/Intact_Nx/sub-002/ephys/101617_000_cropped.smrx': 'files/primary/Intact_Nx/sub-002/ephys/Intact_Nx_101617_000_cropped.smrx',
-            'files/primary/Intact_Nx/sub-104/ephys/013018_003_cropped.smrx': 'files/primary/Intact_Nx/sub-104/ephys/Intact_Nx_013018_003_cropped.smrx',
-            'files/primary/Intact_Nx/sub-110/ephys/020518_001_cropped.smrx': 'files/primary/Intact_Nx/sub-110/ephys/Intact_Nx_020518_001_cropped.smrx',
-            'files/primary/Intact_Nx/sub-103/ephys/013018_001_cropped.smrx': 'files/primary/Intact_Nx/sub-103/ephys/Intact_Nx_013018_001_cropped.smrx',
-            'files/primary/Intact_Nx/sub-52A/sub/120217_001_cropped.smrx': 'files/primary/Intact_Nx/sub-52A/sub/Intact_Nx_120217_001_cropped.smrx',
-            'files/primary/Intact_Nx/sub-107/ephys/020118_001_cropped.smrx': 'files/primary/Intact_Nx/sub-107/ephys/Intact_Nx_020118_001_cropped.smrx',
-            'files/primary/Intact_Nx/sub-101/ephys/012918_001_cropped.smrx': 'files/primary/Intact_Nx/sub-101/ephys/Intact_Nx_012918_001_cropped.smrx',
-            'files/primary/Intact_Nx/sub-51A/sub/120117_001_cropped.smrx': 'files/primary/Intact_Nx/sub-51A/sub/Intact_Nx_120117_001_cropped.smrx',
-            'files/primary/C2Hx_IH28-22/sub-04C/ephys/010318_001_cropped.smrx': 'files/primary/C2Hx_IH28-22/sub-04C/ephys/C2Hx_IH28-2%2F2_010318_001_cropped.smrx',
-            'files/primary/C2Hx_IH28-22/sub-08C/ephys/010218_003_cropped.smrx': 'files/primary/C2Hx_IH28-22/sub-08C/ephys/C2Hx_IH28-2%2F2_010218_003_cropped.smrx',
-            'files/primary/C2Hx_IH28-22/sub-05C/ephys/010318_004_cropped.smrx': 'files/primary/C2Hx_IH28-22/sub-05C/ephys/C2Hx_IH28-2%2F2_010318_004_cropped.smrx',
-            'files/primary/C2Hx_IH28-22/sub-14C/ephys/011718_002_cropped.smrx': 'files/primary/C2Hx_IH28-22/sub-14C/ephys/C2Hx_IH28-2%2F2_011718_002_cropped.smrx',
-            'files/primary/C2Hx_IH28-22/sub-09C/ephys/011918_000_cropped.smrx': 'files/primary/C2Hx_IH28-22/sub-09C/ephys/C2Hx_IH28-2%2F2_011918_000_cropped.smrx',
-            'files/primary/Intact_Nx/sub-106/ephys/020618_001_cropped.smrx': 'files/primary/Intact_Nx/sub-106/ephys/Intact_Nx_020618_001_cropped.smrx',
-            'files/primary/C2Hx_IH28-22/sub-02C/ephys/010418_002_cropped.smrx': 'files/primary/C2Hx_IH28-22/sub-02C/ephys/C2Hx_IH28-2%2F2_010418_002_cropped.smrx',
-            'files/primary/C2Hx_IH28-22/sub-15C/ephys/012318_001_cropped.smrx': 'files/primary/C2Hx_IH28-22/sub-15C/ephys/C2Hx_IH28-2%2F2_012318_001_cropped.smrx',
-            'files/primary/C2Hx_IH28-22/sub-18C/ephys/011618_001_cropped.smrx': 'files/primary/C2Hx_IH28-22/sub-18C/ephys/C2Hx_IH28-2%2F2_011618_001_cropped.smrx',
-            'files/primary/C2Hx_IH28-22/sub-47A/ephys/112917_000_cropped.smrx': 'files/primary/C2Hx_IH28-22/sub-47A/ephys/C2Hx_IH28-2%2F2_112917_000_cropped.smrx',
-            'files/primary/C2Hx_IH28-22/sub-06C/ephys/010218_001_cropped.smrx': 'files/primary/C2Hx_IH28-22/sub-06C/ephys/C2Hx_IH28-2%2F2_010218_001_cropped.smrx',
-            'files/primary/C2Hx_IH28-22/sub-16C/ephys/012318_003_cropped.smrx': 'files/primary/C2Hx_IH28-22/sub-16C/ephys/C2Hx_IH28-2%2F2_012318_003_cropped.smrx',
-            'files/primary/C2Hx_IH28-22/sub-11C/ephys/011818_003_cropped.smrx': 'files/primary/C2Hx_IH28-22/sub-11C/ephys/C2Hx_IH28-2%2F2_011818_003_cropped.smrx',
-            'files/primary/C2Hx_IH28-22/sub-17C/ephys/011618_004_cropped.smrx': 'files/primary/C2Hx_IH28-22/sub-17C/ephys/C2Hx_IH28-2%2F2_011618_004_cropped.smrx',
-            'files/derivative/README.txt': 'files/derivative/sub-Blood_Gasses_README_txt.txt',
-            'files/primary/C2Hx_IH28-22/sub-12C/ephys/011818_001_cropped.smrx': 'files/primary/C2Hx_IH28-22/sub-12C/ephys/C2Hx_IH28-2%2F2_011818_001_cropped.smrx',
-            'files/derivative/CHANGES.txt': 'files/derivative/sub-Blood_Gasses_CHANGES_txt.txt',
-            'files/docs/sub-Blood_Gasses/SPARC_Blood_Gas_Values.csv': 'files/docs/sub-Blood_Gasses/sub-Blood_Gasses_SPARC_Blood_Gas_Values_csv.csv',
-            'files/protocol/SPARC_bilateral_terminal_phrenic_neurophysiology_preparation_with_moderate_acute_intermittent_v1.docx': 'files/protocol/sub-Blood_Gasses_SPARC bilateral terminal phrenic neurophysiology preparation with moderate acute intermittent_v1_docx.docx',
-            'files/primary/C2Hx_IH28-22/sub-10C/ephys/011918_002_cropped.smrx': 'files/primary/C2Hx_IH28-22/sub-10C/ephys/C2Hx_IH28-2%2F2_011918_002_cropped.smrx',
-            'files/protocol/TRAP-SEQ_Sympathetic_chain_ganglia_protocol.docx': 'files/protocol/TRAP-SEQ_Sympathetic chain ganglia_protocol.docx',
-            'files/primary/sam-WT/M879/M879_SG_R_CTB-555.lsm': 'files/primary/sam-WT/M879/M879 SG R CTB-555.lsm',
-            'files/primary/sam-WT/M879/M879_SG_L_CTB-488.lsm': 'files/primary/sam-WT/M879/M879 SG L CTB-488.lsm',
-            'files/primary/sam-WT/M879/M879_SG_R_CTB-488.lsm': 'files/primary/sam-WT/M879/M879 SG R CTB-488.lsm',
-            'files/primary/sam-WT/M879/M879_SG_L_CTB-555.lsm': 'files/primary/sam-WT/M879/M879 SG L CTB-555.lsm',
-            'files/primary/sam-WT/F883/F883_SG_L_CTB-555.lsm': 'files/primary/sam-WT/F883/F883 SG L CTB-555.lsm',
-            'files/primary/sam-WT/M877/M877_SG_R_CTB-488.lsm': 'files/primary/sam-WT/M877/M877 SG R CTB-488.lsm',
-            'files/primary/sam-WT/F883/F883_SG_R_CTB-555.lsm': 'files/primary/sam-WT/F883/F883 SG R CTB-555.lsm',
-            'files/primary/sam-WT/F883/F883_SG_L_CTB-488.lsm': 'files/primary/sam-WT/F883/F883 SG L CTB-488.lsm',
-            'files/primary/sam-WT/F883/F883_SG_R_CTB-488.lsm': 'files/primary/sam-WT/F883/F883 SG R CTB-488.lsm',
-            'files/primary/sam-WT/M877/M877_SG_L_CTB-555.lsm': 'files/primary/sam-WT/M877/M877 SG L CTB-555.lsm',
-            'files/primary/sam-WT/M877/M877_SG_R_CTB-555.lsm': 'files/primary/sam-WT/M877/M877 SG R CTB-555.lsm',
-            'files/primary/sam-WT/M877/M877_SG_L_CTB-488.lsm': 'files/primary/sam-WT/M877/M877 SG L CTB-488.lsm',
-            'files/primary/sam-WT/F884/F884_SG_R_CTB-488.lsm': 'files/primary/sam-WT/F884/F884 SG R CTB-488.lsm',
-            'files/primary/sam-WT/F884/F884_SG_L_CTB-488.lsm': 'files/primary/sam-WT/F884/F884 SG L CTB-488.lsm',
-            'files/primary/sam-WT/F884/F884_SG_R_CTB-555.lsm': 'files/primary/sam-WT/F884/F884 SG R CTB-555.lsm',
-            'files/primary/sam-NPY-GFP/M701/M701_SG_L_NPY-GFP.lsm': 'files/primary/sam-NPY-GFP/M701/M701 SG L NPY-GFP.lsm',
-            'files/primary/sam-WT/F884/F884_SG_L_CTB-555.lsm': 'files/primary/sam-WT/F884/F884 SG L CTB-555.lsm',
-            'files/primary/sam-NPY-GFP/M701/M701_SG_R_NPY-GFP.lsm': 'files/primary/sam-NPY-GFP/M701/M701 SG R NPY-GFP.lsm',
-            'files/primary/sam-NPY-GFP/M701/M701_SG_R_CTB-555.lsm': 'files/primary/sam-NPY-GFP/M701/M701 SG R CTB-555.lsm',
-            'files/primary/sam-NPY-GFP/F702/F702_SG_R_NPY-GFP.lsm': 'files/primary/sam-NPY-GFP/F702/F702 SG R NPY-GFP.lsm',
-            'files/primary/sam-NPY-GFP/M701/M701_SG_L_CTB-555.lsm': 'files/primary/sam-NPY-GFP/M701/M701 SG L CTB-555.lsm',
-            'files/primary/sam-NPY-GFP/F702/F702_SG_R_CTB-555.lsm': 'files/primary/sam-NPY-GFP/F702/F702 SG R CTB-555.lsm',
-            'files/primary/sam-NPY-GFP/F702/F702_SG_L_CTB-555.lsm': 'files/primary/sam-NPY-GFP/F702/F702 SG L CTB-555.lsm',
-            'files/primary/sam-NPY-GFP/M703/M703_SG_R_NPY-GFP.lsm': 'files/primary/sam-NPY-GFP/M703/M703 SG R NPY-GFP.lsm',
-            'files/primary/sam-NPY-GFP/M703/M703_SG_L_NPY-GFP.lsm': 'files/primary/sam-NPY-GFP/M703/M703 SG L NPY-GFP.lsm',
-            'files/primary/sam-NPY-GFP/F702/F702_SG_L_NPY-GFP.lsm': 'files/primary/sam-NPY-GFP/F702/F702 SG L NPY-GFP.lsm',
-            'files/primary/sam-NPY-GFP/M703/M703_SG_R_CTB-555.lsm': 'files/primary/sam-NPY-GFP/M703/M703 SG R CTB-555.lsm',
-            'files/primary/sam-NPY-GFP/M703/M703_SG_L_CTB-555.lsm': 'files/primary/sam-NPY-GFP/M703/M703 SG L CTB-555.lsm',
-            'files/primary/sam-NPY-GFP/F700/F700_SG_R_CTB-555.lsm': 'files/primary/sam-NPY-GFP/F700/F700 SG R CTB-555.lsm',
-            'files/primary/sam-NPY-GFP/F700/F700_SG_L_CTB-555.lsm': 'files/primary/sam-NPY-GFP/F700/F700 SG L CTB-555.lsm',
-            'files/derivative/sam-WT/M879/M879_SG_R_CTB-555.jpx': 'files/derivative/sam-WT/M879/M879 SG R CTB-555.jpx',
-            'files/derivative/sam-WT/M879/M879_SG_R_CTB-488.jpx': 'files/derivative/sam-WT/M879/M879 SG R CTB-488.jpx',
-            'files/primary/sam-NPY-GFP/F700/F700_SG_L_NPY-GFP.lsm': 'files/primary/sam-NPY-GFP/F700/F700 SG L NPY-GFP.lsm',
-            'files/derivative/sam-WT/F883/F883_SG_L_CTB-488.jpx': 'files/derivative/sam-WT/F883/F883 SG L CTB-488.jpx',
-            'files/derivative/sam-WT/F883/F883_SG_L_CTB-555.jpx': 'files/derivative/sam-WT/F883/F883 SG L CTB-555.jpx',
-            'files/derivative/sam-WT/M877/M877_SG_L_CTB-555.jpx': 'files/derivative/sam-WT/M877/M877 SG L CTB-555.jpx',
-            'files/derivative/sam-WT/M877/M877_SG_L_CTB-488.jpx': 'files/derivative/sam-WT/M877/M877 SG L CTB-488.jpx',
-            'files/derivative/sam-WT/F884/F884_SG_R_CTB-555.jpx': 'files/derivative/sam-WT/F884/F884 SG R CTB-555.jpx',
-            'files/derivative/sam-WT/F884/F884_SG_R_CTB-488.jpx': 'files/derivative/sam-WT/F884/F884 SG R CTB-488.jpx',
-            'files/derivative/sam-NPY-GFP/M701/M701_SG_L_NPY-GFP.jpx': 'files/derivative/sam-NPY-GFP/M701/M701 SG L NPY-GFP.jpx',
-            'files/derivative/sam-NPY-GFP/M701/M701_SG_L_CTB-555.jpx': 'files/derivative/sam-NPY-GFP/M701/M701 SG L CTB-555.jpx',
-            'files/derivative/sam-NPY-GFP/F702/F702_SG_R_NPY-GFP.jpx': 'files/derivative/sam-NPY-GFP/F702/F702 SG R NPY-GFP.jpx',
-            'files/derivative/sam-NPY-GFP/F702/F702_SG_R_CTB-555.jpx': 'files/derivative/sam-NPY-GFP/F702/F702 SG R CTB-555.jpx',
-            'files/derivative/sam-NPY-GFP/M703/M703_SG_R_NPY-GFP.jpx': 'files/derivative/sam-NPY-GFP/M703/M703 SG R NPY-GFP.jpx',
-            'files/derivative/sam-NPY-GFP/M703/M703_SG_R_CTB-555.jpx': 'files/derivative/sam-NPY-GFP/M703/M703 SG R CTB-555.jpx',
-            'files/derivative/sam-NPY-GFP/F700/F700_SG_L_CTB-555.jpx': 'files/derivative/sam-NPY-GFP/F700/F700 SG L CTB-555.jpx',
-            'files/derivative/sam-NPY-GFP/F700/F700_SG_L_NPY-GFP.jpx': 'files/derivative/sam-NPY-GFP/F700/F700 SG L NPY-GFP.jpx',
-            'files/derivative/sub-10/sam-1/sub-10_sam-1_TH_P10-1p1_20x.tif': 'files/derivative/sub-10/sam-1/sub-10_sam-1_TH_P10-1p1_20x (1).tif',
-            'files/derivative/sub-6/sam-7/sub-6_sam-7_ChAT_P6-7p1_20x.tif': 'files/derivative/sub-6/sam-7/sub-6_sam-7_ChAT_P6-7p1_20x (1).tif',
-            'files/derivative/sub-10/sam-1/sub-10_sam-1_ChAT_P10-1p1_20x.jp2': 'files/derivative/sub-10/sam-1/sub-10_sam-1_ChAT_P10-1p1_20x (1).jp2',
-            'files/derivative/sub-6/sam-1/sub-6_sam-1_TH_NPcontrol_P6-1p1_20x.tif': 'files/derivative/sub-6/sam-1/sub-6_sam-1_TH_NPcontrol_P6-1p1_20x (1).tif',
-            'files/derivative/sub-6/sam-1/sub-6_sam-1_ChAT_NPcontrol_P6-1p1_20x.tif': 'files/derivative/sub-6/sam-1/sub-6_sam-1_ChAT_NPcontrol_P6-1p1_20x (1).tif',
-            'files/derivative/sub-13/sam-3/sub-13_sam-3_TH_P13-3p1_20x.tif': 'files/derivative/sub-13/sam-3/sub-13_sam-3_TH_P13-3p1_20x (1).tif',
-            'files/derivative/sub-6/sam-7/sub-6_sam-7_TH_P6-7p1_20x.tif': 'files/derivative/sub-6/sam-7/sub-6_sam-7_TH_P6-7p1_20x (1).tif',
-            'files/derivative/sub-13/sam-3/sub-13_sam-3_ChAT_P13-3p3_20x.tif': 'files/derivative/sub-13/sam-3/sub-13_sam-3_ChAT_P13-3p3_20x (1).tif',
-            'files/derivative/sub-13/sam-1/sub-13_sam-1_ChAT_P13-1p1_20x.tif': 'files/derivative/sub-13/sam-1/sub-13_sam-1_ChAT_P13-1p1_20x (1).tif',
-            'files/derivative/sub-13/sam-1/sub-13_sam-1_TH_P13-1p1_20x.tif': 'files/derivative/sub-13/sam-1/sub-13_sam-1_TH_P13-1p1_20x (1).tif',
-            'files/derivative/sub-12/sam-3/sub-12_sam-3_ChAT_P12-3p3_20x.tif': 'files/derivative/sub-12/sam-3/sub-12_sam-3_ChAT_P12-3p3_20x (1).tif',
-            'files/derivative/sub-12/sam-3/sub-12_sam-3_TH_P12-3p1_20x.tif': 'files/derivative/sub-12/sam-3/sub-12_sam-3_TH_P12-3p1_20x (1).tif',
-            'files/derivative/sub-12/sam-1/sub-12_sam-1_ChAT_P12-1p1_20x.tif': 'files/derivative/sub-12/sam-1/sub-12_sam-1_ChAT_P12-1p1_20x (1).tif',
-            'files/derivative/sub-12/sam-1/sub-12_sam-1_TH_P12-1p1_20x.tif': 'files/derivative/sub-12/sam-1/sub-12_sam-1_TH_P12-1p1_20x (1).tif',
-            'files/derivative/sub-9/sam-3/sub-9_sam-3_TH_P9-3p3_20x.tif': 'files/derivative/sub-9/sam-3/sub-9_sam-3_TH_P9-3p3_20x (1).tif',
-            'files/derivative/sub-9/sam-3/sub-9_sam-3_ChAT_P9-3p1_20x.tif': 'files/derivative/sub-9/sam-3/sub-9_sam-3_ChAT_P9-3p1_20x (1).tif',
-            'files/derivative/sub-14/sam-3/sub-14_sam-3_ChAT_P14-3p3_20x.jp2': 'files/derivative/sub-14/sam-3/sub-14_sam-3_ChAT_P14-3p3_20x (1).jp2',
-            'files/derivative/sub-14/sam-3/sub-14_sam-3_TH_P14-3p1_20x.tif': 'files/derivative/sub-14/sam-3/sub-14_sam-3_TH_P14-3p1_20x (1).tif',
-            'files/derivative/sub-14/sam-2/sub-14_sam-2_TH_P14-2p1_20x.tif': 'files/derivative/sub-14/sam-2/sub-14_sam-2_TH_P14-2p1_20x (1).tif',
-            'files/derivative/sub-7/sam-7/sub-7_sam-7_TH_NPcontrol_P7-7p1_20x.tif': 'files/derivative/sub-7/sam-7/sub-7_sam-7_TH_NPcontrol_P7-7p1_20x (1).tif',
-            'files/derivative/sub-14/sam-2/sub-14_sam-2_ChAT_P14-2p1_20x.tif': 'files/derivative/sub-14/sam-2/sub-14_sam-2_ChAT_P14-2p1_20x (1).tif',
-            'files/derivative/sub-7/sam-7/sub-7_sam-7_ChAT_NPcontrol_P7-7p4_20x.tif': 'files/derivative/sub-7/sam-7/sub-7_sam-7_ChAT_NPcontrol_P7-7p4_20x (1).tif',
-            'files/derivative/sub-15/sam-3/sub-15_sam-3_TH_P15-3p1_20x.tif': 'files/derivative/sub-15/sam-3/sub-15_sam-3_TH_P15-3p1_20x (1).tif',
-            'files/derivative/sub-15/sam-3/sub-15_sam-3_ChAT_P15-3p3_20x.tif': 'files/derivative/sub-15/sam-3/sub-15_sam-3_ChAT_P15-3p3_20x (1).tif',
-            'files/derivative/sub-15/sam-2/sub-15_sam-2_ChAT_P15-2p2_20x.tif': 'files/derivative/sub-15/sam-2/sub-15_sam-2_ChAT_P15-2p2_20x (1).tif',
-            'files/derivative/sub-15/sam-2/sub-15_sam-2_TH_P15-2p1_20x.tif': 'files/derivative/sub-15/sam-2/sub-15_sam-2_TH_P15-2p1_20x (1).tif',
-            'files/derivative/sub-11/sam-3/sub-11_sam-3_TH_P11-3p1_20x.jp2': 'files/derivative/sub-11/sam-3/sub-11_sam-3_TH_P11-3p1_20x (1).jp2',
-            'files/derivative/sub-11/sam-3/sub-11_sam-3_ChAT_P11-3p3_20x.tif': 'files/derivative/sub-11/sam-3/sub-11_sam-3_ChAT_P11-3p3_20x (1).tif',
-            'files/derivative/sub-11/sam-1/sub-11_sam-1_TH_P11-1p1_20x.tif': 'files/derivative/sub-11/sam-1/sub-11_sam-1_TH_P11-1p1_20x (1).tif',
-            'files/derivative/sub-11/sam-1/sub-11_sam-1_ChAT_P11-1p2_20x.tif': 'files/derivative/sub-11/sam-1/sub-11_sam-1_ChAT_P11-1p2_20x (1).tif',
-            'files/derivative/sub-8/sam-7/sub-8_sam-7_TH_P8-7p1_20x.tif': 'files/derivative/sub-8/sam-7/sub-8_sam-7_TH_P8-7p1_20x (1).tif',
-            'files/derivative/sub-8/sam-1/sub-8_sam-1_ChAT_P8-1p1_20x.jp2': 'files/derivative/sub-8/sam-1/sub-8_sam-1_ChAT_P8-1p1_20x (1).jp2',
-            'files/derivative/sub-8/sam-7/sub-8_sam-7_ChAT_P8-7p1_20x.tif': 'files/derivative/sub-8/sam-7/sub-8_sam-7_ChAT_P8-7p1_20x (1).tif',
-            'files/derivative/sub-8/sam-1/sub-8_sam-1_TH_P8-1p1_20x.tif': 'files/derivative/sub-8/sam-1/sub-8_sam-1_TH_P8-1p1_20x (1).tif',
-            'files/derivative/sub-4/sam-3/sub-4_sam-3_ChAT_P4-3p1_20x.tif': 'files/derivative/sub-4/sam-3/sub-4_sam-3_ChAT_P4-3p1_20x (1).tif',
-            'files/derivative/sub-5/sam-3/sub-5_sam-3_TH_P5-3p1_20x.tif': 'files/derivative/sub-5/sam-3/sub-5_sam-3_TH_P5-3p1_20x (1).tif',
-            'files/derivative/sub-4/sam-3/sub-4_sam-3_TH_P4-3p1_20x.tif': 'files/derivative/sub-4/sam-3/sub-4_sam-3_TH_P4-3p1_20x (1).tif',
-            'files/derivative/sub-5/sam-3/sub-5_sam-3_ChAT_P5-3p1_20x.tif': 'files/derivative/sub-5/sam-3/sub-5_sam-3_ChAT_P5-3p1_20x (1).tif',
-            'files/derivative/sub-5/sam-1/sub-5_sam-1_ChAT_P5-1p1_20x.tif': 'files/derivative/sub-5/sam-1/sub-5_sam-1_ChAT_P5-1p1_20x (1).tif',
-            'files/derivative/sub-5/sam-1/sub-5_sam-1_TH_P5-1p4_20x.tif': 'files/derivative/sub-5/sam-1/sub-5_sam-1_TH_P5-1p4_20x (1).tif',
-            'files/protocol/Preparation_of_Adult_Rat_Ventricular_Myocytes_for_FRET_Imaging-Protocol.docx': 'files/protocol/Preparation of Adult Rat Ventricular Myocytes for FRET Imaging-Protocol.docx',
-            'files/docs/Neurite_Map_IMAs.jpg': 'files/docs/Neurite Map IMAs.jpg',
-            'files/docs/Interactive map/Images/8304_D_Stom_Master_Contour.png': 'files/docs/Interactive map/Images/8304 D Stom Master Contour.png',
-            'files/docs/Interactive map/Images/Longitudinal_IMAs.png': 'files/docs/Interactive map/Images/Longitudinal IMAs.png',
-            'files/docs/Interactive map/Images/Circular_IMAs.png': 'files/docs/Interactive map/Images/Circular IMAs.png',
-            'files/primary/sam-P21 BAT/ses-Pgp9/P21-4_Pgp9.5.nd2': 'files/primary/sam-P21 BAT/ses-Pgp9.5/P21-4 Pgp9.5.nd2',
-            'files/primary/sam-P21 BAT/ses-Pgp9/P21-3_Pgp9.5.nd2': 'files/primary/sam-P21 BAT/ses-Pgp9.5/P21-3 Pgp9.5.nd2',
-            'files/primary/sam-P21 BAT/ses-B3tub/P21-5_b3tub.nd2': 'files/primary/sam-P21 BAT/ses-B3tub/P21-5 b3tub.nd2',
-            'files/primary/sam-P21 BAT/ses-B3tub/P21-6_b3tub.nd2': 'files/primary/sam-P21 BAT/ses-B3tub/P21-6 b3tub.nd2',
-            'files/primary/sam-P28 BAT/ses-B3tub/P28-2M_b3tub.nd2': 'files/primary/sam-P28 BAT/ses-B3tub/P28-2M b3tub.nd2',
-            'files/primary/sam-P21 BAT/ses-TH/P21-1_TH.nd2': 'files/primary/sam-P21 BAT/ses-TH/P21-1 TH.nd2',
-            'files/derivative/sam-P21 BAT/ses-B3tub/P21-6_b3tub_-_Movie.mp4': 'files/derivative/sam-P21 BAT/ses-B3tub/P21-6 b3tub - Movie.mp4',
-            'files/primary/sam-P21 BAT/ses-TH/P21-2_TH.nd2': 'files/primary/sam-P21 BAT/ses-TH/P21-2 TH.nd2',
-            'files/derivative/sam-P21 BAT/ses-B3tub/P21-6_b3tub__Projection1_.tif': 'files/derivative/sam-P21 BAT/ses-B3tub/P21-6 b3tub (Projection1).tif',
-            'files/derivative/sam-P21 BAT/ses-B3tub/P21-5_b3tub.jpx': 'files/derivative/sam-P21 BAT/ses-B3tub/P21-5 b3tub.jpx',
-            'files/derivative/sam-P21 BAT/ses-B3tub/P21-5_b3tub__Projection1_.tif': 'files/derivative/sam-P21 BAT/ses-B3tub/P21-5 b3tub (Projection1).tif',
-            'files/derivative/sam-P21 BAT/ses-B3tub/P21-6_b3tub.jpx': 'files/derivative/sam-P21 BAT/ses-B3tub/P21-6 b3tub.jpx',
-            'files/derivative/sam-P21 BAT/ses-TH/P21-2_TH.jpx': 'files/derivative/sam-P21 BAT/ses-TH/P21-2 TH.jpx',
-            'files/derivative/sam-P21 BAT/ses-B3tub/P21-5_b3tub_-_Movie.mp4': 'files/derivative/sam-P21 BAT/ses-B3tub/P21-5 b3tub - Movie.mp4',
-            'files/derivative/sam-P21 BAT/ses-TH/P21-2_TH_-_Movie.mp4': 'files/derivative/sam-P21 BAT/ses-TH/P21-2 TH - Movie.mp4',
-            'files/derivative/sam-P21 BAT/ses-TH/P21-1_TH.jpx': 'files/derivative/sam-P21 BAT/ses-TH/P21-1 TH.jpx',
-            'files/derivative/sam-P21 BAT/ses-TH/P21-1_TH_-_Movie.mp4': 'files/derivative/sam-P21 BAT/ses-TH/P21-1 TH - Movie.mp4',
-            'files/derivative/sam-P21 BAT/ses-TH/P21-2_TH__Projection1_.tif': 'files/derivative/sam-P21 BAT/ses-TH/P21-2 TH (Projection1).tif',
-            'files/derivative/sam-P21 BAT/ses-Pgp9/P21-4_Pgp9.5.jpx': 'files/derivative/sam-P21 BAT/ses-Pgp9.5/P21-4 Pgp9.5.jpx',
-            'files/derivative/sam-P21 BAT/ses-Pgp9.5/P21-3_Pgp9.5_-_Movie.mp4': 'files/derivative/sam-P21 BAT/ses-Pgp9.5/P21-3 Pgp9.5 - Movie.mp4',
-            'files/derivative/sam-P21 BAT/ses-TH/P21-1_TH__Projection1_.tif': 'files/derivative/sam-P21 BAT/ses-TH/P21-1 TH (Projection1).tif',
-            'files/derivative/sam-P21 BAT/ses-Pgp9/P21-3_Pgp9.5__Projection1_.tif': 'files/derivative/sam-P21 BAT/ses-Pgp9.5/P21-3 Pgp9.5 (Projection1).tif',
-            'files/derivative/sam-P21 BAT/ses-Pgp9/P21-4_Pgp9.5__Projection1_.tif': 'files/derivative/sam-P21 BAT/ses-Pgp9.5/P21-4 Pgp9.5 (Projection1).tif',
-            'files/derivative/sam-P28 BAT/ses-B3tub/P28-2M_b3tub__Projection1_.tif': 'files/derivative/sam-P28 BAT/ses-B3tub/P28-2M b3tub (Projection1).tif',
-            'files/derivative/sam-P21 BAT/ses-Pgp9/P21-3_Pgp9.5.jpx': 'files/derivative/sam-P21 BAT/ses-Pgp9.5/P21-3 Pgp9.5.jpx',
-            'files/derivative/sam-P28 BAT/ses-B3tub/P28-2M_b3tub.jpx': 'files/derivative/sam-P28 BAT/ses-B3tub/P28-2M b3tub.jpx',
-            'files/derivative/sam-P28 BAT/ses-B3tub/P28-2M_b3tub_-_Movie.mp4': 'files/derivative/sam-P28 BAT/ses-B3tub/P28-2M b3tub - Movie.mp4',
-            'files/derivative/sub-6289/sam-15_sub-6289_islet2/sub-6289_20x_MsGcg_RbCol4_SMACy3_islet2.tif': 'files/derivative/sub-6289/sam-15_sub-6289_islet2/sub-6289_20x_MsGcg_RbCol4_SMACy3_islet2 (1).tif',
-            'files/derivative/sub-6289/sam-20_sub-6289_islet7/sub-6289_20x_MsGcg_RbCol4_SMACy3_islet7.tif': 'files/derivative/sub-6289/sam-20_sub-6289_islet7/sub-6289_20x_MsGcg_RbCol4_SMACy3_islet7 (1).tif',
-            'files/derivative/sub-6289/sam-18_sub-6289_islet5/sub-6289_20x_MsGcg_RbCol4_SMACy3_islet5.tif': 'files/derivative/sub-6289/sam-18_sub-6289_islet5/sub-6289_20x_MsGcg_RbCol4_SMACy3_islet5 (1).tif',
-            'files/derivative/sub-6289/sam-14_sub-6289_islet1/sub-6289_20x_MsGcg_RbCol4_SMACy3_islet1.jpx': 'files/derivative/sub-6289/sam-14_sub-6289_islet1/sub-6289_20x_MsGcg_RbCol4_SMACy3_islet1 (1).jpx',
-            'files/derivative/sub-6289/sam-16_sub-6289_islet3/sub-6289_20x_MsGcg_RbCol4_SMACy3_islet3.tif': 'files/derivative/sub-6289/sam-16_sub-6289_islet3/sub-6289_20x_MsGcg_RbCol4_SMACy3_islet3 (1).tif',
-            'files/derivative/sub-6289/sam-19_sub-6289_islet6/sub-6289_20x_MsGcg_RbCol4_SMACy3_islet6.tif': 'files/derivative/sub-6289/sam-19_sub-6289_islet6/sub-6289_20x_MsGcg_RbCol4_SMACy3_islet6 (1).tif',
-            'files/derivative/sub-6289/sam-17_sub-6289_islet4/sub-6289_20x_MsGcg_RbCol4_SMACy3_islet4.tif': 'files/derivative/sub-6289/sam-17_sub-6289_islet4/sub-6289_20x_MsGcg_RbCol4_SMACy3_islet4 (1).tif',
-            'files/derivative/sub-6232/sam-6_sub-6232_islet6/sub-6232_20x_MsGcg_RbCol4_SMACy3_islet6.tif': 'files/derivative/sub-6232/sam-6_sub-6232_islet6/sub-6232_20x_MsGcg_RbCol4_SMACy3_islet6 (1).tif',
-            'files/derivative/sub-6232/sam-1_sub-6232_islet1/sub-6232_20x_MsGcg_RbCol4_SMACy3_islet1.tif': 'files/derivative/sub-6232/sam-1_sub-6232_islet1/sub-6232_20x_MsGcg_RbCol4_SMACy3_islet1 (1).tif',
-            'files/derivative/sub-6232/sam-2_sub-6232_islet2/sub-6232_20x_MsGcg_RbCol4_SMACy3_islet2.tif': 'files/derivative/sub-6232/sam-2_sub-6232_islet2/sub-6232_20x_MsGcg_RbCol4_SMACy3_islet2 (1).tif',
-            'files/derivative/sub-6232/sam-5_sub-6232_islet5/sub-6232_20x_MsGcg_RbCol4_SMACy3_islet5.tif': 'files/derivative/sub-6232/sam-5_sub-6232_islet5/sub-6232_20x_MsGcg_RbCol4_SMACy3_islet5 (1).tif',
-            'files/derivative/sub-6232/sam-7_sub-6232_islet7/sub-6232_20x_MsGcg_RbCol4_SMACy3_islet7.tif': 'files/derivative/sub-6232/sam-7_sub-6232_islet7/sub-6232_20x_MsGcg_RbCol4_SMACy3_islet7 (1).tif',
-            'files/derivative/sub-6232/sam-4_sub-6232_islet4/sub-6232_20x_MsGcg_RbCol4_SMACy3_islet4.tif': 'files/derivative/sub-6232/sam-4_sub-6232_islet4/sub-6232_20x_MsGcg_RbCol4_SMACy3_islet4 (1).tif',
-            'files/derivative/sub-6232/sam-3_sub-6232_islet3/sub-6232_20x_MsGcg_RbCol4_SMACy3_islet3.tif': 'files/derivative/sub-6232/sam-3_sub-6232_islet3/sub-6232_20x_MsGcg_RbCol4_SMACy3_islet3 (1).tif',
-            'files/derivative/sub-6238/sam-9_sub-6238_islet2/sub-6238_20x_MsGcg_RbCol4_SMACy3_islet2.tif': 'files/derivative/sub-6238/sam-9_sub-6238_islet2/sub-6238_20x_MsGcg_RbCol4_SMACy3_islet2 (1).tif',
-            'files/derivative/sub-6238/sam-13_sub-6238_islet6/sub-6238_20x_MsGcg_RbCol4_SMACy3_islet6.tif': 'files/derivative/sub-6238/sam-13_sub-6238_islet6/sub-6238_20x_MsGcg_RbCol4_SMACy3_islet6 (1).tif',
-            'files/derivative/sub-6238/sam-11_sub-6238_islet4/sub-6238_20x_MsGcg_RbCol4_SMACy3_islet4.tif': 'files/derivative/sub-6238/sam-11_sub-6238_islet4/sub-6238_20x_MsGcg_RbCol4_SMACy3_islet4 (1).tif',
-            'files/derivative/sub-6238/sam-12_sub-6238_islet5/sub-6238_20x_MsGcg_RbCol4_SMACy3_islet5.tif': 'files/derivative/sub-6238/sam-12_sub-6238_islet5/sub-6238_20x_MsGcg_RbCol4_SMACy3_islet5 (1).tif',
-            'files/derivative/sub-6238/sam-10_sub-6238_islet3/sub-6238_20x_MsGcg_RbCol4_SMACy3_islet3.tif': 'files/derivative/sub-6238/sam-10_sub-6238_islet3/sub-6238_20x_MsGcg_RbCol4_SMACy3_islet3 (1).tif',
-            'files/derivative/sub-6238/sam-8_sub-6238_islet1/sub-6238_20x_MsGcg_RbCol4_SMACy3_islet1.tif': 'files/derivative/sub-6238/sam-8_sub-6238_islet1/sub-6238_20x_MsGcg_RbCol4_SMACy3_islet1 (1).tif',
-            'files/derivative/sub-6368/sam-23_sub-6368_islet3/sub-6368_20x_MsGcg_RbCol4_SMACy3_islet3.tif': 'files/derivative/sub-6368/sam-23_sub-6368_islet3/sub-6368_20x_MsGcg_RbCol4_SMACy3_islet3 (1).tif',
-            'files/derivative/sub-6368/sam-22_sub-6368_islet2/sub-6368_20x_MsGcg_RbCol4_SMACy3_islet2.jpx': 'files/derivative/sub-6368/sam-22_sub-6368_islet2/sub-6368_20x_MsGcg_RbCol4_SMACy3_islet2 (1).jpx',
-            'files/derivative/sub-6368/sam-21_sub-6368_islet1/sub-6368_20x_MsGcg_RbCol4_SMACy3_islet1.tif': 'files/derivative/sub-6368/sam-21_sub-6368_islet1/sub-6368_20x_MsGcg_RbCol4_SMACy3_islet1 (1).tif',
-            'files/derivative/sub-6384/sam-27_sub-6384_islet2/sub-6384_20x_MsGcg_RbCol4_SMACy3_islet2.tif': 'files/derivative/sub-6384/sam-27_sub-6384_islet2/sub-6384_20x_MsGcg_RbCol4_SMACy3_islet2 (1).tif',
-            'files/derivative/sub-6368/sam-24_sub-6368_islet4/sub-6368_20x_MsGcg_RbCol4_SMACy3_islet4.tif': 'files/derivative/sub-6368/sam-24_sub-6368_islet4/sub-6368_20x_MsGcg_RbCol4_SMACy3_islet4 (1).tif',
-            'files/derivative/sub-6384/sam-34_sub-6384_islet9/sub-6384_20x_MsGcg_RbCol4_SMACy3_islet9.tif': 'files/derivative/sub-6384/sam-34_sub-6384_islet9/sub-6384_20x_MsGcg_RbCol4_SMACy3_islet9 (1).tif',
-            'files/derivative/sub-6384/sam-33_sub-6384_islet8/sub-6384_20x_MsGcg_RbCol4_SMACy3_islet8.tif': 'files/derivative/sub-6384/sam-33_sub-6384_islet8/sub-6384_20x_MsGcg_RbCol4_SMACy3_islet8 (1).tif',
-            'files/derivative/sub-6384/sam-25_sub-6384_islet1/sub-6384_20x_MsGcg_RbCol4_SMACy3_islet1.tif': 'files/derivative/sub-6384/sam-25_sub-6384_islet1/sub-6384_20x_MsGcg_RbCol4_SMACy3_islet1 (1).tif',
-            'files/derivative/sub-6384/sam-31_sub-6384_islet6/sub-6384_20x_MsGcg_RbCol4_SMACy3_islet6.tif': 'files/derivative/sub-6384/sam-31_sub-6384_islet6/sub-6384_20x_MsGcg_RbCol4_SMACy3_islet6 (1).tif',
-            'files/derivative/sub-6384/sam-30_sub-6384_islet5/sub-6384_20x_MsGcg_RbCol4_SMACy3_islet5.tif': 'files/derivative/sub-6384/sam-30_sub-6384_islet5/sub-6384_20x_MsGcg_RbCol4_SMACy3_islet5 (1).tif',
-            'files/derivative/sub-6384/sam-26_sub-6384_islet10/sub-6384_20x_MsGcg_RbCol4_SMACy3_islet10.tif': 'files/derivative/sub-6384/sam-26_sub-6384_islet10/sub-6384_20x_MsGcg_RbCol4_SMACy3_islet10 (1).tif',
-            'files/derivative/sub-6384/sam-29_sub-6384_islet4/sub-6384_20x_MsGcg_RbCol4_SMACy3_islet4.tif': 'files/derivative/sub-6384/sam-29_sub-6384_islet4/sub-6384_20x_MsGcg_RbCol4_SMACy3_islet4 (1).tif',
-            'files/derivative/sub-6384/sam-32_sub-6384_islet7/sub-6384_20x_MsGcg_RbCol4_SMACy3_islet7.tif': 'files/derivative/sub-6384/sam-32_sub-6384_islet7/sub-6384_20x_MsGcg_RbCol4_SMACy3_islet7 (1).tif',
-            'files/derivative/sub-6384/sam-28_sub-6384_islet3/sub-6384_20x_MsGcg_RbCol4_SMACy3_islet3.tif': 'files/derivative/sub-6384/sam-28_sub-6384_islet3/sub-6384_20x_MsGcg_RbCol4_SMACy3_islet3 (2).tif',
-            'files/derivative/sub-6384/sam-28_sub-6384_islet3/sub-6384_20x_MsGcg_RbCol4_SMACy3_islet3.xml': 'files/derivative/sub-6384/sam-28_sub-6384_islet3/sub-6384_20x_MsGcg_RbCol4_SMACy3_islet3 (1).xml',
-            'files/docs/Input_annotations.csv': 'files/docs/humanColon_annotations.csv', 'files/docs/SPARC-Keast-001-Notebook.nb.html': 'files/docs/SPARC-Keast-001-Notebook.nb',
-            'files/primary/sub-42/ses_direct-stim/sub42_direct-stim_impedance_direct.pl2': 'files/primary/sub-42/ses_direct-stim/sub42_direct-stim_impedance_stim.pl2',
-            'files/primary/sub-27/sub27_direct-stim_impedance_baseline.pl2': 'files/primary/sub-27/sub-27_direct-stim_impedance_baseline.pl2',
-            'files/primary/sub-27/sub27_direct-stim_impedance_stim.pl2': 'files/primary/sub-27/sub-27_direct-stim_impedance_stim.pl2',
-            'files/primary/sub-48/Pig48_ES18_baseline.pl2': 'files/primary/sub-48/sub-48_direct-stim_impedance_baseline.pl2',
-            'files/derivative/sub-all_direct-stim_impedance_distal-colon.xlsx': 'files/derivative/sub-all_direct-stim_distal-colon_impedance.xlsx',
-            'files/derivative/sub-all_direct-stim_manometry_proximal-colon.xlsx': 'files/derivative/sub-all_direct-stim_proximal-colon_manometry.xlsx',
-            'files/derivative/sub-all_direct-stim_manometry_distal-colon.xlsx': 'files/derivative/sub-all_direct-stim_distal-colon_manometry.xlsx',
-            'files/code/Impedance_Data_Import.rar': 'files/code/Impedance Data Import.rar',
-            'files/docs/Proximal_colon_stimulation__3_.jpg': 'files/docs/Proximal colon stimulation.jpg',
-            'files/derivative/sub-all_direct-stim_impedance_proximal-colon.xlsx': 'files/derivative/sub-all_direct-stim_proximal-colon_impedance.xlsx',
-            'files/protocol/Method_for_processing_impedance_data_SPARC.docx': 'files/protocol/Method for processing impedance data_SPARC.docx',
-            'files/primary/sub-898/sam-1/Rat_898_Control_1_Abd_Vag_Ant_Gast_100X_montage_01_03_19.tif': 'files/primary/sub-898/sam-1/Rat_898_Control_1_Abd Vag Ant Gast_100X_montage_01_03_19.tif',
-            'files/primary/sub-898/sam-1/Rat_898_Control_1_Abd_Vag_Ant_Gas_100X_4_4__01_02_19.jp2': 'files/primary/sub-898/sam-1/Rat_898_Control_1_Abd Vag Ant Gas_100X_4(4)_01_02_19.jp2',
-            'files/primary/sub-898/sam-1/Rat_898_Control_1_Abd_Vag_Ant_Gas_100X_2_4__01_02_19.jp2': 'files/primary/sub-898/sam-1/Rat_898_Control_1_Abd Vag Ant Gas_100X_2(4)_01_02_19.jp2',
-            'files/primary/sub-898/sam-1/Rat_898_Control_1_Abd_Vag_Ant_Gas_100X_2_4__01_02_19.tif': 'files/primary/sub-898/sam-1/Rat_898_Control_1_Abd Vag Ant Gas_100X_2(4)_01_02_19 (1).tif',
-            'files/primary/sub-898/sam-1/Rat_898_Control_1_Abd_Vag_Ant_Gas_100X_3_4__01_02_19.tif': 'files/primary/sub-898/sam-1/Rat_898_Control_1_Abd Vag Ant Gas_100X_3(4)_01_02_19 (1).tif',
-            'files/primary/sub-898/sam-1/Rat_898_Control_1_Abd_Vag_Ant_Gas_100X_1_4__01_02_19.jp2': 'files/primary/sub-898/sam-1/Rat_898_Control_1_Abd Vag Ant Gas_100X_1(4)_01_02_19.jp2',
-            'files/primary/sub-898/Rat_898_Control_overview_Abd_Vag_Ant_Gas_10X_01_02_19.tif': 'files/primary/sub-898/Rat_898_Control_overview_Abd Vag Ant Gas_10X_01_02_19 (1).tif',
-            'files/primary/sub-898/sam-1/Rat_898_Control_1_Abd_Vag_Ant_Gas_100X_4_4__01_02_19.tif': 'files/primary/sub-898/sam-1/Rat_898_Control_1_Abd Vag Ant Gas_100X_4(4)_01_02_19 (1).tif',
-            'files/primary/sub-898/sam-1/Rat_898_Control_1_Abd_Vag_Ant_Gas_100X_3_4__01_02_19.jp2': 'files/primary/sub-898/sam-1/Rat_898_Control_1_Abd Vag Ant Gas_100X_3(4)_01_02_19.jp2',
-            'files/primary/sub-898/sam-2/Rat_898_Control_1_Abd_Vag_Ant_Gas_100X_1_4__01_02_19.tif': 'files/primary/sub-898/sam-2/Rat_898_Control_1_Abd Vag Ant Gas_100X_1(4)_01_02_19.tif',
-            'files/primary/sub-898/sam-2/Rat_898_Control_2_Abd_Vag_Ant_Gas_100X_1_1__01_02_19.jp2': 'files/primary/sub-898/sam-2/Rat_898_Control_2_Abd Vag Ant Gas_100X_1(1)_01_02_19.jp2',
-            'files/primary/sub-898/sam-2/Rat_898_Control_2_Abd_Vag_Ant_Gas_100X_1_1__01_02_19.tif': 'files/primary/sub-898/sam-2/Rat_898_Control_2_Abd Vag Ant Gas_100X_1(1)_01_02_19 (1).tif',
-            'files/primary/sub-897/sam-1/Rat_897_Control_1_Abd_Vag_Ant_Gas_100X_3_5__01_02_19.tif': 'files/primary/sub-897/sam-1/Rat_897_Control_1_Abd Vag Ant Gas_100X_3(5)_01_02_19 (1).tif',
-            'files/primary/sub-897/sam-1/Rat_897_Control_1_Abd_Vag_Ant_Gas_100X_2_5__01_02_19.tif': 'files/primary/sub-897/sam-1/Rat_897_Control_1_Abd Vag Ant Gas_100X_2(5)_01_02_19.tif',
-            'files/primary/sub-898/Rat_898_Control_overview_Abd_Vag_Ant_Gas_10X_01_02_19.jp2': 'files/primary/sub-898/Rat_898_Control_overview_Abd Vag Ant Gas_10X_01_02_19.jp2',
-            'files/primary/sub-897/sam-1/Rat_897_Control_1_Abd_Vag_Ant_Gas_100X_5_5__01_02_19.tif': 'files/primary/sub-897/sam-1/Rat_897_Control_1_Abd Vag Ant Gas_100X_5(5)_01_02_19.tif',
-            'files/primary/sub-897/sam-1/Rat_897_Control_1_Abd_Vag_Ant_Gast_100X_montage_01_03_19.tif': 'files/primary/sub-897/sam-1/Rat_897_Control_1_Abd Vag Ant Gast_100X_montage_01_03_19.tif',
-            'files/primary/sub-897/sam-1/Rat_897_Control_1_Abd_Vag_Ant_Gas_100X_1_5__01_02_19.jp2': 'files/primary/sub-897/sam-1/Rat_897_Control_1_Abd Vag Ant Gas_100X_1(5)_01_02_19.jp2',
-            'files/primary/sub-897/sam-1/Rat_897_Control_1_Abd_Vag_Ant_Gas_100X_4_5__01_02_19.tif': 'files/primary/sub-897/sam-1/Rat_897_Control_1_Abd Vag Ant Gas_100X_4(5)_01_02_19 (1).tif',
-            'files/primary/sub-897/sam-1/Rat_897_Control_1_Abd_Vag_Ant_Gas_100X_5_5__01_02_19.jp2': 'files/primary/sub-897/sam-1/Rat_897_Control_1_Abd Vag Ant Gas_100X_5(5)_01_02_19 (1).jp2',
-            'files/primary/sub-897/sam-2/Rat_897_Control_1_Abd_Vag_Ant_Gas_100X_1_5__01_02_19.tif': 'files/primary/sub-897/sam-2/Rat_897_Control_1_Abd Vag Ant Gas_100X_1(5)_01_02_19.tif',
-            'files/primary/sub-897/sam-2/Rat_897_Control_2_Abd_Vag_Ant_Gas_100X_1_1__01_02_19.tif': 'files/primary/sub-897/sam-2/Rat_897_Control_2_Abd Vag Ant Gas_100X_1(1)_01_02_19 (1).tif',
-            'files/primary/sub-897/sam-1/Rat_897_Control_1_Abd_Vag_Ant_Gas_100X_3_5__01_02_19.jp2': 'files/primary/sub-897/sam-1/Rat_897_Control_1_Abd Vag Ant Gas_100X_3(5)_01_02_19.jp2',
-            'files/primary/sub-897/sam-2/Rat_897_Control_2_Abd_Vag_Ant_Gas_100X_1_1__01_02_19.jp2': 'files/primary/sub-897/sam-2/Rat_897_Control_2_Abd Vag Ant Gas_100X_1(1)_01_02_19.jp2',
-            'files/primary/sub-897/sam-1/Rat_897_Control_1_Abd_Vag_Ant_Gas_100X_4_5__01_02_19.jp2': 'files/primary/sub-897/sam-1/Rat_897_Control_1_Abd Vag Ant Gas_100X_4(5)_01_02_19.jp2',
-            'files/primary/sub-897/Rat_897_Control_overview_Abd_Vag_Ant_Gas_10X_01_02_19.tif': 'files/primary/sub-897/Rat_897_Control_overview_Abd Vag Ant Gas_10X_01_02_19 (1).tif',
-            'files/primary/sub-897/Rat_897_Control_1_Abd_Vag_Ant_Gas_100X_2_5__01_02_19.jp2': 'files/primary/sub-897/Rat_897_Control_1_Abd Vag Ant Gas_100X_2(5)_01_02_19.jp2',
-            'files/primary/sub-897/Rat_897_Control_overview_Abd_Vag_Ant_Gas_10X_01_02_19.jp2': 'files/primary/sub-897/Rat_897_Control_overview_Abd Vag Ant Gas_10X_01_02_19.jp2',
-            'files/primary/sub-896/Rat_896_Control_overview_Abd_Vag_Ant_Gas_10X_01_02_19.tif': 'files/primary/sub-896/Rat_896_Control_overview_Abd Vag Ant Gas_10X_01_02_19 (1).tif',
-            'files/primary/sub-896/sam-1/Rat_896_Control_1_Abd_Vag_Ant_Gast_100X_montage_01_03_19.tif': 'files/primary/sub-896/sam-1/Rat_896_Control_1_Abd Vag Ant Gast_100X_montage_01_03_19.tif',
-            'files/primary/sub-896/sam-1/Rat_896_Control_1_Abd_Vag_Ant_Gas_100X_3_4__01_02_19.tif': 'files/primary/sub-896/sam-1/Rat_896_Control_1_Abd Vag Ant Gas_100X_3(4)_01_02_19 (1).tif',
-            'files/primary/sub-896/sam-1/Rat_896_Control_1_Abd_Vag_Ant_Gas_100X_4_4__01_02_19.jp2': 'files/primary/sub-896/sam-1/Rat_896_Control_1_Abd Vag Ant Gas_100X_4(4)_01_02_19 (1).jp2',
-            'files/primary/sub-896/Rat_896_Control_overview_Abd_Vag_Ant_Gas_10X_01_02_19.jp2': 'files/primary/sub-896/Rat_896_Control_overview_Abd Vag Ant Gas_10X_01_02_19.jp2',
-            'files/primary/sub-896/sam-1/Rat_896_Control_1_Abd_Vag_Ant_Gas_100X_4_4__01_02_19.tif': 'files/primary/sub-896/sam-1/Rat_896_Control_1_Abd Vag Ant Gas_100X_4(4)_01_02_19.tif',
-            'files/primary/sub-896/sam-1/Rat_896_Control_1_Abd_Vag_Ant_Gas_100X_3_4__01_02_19.jp2': 'files/primary/sub-896/sam-1/Rat_896_Control_1_Abd Vag Ant Gas_100X_3(4)_01_02_19.jp2',
-            'files/primary/sub-896/sam-2/Rat_896_Control_2_Abd_Vag_Ant_Gas_100X_1_1__01_02_19.tif': 'files/primary/sub-896/sam-2/Rat_896_Control_2_Abd Vag Ant Gas_100X_1(1)_01_02_19 (1).tif',
-            'files/primary/sub-896/sam-1/Rat_896_Control_1_Abd_Vag_Ant_Gas_100X_2_4__01_02_19.tif': 'files/primary/sub-896/sam-1/Rat_896_Control_1_Abd Vag Ant Gas_100X_2(4)_01_02_19 (1).tif',
-            'files/primary/sub-896/sam-1/Rat_896_Control_1_Abd_Vag_Ant_Gas_100X_2_4__01_02_19.jp2': 'files/primary/sub-896/sam-1/Rat_896_Control_1_Abd Vag Ant Gas_100X_2(4)_01_02_19.jp2',
-            'files/primary/sub-896/sam-2/Rat_896_Control_2_Abd_Vag_Ant_Gas_100X_1_1__01_02_19.jp2': 'files/primary/sub-896/sam-2/Rat_896_Control_2_Abd Vag Ant Gas_100X_1(1)_01_02_19.jp2',
-            'files/primary/sub-896/sam-2/Rat_896_Control_1_Abd_Vag_Ant_Gas_100X_1_4__01_02_19.tif': 'files/primary/sub-896/sam-2/Rat_896_Control_1_Abd Vag Ant Gas_100X_1(4)_01_02_19.tif',
-            'files/derivative/sub-898/sam-1/Rat_898_Control_1_Abd_Vag_Ant_Gas_100X_1_4__01_02_19.jp2': 'files/derivative/sub-898/sam-1/Rat_898_Control_1_Abd Vag Ant Gas_100X_1(4)_01_02_19.jp2',
-            'files/derivative/sub-898/sam-1/Rat_898_Control_1_Abd_Vag_Ant_Gas_100X_2_4__01_02_19.jp2': 'files/derivative/sub-898/sam-1/Rat_898_Control_1_Abd Vag Ant Gas_100X_2(4)_01_02_19.jp2',
-            'files/derivative/sub-898/sam-1/Rat_898_Control_1_Abd_Vag_Ant_Gast_100X_montage_01_03_19.jp2': 'files/derivative/sub-898/sam-1/Rat_898_Control_1_Abd Vag Ant Gast_100X_montage_01_03_19.jp2',
-            'files/derivative/sub-898/sam-1/Rat_898_Control_1_Abd_Vag_Ant_Gas_100X_4_4__01_02_19.jp2': 'files/derivative/sub-898/sam-1/Rat_898_Control_1_Abd Vag Ant Gas_100X_4(4)_01_02_19.jp2',
-            'files/derivative/sub-898/sam-1/Rat_898_Control_1_Abd_Vag_Ant_Gas_100X_3_4__01_02_19.jp2': 'files/derivative/sub-898/sam-1/Rat_898_Control_1_Abd Vag Ant Gas_100X_3(4)_01_02_19.jp2',
-            'files/derivative/sub-898/Rat_898_Control_overview_Abd_Vag_Ant_Gas_10X_01_02_19.jp2': 'files/derivative/sub-898/Rat_898_Control_overview_Abd Vag Ant Gas_10X_01_02_19.jp2',
-            'files/derivative/sub-898/sam-2/Rat_898_Control_2_Abd_Vag_Ant_Gas_100X_1_1__01_02_19.jp2': 'files/derivative/sub-898/sam-2/Rat_898_Control_2_Abd Vag Ant Gas_100X_1(1)_01_02_19.jp2',
-            'files/derivative/sub-897/sam-1/Rat_897_Control_1_Abd_Vag_Ant_Gast_100X_montage_01_03_19.jp2': 'files/derivative/sub-897/sam-1/Rat_897_Control_1_Abd Vag Ant Gast_100X_montage_01_03_19.jp2',
-            'files/derivative/sub-897/sam-1/Rat_897_Control_1_Abd_Vag_Ant_Gas_100X_1_5__01_02_19.jp2': 'files/derivative/sub-897/sam-1/Rat_897_Control_1_Abd Vag Ant Gas_100X_1(5)_01_02_19.jp2',
-            'files/derivative/sub-897/sam-1/Rat_897_Control_1_Abd_Vag_Ant_Gas_100X_4_5__01_02_19.jp2': 'files/derivative/sub-897/sam-1/Rat_897_Control_1_Abd Vag Ant Gas_100X_4(5)_01_02_19.jp2',
-            'files/derivative/sub-897/sam-1/Rat_897_Control_1_Abd_Vag_Ant_Gas_100X_3_5__01_02_19.jp2': 'files/derivative/sub-897/sam-1/Rat_897_Control_1_Abd Vag Ant Gas_100X_3(5)_01_02_19.jp2',
-            'files/derivative/sub-897/sam-1/Rat_897_Control_1_Abd_Vag_Ant_Gas_100X_5_5__01_02_19.jp2': 'files/derivative/sub-897/sam-1/Rat_897_Control_1_Abd Vag Ant Gas_100X_5(5)_01_02_19.jp2',
-            'files/derivative/sub-897/Rat_897_Control_overview_Abd_Vag_Ant_Gas_10X_01_02_19.jp2': 'files/derivative/sub-897/Rat_897_Control_overview_Abd Vag Ant Gas_10X_01_02_19.jp2',
-            'files/derivative/sub-897/sam-1/Rat_897_Control_1_Abd_Vag_Ant_Gas_100X_2_5__01_02_19.jp2': 'files/derivative/sub-897/sam-1/Rat_897_Control_1_Abd Vag Ant Gas_100X_2(5)_01_02_19.jp2',
-            'files/derivative/sub-897/sam-2/Rat_897_Control_2_Abd_Vag_Ant_Gas_100X_1_1__01_02_19.jp2': 'files/derivative/sub-897/sam-2/Rat_897_Control_2_Abd Vag Ant Gas_100X_1(1)_01_02_19.jp2',
-            'files/derivative/sub-896/sam-1/Rat_896_Control_1_Abd_Vag_Ant_Gast_100X_montage_01_03_19_new.jp2': 'files/derivative/sub-896/sam-1/Rat_896_Control_1_Abd Vag Ant Gast_100X_montage_01_03_19.jp2',
-            'files/derivative/sub-896/Rat_896_Control_overview_Abd_Vag_Ant_Gas_10X_01_02_19.jp2': 'files/derivative/sub-896/Rat_896_Control_overview_Abd Vag Ant Gas_10X_01_02_19.jp2',
-            'files/derivative/sub-896/sam-1/Rat_896_Control_1_Abd_Vag_Ant_Gas_100X_4_4__01_02_19.jp2': 'files/derivative/sub-896/sam-1/Rat_896_Control_1_Abd Vag Ant Gas_100X_4(4)_01_02_19.jp2',
-            'files/derivative/sub-896/sam-1/Rat_896_Control_1_Abd_Vag_Ant_Gas_100X_3_4__01_02_19.jp2': 'files/derivative/sub-896/sam-1/Rat_896_Control_1_Abd Vag Ant Gas_100X_3(4)_01_02_19.jp2',
-            'files/derivative/sub-896/sam-2/Rat_896_Control_2_Abd_Vag_Ant_Gas_100X_1_1__01_02_19.jp2': 'files/derivative/sub-896/sam-2/Rat_896_Control_2_Abd Vag Ant Gas_100X_1(1)_01_02_19.jp2',
-            'files/derivative/sub-896/sam-1/Rat_896_Control_1_Abd_Vag_Ant_Gas_100X_2_4__01_02_19.jp2': 'files/derivative/sub-896/sam-1/Rat_896_Control_1_Abd Vag Ant Gas_100X_2(4)_01_02_19.jp2',
-            'files/derivative/sub-16/sam-3/sub-16_sam-3_R16-3MergeMask.xml': 'files/derivative/sub-16/sam-3/sub-16_sam-3_R16-3MergeMask (1).xml',
-            'files/derivative/sub-25/sam-3/sub-25_sam-3_R25-3MergeMask.xml': 'files/derivative/sub-25/sam-3/sub-25_sam-3_R25-3MergeMask (1).xml',
-            'files/derivative/sub-16/sam-1/sub-16_sam-1_R16-1MergeMask.xml': 'files/derivative/sub-16/sam-1/sub-16_sam-1_R16-1MergeMask (1).xml',
-            'files/derivative/sub-18/sam-1/sub-18_sam-1_R18-1MergeMask.xml': 'files/derivative/sub-18/sam-1/sub-18_sam-1_R18-1MergeMask (1).xml',
-            'files/derivative/sub-25/sam-1/sub-25_sam-1_R25-1MergeMask.xml': 'files/derivative/sub-25/sam-1/sub-25_sam-1_R25-1MergeMask (1).xml',
-            'files/derivative/sub-20/sam-3/sub-20_sam-3_R20-3MergeMask.xml': 'files/derivative/sub-20/sam-3/sub-20_sam-3_R20-3MergeMask (1).xml',
-            'files/derivative/sub-21/sam-3/sub-21_sam-3_R21-3MergeMask.xml': 'files/derivative/sub-21/sam-3/sub-21_sam-3_R21-3MergeMask (1).xml',
-            'files/derivative/sub-20/sam-1/sub-20_sam-1_R20-1MergeMask.xml': 'files/derivative/sub-20/sam-1/sub-20_sam-1_R20-1MergeMask (1).xml',
-            'files/derivative/sub-21/sam-1/sub-21_sam-1_R21-1MergeMask.xml': 'files/derivative/sub-21/sam-1/sub-21_sam-1_R21-1MergeMask (1).xml',
-            'files/derivative/sub-17/sam-3/sub-17_sam-3_R17-3MergeMask.xml': 'files/derivative/sub-17/sam-3/sub-17_sam-3_R17-3MergeMask (1).xml',
-            'files/derivative/sub-26/sam-1/sub-26_sam-1_R26-1MergeMask.xml': 'files/derivative/sub-26/sam-1/sub-26_sam-1_R26-1MergeMask (1).xml',
-            'files/derivative/sub-24/sam-3/sub-24_sam-3_R24-3MergeMask.xml': 'files/derivative/sub-24/sam-3/sub-24_sam-3_R24-3MergeMask (1).xml',
-            'files/derivative/sub-17/sam-1/sub-17_sam-1_R17-1MergeMask.xml': 'files/derivative/sub-17/sam-1/sub-17_sam-1_R17-1MergeMask (1).xml',
-            'files/derivative/sub-24/sam-1/sub-24_sam-1_R24-1MergeMask.xml': 'files/derivative/sub-24/sam-1/sub-24_sam-1_R24-1MergeMask (1).xml',
-            'files/derivative/sub-23/sam-3/sub-23_sam-3_R23-3MergeMask.xml': 'files/derivative/sub-23/sam-3/sub-23_sam-3_R23-3MergeMask (1).xml',
-            'files/derivative/sub-23/sam-1/sub-23_sam-1_R23-1MergeMask.xml': 'files/derivative/sub-23/sam-1/sub-23_sam-1_R23-1MergeMask (1).xml',
-            'files/derivative/sub-22/sam-1/sub-22_sam-1_R22-1MergeMask.xml': 'files/derivative/sub-22/sam-1/sub-22_sam-1_R22-1MergeMask (1).xml',
-            'files/derivative/sub-22/sam-3/sub-22_sam-3_R22-3MergeMask.xml': 'files/derivative/sub-22/sam-3/sub-22_sam-3_R22-3MergeMask (1).xml',
-            'files/primary/sub-119/sam-c-Kit_119/c-Kit tC M119 20X0.9Z 190508_201015_3.lsm': 'files/primary/sub-119/sam-c-Kit_119/c-Kit tC M119 20X0.9Z 190508_201015_3',
-            'files/primary/sub-119/sam-c-Kit_119/c-Kit tC M119 20X0.9Z 190508_201015_2.lsm': 'files/primary/sub-119/sam-c-Kit_119/c-Kit tC M119 20X0.9Z 190508_201015_2',
-            'files/primary/sub-119/sam-c-Kit_119/c-Kit tC M119 20X0.9Z 190508_201015_1.lsm': 'files/primary/sub-119/sam-c-Kit_119/c-Kit tC M119 20X0.9Z 190508_201015_1',
-            'files/primary/sub-119/sam-c-Kit_119/c-Kit pC M119 20X0.9Z 190508_201015_1.lsm': 'files/primary/sub-119/sam-c-Kit_119/c-Kit pC M119 20X0.9Z 190508_201015_1',
-            'files/primary/sub-119/sam-c-Kit_119/c-Kit tC M119 20X0.9Z 190508_201015_4.lsm': 'files/primary/sub-119/sam-c-Kit_119/c-Kit tC M119 20X0.9Z 190508_201015_4',
-            'files/primary/sub-119/sam-c-Kit_119/c-Kit tC M119 20X0.9Z 190508_201015_5.lsm': 'files/primary/sub-119/sam-c-Kit_119/c-Kit tC M119 20X0.9Z 190508_201015_5',
-            'files/primary/sub-119/sam-ChAT_119/ChAT MP M190 10X0.9Z 191210_201008_45.lsm': 'files/primary/sub-119/sam-ChAT_119/ChAT MP M190 10X0.9Z 191210_201008_45',
-            'files/primary/sub-218/sam-c-Kit_M218/c-Kit pC M218 10X0.6Z 201021_201028.lsm': 'files/primary/sub-218/sam-c-Kit_M218/c-Kit pC M218 10X0.6Z 201021_201028',
-            'files/primary/sub-218/sam-c-Kit_M218/c-Kit pC M218 20X0.6Z 201021_201028_3.lsm': 'files/primary/sub-218/sam-c-Kit_M218/c-Kit pC M218 20X0.6Z 201021_201028_3',
-            'files/primary/sub-218/sam-c-Kit_PGP9/c-Kit PGP9.5 pC SMP M217 10X0.6Z 201021_201028.lsm': 'files/primary/sub-218/sam-c-Kit_PGP9.5_M218/c-Kit PGP9.5 pC SMP M217 10X0.6Z 201021_201028',
-            'files/primary/sub-218/sam-c-Kit_M218/c-Kit pC M218 20X0.6Z 201021_201028_2.lsm': 'files/primary/sub-218/sam-c-Kit_M218/c-Kit pC M218 20X0.6Z 201021_201028_2',
-            'files/primary/sub-218/sam-c-Kit_PGP9/c-Kit PGP9.5 pC SMP M217 20X0.6Z 201021_201028.lsm': 'files/primary/sub-218/sam-c-Kit_PGP9.5_M218/c-Kit PGP9.5 pC SMP M217 20X0.6Z 201021_201028',
-            'files/primary/sub-218/sam-c-Kit_M218/c-Kit pC M218 20X0.6Z 201021_201028_4.lsm': 'files/primary/sub-218/sam-c-Kit_M218/c-Kit pC M218 20X0.6Z 201021_201028_4',
-            'files/primary/sub-218/sam-c-Kit_NeuN_M218/c-Kit NeuN pC MP M218 20X0.6Z 201021_201028.lsm': 'files/primary/sub-218/sam-c-Kit_NeuN_M218/c-Kit NeuN pC MP M218 20X0.6Z 201021_201028',
-            'files/primary/sub-218/sam-c-Kit_NeuN_M218/c-Kit NeuN pC a-m M218 20X0.6Z 201021_201028.lsm': 'files/primary/sub-218/sam-c-Kit_NeuN_M218/c-Kit NeuN pC a-m M218 20X0.6Z 201021_201028',
-            'files/primary/sub-218/sam-c-Kit_NeuN_M218/c-Kit NeuN pC am-MP M218 20X0.6Z 201021_201028.lsm': 'files/primary/sub-218/sam-c-Kit_NeuN_M218/c-Kit NeuN pC am-MP M218 20X0.6Z 201021_201028',
-            'files/primary/sub-20191031M1/sam-PG9/20171107M1_dC_PGP9.5_10x.lsm': 'files/primary/sub-20191031M1/sam-PG9.5_M1/20171107M1_dC_PGP9.5_10x.lsm',
-            'files/primary/sub-20191031M1/sam-PG9/20171107M1_pC_PGP9.5_1_10x.lsm': 'files/primary/sub-20191031M1/sam-PG9.5_M1/20171107M1_pC_PGP9.5_1_10x.lsm',
-            'files/primary/sub-20191031M1/sam-nNOS_Hu_M1/1. 20191031M1_dC_SMP_nNOS_Hu_20x.lsm': 'files/primary/sub-20191031M1/sam-nNOS_Hu_M1/20191031M1_dC_SMP_nNOS_Hu_20x.lsm',
-            'files/primary/sub-190/sam-PGP9/PGP9.5 pC SMP M190 10X0.6Z 191210_201015_1.lsm': 'files/primary/sub-190/sam-PGP9.5_190/PGP9.5 pC SMP M190 10X0.6Z 191210_201015_1',
-            'files/primary/sub-190/sam-PGP9/PGP9.5 pC MP M190 10X0.8Z 191210_201015_1.lsm': 'files/primary/sub-190/sam-PGP9.5_190/PGP9.5 pC MP M190 10X0.8Z 191210_201015_1',
-            'files/primary/sub-190/sam-PGP9/PGP9.5 MP M190 20X0.6Z 191210_201006_10.lsm': 'files/primary/sub-190/sam-PGP9.5_190/PGP9.5 MP M190 20X0.6Z 191210_201006_10',
-            'files/primary/sub-190/sam-PGP9/PGP9.5 pC SMP M190 20XZ 191210_201015_1.lsm': 'files/primary/sub-190/sam-PGP9.5_190/PGP9.5 pC SMP M190 20XZ 191210_201015_1',
-            'files/primary/sub-190/sam-PGP9/PGP9.5 pC MP M190 20X0.8Z 191210_201015_4.lsm': 'files/primary/sub-190/sam-PGP9.5_190/PGP9.5 pC MP M190 20X0.8Z 191210_201015_4',
-            'files/primary/sub-190/sam-PGP9/PGP9.5 pC MP M190 10X0.8Z 191210_201015_2.lsm': 'files/primary/sub-190/sam-PGP9.5_190/PGP9.5 pC MP M190 10X0.8Z 191210_201015_2',
-            'files/primary/sub-190/sam-PGP9/PGP9.5 pC SMP M190 20XZ 191210_201015_2.lsm': 'files/primary/sub-190/sam-PGP9.5_190/PGP9.5 pC SMP M190 20XZ 191210_201015_2',
-            'files/primary/sub-190/sam-PGP9/PGP9.5 pC MP M190 20X0.8Z 191210_201015_2.lsm': 'files/primary/sub-190/sam-PGP9.5_190/PGP9.5 pC MP M190 20X0.8Z 191210_201015_2',
-            'files/primary/sub-190/sam-PGP9/PGP9.5 MP M190 10X0.6Z 191210_201006_9.lsm': 'files/primary/sub-190/sam-PGP9.5_190/PGP9.5 MP M190 10X0.6Z 191210_201006_9',
-            'files/primary/sub-20191031M2/sam-rpChAT_Hu_M2/2. 20191031M2_pC_SMP_rpChAT_Hu_20x.lsm': 'files/primary/sub-20191031M2/sam-rpChAT_Hu_M2/20191031M2_pC_SMP_rpChAT_Hu_20x.lsm (2)',
-            'files/primary/sub-20191031M2/sam-rpChAT_Hu_M2/1. 20191031M2_pC_SMP_rpChAT_Hu_20x.lsm': 'files/primary/sub-20191031M2/sam-rpChAT_Hu_M2/20191031M2_pC_SMP_rpChAT_Hu_20x.lsm',
-            'files/primary/sub-189/sam-PGP9/PGP9.5 SMP M189 10X0.6 191210_201006_2.lsm': 'files/primary/sub-189/sam-PGP9.5_189/PGP9.5 SMP M189 10X0.6 191210_201006_2',
-            'files/primary/sub-189/sam-PGP9/PGP9.5 pC MP M189 20XZ 191210_201015_1.lsm': 'files/primary/sub-189/sam-PGP9.5_189/PGP9.5 pC MP M189 20XZ 191210_201015_1',
-            'files/primary/sub-189/sam-PGP9/PGP9.5 pC SMP M189 10X0.8Z 191210_201014_1.lsm': 'files/primary/sub-189/sam-PGP9.5_189/PGP9.5 pC SMP M189 10X0.8Z 191210_201014_1',
-            'files/primary/sub-189/sam-PGP9/PGP9.5 pC SMP M189 20X0.6Z 191210_201015_2.lsm': 'files/primary/sub-189/sam-PGP9.5_189/PGP9.5 pC SMP M189 20X0.6Z 191210_201015_2',
-            'files/primary/sub-189/sam-PGP9/PGP9.5 pC SMP M189 10X0.8Z 191210_201014_2.lsm': 'files/primary/sub-189/sam-PGP9.5_189/PGP9.5 pC SMP M189 10X0.8Z 191210_201014_2',
-            'files/primary/sub-189/sam-PGP9/PGP9.5 SMP M189 10X0.6Z 191210_201006_4.lsm': 'files/primary/sub-189/sam-PGP9.5_189/PGP9.5 SMP M189 10X0.6Z 191210_201006_4',
-            'files/primary/sub-189/sam-PGP9/PGP9.5 pC SMP M189 10X0.8Z 191210_201014_3.lsm': 'files/primary/sub-189/sam-PGP9.5_189/PGP9.5 pC SMP M189 10X0.8Z 191210_201014_3',
-            'files/primary/sub-189/sam-PGP9/PGP9.5 pC SMP M189 20X0.9Z 191210_201015_1.lsm': 'files/primary/sub-189/sam-PGP9.5_189/PGP9.5 pC SMP M189 20X0.9Z 191210_201015_1',
-            'files/primary/sub-189/sam-PGP9/PGP9.5 MP M189 10X0.6Z 191210_201006_11.lsm': 'files/primary/sub-189/sam-PGP9.5_189/PGP9.5 MP M189 10X0.6Z 191210_201006_11',
-            'files/primary/sub-189/sam-PGP9/PGP9.5 SMP M189 20X0.9Z 191210_201006_5.lsm': 'files/primary/sub-189/sam-PGP9.5_189/PGP9.5 SMP M189 20X0.9Z 191210_201006_5',
-            'files/primary/sub-189/sam-PGP9/PGP9.5 pC MP M189 10X0.8Z 191210_201014_2.lsm': 'files/primary/sub-189/sam-PGP9.5_189/PGP9.5 pC MP M189 10X0.8Z 191210_201014_2',
-            'files/primary/sub-189/sam-PGP9/PGP9.5 SMP M189 10X0.6Z 191210_201006_8.lsm': 'files/primary/sub-189/sam-PGP9.5_189/PGP9.5 SMP M189 10X0.6Z 191210_201006_8',
-            'files/primary/sub-189/sam-PGP9/PGP9.5 pC MP M189 10X0.8Z 191210_201014_3.lsm': 'files/primary/sub-189/sam-PGP9.5_189/PGP9.5 pC MP M189 10X0.8Z 191210_201014_3',
-            'files/primary/sub-189/sam-PGP9/PGP9.5 SMP M189 20X0.6Z 191210_201006_7.lsm': 'files/primary/sub-189/sam-PGP9.5_189/PGP9.5 SMP M189 20X0.6Z 191210_201006_7',
-            'files/primary/sub-189/sam-PGP9/PGP9.5 SMP M189 20X0.6Z 191210_201006_6.lsm': 'files/primary/sub-189/sam-PGP9.5_189/PGP9.5 SMP M189 20X0.6Z 191210_201006_6',
-            'files/primary/sub-189/sam-PGP9/PGP9.5 SMP M189 10X0.6Z 191210_201006_3.lsm': 'files/primary/sub-189/sam-PGP9.5_189/PGP9.5 SMP M189 10X0.6Z 191210_201006_3',
-            'files/primary/sub-189/sam-PGP9/PGP9.5 pC MP M189 20XZ 191210_201015_2.lsm': 'files/primary/sub-189/sam-PGP9.5_189/PGP9.5 pC MP M189 20XZ 191210_201015_2',
-            'files/primary/sub-189/sam-PGP9/PGP9.5 pC MP M189 10X0.8Z 191210_201014_1.lsm': 'files/primary/sub-189/sam-PGP9.5_189/PGP9.5 pC MP M189 10X0.8Z 191210_201014_1',
-            'files/primary/sub-217/sam-CD206_M217/CD206 pC MP M217 20X0.9Z 201021_201028.lsm': 'files/primary/sub-217/sam-CD206_M217/CD206 pC MP M217 20X0.9Z 201021_201028',
-            'files/primary/sub-217/sam-CD206_M217/CD206 pC SMP M217 20X0.9Z 201021_201028.lsm': 'files/primary/sub-217/sam-CD206_M217/CD206 pC SMP M217 20X0.9Z 201021_201028',
-            'files/primary/sub-217/sam-CD206_M217/CD206 pC SMP M217 10X0.6Z 201021_201028.lsm': 'files/primary/sub-217/sam-CD206_M217/CD206 pC SMP M217 10X0.6Z 201021_201028',
-            'files/derivative/sub-218/sam-c-Kit_PGP9/c-Kit PGP9.5 pC SMP M217 20X0.6Z 201021_201028.jpx': 'files/derivative/sub-218/sam-c-Kit_PGP9.5_M218/c-Kit PGP9.5 pC SMP M217 20X0.6Z 201021_201028.jpx',
-            'files/derivative/sub-218/sam-c-Kit_PGP9/c-Kit PGP9.5 pC SMP M217 10X0.6Z 201021_201028.jpx': 'files/derivative/sub-218/sam-c-Kit_PGP9.5_M218/c-Kit PGP9.5 pC SMP M217 10X0.6Z 201021_201028.jpx',
-            'files/derivative/sub-218/sam-c-Kit_PGP9/c-Kit PGP9.5 pC SMP M217 10X0.6Z 201021_201028.tif': 'files/derivative/sub-218/sam-c-Kit_PGP9.5_M218/c-Kit PGP9.5 pC SMP M217 10X0.6Z 201021_201028.tif',
-            'files/derivative/sub-218/sam-c-Kit_PGP9/c-Kit PGP9.5 pC SMP M217 20X0.6Z 201021_201028.tif': 'files/derivative/sub-218/sam-c-Kit_PGP9.5_M218/c-Kit PGP9.5 pC SMP M217 20X0.6Z 201021_201028.tif',
-            'files/derivative/sub-20191031M1/sam-PG9/20171107M1_pC_PGP9.5_1_10x.lsm.jpx': 'files/derivative/sub-20191031M1/sam-PG9.5_M1/20171107M1_pC_PGP9.5_1_10x.lsm.jpx',
-            'files/derivative/sub-20191031M1/sam-PG9/20171107M1_dC_PGP9.5_10x.lsm.tif': 'files/derivative/sub-20191031M1/sam-PG9.5_M1/20171107M1_dC_PGP9.5_10x.lsm.tif',
-            'files/derivative/sub-20191031M1/sam-PG9/20171107M1_pC_PGP9.5_1_10x.lsm.tif': 'files/derivative/sub-20191031M1/sam-PG9.5_M1/20171107M1_pC_PGP9.5_1_10x.lsm.tif',
-            'files/derivative/sub-20191031M1/sam-PG9/20171107M1_dC_PGP9.5_10x.lsm.jpx': 'files/derivative/sub-20191031M1/sam-PG9.5_M1/20171107M1_dC_PGP9.5_10x.lsm.jpx',
-            'files/derivative/sub-190/sam-PGP9/PGP9.5 pC MP M190 20X0.8Z 191210_201015_4.jpx': 'files/derivative/sub-190/sam-PGP9.5_190/PGP9.5 pC MP M190 20X0.8Z 191210_201015_4.jpx',
-            'files/derivative/sub-190/sam-PGP9/PGP9.5 pC MP M190 20X0.8Z 191210_201015_2.tif': 'files/derivative/sub-190/sam-PGP9.5_190/PGP9.5 pC MP M190 20X0.8Z 191210_201015_2.tif',
-            'files/derivative/sub-190/sam-PGP9/PGP9.5 pC MP M190 10X0.8Z 191210_201015_1.jpx': 'files/derivative/sub-190/sam-PGP9.5_190/PGP9.5 pC MP M190 10X0.8Z 191210_201015_1.jpx',
-            'files/derivative/sub-190/sam-PGP9/PGP9.5 MP M190 10X0.6Z 191210_201006_9.tif': 'files/derivative/sub-190/sam-PGP9.5_190/PGP9.5 MP M190 10X0.6Z 191210_201006_9.tif',
-            'files/derivative/sub-190/sam-PGP9/PGP9.5 pC SMP M190 20XZ 191210_201015_2.tif': 'files/derivative/sub-190/sam-PGP9.5_190/PGP9.5 pC SMP M190 20XZ 191210_201015_2.tif',
-            'files/derivative/sub-190/sam-PGP9/PGP9.5 pC MP M190 10X0.8Z 191210_201015_2.tif': 'files/derivative/sub-190/sam-PGP9.5_190/PGP9.5 pC MP M190 10X0.8Z 191210_201015_2.tif',
-            'files/derivative/sub-190/sam-PGP9/PGP9.5 pC SMP M190 20XZ 191210_201015_1.tif': 'files/derivative/sub-190/sam-PGP9.5_190/PGP9.5 pC SMP M190 20XZ 191210_201015_1.tif',
-            'files/derivative/sub-190/sam-PGP9/PGP9.5 pC SMP M190 10X0.6Z 191210_201015_1.jpx': 'files/derivative/sub-190/sam-PGP9.5_190/PGP9.5 pC SMP M190 10X0.6Z 191210_201015_1.jpx',
-            'files/derivative/sub-190/sam-PGP9/PGP9.5 pC MP M190 10X0.8Z 191210_201015_1.tif': 'files/derivative/sub-190/sam-PGP9.5_190/PGP9.5 pC MP M190 10X0.8Z 191210_201015_1.tif',
-            'files/derivative/sub-190/sam-PGP9/PGP9.5 pC SMP M190 20XZ 191210_201015_1.jpx': 'files/derivative/sub-190/sam-PGP9.5_190/PGP9.5 pC SMP M190 20XZ 191210_201015_1.jpx',
-            'files/derivative/sub-190/sam-PGP9/PGP9.5 pC MP M190 20X0.8Z 191210_201015_2.jpx': 'files/derivative/sub-190/sam-PGP9.5_190/PGP9.5 pC MP M190 20X0.8Z 191210_201015_2.jpx',
-            'files/derivative/sub-190/sam-PGP9/PGP9.5 pC SMP M190 10X0.6Z 191210_201015_1.tif': 'files/derivative/sub-190/sam-PGP9.5_190/PGP9.5 pC SMP M190 10X0.6Z 191210_201015_1.tif',
-            'files/derivative/sub-190/sam-PGP9/PGP9.5 pC MP M190 10X0.8Z 191210_201015_2.jpx': 'files/derivative/sub-190/sam-PGP9.5_190/PGP9.5 pC MP M190 10X0.8Z 191210_201015_2.jpx',
-            'files/derivative/sub-190/sam-PGP9/PGP9.5 pC SMP M190 20XZ 191210_201015_2.jpx': 'files/derivative/sub-190/sam-PGP9.5_190/PGP9.5 pC SMP M190 20XZ 191210_201015_2.jpx',
-            'files/derivative/sub-190/sam-PGP9/PGP9.5 pC MP M190 20X0.8Z 191210_201015_4.tif': 'files/derivative/sub-190/sam-PGP9.5_190/PGP9.5 pC MP M190 20X0.8Z 191210_201015_4.tif',
-            'files/derivative/sub-190/sam-PGP9/PGP9.5 MP M190 10X0.6Z 191210_201006_9.jpx': 'files/derivative/sub-190/sam-PGP9.5_190/PGP9.5 MP M190 10X0.6Z 191210_201006_9.jpx',
-            'files/derivative/sub-190/sam-PGP9/PGP9.5 MP M190 20X0.6Z 191210_201006_10.jpx': 'files/derivative/sub-190/sam-PGP9.5_190/PGP9.5 MP M190 20X0.6Z 191210_201006_10.jpx',
-            'files/derivative/sub-189/sam-PGP9/PGP9.5 pC SMP M189 20X0.9Z 191210_201015_1.jpx': 'files/derivative/sub-189/sam-PGP9.5_189/PGP9.5 pC SMP M189 20X0.9Z 191210_201015_1.jpx',
-            'files/derivative/sub-189/sam-PGP9/PGP9.5 pC SMP M189 10X0.8Z 191210_201014_3.jpx': 'files/derivative/sub-189/sam-PGP9.5_189/PGP9.5 pC SMP M189 10X0.8Z 191210_201014_3.jpx',
-            'files/derivative/sub-189/sam-PGP9/PGP9.5 SMP M189 20X0.6Z 191210_201006_7.jpx': 'files/derivative/sub-189/sam-PGP9.5_189/PGP9.5 SMP M189 20X0.6Z 191210_201006_7.jpx',
-            'files/derivative/sub-189/sam-PGP9/PGP9.5 pC MP M189 20XZ 191210_201015_1.jpx': 'files/derivative/sub-189/sam-PGP9.5_189/PGP9.5 pC MP M189 20XZ 191210_201015_1.jpx',
-            'files/derivative/sub-189/sam-PGP9/PGP9.5 pC MP M189 10X0.8Z 191210_201014_3.jpx': 'files/derivative/sub-189/sam-PGP9.5_189/PGP9.5 pC MP M189 10X0.8Z 191210_201014_3.jpx',
-            'files/derivative/sub-189/sam-PGP9/PGP9.5 pC MP M189 10X0.8Z 191210_201014_2.tif': 'files/derivative/sub-189/sam-PGP9.5_189/PGP9.5 pC MP M189 10X0.8Z 191210_201014_2.tif',
-            'files/derivative/sub-189/sam-PGP9/PGP9.5 MP M189 10X0.6Z 191210_201006_11.tif': 'files/derivative/sub-189/sam-PGP9.5_189/PGP9.5 MP M189 10X0.6Z 191210_201006_11.tif',
-            'files/derivative/sub-189/sam-PGP9/PGP9.5 SMP M189 10X0.6Z 191210_201006_4.jpx': 'files/derivative/sub-189/sam-PGP9.5_189/PGP9.5 SMP M189 10X0.6Z 191210_201006_4.jpx',
-            'files/derivative/sub-189/sam-PGP9/PGP9.5 pC MP M189 10X0.8Z 191210_201014_2.jpx': 'files/derivative/sub-189/sam-PGP9.5_189/PGP9.5 pC MP M189 10X0.8Z 191210_201014_2.jpx',
-            'files/derivative/sub-189/sam-PGP9/PGP9.5 SMP M189 10X0.6 191210_201006_2.tif': 'files/derivative/sub-189/sam-PGP9.5_189/PGP9.5 SMP M189 10X0.6 191210_201006_2.tif',
-            'files/derivative/sub-189/sam-PGP9/PGP9.5 pC SMP M189 10X0.8Z 191210_201014_3.tif': 'files/derivative/sub-189/sam-PGP9.5_189/PGP9.5 pC SMP M189 10X0.8Z 191210_201014_3.tif',
-            'files/derivative/sub-189/sam-PGP9/PGP9.5 pC SMP M189 10X0.8Z 191210_201014_2.jpx': 'files/derivative/sub-189/sam-PGP9.5_189/PGP9.5 pC SMP M189 10X0.8Z 191210_201014_2.jpx',
-            'files/derivative/sub-189/sam-PGP9/PGP9.5 pC SMP M189 10X0.8Z 191210_201014_2.tif': 'files/derivative/sub-189/sam-PGP9.5_189/PGP9.5 pC SMP M189 10X0.8Z 191210_201014_2.tif',
-            'files/derivative/sub-189/sam-PGP9/PGP9.5 pC MP M189 20XZ 191210_201015_2.jpx': 'files/derivative/sub-189/sam-PGP9.5_189/PGP9.5 pC MP M189 20XZ 191210_201015_2.jpx',
-            'files/derivative/sub-189/sam-PGP9/PGP9.5 SMP M189 10X0.6Z 191210_201006_3.jpx': 'files/derivative/sub-189/sam-PGP9.5_189/PGP9.5 SMP M189 10X0.6Z 191210_201006_3.jpx',
-            'files/derivative/sub-189/sam-PGP9/PGP9.5 SMP M189 20X0.6Z 191210_201006_7.tif': 'files/derivative/sub-189/sam-PGP9.5_189/PGP9.5 SMP M189 20X0.6Z 191210_201006_7.tif',
-            'files/derivative/sub-189/sam-PGP9/PGP9.5 SMP M189 20X0.9Z 191210_201006_5.tif': 'files/derivative/sub-189/sam-PGP9.5_189/PGP9.5 SMP M189 20X0.9Z 191210_201006_5.tif',
-            'files/derivative/sub-189/sam-PGP9/PGP9.5 SMP M189 20X0.9Z 191210_201006_5.jpx': 'files/derivative/sub-189/sam-PGP9.5_189/PGP9.5 SMP M189 20X0.9Z 191210_201006_5.jpx',
-            'files/derivative/sub-189/sam-PGP9/PGP9.5 pC MP M189 20XZ 191210_201015_1.tif': 'files/derivative/sub-189/sam-PGP9.5_189/PGP9.5 pC MP M189 20XZ 191210_201015_1.tif',
-            'files/derivative/sub-189/sam-PGP9/PGP9.5 pC SMP M189 20X0.9Z 191210_201015_1.tif': 'files/derivative/sub-189/sam-PGP9.5_189/PGP9.5 pC SMP M189 20X0.9Z 191210_201015_1.tif',
-            'files/derivative/sub-189/sam-PGP9/PGP9.5 pC SMP M189 20X0.6Z 191210_201015_2.tif': 'files/derivative/sub-189/sam-PGP9.5_189/PGP9.5 pC SMP M189 20X0.6Z 191210_201015_2.tif',
-            'files/derivative/sub-189/sam-PGP9/PGP9.5 pC SMP M189 20X0.6Z 191210_201015_2.jpx': 'files/derivative/sub-189/sam-PGP9.5_189/PGP9.5 pC SMP M189 20X0.6Z 191210_201015_2.jpx',
-            'files/derivative/sub-189/sam-PGP9/PGP9.5 SMP M189 20X0.6Z 191210_201006_6.tif': 'files/derivative/sub-189/sam-PGP9.5_189/PGP9.5 SMP M189 20X0.6Z 191210_201006_6.tif',
-            'files/derivative/sub-189/sam-PGP9/PGP9.5 SMP M189 10X0.6Z 191210_201006_8.jpx': 'files/derivative/sub-189/sam-PGP9.5_189/PGP9.5 SMP M189 10X0.6Z 191210_201006_8.jpx',
-            'files/derivative/sub-189/sam-PGP9/PGP9.5 pC MP M189 10X0.8Z 191210_201014_1.jpx': 'files/derivative/sub-189/sam-PGP9.5_189/PGP9.5 pC MP M189 10X0.8Z 191210_201014_1.jpx',
-            'files/derivative/sub-189/sam-PGP9/PGP9.5 MP M189 10X0.6Z 191210_201006_11.jpx': 'files/derivative/sub-189/sam-PGP9.5_189/PGP9.5 MP M189 10X0.6Z 191210_201006_11.jpx',
-            'files/derivative/sub-189/sam-PGP9/PGP9.5 SMP M189 10X0.6Z 191210_201006_3.tif': 'files/derivative/sub-189/sam-PGP9.5_189/PGP9.5 SMP M189 10X0.6Z 191210_201006_3.tif',
-            'files/derivative/sub-189/sam-PGP9/PGP9.5 pC MP M189 10X0.8Z 191210_201014_1.tif': 'files/derivative/sub-189/sam-PGP9.5_189/PGP9.5 pC MP M189 10X0.8Z 191210_201014_1.tif',
-            'files/derivative/sub-189/sam-PGP9/PGP9.5 pC SMP M189 10X0.8Z 191210_201014_1.jpx': 'files/derivative/sub-189/sam-PGP9.5_189/PGP9.5 pC SMP M189 10X0.8Z 191210_201014_1.jpx',
-            'files/derivative/sub-189/sam-PGP9/PGP9.5 pC MP M189 20XZ 191210_201015_2.tif': 'files/derivative/sub-189/sam-PGP9.5_189/PGP9.5 pC MP M189 20XZ 191210_201015_2.tif',
-            'files/derivative/sub-189/sam-PGP9/PGP9.5 SMP M189 10X0.6Z 191210_201006_8.tif': 'files/derivative/sub-189/sam-PGP9.5_189/PGP9.5 SMP M189 10X0.6Z 191210_201006_8.tif',
-            'files/derivative/sub-189/sam-PGP9/PGP9.5 pC SMP M189 10X0.8Z 191210_201014_1.tif': 'files/derivative/sub-189/sam-PGP9.5_189/PGP9.5 pC SMP M189 10X0.8Z 191210_201014_1.tif',
-            'files/derivative/sub-189/sam-PGP9/PGP9.5 pC MP M189 10X0.8Z 191210_201014_3.tif': 'files/derivative/sub-189/sam-PGP9.5_189/PGP9.5 pC MP M189 10X0.8Z 191210_201014_3.tif',
-            'files/derivative/sub-189/sam-PGP9/PGP9.5 SMP M189 10X0.6 191210_201006_2.jp2': 'files/derivative/sub-189/sam-PGP9.5_189/PGP9.5 SMP M189 10X0.6 191210_201006_2.jp2',
-            'files/derivative/sub-189/sam-PGP9/PGP9.5 SMP M189 10X0.6Z 191210_201006_4.tif': 'files/derivative/sub-189/sam-PGP9.5_189/PGP9.5 SMP M189 10X0.6Z 191210_201006_4.tif',
-            'files/derivative/sub-189/sam-PGP9/PGP9.5 SMP M189 20X0.6Z 191210_201006_6.jpx': 'files/derivative/sub-189/sam-PGP9.5_189/PGP9.5 SMP M189 20X0.6Z 191210_201006_6.jpx',
-            'files/docs/README (derivatives).txt': 'files/docs/README.txt', 'files/primary/sub-J7/070918_000.smrx': 'files/primary/sub-J7/sub-07-09-2018-J7_070918_000.smrx',
-            'files/primary/sub-K1/022318_000.smrx': 'files/primary/sub-K1/sub-02-23-2018-K1_022318_000.smrx',
-            'files/primary/sub-L8/080219_000.smrx': 'files/primary/sub-L8/sub-08-02-2019-L8_080219_000.smrx',
-            'files/primary/sub-K5/052218_000.smrx': 'files/primary/sub-K5/sub-05-22-2018-K5_052218_000.smrx',
-            'files/primary/sub-J10/081518_000.smrx': 'files/primary/sub-J10/sub-08-15-2018-J10_081518_000.smrx',
-            'files/primary/sub-K2/030618_000.smrx': 'files/primary/sub-K2/sub-03-06-2018-K2_030618_000.smrx',
-            'files/primary/sub-I9/073018_000.smrx': 'files/primary/sub-I9/sub-07-30-2018-I9_073018_000.smrx',
-            'files/primary/sub-K10/073118_000.smrx': 'files/primary/sub-K10/sub-07-31-2018-K10_073118_000.smrx',
-            'files/primary/sub-J6/061118_000.smrx': 'files/primary/sub-J6/sub-06-11-2018-J6_061118_000.smrx',
-            'files/primary/sub-J4/040318_000.smrx': 'files/primary/sub-J4/sub-04-03-2018-J4_040318_000.smrx',
-            'files/primary/sub-I5/051518_000.smrx': 'files/primary/sub-I5/sub-05-15-2018-I5_051518_000.smrx',
-            'files/primary/sub-L6/072419_000.smrx': 'files/primary/sub-L6/sub-07-24-2019-L6_072419_000.smrx',
-            'files/primary/sub-I2/030218_000.smrx': 'files/primary/sub-I2/sub-03-02-2018-I2_030218_000.smrx',
-            'files/primary/sub-J3/032618_000.smrx': 'files/primary/sub-J3/sub-03-26-2018-J3_032618_000.smrx',
-            'files/primary/sub-K4/032918_000.smrx': 'files/primary/sub-K4/sub-03-29-2018-K4_032918_000.smrx',
-            'files/primary/sub-I10/081318_000.smrx': 'files/primary/sub-I10/sub-08-13-2018-I10_081318_000.smrx',
-            'files/primary/sub-L9/080519_000.smrx': 'files/primary/sub-L9/sub-08-05-2019-L9_080519_000.smrx',
-            'files/primary/sub-L2/053018_000.smrx': 'files/primary/sub-L2/sub-05-30-2018-L2_053018_000.smrx',
-            'files/primary/sub-K9/071818_001.smrx': 'files/primary/sub-K9/sub-07-18-2018-K9_071818_001.smrx',
-            'files/primary/sub-K9/071818_000.smrx': 'files/primary/sub-K9/sub-07-18-2018-K9_071818_000.smrx',
-            'files/primary/sub-L1/040518_000.smrx': 'files/primary/sub-L1/sub-04-05-2018-L1_040518_000.smrx',
-            'files/primary/sub-K8/062918_000.smrx': 'files/primary/sub-K8/sub-06-29-2018-K8_062918_000.smrx',
-            'files/primary/sub-I6/060618_000.smrx': 'files/primary/sub-I6/sub-06-06-2018-I6_060618_000.smrx',
-            'files/primary/sub-L5/072319_000.smrx': 'files/primary/sub-L5/sub-07-23-2019-L5_072319_000.smrx',
-            'files/primary/sub-J2/030918_000.smrx': 'files/primary/sub-J2/sub-03-09-2018-J2_030918_000.smrx',
-            'files/primary/sub-L10/080819_001.smrx': 'files/primary/sub-L10/sub-08-08-2019-L10_080819_001.smrx',
-            'files/primary/sub-L10/080819_000.smrx': 'files/primary/sub-L10/sub-08-08-2019-L10_080819_000.smrx',
-            'files/primary/sub-J9/072518_000.smrx': 'files/primary/sub-J9/sub-07-25-2018-J9_072518_000.smrx',
-            'files/primary/sub-J8/071118_000.smrx': 'files/primary/sub-J8/sub-07-11-2018-J8_071118_000.smrx',
-            'files/primary/sub-L4/111518_000.smrx': 'files/primary/sub-L4/sub-11-15-2018-L4_111518_000.smrx',
-            'files/primary/sub-J1/030118_000.smrx': 'files/primary/sub-J1/sub-03-01-2018-J1_030118_000.smrx',
-            'files/primary/sub-I4/032818_000.smrx': 'files/primary/sub-I4/sub-03-28-2018-I4_032818_000.smrx',
-            'files/primary/sub-I7/071018_000.smrx': 'files/primary/sub-I7/sub-07-10-2018-I7_071018_000.smrx',
-            'files/primary/sub-J5/052318_000.smrx': 'files/primary/sub-J5/sub-05-23-2018-J5_052318_000.smrx',
-            'files/primary/sub-I3/031418_000.smrx': 'files/primary/sub-I3/sub-03-14-2018-I3_031418_000.smrx',
-            'files/primary/sub-K6/060518_000.smrx': 'files/primary/sub-K6/sub-06-05-2018-K6_060518_000.smrx',
-            'files/primary/sub-I4/032818_001.smrx': 'files/primary/sub-I4/sub-03-28-2018-I4_032818_001.smrx',
-            'files/primary/sub-K7/062518_000.smrx': 'files/primary/sub-K7/sub-06-25-2018-K7_062518_000.smrx',
-            'files/primary/sub-I8/071718_000.smrx': 'files/primary/sub-I8/sub-07-17-2018-I8_071718_000.smrx',
-            'files/primary/sub-K3/032718_000.smrx': 'files/primary/sub-K3/sub-03-27-2018-K3_032718_000.smrx',
-            'files/primary/sub-I1/022218_000.smrx': 'files/primary/sub-I1/sub-02-22-2018-I1_022218_000.smrx',
-            'files/primary/sub-L3/111618_000.smrx': 'files/primary/sub-L3/sub-11-16-2018-L3_111618_000.smrx',
-            'files/primary/sub-L7/073019_000.smrx': 'files/primary/sub-L7/sub-07-30-2019-L7_073019_000.smrx',
-            'files/docs/sub-J7/J7_Notebook.pdf': 'files/docs/sub-J7/sub-07-09-2018-J7_J7 Notebook_pdf.pdf',
-            'files/docs/sub-K2/K2_Notebook.pdf': 'files/docs/sub-K2/sub-03-06-2018-K2_K2 Notebook_pdf.pdf',
-            'files/docs/sub-J10/J10_Notebook.pdf': 'files/docs/sub-J10/sub-08-15-2018-J10_J10 Notebook_pdf.pdf',
-            'files/docs/sub-I9/I9_Notebook.pdf': 'files/docs/sub-I9/sub-07-30-2018-I9_I9 Notebook_pdf.pdf',
-            'files/docs/sub-K1/K1_Notebook.pdf': 'files/docs/sub-K1/sub-02-23-2018-K1_K1 Notebook_pdf.pdf',
-            'files/docs/sub-K5/K5_notebook.pdf': 'files/docs/sub-K5/sub-05-22-2018-K5_K5 notebook_pdf.pdf',
-            'files/docs/sub-J6/J6_Notebook.pdf': 'files/docs/sub-J6/sub-06-11-2018-J6_J6 Notebook_pdf.pdf',
-            'files/docs/sub-J4/J4_Notebook.pdf': 'files/docs/sub-J4/sub-04-03-2018-J4_J4 Notebook_pdf.pdf',
-            'files/docs/sub-K10/K10_Notebook.pdf': 'files/docs/sub-K10/sub-07-31-2018-K10_K10 Notebook_pdf.pdf',
-            'files/docs/sub-I10/I10_Notebook.pdf': 'files/docs/sub-I10/sub-08-13-2018-I10_I10 Notebook_pdf.pdf',
-            'files/docs/sub-K9/K9_Notebook.pdf': 'files/docs/sub-K9/sub-07-18-2018-K9_K9 Notebook_pdf.pdf',
-            'files/docs/sub-L1/L1_Notebook.pdf': 'files/docs/sub-L1/sub-04-05-2018-L1_L1 Notebook_pdf.pdf',
-            'files/docs/sub-I5/I5_Notebook.pdf': 'files/docs/sub-I5/sub-05-15-2018-I5_I5 Notebook_pdf.pdf',
-            'files/docs/sub-K4/K4_Notebook.pdf': 'files/docs/sub-K4/sub-03-29-2018-K4_K4 Notebook_pdf.pdf',
-            'files/docs/sub-L2/L2_Notebook.pdf': 'files/docs/sub-L2/sub-05-30-2018-L2_L2 Notebook_pdf.pdf',
-            'files/docs/sub-J3/J3_Notebook.pdf': 'files/docs/sub-J3/sub-03-26-2018-J3_J3 Notebook_pdf.pdf',
-            'files/docs/sub-I6/I6_Notebook.pdf': 'files/docs/sub-I6/sub-06-06-2018-I6_I6 Notebook_pdf.pdf',
-            'files/docs/sub-L4/L4_Notebook.pdf': 'files/docs/sub-L4/sub-11-15-2018-L4_L4 Notebook_pdf.pdf',
-            'files/docs/sub-K8/K8_Notebook.pdf': 'files/docs/sub-K8/sub-06-29-2018-K8_K8 Notebook_pdf.pdf',
-            'files/docs/sub-J2/J2_Notebook.pdf': 'files/docs/sub-J2/sub-03-09-2018-J2_J2 Notebook_pdf.pdf',
-            'files/docs/sub-J1/J1_Notebook.pdf': 'files/docs/sub-J1/sub-03-01-2018-J1_J1 Notebook_pdf.pdf',
-            'files/docs/sub-J9/J9_Notebook.pdf': 'files/docs/sub-J9/sub-07-25-2018-J9_J9 Notebook_pdf.pdf',
-            'files/docs/sub-K6/K6_Notebook.pdf': 'files/docs/sub-K6/sub-06-05-2018-K6_K6 Notebook_pdf.pdf',
-            'files/docs/sub-J8/J8_Notebook.pdf': 'files/docs/sub-J8/sub-07-11-2018-J8_J8 Notebook_pdf.pdf',
-            'files/docs/sub-I7/I7_Notebook.pdf': 'files/docs/sub-I7/sub-07-10-2018-I7_I7 Notebook_pdf.pdf',
-            'files/docs/sub-J5/J5_Notebook.pdf': 'files/docs/sub-J5/sub-05-23-2018-J5_J5 Notebook_pdf.pdf',
-            'files/docs/sub-I3/I3_Notebook.pdf': 'files/docs/sub-I3/sub-03-14-2018-I3_I3 Notebook_pdf.pdf',
-            'files/docs/sub-I4/I4_Notebook.pdf': 'files/docs/sub-I4/sub-03-28-2018-I4_I4 Notebook_pdf.pdf',
-            'files/docs/sub-K7/K7_Notebook.pdf': 'files/docs/sub-K7/sub-06-25-2018-K7_K7 Notebook_pdf.pdf',
-            'files/docs/sub-I1/I1_Notebook.pdf': 'files/docs/sub-I1/sub-02-22-2018-I1_I1 Notebook_pdf.pdf',
-            'files/docs/sub-L3/L3_Notebook.pdf': 'files/docs/sub-L3/sub-11-16-2018-L3_L3 Notebook_pdf.pdf',
-            'files/docs/sub-I8/I8_Notebook.pdf': 'files/docs/sub-I8/sub-07-17-2018-I8_I8 Notebook_pdf.pdf',
-            'files/docs/sub-K3/K3_Notebook.pdf': 'files/docs/sub-K3/sub-03-27-2018-K3_K3 Notebook_pdf.pdf',
-            'files/primary/sub-20191112P_1/sam-20191112P_1_dC/manifest_4_dC_scRNAseq.xlsx': 'files/primary/sub-20191112P_1/sam-20191112P_1_dC/manifest.xlsx',
-            'files/primary/sub-20191112P_1/sam-20191112P_1_tC/manifest_4_dC_scRNAseq.xlsx': 'files/primary/sub-20191112P_1/sam-20191112P_1_tC/manifest.xlsx',
-            'files/primary/sub-20190807P_1/sam-20190807P_1_pC/manifest_2_pC_scRNAseq.xlsx': 'files/primary/sub-20190807P_1/sam-20190807P_1_pC/manifest.xlsx',
-            'files/derivative/sub-20191112P_1/sam-20191112P_1_dC/20191112P_dC_filtered_feature_bc_matrix/manifest_dC_derv.xlsx': 'files/derivative/sub-20191112P_1/sam-20191112P_1_dC/20191112P_dC_filtered_feature_bc_matrix/manifest.xlsx',
-            'files/primary/sub-20190807P_1ACT/sam-20190807P_1_pC_ActD/manifest_1_ActD_for_cell_dissociation.xlsx': 'files/primary/sub-20190807P_1ACT/sam-20190807P_1_pC_ActD/manifest.xlsx',
-            'files/docs/ActD_treatment_RNA_quality_pc_0807.pdf': 'files/docs/ActD treatment RNA quality pc_0807.pdf',
-            'files/docs/10x_Genomics_cDNA_library_quality_tc1112_F9_dc1112_G9.pdf': 'files/docs/10x Genomics cDNA library quality tc1112_F9_dc1112_G9.pdf',
-            'files/docs/10x_Genomics_cDNA_library_quality_pc_0807.pdf': 'files/docs/10x Genomics cDNA library quality pc_0807.pdf',
-            'files/docs/Derivative_file.pptx': 'files/docs/Derivative file.pptx',
-            'files/docs/FACS_live_cell_collection_pc_0807.pdf': 'files/docs/FACS live_cell_collection_pc_0807.pdf',
-            'files/docs/FACS_live_cell_collection_tc_dc_1112.pdf': 'files/docs/FACS live_cell_collection_tc_dc_1112.pdf',
-            'files/protocol/RNA_extraction_using_Trizol_method_Protocol.docx': 'files/protocol/RNA extraction using Trizol method_Protocol.docx',
-            'files/docs/3D_Slicer_Segmentation_Instructions.docx': 'files/docs/3D Slicer Segmentation Instructions.docx',
-            'files/docs/Iodine_Stomach.jpg': 'files/docs/Iodine Stomach.jpg', 'files/README.xlsx': 'files/README (1).xlsx', 'files/code/beeswarm': 'files/code/beeswarm.m',
-            'files/derivative/sub-13/sam-3/sub-13_sam-3_P13-3MergeMask.xml': 'files/derivative/sub-13/sam-3/sub-13_sam-3_P13-3MergeMask (1).xml',
-            'files/derivative/sub-13/sam-1/sub-13_sam-1_P13-1MergeMask.xml': 'files/derivative/sub-13/sam-1/sub-13_sam-1_P13-1MergeMask (1).xml',
-            'files/derivative/sub-12/sam-1/sub-12_sam-1_P12-1MergeMask.xml': 'files/derivative/sub-12/sam-1/sub-12_sam-1_P12-1MergeMask (1).xml',
-            'files/derivative/sub-14/sam-3/sub-14_sam-3_P14-3MergeMask.xml': 'files/derivative/sub-14/sam-3/sub-14_sam-3_P14-3MergeMask (1).xml',
-            'files/derivative/sub-14/sam-2/sub-14_sam-2_P14-2MergeMask.xml': 'files/derivative/sub-14/sam-2/sub-14_sam-2_P14-2MergeMask (1).xml',
-            'files/derivative/sub-15/sam-2/sub-15_sam-2_P15-2MergeMask.xml': 'files/derivative/sub-15/sam-2/sub-15_sam-2_P15-2MergeMask (1).xml',
-            'files/primary/Pig47/Primary Analytics Cardiac EP/Stellate_LSS.JNB': 'files/primary/Pig47/Primary Analytics Cardiac EP/Stellate LSS.JNB',
-            'files/primary/Pig47/Primary Analytics Cardiac EP/Stellate_RSS.JNB': 'files/primary/Pig47/Primary Analytics Cardiac EP/Stellate RSS.JNB',
-            'files/primary/Pig-820/In Vivo Nodose Neural Recording/Pig-820_Nodose-002.mat': 'files/primary/Pig-820/In Vivo Nodose Neural Recording/Pig-820_Nodose-002 (1).mat',
-            'files/primary/Pig47/Primary Analytics Cardiac EP/Stellate_EP_analytics_Rt_vs_Lt.xlsx': 'files/primary/Pig47/Primary Analytics Cardiac EP/Stellate EP analytics Rt vs Lt.xlsx',
-            'files/primary/Pig47/Primary Analytics Cardiac EP/Stellate_RSS.tif': 'files/primary/Pig47/Primary Analytics Cardiac EP/Stellate RSS.tif',
-            'files/primary/Pig47/Polar Maps/BL_LSG_RSG_RT_Sync.tiff': 'files/primary/Pig47/Polar Maps/BL LSG RSG RT Sync.tiff',
-            'files/primary/Pig47/Primary Analytics Cardiac EP/Stellate_LSS.tif': 'files/primary/Pig47/Primary Analytics Cardiac EP/Stellate LSS.tif',
-            'files/primary/Pig47/Raw Data/Sample_unipolar_EP_to_stellate_stim.tif': 'files/primary/Pig47/Raw Data/Sample unipolar EP to stellate stim.tif',
-            'files/primary/Pig47/Polar Maps/BL_LSG_RSG_ARI_Sync.tiff': 'files/primary/Pig47/Polar Maps/BL LSG RSG ARI Sync.tiff',
-            'files/primary/Pig47/Polar Maps/BL_LSG_RSG_AT_Sync.tiff': 'files/primary/Pig47/Polar Maps/BL LSG RSG AT Sync.tiff',
-            'files/docs/SPARC_DATA_UPLOAD_Slide_deck.pptx': 'files/docs/SPARC DATA UPLOAD Slide deck.pptx',
-            'files/primary/Pig47/Electrode Spatial registration/Cardiac_EP_electrode_registration.jpg': 'files/primary/Pig47/Electrode Spatial registration/Cardiac EP electrode registration.jpg',
-            'files/primary/Pig47/Raw Data/Raw_data_Stellate_stimulations.xlsx': 'files/primary/Pig47/Raw Data/Raw data Stellate stimulations.xlsx',
-            'files/docs/CardioNeuronal_Recordings.tiff': 'files/docs/CardioNeuronal Recordings.tiff', 'files/dataset_description (14).xlsx': 'files/dataset_description.xlsx',
-            'files/primary/20180111P/20180111P_pC/20180111P__pC_OSP_1.2_PGP_9.5-NF_10X.lsm': 'files/primary/20180111P/20180111P_pC/20180111P_ pC_OSP_1.2_PGP 9.5-NF_10X.lsm',
-            'files/primary/20180131M_2/20180131M_2_pC/20180131M_2.2_pC__nNos_NF_10x.lsm': 'files/primary/20180131M_2/20180131M_2_pC/20180131M_2.2_pC_ nNos_NF_10x.lsm',
-            'files/primary/20180131M_2/20180131M_2_dC/20180131M_2.1_dC__nNos_NF_10x.lsm': 'files/primary/20180131M_2/20180131M_2_dC/20180131M_2.1_dC_ nNos_NF_10x.lsm',
-            'files/primary/20180131M_2/20180131M_2_pC/20180131M_2.1_pC__nNos_NF_10x.lsm': 'files/primary/20180131M_2/20180131M_2_pC/20180131M_2.1_pC_ nNos_NF_10x.lsm',
-            'files/primary/20171129P/20171129P_pC/20171129P-pC-1.2_ISP__PGP9.5_10x.lsm': 'files/primary/20171129P/20171129P_pC/20171129P-pC-1.2_ISP_ PGP9.5_10x.lsm',
-            'files/primary/20180111P/20180111P_pC/manifest_11.xlsx': 'files/primary/20180111P/20180111P_pC/manifest.xlsx',
-            'files/primary/20180111P/20180111P_pC/20180111P__pC_afterclarity_IMG_2862.jpg': 'files/primary/20180111P/20180111P_pC/20180111P_ pC_afterclarity_IMG_2862.jpg',
-            'files/primary/20180131M_1/20180131M_1_pC/manifest_6.xlsx': 'files/primary/20180131M_1/20180131M_1_pC/manifest.xlsx',
-            'files/primary/20180111P/20180111P_pC/20180111P__pC_beforeclarity.IMG.jpg': 'files/primary/20180111P/20180111P_pC/20180111P_ pC_beforeclarity.IMG.jpg',
-            'files/primary/20171122P/20171122P_pC/manifest_10.xlsx': 'files/primary/20171122P/20171122P_pC/manifest.xlsx',
-            'files/primary/20180131M_1/20180131M_1_pC/20180131M_1.1_pC_before_clarity_IMG_1691.jpg': 'files/primary/20180131M_1/20180131M_1_pC/20180131M_1.1_pC_before clarity_IMG_1691.jpg',
-            'files/primary/20180131M_1/20180131M_1_dC/manifest_5.xlsx': 'files/primary/20180131M_1/20180131M_1_dC/manifest.xlsx',
-            'files/primary/20180131M_2/20180131M_2_pC/manifest_8.xlsx': 'files/primary/20180131M_2/20180131M_2_pC/manifest.xlsx',
-            'files/primary/20180131M_2/20180131M_2_dC/manifest_7.xlsx': 'files/primary/20180131M_2/20180131M_2_dC/manifest.xlsx',
-            'files/primary/20171107M_1/20171107M_1_dC/cro_20171107M_1.1_pC_PGP9.5_10x_2018-02-08T10-04-58.774.tif': 'files/primary/20171107M_1/20171107M_1_dC/cro 20171107M_1.1_pC_PGP9.5_10x_2018-02-08T10-04-58.774.tif',
-            'files/primary/20171107M_1/20171107M_1_dC/cro_20171107M_1.1_dC_PGP9.5_10x_2018-02-08T10-12-35.586.tif': 'files/primary/20171107M_1/20171107M_1_dC/cro 20171107M_1.1_dC_PGP9.5_10x_2018-02-08T10-12-35.586.tif',
-            'files/primary/20180131M_1/20180131M_1_pC/20180131M_1.3_pC_after_clarity_IMG_0629.jpg': 'files/primary/20180131M_1/20180131M_1_pC/20180131M_1.3_pC_after clarity_IMG_0629.jpg',
-            'files/primary/20171107M_1/20171107M_1_pC/20171107M_1.1_pC-after_clarity_IMG_0629.jpg': 'files/primary/20171107M_1/20171107M_1_pC/20171107M_1.1_pC-after clarity_IMG_0629.jpg',
-            'files/primary/20171107M_1/20171107M_1_dC/cro_20171107M_1.1_dC_PGP9.5_10x_2018-02-08T10-41-00.118.tif': 'files/primary/20171107M_1/20171107M_1_dC/cro 20171107M_1.1_dC_PGP9.5_10x_2018-02-08T10-41-00.118.tif',
-            'files/primary/20171107M_1/20171107M_1_dC/cro_20171107M_1.1_dC_PGP9.5_10x_2018-02-08T10-15-54.417.tif': 'files/primary/20171107M_1/20171107M_1_dC/cro 20171107M_1.1_dC_PGP9.5_10x_2018-02-08T10-15-54.417.tif',
-            'files/primary/20171107M_1/20171107M_1_pC/cro_20171107M_1.1_pC_PGP9.5_10x_2018-02-08T10-04-58.774.tif': 'files/primary/20171107M_1/20171107M_1_pC/cro 20171107M_1.1_pC_PGP9.5_10x_2018-02-08T10-04-58.774.tif',
-            'files/primary/20171107M_1/20171107M_1_pC/manifest_2.xlsx': 'files/primary/20171107M_1/20171107M_1_pC/manifest.xlsx',
-            'files/primary/20171107M_1/20171107M_1_pC/20171107M_1.1_pC-before_clarity_IMG_1691.jpg': 'files/primary/20171107M_1/20171107M_1_pC/20171107M_1.1_pC-before clarity_IMG_1691.jpg',
-            'files/primary/20171107M_2/20171107M_2_dC/manifest_3.xlsx': 'files/primary/20171107M_2/20171107M_2_dC/manifest.xlsx',
-            'files/primary/20171129P/20171129P_pC/manifest_9.xlsx': 'files/primary/20171129P/20171129P_pC/manifest.xlsx',
-            'files/primary/20171107M_2/20171107M_2_pC/manifest_4.xlsx': 'files/primary/20171107M_2/20171107M_2_pC/manifest.xlsx',
-            'files/primary/20171107M_2/20171107M_2_pC/cro_20171107M_2.1_pC_NF_10x_2018-02-08T10-45-08.499.tif': 'files/primary/20171107M_2/20171107M_2_pC/cro 20171107M_2.1_pC_NF_10x_2018-02-08T10-45-08.499 (1).tif',
-            'files/derivative/20180111P/20180111P_pC/20180111P__pC_OSP_1.2_PGP_9.5-NF_10X.lsm.jpx': 'files/derivative/20180111P/20180111P_pC/20180111P_ pC_OSP_1.2_PGP 9.5-NF_10X.lsm.jpx',
-            'files/derivative/20180131M_2/20180131M_2_pC/20180131M_2.2_pC__nNos_NF_10x.lsm.jpx': 'files/derivative/20180131M_2/20180131M_2_pC/20180131M_2.2_pC_ nNos_NF_10x.lsm.jpx',
-            'files/derivative/20180131M_2/20180131M_2_pC/20180131M_2.1_pC__nNos_NF_10x.lsm.jpx': 'files/derivative/20180131M_2/20180131M_2_pC/20180131M_2.1_pC_ nNos_NF_10x.lsm.jpx',
-            'files/derivative/20180131M_2/20180131M_2_dC/20180131M_2.1_dC__nNos_NF_10x.lsm.jpx': 'files/derivative/20180131M_2/20180131M_2_dC/20180131M_2.1_dC_ nNos_NF_10x.lsm.jpx',
-            'files/derivative/20171129P/20171129_pC/20171129P-pC-1.2_ISP__PGP9.5_10x.lsm.jpx': 'files/derivative/20171129P/20171129_pC/20171129P-pC-1.2_ISP_ PGP9.5_10x.lsm.jpx',
-            'files/docs/Videos_2-1.pptx': 'files/docs/Videos 2-1.pptx', 'files/docs/Figures_2-2.pptx': 'files/docs/Figures 2-2.pptx',
-            'files/docs/Methods_and_Results_2.docx': 'files/docs/Methods and Results_2.docx', 'files/docs/Figures_1-2.pptx': 'files/docs/Figures 1-2.pptx',
-            'files/docs/Figures_1-1.pptx': 'files/docs/Figures 1-1.pptx', 'files/docs/Dataset_element.docx': 'files/docs/Dataset element (1).docx',
-            'files/docs/Methods_and_Results_1.docx': 'files/docs/Methods and Results_1.docx', 'files/docs/manifest_derivatives.xlsx': 'files/docs/manifest.xlsx',
-            'files/docs/Figures_2-1.pptx': 'files/docs/Figures 2-1.pptx', 'files/docs/Videos_1-1.pptx': 'files/docs/Videos 1-1.pptx',
-            'files/primary/sub-54-6/TJU_3Scan_RatHeart_54-6.jpx': 'files/primary/sub-54-6/TJU_3Scan_ratheart_54-6.jpx',
-            'files/primary/sub-54-11/TJU_3Scan_ratheart54-11.1.jpx': 'files/primary/sub-54-11/TJU_3Scan_ratheart_54-11.jpx',
-            'files/derivative/sub-54-14/F54-14_05_14_2020.xml': 'files/derivative/sub-54-14/F54-14_05_14_2020_Final.xml',
-            'files/primary/sub-PR1643/pool-1/PR1643_736-G-4.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_736-G-4.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_736-G-3.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_736-G-3.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_808-G-5.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_808-G-5.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_664-G-5.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_664-G-5.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_638-G-4.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_638-G-4.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_502-G-5.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_502-G-5.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_832-G-2.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_832-G-2.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_784-G-1.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_784-G-1.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_672-G-1.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_672-G-1.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_764-G-5.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_764-G-5.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_776-G-5.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_776-G-5.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_852-G-1.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_852-G-1.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_594-G-1.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_594-G-1.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_534-G-2.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_534-G-2.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_712-G-1.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_712-G-1.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_656-G-4.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_656-G-4.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_570-G-4.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_570-G-4.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_720-G-4.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_720-G-4.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_744-G-1.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_744-G-1.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_728-G-6.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_728-G-6.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_712-G-3.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_712-G-3.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_776-G-1.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_776-G-1.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_514-G-2.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_514-G-2.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_672-G-2.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_672-G-2.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_502-G-6.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_502-G-6.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_764-G-2.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_764-G-2.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_744-G-3.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_744-G-3.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_696-G-1.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_696-G-1.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_804-G-4.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_804-G-4.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_720-G-1.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_720-G-1.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_784-G-4.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_784-G-4.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_672-G-4.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_672-G-4.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_728-G-7.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_728-G-7.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_646-G-5.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_646-G-5.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_696-G-4.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_696-G-4.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_570-G-5.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_570-G-5.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_570-G-1.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_570-G-1.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_736-G-1.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_736-G-1.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_534-G-1.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_534-G-1.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_744-G-4.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_744-G-4.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_728-G-4.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_728-G-4.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_646-G-3.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_646-G-3.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_638-G-3.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_638-G-3.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_618-G-4.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_618-G-4.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_578-G-4.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_578-G-4.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_720-G-5.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_720-G-5.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_534-G-4.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_534-G-4.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_594-G-2.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_594-G-2.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_804-G-1.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_804-G-1.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_720-G-3.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_720-G-3.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_502-G-4.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_502-G-4.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_764-G-3.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_764-G-3.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_664-G-1.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_664-G-1.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_630-G-2.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_630-G-2.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_578-G-6.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_578-G-6.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_684-G-4.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_684-G-4.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_764-G-1.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_764-G-1.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_578-G-1.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_578-G-1.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_784-G-3.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_784-G-3.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_784-G-2.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_784-G-2.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_502-G-1.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_502-G-1.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_696-G-2.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_696-G-2.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_852-G-5.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_852-G-5.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_696-G-5.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_696-G-5.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_630-G-1.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_630-G-1.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_618-G-1.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_618-G-1.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_832-G-4.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_832-G-4.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_704-G-5.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_704-G-5.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_804-G-5.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_804-G-5.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_696-G-3.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_696-G-3.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_764-G-4.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_764-G-4.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_656-G-1.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_656-G-1.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_756-G-3.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_756-G-3.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_776-G-2.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_776-G-2.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_704-G-1.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_704-G-1.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_646-G-4.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_646-G-4.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_808-G-3.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_808-G-3.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_684-G-3.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_684-G-3.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_656-G-2.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_656-G-2.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_728-G-1.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_728-G-1.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_804-G-3.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_804-G-3.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_514-G-1.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_514-G-1.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_570-G-2.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_570-G-2.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_776-G-4.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_776-G-4.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_578-G-2.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_578-G-2.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_832-G-1.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_832-G-1.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_638-G-2.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_638-G-2.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_664-G-2.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_664-G-2.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_728-G-3.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_728-G-3.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_672-G-5.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_672-G-5.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_808-G-4.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_808-G-4.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_594-G-5.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_594-G-5.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_852-G-4.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_852-G-4.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_514-G-4.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_514-G-4.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_808-G-1.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_808-G-1.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_756-G-2.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_756-G-2.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_832-G-5.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_832-G-5.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_578-G-3.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_578-G-3.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_712-G-2.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_712-G-2.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_776-G-3.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_776-G-3.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_618-G-5.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_618-G-5.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_728-G-2.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_728-G-2.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_638-G-5.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_638-G-5.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_664-G-3.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_664-G-3.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_852-G-6.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_852-G-6.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_502-G-2.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_502-G-2.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_852-G-3.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_852-G-3.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_646-G-1.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_646-G-1.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_638-G-1.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_638-G-1.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_704-G-3.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_704-G-3.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_514-G-3.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_514-G-3.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_594-G-3.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_594-G-3.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_570-G-3.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_570-G-3.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_784-G-5.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_784-G-5.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_502-G-3.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_502-G-3.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_744-G-5.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_744-G-5.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_594-G-4.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_594-G-4.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_808-G-2.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_808-G-2.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_784-G-6.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_784-G-6.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_618-G-3.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_618-G-3.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_684-G-1.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_684-G-1.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_534-G-3.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_534-G-3.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_664-G-4.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_664-G-4.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_736-G-5.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_736-G-5.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_720-G-2.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_720-G-2.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_646-G-2.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_646-G-2.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_684-G-2.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_684-G-2.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_514-G-5.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_514-G-5.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_704-G-4.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_704-G-4.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_704-G-2.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_704-G-2.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_578-G-5.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_578-G-5.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_832-G-3.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_832-G-3.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_744-G-6.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_744-G-6.sam',
-            'files/primary/sub-PR1643/pool-1/PR1643_804-G-2.sam.bam': 'files/primary/sub-PR1643/pool-1/PR1643_804-G-2.sam',
-            'files/derivative/derivates_manifest.xlsx': 'files/derivative/manifest.xlsx',
-            'files/primary/sub-10/sam-1/sub-10sam-1P10-1Slide2p3MT10x.nd2': 'files/primary/sub-10/sam-1/sub-10sam-1P10-1Slide2p3MT10x (1).nd2',
-            'files/primary/sub-10/sam-2/microscopy/sub-10sam-2P10-2Slide2p1MT10x.tif': 'files/primary/sub-10/sam-2/microscopy/sub-10sam-2P10-2Slide2p1MT10x (1).tif',
-            'files/primary/sub-6/sam-7/microscopy/sub-6sam-7P6-7Slide2p3_10x.tif': 'files/primary/sub-6/sam-7/microscopy/sub-6sam-7P6-7Slide2p3_10x (1).tif',
-            'files/primary/sub-6/sam-3/microscopy/sub-6sam-3P6-3Slide2p3_10x.nd2': 'files/primary/sub-6/sam-3/microscopy/sub-6sam-3P6-3Slide2p3_10x (1).nd2',
-            'files/primary/sub-6/sam-5/microscopy/sub-6sam-5P6-5Slide2p1_10x.tif': 'files/primary/sub-6/sam-5/microscopy/sub-6sam-5P6-5Slide2p1_10x (1).tif',
-            'files/primary/sub-10/sam-4/microscopy/sub-10sam-4P10-4Slide2p2MT10x.nd2': 'files/primary/sub-10/sam-4/microscopy/sub-10sam-4P10-4Slide2p2MT10x (1).nd2',
-            'files/primary/sub-6/sam-1/microscopy/sub-6sam-1P6-1Slide2p3_10x.tif': 'files/primary/sub-6/sam-1/microscopy/sub-6sam-1P6-1Slide2p3_10x (1).tif',
-            'files/primary/sub-13/sam-3/microscopy/sub-13sam-3P13-3Slide2P3_10x.nd2': 'files/primary/sub-13/sam-3/microscopy/sub-13sam-3P13-3Slide2P3_10x (1).nd2',
-            'files/primary/sub-13/sam-2/microscopy/sub-13sam-2P13-2Slide2P2_10x.tif': 'files/primary/sub-13/sam-2/microscopy/sub-13sam-2P13-2Slide2P2_10x (1).tif',
-            'files/primary/sub-13/sam-4/microscopy/sub-13sam-4P13-4Slide14P2_10x.tif': 'files/primary/sub-13/sam-4/microscopy/sub-13sam-4P13-4Slide14P2_10x (1).tif',
-            'files/primary/sub-12/sam-1/microscopy/sub-12sam-1P12-1Slide2P1_10x.tif': 'files/primary/sub-12/sam-1/microscopy/sub-12sam-1P12-1Slide2P1_10x (1).tif',
-            'files/primary/sub-12/sam-3/microscopy/sub-12sam-3P12-3Slide2P2_10x.tif': 'files/primary/sub-12/sam-3/microscopy/sub-12sam-3P12-3Slide2P2_10x (1).tif',
-            'files/primary/sub-12/sam-2/microscopy/sub-12sam-2P12-2Slide2P3_10x.nd2': 'files/primary/sub-12/sam-2/microscopy/sub-12sam-2P12-2Slide2P3_10x (1).nd2',
-            'files/primary/sub-12/sam-4/microscopy/sub-12sam-4P12-4Slide2P1_10x.tif': 'files/primary/sub-12/sam-4/microscopy/sub-12sam-4P12-4Slide2P1_10x (1).tif',
-            'files/primary/sub-9/sam-3/microscopy/sub-9sam-3P9-3Slide2p3MT10x.tif': 'files/primary/sub-9/sam-3/microscopy/sub-9sam-3P9-3Slide2p3MT10x (1).tif',
-            'files/primary/sub-9/sam-1/microscopy/sub-9sam-1P9-1Slide2p2MT10x.nd2': 'files/primary/sub-9/sam-1/microscopy/sub-9sam-1P9-1Slide2p2MT10x (1).nd2',
-            'files/primary/sub-9/sam-2/microscopy/sub-9sam-2P9-2Slide2p3MT10x.nd2': 'files/primary/sub-9/sam-2/microscopy/sub-9sam-2P9-2Slide2p3MT10x (1).nd2',
-            'files/primary/sub-14/sam-3/microscopy/sub-14sam-3P14-3Slide2P3MT10x.tif': 'files/primary/sub-14/sam-3/microscopy/sub-14sam-3P14-3Slide2P3MT10x (1).tif',
-            'files/primary/sub-9/sam-4/microscopy/sub-9sam-4P9-4Slide2p4MT10x.tif': 'files/primary/sub-9/sam-4/microscopy/sub-9sam-4P9-4Slide2p4MT10x (1).tif',
-            'files/primary/sub-14/sam-1/microscopy/sub-14sam-1P14-1Slide14P2MT10x.tif': 'files/primary/sub-14/sam-1/microscopy/sub-14sam-1P14-1Slide14P2MT10x (1).tif',
-            'files/primary/sub-14/sam-2/microscopy/sub-14sam-2P14-2Slide2P1MT10x.tif': 'files/primary/sub-14/sam-2/microscopy/sub-14sam-2P14-2Slide2P1MT10x (1).tif',
-            'files/primary/sub-7/sam-5/microscopy/sub-7sam-5P7-5Slide2p1_10x.tif': 'files/primary/sub-7/sam-5/microscopy/sub-7sam-5P7-5Slide2p1_10x (1).tif',
-            'files/primary/sub-14/sam-4/microscopy/sub-14sam-4P14-4Slide2P3MT10x.tif': 'files/primary/sub-14/sam-4/microscopy/sub-14sam-4P14-4Slide2P3MT10x (1).tif',
-            'files/primary/sub-15/sam-1/microscopy/sub-15sam-1P15-1Slide2P3MT10x.tif': 'files/primary/sub-15/sam-1/microscopy/sub-15sam-1P15-1Slide2P3MT10x (1).tif',
-            'files/primary/sub-7/sam-1/microscopy/sub-7sam-1P7-1Slide2p3_10x.tif': 'files/primary/sub-7/sam-1/microscopy/sub-7sam-1P7-1Slide2p3_10x (1).tif',
-            'files/primary/sub-15/sam-2/microscopy/sub-15sam-2P15-2Slide2P2MT10x.tif': 'files/primary/sub-15/sam-2/microscopy/sub-15sam-2P15-2Slide2P2MT10x (1).tif',
-            'files/primary/sub-15/sam-4/microscopy/sub-15sam-4P15-4Slide2P3MT10x.nd2': 'files/primary/sub-15/sam-4/microscopy/sub-15sam-4P15-4Slide2P3MT10x (1).nd2',
-            'files/primary/sub-11/sam-1/microscopy/sub-11sam-1P11-1Slide2P1_10x.tif': 'files/primary/sub-11/sam-1/microscopy/sub-11sam-1P11-1Slide2P1_10x (1).tif',
-            'files/primary/sub-11/sam-3/microscopy/sub-11sam-3P11-3Slide2P1_10x.tif': 'files/primary/sub-11/sam-3/microscopy/sub-11sam-3P11-3Slide2P1_10x (1).tif',
-            'files/primary/sub-11/sam-4/microscopy/sub-11sam-4P11-4Slide2P1_10x.nd2': 'files/primary/sub-11/sam-4/microscopy/sub-11sam-4P11-4Slide2P1_10x (1).nd2',
-            'files/primary/sub-8/sam-5/microscopy/sub-8sam-5P8-5Slide2p3_10x.tif': 'files/primary/sub-8/sam-5/microscopy/sub-8sam-5P8-5Slide2p3_10x (1).tif',
-            'files/primary/sub-11/sam-2/microscopy/sub-11sam-2P11-2Slide14P1_10x.tif': 'files/primary/sub-11/sam-2/microscopy/sub-11sam-2P11-2Slide14P1_10x (1).tif',
-            'files/primary/sub-8/sam-7/microscopy/sub-8sam-7P8-7Slide2p1_10x.tif': 'files/primary/sub-8/sam-7/microscopy/sub-8sam-7P8-7Slide2p1_10x (1).tif',
-            'files/primary/sub-8/sam-3/microscopy/sub-8sam-3P8-3Slide2p4_10x.nd2': 'files/primary/sub-8/sam-3/microscopy/sub-8sam-3P8-3Slide2p4_10x (1).nd2',
-            'files/primary/sub-8/sam-1/microscopy/sub-8sam-1P8-1Slide2p3_10x.tif': 'files/primary/sub-8/sam-1/microscopy/sub-8sam-1P8-1Slide2p3_10x (1).tif',
-            'files/primary/sub-4/sam-2/microscopy/sub-4sam-2P4-2Slide2p2_10x.tif': 'files/primary/sub-4/sam-2/microscopy/sub-4sam-2P4-2Slide2p2_10x (1).tif',
-            'files/primary/sub-4/sam-3/microscopy/sub-4sam-3P4-3Slide2p1_10x.tif': 'files/primary/sub-4/sam-3/microscopy/sub-4sam-3P4-3Slide2p1_10x (1).tif',
-            'files/primary/sub-5/sam-3/microscopy/sub-5sam-3P5-3Slide2p1_10x.nd2': 'files/primary/sub-5/sam-3/microscopy/sub-5sam-3P5-3Slide2p1_10x (1).nd2',
-            'files/primary/sub-4/sam-4/microscopy/sub-4sam-4P4-4Slide2P1MT10x.tif': 'files/primary/sub-4/sam-4/microscopy/sub-4sam-4P4-4Slide2P1MT10x (1).tif',
-            'files/primary/sub-5/sam-1/microscopy/sub-5sam-1P5-1Slide2p2_10x.tif': 'files/primary/sub-5/sam-1/microscopy/sub-5sam-1P5-1Slide2p2_10x (1).tif',
-            'files/primary/sub-5/sam-2/microscopy/sub-5sam-2P5-2Slide2p3_10x.tif': 'files/primary/sub-5/sam-2/microscopy/sub-5sam-2P5-2Slide2p3_10x (1).tif',
-            'files/primary/sub-5/sam-4/microscopy/sub-5sam-4P5-4Slide2p3_10x.tif': 'files/primary/sub-5/sam-4/microscopy/sub-5sam-4P5-4Slide2p3_10x (1).tif',
-            'files/protocol/Surgery_AAV6 injection into iBAT_Protocol.io.docx': 'files/protocol/Surgery_AAV6 injection into iBAT_Protocol.io',
-            'files/protocol/Surgery_unilateral viral injection into iBAT_Protocol.io.docx': 'files/protocol/Surgery_unilateral viral injection into iBAT_Protocol.io',
-            'files/primary/sub-148/perf-T12-stim_10Hz_continuous_afferent/sub-148_T12_10Hz_continuous_afferent.S2R': 'files/primary/sub-148/perf-T12-stim_10Hz_continuous_afferent/sub-148_T12_10Hz_continuous_afferent_manometry.S2R',
-            'files/primary/sub-144/perf-L1-stim_30Hz_PT_afferent-efferent/sub-144_L1_30Hz_PT_afferent%2Befferent.S2R': 'files/primary/sub-144/perf-L1-stim_30Hz_PT_afferent-efferent/sub-144_L1_30Hz_PT_afferent%2Befferent_manometry.S2R',
-            'files/primary/sub-148/perf-T12-stim_30Hz_PT_afferent/sub-148_T12_30Hz_PT_afferent.S2R': 'files/primary/sub-148/perf-T12-stim_30Hz_PT_afferent/sub-148_T12_30Hz_PT_afferent_manometry.S2R',
-            'files/primary/sub-144/perf-T12-stim_30Hz_PT_afferent-efferent/sub-144_T12_30Hz_PT_afferent%2Befferent.S2R': 'files/primary/sub-144/perf-T12-stim_30Hz_PT_afferent-efferent/sub-144_T12_30Hz_PT_afferent%2Befferent_manometry.S2R',
-            'files/primary/sub-146/perf-L1-stim_30Hz_PT_afferent-efferent/sub-146_L1_30Hz_PT_afferent%2Befferent.S2R': 'files/primary/sub-146/perf-L1-stim_30Hz_PT_afferent-efferent/sub-146_L1_30Hz_PT_afferent%2Befferent_manometry.S2R',
-            'files/primary/sub-144/perf-L1-stim_10Hz_continuous_afferent-efferent/sub-144_L1_10Hz_continuous_afferent%2Befferent.S2R': 'files/primary/sub-144/perf-L1-stim_10Hz_continuous_afferent-efferent/sub-144_L1_10Hz_continuous_afferent%2Befferent_manometry.S2R',
-            'files/primary/sub-146/perf-L1-stim_10Hz_continuous_afferent-efferent/sub-146_L1_10Hz_continuous_afferent%2Befferent.S2R': 'files/primary/sub-146/perf-L1-stim_10Hz_continuous_afferent-efferent/sub-146_L1_10Hz_continuous_afferent%2Befferent_manometry.S2R',
-            'files/primary/sub-144/perf-L1-stim_30Hz_PT_afferent/sub-144_L1_30Hz_PT_afferent.S2R': 'files/primary/sub-144/perf-L1-stim_30Hz_PT_afferent/sub-144_L1_30Hz_PT_afferent_manometry.S2R',
-            'files/primary/sub-145/perf-L1-stim_10Hz_continuous_afferent-efferent/sub-145_L1_10Hz_continuous_afferent%2Befferent.S2R': 'files/primary/sub-145/perf-L1-stim_10Hz_continuous_afferent-efferent/sub-145_L1_10Hz_continuous_afferent%2Befferent_manometry.S2R',
-            'files/primary/sub-145/perf-L1-stim_30Hz_PT_afferent-efferent/sub-145_L1_30Hz_PT_afferent%2Befferent.S2R': 'files/primary/sub-145/perf-L1-stim_30Hz_PT_afferent-efferent/sub-145_L1_30Hz_PT_afferent%2Befferent_manometry.S2R',
-            'files/primary/sub-150/perf-L1-stim_10Hz_continuous_afferent-efferent/sub-150_L1_10Hz_continuous_afferent%2Befferent.S2R': 'files/primary/sub-150/perf-L1-stim_10Hz_continuous_afferent-efferent/sub-150_L1_10Hz_continuous_afferent%2Befferent_manometry.S2R',
-            'files/primary/sub-150/perf-T12-stim_10Hz_continuous_afferent-efferent/sub-150_T12_10Hz_continuous_afferent%2Befferent.S2R': 'files/primary/sub-150/perf-T12-stim_10Hz_continuous_afferent-efferent/sub-150_T12_10Hz_continuous_afferent%2Befferent_manometry.S2R',
-            'files/primary/sub-150/perf-L1-stim_30Hz_PT_afferent-efferent/sub-150_L1_30Hz_PT_afferent%2Befferent.S2R': 'files/primary/sub-150/perf-L1-stim_30Hz_PT_afferent-efferent/sub-150_L1_30Hz_PT_afferent%2Befferent_manometry.S2R',
-            'files/primary/sub-145/perf-T12-stim_10Hz_continuous_afferent-efferent/sub-145_T12_10Hz_continuous_afferent%2Befferent.S2R': 'files/primary/sub-145/perf-T12-stim_10Hz_continuous_afferent-efferent/sub-145_T12_10Hz_continuous_afferent%2Befferent_manometry.S2R',
-            'files/primary/sub-150/perf-T12-stim_30Hz_PT_afferent-efferent/sub-150_T12_30Hz_PT_afferent%2Befferent.S2R': 'files/primary/sub-150/perf-T12-stim_30Hz_PT_afferent-efferent/sub-150_T12_30Hz_PT_afferent%2Befferent_manometry.S2R',
-            'files/primary/sub-143/perf-L1-stim_10Hz_continuous_afferent/sub-143_L1_10Hz_continuous_afferent.S2R': 'files/primary/sub-143/perf-L1-stim_10Hz_continuous_afferent/sub-143_L1_10Hz_continuous_afferent_manometry.S2R',
-            'files/primary/sub-149/perf-L1-stim_30Hz_PT_afferent/sub-149_L1_30Hz_PT_afferent.S2R': 'files/primary/sub-149/perf-L1-stim_30Hz_PT_afferent/sub-149_L1_30Hz_PT_afferent_manometry.S2R',
-            'files/primary/sub-143/perf-L1-stim_30Hz_PT_afferent/sub-143_L1_30Hz_PT_afferent.S2R': 'files/primary/sub-143/perf-L1-stim_30Hz_PT_afferent/sub-143_L1_30Hz_PT_afferent_manometry.S2R',
-            'files/primary/sub-142/perf-T12-stim_10Hz_continuous_afferent/sub-142_T12_10Hz_continuous_afferent.S2R': 'files/primary/sub-142/perf-T12-stim_10Hz_continuous_afferent/sub-142_T12_10Hz_continuous_afferent_manometry.S2R',
-            'files/primary/sub-143/perf-T12-stim_30Hz_PT_afferent/sub-143_T12_30Hz_PT_afferent.S2R': 'files/primary/sub-143/perf-T12-stim_30Hz_PT_afferent/sub-143_T12_30Hz_PT_afferent_manometry.S2R',
-            'files/primary/sub-149/perf-L1-stim_10Hz_continuous_afferent/sub-149_L1_10Hz_continuous_afferent.S2R': 'files/primary/sub-149/perf-L1-stim_10Hz_continuous_afferent/sub-149_L1_10Hz_continuous_afferent_manometry.S2R',
-            'files/primary/sub-142/perf-T12-stim_30Hz_PT_afferent/sub-142_T12_30Hz_PT_afferent.S2R': 'files/primary/sub-142/perf-T12-stim_30Hz_PT_afferent/sub-142_T12_30Hz_PT_afferent_manometry.S2R',
-            'files/primary/sub-147/perf-L1-stim_30Hz_PT_afferent/sub-147_L1_30Hz_PT_afferent.S2R': 'files/primary/sub-147/perf-L1-stim_30Hz_PT_afferent/sub-147_L1_30Hz_PT_afferent_manometry.S2R',
-            'files/primary/sub-144/perf-T12-stim_30Hz_PT_afferent-efferent/sub-144_T12_30Hz_PT_afferent%2Befferent.smr': 'files/primary/sub-144/perf-T12-stim_30Hz_PT_afferent-efferent/sub-144_T12_30Hz_PT_afferent%2Befferent_manometry.smr',
-            'files/primary/sub-144/perf-L1-stim_10Hz_continuous_afferent-efferent/sub-144_L1_10Hz_continuous_afferent%2Befferent.smr': 'files/primary/sub-144/perf-L1-stim_10Hz_continuous_afferent-efferent/sub-144_L1_10Hz_continuous_afferent%2Befferent_manometry.smr',
-            'files/primary/sub-144/perf-L1-stim_30Hz_PT_afferent/sub-144_L1_30Hz_PT_afferent.smr': 'files/primary/sub-144/perf-L1-stim_30Hz_PT_afferent/sub-144_L1_30Hz_PT_afferent_manometry.smr',
-            'files/primary/sub-148/perf-T12-stim_30Hz_PT_afferent/sub-148_T12_30Hz_PT_afferent.smr': 'files/primary/sub-148/perf-T12-stim_30Hz_PT_afferent/sub-148_T12_30Hz_PT_afferent_manometry.smr',
-            'files/primary/sub-146/perf-L1-stim_10Hz_continuous_afferent-efferent/sub-146_L1_10Hz_continuous_afferent%2Befferent.smr': 'files/primary/sub-146/perf-L1-stim_10Hz_continuous_afferent-efferent/sub-146_L1_10Hz_continuous_afferent%2Befferent_manometry.smr',
-            'files/primary/sub-144/perf-L1-stim_30Hz_PT_afferent-efferent/sub-144_L1_30Hz_PT_afferent%2Befferent.smr': 'files/primary/sub-144/perf-L1-stim_30Hz_PT_afferent-efferent/sub-144_L1_30Hz_PT_afferent%2Befferent_manometry.smr',
-            'files/primary/sub-148/perf-T12-stim_10Hz_continuous_afferent/sub-148_T12_10Hz_continuous_afferent.smr': 'files/primary/sub-148/perf-T12-stim_10Hz_continuous_afferent/sub-148_T12_10Hz_continuous_afferent_manometry.smr',
-            'files/primary/sub-145/perf-L1-stim_10Hz_continuous_afferent-efferent/sub-145_L1_10Hz_continuous_afferent%2Befferent.smr': 'files/primary/sub-145/perf-L1-stim_10Hz_continuous_afferent-efferent/sub-145_L1_10Hz_continuous_afferent%2Befferent_manometry.smr',
-            'files/primary/sub-146/perf-L1-stim_30Hz_PT_afferent-efferent/sub-146_L1_30Hz_PT_afferent%2Befferent.smr': 'files/primary/sub-146/perf-L1-stim_30Hz_PT_afferent-efferent/sub-146_L1_30Hz_PT_afferent%2Befferent_manometry.smr',
-            'files/primary/sub-150/perf-T12-stim_30Hz_PT_afferent-efferent/sub-150_T12_30Hz_PT_afferent%2Befferent.smr': 'files/primary/sub-150/perf-T12-stim_30Hz_PT_afferent-efferent/sub-150_T12_30Hz_PT_afferent%2Befferent_manometry.smr',
-            'files/primary/sub-145/perf-L1-stim_30Hz_PT_afferent-efferent/sub-145_L1_30Hz_PT_afferent%2Befferent.smr': 'files/primary/sub-145/perf-L1-stim_30Hz_PT_afferent-efferent/sub-145_L1_30Hz_PT_afferent%2Befferent_manometry.smr',
-            'files/primary/sub-145/perf-T12-stim_10Hz_continuous_afferent-efferent/sub-145_T12_10Hz_continuous_afferent%2Befferent.smr': 'files/primary/sub-145/perf-T12-stim_10Hz_continuous_afferent-efferent/sub-145_T12_10Hz_continuous_afferent%2Befferent_manometry.smr',
-            'files/primary/sub-150/perf-L1-stim_10Hz_continuous_afferent-efferent/sub-150_L1_10Hz_continuous_afferent%2Befferent.smr': 'files/primary/sub-150/perf-L1-stim_10Hz_continuous_afferent-efferent/sub-150_L1_10Hz_continuous_afferent%2Befferent_manometry.smr',
-            'files/primary/sub-150/perf-L1-stim_30Hz_PT_afferent-efferent/sub-150_L1_30Hz_PT_afferent%2Befferent.smr': 'files/primary/sub-150/perf-L1-stim_30Hz_PT_afferent-efferent/sub-150_L1_30Hz_PT_afferent%2Befferent_manometry.smr',
-            'files/primary/sub-143/perf-L1-stim_10Hz_continuous_afferent/sub-143_L1_10Hz_continuous_afferent.smr': 'files/primary/sub-143/perf-L1-stim_10Hz_continuous_afferent/sub-143_L1_10Hz_continuous_afferent_manometry.smr',
-            'files/primary/sub-150/perf-T12-stim_10Hz_continuous_afferent-efferent/sub-150_T12_10Hz_continuous_afferent%2Befferent.smr': 'files/primary/sub-150/perf-T12-stim_10Hz_continuous_afferent-efferent/sub-150_T12_10Hz_continuous_afferent%2Befferent_manometry.smr',
-            'files/primary/sub-143/perf-T12-stim_30Hz_PT_afferent/sub-143_T12_30Hz_PT_afferent.smr': 'files/primary/sub-143/perf-T12-stim_30Hz_PT_afferent/sub-143_T12_30Hz_PT_afferent_manometry.smr',
-            'files/primary/sub-143/perf-L1-stim_30Hz_PT_afferent/sub-143_L1_30Hz_PT_afferent.smr': 'files/primary/sub-143/perf-L1-stim_30Hz_PT_afferent/sub-143_L1_30Hz_PT_afferent_manometry.smr',
-            'files/primary/sub-149/perf-L1-stim_30Hz_PT_afferent/sub-149_L1_30Hz_PT_afferent.smr': 'files/primary/sub-149/perf-L1-stim_30Hz_PT_afferent/sub-149_L1_30Hz_PT_afferent_manometry.smr',
-            'files/primary/sub-142/perf-T12-stim_30Hz_PT_afferent/sub-142_T12_30Hz_PT_afferent.smr': 'files/primary/sub-142/perf-T12-stim_30Hz_PT_afferent/sub-142_T12_30Hz_PT_afferent_manometry.smr',
-            'files/primary/sub-147/perf-L1-stim_30Hz_PT_afferent/sub-147_L1_30Hz_PT_afferent.smr': 'files/primary/sub-147/perf-L1-stim_30Hz_PT_afferent/sub-147_L1_30Hz_PT_afferent_manometry.smr',
-            'files/primary/sub-149/perf-L1-stim_10Hz_continuous_afferent/sub-149_L1_10Hz_continuous_afferent.smr': 'files/primary/sub-149/perf-L1-stim_10Hz_continuous_afferent/sub-149_L1_10Hz_continuous_afferent_manometry.smr',
-            'files/primary/sub-142/perf-T12-stim_10Hz_continuous_afferent/sub-142_T12_10Hz_continuous_afferent.smr': 'files/primary/sub-142/perf-T12-stim_10Hz_continuous_afferent/sub-142_T12_10Hz_continuous_afferent_manometry.smr',
-            'files/primary/sub-147/perf-L1-stim_10Hz_continuous_afferent/sub-147_L1_10Hz_continuous_afferent.smr': 'files/primary/sub-147/perf-L1-stim_10Hz_continuous_afferent/sub-147_L1_10Hz_continuous_afferent_manometry.smr',
-            'files/derivative/perf-L1-stim_30Hz_PT_afferent/sub-all_L1-stim_30Hz_PT_afferent.xlsx': 'files/derivative/perf-L1-stim_30Hz_PT_afferent/sub-all_L1-stim_30Hz_PT_afferent (1).xlsx',
-            'files/primary/sub-rat13/sam-corp13/ses-pyy4885ht555som647/microscopy/manifest.txt': 'files/primary/sub-rat13/sam-corp13/ses-pyy4885ht555som647/microscopy/manifest (1).txt',
-            'files/primary/sub-rat13/sam-corp13/ses-gas488som555/microscopy/manifest.txt': 'files/primary/sub-rat13/sam-corp13/ses-gas488som555/microscopy/manifest (1).txt',
-            'files/primary/sub-rat11/sam-corp11/ses-gas4885ht555hdc647/microscopy/manifest.xlsx': 'files/primary/sub-rat11/sam-corp11/ses-gas4885ht555hdc647/microscopy/manifest (1).xlsx',
-            'files/source/st2_1_2_20x.czi': 'files/source/st2 1&2 20x.czi', 'files/source/pyy_400_antrum_20x.czi': 'files/source/sub-rat03/sam-ant03/pyy 400 antrum 20x.czi',
-            'files/source/hdc2_hdc647_gas488_20x.czi': 'files/source/sam-ant07/hdc2 hdc647 gas488 20x.czi',
-            'files/source/sub-rat12/sam-corp12/bom_488_vip_647_npy_555_ant_c.czi': 'files/source/sam-corp12/bom 488 vip 647 npy 555 ant c.czi',
-            'files/source/sub-rat12/sam-corp12/ns6_dapi_hdc_hatp_ghr_20x_corp.czi': 'files/source/sam-corp12/ns6 dapi hdc hatp ghr 20x corp.czi',
-            'files/source/slide_27_corp_vip_cgrp_bom_2.czi': 'files/source/sub-rat03/sam-corp03/slide 27 corp vip cgrp bom 2.czi',
-            'files/source/st2_3_4_20x.czi': 'files/source/sam-ant09/st2 3&4 20x.czi', 'files/source/Experiment-337.czi': 'files/source/sub-rat03/sam-corp03/Experiment-337.czi',
-            'files/source/slide_ab_msvip_vacht_x_rat_corp.czi': 'files/source/sam-corp10/slide ab msvip vacht x rat corp.czi',
-            'files/source/sub-rat13/sam-ant13/gas_555_som_488_ghr_647_20x.czi': 'files/source/sam-ant13/gas 555 som 488 ghr 647 20x.czi',
-            'files/source/hdc_som647_corp_20xz.czi': 'files/source/sam-corp07/hdc som647 corp 20xz.czi',
-            'files/source/sub-rat13/sam-corp13/corp_gas_555_som_488_ghr_657.czi': 'files/source/sam-corp13/corp gas 555 som 488 ghr 657.czi',
-            'files/source/sub-rat14/sam-ant14/bom_488_vip_647_npy_555_corp_a.czi': 'files/source/sam-ant14/bom 488 vip 647 npy 555 corp a.czi',
-            'files/source/sub-rat14/sam-corp14/corpus_dbh_488_th_555_1.czi': 'files/source/sam-corp14/corpus dbh 488 th 555 1.czi',
-            'files/source/hdc_som647_ant_20xz_b.czi': 'files/source/sam-ant07/hdc som647 ant 20xz b.czi',
-            'files/source/sub-rat14/sam-ant14/gas_5ht_hdc_ant_63x_6.czi': 'files/source/sam-ant14/gas 5ht hdc ant 63x 6.czi',
-            'files/source/sub-rat14/sam-ant14/vip_bom_npy_ant_6g_z.czi': 'files/source/sam-ant14/vip bom npy ant 6g z.czi',
-            'files/source/sub-rat14/sam-corp14/calb_hdc_corp_20x.czi': 'files/source/sam-corp14/calb hdc corp 20x.czi',
-            'files/source/sub-rat14/sam-corp14/Snap-15.czi': 'files/source/sam-corp14/Snap-15.czi',
-            'files/source/sub-rat11/sam-corp11/corpus_dbh_488_th_555_3.czi': 'files/source/sam-corp11/corpus dbh 488 th 555 3.czi',
-            'files/source/sub-rat14/sam-corp14/gas_488_5ht_555_hdc_647_corp_4.czi': 'files/source/sam-corp14/gas 488 5ht 555 hdc 647 corp 4.czi',
-            'files/source/sub-rat11/sam-corp11/rb5ht_ar_488_20x_3.czi': 'files/source/sam-corp11/rb5ht ar 488 20x 3.czi',
-            'files/derivative/quantification_summary.xlsx': 'files/derivative/quantification summary.xlsx',
-            'files/docs/Fig_8_close_up_fibers.jpg': 'files/docs/Fig 8 close up fibers.jpg',
-            'files/docs/Fig_2_EEC_Multilabel_Corp_Ant.jpg': 'files/docs/Fig 2 EEC Multilabel Corp Ant.jpg',
-            'files/docs/Fig_10_VIP_Ghrelin.jpg': 'files/docs/Fig 10 VIP Ghrelin.jpg', 'files/docs/Fig_9_DBH_TH.jpg': 'files/docs/Fig 9 DBH TH.jpg',
-            'files/docs/Fig_1_EEC_images_Corp.jpg': 'files/docs/Fig 1 EEC images Corp.jpg', 'files/docs/Fig_4_Cell_shapes.jpg': 'files/docs/Fig 4 Cell shapes.jpg',
-            'files/docs/Fig_5_EEC_coloc.jpg': 'files/docs/Fig 5 EEC coloc.jpg', 'files/docs/Fig_6_Colocalisation_Quantified.jpg': 'files/docs/Fig 6 Colocalisation Quantified.jpg',
-            'files/docs/Fig_7_fibers.jpg': 'files/docs/Fig 7 fibers.jpg',
-            'files/primary/Sub_01/submandibular_ganglion_labelled_by_nanosensor_high_magnification_1.lsm': 'files/primary/Sub_01/submandibular ganglion labelled by nanosensor high magnification_1.lsm',
-            'files/primary/Sub_01/submandibular_ganglion_labelled_by_nanosensor_high_magnification_2.lsm': 'files/primary/Sub_01/submandibular ganglion labelled by nanosensor high magnification_2.lsm',
-            'files/primary/Sub_01/submandibular_ganglion_labelled_by_nanosensor_low_magnification.lsm': 'files/primary/Sub_01/submandibular ganglion labelled by nanosensor low magnification.lsm',
-            'files/primary/Sub_01/submandibular_ganglion_labelled_by_nanosensor_high_magnification_3.lsm': 'files/primary/Sub_01/submandibular ganglion labelled by nanosensor high magnification_3.lsm',
-            'files/primary/Sub_01/submandibular_ganglion_labelled_by_bungarotoxin_Z-stack_low_magnification.lsm': 'files/primary/Sub_01/submandibular ganglion labelled by bungarotoxin Z-stack low magnification.lsm',
-            'files/primary/Sub_01/submandibular_ganglion_labelled_by_bungarotoxin_Z-stack_high_magnification.lsm': 'files/primary/Sub_01/submandibular ganglion labelled by bungarotoxin Z-stack high magnification.lsm',
-            'files/derivative/Sub_01/submandibular_ganglion_labelled_by_bungarotoxin_Z-stack_high_magnification.jpx': 'files/derivative/Sub_01/submandibular ganglion labelled by bungarotoxin Z-stack high magnification.jpx',
-            'files/derivative/Sub_01/submandibular_ganglion_labelled_by_nanosensor_high_magnification_1.jp2': 'files/derivative/Sub_01/submandibular ganglion labelled by nanosensor high magnification_1.jp2',
-            'files/derivative/Sub_01/submandibular_ganglion_labelled_by_nanosensor_high_magnification_3.jp2': 'files/derivative/Sub_01/submandibular ganglion labelled by nanosensor high magnification_3.jp2',
-            'files/derivative/Sub_01/submandibular_ganglion_labelled_by_nanosensor_high_magnification_2.jp2': 'files/derivative/Sub_01/submandibular ganglion labelled by nanosensor high magnification_2.jp2',
-            'files/derivative/Sub_01/submandibular_ganglion_labelled_by_nanosensor_low_magnification.jp2': 'files/derivative/Sub_01/submandibular ganglion labelled by nanosensor low magnification.jp2',
-            'files/derivative/Sub_01/submandibular_ganglion_labelled_by_bungarotoxin_Z-stack_low_magnification.jpx': 'files/derivative/Sub_01/submandibular ganglion labelled by bungarotoxin Z-stack low magnification.jpx',
-            'files/docs/Example_figure.jpg': 'files/docs/Example figure.jpg',
-            'files/derivative/sub-PR1643/pool-PR1643/PR1643_BlockFace_500-900_Shaina-scaling50umX50um_2019-07-18__Blackfynn.xml': 'files/derivative/sub-PR1643/pool-PR1643/PR1643_All_Sampled_Points.xml',
-            'files/primary/sub-PR1643/pool-PR1643/PR1643_BlockFace_500-900_Shaina-scaling50umX50um.jpx': 'files/primary/sub-PR1643/pool-PR1643/PR1643_BlockFace_scaling50umX50um.jpx',
-            'files/primary/sub-261/sam-261-Corp/ses-Ghrelin_CST/microscopy/qtification.cz': 'files/primary/sam-261-Corp/ses-Ghrelin_CST/microscopy/qtification.cz',
-            'files/primary/sub-261/sam-261-Fund/ses-5HT_PCST/microscopy/qtification.cz': 'files/primary/sam-261-Fund/ses-5HT_PCST/microscopy/qtification.cz',
-            'files/primary/sub-261/sam-261-Fund/ses-SST_PCST/microscopy/Thumbs.db': 'files/primary/sam-261-Fund/ses-SST_PCST/microscopy/Thumbs.db',
-            'files/primary/sub-261/sam-261-Fund/ses-SST_PCST/microscopy/quantification.cz': 'files/primary/sam-261-Fund/ses-SST_PCST/microscopy/quantification.cz',
-            'files/primary/sub-261/sam-261-Corp/ses-5HT_SST/microscopy/qtification_scene_3.cz': 'files/primary/sam-261-Corp/ses-5HT_SST/microscopy/qtification_scene_3.cz',
-            'files/primary/sub-261/sam-261-Fund/ses-Ghrelin_SST/microscopy/Thumbs.db': 'files/primary/sam-261-Fund/ses-Ghrelin_SST/microscopy/Thumbs.db',
-            'files/primary/sub-261/sam-261-Corp/ses-5HT_SST/microscopy/slide_5_06092017_Experiment-328.IP-Split_Scenes-03_corpus261.czi': 'files/primary/sam-261-Corp/ses-5HT_SST/microscopy/slide_5_06092017_Experiment-328.IP-Split_Scenes-03_corpus261.czi',
-            'files/primary/sub-259/sam-259-Fund/ses-SST_PCST/microscopy/axcam.log': 'files/primary/sam-259-Fund/ses-SST_PCST/microscopy/axcam.log',
-            'files/primary/sub-261/sam-261-Fund/ses-Ghrelin_PCST/microscopy/qtification.cz': 'files/primary/sam-261-Fund/ses-Ghrelin_PCST/microscopy/qtification.cz',
-            'files/primary/sub-264/sam-264-Corp/ses-Ghrelin_PCST/microscopy/qtification.cz': 'files/primary/sam-264-Corp/ses-Ghrelin_PCST/microscopy/qtification.cz',
-            'files/primary/sub-264/sam-264-Fund/ses-Ghrelin_PCST/microscopy/qtification.cz': 'files/primary/sam-264-Fund/ses-Ghrelin_PCST/microscopy/qtification.cz',
-            'files/primary/sub-264/sam-264-Fund/ses-5HT_PCST/microscopy/qtification.cz': 'files/primary/sam-264-Fund/ses-5HT_PCST/microscopy/qtification.cz',
-            'files/primary/sub-263/sam-263-Fund/ses-SST_PCST/microscopy/qtification.cz': 'files/primary/sam-263-Fund/ses-SST_PCST/microscopy/qtification.cz',
-            'files/primary/sub-264/sam-264-Corp/ses-5HT_SST/microscopy/qtification_scene_1.cz': 'files/primary/sam-264-Corp/ses-5HT_SST/microscopy/qtification_scene_1.cz',
-            'files/primary/sub-264/sam-264-Corp/ses-5HT_SST/microscopy/slide_5-06092017-Experiment-328.IP-Split_Scenes-01_corpus.czi': 'files/primary/sam-264-Corp/ses-5HT_SST/microscopy/slide_5-06092017-Experiment-328.IP-Split_Scenes-01_corpus.czi',
-            'files/primary/sub-264/sam-264-Fund/ses-5HT_SST/microscopy/qtification_scene2.cz': 'files/primary/sam-264-Fund/ses-5HT_SST/microscopy/qtification_scene2.cz',
-            'files/primary/sub-263/sam-263-Fund/ses-5HT_SST/microscopy/slide_5-06092017-Experiment-328.IP-Split_Scenes-04_fundus263.czi': 'files/primary/sam-263-Fund/ses-5HT_SST/microscopy/slide_5-06092017-Experiment-328.IP-Split_Scenes-04_fundus263.czi',
-            'files/primary/sub-263/sam-263-Fund/ses-5HT_SST/microscopy/qtification_scene_4.cz': 'files/primary/sam-263-Fund/ses-5HT_SST/microscopy/qtification_scene_4.cz',
-            'files/primary/sub-263/sam-263-Corp/ses-5HT_PCST/microscopy/qtification_slide_4-26092017.cz': 'files/primary/sam-263-Corp/ses-5HT_PCST/microscopy/qtification_slide_4-26092017.cz',
-            'files/primary/sub-263/sam-263-Corp/ses-Ghrelin_PCST/microscopy/qtification.cz': 'files/primary/sam-263-Corp/ses-Ghrelin_PCST/microscopy/qtification.cz',
-            'files/primary/sub-263/sam-263-Fund/ses-SST_PCST/microscopy/2.cz': 'files/primary/sam-263-Fund/ses-SST_PCST/microscopy/2.cz',
-            'files/derivative/Graphs_-_Fakhry_et_al_2019.pzf': 'files/derivative/Graphs - Fakhry et al 2019.pzf',
-            'files/primary/sub-263/sam-263-Fund/ses-5HT_PCST/microscopy/qtification.cz': 'files/primary/sam-263-Fund/ses-5HT_PCST/microscopy/qtification.cz',
-            'files/primary/sub-263/sam-263-Fund/ses-Ghrelin_PCST/microscopy/quantification.cz': 'files/primary/sam-263-Fund/ses-Ghrelin_PCST/microscopy/quantification.cz',
-            'files/primary/sub-261/sam-261-Fund/ses-SST_PCST/microscopy/manifest.xlsx': 'files/primary/sam-261-Fund/ses-SST_PCST/microscopy/manifest.xlsx',
-            'files/primary/sub-261/sam-261-Fund/ses-SST_PCST/microscopy/slide_2_20112017_PCST_H__SST_Experiment-119-F_261_Split_Scenes-01.czi': 'files/primary/sam-261-Fund/ses-SST_PCST/microscopy/slide_2_20112017_PCST_H%2B_SST_Experiment-119-F_261_Split_Scenes-01.czi',
-            'files/primary/sub-261/sam-261-Fund/ses-5HT_PCST/microscopy/slide_2_06092017_Experiment-238-Split_Scenes-14.czi': 'files/primary/sam-261-Fund/ses-5HT_PCST/microscopy/slide_2_06092017_Experiment-238-Split_Scenes-14.czi',
-            'files/primary/sub-261/sam-261-Fund/ses-Ghrelin_PCST/microscopy/Screenshot_zoomed2_.tif': "files/primary/sam-261-Fund/ses-Ghrelin_PCST/microscopy/Screenshot_zoomed2'.tif",
-            'files/code/Macro_thirds.ijm': 'files/code/Macro thirds.ijm',
-            'files/primary/sub-261/sam-261-Fund/ses-Ghrelin_PCST/microscopy/printscreen_analysis.tif': 'files/primary/sam-261-Fund/ses-Ghrelin_PCST/microscopy/printscreen_analysis.tif',
-            'files/primary/sub-261/sam-261-Fund/ses-Ghrelin_PCST/microscopy/ghrelin_cluster_analysis_sheet2_RoiSet.zip': 'files/primary/sam-261-Fund/ses-Ghrelin_PCST/microscopy/ghrelin_cluster_analysis_sheet2_RoiSet.zip',
-            'files/primary/sub-261/sam-261-Fund/ses-Ghrelin_PCST/microscopy/slide_1_fundus_06092017-Experiment-62-Stitching-02-Split_Scenes-03.czi': 'files/primary/sam-261-Fund/ses-Ghrelin_PCST/microscopy/slide_1_fundus_06092017-Experiment-62-Stitching-02-Split_Scenes-03.czi',
-            'files/primary/sub-261/sam-261-Fund/ses-SST_PCST/microscopy/slide_2_20112017_PCST_H__SST_Experiment-119-F_261_Split_Scenes-01-Stitching-01.czi': 'files/primary/sam-261-Fund/ses-SST_PCST/microscopy/slide_2_20112017_PCST_H%2B_SST_Experiment-119-F_261_Split_Scenes-01-Stitching-01.czi',
-            'files/primary/sub-261/sam-261-Fund/ses-Ghrelin_PCST/microscopy/slide_1_fundus_06092017-Experiment-62-Stitching-02-Split_Scenes-03.czi_1.tif': 'files/primary/sam-261-Fund/ses-Ghrelin_PCST/microscopy/slide_1_fundus_06092017-Experiment-62-Stitching-02-Split_Scenes-03.czi%231.tif',
-            'files/primary/sub-261/sam-261-Fund/ses-Ghrelin_PCST/microscopy/Screenshot_zoomed2.tif': 'files/primary/sam-261-Fund/ses-Ghrelin_PCST/microscopy/Screenshot_zoomed2.tif',
-            'files/primary/sub-261/sam-261-Fund/ses-Ghrelin_PCST/microscopy/slide_1_fundus_06092017-Experiment-62-Split_Scenes-07.czi': 'files/primary/sam-261-Fund/ses-Ghrelin_PCST/microscopy/slide_1_fundus_06092017-Experiment-62-Split_Scenes-07.czi',
-            'files/primary/sub-261/sam-261-Fund/ses-Ghrelin_SST/microscopy/manifest.xlsx': 'files/primary/sam-261-Fund/ses-Ghrelin_SST/microscopy/manifest.xlsx',
-            'files/primary/sub-261/sam-261-Fund/ses-Ghrelin_SST/microscopy/Ghrelin_SST_Fundus1.xlsx': 'files/primary/sam-261-Fund/ses-Ghrelin_SST/microscopy/Ghrelin_SST_Fundus1.xlsx',
-            'files/primary/sub-261/sam-261-Fund/ses-Ghrelin_SST/microscopy/20022017_slide_1_test_ghrelin_somatostatin_fundus_261_GOOD_ONE_Experiment-157.czi': 'files/primary/sam-261-Fund/ses-Ghrelin_SST/microscopy/20022017_slide_1_test_ghrelin_somatostatin_fundus_261_GOOD_ONE_Experiment-157.czi',
-            'files/primary/sub-261/sam-261-Fund/ses-Ghrelin_SST/microscopy/RoiSet_thirds.zip': 'files/primary/sam-261-Fund/ses-Ghrelin_SST/microscopy/RoiSet_thirds.zip',
-            'files/primary/sub-261/sam-261-Fund/ses-Ghrelin_SST/microscopy/13022017_slide_A_ghrelin_somatostatin_fundus_1_top_Experiment-65-Split_Scenes-01.czi': 'files/primary/sam-261-Fund/ses-Ghrelin_SST/microscopy/13022017_slide_A_ghrelin_somatostatin_fundus_1_top_Experiment-65-Split_Scenes-01.czi',
-            'files/primary/sub-261/sam-261-Fund/ses-Ghrelin_SST/microscopy/20022017_slide_1_test_ghrelin_somatostatin_fundus_261_GOOD_ONE_Experiment-157-Stitching-02.czi': 'files/primary/sam-261-Fund/ses-Ghrelin_SST/microscopy/20022017_slide_1_test_ghrelin_somatostatin_fundus_261_GOOD_ONE_Experiment-157-Stitching-02.czi',
-            'files/primary/sub-261/sam-261-Fund/ses-Ghrelin_SST/microscopy/top_third.tif': 'files/primary/sam-261-Fund/ses-Ghrelin_SST/microscopy/top_third.tif',
-            'files/primary/sub-261/sam-261-Fund/ses-Ghrelin_SST/microscopy/RoiSet_top_third.zip': 'files/primary/sam-261-Fund/ses-Ghrelin_SST/microscopy/RoiSet_top_third.zip',
-            'files/primary/sub-261/sam-261-Fund/ses-Ghrelin_PCST/microscopy/Screenshot_zoomed-1.tif': 'files/primary/sam-261-Fund/ses-Ghrelin_PCST/microscopy/Screenshot_zoomed-1.tif',
-            'files/primary/sub-261/sam-261-Fund/ses-Ghrelin_SST/microscopy/bottom_third.tif': 'files/primary/sam-261-Fund/ses-Ghrelin_SST/microscopy/bottom_third.tif',
-            'files/primary/sub-261/sam-261-Fund/ses-Ghrelin_SST/microscopy/middle_third.tif': 'files/primary/sam-261-Fund/ses-Ghrelin_SST/microscopy/middle_third.tif',
-            'files/primary/sub-261/sam-261-Fund/ses-Ghrelin_SST/microscopy/Roi_parietal_cells_area.zip': 'files/primary/sam-261-Fund/ses-Ghrelin_SST/microscopy/Roi_parietal_cells_area.zip',
-            'files/primary/sub-261/sam-261-Fund/ses-Ghrelin_SST/microscopy/ROI_bottom_in_place.zip': 'files/primary/sam-261-Fund/ses-Ghrelin_SST/microscopy/ROI_bottom_in_place.zip',
-            'files/primary/sub-261/sam-261-Fund/ses-Ghrelin_SST/microscopy/13022017_slide_A_ghrelin_somatostatin_fundus_1_top_Experiment-65-Split_Scenes-01-Stitching-01.czi': 'files/primary/sam-261-Fund/ses-Ghrelin_SST/microscopy/13022017_slide_A_ghrelin_somatostatin_fundus_1_top_Experiment-65-Split_Scenes-01-Stitching-01.czi',
-            'files/primary/sub-261/sam-261-Fund/ses-Ghrelin_SST/microscopy/Roi_Middle_in_place.zip': 'files/primary/sam-261-Fund/ses-Ghrelin_SST/microscopy/Roi_Middle_in_place.zip',
-            'files/primary/sub-261/sam-261-Fund/ses-Ghrelin_SST/microscopy/Roi_Top_in_place.zip': 'files/primary/sam-261-Fund/ses-Ghrelin_SST/microscopy/Roi_Top_in_place.zip',
-            'files/primary/sub-261/sam-261-Fund/ses-Ghrelin_SST/microscopy/RoiSet_middle_third.zip': 'files/primary/sam-261-Fund/ses-Ghrelin_SST/microscopy/RoiSet_middle_third.zip',
-            'files/primary/sub-261/sam-261-Corp/ses-Ghrelin_CST/microscopy/slide_1_corpus_06092017_Experiment-64-Split_Scenes-01-Stitching-04.czi': 'files/primary/sam-261-Corp/ses-Ghrelin_CST/microscopy/slide_1_corpus_06092017_Experiment-64-Split_Scenes-01-Stitching-04.czi',
-            'files/primary/sub-261/sam-261-Corp/ses-Ghrelin_CST/microscopy/slide_1_corpus_06092017_Experiment-64-Split_Scenes-01.czi': 'files/primary/sam-261-Corp/ses-Ghrelin_CST/microscopy/slide_1_corpus_06092017_Experiment-64-Split_Scenes-01.czi',
-            'files/primary/sub-261/sam-261-Corp/ses-Ghrelin_5HT/microscopy/slide_2_of_24072017_ghrelin_GR_5HT_Red_SST_FR_corpus_Experiment-563-Split_Scenes-06.czi': 'files/primary/sam-261-Corp/ses-Ghrelin_5HT/microscopy/slide_2_of_24072017_ghrelin_GR_5HT_Red_SST_FR_corpus_Experiment-563-Split_Scenes-06.czi',
-            'files/primary/sub-261/sam-261-Corp/ses-Ghrelin_5HT/microscopy/ghrelin8_5HT4_SST5_corpus.xlsx': 'files/primary/sam-261-Corp/ses-Ghrelin_5HT/microscopy/ghrelin8_5HT4_SST5_corpus.xlsx',
-            'files/primary/sub-261/sam-261-Corp/ses-Ghrelin_5HT/microscopy/slide_2_of_24072017_ghrelin_GR_5HT_Red_SST_FR_corpus_Experiment-563-Split_Scenes-06-Stitching-08.czi': 'files/primary/sam-261-Corp/ses-Ghrelin_5HT/microscopy/slide_2_of_24072017_ghrelin_GR_5HT_Red_SST_FR_corpus_Experiment-563-Split_Scenes-06-Stitching-08.czi',
-            'files/primary/sub-261/sam-261-Corp/ses-Ghrelin_5HT/microscopy/CellCounter_slide_2_of_24072017.xml': 'files/primary/sam-261-Corp/ses-Ghrelin_5HT/microscopy/CellCounter_slide_2_of_24072017.xml',
-            'files/primary/sub-261/sam-261-Corp/ses-Ghrelin_SST/microscopy/RoiSet_thirds.zip': 'files/primary/sam-261-Corp/ses-Ghrelin_SST/microscopy/RoiSet_thirds.zip',
-            'files/primary/sub-261/sam-261-Corp/ses-Ghrelin_SST/microscopy/RoiSet_bottom_third_red.zip': 'files/primary/sam-261-Corp/ses-Ghrelin_SST/microscopy/RoiSet_bottom_third_red.zip',
-            'files/primary/sub-261/sam-261-Corp/ses-Ghrelin_SST/microscopy/top_third.tif': 'files/primary/sam-261-Corp/ses-Ghrelin_SST/microscopy/top_third.tif',
-            'files/primary/sub-261/sam-261-Corp/ses-Ghrelin_SST/microscopy/ghrelin4_SST1_Corpus.xlsx': 'files/primary/sam-261-Corp/ses-Ghrelin_SST/microscopy/ghrelin4_SST1_Corpus.xlsx',
-            'files/primary/sub-261/sam-261-Corp/ses-Ghrelin_SST/microscopy/middle_third.tif': 'files/primary/sam-261-Corp/ses-Ghrelin_SST/microscopy/middle_third.tif',
-            'files/primary/sub-261/sam-261-Corp/ses-Ghrelin_SST/microscopy/CellCounter_top_third_red_1_green_2.xml': 'files/primary/sam-261-Corp/ses-Ghrelin_SST/microscopy/CellCounter_top_third_red_1_green_2.xml',
-            'files/primary/sub-261/sam-261-Corp/ses-Ghrelin_SST/microscopy/bottom_third.tif': 'files/primary/sam-261-Corp/ses-Ghrelin_SST/microscopy/bottom_third.tif',
-            'files/primary/sub-261/sam-261-Corp/ses-Ghrelin_SST/microscopy/CellCounter_middle_third_1_red_2_green.xml': 'files/primary/sam-261-Corp/ses-Ghrelin_SST/microscopy/CellCounter_middle_third_1_red_2_green.xml',
-            'files/primary/sub-261/sam-261-Corp/ses-Ghrelin_SST/microscopy/07032017_slide_corpus_261_Experiment-421-Split_Scenes-01-Stitching-04.czi': 'files/primary/sam-261-Corp/ses-Ghrelin_SST/microscopy/07032017_slide_corpus_261_Experiment-421-Split_Scenes-01-Stitching-04.czi',
-            'files/primary/sub-261/sam-261-Corp/ses-Ghrelin_SST/microscopy/07032017_slide_corpus_261_Experiment-421-Split_Scenes-01.czi': 'files/primary/sam-261-Corp/ses-Ghrelin_SST/microscopy/07032017_slide_corpus_261_Experiment-421-Split_Scenes-01.czi',
-            'files/primary/sub-261/sam-261-Corp/ses-Ghrelin_SST/microscopy/CellCounter_green_bottom_third.xml': 'files/primary/sam-261-Corp/ses-Ghrelin_SST/microscopy/CellCounter_green_bottom_third.xml',
-            'files/primary/sub-259/sam-259-Fund/ses-Ghrelin_5HT_Gastrin/microscopy/Top.tif': 'files/primary/sam-259-Fund/ses-Ghrelin_5HT_Gastrin/microscopy/Top.tif',
-            'files/primary/sub-259/sam-259-Fund/ses-Ghrelin_5HT_Gastrin/microscopy/slide_1_24052017_gastrin_FR_5HT_red_ghrelin_GR_Fundus_Experiment-1609-Split_Scenes-02.czi': 'files/primary/sam-259-Fund/ses-Ghrelin_5HT_Gastrin/microscopy/slide_1_24052017_gastrin_FR_5HT_red_ghrelin_GR_Fundus_Experiment-1609-Split_Scenes-02.czi',
-            'files/primary/sub-259/sam-259-Fund/ses-Ghrelin_5HT_Gastrin/microscopy/Ghrelin4_5HT2_Gastrin1_fundus.xlsx': 'files/primary/sam-259-Fund/ses-Ghrelin_5HT_Gastrin/microscopy/Ghrelin4_5HT2_Gastrin1_fundus.xlsx',
-            'files/primary/sub-259/sam-259-Fund/ses-Ghrelin_5HT_Gastrin/microscopy/RoiSet_thirds.zip': 'files/primary/sam-259-Fund/ses-Ghrelin_5HT_Gastrin/microscopy/RoiSet_thirds.zip',
-            'files/primary/sub-259/sam-259-Fund/ses-Ghrelin_5HT_Gastrin/microscopy/slide_1_24052017_gastrin_FR_5HT_red_ghrelin_GR_Fundus_Experiment-1609-Split_Scenes-02-Stitching-03.czi': 'files/primary/sam-259-Fund/ses-Ghrelin_5HT_Gastrin/microscopy/slide_1_24052017_gastrin_FR_5HT_red_ghrelin_GR_Fundus_Experiment-1609-Split_Scenes-02-Stitching-03.czi',
-            'files/primary/sub-259/sam-259-Fund/ses-Ghrelin_5HT_Gastrin/microscopy/CellCounter_middle.xml': 'files/primary/sam-259-Fund/ses-Ghrelin_5HT_Gastrin/microscopy/CellCounter_middle.xml',
-            'files/primary/sub-259/sam-259-Fund/ses-Ghrelin_5HT_Gastrin/microscopy/CellCounter_bottom.xml': 'files/primary/sam-259-Fund/ses-Ghrelin_5HT_Gastrin/microscopy/CellCounter_bottom.xml',
-            'files/primary/sub-259/sam-259-Fund/ses-Ghrelin_5HT_Gastrin/microscopy/CellCounter_Top.xml': 'files/primary/sam-259-Fund/ses-Ghrelin_5HT_Gastrin/microscopy/CellCounter_Top.xml',
-            'files/primary/sub-259/sam-259-Fund/ses-Ghrelin_5HT_Gastrin/microscopy/middle.tif': 'files/primary/sam-259-Fund/ses-Ghrelin_5HT_Gastrin/microscopy/middle.tif',
-            'files/primary/sub-259/sam-259-Fund/ses-Ghrelin_5HT_Gastrin/microscopy/bottom.tif': 'files/primary/sam-259-Fund/ses-Ghrelin_5HT_Gastrin/microscopy/bottom.tif',
-            'files/primary/sub-259/sam-259-Fund/ses-SST_PCST/microscopy/slide_3_06122017_Fundus_259_SST_in_green_PCST_in_red_Experiment-450.czi': 'files/primary/sam-259-Fund/ses-SST_PCST/microscopy/slide_3_06122017_Fundus_259_SST_in_green_PCST_in_red_Experiment-450.czi',
-            'files/primary/sub-259/sam-259-Fund/ses-Ghrelin_SST/microscopy/Roi_extrapolated_bottom.zip': 'files/primary/sam-259-Fund/ses-Ghrelin_SST/microscopy/Roi_extrapolated_bottom.zip',
-            'files/primary/sub-259/sam-259-Fund/ses-Ghrelin_SST/microscopy/RoiSet_half_top.zip': 'files/primary/sam-259-Fund/ses-Ghrelin_SST/microscopy/RoiSet_half_top.zip',
-            'files/primary/sub-259/sam-259-Fund/ses-Ghrelin_SST/microscopy/RoiSet_half_bottom.zip': 'files/primary/sam-259-Fund/ses-Ghrelin_SST/microscopy/RoiSet_half_bottom.zip',
-            'files/primary/sub-259/sam-259-Fund/ses-SST_PCST/microscopy/slide_3_06122017_Fundus_259_SST_in_green_PCST_in_red_Experiment-450-Stitching-01.czi': 'files/primary/sam-259-Fund/ses-SST_PCST/microscopy/slide_3_06122017_Fundus_259_SST_in_green_PCST_in_red_Experiment-450-Stitching-01.czi',
-            'files/primary/sub-259/sam-259-Fund/ses-Ghrelin_SST/microscopy/right_half_of_middle.tif': 'files/primary/sam-259-Fund/ses-Ghrelin_SST/microscopy/right_half_of_middle.tif',
-            'files/primary/sub-259/sam-259-Fund/ses-Ghrelin_SST/microscopy/half_of_bottom.tif': 'files/primary/sam-259-Fund/ses-Ghrelin_SST/microscopy/half_of_bottom.tif',
-            'files/primary/sub-259/sam-259-Fund/ses-Ghrelin_SST/microscopy/13022017_slide_A_ghrelin_somatostatin_fundus_3_Experiment-67.czi': 'files/primary/sam-259-Fund/ses-Ghrelin_SST/microscopy/13022017_slide_A_ghrelin_somatostatin_fundus_3_Experiment-67.czi',
-            'files/primary/sub-259/sam-259-Fund/ses-Ghrelin_SST/microscopy/right_half_of_top-1.tif': 'files/primary/sam-259-Fund/ses-Ghrelin_SST/microscopy/right_half_of_top-1.tif',
-            'files/primary/sub-259/sam-259-Fund/ses-Ghrelin_SST/microscopy/RoiSet_thirds.zip': 'files/primary/sam-259-Fund/ses-Ghrelin_SST/microscopy/RoiSet_thirds.zip',
-            'files/primary/sub-259/sam-259-Fund/ses-Ghrelin_SST/microscopy/Ghrelin_SST_Fundus_3.xlsx': 'files/primary/sam-259-Fund/ses-Ghrelin_SST/microscopy/Ghrelin_SST_Fundus_3.xlsx',
-            'files/primary/sub-259/sam-259-Fund/ses-Ghrelin_SST/microscopy/13022017_slide_A_ghrelin_somatostatin_fundus_3_Experiment-67-Stitching-03.czi': 'files/primary/sam-259-Fund/ses-Ghrelin_SST/microscopy/13022017_slide_A_ghrelin_somatostatin_fundus_3_Experiment-67-Stitching-03.czi',
-            'files/primary/sub-259/sam-259-Fund/ses-Ghrelin_SST/microscopy/RoiSet_half_middle.zip': 'files/primary/sam-259-Fund/ses-Ghrelin_SST/microscopy/RoiSet_half_middle.zip',
-            'files/primary/sub-259/sam-259-Fund/ses-Ghrelin_SST/microscopy/right_half_of_bottom.tif': 'files/primary/sam-259-Fund/ses-Ghrelin_SST/microscopy/right_half_of_bottom.tif',
-            'files/primary/sub-259/sam-259-Fund/ses-Ghrelin_SST/microscopy/Roi_extrapolated_top.zip': 'files/primary/sam-259-Fund/ses-Ghrelin_SST/microscopy/Roi_extrapolated_top.zip',
-            'files/primary/sub-259/sam-259-Fund/ses-5HT_SST/microscopy/5HT3_SST4_fundus.xlsx': 'files/primary/sam-259-Fund/ses-5HT_SST/microscopy/5HT3_SST4_fundus.xlsx',
-            'files/primary/sub-259/sam-259-Fund/ses-Ghrelin_SST/microscopy/Roi_extrapolated_middle.zip': 'files/primary/sam-259-Fund/ses-Ghrelin_SST/microscopy/Roi_extrapolated_middle.zip',
-            'files/primary/sub-259/sam-259-Fund/ses-5HT_SST/microscopy/slide_2_24052017_5HT_SST_fundus_corpus_Experiment-35-Stitching-03-Split_Scenes-04.czi': 'files/primary/sam-259-Fund/ses-5HT_SST/microscopy/slide_2_24052017_5HT_SST_fundus_corpus_Experiment-35-Stitching-03-Split_Scenes-04.czi',
-            'files/primary/sub-259/sam-259-Fund/ses-5HT_SST/microscopy/RoiSet.zip': 'files/primary/sam-259-Fund/ses-5HT_SST/microscopy/RoiSet.zip',
-            'files/primary/sub-259/sam-259-Fund/ses-5HT_SST/microscopy/CellCounter_middle.xml': 'files/primary/sam-259-Fund/ses-5HT_SST/microscopy/CellCounter_middle.xml',
-            'files/primary/sub-259/sam-259-Fund/ses-5HT_SST/microscopy/slide_2_24052017_5HT_SST_fundus_Experiment-35.czi': 'files/primary/sam-259-Fund/ses-5HT_SST/microscopy/slide_2_24052017_5HT_SST_fundus_Experiment-35.czi',
-            'files/primary/sub-259/sam-259-Fund/ses-5HT_SST/microscopy/top.tif': 'files/primary/sam-259-Fund/ses-5HT_SST/microscopy/top.tif',
-            'files/primary/sub-259/sam-259-Fund/ses-5HT_SST/microscopy/middle.tif': 'files/primary/sam-259-Fund/ses-5HT_SST/microscopy/middle.tif',
-            'files/primary/sub-259/sam-259-Fund/ses-5HT_SST/microscopy/CellCounter_bottom.xml': 'files/primary/sam-259-Fund/ses-5HT_SST/microscopy/CellCounter_bottom.xml',
-            'files/primary/sub-259/sam-259-Fund/ses-Ghrelin_SST/microscopy/half_of_middle.tif': 'files/primary/sam-259-Fund/ses-Ghrelin_SST/microscopy/half_of_middle.tif',
-            'files/primary/sub-259/sam-259-Fund/ses-5HT_SST/microscopy/bottom.tif': 'files/primary/sam-259-Fund/ses-5HT_SST/microscopy/bottom.tif',
-            'files/primary/sub-259/sam-259-Fund/ses-5HT_SST/microscopy/slide_2_24052017_5HT_SST_Experiment-1610_fundus.czi': 'files/primary/sam-259-Fund/ses-5HT_SST/microscopy/slide_2_24052017_5HT_SST_Experiment-1610_fundus.czi',
-            'files/primary/sub-259/sam-259-Fund/ses-5HT_SST/microscopy/CellCounter_top.xml': 'files/primary/sam-259-Fund/ses-5HT_SST/microscopy/CellCounter_top.xml',
-            'files/primary/sub-259/sam-259-Corp/ses-Gh_5HT/microscopy/slide_1_24052017_gastrin_FR_5HT_red_ghrelin_GR_Corpus_Experiment-1609-Split_Scenes-03-Stitching-02.czi': 'files/primary/sam-259-Corp/ses-Gh_5HT/microscopy/slide_1_24052017_gastrin_FR_5HT_red_ghrelin_GR_Corpus_Experiment-1609-Split_Scenes-03-Stitching-02.czi',
-            'files/primary/sub-259/sam-259-Corp/ses-Gh_5HT/microscopy/RoiSet_all_thirds.zip': 'files/primary/sam-259-Corp/ses-Gh_5HT/microscopy/RoiSet_all_thirds.zip',
-            'files/primary/sub-259/sam-259-Corp/ses-Gh_5HT/microscopy/CellCounter_bottom.xml': 'files/primary/sam-259-Corp/ses-Gh_5HT/microscopy/CellCounter_bottom.xml',
-            'files/primary/sub-259/sam-259-Corp/ses-Gh_5HT/microscopy/Ghrelin7_5HT2_gastrin1__corpus.xlsx': "files/primary/sam-259-Corp/ses-Gh_5HT/microscopy/Ghrelin7_5HT2_gastrin1'_corpus.xlsx",
-            'files/primary/sub-259/sam-259-Corp/ses-Gh_5HT/microscopy/middle.tif': 'files/primary/sam-259-Corp/ses-Gh_5HT/microscopy/middle.tif',
-            'files/primary/sub-259/sam-259-Corp/ses-Gh_5HT/microscopy/CellCounter_middle.xml': 'files/primary/sam-259-Corp/ses-Gh_5HT/microscopy/CellCounter_middle.xml',
-            'files/primary/sub-259/sam-259-Corp/ses-5HT_SST/microscopy/CellCounter_middle.xml': 'files/primary/sam-259-Corp/ses-5HT_SST/microscopy/CellCounter_middle.xml',
-            'files/primary/sub-259/sam-259-Corp/ses-Gh_5HT/microscopy/CellCounter_top.xml': 'files/primary/sam-259-Corp/ses-Gh_5HT/microscopy/CellCounter_top.xml',
-            'files/primary/sub-259/sam-259-Corp/ses-Gh_5HT/microscopy/slide_1_24052017_gastrin_FR_5HT_red_ghrelin_GR_Corpus_Experiment-1609-Split_Scenes-03.czi': 'files/primary/sam-259-Corp/ses-Gh_5HT/microscopy/slide_1_24052017_gastrin_FR_5HT_red_ghrelin_GR_Corpus_Experiment-1609-Split_Scenes-03.czi',
-            'files/primary/sub-259/sam-259-Corp/ses-5HT_SST/microscopy/5HT3_SST4_corpus.xlsx': 'files/primary/sam-259-Corp/ses-5HT_SST/microscopy/5HT3_SST4_corpus.xlsx',
-            'files/primary/sub-259/sam-259-Corp/ses-5HT_SST/microscopy/slide_2_24052017_5HT_SST_corpus_Experiment-35.czi': 'files/primary/sam-259-Corp/ses-5HT_SST/microscopy/slide_2_24052017_5HT_SST_corpus_Experiment-35.czi',
-            'files/primary/sub-259/sam-259-Corp/ses-5HT_SST/microscopy/top.tif': 'files/primary/sam-259-Corp/ses-5HT_SST/microscopy/top.tif',
-            'files/primary/sub-259/sam-259-Corp/ses-5HT_SST/microscopy/CellCounter_bottom.xml': 'files/primary/sam-259-Corp/ses-5HT_SST/microscopy/CellCounter_bottom.xml',
-            'files/primary/sub-259/sam-259-Corp/ses-5HT_SST/microscopy/middle.tif': 'files/primary/sam-259-Corp/ses-5HT_SST/microscopy/middle.tif',
-            'files/primary/sub-259/sam-259-Corp/ses-Gh_5HT/microscopy/top.tif': 'files/primary/sam-259-Corp/ses-Gh_5HT/microscopy/top.tif',
-            'files/primary/sub-259/sam-259-Corp/ses-5HT_SST/microscopy/slide_2_24052017_5HT_SST_fundus_corpus_Experiment-35-Stitching-03-Split_Scenes-05.czi': 'files/primary/sam-259-Corp/ses-5HT_SST/microscopy/slide_2_24052017_5HT_SST_fundus_corpus_Experiment-35-Stitching-03-Split_Scenes-05.czi',
-            'files/primary/sub-259/sam-259-Corp/ses-5HT_SST/microscopy/CellCounter_top.xml': 'files/primary/sam-259-Corp/ses-5HT_SST/microscopy/CellCounter_top.xml',
-            'files/primary/sub-259/sam-259-Corp/ses-5HT_SST/microscopy/bottom.tif': 'files/primary/sam-259-Corp/ses-5HT_SST/microscopy/bottom.tif',
-            'files/primary/sub-264/sam-264-Corp/ses-Ghrelin_PCST/microscopy/slide_1-corpus-06092017-Experiment-64-Split_Scenes-02-Stitching-05.czi': 'files/primary/sam-264-Corp/ses-Ghrelin_PCST/microscopy/slide_1-corpus-06092017-Experiment-64-Split_Scenes-02-Stitching-05.czi',
-            'files/primary/sub-264/sam-264-Corp/ses-Ghrelin_SST/microscopy/ghrelin5_SST2_Corpus.xlsx': 'files/primary/sam-264-Corp/ses-Ghrelin_SST/microscopy/ghrelin5_SST2_Corpus.xlsx',
-            'files/primary/sub-264/sam-264-Corp/ses-Ghrelin_SST/microscopy/CellCounter_middle.xml': 'files/primary/sam-264-Corp/ses-Ghrelin_SST/microscopy/CellCounter_middle.xml',
-            'files/primary/sub-264/sam-264-Corp/ses-Ghrelin_PCST/microscopy/slide_1-corpus-06092017-Experiment-64-Split_Scenes-02.czi': 'files/primary/sam-264-Corp/ses-Ghrelin_PCST/microscopy/slide_1-corpus-06092017-Experiment-64-Split_Scenes-02.czi',
-            'files/primary/sub-264/sam-264-Corp/ses-Ghrelin_SST/microscopy/07032017_slide_corpus_264_Experiment-421-Split_Scenes-02-Stitching-05.czi': 'files/primary/sam-264-Corp/ses-Ghrelin_SST/microscopy/07032017_slide_corpus_264_Experiment-421-Split_Scenes-02-Stitching-05.czi',
-            'files/primary/sub-264/sam-264-Corp/ses-Ghrelin_SST/microscopy/RoiSet_all_thirds.zip': 'files/primary/sam-264-Corp/ses-Ghrelin_SST/microscopy/RoiSet_all_thirds.zip',
-            'files/primary/sub-264/sam-264-Corp/ses-Ghrelin_SST/microscopy/CellCounter_bottom.xml': 'files/primary/sam-264-Corp/ses-Ghrelin_SST/microscopy/CellCounter_bottom.xml',
-            'files/primary/sub-264/sam-264-Corp/ses-Ghrelin_SST/microscopy/07032017_slide_corpus_264_Experiment-421-Split_Scenes-02.czi': 'files/primary/sam-264-Corp/ses-Ghrelin_SST/microscopy/07032017_slide_corpus_264_Experiment-421-Split_Scenes-02.czi',
-            'files/primary/sub-264/sam-264-Corp/ses-Ghrelin_SST/microscopy/middle.tif': 'files/primary/sam-264-Corp/ses-Ghrelin_SST/microscopy/middle.tif',
-            'files/primary/sub-264/sam-264-Corp/ses-Ghrelin_SST/microscopy/top.tif': 'files/primary/sam-264-Corp/ses-Ghrelin_SST/microscopy/top.tif',
-            'files/primary/sub-264/sam-264-Corp/ses-Ghrelin_SST/microscopy/CellCounter_top.xml': 'files/primary/sam-264-Corp/ses-Ghrelin_SST/microscopy/CellCounter_top.xml',
-            'files/primary/sub-264/sam-264-Fund/ses-5HT_PCST/microscopy/slide_2-06092017-Panc_H__5HT-Experiment-128-Split_Scenes-08-Stitching-12.czi': 'files/primary/sam-264-Fund/ses-5HT_PCST/microscopy/slide_2-06092017-Panc_H%2B_5HT-Experiment-128-Split_Scenes-08-Stitching-12.czi',
-            'files/primary/sub-264/sam-264-Fund/ses-Ghrelin_PCST/microscopy/ghrelin_cluster_analysis_sheet3_RoiSet.zip': 'files/primary/sam-264-Fund/ses-Ghrelin_PCST/microscopy/ghrelin_cluster_analysis_sheet3_RoiSet.zip',
-            'files/primary/sub-264/sam-264-Fund/ses-5HT_PCST/microscopy/slide_2-06092017-Panc_H__5HT-Experiment-128-Split_Scenes-08.czi': 'files/primary/sam-264-Fund/ses-5HT_PCST/microscopy/slide_2-06092017-Panc_H%2B_5HT-Experiment-128-Split_Scenes-08.czi',
-            'files/primary/sub-264/sam-264-Fund/ses-Ghrelin_PCST/microscopy/screenshot_of_clumps_analysis.tif': 'files/primary/sam-264-Fund/ses-Ghrelin_PCST/microscopy/screenshot_of_clumps_analysis.tif',
-            'files/primary/sub-264/sam-264-Corp/ses-Ghrelin_SST/microscopy/bottom.tif': 'files/primary/sam-264-Corp/ses-Ghrelin_SST/microscopy/bottom.tif',
-            'files/primary/sub-264/sam-264-Fund/ses-Ghrelin_SST/microscopy/20022017_slide_1_test_ghrelin_somatostatin_fundus_264_GOOD_ONE_Experiment-158.czi': 'files/primary/sam-264-Fund/ses-Ghrelin_SST/microscopy/20022017_slide_1_test_ghrelin_somatostatin_fundus_264_GOOD_ONE_Experiment-158.czi',
-            'files/primary/sub-264/sam-264-Fund/ses-Ghrelin_SST/microscopy/Roi_extrapolated_bottom.zip': 'files/primary/sam-264-Fund/ses-Ghrelin_SST/microscopy/Roi_extrapolated_bottom.zip',
-            'files/primary/sub-264/sam-264-Fund/ses-Ghrelin_PCST/microscopy/slide_1-fundus-06092017-Experiment-62-Split_Scenes-08.czi': 'files/primary/sam-264-Fund/ses-Ghrelin_PCST/microscopy/slide_1-fundus-06092017-Experiment-62-Split_Scenes-08.czi',
-            'files/primary/sub-264/sam-264-Fund/ses-Ghrelin_SST/microscopy/RoiSet_thirds.zip': 'files/primary/sam-264-Fund/ses-Ghrelin_SST/microscopy/RoiSet_thirds.zip',
-            'files/primary/sub-264/sam-264-Fund/ses-Ghrelin_SST/microscopy/RoiSet_top_third.zip': 'files/primary/sam-264-Fund/ses-Ghrelin_SST/microscopy/RoiSet_top_third.zip',
-            'files/primary/sub-264/sam-264-Fund/ses-Ghrelin_PCST/microscopy/slide_1-fundus-06092017-Experiment-62-Split_Scenes-08-Stitching-08.czi': 'files/primary/sam-264-Fund/ses-Ghrelin_PCST/microscopy/slide_1-fundus-06092017-Experiment-62-Split_Scenes-08-Stitching-08.czi',
-            'files/primary/sub-264/sam-264-Fund/ses-Ghrelin_SST/microscopy/RoiSet_bottom_third.zip': 'files/primary/sam-264-Fund/ses-Ghrelin_SST/microscopy/RoiSet_bottom_third.zip',
-            'files/primary/sub-264/sam-264-Fund/ses-Ghrelin_SST/microscopy/20022017_slide_1_test_ghrelin_somatostatin_fundus_264_GOOD_ONE_Experiment-158-Stitching-03.czi': 'files/primary/sam-264-Fund/ses-Ghrelin_SST/microscopy/20022017_slide_1_test_ghrelin_somatostatin_fundus_264_GOOD_ONE_Experiment-158-Stitching-03.czi',
-            'files/primary/sub-264/sam-264-Fund/ses-Ghrelin_SST/microscopy/Roi_extrapolated_top.zip': 'files/primary/sam-264-Fund/ses-Ghrelin_SST/microscopy/Roi_extrapolated_top.zip',
-            'files/primary/sub-264/sam-264-Fund/ses-Ghrelin_SST/microscopy/Ghrelin_SST_Fundus2.xlsx': 'files/primary/sam-264-Fund/ses-Ghrelin_SST/microscopy/Ghrelin_SST_Fundus2.xlsx',
-            'files/primary/sub-264/sam-264-Fund/ses-Ghrelin_SST/microscopy/middle.tif': 'files/primary/sam-264-Fund/ses-Ghrelin_SST/microscopy/middle.tif',
-            'files/primary/sub-264/sam-264-Fund/ses-Ghrelin_SST/microscopy/13022017_slide_A_ghrelin_somatostatin_fundus_2_bottom_Experiment-65-Split_Scenes-02.czi': 'files/primary/sam-264-Fund/ses-Ghrelin_SST/microscopy/13022017_slide_A_ghrelin_somatostatin_fundus_2_bottom_Experiment-65-Split_Scenes-02.czi',
-            'files/primary/sub-264/sam-264-Fund/ses-Ghrelin_SST/microscopy/top.tif': 'files/primary/sam-264-Fund/ses-Ghrelin_SST/microscopy/top.tif',
-            'files/primary/sub-264/sam-264-Fund/ses-Ghrelin_SST/microscopy/RoiSet_parietal_cells.zip': 'files/primary/sam-264-Fund/ses-Ghrelin_SST/microscopy/RoiSet_parietal_cells.zip',
-            'files/primary/sub-264/sam-264-Fund/ses-Ghrelin_SST/microscopy/Roi_extrapolated_middle.zip': 'files/primary/sam-264-Fund/ses-Ghrelin_SST/microscopy/Roi_extrapolated_middle.zip',
-            'files/primary/sub-264/sam-264-Fund/ses-Ghrelin_SST/microscopy/13022017_slide_A_ghrelin_somatostatin_fundus_2_bottom_Experiment-65-Split_Scenes-02-Stitching-02.czi': 'files/primary/sam-264-Fund/ses-Ghrelin_SST/microscopy/13022017_slide_A_ghrelin_somatostatin_fundus_2_bottom_Experiment-65-Split_Scenes-02-Stitching-02.czi',
-            'files/primary/sub-264/sam-264-Fund/ses-Ghrelin_SST/microscopy/RoiSet_middle_third.zip': 'files/primary/sam-264-Fund/ses-Ghrelin_SST/microscopy/RoiSet_middle_third.zip',
-            'files/primary/sub-263/sam-263-Fund/ses-SST_PCST/microscopy/slide_1_26092017-Experiment-13-fundus263.czi': 'files/primary/sam-263-Fund/ses-SST_PCST/microscopy/slide_1_26092017-Experiment-13-fundus263.czi',
-            'files/primary/sub-264/sam-264-Fund/ses-Ghrelin_SST/microscopy/bottom.tif': 'files/primary/sam-264-Fund/ses-Ghrelin_SST/microscopy/bottom.tif',
-            'files/primary/sub-263/sam-263-Fund/ses-5HT_PCST/microscopy/slide_2_06092017_Experiment-238-Split_Scenes-13.czi': 'files/primary/sam-263-Fund/ses-5HT_PCST/microscopy/slide_2_06092017_Experiment-238-Split_Scenes-13.czi',
-            'files/primary/sub-263/sam-263-Fund/ses-Ghrelin_PCST/microscopy/slide_1-fundus-06092017-Experiment-62-Stitching-02-Split_Scenes-05.czi': 'files/primary/sam-263-Fund/ses-Ghrelin_PCST/microscopy/slide_1-fundus-06092017-Experiment-62-Stitching-02-Split_Scenes-05.czi',
-            'files/primary/sub-263/sam-263-Fund/ses-Ghrelin_PCST/microscopy/printscreen_clumps_analysis.tif': 'files/primary/sam-263-Fund/ses-Ghrelin_PCST/microscopy/printscreen_clumps_analysis.tif',
-            'files/primary/sub-259/sam-259-Fund/ses-Ghrelin_SST/microscopy/half_of_top-1.tif': 'files/primary/sam-259-Fund/ses-Ghrelin_SST/microscopy/half_of_top-1.tif',
-            'files/primary/sub-263/sam-263-Fund/ses-Ghrelin_PCST/microscopy/ghrelin_cluster_analysis_sheet4_RoiSet.zip': 'files/primary/sam-263-Fund/ses-Ghrelin_PCST/microscopy/ghrelin_cluster_analysis_sheet4_RoiSet.zip',
-            'files/primary/sub-263/sam-263-Fund/ses-Ghrelin_PCST/microscopy/slide_1-fundus-06092017-Experiment-62-Split_Scenes-09.czi': 'files/primary/sam-263-Fund/ses-Ghrelin_PCST/microscopy/slide_1-fundus-06092017-Experiment-62-Split_Scenes-09.czi',
-            'files/primary/sub-263/sam-263-Corp/ses-5HT_PCST/microscopy/slide_4-26092017-Panc_H__5HT-Experiment-49.czi': 'files/primary/sam-263-Corp/ses-5HT_PCST/microscopy/slide_4-26092017-Panc_H%2B_5HT-Experiment-49.czi',
-            'files/primary/sub-263/sam-263-Fund/ses-5HT_PCST/microscopy/slide_2_06092017_Experiment-238-Split_Scenes-13-Stitching-15.czi': 'files/primary/sam-263-Fund/ses-5HT_PCST/microscopy/slide_2_06092017_Experiment-238-Split_Scenes-13-Stitching-15.czi',
-            'files/primary/sub-263/sam-263-Corp/ses-Ghrelin_PCST/microscopy/slide_1-corpus-06092017-Experiment-64-Split_Scenes-03-Stitching-06.czi': 'files/primary/sam-263-Corp/ses-Ghrelin_PCST/microscopy/slide_1-corpus-06092017-Experiment-64-Split_Scenes-03-Stitching-06.czi',
-            'files/primary/sub-263/sam-263-Corp/ses-Ghrelin_SST/microscopy/CellCounter_middle.xml': 'files/primary/sam-263-Corp/ses-Ghrelin_SST/microscopy/CellCounter_middle.xml',
-            'files/primary/sub-263/sam-263-Corp/ses-Ghrelin_PCST/microscopy/slide_1-corpus-06092017-Experiment-64-Split_Scenes-03.czi': 'files/primary/sam-263-Corp/ses-Ghrelin_PCST/microscopy/slide_1-corpus-06092017-Experiment-64-Split_Scenes-03.czi',
-            'files/primary/sub-263/sam-263-Corp/ses-Ghrelin_SST/microscopy/07032017_slide_corpus_263_Experiment-421-Split_Scenes-03.czi': 'files/primary/sam-263-Corp/ses-Ghrelin_SST/microscopy/07032017_slide_corpus_263_Experiment-421-Split_Scenes-03.czi',
-            'files/primary/sub-263/sam-263-Corp/ses-Ghrelin_SST/microscopy/CellCounter_bottom.xml': 'files/primary/sam-263-Corp/ses-Ghrelin_SST/microscopy/CellCounter_bottom.xml',
-            'files/primary/sub-263/sam-263-Corp/ses-Ghrelin_SST/microscopy/07032017_slide_corpus_263_Experiment-421-Split_Scenes-03-Stitching-06.czi': 'files/primary/sam-263-Corp/ses-Ghrelin_SST/microscopy/07032017_slide_corpus_263_Experiment-421-Split_Scenes-03-Stitching-06.czi',
-            'files/primary/sub-263/sam-263-Corp/ses-Ghrelin_SST/microscopy/RoiSet_thirds.zip': 'files/primary/sam-263-Corp/ses-Ghrelin_SST/microscopy/RoiSet_thirds.zip',
-            'files/primary/sub-263/sam-263-Corp/ses-Ghrelin_SST/microscopy/middle.tif': 'files/primary/sam-263-Corp/ses-Ghrelin_SST/microscopy/middle.tif',
-            'files/primary/sub-263/sam-263-Corp/ses-Ghrelin_SST/microscopy/top.tif': 'files/primary/sam-263-Corp/ses-Ghrelin_SST/microscopy/top.tif',
-            'files/primary/sub-263/sam-263-Corp/ses-Ghrelin_SST/microscopy/ghrelin6_SST3_Corpus.xlsx': 'files/primary/sam-263-Corp/ses-Ghrelin_SST/microscopy/ghrelin6_SST3_Corpus.xlsx',
-            'files/primary/sub-263/sam-263-Corp/ses-Ghrelin_SST/microscopy/bottom.tif': 'files/primary/sam-263-Corp/ses-Ghrelin_SST/microscopy/bottom.tif',
-            'files/derivative/Combined_data_table.xlsx': 'files/derivative/Combined data table.xlsx',
-            'files/primary/sub-263/sam-263-Corp/ses-Ghrelin_SST/microscopy/CellCounter_top.xml': 'files/primary/sam-263-Corp/ses-Ghrelin_SST/microscopy/CellCounter_top.xml',
-            'files/derivative/Fig_2_Cell_distrib_Histograms.tif': 'files/derivative/Fig 2 Cell distrib Histograms.tif',
-            'files/derivative/Fig_8_5HT_specificity_mast_cells_ECL.cdr': 'files/derivative/Fig 8 5HT specificity mast cells ECL.cdr',
-            'files/derivative/Fig_10_ECL_cells.tif': 'files/derivative/Fig 10 ECL cells.tif',
-            'files/derivative/Ghrelin_cluster_analysis.xlsx': 'files/derivative/Ghrelin cluster analysis.xlsx',
-            'files/derivative/Fig_2_Cell_distrib_Histograms.cdr': 'files/derivative/Fig 2 Cell distrib Histograms.cdr',
-            'files/derivative/Fig_5_GhrelinCell_types.tif': 'files/derivative/Fig 5 GhrelinCell types.tif',
-            'files/derivative/Fig_3_Colocalisation.cdr': 'files/derivative/Fig 3 Colocalisation.cdr',
-            'files/derivative/Fig_9_5HT_Shapes.tif': 'files/derivative/Fig 9 5HT Shapes.tif',
-            'files/derivative/Fig_3_Colocalisation.tif': 'files/derivative/Fig 3 Colocalisation.tif',
-            'files/derivative/Fig_6_Ghrelin_Clumps.cdr': 'files/derivative/Fig 6 Ghrelin Clumps.cdr',
-            'files/derivative/Fig_1_low_power_viewsFINAL.cdr': 'files/derivative/Fig 1 low power viewsFINAL.cdr',
-            'files/derivative/Fig_6_Ghrelin_Clumps.tif': 'files/derivative/Fig 6 Ghrelin Clumps.tif',
-            'files/derivative/Fig_5_GhrelinCell_types.cdr': 'files/derivative/Fig 5 GhrelinCell types.cdr',
-            'files/derivative/Fig_9_5HT_Shapes.cdr': 'files/derivative/Fig 9 5HT Shapes.cdr',
-            'files/derivative/Fig_1_low_power_viewsFINAL.tif': 'files/derivative/Fig 1 low power viewsFINAL.tif',
-            'files/derivative/Fig_7_Ghrelin_Relation_with_other_cell_types.tif': 'files/derivative/Fig 7 Ghrelin Relation with other cell types.tif',
-            'files/derivative/Fig_4_Colocalisation_Histograms.tif': 'files/derivative/Fig 4 Colocalisation Histograms.tif',
-            'files/derivative/Fig_4_Colocalisation_Histograms.cdr': 'files/derivative/Fig 4 Colocalisation Histograms.cdr',
-            'files/derivative/Fig_10_ECL_cells.cdr': 'files/derivative/Fig 10 ECL cells.cdr',
-            'files/derivative/Fig_7_Ghrelin_Relation_with_other_cell_types.cdr': 'files/derivative/Fig 7 Ghrelin Relation with other cell types.cdr',
-            'files/derivative/Fig_8_5HT_specificity_mast_cells_ECL.tif': 'files/derivative/Fig 8 5HT specificity mast cells ECL.tif',
-            'files/primary/Fig18_to_21/Figure20/Sundt2015_Fig5A (1).PNG.png': 'files/primary/Fig18_to_21/Figure20/Sundt2015_Fig5A (1).png',
-            'files/primary/Fig18_to_21/Figure18/Tigerholm_2014_Fig4C.PNG.png': 'files/primary/Fig18_to_21/Figure18/Tigerholm_2014_Fig4C.png',
-            'files/primary/Fig18_to_21/Figure20/Sundt2015_Fig6A1 (1).PNG.png': 'files/primary/Fig18_to_21/Figure20/Sundt2015_Fig6A1 (1).png',
-            'files/primary/Fig18_to_21/Figure21/Rattay1993_Fig3A_Middle.PNG.png': 'files/primary/Fig18_to_21/Figure21/Rattay1993_Fig3A_Middle.png',
-            'files/primary/Fig18_to_21/Figure21/Rattay1993_Fig3A_Bottom.PNG.png': 'files/primary/Fig18_to_21/Figure21/Rattay1993_Fig3A_Bottom.png',
-            'files/primary/Fig18_to_21/Figure21/Rattay1993_Fig6A_Top.PNG.png': 'files/primary/Fig18_to_21/Figure21/Rattay1993_Fig6A_Top.png',
-            'files/primary/Fig18_to_21/Figure18/Tigerholm_2014_Fig4A.PNG.png': 'files/primary/Fig18_to_21/Figure18/Tigerholm_2014_Fig4A.png',
-            'files/primary/Fig18_to_21/Figure21/Rattay1993_Fig3A_Top.PNG.png': 'files/primary/Fig18_to_21/Figure21/Rattay1993_Fig3A_Top.png',
-            'files/primary/Fig18_to_21/Figure21/Rattay1993_Fig6A_Bottom.PNG.png': 'files/primary/Fig18_to_21/Figure21/Rattay1993_Fig6A_Bottom.png',
-            'files/primary/Fig15/ValidationData/Woodbury_1990_Fig2B.PNG.png': 'files/primary/Fig15/ValidationData/Woodbury_1990_Fig2B.png',
-            'files/primary/Fig18_to_21/Figure21/Rattay1993_Fig6A_Middle.PNG.png': 'files/primary/Fig18_to_21/Figure21/Rattay1993_Fig6A_Middle.png',
-            'files/primary/Fig15/ValidationData/Hursh_1939_Fig2.PNG.png': 'files/primary/Fig15/ValidationData/Hursh_1939_Fig2.png',
-            'files/primary/Fig15/ValidationData/Woodbury_1990_Fig2A.PNG.png': 'files/primary/Fig15/ValidationData/Woodbury_1990_Fig2A.png',
-            'files/primary/Fig15/ValidationData/Paintal_1966_Fig2B.PNG.png': 'files/primary/Fig15/ValidationData/Paintal_1966_Fig2B.png',
-            'files/primary/Fig15/ValidationData/Grundfest_1939_Fig14.PNG.png': 'files/primary/Fig15/ValidationData/Grundfest_1939_Fig14.png',
-            'files/primary/Fig15/ValidationData/Iggo1958_Fig7(1).PNG.png': 'files/primary/Fig15/ValidationData/Iggo1958_Fig7(1).png',
-            'files/primary/Fig15/ValidationData/BoydAndKalu_1979_Fig6.PNG.png': 'files/primary/Fig15/ValidationData/BoydAndKalu_1979_Fig6.png',
-            'files/primary/Fig15/ValidationData/Grundfest_1938_Fig10.PNG.png': 'files/primary/Fig15/ValidationData/Grundfest_1938_Fig10.png',
-            'files/primary/Fig15/ValidationData/Paintal_1967_Fig1.PNG.png': 'files/primary/Fig15/ValidationData/Paintal_1967_Fig1.png',
-            'files/primary/Fig15/ValidationData/Koslow_1973_Fig4.PNG.png': 'files/primary/Fig15/ValidationData/Koslow_1973_Fig4.png',
-            'files/primary/Fig15/ValidationData/Castoro_2011_Fig9B.PNG.png': 'files/primary/Fig15/ValidationData/Castoro_2011_Fig9B.png',
-            'files/primary/Fig15/ValidationData/Grundfest_1938_Fig11.PNG.png': 'files/primary/Fig15/ValidationData/Grundfest_1938_Fig11.png',
-            'files/primary/Fig14/ValidationData/Woodbury_1990_Fig2B.PNG.png': 'files/primary/Fig14/ValidationData/Woodbury_1990_Fig2B.png',
-            'files/primary/Fig14/ValidationData/Woodbury_1990_Fig2A.PNG.png': 'files/primary/Fig14/ValidationData/Woodbury_1990_Fig2A.png',
-            'files/primary/Fig14/ValidationData/Paintal_1966_Fig2B.PNG.png': 'files/primary/Fig14/ValidationData/Paintal_1966_Fig2B.png',
-            'files/primary/Fig14/ValidationData/Hursh_1939_Fig2.PNG.png': 'files/primary/Fig14/ValidationData/Hursh_1939_Fig2.png',
-            'files/primary/Fig14/ValidationData/Grundfest_1939_Fig14.PNG.png': 'files/primary/Fig14/ValidationData/Grundfest_1939_Fig14.png',
-            'files/primary/Fig14/ValidationData/BoydAndKalu_1979_Fig6.PNG.png': 'files/primary/Fig14/ValidationData/BoydAndKalu_1979_Fig6.png',
-            'files/primary/Fig14/ValidationData/Iggo1958_Fig7 (1).PNG.png': 'files/primary/Fig14/ValidationData/Iggo1958_Fig7 (1).png',
-            'files/primary/Fig14/ValidationData/Paintal_1967_Fig1.PNG.png': 'files/primary/Fig14/ValidationData/Paintal_1967_Fig1.png',
-            'files/primary/Fig14/ValidationData/Grundfest_1938_Fig10.PNG.png': 'files/primary/Fig14/ValidationData/Grundfest_1938_Fig10.png',
-            'files/primary/Fig14/ValidationData/Koslow_1973_Fig4.PNG.png': 'files/primary/Fig14/ValidationData/Koslow_1973_Fig4.png',
-            'files/primary/Fig14/ValidationData/Grundfest_1938_Fig11.PNG.png': 'files/primary/Fig14/ValidationData/Grundfest_1938_Fig11.png',
-            'files/primary/Fig14/ValidationData/Castoro_2011_Fig9B.PNG.png': 'files/primary/Fig14/ValidationData/Castoro_2011_Fig9B.png',
-            'files/primary/Human Colon 3D/sub_4656/92_Adult_Right_Colon_4656_20x_anti_HucD_488_anti_nNOS_594_anti_CHAT_647_4.tif': 'files/primary/Human Colon 3D/sub_4656/92 Adult Right Colon 4656 20x anti HucD 488 anti nNOS 594 anti CHAT 647 4.tif',
-            'files/primary/Human Colon 3D/sub_4656/195_Adult_Right_Colon_4656_20x_anti_HucD_594_anti_calretinin_647_1.tif': 'files/primary/Human Colon 3D/sub_4656/195 Adult Right Colon 4656 20x anti HucD 594 anti calretinin 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4656/235_Adult_Right_Colon_4656_20x_anti_HucD_594_anti_VAChT_488_anti_ChAT_647_5.tif': 'files/primary/Human Colon 3D/sub_4656/235 Adult Right Colon 4656 20x anti HucD 594 anti VAChT 488 anti ChAT 647 5.tif',
-            'files/primary/Human Colon 3D/sub_4656/236_Adult_Right_Colon_4656_10x_anti_HucD_594_anti_VAChT_488_anti_ChAT_647_1.tif': 'files/primary/Human Colon 3D/sub_4656/236 Adult Right Colon 4656 10x anti HucD 594 anti VAChT 488 anti ChAT 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4656/198_Adult_Right_Colon_4656_20x_anti_HucD_594_anti_calretinin_647_4.tif': 'files/primary/Human Colon 3D/sub_4656/198 Adult Right Colon 4656 20x anti HucD 594 anti calretinin 647 4.tif',
-            'files/primary/Human Colon 3D/sub_4656/196_Adult_Right_Colon_4656_20x_anti_HucD_594_anti_calretinin_647_2.tif': 'files/primary/Human Colon 3D/sub_4656/196 Adult Right Colon 4656 20x anti HucD 594 anti calretinin 647 2.tif',
-            'files/primary/Human Colon 3D/sub_4656/89_Adult_Right_Colon_4656_20x_anti_HucD_488_anti_nNOS_594_anti_CHAT_647_1.tif': 'files/primary/Human Colon 3D/sub_4656/89 Adult Right Colon 4656 20x anti HucD 488 anti nNOS 594 anti CHAT 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4656/232_Adult_Right_Colon_4656_20x_anti_HucD_594_anti_VAChT_488_anti_ChAT_647_2.tif': 'files/primary/Human Colon 3D/sub_4656/232 Adult Right Colon 4656 20x anti HucD 594 anti VAChT 488 anti ChAT 647 2.tif',
-            'files/primary/Human Colon 3D/sub_4656/231_Adult_Right_Colon_4656_20x_anti_HucD_594_anti_VAChT_488_anti_ChAT_647_1.tif': 'files/primary/Human Colon 3D/sub_4656/231 Adult Right Colon 4656 20x anti HucD 594 anti VAChT 488 anti ChAT 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4656/200_Adult_Right_Colon_4656_10x_stitich_anti_HucD_594_anti_calretinin_647_1.tif': 'files/primary/Human Colon 3D/sub_4656/200 Adult Right Colon 4656 10x stitich anti HucD 594 anti calretinin 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4656/199_Adult_Right_Colon_4656_20x_anti_HucD_594_anti_calretinin_647_5.tif': 'files/primary/Human Colon 3D/sub_4656/199 Adult Right Colon 4656 20x anti HucD 594 anti calretinin 647 5.tif',
-            'files/primary/Human Colon 3D/sub_4656/233_Adult_Right_Colon_4656_20x_anti_HucD_594_anti_VAChT_488_anti_ChAT_647_3.tif': 'files/primary/Human Colon 3D/sub_4656/233 Adult Right Colon 4656 20x anti HucD 594 anti VAChT 488 anti ChAT 647 3.tif',
-            'files/primary/Human Colon 3D/sub_4656/93_Adult_Right_Colon_4656_20x_anti_HucD_488_anti_nNOS_594_anti_CHAT_647_5.tif': 'files/primary/Human Colon 3D/sub_4656/93 Adult Right Colon 4656 20x anti HucD 488 anti nNOS 594 anti CHAT 647 5.tif',
-            'files/primary/Human Colon 3D/sub_4656/96_Adult_Right_Colon_4656_20x_anti_HucD_488_anti_nNOS_594_anti_CHAT_647_8.tif': 'files/primary/Human Colon 3D/sub_4656/96 Adult Right Colon 4656 20x anti HucD 488 anti nNOS 594 anti CHAT 647 8.tif',
-            'files/primary/Human Colon 3D/sub_4656/98_Adult_Right_Colon_4656_10x_stitch_anti_HucD_488_anti_nNOS_594_anti_CHAT_647_1.tif': 'files/primary/Human Colon 3D/sub_4656/98 Adult Right Colon 4656 10x stitch anti HucD 488 anti nNOS 594 anti CHAT 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4656/90_Adult_Right_Colon_4656_20x_anti_HucD_488_anti_nNOS_594_anti_CHAT_647_2.tif': 'files/primary/Human Colon 3D/sub_4656/90 Adult Right Colon 4656 20x anti HucD 488 anti nNOS 594 anti CHAT 647 2.tif',
-            'files/primary/Human Colon 3D/sub_4656/97_Adult_Right_Colon_4656_20x_anti_HucD_488_anti_nNOS_594_anti_CHAT_647_9.tif': 'files/primary/Human Colon 3D/sub_4656/97 Adult Right Colon 4656 20x anti HucD 488 anti nNOS 594 anti CHAT 647 9.tif',
-            'files/primary/Human Colon 3D/sub_4656/197_Adult_Right_Colon_4656_20x_anti_HucD_594_anti_calretinin_647_3.tif': 'files/primary/Human Colon 3D/sub_4656/197 Adult Right Colon 4656 20x anti HucD 594 anti calretinin 647 3.tif',
-            'files/primary/Human Colon 3D/sub_4656/94_Adult_Right_Colon_4656_20x_anti_HucD_488_anti_nNOS_594_anti_CHAT_647_6.tif': 'files/primary/Human Colon 3D/sub_4656/94 Adult Right Colon 4656 20x anti HucD 488 anti nNOS 594 anti CHAT 647 6.tif',
-            'files/primary/Human Colon 3D/sub_4514/136_Adult_Right_Colon_4514_20x_anti_HucD_488_anti_S100B_594_anti_PHOX2B_647_3.tif': 'files/primary/Human Colon 3D/sub_4514/136 Adult Right Colon 4514 20x anti HucD 488 anti S100B 594 anti PHOX2B 647 3.tif',
-            'files/primary/Human Colon 3D/sub_4656/95_Adult_Right_Colon_4656_20x_anti_HucD_488_anti_nNOS_594_anti_CHAT_647_7.tif': 'files/primary/Human Colon 3D/sub_4656/95 Adult Right Colon 4656 20x anti HucD 488 anti nNOS 594 anti CHAT 647 7.tif',
-            'files/primary/Human Colon 3D/sub_4514/183_Adult_Right_Colon_4514_20x_anti_HucD_594_anti_calretinin_647_1.tif': 'files/primary/Human Colon 3D/sub_4514/183 Adult Right Colon 4514 20x anti HucD 594 anti calretinin 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4514/88_Adult_Right_Colon_4514_10x_stitch_anti_HucD_488_anti_nNOS_594_anti_CHAT_647_1.tif': 'files/primary/Human Colon 3D/sub_4514/88 Adult Right Colon 4514 10x stitch anti HucD 488 anti nNOS 594 anti CHAT 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4514/85_Adult_Right_Colon_4514_20x_anti_HucD_488_anti_nNOS_594_anti_CHAT_647_8.tif': 'files/primary/Human Colon 3D/sub_4514/85 Adult Right Colon 4514 20x anti HucD 488 anti nNOS 594 anti CHAT 647 8.tif',
-            'files/primary/Human Colon 3D/sub_4514/135_Adult_Right_Colon_4514_20x_anti_HucD_488_anti_S100B_594_anti_PHOX2B_647_2.tif': 'files/primary/Human Colon 3D/sub_4514/135 Adult Right Colon 4514 20x anti HucD 488 anti S100B 594 anti PHOX2B 647 2.tif',
-            'files/primary/Human Colon 3D/sub_4514/84_Adult_Right_Colon_4514_20x_anti_HucD_488_anti_nNOS_594_anti_CHAT_647_7.tif': 'files/primary/Human Colon 3D/sub_4514/84 Adult Right Colon 4514 20x anti HucD 488 anti nNOS 594 anti CHAT 647 7.tif',
-            'files/primary/Human Colon 3D/sub_4514/184_Adult_Right_Colon_4514_20x_anti_HucD_594_anti_calretinin_647_2.tif': 'files/primary/Human Colon 3D/sub_4514/184 Adult Right Colon 4514 20x anti HucD 594 anti calretinin 647 2.tif',
-            'files/primary/Human Colon 3D/sub_4514/87_Adult_Right_Colon_4514_20x_anti_HucD_488_anti_nNOS_594_anti_CHAT_647_10.tif': 'files/primary/Human Colon 3D/sub_4514/87 Adult Right Colon 4514 20x anti HucD 488 anti nNOS 594 anti CHAT 647 10.tif',
-            'files/primary/Human Colon 3D/sub_4514/86_Adult_Right_Colon_4514_20x_anti_HucD_488_anti_nNOS_594_anti_CHAT_647_9.tif': 'files/primary/Human Colon 3D/sub_4514/86 Adult Right Colon 4514 20x anti HucD 488 anti nNOS 594 anti CHAT 647 9.tif',
-            'files/primary/Human Colon 3D/sub_4514/222_Adult_Right_Colon_4514_20x_anti_HucD_488_anti_VAChT_594_anti_ChAT_647_2.tif': 'files/primary/Human Colon 3D/sub_4514/222 Adult Right Colon 4514 20x anti HucD 488 anti VAChT 594 anti ChAT 647 2.tif',
-            'files/primary/Human Colon 3D/sub_4514/134_Adult_Right_Colon_4514_20x_anti_HucD_488_anti_S100B_594_anti_PHOX2B_647_1.tif': 'files/primary/Human Colon 3D/sub_4514/134 Adult Right Colon 4514 20x anti HucD 488 anti S100B 594 anti PHOX2B 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4514/187_Adult_Right_Colon_4514_20x_anti_HucD_594_anti_calretinin_647_5.tif': 'files/primary/Human Colon 3D/sub_4514/187 Adult Right Colon 4514 20x anti HucD 594 anti calretinin 647 5.tif',
-            'files/primary/Human Colon 3D/sub_4514/185_Adult_Right_Colon_4514_20x_anti_HucD_594_anti_calretinin_647_3.tif': 'files/primary/Human Colon 3D/sub_4514/185 Adult Right Colon 4514 20x anti HucD 594 anti calretinin 647 3.tif',
-            'files/primary/Human Colon 3D/sub_4514/81_Adult_Right_Colon_4514_20x_anti_HucD_488_anti_nNOS_594_anti_CHAT_647_4.tif': 'files/primary/Human Colon 3D/sub_4514/81 Adult Right Colon 4514 20x anti HucD 488 anti nNOS 594 anti CHAT 647 4.tif',
-            'files/primary/Human Colon 3D/sub_4514/83_Adult_Right_Colon_4514_20x_anti_HucD_488_anti_nNOS_594_anti_CHAT_647_6.tif': 'files/primary/Human Colon 3D/sub_4514/83 Adult Right Colon 4514 20x anti HucD 488 anti nNOS 594 anti CHAT 647 6.tif',
-            'files/primary/Human Colon 3D/sub_4514/138_Adult_Right_Colon_4514_20x_anti_HucD_488_anti_S100B_594_anti_PHOX2B_647_5.tif': 'files/primary/Human Colon 3D/sub_4514/138 Adult Right Colon 4514 20x anti HucD 488 anti S100B 594 anti PHOX2B 647 5.tif',
-            'files/primary/Human Colon 3D/sub_4514/224_Adult_Right_Colon_4514_20x_anti_HucD_488_anti_VAChT_594_anti_ChAT_647_4.tif': 'files/primary/Human Colon 3D/sub_4514/224 Adult Right Colon 4514 20x anti HucD 488 anti VAChT 594 anti ChAT 647 4.tif',
-            'files/primary/Human Colon 3D/sub_4514/139_Adult_Right_Colon_4514_10x_stitch_anti_HucD_488_anti_S100B_594_anti_PHOX2B_647_1.tif': 'files/primary/Human Colon 3D/sub_4514/139 Adult Right Colon 4514 10x stitch anti HucD 488 anti S100B 594 anti PHOX2B 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4514/223_Adult_Right_Colon_4514_20x_anti_HucD_488_anti_VAChT_594_anti_ChAT_647_3.tif': 'files/primary/Human Colon 3D/sub_4514/223 Adult Right Colon 4514 20x anti HucD 488 anti VAChT 594 anti ChAT 647 3.tif',
-            'files/primary/Human Colon 3D/sub_4514/78_Adult_Right_Colon_4514_20x_anti_HucD_488_anti_nNOS_594_anti_CHAT_647_1.tif': 'files/primary/Human Colon 3D/sub_4514/78 Adult Right Colon 4514 20x anti HucD 488 anti nNOS 594 anti CHAT 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4514/221_Adult_Right_Colon_4514_20x_anti_HucD_488_anti_VAChT_594_anti_ChAT_647_1.tif': 'files/primary/Human Colon 3D/sub_4514/221 Adult Right Colon 4514 20x anti HucD 488 anti VAChT 594 anti ChAT 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4514/80_Adult_Right_Colon_4514_20x_anti_HucD_488_anti_nNOS_594_anti_CHAT_647_3.tif': 'files/primary/Human Colon 3D/sub_4514/80 Adult Right Colon 4514 20x anti HucD 488 anti nNOS 594 anti CHAT 647 3.tif',
-            'files/primary/Human Colon 3D/sub_4514/188_Adult_Right_Colon_4514_10x_stitch_anti_HucD_594_anti_calretinin_647_1.tif': 'files/primary/Human Colon 3D/sub_4514/188 Adult Right Colon 4514 10x stitch anti HucD 594 anti calretinin 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4514/79_Adult_Right_Colon_4514_20x_anti_HucD_488_anti_nNOS_594_anti_CHAT_647_2.tif': 'files/primary/Human Colon 3D/sub_4514/79 Adult Right Colon 4514 20x anti HucD 488 anti nNOS 594 anti CHAT 647 2.tif',
-            'files/primary/Human Colon 3D/sub_4514/186_Adult_Right_Colon_4514_20x_anti_HucD_594_anti_calretinin_647_4.tif': 'files/primary/Human Colon 3D/sub_4514/186 Adult Right Colon 4514 20x anti HucD 594 anti calretinin 647 4.tif',
-            'files/primary/Human Colon 3D/sub_4514/82_Adult_Right_Colon_4514_20x_anti_HucD_488_anti_nNOS_594_anti_CHAT_647_5.tif': 'files/primary/Human Colon 3D/sub_4514/82 Adult Right Colon 4514 20x anti HucD 488 anti nNOS 594 anti CHAT 647 5.tif',
-            'files/primary/Human Colon 3D/sub_4514/137_Adult_Right_Colon_4514_20x_anti_HucD_488_anti_S100B_594_anti_PHOX2B_647_4.tif': 'files/primary/Human Colon 3D/sub_4514/137 Adult Right Colon 4514 20x anti HucD 488 anti S100B 594 anti PHOX2B 647 4.tif',
-            'files/primary/Human Colon 3D/sub_4443/3_Adult_Left_Colon_4443_20x_anti_HucD_594_anti_nNOS_488_anti_CHAT_647_3.tif': 'files/primary/Human Colon 3D/sub_4443/3 Adult Left Colon 4443 20x anti HucD 594 anti nNOS 488 anti CHAT 647 3.tif',
-            'files/primary/Human Colon 3D/sub_4443/2_Adult_Left_Colon_4443_20x_anti_HucD_594_anti_nNOS_488_anti_CHAT_647_2.tif': 'files/primary/Human Colon 3D/sub_4443/2 Adult Left Colon 4443 20x anti HucD 594 anti nNOS 488 anti CHAT 647 2.tif',
-            'files/primary/Human Colon 3D/sub_4443/10_Adult_Left_Colon_4443_20x_anti_HucD_594_anti_nNOS_488_anti_CHAT_647_10.tif': 'files/primary/Human Colon 3D/sub_4443/10 Adult Left Colon 4443 20x anti HucD 594 anti nNOS 488 anti CHAT 647 10.tif',
-            'files/primary/Human Colon 3D/sub_4443/8_Adult_Left_Colon_4443_20x_anti_HucD_594_anti_nNOS_488_anti_CHAT_647_8.tif': 'files/primary/Human Colon 3D/sub_4443/8 Adult Left Colon 4443 20x anti HucD 594 anti nNOS 488 anti CHAT 647 8.tif',
-            'files/primary/Human Colon 3D/sub_4443/11_Adult_Left_Colon_4443_10x_stitch_anti_HucD_594_anti_nNOS_488_anti_CHAT_647_1.tif': 'files/primary/Human Colon 3D/sub_4443/11 Adult Left Colon 4443 10x stitch anti HucD 594 anti nNOS 488 anti CHAT 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4443/4_Adult_Left_Colon_4443_20x_anti_HucD_594_anti_nNOS_488_anti_CHAT_647_4.tif': 'files/primary/Human Colon 3D/sub_4443/4 Adult Left Colon 4443 20x anti HucD 594 anti nNOS 488 anti CHAT 647 4.tif',
-            'files/primary/Human Colon 3D/sub_4443/7_Adult_Left_Colon_4443_20x_anti_HucD_594_anti_nNOS_488_anti_CHAT_647_7.tif': 'files/primary/Human Colon 3D/sub_4443/7 Adult Left Colon 4443 20x anti HucD 594 anti nNOS 488 anti CHAT 647 7.tif',
-            'files/primary/Human Colon 3D/sub_4443/1_Adult_Left_Colon_4443_20x_anti_HucD_594_anti_nNOS_488_anti_CHAT_647_1.tif': 'files/primary/Human Colon 3D/sub_4443/1 Adult Left Colon 4443 20x anti HucD 594 anti nNOS 488 anti CHAT 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4443/5_Adult_Left_Colon_4443_20x_anti_HucD_594_anti_nNOS_488_anti_CHAT_647_5.tif': 'files/primary/Human Colon 3D/sub_4443/5 Adult Left Colon 4443 20x anti HucD 594 anti nNOS 488 anti CHAT 647 5.tif',
-            'files/primary/Human Colon 3D/sub_4443/6_Adult_Left_Colon_4443_20x_anti_HucD_594_anti_nNOS_488_anti_CHAT_647_6.tif': 'files/primary/Human Colon 3D/sub_4443/6 Adult Left Colon 4443 20x anti HucD 594 anti nNOS 488 anti CHAT 647 6.tif',
-            'files/primary/Human Colon 3D/sub_4514/225_Adult_Right_Colon_4514_20x_anti_HucD_488_anti_VAChT_594_anti_ChAT_647_5.tif': 'files/primary/Human Colon 3D/sub_4514/225 Adult Right Colon 4514 20x anti HucD 488 anti VAChT 594 anti ChAT 647 5.tif',
-            'files/primary/Human Colon 3D/sub_4689/127_Adult_Left_Colon_4689_10x_stitch_anti_HucD_488_anti_S100B_594_anti_PHOX2B_647_1.tif': 'files/primary/Human Colon 3D/sub_4689/127 Adult Left Colon 4689 10x stitch anti HucD 488 anti S100B 594 anti PHOX2B 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4443/9_Adult_Left_Colon_4443_20x_anti_HucD_594_anti_nNOS_488_anti_CHAT_647_9.tif': 'files/primary/Human Colon 3D/sub_4443/9 Adult Left Colon 4443 20x anti HucD 594 anti nNOS 488 anti CHAT 647 9.tif',
-            'files/primary/Human Colon 3D/sub_4689/218_Adult_Left_Colon_4689_20x_stitch_anti_HucD_488_VAChT_594_ChAT_647_6.tif': 'files/primary/Human Colon 3D/sub_4689/218 Adult Left Colon 4689 20x stitch anti HucD 488 VAChT 594 ChAT 647 6.tif',
-            'files/primary/Human Colon 3D/sub_4689/175_Adult_Left_Colon_4689_20x_anti_HucD_594_anti_calretinin_647_5.tif': 'files/primary/Human Colon 3D/sub_4689/175 Adult Left Colon 4689 20x anti HucD 594 anti calretinin 647 5.tif',
-            'files/primary/Human Colon 3D/sub_4689/123_Adult_Left_Colon_4689_20x_anti_HucD_488_anti_S100B_594_anti_PHOX2B_647_2.tif': 'files/primary/Human Colon 3D/sub_4689/123 Adult Left Colon 4689 20x anti HucD 488 anti S100B 594 anti PHOX2B 647 2.tif',
-            'files/primary/Human Colon 3D/sub_4689/171_Adult_Left_Colon_4689_20x_anti_HucD_594_anti_calretinin_647_1.tif': 'files/primary/Human Colon 3D/sub_4689/171 Adult Left Colon 4689 20x anti HucD 594 anti calretinin 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4689/219_Adult_Left_Colon_4689_20x_stitch_anti_HucD_488_VAChT_594_ChAT_647_7.tif': 'files/primary/Human Colon 3D/sub_4689/219 Adult Left Colon 4689 20x stitch anti HucD 488 VAChT 594 ChAT 647 7.tif',
-            'files/primary/Human Colon 3D/sub_4689/216_Adult_Left_Colon_4689_20x_stitch_anti_HucD_488_VAChT_594_ChAT_647_4.tif': 'files/primary/Human Colon 3D/sub_4689/216 Adult Left Colon 4689 20x stitch anti HucD 488 VAChT 594 ChAT 647 4.tif',
-            'files/primary/Human Colon 3D/sub_4689/126_Adult_Left_Colon_4689_20x_anti_HucD_488_anti_S100B_594_anti_PHOX2B_647_5.tif': 'files/primary/Human Colon 3D/sub_4689/126 Adult Left Colon 4689 20x anti HucD 488 anti S100B 594 anti PHOX2B 647 5.tif',
-            'files/primary/Human Colon 3D/sub_4689/217_Adult_Left_Colon_4689_20x_stitch_anti_HucD_488_VAChT_594_ChAT_647_5.tif': 'files/primary/Human Colon 3D/sub_4689/217 Adult Left Colon 4689 20x stitch anti HucD 488 VAChT 594 ChAT 647 5.tif',
-            'files/primary/Human Colon 3D/sub_4689/174_Adult_Left_Colon_4689_20x_anti_HucD_594_anti_calretinin_647_4.tif': 'files/primary/Human Colon 3D/sub_4689/174 Adult Left Colon 4689 20x anti HucD 594 anti calretinin 647 4.tif',
-            'files/primary/Human Colon 3D/sub_4689/220_Adult_Left_Colon_4689_10x_stitch_anti_HucD_488_VAChT_594_ChAT_647_1.tif': 'files/primary/Human Colon 3D/sub_4689/220 Adult Left Colon 4689 10x stitch anti HucD 488 VAChT 594 ChAT 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4689/172_Adult_Left_Colon_4689_20x_anti_HucD_594_anti_calretinin_647_2.tif': 'files/primary/Human Colon 3D/sub_4689/172 Adult Left Colon 4689 20x anti HucD 594 anti calretinin 647 2.tif',
-            'files/primary/Human Colon 3D/sub_4689/122_Adult_Left_Colon_4689_20x_anti_HucD_488_anti_S100B_594_anti_PHOX2B_647_1.tif': 'files/primary/Human Colon 3D/sub_4689/122 Adult Left Colon 4689 20x anti HucD 488 anti S100B 594 anti PHOX2B 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4689/215_Adult_Left_Colon_4689_20x_stitch_anti_HucD_488_VAChT_594_ChAT_647_3.tif': 'files/primary/Human Colon 3D/sub_4689/215 Adult Left Colon 4689 20x stitch anti HucD 488 VAChT 594 ChAT 647 3.tif',
-            'files/primary/Human Colon 3D/sub_4689/176_Adult_Left_Colon_4689_10x_stitch_anti_HucD_594_anti_calretinin_647_1.tif': 'files/primary/Human Colon 3D/sub_4689/176 Adult Left Colon 4689 10x stitch anti HucD 594 anti calretinin 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4445/17_Adult_Left_Colon_4445_20x_anti_HucD_594_anti_nNOS_488_anti_CHAT_647_6.tif': 'files/primary/Human Colon 3D/sub_4445/17 Adult Left Colon 4445 20x anti HucD 594 anti nNOS 488 anti CHAT 647 6.tif',
-            'files/primary/Human Colon 3D/sub_4689/173_Adult_Left_Colon_4689_20x_anti_HucD_594_anti_calretinin_647_3.tif': 'files/primary/Human Colon 3D/sub_4689/173 Adult Left Colon 4689 20x anti HucD 594 anti calretinin 647 3.tif',
-            'files/primary/Human Colon 3D/sub_4445/12_Adult_Left_Colon_4445_20x_anti_HucD_594_anti_nNOS_488_anti_CHAT_647_1.tif': 'files/primary/Human Colon 3D/sub_4445/12 Adult Left Colon 4445 20x anti HucD 594 anti nNOS 488 anti CHAT 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4445/163_Adult_Left_Colon_4445_20x_anti_HucD_594_anti_calretinin_647_5.tif': 'files/primary/Human Colon 3D/sub_4445/163 Adult Left Colon 4445 20x anti HucD 594 anti calretinin 647 5.tif',
-            'files/primary/Human Colon 3D/sub_4445/13_Adult_Left_Colon_4445_20x_anti_HucD_594_anti_nNOS_488_anti_CHAT_647_2.tif': 'files/primary/Human Colon 3D/sub_4445/13 Adult Left Colon 4445 20x anti HucD 594 anti nNOS 488 anti CHAT 647 2.tif',
-            'files/primary/Human Colon 3D/sub_4445/14_Adult_Left_Colon_4445_20x_anti_HucD_594_anti_nNOS_488_anti_CHAT_647_3.tif': 'files/primary/Human Colon 3D/sub_4445/14 Adult Left Colon 4445 20x anti HucD 594 anti nNOS 488 anti CHAT 647 3.tif',
-            'files/primary/Human Colon 3D/sub_4445/115_Adult_Left_Colon_4445_10x_stitch_anti_HucD_488_anti_S100B_594_anti_PHOX2B_647_1.tif': 'files/primary/Human Colon 3D/sub_4445/115 Adult Left Colon 4445 10x stitch anti HucD 488 anti S100B 594 anti PHOX2B 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4445/20_Adult_Left_Colon_4445_20x_anti_HucD_594_anti_nNOS_488_anti_CHAT_647_9.tif': 'files/primary/Human Colon 3D/sub_4445/20 Adult Left Colon 4445 20x anti HucD 594 anti nNOS 488 anti CHAT 647 9.tif',
-            'files/primary/Human Colon 3D/sub_4445/161_Adult_Left_Colon_4445_20x_anti_HucD_594_anti_calretinin_647_3.tif': 'files/primary/Human Colon 3D/sub_4445/161 Adult Left Colon 4445 20x anti HucD 594 anti calretinin 647 3.tif',
-            'files/primary/Human Colon 3D/sub_4445/16_Adult_Left_Colon_4445_20x_anti_HucD_594_anti_nNOS_488_anti_CHAT_647_5.tif': 'files/primary/Human Colon 3D/sub_4445/16 Adult Left Colon 4445 20x anti HucD 594 anti nNOS 488 anti CHAT 647 5.tif',
-            'files/primary/Human Colon 3D/sub_4445/18_Adult_Left_Colon_4445_20x_anti_HucD_594_anti_nNOS_488_anti_CHAT_647_7.tif': 'files/primary/Human Colon 3D/sub_4445/18 Adult Left Colon 4445 20x anti HucD 594 anti nNOS 488 anti CHAT 647 7.tif',
-            'files/primary/Human Colon 3D/sub_4445/211_Adult_Left_Colon_4445_20x_anti_HucD_488_anti_VAChT_594_anti_ChAT_647_5.tif': 'files/primary/Human Colon 3D/sub_4445/211 Adult Left Colon 4445 20x anti HucD 488 anti VAChT 594 anti ChAT 647 5.tif',
-            'files/primary/Human Colon 3D/sub_4445/25_Adult_Left_Colon_4445_10x_stitch_anti_HucD_594_anti_nNOS_488_anti_CHAT_647_1.tif': 'files/primary/Human Colon 3D/sub_4445/25 Adult Left Colon 4445 10x stitch anti HucD 594 anti nNOS 488 anti CHAT 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4445/209_Adult_Left_Colon_4445_20x_anti_HucD_488_anti_VAChT_594_anti_ChAT_647_3.tif': 'files/primary/Human Colon 3D/sub_4445/209 Adult Left Colon 4445 20x anti HucD 488 anti VAChT 594 anti ChAT 647 3.tif',
-            'files/primary/Human Colon 3D/sub_4445/111_Adult_Left_Colon_4445_20x_anti_HucD_488_anti_S100B_594_anti_PHOX2B_647_1.tif': 'files/primary/Human Colon 3D/sub_4445/111 Adult Left Colon 4445 20x anti HucD 488 anti S100B 594 anti PHOX2B 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4445/159_Adult_Left_Colon_4445_20x_anti_HucD_594_anti_calretinin_647_1.tif': 'files/primary/Human Colon 3D/sub_4445/159 Adult Left Colon 4445 20x anti HucD 594 anti calretinin 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4445/24_Adult_Left_Colon_4445_20x_anti_HucD_594_anti_nNOS_488_anti_CHAT_647_13.tif': 'files/primary/Human Colon 3D/sub_4445/24 Adult Left Colon 4445 20x anti HucD 594 anti nNOS 488 anti CHAT 647 13.tif',
-            'files/primary/Human Colon 3D/sub_4445/21_Adult_Left_Colon_4445_20x_anti_HucD_594_anti_nNOS_488_anti_CHAT_647_10.tif': 'files/primary/Human Colon 3D/sub_4445/21 Adult Left Colon 4445 20x anti HucD 594 anti nNOS 488 anti CHAT 647 10.tif',
-            'files/primary/Human Colon 3D/sub_4445/207_Adult_Left_Colon_4445_20x_anti_HucD_488_anti_VAChT_594_anti_ChAT_647_1.tif': 'files/primary/Human Colon 3D/sub_4445/207 Adult Left Colon 4445 20x anti HucD 488 anti VAChT 594 anti ChAT 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4445/210_Adult_Left_Colon_4445_20x_anti_HucD_488_anti_VAChT_594_anti_ChAT_647_4.tif': 'files/primary/Human Colon 3D/sub_4445/210 Adult Left Colon 4445 20x anti HucD 488 anti VAChT 594 anti ChAT 647 4.tif',
-            'files/primary/Human Colon 3D/sub_4445/112_Adult_Left_Colon_4445_20x_anti_HucD_488_anti_S100B_594_anti_PHOX2B_647_2.tif': 'files/primary/Human Colon 3D/sub_4445/112 Adult Left Colon 4445 20x anti HucD 488 anti S100B 594 anti PHOX2B 647 2.tif',
-            'files/primary/Human Colon 3D/sub_4445/22_Adult_Left_Colon_4445_20x_anti_HucD_594_anti_nNOS_488_anti_CHAT_647_11.tif': 'files/primary/Human Colon 3D/sub_4445/22 Adult Left Colon 4445 20x anti HucD 594 anti nNOS 488 anti CHAT 647 11.tif',
-            'files/primary/Human Colon 3D/sub_4445/212_Adult_Left_Colon_4445_10x_stitch_anti_HucD_594_anti_VAChT_488_anti_ChAT_647_1.tif': 'files/primary/Human Colon 3D/sub_4445/212 Adult Left Colon 4445 10x stitch anti HucD 594 anti VAChT 488 anti ChAT 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4445/114_Adult_Left_Colon_4445_20x_anti_HucD_488_anti_S100B_594_anti_PHOX2B_647_4.tif': 'files/primary/Human Colon 3D/sub_4445/114 Adult Left Colon 4445 20x anti HucD 488 anti S100B 594 anti PHOX2B 647 4.tif',
-            'files/primary/Human Colon 3D/sub_4445/160_Adult_Left_Colon_4445_20x_anti_HucD_594_anti_calretinin_647_2.tif': 'files/primary/Human Colon 3D/sub_4445/160 Adult Left Colon 4445 20x anti HucD 594 anti calretinin 647 2.tif',
-            'files/primary/Human Colon 3D/sub_4445/164_Adult_Left_Colon_4445_10x_stitch_anti_HucD_594_anti_calretinin_647_1.tif': 'files/primary/Human Colon 3D/sub_4445/164 Adult Left Colon 4445 10x stitch anti HucD 594 anti calretinin 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4445/19_Adult_Left_Colon_4445_20x_anti_HucD_594_anti_nNOS_488_anti_CHAT_647_8.tif': 'files/primary/Human Colon 3D/sub_4445/19 Adult Left Colon 4445 20x anti HucD 594 anti nNOS 488 anti CHAT 647 8.tif',
-            'files/primary/Human Colon 3D/sub_4445/23Adult_Left_Colon_4445_20x_anti_HucD_594_anti_nNOS_488_anti_CHAT_647_12.tif': 'files/primary/Human Colon 3D/sub_4445/23Adult Left Colon 4445 20x anti HucD 594 anti nNOS 488 anti CHAT 647 12.tif',
-            'files/primary/Human Colon 3D/sub_ ICRH 117/285_Pancreas_ICRH_117_HuCD_S100B_PHOX2B.tif': 'files/primary/Human Colon 3D/sub_ ICRH 117/285 Pancreas ICRH 117 HuCD S100B PHOX2B.tif',
-            'files/primary/Human Colon 3D/sub_4445/15_Adult_Left_Colon_4445_20x_anti_HucD_594_anti_nNOS_488_anti_CHAT_647_4.tif': 'files/primary/Human Colon 3D/sub_4445/15 Adult Left Colon 4445 20x anti HucD 594 anti nNOS 488 anti CHAT 647 4.tif',
-            'files/primary/Human Colon 3D/sub_4445/113_Adult_Left_Colon_4445_20x_anti_HucD_488_anti_S100B_594_anti_PHOX2B_647_3.tif': 'files/primary/Human Colon 3D/sub_4445/113 Adult Left Colon 4445 20x anti HucD 488 anti S100B 594 anti PHOX2B 647 3.tif',
-            'files/primary/Human Colon 3D/sub_4445/208_Adult_Left_Colon_4445_20x_anti_HucD_488_anti_VAChT_594_anti_ChAT_647_2.tif': 'files/primary/Human Colon 3D/sub_4445/208 Adult Left Colon 4445 20x anti HucD 488 anti VAChT 594 anti ChAT 647 2.tif',
-            'files/primary/Human Colon 3D/sub_4445/162_Adult_Left_Colon_4445_20x_anti_HucD_594_anti_calretinin_647_4.tif': 'files/primary/Human Colon 3D/sub_4445/162 Adult Left Colon 4445 20x anti HucD 594 anti calretinin 647 4.tif',
-            'files/primary/Human Colon 3D/sub_4506/182_Adult_Right_Colon_4506_10x_stitch_anti_HucD_594_anti_calretinin_647_1.tif': 'files/primary/Human Colon 3D/sub_4506/182 Adult Right Colon 4506 10x stitch anti HucD 594 anti calretinin 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4506/180_Adult_Right_Colon_4506_20x_anti_HucD_594_anti_calretinin_647_4.tif': 'files/primary/Human Colon 3D/sub_4506/180 Adult Right Colon 4506 20x anti HucD 594 anti calretinin 647 4.tif',
-            'files/primary/Human Colon 3D/sub_4506/128_Adult_Right_Colon_4506_20x_anti_HucD_488_anti_S100B_594_anti_PHOX2B_647_1.tif': 'files/primary/Human Colon 3D/sub_4506/128 Adult Right Colon 4506 20x anti HucD 488 anti S100B 594 anti PHOX2B 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4506/74_Adult_Right_Colon_4506_20x_anti_Hu_594_anti_Nos_488_anti_Chat_647_9.tif': 'files/primary/Human Colon 3D/sub_4506/74 Adult Right Colon 4506 20x anti Hu 594 anti Nos 488 anti Chat 647 9.tif',
-            'files/primary/Human Colon 3D/sub_4506/130_Adult_Right_Colon_4506_20x_anti_HucD_488_anti_S100B_594_anti_PHOX2B_647_3.tif': 'files/primary/Human Colon 3D/sub_4506/130 Adult Right Colon 4506 20x anti HucD 488 anti S100B 594 anti PHOX2B 647 3.tif',
-            'files/primary/Human Colon 3D/sub_4506/253_Adult_Right_Colon_4506_20x_anti_HucD_594_anti_cKit_647_4.tif': 'files/primary/Human Colon 3D/sub_4506/253 Adult Right Colon 4506 20x anti HucD 594 anti cKit 647 4.tif',
-            'files/primary/Human Colon 3D/sub_4506/251_Adult_Right_Colon_4506_20x_anti_HucD_594_anti_cKit_647_2.tif': 'files/primary/Human Colon 3D/sub_4506/251 Adult Right Colon 4506 20x anti HucD 594 anti cKit 647 2.tif',
-            'files/primary/Human Colon 3D/sub_4506/73_Adult_Right_Colon_4506_20x_anti_Hu_594_anti_Nos_488_anti_Chat_647_8.tif': 'files/primary/Human Colon 3D/sub_4506/73 Adult Right Colon 4506 20x anti Hu 594 anti Nos 488 anti Chat 647 8.tif',
-            'files/primary/Human Colon 3D/sub_4506/76_Adult_Right_Colon_4506_20x_anti_Hu_594_anti_Nos_488_anti_Chat_647_11.tif': 'files/primary/Human Colon 3D/sub_4506/76 Adult Right Colon 4506 20x anti Hu 594 anti Nos 488 anti Chat 647 11.tif',
-            'files/primary/Human Colon 3D/sub_4506/131_Adult_Right_Colon_4506_20x_anti_HucD_488_anti_S100B_594_anti_PHOX2B_647_4.tif': 'files/primary/Human Colon 3D/sub_4506/131 Adult Right Colon 4506 20x anti HucD 488 anti S100B 594 anti PHOX2B 647 4.tif',
-            'files/primary/Human Colon 3D/sub_4506/69_Adult_Right_Colon_4506_20x_anti_Hu_594_anti_Nos_488_anti_Chat_647_4.tif': 'files/primary/Human Colon 3D/sub_4506/69 Adult Right Colon 4506 20x anti Hu 594 anti Nos 488 anti Chat 647 4.tif',
-            'files/primary/Human Colon 3D/sub_4506/177_Adult_Right_Colon_4506_20x_anti_HucD_594_anti_calretinin_647_1.tif': 'files/primary/Human Colon 3D/sub_4506/177 Adult Right Colon 4506 20x anti HucD 594 anti calretinin 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4506/179_Adult_Right_Colon_4506_20x_anti_HucD_594_anti_calretinin_647_3.tif': 'files/primary/Human Colon 3D/sub_4506/179 Adult Right Colon 4506 20x anti HucD 594 anti calretinin 647 3.tif',
-            'files/primary/Human Colon 3D/sub_4506/63_Adult_Right_Colon_4506_20x_anti_Hu_488_anti_Nos_594_anti_Chat_647_3.tif': 'files/primary/Human Colon 3D/sub_4506/63 Adult Right Colon 4506 20x anti Hu 488 anti Nos 594 anti Chat 647 3.tif',
-            'files/primary/Human Colon 3D/sub_4506/70_Adult_Right_Colon_4506_20x_anti_Hu_594_anti_Nos_488_anti_Chat_647_5.tif': 'files/primary/Human Colon 3D/sub_4506/70 Adult Right Colon 4506 20x anti Hu 594 anti Nos 488 anti Chat 647 5.tif',
-            'files/primary/Human Colon 3D/sub_4506/71_Adult_Right_Colon_4506_20x_anti_Hu_594_anti_Nos_488_anti_Chat_647_6.tif': 'files/primary/Human Colon 3D/sub_4506/71 Adult Right Colon 4506 20x anti Hu 594 anti Nos 488 anti Chat 647 6.tif',
-            'files/primary/Human Colon 3D/sub_4506/65_Adult_Right_Colon_4506_20x_anti_Hu_488_anti_Nos_594_anti_Chat_647_5.tif': 'files/primary/Human Colon 3D/sub_4506/65 Adult Right Colon 4506 20x anti Hu 488 anti Nos 594 anti Chat 647 5.tif',
-            'files/primary/Human Colon 3D/sub_4506/133_Adult_Right_Colon_4506_10x_stitch_anti_HucD_488_anti_S100B_594_anti_PHOX2B_647_1.tif': 'files/primary/Human Colon 3D/sub_4506/133 Adult Right Colon 4506 10x stitch anti HucD 488 anti S100B 594 anti PHOX2B 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4506/178_Adult_Right_Colon_4506_20x_anti_HucD_594_anti_calretinin_647_2.tif': 'files/primary/Human Colon 3D/sub_4506/178 Adult Right Colon 4506 20x anti HucD 594 anti calretinin 647 2.tif',
-            'files/primary/Human Colon 3D/sub_4506/129_Adult_Right_Colon_4506_20x_anti_HucD_488_anti_S100B_594_anti_PHOX2B_647_2.tif': 'files/primary/Human Colon 3D/sub_4506/129 Adult Right Colon 4506 20x anti HucD 488 anti S100B 594 anti PHOX2B 647 2.tif',
-            'files/primary/Human Colon 3D/sub_4506/61_Adult_Right_Colon_4506_20x_anti_Hu_488_anti_Nos_594_anti_Chat_647_1.tif': 'files/primary/Human Colon 3D/sub_4506/61 Adult Right Colon 4506 20x anti Hu 488 anti Nos 594 anti Chat 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4506/66_Adult_Right_Colon_4506_20x_anti_Hu_594_anti_Nos_488_anti_Chat_647_1.tif': 'files/primary/Human Colon 3D/sub_4506/66 Adult Right Colon 4506 20x anti Hu 594 anti Nos 488 anti Chat 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4506/77_Adult_Right_Colon_4506_10x_stitch_anti_Hu_488_anti_Nos_594_anti_Chat_647_1.tif': 'files/primary/Human Colon 3D/sub_4506/77 Adult Right Colon 4506 10x stitch anti Hu 488 anti Nos 594 anti Chat 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4506/132_Adult_Right_Colon_4506_20x_anti_HucD_488_anti_S100B_594_anti_PHOX2B_647_5.tif': 'files/primary/Human Colon 3D/sub_4506/132 Adult Right Colon 4506 20x anti HucD 488 anti S100B 594 anti PHOX2B 647 5.tif',
-            'files/primary/Human Colon 3D/sub_4506/72_Adult_Right_Colon_4506_20x_anti_Hu_594_anti_Nos_488_anti_Chat_647_7.tif': 'files/primary/Human Colon 3D/sub_4506/72 Adult Right Colon 4506 20x anti Hu 594 anti Nos 488 anti Chat 647 7.tif',
-            'files/primary/Human Colon 3D/sub_4506/250_Adult_Right_Colon_4506_20x_anti_HucD_594_anti_cKit_647_1.tif': 'files/primary/Human Colon 3D/sub_4506/250 Adult Right Colon 4506 20x anti HucD 594 anti cKit 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4506/62_Adult_Right_Colon_4506_20x_anti_Hu_488_anti_Nos_594_anti_Chat_647_2.tif': 'files/primary/Human Colon 3D/sub_4506/62 Adult Right Colon 4506 20x anti Hu 488 anti Nos 594 anti Chat 647 2.tif',
-            'files/primary/Human Colon 3D/sub_4506/67_Adult_Right_Colon_4506_20x_anti_Hu_594_anti_Nos_488_anti_Chat_647_2.tif': 'files/primary/Human Colon 3D/sub_4506/67 Adult Right Colon 4506 20x anti Hu 594 anti Nos 488 anti Chat 647 2.tif',
-            'files/primary/Human Colon 3D/sub_4506/64Adult_Right_Colon_4506_20x_anti_Hu_488_anti_Nos_594_anti_Chat_647_4.tif': 'files/primary/Human Colon 3D/sub_4506/64Adult Right Colon 4506 20x anti Hu 488 anti Nos 594 anti Chat 647 4.tif',
-            'files/primary/Human Colon 3D/sub_4506/252_Adult_Right_Colon_4506_20x_anti_HucD_594_anti_cKit_647_3.tif': 'files/primary/Human Colon 3D/sub_4506/252 Adult Right Colon 4506 20x anti HucD 594 anti cKit 647 3.tif',
-            'files/primary/Human Colon 3D/sub_4506/68_Adult_Right_Colon_4506_20x_anti_Hu_594_anti_Nos_488_anti_Chat_647_3.tif': 'files/primary/Human Colon 3D/sub_4506/68 Adult Right Colon 4506 20x anti Hu 594 anti Nos 488 anti Chat 647 3.tif',
-            'files/primary/Human Colon 3D/sub_4457/243_Adult_Left_Colon_4557_20x_anti_HucD_594_anti_cKit_647_2.tif': 'files/primary/Human Colon 3D/sub_4457/243 Adult Left Colon 4557 20x anti HucD 594 anti cKit 647 2.tif',
-            'files/primary/Human Colon 3D/sub_4506/181_Adult_Right_Colon_4506_20x_anti_HucD_594_anti_calretinin_647_5.tif': 'files/primary/Human Colon 3D/sub_4506/181 Adult Right Colon 4506 20x anti HucD 594 anti calretinin 647 5.tif',
-            'files/primary/Human Colon 3D/sub_4506/75_Adult_Right_Colon_4506_20x_anti_Hu_594_anti_Nos_488_anti_Chat_647_10.tif': 'files/primary/Human Colon 3D/sub_4506/75 Adult Right Colon 4506 20x anti Hu 594 anti Nos 488 anti Chat 647 10.tif',
-            'files/primary/Human Colon 3D/sub_4457/237_Adult_Left_Colon_4557_20x_anti_HucD_488_anti_VAChT_594_anti_ChAT__647_1.tif': 'files/primary/Human Colon 3D/sub_4457/237 Adult Left Colon 4557 20x anti HucD 488 anti VAChT 594 anti ChAT 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4457/241_Adult_Left_Colon_4557_20x_anti_HucD_488_anti_VAChT_594_anti_ChAT__647_5.tif': 'files/primary/Human Colon 3D/sub_4457/241 Adult Left Colon 4557 20x anti HucD 488 anti VAChT 594 anti ChAT 647 5.tif',
-            'files/primary/Human Colon 3D/sub_4457/238_Adult_Left_Colon_4557_20x_anti_HucD_488_anti_VAChT_594_anti_ChAT__647_2.tif': 'files/primary/Human Colon 3D/sub_4457/238 Adult Left Colon 4557 20x anti HucD 488 anti VAChT 594 anti ChAT 647 2.tif',
-            'files/primary/Human Colon 3D/sub_4457/46_Adult_Left_Colon_4557_20x_anti_HucD_488_anti_nNOS_594_anti_CHAT_647_5.tif': 'files/primary/Human Colon 3D/sub_4457/46 Adult Left Colon 4557 20x anti HucD 488 anti nNOS 594 anti CHAT 647 5.tif',
-            'files/primary/Human Colon 3D/sub_4457/170_Adult_Left_Colon_4557_10x_stitch_anti_HucD_594_anti_calretinin_647_1.tif': 'files/primary/Human Colon 3D/sub_4457/170 Adult Left Colon 4557 10x stitch anti HucD 594 anti calretinin 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4457/47_Adult_Left_Colon_4557_10x_stitch_anti_HucD_488_anti_nNOS_594_anti_CHAT_647_1.tif': 'files/primary/Human Colon 3D/sub_4457/47 Adult Left Colon 4557 10x stitch anti HucD 488 anti nNOS 594 anti CHAT 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4457/242_Adult_Left_Colon_4557_20x_anti_HucD_594_anti_cKit_647_1.tif': 'files/primary/Human Colon 3D/sub_4457/242 Adult Left Colon 4557 20x anti HucD 594 anti cKit 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4457/166_Adult_Left_Colon_4557_20x_anti_HucD_594_anti_calretinin_647_2.tif': 'files/primary/Human Colon 3D/sub_4457/166 Adult Left Colon 4557 20x anti HucD 594 anti calretinin 647 2.tif',
-            'files/primary/Human Colon 3D/sub_4457/169_Adult_Left_Colon_4557_20x_anti_HucD_594_anti_calretinin_647_5.tif': 'files/primary/Human Colon 3D/sub_4457/169 Adult Left Colon 4557 20x anti HucD 594 anti calretinin 647 5.tif',
-            'files/primary/Human Colon 3D/sub_4457/43_Adult_Left_Colon_4557_20x_anti_HucD_488_anti_nNOS_594_anti_CHAT_647_2.tif': 'files/primary/Human Colon 3D/sub_4457/43 Adult Left Colon 4557 20x anti HucD 488 anti nNOS 594 anti CHAT 647 2.tif',
-            'files/primary/Human Colon 3D/sub_4457/165_Adult_Left_Colon_4557_20x_anti_HucD_594_anti_calretinin_647_1.tif': 'files/primary/Human Colon 3D/sub_4457/165 Adult Left Colon 4557 20x anti HucD 594 anti calretinin 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4457/167_Adult_Left_Colon_4557_20x_anti_HucD_594_anti_calretinin_647_3.tif': 'files/primary/Human Colon 3D/sub_4457/167 Adult Left Colon 4557 20x anti HucD 594 anti calretinin 647 3.tif',
-            'files/primary/Human Colon 3D/sub_4457/239_Adult_Left_Colon_4557_20x_anti_HucD_488_anti_VAChT_594_anti_ChAT__647_3.tif': 'files/primary/Human Colon 3D/sub_4457/239 Adult Left Colon 4557 20x anti HucD 488 anti VAChT 594 anti ChAT 647 3.tif',
-            'files/primary/Human Colon 3D/sub_4457/168_Adult_Left_Colon_4557_20x_anti_HucD_594_anti_calretinin_647_4.tif': 'files/primary/Human Colon 3D/sub_4457/168 Adult Left Colon 4557 20x anti HucD 594 anti calretinin 647 4.tif',
-            'files/primary/Human Colon 3D/sub_4457/42_Adult_Left_Colon_4557_20x_anti_HucD_488_anti_nNOS_594_anti_CHAT_647_1.tif': 'files/primary/Human Colon 3D/sub_4457/42 Adult Left Colon 4557 20x anti HucD 488 anti nNOS 594 anti CHAT 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4504/55_Adult_Right_Colon_4504_20x_anti_HucD_594_anti_nNOS_488_anti_CHAT_647_8.tif': 'files/primary/Human Colon 3D/sub_4504/55 Adult Right Colon 4504 20x anti HucD 594 anti nNOS 488 anti CHAT 647 8.tif',
-            'files/primary/Human Colon 3D/sub_4457/240_Adult_Left_Colon_4557_20x_anti_HucD_488_anti_VAChT_594_anti_ChAT__647_4.tif': 'files/primary/Human Colon 3D/sub_4457/240 Adult Left Colon 4557 20x anti HucD 488 anti VAChT 594 anti ChAT 647 4.tif',
-            'files/primary/Human Colon 3D/sub_4457/44_Adult_Left_Colon_4557_20x_anti_HucD_488_anti_nNOS_594_anti_CHAT_647_3.tif': 'files/primary/Human Colon 3D/sub_4457/44 Adult Left Colon 4557 20x anti HucD 488 anti nNOS 594 anti CHAT 647 3.tif',
-            'files/primary/Human Colon 3D/sub_4504/59_Adult_Right_Colon_4504_20x_anti_HucD_594_anti_nNOS_488_anti_CHAT_647_12.tif': 'files/primary/Human Colon 3D/sub_4504/59 Adult Right Colon 4504 20x anti HucD 594 anti nNOS 488 anti CHAT 647 12.tif',
-            'files/primary/Human Colon 3D/sub_4457/45_Adult_Left_Colon_4557_20x_anti_HucD_488_anti_nNOS_594_anti_CHAT_647_4.tif': 'files/primary/Human Colon 3D/sub_4457/45 Adult Left Colon 4557 20x anti HucD 488 anti nNOS 594 anti CHAT 647 4.tif',
-            'files/primary/Human Colon 3D/sub_4504/48_Adult_Right_Colon_4504_20x_anti_HucD_594_anti_nNOS_488_anti_CHAT_647_1.tif': 'files/primary/Human Colon 3D/sub_4504/48 Adult Right Colon 4504 20x anti HucD 594 anti nNOS 488 anti CHAT 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4504/60_Adult_Right_Colon_4504_10x_stitch_anti_HucD_594_anti_nNOS_488_anti_CHAT_647_1.tif': 'files/primary/Human Colon 3D/sub_4504/60 Adult Right Colon 4504 10x stitch anti HucD 594 anti nNOS 488 anti CHAT 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4504/58_Adult_Right_Colon_4504_20x_anti_HucD_594_anti_nNOS_488_anti_CHAT_647_11.tif': 'files/primary/Human Colon 3D/sub_4504/58 Adult Right Colon 4504 20x anti HucD 594 anti nNOS 488 anti CHAT 647 11.tif',
-            'files/primary/Human Colon 3D/sub_4504/53_Adult_Right_Colon_4504_20x_anti_HucD_594_anti_nNOS_488_anti_CHAT_647_6.tif': 'files/primary/Human Colon 3D/sub_4504/53 Adult Right Colon 4504 20x anti HucD 594 anti nNOS 488 anti CHAT 647 6.tif',
-            'files/primary/Human Colon 3D/sub_4504/56_Adult_Right_Colon_4504_20x_anti_HucD_594_anti_nNOS_488_anti_CHAT_647_9.tif': 'files/primary/Human Colon 3D/sub_4504/56 Adult Right Colon 4504 20x anti HucD 594 anti nNOS 488 anti CHAT 647 9.tif',
-            'files/primary/Human Colon 3D/sub_4504/57_Adult_Right_Colon_4504_20x_anti_HucD_594_anti_nNOS_488_anti_CHAT_647_10.tif': 'files/primary/Human Colon 3D/sub_4504/57 Adult Right Colon 4504 20x anti HucD 594 anti nNOS 488 anti CHAT 647 10.tif',
-            'files/primary/Human Colon 3D/sub_4504/50_Adult_Right_Colon_4504_20x_anti_HucD_594_anti_nNOS_488_anti_CHAT_647_3.tif': 'files/primary/Human Colon 3D/sub_4504/50 Adult Right Colon 4504 20x anti HucD 594 anti nNOS 488 anti CHAT 647 3.tif',
-            'files/primary/Human Colon 3D/sub_4504/54_Adult_Right_Colon_4504_20x_anti_HucD_594_anti_nNOS_488_anti_CHAT_647_7.tif': 'files/primary/Human Colon 3D/sub_4504/54 Adult Right Colon 4504 20x anti HucD 594 anti nNOS 488 anti CHAT 647 7.tif',
-            'files/primary/Human Colon 3D/sub_4504/49_Adult_Right_Colon_4504_20x_anti_HucD_594_anti_nNOS_488_anti_CHAT_647_2.tif': 'files/primary/Human Colon 3D/sub_4504/49 Adult Right Colon 4504 20x anti HucD 594 anti nNOS 488 anti CHAT 647 2.tif',
-            'files/primary/Human Colon 3D/sub_4504/51_Adult_Right_Colon_4504_20x_anti_HucD_594_anti_nNOS_488_anti_CHAT_647_4.tif': 'files/primary/Human Colon 3D/sub_4504/51 Adult Right Colon 4504 20x anti HucD 594 anti nNOS 488 anti CHAT 647 4.tif',
-            'files/primary/Human Colon 3D/sub_4566/274_Adult_Left_Colon_4566_20x_anti_HucD_647_anti_Tuj1_594_3.tif': 'files/primary/Human Colon 3D/sub_4566/274 Adult Left Colon 4566 20x anti HucD 647 anti Tuj1 594 3.tif',
-            'files/primary/Human Colon 3D/sub_4566/249_Adult_Left_Colon_4566_20x_anti_HucD_647_anti_cKit_594_3.tif': 'files/primary/Human Colon 3D/sub_4566/249 Adult Left Colon 4566 20x anti HucD 647 anti cKit 594 3.tif',
-            'files/primary/Human Colon 3D/sub_4566/272_Adult_Left_Colon_4566_20x_anti_HucD_647_anti_Tuj1_594_1.tif': 'files/primary/Human Colon 3D/sub_4566/272 Adult Left Colon 4566 20x anti HucD 647 anti Tuj1 594 1.tif',
-            'files/primary/Human Colon 3D/sub_4504/52_Adult_Right_Colon_4504_20x_anti_HucD_594_anti_nNOS_488_anti_CHAT_647_5.tif': 'files/primary/Human Colon 3D/sub_4504/52 Adult Right Colon 4504 20x anti HucD 594 anti nNOS 488 anti CHAT 647 5.tif',
-            'files/primary/Human Colon 3D/sub_4566/248_Adult_Left_Colon_4566_20x_anti_HucD_647_anti_cKit_594_2.tif': 'files/primary/Human Colon 3D/sub_4566/248 Adult Left Colon 4566 20x anti HucD 647 anti cKit 594 2.tif',
-            'files/primary/Human Colon 3D/sub_4566/247_Adult_Left_Colon_4566_20x_anti_HucD_647_anti_cKit_594_1.tif': 'files/primary/Human Colon 3D/sub_4566/247 Adult Left Colon 4566 20x anti HucD 647 anti cKit 594 1.tif',
-            'files/primary/Human Colon 3D/sub_4566/273_Adult_Left_Colon_4566_20x_anti_HucD_647_anti_Tuj1_594_2.tif': 'files/primary/Human Colon 3D/sub_4566/273 Adult Left Colon 4566 20x anti HucD 647 anti Tuj1 594 2.tif',
-            'files/primary/Human Colon 3D/sub_4755/255_Adult_Right_Colon_4755_20x_anti_HucD_647_anti_cKit_594_2.tif': 'files/primary/Human Colon 3D/sub_4755/255 Adult Right Colon 4755 20x anti HucD 647 anti cKit 594 2.tif',
-            'files/primary/Human Colon 3D/sub_HSCR 7962/283_HSCR_7962_10x_stitch_distal_aganglionic_HuCD_red_nNOS_green.tif': 'files/primary/Human Colon 3D/sub_HSCR 7962/283 HSCR 7962 10x stitch distal aganglionic HuCD red nNOS green.tif',
-            'files/primary/Human Colon 3D/sub_4755/254_Adult_Right_Colon_4755_20x_anti_HucD_647_anti_cKit_594_1.tif': 'files/primary/Human Colon 3D/sub_4755/254 Adult Right Colon 4755 20x anti HucD 647 anti cKit 594 1.tif',
-            'files/primary/Human Colon 3D/sub_4755/278_Adult_Right_Colon_4755_20x_anti_HucD_647_anti_Tuj1_594_1.tif': 'files/primary/Human Colon 3D/sub_4755/278 Adult Right Colon 4755 20x anti HucD 647 anti Tuj1 594 1.tif',
-            'files/primary/Human Colon 3D/sub_4755/266_Adult_Right_Colon_4755_20x_anti_HucD_647_anti_NFM_594_1.tif': 'files/primary/Human Colon 3D/sub_4755/266 Adult Right Colon 4755 20x anti HucD 647 anti NFM 594 1.tif',
-            'files/primary/Human Colon 3D/sub_4755/267_Adult_Right_Colon_4755_20x_anti_HucD_647_anti_NFM_594_2.tif': 'files/primary/Human Colon 3D/sub_4755/267 Adult Right Colon 4755 20x anti HucD 647 anti NFM 594 2.tif',
-            'files/primary/Human Colon 3D/sub_4755/279_Adult_Right_Colon_4755_20x_anti_HucD_647_anti_Tuj1_594_2.tif': 'files/primary/Human Colon 3D/sub_4755/279 Adult Right Colon 4755 20x anti HucD 647 anti Tuj1 594 2.tif',
-            'files/primary/Human Colon 3D/sub_4755/268_Adult_Right_Colon_4755_20x_anti_HucD_647_anti_NFM_594_3.tif': 'files/primary/Human Colon 3D/sub_4755/268 Adult Right Colon 4755 20x anti HucD 647 anti NFM 594 3.tif',
-            'files/primary/Human Colon 3D/sub_4755/280_Adult_Right_Colon_4755_20x_anti_HucD_647_anti_Tuj1_594_3.tif': 'files/primary/Human Colon 3D/sub_4755/280 Adult Right Colon 4755 20x anti HucD 647 anti Tuj1 594 3.tif',
-            'files/primary/Human Colon 3D/sub_4755/256_Adult_Right_Colon_4755_20x_anti_HucD_647_anti_cKit_594_3.tif': 'files/primary/Human Colon 3D/sub_4755/256 Adult Right Colon 4755 20x anti HucD 647 anti cKit 594 3.tif',
-            'files/primary/Human Colon 3D/sub_4454/26_Adult_Left_Colon_4454_20x_anti_HucD_594_anti_nNOS_488_anti_CHAT_647_1.tif': 'files/primary/Human Colon 3D/sub_4454/26 Adult Left Colon 4454 20x anti HucD 594 anti nNOS 488 anti CHAT 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4454/33_Adult_Left_Colon_4454_20x_anti_HucD_594_anti_nNOS_488_anti_CHAT_647_8.tif': 'files/primary/Human Colon 3D/sub_4454/33 Adult Left Colon 4454 20x anti HucD 594 anti nNOS 488 anti CHAT 647 8.tif',
-            'files/primary/Human Colon 3D/sub_4454/41_Adult_Left_Colon_4454_10x_stitch_anti_HucD_594_anti_nNOS_488_anti_CHAT_647.tif': 'files/primary/Human Colon 3D/sub_4454/41 Adult Left Colon 4454 10x stitch anti HucD 594 anti nNOS 488 anti CHAT 647.tif',
-            'files/primary/Human Colon 3D/sub_4454/36_Adult_Left_Colon_4454_20x_anti_HucD_594_anti_nNOS_488_anti_CHAT_647_11.tif': 'files/primary/Human Colon 3D/sub_4454/36 Adult Left Colon 4454 20x anti HucD 594 anti nNOS 488 anti CHAT 647 11.tif',
-            'files/primary/Human Colon 3D/sub_4454/34_Adult_Left_Colon_4454_20x_anti_HucD_594_anti_nNOS_488_anti_CHAT_647_9.tif': 'files/primary/Human Colon 3D/sub_4454/34 Adult Left Colon 4454 20x anti HucD 594 anti nNOS 488 anti CHAT 647 9.tif',
-            'files/primary/Human Colon 3D/sub_4454/37_Adult_Left_Colon_4454_20x_anti_HucD_594_anti_nNOS_488_anti_CHAT_647_12.tif': 'files/primary/Human Colon 3D/sub_4454/37 Adult Left Colon 4454 20x anti HucD 594 anti nNOS 488 anti CHAT 647 12.tif',
-            'files/primary/Human Colon 3D/sub_4454/27_Adult_Left_Colon_4454_20x_anti_HucD_594_anti_nNOS_488_anti_CHAT_647_2.tif': 'files/primary/Human Colon 3D/sub_4454/27 Adult Left Colon 4454 20x anti HucD 594 anti nNOS 488 anti CHAT 647 2.tif',
-            'files/primary/Human Colon 3D/sub_4454/38_Adult_Left_Colon_4454_20x_anti_HucD_594_anti_nNOS_488_anti_CHAT_647_13.tif': 'files/primary/Human Colon 3D/sub_4454/38 Adult Left Colon 4454 20x anti HucD 594 anti nNOS 488 anti CHAT 647 13.tif',
-            'files/primary/Human Colon 3D/sub_4454/30_Adult_Left_Colon_4454_20x_anti_HucD_594_anti_nNOS_488_anti_CHAT_647_5.tif': 'files/primary/Human Colon 3D/sub_4454/30 Adult Left Colon 4454 20x anti HucD 594 anti nNOS 488 anti CHAT 647 5.tif',
-            'files/primary/Human Colon 3D/sub_4454/28_Adult_Left_Colon_4454_20x_anti_HucD_594_anti_nNOS_488_anti_CHAT_647_3.tif': 'files/primary/Human Colon 3D/sub_4454/28 Adult Left Colon 4454 20x anti HucD 594 anti nNOS 488 anti CHAT 647 3.tif',
-            'files/primary/Human Colon 3D/sub_4454/31_Adult_Left_Colon_4454_20x_anti_HucD_594_anti_nNOS_488_anti_CHAT_647_6.tif': 'files/primary/Human Colon 3D/sub_4454/31 Adult Left Colon 4454 20x anti HucD 594 anti nNOS 488 anti CHAT 647 6.tif',
-            'files/primary/Human Colon 3D/sub_4454/29_Adult_Left_Colon_4454_20x_anti_HucD_594_anti_nNOS_488_anti_CHAT_647_4.tif': 'files/primary/Human Colon 3D/sub_4454/29 Adult Left Colon 4454 20x anti HucD 594 anti nNOS 488 anti CHAT 647 4.tif',
-            'files/primary/Human Colon 3D/sub_4454/35_Adult_Left_Colon_4454_20x_anti_HucD_594_anti_nNOS_488_anti_CHAT_647_10.tif': 'files/primary/Human Colon 3D/sub_4454/35 Adult Left Colon 4454 20x anti HucD 594 anti nNOS 488 anti CHAT 647 10.tif',
-            'files/primary/Human Colon 3D/sub_4454/40_Adult_Left_Colon_4454_20x_anti_HucD_594_anti_nNOS_488_anti_CHAT_647_15.tif': 'files/primary/Human Colon 3D/sub_4454/40 Adult Left Colon 4454 20x anti HucD 594 anti nNOS 488 anti CHAT 647 15.tif',
-            'files/primary/Human Colon 3D/sub_4454/39_Adult_Left_Colon_4454_20x_anti_HucD_594_anti_nNOS_488_anti_CHAT_647_14.tif': 'files/primary/Human Colon 3D/sub_4454/39 Adult Left Colon 4454 20x anti HucD 594 anti nNOS 488 anti CHAT 647 14.tif',
-            'files/primary/Human Colon 3D/sub_4454/32_Adult_Left_Colon_4454_20x_anti_HucD_594_anti_nNOS_488_anti_CHAT_647_7.tif': 'files/primary/Human Colon 3D/sub_4454/32 Adult Left Colon 4454 20x anti HucD 594 anti nNOS 488 anti CHAT 647 7.tif',
-            'files/primary/Human Colon 3D/sub_4314/155_Adult_Left_Colon_4314_20x_anti_HucD_594_anti_calretinin_647_3.tif': 'files/primary/Human Colon 3D/sub_4314/155 Adult Left Colon 4314 20x anti HucD 594 anti calretinin 647 3.tif',
-            'files/primary/Human Colon 3D/sub_4314/157_Adult_Left_Colon_4314_20x_anti_HucD_594_anti_calretinin_647_5.tif': 'files/primary/Human Colon 3D/sub_4314/157 Adult Left Colon 4314 20x anti HucD 594 anti calretinin 647 5.tif',
-            'files/primary/Human Colon 3D/sub_4314/205_Adult_Left_Colon_4314_20x_anti_HucD_488_anti_VAChT_594_anti_ChAT__647_5.tif': 'files/primary/Human Colon 3D/sub_4314/205 Adult Left Colon 4314 20x anti HucD 488 anti VAChT 594 anti ChAT 647 5.tif',
-            'files/primary/Human Colon 3D/sub_4314/154_Adult_Left_Colon_4314_20x_anti_HucD_594_anti_calretinin_647_2.tif': 'files/primary/Human Colon 3D/sub_4314/154 Adult Left Colon 4314 20x anti HucD 594 anti calretinin 647 2.tif',
-            'files/primary/Human Colon 3D/sub_4314/153_Adult_Left_Colon_4314_20x_anti_HucD_594_anti_calretinin_647_1.tif': 'files/primary/Human Colon 3D/sub_4314/153 Adult Left Colon 4314 20x anti HucD 594 anti calretinin 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4314/204_Adult_Left_Colon_4314_20x_anti_HucD_488_anti_VAChT_594_anti_ChAT__647_4.tif': 'files/primary/Human Colon 3D/sub_4314/204 Adult Left Colon 4314 20x anti HucD 488 anti VAChT 594 anti ChAT 647 4.tif',
-            'files/primary/Human Colon 3D/sub_4314/106_Adult_Left_Colon_4314_20x_anti_HucD_488_anti_S100B_594_anti_PHOX2B_647_2.tif': 'files/primary/Human Colon 3D/sub_4314/106 Adult Left Colon 4314 20x anti HucD 488 anti S100B 594 anti PHOX2B 647 2.tif',
-            'files/primary/Human Colon 3D/sub_4314/203_Adult_Left_Colon_4314_20x_anti_HucD_488_anti_VAChT_594_anti_ChAT__647_3.tif': 'files/primary/Human Colon 3D/sub_4314/203 Adult Left Colon 4314 20x anti HucD 488 anti VAChT 594 anti ChAT 647 3.tif',
-            'files/primary/Human Colon 3D/sub_4314/158_Adult_Left_Colon_4314_10x_stitch_anti_HucD_594_anti_calretinin_647_1.tif': 'files/primary/Human Colon 3D/sub_4314/158 Adult Left Colon 4314 10x stitch anti HucD 594 anti calretinin 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4314/109_Adult_Left_Colon_4314_20x_anti_HucD_488_anti_S100B_594_anti_PHOX2B_647_5.tif': 'files/primary/Human Colon 3D/sub_4314/109 Adult Left Colon 4314 20x anti HucD 488 anti S100B 594 anti PHOX2B 647 5.tif',
-            'files/primary/Human Colon 3D/sub_4314/107_Adult_Left_Colon_4314_20x_anti_HucD_488_anti_S100B_594_anti_PHOX2B_647_3.tif': 'files/primary/Human Colon 3D/sub_4314/107 Adult Left Colon 4314 20x anti HucD 488 anti S100B 594 anti PHOX2B 647 3.tif',
-            'files/primary/Human Colon 3D/sub_4314/206_Adult_Left_Colon_4314_10x_stitch_anti_HucD_488_anti_VAChT_594_anti_ChAT_647_1.tif': 'files/primary/Human Colon 3D/sub_4314/206 Adult Left Colon 4314 10x stitch anti HucD 488 anti VAChT 594 anti ChAT 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4314/156_Adult_Left_Colon_4314_20x_anti_HucD_594_anti_calretinin_647_4.tif': 'files/primary/Human Colon 3D/sub_4314/156 Adult Left Colon 4314 20x anti HucD 594 anti calretinin 647 4.tif',
-            'files/primary/Human Colon 3D/sub_4314/110_Adult_Left_Colon_4314_10x_stitch_anti_HucD_488_anti_S100B_594_anti_PHOX2B_647_1.tif': 'files/primary/Human Colon 3D/sub_4314/110 Adult Left Colon 4314 10x stitch anti HucD 488 anti S100B 594 anti PHOX2B 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4314/201_Adult_Left_Colon_4314_20x_anti_HucD_488_anti_VAChT_594_anti_ChAT__647_1.tif': 'files/primary/Human Colon 3D/sub_4314/201 Adult Left Colon 4314 20x anti HucD 488 anti VAChT 594 anti ChAT 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4314/202_Adult_Left_Colon_4314_20x_anti_HucD_488_anti_VAChT_594_anti_ChAT__647_2.tif': 'files/primary/Human Colon 3D/sub_4314/202 Adult Left Colon 4314 20x anti HucD 488 anti VAChT 594 anti ChAT 647 2.tif',
-            'files/primary/Human Colon 3D/sub_4314/108_Adult_Left_Colon_4314_20x_anti_HucD_488_anti_S100B_594_anti_PHOX2B_647_4.tif': 'files/primary/Human Colon 3D/sub_4314/108 Adult Left Colon 4314 20x anti HucD 488 anti S100B 594 anti PHOX2B 647 4.tif',
-            'files/primary/Human Colon 3D/sub_4314/105_Adult_Left_Colon_4314_20x_anti_HucD_488_anti_S100B_594_anti_PHOX2B_647_1.tif': 'files/primary/Human Colon 3D/sub_4314/105 Adult Left Colon 4314 20x anti HucD 488 anti S100B 594 anti PHOX2B 647 1.tif',
-            'files/primary/Human Colon 3D/sub_ HPAP026/284_Adult_Jejunum_HPAP026_HuCD_S100_PHOX2B_Supplemental_Figure_4.tif': 'files/primary/Human Colon 3D/sub_ HPAP026/284 Adult Jejunum HPAP026 HuCD S100 PHOX2B.tif',
-            'files/primary/Human Colon 3D/sub_HSCR 1255/281_HSCR_1255_10x_stitch_proximal_margin_scale_HuCD_red_nNOS_green.tif': 'files/primary/Human Colon 3D/sub_HSCR 1255/281 HSCR 1255 10x stitch proximal margin scale HuCD red nNOS green.tif',
-            'files/primary/Human Colon 3D/sub_4585/121_Adult_Left_Colon_4585_10x_stitch_anti_HucD_488_anti_S100B_594_anti_PHOX2B_647_1.tif': 'files/primary/Human Colon 3D/sub_4585/121 Adult Left Colon 4585 10x stitch anti HucD 488 anti S100B 594 anti PHOX2B 647 1.tif',
-            'files/primary/Human Colon 3D/sub_HSCR 1255/282_HSCR_1255_10x_stitch_transition_zone_scale_HuCD_red_nNOS_green.tif': 'files/primary/Human Colon 3D/sub_HSCR 1255/282 HSCR 1255 10x stitch transition zone scale HuCD red nNOS green.tif',
-            'files/primary/Human Colon 3D/sub_4585/117_Adult_Left_Colon_4585_20x_anti_HucD_488_anti_S100B_594_anti_PHOX2B_647_2.tif': 'files/primary/Human Colon 3D/sub_4585/117 Adult Left Colon 4585 20x anti HucD 488 anti S100B 594 anti PHOX2B 647 2.tif',
-            'files/primary/Human Colon 3D/sub_4585/119_Adult_Left_Colon_4585_20x_anti_HucD_488_anti_S100B_594_anti_PHOX2B_647_4.tif': 'files/primary/Human Colon 3D/sub_4585/119 Adult Left Colon 4585 20x anti HucD 488 anti S100B 594 anti PHOX2B 647 4.tif',
-            'files/primary/Human Colon 3D/sub_4585/244_Adult_Left_Colon_4585_20x_anti_HucD_647_anti_cKit_594_1.tif': 'files/primary/Human Colon 3D/sub_4585/244 Adult Left Colon 4585 20x anti HucD 647 anti cKit 594 1.tif',
-            'files/primary/Human Colon 3D/sub_4585/270_Adult_Left_Colon_4585_20x_anti_HucD_647_anti_Tuj1_594_2.tif': 'files/primary/Human Colon 3D/sub_4585/270 Adult Left Colon 4585 20x anti HucD 647 anti Tuj1 594 2.tif',
-            'files/primary/Human Colon 3D/sub_4585/245_Adult_Left_Colon_4585_20x_anti_HucD_647_anti_cKit_594_2.tif': 'files/primary/Human Colon 3D/sub_4585/245 Adult Left Colon 4585 20x anti HucD 647 anti cKit 594 2.tif',
-            'files/primary/Human Colon 3D/sub_4585/246_Adult_Left_Colon_4585_20x_anti_HucD_647_anti_cKit_594_3.tif': 'files/primary/Human Colon 3D/sub_4585/246 Adult Left Colon 4585 20x anti HucD 647 anti cKit 594 3.tif',
-            'files/primary/Human Colon 3D/sub_4585/262_Adult_Left_Colon_4585_20x_anti_HucD_647_anti_NFM_594_3.tif': 'files/primary/Human Colon 3D/sub_4585/262 Adult Left Colon 4585 20x anti HucD 647 anti NFM 594 3.tif',
-            'files/primary/Human Colon 3D/sub_4585/120_Adult_Left_Colon_4585_20x_anti_HucD_488_anti_S100B_594_anti_PHOX2B_647_5.tif': 'files/primary/Human Colon 3D/sub_4585/120 Adult Left Colon 4585 20x anti HucD 488 anti S100B 594 anti PHOX2B 647 5.tif',
-            'files/primary/Human Colon 3D/sub_4585/260_Adult_Left_Colon_4585_20x_anti_HucD_647_anti_NFM_594_1.tif': 'files/primary/Human Colon 3D/sub_4585/260 Adult Left Colon 4585 20x anti HucD 647 anti NFM 594 1.tif',
-            'files/primary/Human Colon 3D/sub_4585/118_Adult_Left_Colon_4585_20x_anti_HucD_488_anti_S100B_594_anti_PHOX2B_647_3.tif': 'files/primary/Human Colon 3D/sub_4585/118 Adult Left Colon 4585 20x anti HucD 488 anti S100B 594 anti PHOX2B 647 3.tif',
-            'files/primary/Human Colon 3D/sub_4585/261_Adult_Left_Colon_4585_20x_anti_HucD_647_anti_NFM_594_2.tif': 'files/primary/Human Colon 3D/sub_4585/261 Adult Left Colon 4585 20x anti HucD 647 anti NFM 594 2.tif',
-            'files/primary/Human Colon 3D/sub_4585/116_Adult_Left_Colon_4585_20x_anti_HucD_488_anti_S100B_594_anti_PHOX2B_647_1.tif': 'files/primary/Human Colon 3D/sub_4585/116 Adult Left Colon 4585 20x anti HucD 488 anti S100B 594 anti PHOX2B 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4585/271_Adult_Left_Colon_4585_20x_anti_HucD_647_anti_Tuj1_594_3.tif': 'files/primary/Human Colon 3D/sub_4585/271 Adult Left Colon 4585 20x anti HucD 647 anti Tuj1 594 3.tif',
-            'files/primary/Human Colon 3D/sub_4585/269_Adult_Left_Colon_4585_20x_anti_HucD_647_anti_Tuj1_594_1.tif': 'files/primary/Human Colon 3D/sub_4585/269 Adult Left Colon 4585 20x anti HucD 647 anti Tuj1 594 1.tif',
-            'files/primary/Human Colon 3D/sub_4790/259_Adult_Right_Colon_4790_20x_anti_HucD_647_anti_cKit_594_3.tif': 'files/primary/Human Colon 3D/sub_4790/259 Adult Right Colon 4790 20x anti HucD 647 anti cKit 594 3.tif',
-            'files/primary/Human Colon 3D/sub_4790/103_Adult_Right_Colon_4790_20x_anti_HucD_488_anti_nNOS_594_anti_CHAT_647_5.tif': 'files/primary/Human Colon 3D/sub_4790/103 Adult Right Colon 4790 20x anti HucD 488 anti nNOS 594 anti CHAT 647 5.tif',
-            'files/primary/Human Colon 3D/sub_4790/149_Adult_Right_Colon_4790_20x_anti_HucD_488_anti_S100B_594_anti_PHOX2B_647_3.tif': 'files/primary/Human Colon 3D/sub_4790/149 Adult Right Colon 4790 20x anti HucD 488 anti S100B 594 anti PHOX2B 647 3.tif',
-            'files/primary/Human Colon 3D/sub_4790/151_Adult_Right_Colon_4790_20x_anti_HucD_488_anti_S100B_594_anti_PHOX2B_647_5.tif': 'files/primary/Human Colon 3D/sub_4790/151 Adult Right Colon 4790 20x anti HucD 488 anti S100B 594 anti PHOX2B 647 5.tif',
-            'files/primary/Human Colon 3D/sub_4790/258_Adult_Right_Colon_4790_20x_anti_HucD_647_anti_cKit_594_2.tif': 'files/primary/Human Colon 3D/sub_4790/258 Adult Right Colon 4790 20x anti HucD 647 anti cKit 594 2.tif',
-            'files/primary/Human Colon 3D/sub_4790/257Adult_Right_Colon_4790_20x_anti_HucD_647_anti_cKit_594_1.tif': 'files/primary/Human Colon 3D/sub_4790/257Adult Right Colon 4790 20x anti HucD 647 anti cKit 594 1.tif',
-            'files/primary/Human Colon 3D/sub_4790/104_Adult_Right_Colon_4790_10x_stitch_anti_HucD_488_anti_nNOS_594_anti_CHAT_647_1.tif': 'files/primary/Human Colon 3D/sub_4790/104 Adult Right Colon 4790 10x stitch anti HucD 488 anti nNOS 594 anti CHAT 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4790/100_Adult_Right_Colon_4790_20x_anti_HucD_488_anti_nNOS_594_anti_CHAT_647_2.tif': 'files/primary/Human Colon 3D/sub_4790/100 Adult Right Colon 4790 20x anti HucD 488 anti nNOS 594 anti CHAT 647 2.tif',
-            'files/primary/Human Colon 3D/sub_4790/265_Adult_Right_Colon_4790_20x_anti_HucD_647_anti_NFM_594_3.tif': 'files/primary/Human Colon 3D/sub_4790/265 Adult Right Colon 4790 20x anti HucD 647 anti NFM 594 3.tif',
-            'files/primary/Human Colon 3D/sub_4790/152_Adult_Right_Colon_4790_10x_stitch_anti_HucD_488_anti_S100B_594_anti_PHOX2B_647_1.tif': 'files/primary/Human Colon 3D/sub_4790/152 Adult Right Colon 4790 10x stitch anti HucD 488 anti S100B 594 anti PHOX2B 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4790/99_Composite_Adult_Right_Colon_4790_20x_anti_HucD_488_anti_nNOS_594_anti_CHAT_647_1-2.avi': 'files/primary/Human Colon 3D/sub_4790/99 Composite Adult Right Colon 4790 20x anti HucD 488 anti nNOS 594 anti CHAT 647 1-2.avi',
-            'files/primary/Human Colon 3D/sub_4790/150_Adult_Right_Colon_4790_20x_anti_HucD_488_anti_S100B_594_anti_PHOX2B_647_4.tif': 'files/primary/Human Colon 3D/sub_4790/150 Adult Right Colon 4790 20x anti HucD 488 anti S100B 594 anti PHOX2B 647 4.tif',
-            'files/primary/Human Colon 3D/sub_4790/264_Adult_Right_Colon_4790_20x_anti_HucD_647_anti_NFM_594_2.tif': 'files/primary/Human Colon 3D/sub_4790/264 Adult Right Colon 4790 20x anti HucD 647 anti NFM 594 2.tif',
-            'files/primary/Human Colon 3D/sub_4790/263_Adult_Right_Colon_4790_20x_anti_HucD_647_anti_NFM_594_1.tif': 'files/primary/Human Colon 3D/sub_4790/263 Adult Right Colon 4790 20x anti HucD 647 anti NFM 594 1.tif',
-            'files/primary/Human Colon 3D/sub_4790/102_Adult_Right_Colon_4790_20x_anti_HucD_488_anti_nNOS_594_anti_CHAT_647_4.tif': 'files/primary/Human Colon 3D/sub_4790/102 Adult Right Colon 4790 20x anti HucD 488 anti nNOS 594 anti CHAT 647 4.tif',
-            'files/primary/Human Colon 3D/sub_4790/275_Adult_Right_Colon_4790_20x_anti_HucD_647_anti_Tuj1_594_1.tif': 'files/primary/Human Colon 3D/sub_4790/275 Adult Right Colon 4790 20x anti HucD 647 anti Tuj1 594 1.tif',
-            'files/primary/Human Colon 3D/sub_4790/99_Adult_Right_Colon_4790_20x_anti_HucD_488_anti_nNOS_594_anti_CHAT_647_1.tif': 'files/primary/Human Colon 3D/sub_4790/99 Adult Right Colon 4790 20x anti HucD 488 anti nNOS 594 anti CHAT 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4790/148_Adult_Right_Colon_4790_20x_anti_HucD_488_anti_S100B_594_anti_PHOX2B_647_2.tif': 'files/primary/Human Colon 3D/sub_4790/148 Adult Right Colon 4790 20x anti HucD 488 anti S100B 594 anti PHOX2B 647 2.tif',
-            'files/primary/Human Colon 3D/sub_4790/147_Adult_Right_Colon_4790_20x_anti_HucD_488_anti_S100B_594_anti_PHOX2B_647_1.tif': 'files/primary/Human Colon 3D/sub_4790/147 Adult Right Colon 4790 20x anti HucD 488 anti S100B 594 anti PHOX2B 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4790/276_Adult_Right_Colon_4790_20x_anti_HucD_647_anti_Tuj1_594_2.tif': 'files/primary/Human Colon 3D/sub_4790/276 Adult Right Colon 4790 20x anti HucD 647 anti Tuj1 594 2.tif',
-            'files/primary/Human Colon 3D/sub_4527/230_Adult_Right_Colon_4527_20x_anti_HucD_594_anti_VAChT_488_anti_ChAT_647_5.tif': 'files/primary/Human Colon 3D/sub_4527/230 Adult Right Colon 4527 20x anti HucD 594 anti VAChT 488 anti ChAT 647 5.tif',
-            'files/primary/Human Colon 3D/sub_4790/101_Adult_Right_Colon_4790_20x_anti_HucD_488_anti_nNOS_594_anti_CHAT_647_3.tif': 'files/primary/Human Colon 3D/sub_4790/101 Adult Right Colon 4790 20x anti HucD 488 anti nNOS 594 anti CHAT 647 3.tif',
-            'files/primary/Human Colon 3D/sub_4790/277_Adult_Right_Colon_4790_20x_anti_HucD_647_anti_Tuj1_594_3.tif': 'files/primary/Human Colon 3D/sub_4790/277 Adult Right Colon 4790 20x anti HucD 647 anti Tuj1 594 3.tif',
-            'files/primary/Human Colon 3D/sub_4527/140_Adult_Right_Colon_4527_20x_anti_HucD_488_anti_S100B_594_anti_PHOX2B_647_1.tif': 'files/primary/Human Colon 3D/sub_4527/140 Adult Right Colon 4527 20x anti HucD 488 anti S100B 594 anti PHOX2B 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4527/227_Adult_Right_Colon_4527_20x_anti_HucD_594_anti_VAChT_488_anti_ChAT_647_2.tif': 'files/primary/Human Colon 3D/sub_4527/227 Adult Right Colon 4527 20x anti HucD 594 anti VAChT 488 anti ChAT 647 2.tif',
-            'files/primary/Human Colon 3D/sub_4527/192_Adult_Right_Colon_4527_20x_anti_HucD_594_anti_calretinin_647_4.tif': 'files/primary/Human Colon 3D/sub_4527/192 Adult Right Colon 4527 20x anti HucD 594 anti calretinin 647 4.tif',
-            'files/primary/Human Colon 3D/sub_4527/146_Adult_Right_Colon_4527_10x_stitch_anti_HucD_488_anti_S100B_594_anti_PHOX2B_647_1.tif': 'files/primary/Human Colon 3D/sub_4527/146 Adult Right Colon 4527 10x stitch anti HucD 488 anti S100B 594 anti PHOX2B 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4527/226_Adult_Right_Colon_4527_20x_anti_HucD_594_anti_VAChT_488_anti_ChAT_647_1.tif': 'files/primary/Human Colon 3D/sub_4527/226 Adult Right Colon 4527 20x anti HucD 594 anti VAChT 488 anti ChAT 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4527/144_Adult_Right_Colon_4527_20x_anti_HucD_488_anti_S100B_594_anti_PHOX2B_647_5.tif': 'files/primary/Human Colon 3D/sub_4527/144 Adult Right Colon 4527 20x anti HucD 488 anti S100B 594 anti PHOX2B 647 5.tif',
-            'files/primary/Human Colon 3D/sub_4527/145_Adult_Right_Colon_4527_20x_anti_HucD_488_anti_S100B_594_anti_PHOX2B_647_6.tif': 'files/primary/Human Colon 3D/sub_4527/145 Adult Right Colon 4527 20x anti HucD 488 anti S100B 594 anti PHOX2B 647 6.tif',
-            'files/primary/Human Colon 3D/sub_4527/141_Adult_Right_Colon_4527_20x_anti_HucD_488_anti_S100B_594_anti_PHOX2B_647_2.tif': 'files/primary/Human Colon 3D/sub_4527/141 Adult Right Colon 4527 20x anti HucD 488 anti S100B 594 anti PHOX2B 647 2.tif',
-            'files/primary/Human Colon 3D/sub_4527/142_Adult_Right_Colon_4527_20x_anti_HucD_488_anti_S100B_594_anti_PHOX2B_647_3.tif': 'files/primary/Human Colon 3D/sub_4527/142 Adult Right Colon 4527 20x anti HucD 488 anti S100B 594 anti PHOX2B 647 3.tif',
-            'files/primary/Human Colon 3D/sub_4527/228_Adult_Right_Colon_4527_20x_anti_HucD_594_anti_VAChT_488_anti_ChAT_647_3.tif': 'files/primary/Human Colon 3D/sub_4527/228 Adult Right Colon 4527 20x anti HucD 594 anti VAChT 488 anti ChAT 647 3.tif',
-            'files/primary/Human Colon 3D/sub_4527/229_Adult_Right_Colon_4527_20x_anti_HucD_594_anti_VAChT_488_anti_ChAT_647_4.tif': 'files/primary/Human Colon 3D/sub_4527/229 Adult Right Colon 4527 20x anti HucD 594 anti VAChT 488 anti ChAT 647 4.tif',
-            'files/primary/Human Colon 3D/sub_4527/189_Adult_Right_Colon_4527_20x_anti_HucD_594_anti_calretinin_647_1.tif': 'files/primary/Human Colon 3D/sub_4527/189 Adult Right Colon 4527 20x anti HucD 594 anti calretinin 647 1.tif',
-            'files/primary/Human Colon 3D/sub_4527/191_Adult_Right_Colon_4527_20x_anti_HucD_594_anti_calretinin_647_3.tif': 'files/primary/Human Colon 3D/sub_4527/191 Adult Right Colon 4527 20x anti HucD 594 anti calretinin 647 3.tif',
-            'files/primary/Human Colon 3D/sub_4527/190_Adult_Right_Colon_4527_20x_anti_HucD_594_anti_calretinin_647_2.tif': 'files/primary/Human Colon 3D/sub_4527/190 Adult Right Colon 4527 20x anti HucD 594 anti calretinin 647 2.tif',
-            'files/primary/Human Colon 3D/sub_4527/143_Adult_Right_Colon_4527_20x_anti_HucD_488_anti_S100B_594_anti_PHOX2B_647_4.tif': 'files/primary/Human Colon 3D/sub_4527/143 Adult Right Colon 4527 20x anti HucD 488 anti S100B 594 anti PHOX2B 647 4.tif',
-            'files/primary/Human Colon 3D/sub_4527/193_Adult_Right_Colon_4527_20x_anti_HucD_594_anti_calretinin_647_5.tif': 'files/primary/Human Colon 3D/sub_4527/193 Adult Right Colon 4527 20x anti HucD 594 anti calretinin 647 5.tif',
-            'files/primary/Human Colon 3D/sub_4527/194_Adult_Right_Colon_4527_10x_stitch_anti_HucD_594_anti_calretinin_647_1.tif': 'files/primary/Human Colon 3D/sub_4527/194 Adult Right Colon 4527 10x stitch anti HucD 594 anti calretinin 647 1.tif',
-            'files/docs/Graham_3D_Supplemental_Table_2_antibodies_that_did_NOT_work.pdf': 'files/docs/Graham 3D Supplemental Table 2 antibodies that did NOT work.pdf',
-            'files/docs/Supplemental_Table_5_Human_myenteric_neuron_subtypes.pdf': 'files/docs/Supplemental Table 5 Human myenteric neuron subtypes.pdf',
-            'files/docs/suplemental_table_4_Subtype_analysis.pdf': 'files/docs/suplemental table 4_Subtype analysis.pdf',
-            'files/docs/Graham_3D_Supplemental_Table_3_Demographics_Final_12_27_2019.pdf': 'files/docs/Graham 3D Supplemental Table 3 Demographics Final 12 27 2019.pdf',
-            'files/primary/pool-1/2b. Metabolic data_CNO_B3AR antagonist_24C.xlsx': 'files/primary/pool-1/2b. Metabolic data_CNO_B3AR antagonist_24C',
-            'files/primary/pool-1/1c. Telemetry_Tcore_activity_PBS_CNO_30C_10C.xlsx': 'files/primary/pool-1/1c. Telemetry_Tcore_activity_PBS_CNO_30C_10C',
-            'files/primary/pool-1/2c. Metabolic data_CNO_PBS_30C_10C.xlsx': 'files/primary/pool-1/2c. Metabolic data_CNO_PBS_30C_10C',
-            'files/primary/pool-1/1a. Telemetry_Tcore_activity_CNO_dose response_24C.xlsx': 'files/primary/pool-1/1a. Telemetry_Tcore_activity_CNO_dose response_24C',
-            'files/primary/pool-1/2a. Metabolic data_CNO_dose response_24C.xlsx': 'files/primary/pool-1/2a. Metabolic data_CNO_dose response_24C',
-            'files/primary/pool-1/1b. Telemetry_Tcore_activity_B3AR antagonist_24C.xlsx': 'files/primary/pool-1/1b. Telemetry_Tcore_activity_B3AR antagonist_24C',
-            'files/primary/pool-1/1d. Telemetry_Tcore_activity_CNO_B3AR agonist_30C_10C.xlsx': 'files/primary/pool-1/1d. Telemetry_Tcore_activity_CNO_B3AR agonist_30C_10C',
-            'files/primary/pool-1/4. Thermal gradient test_CNO_PBS.xlsx': 'files/primary/pool-1/4. Thermal gradient test_CNO_PBS',
-            'files/primary/pool-1/3. Body weight_Food intake_CNO_B3AR agonist_30C_10C.xlsx': 'files/primary/pool-1/3. Body weight_Food intake_CNO_B3AR agonist_30C_10C',
-            'files/derivative/Motility_Data.xlsx': 'files/derivative/Motility Data.xlsx',
-            'files/derivative/Electrode_Location_Data.xlsx': 'files/derivative/Electrode Location Data.xlsx',
-            'files/docs/Electrode_Location_Determination.docx': 'files/docs/Electrode Location Determination.docx',
-            'files/docs/Motility_index_map.png': 'files/docs/Motility index map.png',
-            'files/primary/sub-IM_15/IM15_10_25_2018_data_file.smrx': 'files/primary/sub-IM_15/IM15_10_25_2018_data file.smrx',
-            'files/primary/sub-IF_09/IF09_2018_08_29_data_file.smrx': 'files/primary/sub-IF_09/IF09_2018_08_29_data file.smrx',
-            'files/primary/sub-STxF_15/STxF15_2018_08_27_data_file.smrx': 'files/primary/sub-STxF_15/STxF15_2018_08_27_data file.smrx',
-            'files/primary/sub-STxF_13/STxF13_data_file_2018_08_21.smrx': 'files/primary/sub-STxF_13/STxF13_data file_2018_08_21.smrx',
-            'files/primary/sub-002/ses-001/eit/sub-002_ses-001_P_log.txt': 'files/primary/sub-002/ses-001/eit/sub-002_ses-001_P_log.txt.txt',
-            'files/primary/sub-002/ses-004/eit/sub-002_ses-004_T_log.txt': 'files/primary/sub-002/ses-004/eit/sub-002_ses-004_T_log.txt.txt',
-            'files/primary/sub-002/ses-003/eit/sub-002_ses-003_T_log.txt': 'files/primary/sub-002/ses-003/eit/sub-002_ses-003_T_log.txt.txt',
-            'files/primary/sub-002/ses-002/eit/sub-002_ses-002_P_log.txt': 'files/primary/sub-002/ses-002/eit/sub-002_ses-002_P_log.txt.txt',
-            'files/primary/sub-002/ses-008/eit/sub-002_ses-008_P_log.txt': 'files/primary/sub-002/ses-008/eit/sub-002_ses-008_P_log.txt.txt',
-            'files/primary/sub-002/ses-006/eit/sub-002_ses-006_T_log.txt': 'files/primary/sub-002/ses-006/eit/sub-002_ses-006_T_log.txt.txt',
-            'files/primary/sub-002/ses-005/eit/sub-002_ses-005_T_log.txt': 'files/primary/sub-002/ses-005/eit/sub-002_ses-005_T_log.txt.txt',
-            'files/primary/sub-002/ses-007/eit/sub-002_ses-007_P_log.txt': 'files/primary/sub-002/ses-007/eit/sub-002_ses-007_P_log.txt.txt',
-            'files/primary/sub-001/ses-001/eit/sub-001_ses-001_P_log.txt': 'files/primary/sub-001/ses-001/eit/sub-001_ses-001_P_log.txt.txt',
-            'files/primary/sub-001/ses-003/eit/sub-001_ses-003_P_log.txt': 'files/primary/sub-001/ses-003/eit/sub-001_ses-003_P_log.txt.txt',
-            'files/primary/sub-001/ses-002/eit/sub-001_ses-002_T_log.txt': 'files/primary/sub-001/ses-002/eit/sub-001_ses-002_T_log.txt.txt',
-            'files/primary/sub-001/ses-004/eit/sub-001_ses-004_T_log.txt': 'files/primary/sub-001/ses-004/eit/sub-001_ses-004_T_log.txt.txt',
-            'files/primary/sub-001/ses-008/eit/sub-001_ses-008_T_log.txt': 'files/primary/sub-001/ses-008/eit/sub-001_ses-008_T_log.txt.txt',
-            'files/primary/sub-001/ses-006/eit/sub-001_ses-006_P_log.txt': 'files/primary/sub-001/ses-006/eit/sub-001_ses-006_P_log.txt.txt',
-            'files/primary/sub-001/ses-005/eit/sub-001_ses-005_T_log.txt': 'files/primary/sub-001/ses-005/eit/sub-001_ses-005_T_log.txt.txt',
-            'files/primary/sub-001/ses-007/eit/sub-001_ses-007_P_log.txt': 'files/primary/sub-001/ses-007/eit/sub-001_ses-007_P_log.txt.txt',
-            'files/primary/sub-003/ses-001/eit/sub-003_ses-001_T_log.txt': 'files/primary/sub-003/ses-001/eit/sub-003_ses-001_T_log.txt.txt',
-            'files/primary/sub-003/ses-003/eit/sub-003_ses-003_P_log.txt': 'files/primary/sub-003/ses-003/eit/sub-003_ses-003_P_log.txt.txt',
-            'files/primary/sub-003/ses-002/eit/sub-003_ses-002_T_log.txt': 'files/primary/sub-003/ses-002/eit/sub-003_ses-002_T_log.txt.txt',
-            'files/primary/sub-003/ses-004/eit/sub-003_ses-004_P_log.txt': 'files/primary/sub-003/ses-004/eit/sub-003_ses-004_P_log.txt.txt',
-            'files/primary/sub-003/ses-006/eit/sub-003_ses-006_T_log.txt': 'files/primary/sub-003/ses-006/eit/sub-003_ses-006_T_log.txt.txt',
-            'files/primary/sub-003/ses-008/eit/sub-003_ses-008_P.txt': 'files/primary/sub-003/ses-008/eit/sub-003_ses-008_P_log.txt.txt',
-            'files/primary/sub-003/ses-008/eit/sub-003_ses-008_P.mat': 'files/primary/sub-003/ses-008/eit/sub-003_ses-008_P_log.mat',
-            'files/primary/sub-003/ses-005/eit/sub-003_ses-005_T_log.txt': 'files/primary/sub-003/ses-005/eit/sub-003_ses-005_T_log.txt.txt',
-            'files/primary/sub-003/ses-007/eit/sub-003_ses-007_P_log.txt': 'files/primary/sub-003/ses-007/eit/sub-003_ses-007_P_log.txt.txt',
-            'files/code/Rabbit_0D1D2DWF/1D2D/README.docx': 'files/code/Rabbit_0D1D2DWF/1D2D/README (1).docx',
-            'files/code/Human_0D1D2DWF/Single_Cell/README.txt': 'files/code/Human_0D1D2DWF/Single_Cell/README (1).txt',
-            'files/code/Mouse_0D1D2DWF/Single_Cell/README.md': 'files/code/Mouse_0D1D2DWF/Single_Cell/README (1).md',
-            'files/code/Mouse_0D1D2DWF/1D2D/README.docx': 'files/code/Mouse_0D1D2DWF/1D2D/README (1).docx', 'files/source/INa_fast_.xls': 'files/source/INa(fast).xls',
-            'files/source/INa_Late_.xls': 'files/source/INa(Late).xls',
-            'files/docs/Arrhythmia_formation_in_subclinical_long_QT_syndrome.pdf': 'files/docs/Arrhythmia formation in subclinical long QT syndrome.pdf',
-            'files/primary/sub-57/sam-3/microscopy/sub-57sam-3C57-3Slide2P1_10x.nd2': 'files/primary/sub-57/sam-3/microscopy/sub-57sam-3C57-3Slide2P1_10x (1).nd2',
-            'files/primary/sub-59/sam-3/microscopy/sub-59sam-3C59-3Slide2P1_10x.tif': 'files/primary/sub-59/sam-3/microscopy/sub-59sam-3C59-3Slide2P1_10x (1).tif',
-            'files/primary/sub-59/sam-4/microscopy/sub-59sam-4C59-4Slide2P1_10x.nd2': 'files/primary/sub-59/sam-4/microscopy/sub-59sam-4C59-4Slide2P1_10x (1).nd2',
-            'files/primary/sub-57/sam-4/microscopy/sub-57sam-4C57-4Slide2P1_10x.nd2': 'files/primary/sub-57/sam-4/microscopy/sub-57sam-4C57-4Slide2P1_10x (1).nd2',
-            'files/primary/sub-57/sam-2/microscopy/sub-57sam-2C57-2Slide2p1MT10x.nd2': 'files/primary/sub-57/sam-2/microscopy/sub-57sam-2C57-2Slide2p1MT10x (1).nd2',
-            'files/primary/sub-68/sam-1/microscopy/sub-68sam-1C68-1Slide2p3MT10x.tif': 'files/primary/sub-68/sam-1/microscopy/sub-68sam-1C68-1Slide2p3MT10x (1).tif',
-            'files/primary/sub-68/sam-2/microscopy/sub-68sam-2C68-2Slide2p3MT10x.nd2': 'files/primary/sub-68/sam-2/microscopy/sub-68sam-2C68-2Slide2p3MT10x (1).nd2',
-            'files/primary/sub-62/sam-1/microscopy/sub-62sam-1C62-1Slide2P3MT10x.tif': 'files/primary/sub-62/sam-1/microscopy/sub-62sam-1C62-1Slide2P3MT10x (1).tif',
-            'files/primary/sub-57/sam-1/microscopy/sub-57sam-1C57-1Slide2p3MT10x.nd2': 'files/primary/sub-57/sam-1/microscopy/sub-57sam-1C57-1Slide2p3MT10x (1).nd2',
-            'files/primary/sub-50/sam-2/microscopy/sub-50sam-2C50-2Slide2p1_10x.tif': 'files/primary/sub-50/sam-2/microscopy/sub-50sam-2C50-2Slide2p1_10x (1).tif',
-            'files/primary/sub-50/sam-1/microscopy/sub-50sam-1C50-1Slide2p1.nd2': 'files/primary/sub-50/sam-1/microscopy/sub-50sam-1C50-1Slide2p1 (1).nd2',
-            'files/primary/sub-62/sam-2/microscopy/sub-62sam-2C62-2Slide2P1MT10x.nd2': 'files/primary/sub-62/sam-2/microscopy/sub-62sam-2C62-2Slide2P1MT10x (1).nd2',
-            'files/primary/sub-44/sam-2/microscopy/sub-44sam-2C44-2Slide2p1_10x.tif': 'files/primary/sub-44/sam-2/microscopy/sub-44sam-2C44-2Slide2p1_10x (1).tif',
-            'files/primary/sub-69/sam-2/microscopy/sub-69sam-2C69-2Slide2p4MT10x.nd2': 'files/primary/sub-69/sam-2/microscopy/sub-69sam-2C69-2Slide2p4MT10x (1).nd2',
-            'files/primary/sub-44/sam-1/microscopy/sub-44sam-1C44-1Slide2p2MT_10x.tif': 'files/primary/sub-44/sam-1/microscopy/sub-44sam-1C44-1Slide2p2MT_10x (1).tif',
-            'files/primary/sub-69/sam-1/microscopy/sub-69sam-1C69-1Slide2p3MT10x.nd2': 'files/primary/sub-69/sam-1/microscopy/sub-69sam-1C69-1Slide2p3MT10x (1).nd2',
-            'files/primary/sub-71/sam-2/microscopy/sub-71sam-2C71-2Slide2p1MT10x.nd2': 'files/primary/sub-71/sam-2/microscopy/sub-71sam-2C71-2Slide2p1MT10x (1).nd2',
-            'files/primary/sub-71/sam-1/microscopy/sub-71sam-1C71-1Slide2p1MT10x.nd2': 'files/primary/sub-71/sam-1/microscopy/sub-71sam-1C71-1Slide2p1MT10x (1).nd2',
-            'files/primary/sub-58/sam-3/microscopy/sub-58sam-3C58-3Slide2P1_10x.nd2': 'files/primary/sub-58/sam-3/microscopy/sub-58sam-3C58-3Slide2P1_10x (1).nd2',
-            'files/primary/sub-58/sam-1/microscopy/sub-58sam-1C58-1Slide2p1MT10x.nd2': 'files/primary/sub-58/sam-1/microscopy/sub-58sam-1C58-1Slide2p1MT10x (1).nd2',
-            'files/primary/sub-58/sam-2/microscopy/sub-58sam-2C58-2Slide2p4MT10x.tif': 'files/primary/sub-58/sam-2/microscopy/sub-58sam-2C58-2Slide2p4MT10x (1).tif',
-            'files/primary/sub-58/sam-4/microscopy/sub-58sam-4C58-4Slide2P3_10x.tif': 'files/primary/sub-58/sam-4/microscopy/sub-58sam-4C58-4Slide2P3_10x (1).tif',
-            'files/primary/sub-65/sam-1/microscopy/sub-65sam-1C65-1Slide2p1MT10x.tif': 'files/primary/sub-65/sam-1/microscopy/sub-65sam-1C65-1Slide2p1MT10x (1).tif',
-            'files/primary/sub-65/sam-2/microscopy/sub-65sam-2C65-2Slide2p4MT10x.tif': 'files/primary/sub-65/sam-2/microscopy/sub-65sam-2C65-2Slide2p4MT10x (1).tif',
-            'files/primary/sub-72/sam-1/microscopy/sub-72sam-1C72-1Slide2p1MT10x.nd2': 'files/primary/sub-72/sam-1/microscopy/sub-72sam-1C72-1Slide2p1MT10x (1).nd2',
-            'files/primary/sub-47/sam-1/microscopy/sub-47sam-1C47-1Slide2p4MT_10x.nd2': 'files/primary/sub-47/sam-1/microscopy/sub-47sam-1C47-1Slide2p4MT_10x (1).nd2',
-            'files/primary/sub-72/sam-2/microscopy/sub-72sam-2C72-2Slide2p1MT10x.tif': 'files/primary/sub-72/sam-2/microscopy/sub-72sam-2C72-2Slide2p1MT10x (1).tif',
-            'files/primary/sub-64/sam-1/microscopy/sub-64sam-1C64-1Slide2p1MT10x.tif': 'files/primary/sub-64/sam-1/microscopy/sub-64sam-1C64-1Slide2p1MT10x (1).tif',
-            'files/primary/sub-56/sam-3/microscopy/sub-56sam-3C56-3Slide2P1_10x.tif': 'files/primary/sub-56/sam-3/microscopy/sub-56sam-3C56-3Slide2P1_10x (1).tif',
-            'files/primary/sub-56/sam-1/microscopy/sub-56sam-1C56-1Slide2p3MT10x.tif': 'files/primary/sub-56/sam-1/microscopy/sub-56sam-1C56-1Slide2p3MT10x (1).tif',
-            'files/primary/sub-47/sam-2/microscopy/sub-47sam-2C47-2Slide2p1_10x.tif': 'files/primary/sub-47/sam-2/microscopy/sub-47sam-2C47-2Slide2p1_10x (1).tif',
-            'files/primary/sub-64/sam-2/microscopy/sub-64sam-2C64-2Slide2p3MT10x.nd2': 'files/primary/sub-64/sam-2/microscopy/sub-64sam-2C64-2Slide2p3MT10x (1).nd2',
-            'files/primary/sub-56/sam-2/microscopy/sub-56sam-2C56-2Slide2p3MT10x.nd2': 'files/primary/sub-56/sam-2/microscopy/sub-56sam-2C56-2Slide2p3MT10x (1).nd2',
-            'files/primary/sub-67/sam-1/microscopy/sub-67sam-1C67-1Slide2p1MT10x.tif': 'files/primary/sub-67/sam-1/microscopy/sub-67sam-1C67-1Slide2p1MT10x (1).tif',
-            'files/primary/sub-67/sam-2/microscopy/sub-67sam-2C67-2Slide2p2MT10x.tif': 'files/primary/sub-67/sam-2/microscopy/sub-67sam-2C67-2Slide2p2MT10x (1).tif',
-            'files/primary/sub-66/sam-2/microscopy/sub-66sam-2C66-2Slide2p4MT10x.tif': 'files/primary/sub-66/sam-2/microscopy/sub-66sam-2C66-2Slide2p4MT10x (1).tif',
-            'files/primary/sub-54/sam-3/microscopy/sub-54sam-3C54-3Slide2P1_10x.nd2': 'files/primary/sub-54/sam-3/microscopy/sub-54sam-3C54-3Slide2P1_10x (1).nd2',
-            'files/primary/sub-54/sam-1/microscopy/sub-54sam-1C54-1Slide2p1MT10x.nd2': 'files/primary/sub-54/sam-1/microscopy/sub-54sam-1C54-1Slide2p1MT10x (1).nd2',
-            'files/primary/sub-54/sam-4/microscopy/sub-54sam-4C54-4Slide2P1_10x.tif': 'files/primary/sub-54/sam-4/microscopy/sub-54sam-4C54-4Slide2P1_10x (1).tif',
-            'files/primary/sub-54/sam-2/microscopy/sub-54sam-2C54-2Slide2p3MT10x.nd2': 'files/primary/sub-54/sam-2/microscopy/sub-54sam-2C54-2Slide2p3MT10x (1).nd2',
-            'files/primary/sub-61/sam-1/microscopy/sub-61sam-1C61-1Slide2P1MT10x.nd2': 'files/primary/sub-61/sam-1/microscopy/sub-61sam-1C61-1Slide2P1MT10x (1).nd2',
-            'files/primary/sub-56/sam-4/microscopy/sub-56sam-4C56-4Slide2P1_10x.nd2': 'files/primary/sub-56/sam-4/microscopy/sub-56sam-4C56-4Slide2P1_10x (1).nd2',
-            'files/primary/sub-61/sam-2/microscopy/sub-61sam-2C61-2Slide2P1MT10x.nd2': 'files/primary/sub-61/sam-2/microscopy/sub-61sam-2C61-2Slide2P1MT10x (1).nd2',
-            'files/primary/sub-51/sam-3/microscopy/sub-51sam-3C51-3Slide2p4MT.tif': 'files/primary/sub-51/sam-3/microscopy/sub-51sam-3C51-3Slide2p4MT (1).tif',
-            'files/primary/sub-42/sam-1/microscopy/sub-42sam-1C42-1Slide1p3MT_10x.tif': 'files/primary/sub-42/sam-1/microscopy/sub-42sam-1C42-1Slide1p3MT_10x (1).tif',
-            'files/primary/sub-42/sam-2/microscopy/sub-42sam-2C42-2Slide2p1_10x.nd2': 'files/primary/sub-42/sam-2/microscopy/sub-42sam-2C42-2Slide2p1_10x (1).nd2',
-            'files/primary/sub-51/sam-1/microscopy/sub-51sam-1C51-1Slide2p2.tif': 'files/primary/sub-51/sam-1/microscopy/sub-51sam-1C51-1Slide2p2 (1).tif',
-            'files/primary/sub-46/sam-1/microscopy/sub-46sam-1C46-1Slide2p4MT_10x.nd2': 'files/primary/sub-46/sam-1/microscopy/sub-46sam-1C46-1Slide2p4MT_10x (1).nd2',
-            'files/primary/sub-46/sam-2/microscopy/sub-46sam-2C46-2Slide2p1_10x.nd2': 'files/primary/sub-46/sam-2/microscopy/sub-46sam-2C46-2Slide2p1_10x (1).nd2',
-            'files/primary/sub-49/sam-1/microscopy/sub-49sam-1C49-1Slide2p1MT_10x.tif': 'files/primary/sub-49/sam-1/microscopy/sub-49sam-1C49-1Slide2p1MT_10x (1).tif',
-            'files/primary/sub-45/sam-1/microscopy/sub-45sam-1C45-1Slide2p1.tif': 'files/primary/sub-45/sam-1/microscopy/sub-45sam-1C45-1Slide2p1 (1).tif',
-            'files/primary/sub-45/sam-2/microscopy/sub-45sam-2C45-2Slide2p1_10x.tif': 'files/primary/sub-45/sam-2/microscopy/sub-45sam-2C45-2Slide2p1_10x (1).tif',
-            'files/primary/sub-43/sam-1/microscopy/sub-43sam-1C43-1Slide2p4.tif': 'files/primary/sub-43/sam-1/microscopy/sub-43sam-1C43-1Slide2p4 (1).tif',
-            'files/primary/sub-43/sam-2/microscopy/sub-43sam-2C43-2Slide2p1_10x.tif': 'files/primary/sub-43/sam-2/microscopy/sub-43sam-2C43-2Slide2p1_10x (1).tif',
-            'files/primary/sub-70/sam-1/microscopy/sub-70sam-1C70-1Slide2p1MT10x.nd2': 'files/primary/sub-70/sam-1/microscopy/sub-70sam-1C70-1Slide2p1MT10x (1).nd2',
-            'files/primary/sub-70/sam-2/microscopy/sub-70sam-2C70-2Slide2p3MT10x.tif': 'files/primary/sub-70/sam-2/microscopy/sub-70sam-2C70-2Slide2p3MT10x (1).tif',
-            'files/primary/sub-63/sam-1/microscopy/sub-63sam-1C63-1Slide2p3MT10x.tif': 'files/primary/sub-63/sam-1/microscopy/sub-63sam-1C63-1Slide2p3MT10x (1).tif',
-            'files/primary/sub-60/sam-3/microscopy/sub-60sam-3C60-3Slide2P1MT10x.nd2': 'files/primary/sub-60/sam-3/microscopy/sub-60sam-3C60-3Slide2P1MT10x (1).nd2',
-            'files/primary/sub-55/sam-5/microscopy/C55-5Slide2p1.nd2': 'files/primary/sub-55/sam-5/microscopy/C55-5Slide2p1 (1).nd2',
-            'files/primary/sub-60/sam-4/microscopy/sub-60sam-4C60-4Slide2P1MT10x.tif': 'files/primary/sub-60/sam-4/microscopy/sub-60sam-4C60-4Slide2P1MT10x (1).tif',
-            'files/primary/sub-48/sam-2/microscopy/sub-48sam-2C48-2Slide2p1_10x.tif': 'files/primary/sub-48/sam-2/microscopy/sub-48sam-2C48-2Slide2p1_10x (1).tif',
-            'files/primary/sub-55/sam-3/microscopy/sub-55sam-3C55-3Slide2P1_10x.nd2': 'files/primary/sub-55/sam-3/microscopy/sub-55sam-3C55-3Slide2P1_10x (1).nd2',
-            'files/primary/sub-55/sam-1/microscopy/sub-55sam-1C55-1Slide2p2MT10x.nd2': 'files/primary/sub-55/sam-1/microscopy/sub-55sam-1C55-1Slide2p2MT10x (1).nd2',
-            'files/primary/sub-55/sam-4/microscopy/sub-55sam-4C55-4Slide2P1_10x.tif': 'files/primary/sub-55/sam-4/microscopy/sub-55sam-4C55-4Slide2P1_10x (1).tif',
-            'files/primary/sub-55/sam-2/microscopy/sub-55sam-2C55-2Slide2p3MT10x.tif': 'files/primary/sub-55/sam-2/microscopy/sub-55sam-2C55-2Slide2p3MT10x (1).tif',
-            'files/primary/sub-53/sam-3/microscopy/sub-53sam-3C53-3Slide2p1MT10x.tif': 'files/primary/sub-53/sam-3/microscopy/sub-53sam-3C53-3Slide2p1MT10x (1).tif',
-            'files/primary/sub-53/sam-2/microscopy/sub-53sam-2C53-2Slide2p1MT10x.tif': 'files/primary/sub-53/sam-2/microscopy/sub-53sam-2C53-2Slide2p1MT10x (1).tif',
-            'files/primary/sub-53/sam-1/microscopy/sub-53sam-1C53-1Slide2p2MT10x.tif': 'files/primary/sub-53/sam-1/microscopy/sub-53sam-1C53-1Slide2p2MT10x (1).tif',
-            'files/primary/sub-53/sam-4/microscopy/sub-53sam-4C53-4Slide2p1MT10x.tif': 'files/primary/sub-53/sam-4/microscopy/sub-53sam-4C53-4Slide2p1MT10x (1).tif',
-            'files/derivative/sub-59/sam-4/sub-59sam-4C59-4Slide2P1_10x.jp2': 'files/derivative/sub-59/sam-4/sub-59sam-4C59-4Slide2P1_10x (1).jp2',
-            'files/derivative/sub-59/sam-3/sub-59sam-3C59-3Slide2P1_10x.tif': 'files/derivative/sub-59/sam-3/sub-59sam-3C59-3Slide2P1_10x (1).tif',
-            'files/derivative/sub-57/sam-3/sub-57sam-3C57-3Slide2P1_10x.tif': 'files/derivative/sub-57/sam-3/sub-57sam-3C57-3Slide2P1_10x (1).tif',
-            'files/derivative/sub-57/sam-1/sub-57sam-1C57-1Slide2p3MT10x.jp2': 'files/derivative/sub-57/sam-1/sub-57sam-1C57-1Slide2p3MT10x (1).jp2',
-            'files/derivative/sub-57/sam-2/sub-57sam-2C57-2Slide2p1MT10x.tif': 'files/derivative/sub-57/sam-2/sub-57sam-2C57-2Slide2p1MT10x (1).tif',
-            'files/derivative/sub-57/sam-4/sub-57sam-4C57-4Slide2P1_10x.tif': 'files/derivative/sub-57/sam-4/sub-57sam-4C57-4Slide2P1_10x (1).tif',
-            'files/derivative/sub-68/sam-2/sub-68sam-2C68-2Slide2p3MT10x.tif': 'files/derivative/sub-68/sam-2/sub-68sam-2C68-2Slide2p3MT10x (1).tif',
-            'files/derivative/sub-68/sam-1/sub-68sam-1C68-1Slide2p3MT10x.tif': 'files/derivative/sub-68/sam-1/sub-68sam-1C68-1Slide2p3MT10x (1).tif',
-            'files/derivative/sub-62/sam-1/sub-62sam-1C62-1Slide2P3MT10x.tif': 'files/derivative/sub-62/sam-1/sub-62sam-1C62-1Slide2P3MT10x (1).tif',
-            'files/derivative/sub-62/sam-1/sub-63sam-1C63-1Slide2p3MT10x.tif': 'files/derivative/sub-62/sam-1/sub-63sam-1C63-1Slide2p3MT10x (1).tif',
-            'files/derivative/sub-50/sam-1/sub-50sam-1C50-1Slide2p1.tif': 'files/derivative/sub-50/sam-1/sub-50sam-1C50-1Slide2p1 (1).tif',
-            'files/derivative/sub-50/sam-2/sub-51sam-3C51-3Slide2p4MT.tif': 'files/derivative/sub-50/sam-2/sub-51sam-3C51-3Slide2p4MT (1).tif',
-            'files/derivative/sub-62/sam-2/sub-62sam-2C62-2Slide2P1MT10x.tif': 'files/derivative/sub-62/sam-2/sub-62sam-2C62-2Slide2P1MT10x (1).tif',
-            'files/derivative/sub-50/sam-2/sub-50sam-2C50-2Slide2p1_10x.tif': 'files/derivative/sub-50/sam-2/sub-50sam-2C50-2Slide2p1_10x (1).tif',
-            'files/derivative/sub-44/sam-2/sub-44sam-2C44-2Slide2p1_10x.tif': 'files/derivative/sub-44/sam-2/sub-44sam-2C44-2Slide2p1_10x (1).tif',
-            'files/derivative/sub-44/sam-1/sub-44sam-1C44-1Slide2p2MT_10x.tif': 'files/derivative/sub-44/sam-1/sub-44sam-1C44-1Slide2p2MT_10x (1).tif',
-            'files/derivative/sub-69/sam-1/sub-69sam-1C69-1Slide2p3MT10x (1).tif': 'files/derivative/sub-69/sam-1/sub-69sam-1C69-1Slide2p3MT10x (1) (1).tif',
-            'files/derivative/sub-71/sam-1/sub-71sam-1C71-1Slide2p1MT10x.tif': 'files/derivative/sub-71/sam-1/sub-71sam-1C71-1Slide2p1MT10x (1).tif',
-            'files/derivative/sub-69/sam-2/sub-69sam-2C69-2Slide2p4MT10x (1).jp2': 'files/derivative/sub-69/sam-2/sub-69sam-2C69-2Slide2p4MT10x (1) (1).jp2',
-            'files/derivative/sub-71/sam-2/sub-71sam-2C71-2Slide2p1MT10x.tif': 'files/derivative/sub-71/sam-2/sub-71sam-2C71-2Slide2p1MT10x (1).tif',
-            'files/derivative/sub-58/sam-3/sub-58sam-3C58-3Slide2P1_10x.tif': 'files/derivative/sub-58/sam-3/sub-58sam-3C58-3Slide2P1_10x (1).tif',
-            'files/derivative/sub-58/sam-1/sub-58sam-1C58-1Slide2p1MT10x.tif': 'files/derivative/sub-58/sam-1/sub-58sam-1C58-1Slide2p1MT10x (1).tif',
-            'files/derivative/sub-58/sam-2/sub-58sam-2C58-2Slide2p4MT10x.tif': 'files/derivative/sub-58/sam-2/sub-58sam-2C58-2Slide2p4MT10x (1).tif',
-            'files/derivative/sub-58/sam-4/sub-58sam-4C58-4Slide2P3_10x.tif': 'files/derivative/sub-58/sam-4/sub-58sam-4C58-4Slide2P3_10x (1).tif',
-            'files/derivative/sub-65/sam-1/sub-65sam-1C65-1Slide2p1MT10x.jp2': 'files/derivative/sub-65/sam-1/sub-65sam-1C65-1Slide2p1MT10x (1).jp2',
-            'files/derivative/sub-65/sam-2/sub-65sam-2C65-2Slide2p4MT10x.tif': 'files/derivative/sub-65/sam-2/sub-65sam-2C65-2Slide2p4MT10x (1).tif',
-            'files/derivative/sub-47/sam-1/sub-47sam-1C47-1Slide2p4MT_10x.tif': 'files/derivative/sub-47/sam-1/sub-47sam-1C47-1Slide2p4MT_10x (1).tif',
-            'files/derivative/sub-47/sam-2/sub-47sam-2C47-2Slide2p1_10x.tif': 'files/derivative/sub-47/sam-2/sub-47sam-2C47-2Slide2p1_10x (1).tif',
-            'files/derivative/sub-72/sam-1/sub-72sam-1C72-1Slide2p1MT10x.tif': 'files/derivative/sub-72/sam-1/sub-72sam-1C72-1Slide2p1MT10x (1).tif',
-            'files/derivative/sub-72/sam-2/sub-72sam-2C72-2Slide2p1MT10x.tif': 'files/derivative/sub-72/sam-2/sub-72sam-2C72-2Slide2p1MT10x (1).tif',
-            'files/derivative/sub-64/sam-1/sub-64sam-1C64-1Slide2p1MT10x.tif': 'files/derivative/sub-64/sam-1/sub-64sam-1C64-1Slide2p1MT10x (1).tif',
-            'files/derivative/sub-56/sam-1/sub-56sam-1C56-1Slide2p3MT10x.tif': 'files/derivative/sub-56/sam-1/sub-56sam-1C56-1Slide2p3MT10x (1).tif',
-            'files/derivative/sub-56/sam-3/sub-56sam-3C56-3Slide2P1_10x.tif': 'files/derivative/sub-56/sam-3/sub-56sam-3C56-3Slide2P1_10x (1).tif',
-            'files/derivative/sub-64/sam-2/sub-64sam-2C64-2Slide2p3MT10x (1).tif': 'files/derivative/sub-64/sam-2/sub-64sam-2C64-2Slide2p3MT10x (1) (1).tif',
-            'files/derivative/sub-56/sam-4/sub-56sam-4C56-4Slide2P1_10x.tif': 'files/derivative/sub-56/sam-4/sub-56sam-4C56-4Slide2P1_10x (1).tif',
-            'files/derivative/sub-56/sam-2/sub-56sam-2C56-2Slide2p3MT10x.jp2': 'files/derivative/sub-56/sam-2/sub-56sam-2C56-2Slide2p3MT10x (1).jp2',
-            'files/derivative/sub-67/sam-1/sub-67sam-1C67-1Slide2p1MT10x.jp2': 'files/derivative/sub-67/sam-1/sub-67sam-1C67-1Slide2p1MT10x (1).jp2',
-            'files/derivative/sub-66/sam-2/sub-66sam-2C66-2Slide2p4MT10x.tif': 'files/derivative/sub-66/sam-2/sub-66sam-2C66-2Slide2p4MT10x (1).tif',
-            'files/derivative/sub-67/sam-2/sub-67sam-2C67-2Slide2p2MT10x.tif': 'files/derivative/sub-67/sam-2/sub-67sam-2C67-2Slide2p2MT10x (1).tif',
-            'files/derivative/sub-54/sam-3/sub-54sam-3C54-3Slide2P1_10x.tif': 'files/derivative/sub-54/sam-3/sub-54sam-3C54-3Slide2P1_10x (1).tif',
-            'files/derivative/sub-54/sam-2/sub-54sam-2C54-2Slide2p3MT10x.tif': 'files/derivative/sub-54/sam-2/sub-54sam-2C54-2Slide2p3MT10x (1).tif',
-            'files/derivative/sub-54/sam-1/sub-54sam-1C54-1Slide2p1MT10x.tif': 'files/derivative/sub-54/sam-1/sub-54sam-1C54-1Slide2p1MT10x (1).tif',
-            'files/derivative/sub-54/sam-4/sub-54sam-4C54-4Slide2P1_10x.tif': 'files/derivative/sub-54/sam-4/sub-54sam-4C54-4Slide2P1_10x (1).tif',
-            'files/derivative/sub-61/sam-1/sub-61sam-1C61-1Slide2P1MT10x.tif': 'files/derivative/sub-61/sam-1/sub-61sam-1C61-1Slide2P1MT10x (1).tif',
-            'files/derivative/sub-61/sam-2/sub-61sam-2C61-2Slide2P1MT10x (1).tif': 'files/derivative/sub-61/sam-2/sub-61sam-2C61-2Slide2P1MT10x (1) (1).tif',
-            'files/derivative/sub-51/sam-3/sub-51sam-3C51-3Slide2p4MT.tif': 'files/derivative/sub-51/sam-3/sub-51sam-3C51-3Slide2p4MT (1).tif',
-            'files/derivative/sub-51/sam-1/sub-51sam-1C51-1Slide2p2.tif': 'files/derivative/sub-51/sam-1/sub-51sam-1C51-1Slide2p2 (1).tif',
-            'files/derivative/sub-42/sam-2/sub-42sam-2C42-2Slide2p1_10x.tif': 'files/derivative/sub-42/sam-2/sub-42sam-2C42-2Slide2p1_10x (1).tif',
-            'files/derivative/sub-42/sam-1/sub-42sam-1C42-1Slide1p3MT_10x.tif': 'files/derivative/sub-42/sam-1/sub-42sam-1C42-1Slide1p3MT_10x (1).tif',
-            'files/derivative/sub-46/sam-1/sub-46sam-1C46-1Slide2p4MT_10x.tif': 'files/derivative/sub-46/sam-1/sub-46sam-1C46-1Slide2p4MT_10x (1).tif',
-            'files/derivative/sub-46/sam-2/sub-46sam-2C46-2Slide2p1_10x.tif': 'files/derivative/sub-46/sam-2/sub-46sam-2C46-2Slide2p1_10x (1).tif',
-            'files/derivative/sub-45/sam-1/sub-45sam-1C45-1Slide2p1.tif': 'files/derivative/sub-45/sam-1/sub-45sam-1C45-1Slide2p1 (1).tif',
-            'files/derivative/sub-49/sam-1/sub-49sam-1C49-1Slide2p1MT_10x.tif': 'files/derivative/sub-49/sam-1/sub-49sam-1C49-1Slide2p1MT_10x (1).tif',
-            'files/derivative/sub-45/sam-2/sub-45sam-2C45-2Slide2p1_10x.tif': 'files/derivative/sub-45/sam-2/sub-45sam-2C45-2Slide2p1_10x (1).tif',
-            'files/derivative/sub-43/sam-2/sub-43sam-2C43-2Slide2p1_10x.tif': 'files/derivative/sub-43/sam-2/sub-43sam-2C43-2Slide2p1_10x (1).tif',
-            'files/derivative/sub-63/sam-1/sub-63sam-1C63-1Slide2p3MT10x.tif': 'files/derivative/sub-63/sub-63sam-1C63-1Slide2p3MT10x (1).tif',
-            'files/derivative/sub-43/sam-1/sub-43sam-1C43-1Slide2p4.jp2': 'files/derivative/sub-43/sam-1/sub-43sam-1C43-1Slide2p4 (1).jp2',
-            'files/derivative/sub-63/sam-1/sub-63sam-1C63-1Slide2p3MT10x.jp2': 'files/derivative/sub-63/sub-63sam-1C63-1Slide2p3MT10x.jp2',
-            'files/derivative/sub-60/sam-3/sub-60sam-3C60-3Slide2P1MT10x (1).tif': 'files/derivative/sub-60/sam-3/sub-60sam-3C60-3Slide2P1MT10x (1) (1).tif',
-            'files/derivative/sub-70/sam-1/sub-70sam-1C70-1Slide2p1MT10x (1).jp2': 'files/derivative/sub-70/sam-1/sub-70sam-1C70-1Slide2p1MT10x (1) (1).jp2',
-            'files/derivative/sub-70/sam-2/sub-70sam-2C70-2Slide2p3MT10x.tif': 'files/derivative/sub-70/sam-2/sub-70sam-2C70-2Slide2p3MT10x (1).tif',
-            'files/derivative/sub-60/sam-4/sub-60sam-4C60-4Slide2P1MT10x.tif': 'files/derivative/sub-60/sam-4/sub-60sam-4C60-4Slide2P1MT10x (1).tif',
-            'files/derivative/sub-48/sam-2/sub-48sam-2C48-2Slide2p1_10x.tif': 'files/derivative/sub-48/sam-2/sub-48sam-2C48-2Slide2p1_10x (1).tif',
-            'files/derivative/sub-55/sam-5/C55-5Slide2p1.tif': 'files/derivative/sub-55/sam-5/C55-5Slide2p1 (1).tif',
-            'files/derivative/sub-55/sam-1/sub-55sam-1C55-1Slide2p2MT10x.tif': 'files/derivative/sub-55/sam-1/sub-55sam-1C55-1Slide2p2MT10x (1).tif',
-            'files/derivative/sub-55/sam-3/sub-55sam-3C55-3Slide2P1_10x.tif': 'files/derivative/sub-55/sam-3/sub-55sam-3C55-3Slide2P1_10x (1).tif',
-            'files/derivative/sub-55/sam-2/sub-55sam-2C55-2Slide2p3MT10x.tif': 'files/derivative/sub-55/sam-2/sub-55sam-2C55-2Slide2p3MT10x (1).tif',
-            'files/derivative/sub-55/sam-4/sub-55sam-4C55-4Slide2P1_10x.tif': 'files/derivative/sub-55/sam-4/sub-55sam-4C55-4Slide2P1_10x (1).tif',
-            'files/derivative/sub-53/sam-1/sub-53sam-1C53-1Slide2p2MT10x.tif': 'files/derivative/sub-53/sam-1/sub-53sam-1C53-1Slide2p2MT10x (1).tif',
-            'files/derivative/sub-53/sam-2/sub-53sam-2C53-2Slide2p1MT10x.tif': 'files/derivative/sub-53/sam-2/sub-53sam-2C53-2Slide2p1MT10x (1).tif',
-            'files/derivative/sub-53/sam-3/sub-53sam-3C53-3Slide2p1MT10x.tif': 'files/derivative/sub-53/sam-3/sub-53sam-3C53-3Slide2p1MT10x (1).tif',
-            'files/docs/PelotEtAl_2019_DukeUniversity_HumanVagusNerveAsset_2_600dpi.jpg': 'files/docs/PelotEtAl_2019_DukeUniversity_HumanVagusNerveAsset 2_600dpi.jpg',
-            'files/derivative/sub-53/sam-4/sub-53sam-4C53-4Slide2p1MT10x.tif': 'files/derivative/sub-53/sam-4/sub-53sam-4C53-4Slide2p1MT10x (1).tif',
-            'files/primary/sensor_validation/sub-1/0.00714_uM.tif': 'files/primary/sensor_validation/sub-1/sub-1_0.00714 uM',
-            'files/primary/sensor_validation/sub-1/7.14_uM.tif': 'files/primary/sensor_validation/sub-1/sub-1_7.14 uM',
-            'files/primary/sensor_validation/sub-1/71.4_uM.tif': 'files/primary/sensor_validation/sub-1/sub-1_71.4 uM',
-            'files/primary/sensor_validation/sub-1/0.0714_uM.tif': 'files/primary/sensor_validation/sub-1/sub-1_0.0714 uM',
-            'files/primary/sensor_validation/sub-6/without_drug_3v_00300_.tif': 'files/primary/sensor_validation/sub-6/sub-6_without drug 3v(00300).tif',
-            'files/primary/sensor_validation/sub-6/with_drug_3v_00299_.tif': 'files/primary/sensor_validation/sub-6/sub-6_with drug 3v(00299).tif',
-            'files/primary/sensor_validation/sub-1/0.714_uM.tif': 'files/primary/sensor_validation/sub-1/sub-1_0.714 uM',
-            'files/primary/sensor_validation/sub-1/142.85_uM.tif': 'files/primary/sensor_validation/sub-1/sub-1_142.85 uM',
-            'files/primary/sensor_validation/sub-3/without_drug_8V_00108_.tif': 'files/primary/sensor_validation/sub-3/sub-3 8V.tif',
-            'files/primary/sensor_validation/sub-1/714_uM.tif': 'files/primary/sensor_validation/sub-1/sub-1_714 uM.tif',
-            'files/primary/sensor_validation/sub-5/2019-11-01_ACh_sensor_staining_in_SMG_02_-_Same_Thresholds_z02.tif': 'files/primary/sensor_validation/sub-5/sub-5_2019-11-01 ACh sensor staining in SMG 02 - Same Thresholds_z02.tif',
-            'files/primary/sensor_validation/sub-4/10V-1.tif': 'files/primary/sensor_validation/sub-4/sub-4 10V.tif',
-            'files/primary/sensor_validation/sub-1/0.000714_uM.tif': 'files/primary/sensor_validation/sub-1/sub-1_0.000714 uM',
-            'files/primary/sensor_validation/sub-5/2019-11-01_ACh_sensor_staining_in_SMG_02_-_Same_Thresholds_z08.tif': 'files/primary/sensor_validation/sub-5/sub-5_2019-11-01 ACh sensor staining in SMG 02 - Same Thresholds_z08.tif',
-            'files/primary/sensor_validation/sub-2/3V_00104_.tif': 'files/primary/sensor_validation/sub-2/sub-2 3V.tif',
-            'files/primary/sensor_validation/sub-5/2019-11-01_ACh_sensor_staining_in_SMG_02_-_Same_Thresholds_z09.tif': 'files/primary/sensor_validation/sub-5/sub-5_2019-11-01 ACh sensor staining in SMG 02 - Same Thresholds_z09.tif',
-            'files/primary/sensor_validation/sub-5/2019-11-01_ACh_sensor_staining_in_SMG_02_-_Same_Thresholds_z05.tif': 'files/primary/sensor_validation/sub-5/sub-5_2019-11-01 ACh sensor staining in SMG 02 - Same Thresholds_z05.tif',
-            'files/primary/sensor_validation/sub-5/2019-11-01_ACh_sensor_staining_in_SMG_02_-_Same_Thresholds_z27.tif': 'files/primary/sensor_validation/sub-5/sub-5_2019-11-01 ACh sensor staining in SMG 02 - Same Thresholds_z27.tif',
-            'files/primary/sensor_validation/sub-5/2019-11-01_ACh_sensor_staining_in_SMG_02_-_Same_Thresholds_z04.tif': 'files/primary/sensor_validation/sub-5/sub-5_2019-11-01 ACh sensor staining in SMG 02 - Same Thresholds_z04.tif',
-            'files/primary/sensor_validation/sub-5/2019-11-01_ACh_sensor_staining_in_SMG_02_-_Same_Thresholds_z01.tif': 'files/primary/sensor_validation/sub-5/sub-5_2019-11-01 ACh sensor staining in SMG 02 - Same Thresholds_z01.tif',
-            'files/primary/sensor_validation/sub-5/2019-11-01_ACh_sensor_staining_in_SMG_02_-_Same_Thresholds_z24.tif': 'files/primary/sensor_validation/sub-5/sub-5_2019-11-01 ACh sensor staining in SMG 02 - Same Thresholds_z24.tif',
-            'files/primary/sensor_validation/sub-5/2019-11-01_ACh_sensor_staining_in_SMG_02_-_Same_Thresholds_z07.tif': 'files/primary/sensor_validation/sub-5/sub-5_2019-11-01 ACh sensor staining in SMG 02 - Same Thresholds_z07.tif',
-            'files/primary/sensor_validation/sub-5/2019-11-01_ACh_sensor_staining_in_SMG_02_-_Same_Thresholds_z26.tif': 'files/primary/sensor_validation/sub-5/sub-5_2019-11-01 ACh sensor staining in SMG 02 - Same Thresholds_z26.tif',
-            'files/primary/sensor_validation/sub-5/2019-11-01_ACh_sensor_staining_in_SMG_02_-_Same_Thresholds_z15.tif': 'files/primary/sensor_validation/sub-5/sub-5_2019-11-01 ACh sensor staining in SMG 02 - Same Thresholds_z15.tif',
-            'files/primary/sensor_validation/sub-5/2019-11-01_ACh_sensor_staining_in_SMG_02_-_Same_Thresholds_z03.tif': 'files/primary/sensor_validation/sub-5/sub-5_2019-11-01 ACh sensor staining in SMG 02 - Same Thresholds_z03.tif',
-            'files/primary/sensor_validation/sub-5/2019-11-01_ACh_sensor_staining_in_SMG_02_-_Same_Thresholds_z23.tif': 'files/primary/sensor_validation/sub-5/sub-5_2019-11-01 ACh sensor staining in SMG 02 - Same Thresholds_z23.tif',
-            'files/primary/sensor_validation/sub-5/2019-11-01_ACh_sensor_staining_in_SMG_02_-_Same_Thresholds_z17.tif': 'files/primary/sensor_validation/sub-5/sub-5_2019-11-01 ACh sensor staining in SMG 02 - Same Thresholds_z17.tif',
-            'files/primary/sensor_validation/sub-5/2019-11-01_ACh_sensor_staining_in_SMG_02_-_Same_Thresholds_z21.tif': 'files/primary/sensor_validation/sub-5/sub-5_2019-11-01 ACh sensor staining in SMG 02 - Same Thresholds_z21.tif',
-            'files/primary/sensor_validation/sub-5/2019-11-01_ACh_sensor_staining_in_SMG_02_-_Same_Thresholds_z11.tif': 'files/primary/sensor_validation/sub-5/sub-5_2019-11-01 ACh sensor staining in SMG 02 - Same Thresholds_z11.tif',
-            'files/primary/sensor_validation/sub-5/2019-11-01_ACh_sensor_staining_in_SMG_02_-_Same_Thresholds_z19.tif': 'files/primary/sensor_validation/sub-5/sub-5_2019-11-01 ACh sensor staining in SMG 02 - Same Thresholds_z19.tif',
-            'files/primary/sensor_validation/sub-5/2019-11-01_ACh_sensor_staining_in_SMG_02_-_Same_Thresholds_z22.tif': 'files/primary/sensor_validation/sub-5/sub-5_2019-11-01 ACh sensor staining in SMG 02 - Same Thresholds_z22.tif',
-            'files/primary/sensor_validation/sub-5/2019-11-01_ACh_sensor_staining_in_SMG_02_-_Same_Thresholds_z13.tif': 'files/primary/sensor_validation/sub-5/sub-5_2019-11-01 ACh sensor staining in SMG 02 - Same Thresholds_z13.tif',
-            'files/primary/sensor_validation/sub-5/2019-11-01_ACh_sensor_staining_in_SMG_02_-_Same_Thresholds_z10.tif': 'files/primary/sensor_validation/sub-5/sub-5_2019-11-01 ACh sensor staining in SMG 02 - Same Thresholds_z10.tif',
-            'files/primary/sensor_validation/sub-5/2019-11-01_ACh_sensor_staining_in_SMG_02_-_Same_Thresholds_z06.tif': 'files/primary/sensor_validation/sub-5/sub-5_2019-11-01 ACh sensor staining in SMG 02 - Same Thresholds_z06.tif',
-            'files/primary/sensor_validation/sub-5/2019-11-01_ACh_sensor_staining_in_SMG_02_-_Same_Thresholds_z12.tif': 'files/primary/sensor_validation/sub-5/sub-5_2019-11-01 ACh sensor staining in SMG 02 - Same Thresholds_z12.tif',
-            'files/primary/sensor_validation/sub-5/2019-11-01_ACh_sensor_staining_in_SMG_02_-_Same_Thresholds_z20.tif': 'files/primary/sensor_validation/sub-5/sub-5_2019-11-01 ACh sensor staining in SMG 02 - Same Thresholds_z20.tif',
-            'files/primary/sensor_validation/sub-5/2019-11-01_ACh_sensor_staining_in_SMG_02_-_Same_Thresholds_z14.tif': 'files/primary/sensor_validation/sub-5/sub-5_2019-11-01 ACh sensor staining in SMG 02 - Same Thresholds_z14.tif',
-            'files/primary/sensor_validation/sub-5/2019-11-01_ACh_sensor_staining_in_SMG_02_-_Same_Thresholds_z16.tif': 'files/primary/sensor_validation/sub-5/sub-5_2019-11-01 ACh sensor staining in SMG 02 - Same Thresholds_z16.tif',
-            'files/primary/sensor_validation/sub-5/2019-11-01_ACh_sensor_staining_in_SMG_02_-_Same_Thresholds_z18.tif': 'files/primary/sensor_validation/sub-5/sub-5_2019-11-01 ACh sensor staining in SMG 02 - Same Thresholds_z18.tif',
-            'files/primary/sensor_validation/sub-5/2019-11-01_ACh_sensor_staining_in_SMG_02_-_Same_Thresholds_z25.tif': 'files/primary/sensor_validation/sub-5/sub-5_2019-11-01 ACh sensor staining in SMG 02 - Same Thresholds_z25.tif',
-            'files/derivative/sensor_validation/sub-5/2019-11-01 ACh sensor staining in SMG 02 - Same Thresholds.jpx': 'files/derivative/sensor_validation/sub-5/2019-11-01-ACh sensor staining in SMG 02 Same Thresholds.jpx',
-            'files/derivative/sensor_validation/sub-5/2019-11-01 ACh sensor staining in SMG 02 - Same Thresholds.tif': 'files/derivative/sensor_validation/sub-5/2019-11-01-ACh sensor staining in SMG 02 Same Thresholds.tif',
-            'files/primary/sub713/Pig_713-S1.smrx': 'files/primary/sub713/Pig 713-S1.smrx', 'files/primary/sub713/Pig_713-S1-raw.smrx': 'files/primary/sub713/Pig 713-S1-raw.smrx',
-            'files/primary/sub863/PIG_863-S1-raw.smrx': 'files/primary/sub863/PIG 863-S1-raw.smrx',
-            'files/primary/sub1144/Pig_1144-R2-S1-raw.smrx': 'files/primary/sub1144/Pig 1144-R2-S1-raw.smrx',
-            'files/primary/sub863/PIG_863-S1.smrx': 'files/primary/sub863/PIG 863-S1.smrx',
-            'files/primary/sub1144/Pig_1144-L1-S1-raw.smrx': 'files/primary/sub1144/Pig 1144-L1-S1-raw.smrx',
-            'files/primary/sub1144/Pig_1144-R2-S1.smrx': 'files/primary/sub1144/Pig 1144-R2-S1.smrx',
-            'files/primary/sub1144/Pig_1144-L1-S1.smrx': 'files/primary/sub1144/Pig 1144-L1-S1.smrx',
-            'files/primary/sub1144/Pig_1144-L2-S1.smrx': 'files/primary/sub1144/Pig 1144-L2-S1.smrx',
-            'files/primary/sub1144/Pig_1144-L2-S1-raw.smrx': 'files/primary/sub1144/Pig 1144-L2-S1-raw.smrx',
-            'files/primary/sub820/Pig_820-S1-raw.smrx': 'files/primary/sub820/Pig 820-S1-raw.smrx', 'files/primary/sub820/Pig_820-S1.smrx': 'files/primary/sub820/Pig 820-S1.smrx',
-            'files/primary/sub1281/Pig_1281-R1-S1-raw.smrx': 'files/primary/sub1281/Pig 1281-R1-S1-raw.smrx',
-            'files/primary/sub975/Pig_975-S1.smrx': 'files/primary/sub975/Pig 975-S1.smrx', 'files/primary/sub975/Pig_975-S1-raw.smrx': 'files/primary/sub975/Pig 975-S1-raw.smrx',
-            'files/primary/sub1281/Pig_1281-R2-S1.smrx': 'files/primary/sub1281/Pig 1281-R2-S1.smrx',
-            'files/primary/sub1281/Pig_1281-L2-S1.smrx': 'files/primary/sub1281/Pig 1281-L2-S1.smrx',
-            'files/primary/sub1281/Pig_1281-R2-S1-raw.smrx': 'files/primary/sub1281/Pig 1281-R2-S1-raw.smrx',
-            'files/primary/sub1281/Pig_1281-L2-S1-raw.smrx': 'files/primary/sub1281/Pig 1281-L2-S1-raw.smrx',
-            'files/primary/sub1281/Pig_1281-L1-S1-raw.smrx': 'files/primary/sub1281/Pig 1281-L1-S1-raw.smrx',
-            'files/primary/sub1281/Pig_1281-L1-S1.smrx': 'files/primary/sub1281/Pig 1281-L1-S1.smrx',
-            'files/primary/sub1281/Pig_1281-R1-S1.smrx': 'files/primary/sub1281/Pig 1281-R1-S1.smrx',
-            'files/primary/sub1146/Pig_1146-R2-S1.smrx': 'files/primary/sub1146/Pig 1146-R2-S1.smrx',
-            'files/primary/sub1146/Pig_1146-R1-S1-raw.smrx': 'files/primary/sub1146/Pig 1146-R1-S1-raw.smrx',
-            'files/primary/sub1146/Pig_1146-L1-S1.smrx': 'files/primary/sub1146/Pig 1146-L1-S1.smrx',
-            'files/primary/sub1146/Pig_1146-R2-S1-raw.smrx': 'files/primary/sub1146/Pig 1146-R2-S1-raw.smrx',
-            'files/primary/sub1146/Pig_1146-L1-S1-raw.smrx': 'files/primary/sub1146/Pig 1146-L1-S1-raw.smrx',
-            'files/primary/sub1146/Pig_1146-R1-S1.smrx': 'files/primary/sub1146/Pig 1146-R1-S1.smrx',
-            'files/primary/sub1273/Pig_1273-L2-S1-raw.smrx': 'files/primary/sub1273/Pig 1273-L2-S1-raw.smrx',
-            'files/primary/sub1273/Pig_1273-R-S1.smrx': 'files/primary/sub1273/Pig 1273-R-S1.smrx',
-            'files/primary/sub1365/Pig_1365-S1-raw.smrx': 'files/primary/sub1365/Pig 1365-S1-raw.smrx',
-            'files/primary/sub1273/Pig_1273-R-S1-raw.smrx': 'files/primary/sub1273/Pig 1273-R-S1-raw.smrx',
-            'files/primary/sub1365/Pig_1365-S1.smrx': 'files/primary/sub1365/Pig 1365-S1.smrx',
-            'files/primary/sub1273/Pig_1273-L2-S1.smrx': 'files/primary/sub1273/Pig 1273-L2-S1.smrx',
-            'files/protocol/Pig_Nodose_recording_protocol.docx': 'files/protocol/Pig Nodose recording protocol.docx',
-            'files/primary/sub-P836/P836_Embedding_Schematic.pptx': 'files/primary/sub-P836/P836_Embedding Schematic.pptx',
-            'files/primary/sub-P866/histology/19P866_VN1_A_258.tif': 'files/primary/sub-P866/histology/P866_VN1_A_258.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_23_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_A_023.tif',
-            'files/primary/sub-P866/P866_Embedding_Schematic.pptx': 'files/primary/sub-P866/P866_Embedding Schematic.pptx',
-            'files/primary/sub-P866/histology/19P866_VN1_C_56_blue_black.tif': 'files/primary/sub-P866/histology/P866_VN1_C_056.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_20_black.tif': 'files/primary/sub-P866/histology/P866_VN1_B_020.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_160.tif': 'files/primary/sub-P866/histology/P866_Nodose_160.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_32.tif': 'files/primary/sub-P866/histology/P866_Nodose_032.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_125_black.tif': 'files/primary/sub-P866/histology/P866_VN1_A_125.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_161_blue.tif': 'files/primary/sub-P866/histology/P866_VN4_A_161.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_197_blue.tif': 'files/primary/sub-P866/histology/P866_VN4_A_197.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_158_blue.tif': 'files/primary/sub-P866/histology/P866_VN3_A_158.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_151.tif': 'files/primary/sub-P866/histology/P866_Nodose_151.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_147_blue_black.tif': 'files/primary/sub-P866/histology/P866_VN4_A_147.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_141.tif': 'files/primary/sub-P866/histology/P866_Nodose_141.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_145_black.tif': 'files/primary/sub-P866/histology/P866_VN4_A_145.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_289.tif': 'files/primary/sub-P866/histology/P866_VN1_A_289.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_201_blue.tif': 'files/primary/sub-P866/histology/P866_VN4_A_201.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_2.tif': 'files/primary/sub-P866/histology/P866_Nodose_002.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_36_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_A_036.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_138_blue_black.tif': 'files/primary/sub-P866/histology/P866_VN1_A_138.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_97_black.tif': 'files/primary/sub-P866/histology/P866_VN1_A_097.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_80.tif': 'files/primary/sub-P866/histology/P866_VN3_A_080.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_78_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_A_078.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_4.tif': 'files/primary/sub-P866/histology/P866_VN1_C_004.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_160_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_A_160.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_1_ripped.tif': 'files/primary/sub-P866/histology/P866_VN1_A_001.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_229.tif': 'files/primary/sub-P866/histology/P866_VN1_A_229.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_203.tif': 'files/primary/sub-P866/histology/P866_VN1_A_203.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_119.tif': 'files/primary/sub-P866/histology/P866_VN4_A_119.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_212.tif': 'files/primary/sub-P866/histology/P866_VN4_A_212.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_55_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_A_055.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_103_blue_black.tif': 'files/primary/sub-P866/histology/P866_VN1_B_103.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_31_black.tif': 'files/primary/sub-P866/histology/P866_VN1_B_031.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_233.tif': 'files/primary/sub-P866/histology/P866_VN1_A_233.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_44_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_A_044.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_97.tif': 'files/primary/sub-P866/histology/P866_Nodose_097.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_102_blue_black.tif': 'files/primary/sub-P866/histology/P866_VN1_B_102.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_125.tif': 'files/primary/sub-P866/histology/P866_VN1_C_125.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_154_blue.tif': 'files/primary/sub-P866/histology/P866_VN4_A_154.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_188.tif': 'files/primary/sub-P866/histology/P866_VN1_A_188.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_26_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_A_026.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_40_black.tif': 'files/primary/sub-P866/histology/P866_VN1_B_040.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_96_black.tif': 'files/primary/sub-P866/histology/P866_VN1_A_096.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_121_black.tif': 'files/primary/sub-P866/histology/P866_VN1_C_121.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_36.tif': 'files/primary/sub-P866/histology/P866_Nodose_036.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_162_blue.tif': 'files/primary/sub-P866/histology/P866_VN3_A_162.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_212.tif': 'files/primary/sub-P866/histology/P866_VN3_A_212.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_183_black.tif': 'files/primary/sub-P866/histology/P866_VN1_A_183.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_172_blue.tif': 'files/primary/sub-P866/histology/P866_VN4_A_172.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_205_black.tif': 'files/primary/sub-P866/histology/P866_VN4_A_205.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_58_black.tif': 'files/primary/sub-P866/histology/P866_VN1_B_058.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_262.tif': 'files/primary/sub-P866/histology/P866_VN1_A_262.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_198_black.tif': 'files/primary/sub-P866/histology/P866_VN3_A_198.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_154_blue.tif': 'files/primary/sub-P866/histology/P866_VN3_A_154.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_153_blue.tif': 'files/primary/sub-P866/histology/P866_VN3_A_153.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_55_black.tif': 'files/primary/sub-P866/histology/P866_VN1_B_055.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_90_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_C_090.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_107_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_C_107.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_251.tif': 'files/primary/sub-P866/histology/P866_VN1_A_251.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_45_black.tif': 'files/primary/sub-P866/histology/P866_VN1_B_045.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_86.tif': 'files/primary/sub-P866/histology/P866_VN4_A_086.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_249_black.tif': 'files/primary/sub-P866/histology/P866_VN1_A_249.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_200_black.tif': 'files/primary/sub-P866/histology/P866_VN1_A_200.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_130_black.tif': 'files/primary/sub-P866/histology/P866_VN4_A_130.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_200_blue.tif': 'files/primary/sub-P866/histology/P866_VN4_A_200.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_41_black.tif': 'files/primary/sub-P866/histology/P866_VN1_C_041.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_146_blue_black.tif': 'files/primary/sub-P866/histology/P866_VN1_A_146.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_128_black.tif': 'files/primary/sub-P866/histology/P866_VN1_B_128.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_104_blue_black.tif': 'files/primary/sub-P866/histology/P866_VN1_B_104.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_223.tif': 'files/primary/sub-P866/histology/P866_VN4_A_223.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_43_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_A_043.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_126.tif': 'files/primary/sub-P866/histology/P866_Nodose_126.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_102.tif': 'files/primary/sub-P866/histology/P866_VN4_A_102.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_153_blue.tif': 'files/primary/sub-P866/histology/P866_VN4_A_153.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_200_black.tif': 'files/primary/sub-P866/histology/P866_VN3_A_200.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_25.tif': 'files/primary/sub-P866/histology/P866_Nodose_025.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_299.tif': 'files/primary/sub-P866/histology/P866_VN1_A_299.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_209.tif': 'files/primary/sub-P866/histology/P866_VN1_A_209.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_111.tif': 'files/primary/sub-P866/histology/P866_Nodose_111.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_210.tif': 'files/primary/sub-P866/histology/P866_VN3_A_210.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_4_black.tif': 'files/primary/sub-P866/histology/P866_VN1_B_004.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_134.tif': 'files/primary/sub-P866/histology/P866_Nodose_134.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_143_black.tif': 'files/primary/sub-P866/histology/P866_VN1_B_143.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_137.tif': 'files/primary/sub-P866/histology/P866_VN4_A_137.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_89_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_C_089.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_162.tif': 'files/primary/sub-P866/histology/P866_Nodose_162.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_178_blue.tif': 'files/primary/sub-P866/histology/P866_VN3_A_178.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_159_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_A_159.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_113.tif': 'files/primary/sub-P866/histology/P866_Nodose_113.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_160_blue.tif': 'files/primary/sub-P866/histology/P866_VN3_A_160.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_160_blue.tif': 'files/primary/sub-P866/histology/P866_VN4_A_160.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_43.tif': 'files/primary/sub-P866/histology/P866_Nodose_043.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_219.tif': 'files/primary/sub-P866/histology/P866_VN4_A_219.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_132_blue.tif': 'files/primary/sub-P866/histology/P866_VN3_A_132.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_110.tif': 'files/primary/sub-P866/histology/P866_Nodose_110.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_12_black.tif': 'files/primary/sub-P866/histology/P866_VN1_B_012.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_24_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_A_024.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_34_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_A_034.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_190_black.tif': 'files/primary/sub-P866/histology/P866_VN3_A_190.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_287_black.tif': 'files/primary/sub-P866/histology/P866_VN1_A_287.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_261.tif': 'files/primary/sub-P866/histology/P866_VN1_A_261.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_31_black.tif': 'files/primary/sub-P866/histology/P866_VN1_C_031.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_134.tif': 'files/primary/sub-P866/histology/P866_VN1_C_134.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_56_black.tif': 'files/primary/sub-P866/histology/P866_VN1_B_056.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_154_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_A_154.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_32_black.tif': 'files/primary/sub-P866/histology/P866_VN1_B_032.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_138.tif': 'files/primary/sub-P866/histology/P866_VN4_A_138.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_47.tif': 'files/primary/sub-P866/histology/P866_Nodose_047.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_59_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_A_059.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_127.tif': 'files/primary/sub-P866/histology/P866_VN4_A_127.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_124.tif': 'files/primary/sub-P866/histology/P866_Nodose_124.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_4_ripped.tif': 'files/primary/sub-P866/histology/P866_VN1_A_004.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_54_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_A_054.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_165_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_A_165.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_99_blue_black.tif': 'files/primary/sub-P866/histology/P866_VN3_A_099.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_102B.tif': 'files/primary/sub-P866/histology/P866_VN4_A_102B.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_124_blue_black.tif': 'files/primary/sub-P866/histology/P866_VN3_A_124.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_56.tif': 'files/primary/sub-P866/histology/P866_Nodose_056.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_28_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_A_028.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_199_black.tif': 'files/primary/sub-P866/histology/P866_VN3_A_199.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_144_blue.tif': 'files/primary/sub-P866/histology/P866_VN3_A_144.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_41_black.tif': 'files/primary/sub-P866/histology/P866_VN1_B_041.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_57_blue_black.tif': 'files/primary/sub-P866/histology/P866_VN1_C_057.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_132_black.tif': 'files/primary/sub-P866/histology/P866_VN1_B_132.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_228_black.tif': 'files/primary/sub-P866/histology/P866_VN1_A_228.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_43_unclear.tif': 'files/primary/sub-P866/histology/P866_VN1_B_043.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_281.tif': 'files/primary/sub-P866/histology/P866_VN1_A_281.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_62_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_C_062.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_52_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_A_052.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_98_blue_black.tif': 'files/primary/sub-P866/histology/P866_VN3_A_098.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_168.tif': 'files/primary/sub-P866/histology/P866_Nodose_168.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_216.tif': 'files/primary/sub-P866/histology/P866_VN1_A_216.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_139.tif': 'files/primary/sub-P866/histology/P866_Nodose_139.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_219.tif': 'files/primary/sub-P866/histology/P866_VN3_A_219.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_178_blue.tif': 'files/primary/sub-P866/histology/P866_VN4_A_178.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_166_blue.tif': 'files/primary/sub-P866/histology/P866_VN4_A_166.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_136_blue_black.tif': 'files/primary/sub-P866/histology/P866_VN1_A_136.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_116_small_blue_large_black.tif': 'files/primary/sub-P866/histology/P866_VN1_B_116.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_120_black.tif': 'files/primary/sub-P866/histology/P866_VN1_C_120.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_224.tif': 'files/primary/sub-P866/histology/P866_VN4_A_224.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_35.tif': 'files/primary/sub-P866/histology/P866_Nodose_035.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_159.tif': 'files/primary/sub-P866/histology/P866_Nodose_159.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_238_black.tif': 'files/primary/sub-P866/histology/P866_VN1_A_238.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_102.tif': 'files/primary/sub-P866/histology/P866_Nodose_102.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_269.tif': 'files/primary/sub-P866/histology/P866_VN1_A_269.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_34_black.tif': 'files/primary/sub-P866/histology/P866_VN1_C_034.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_87.tif': 'files/primary/sub-P866/histology/P866_Nodose_087.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_57_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_A_057.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_175_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_A_175.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_72_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_C_072.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_70_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_C_070.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_79_blue_black.tif': 'files/primary/sub-P866/histology/P866_VN1_A_079.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_48.tif': 'files/primary/sub-P866/histology/P866_Nodose_048.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_147.tif': 'files/primary/sub-P866/histology/P866_Nodose_147.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_96_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_C_096.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_102_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_C_102.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_173_blue_strange_dye_pattern.tif': 'files/primary/sub-P866/histology/P866_VN1_A_173.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_144_unclear.tif': 'files/primary/sub-P866/histology/P866_VN1_A_144.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_125_blue_black.tif': 'files/primary/sub-P866/histology/P866_VN3_A_125.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_197_black.tif': 'files/primary/sub-P866/histology/P866_VN3_A_197.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_105_blue_black.tif': 'files/primary/sub-P866/histology/P866_VN3_A_105.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_211_black.tif': 'files/primary/sub-P866/histology/P866_VN3_A_211.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_133.tif': 'files/primary/sub-P866/histology/P866_Nodose_133.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_112.tif': 'files/primary/sub-P866/histology/P866_Nodose_112.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_210.tif': 'files/primary/sub-P866/histology/P866_VN1_A_210.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_201.tif': 'files/primary/sub-P866/histology/P866_VN3_A_201.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_87_blue_black.tif': 'files/primary/sub-P866/histology/P866_VN1_B_087.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_111.tif': 'files/primary/sub-P866/histology/P866_VN4_A_111.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_153.tif': 'files/primary/sub-P866/histology/P866_Nodose_153.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_112_blue_black.tif': 'files/primary/sub-P866/histology/P866_VN3_A_112.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_96.tif': 'files/primary/sub-P866/histology/P866_Nodose_096.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_194.tif': 'files/primary/sub-P866/histology/P866_VN1_A_194.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_177_blue.tif': 'files/primary/sub-P866/histology/P866_VN4_A_177.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_91_black.tif': 'files/primary/sub-P866/histology/P866_VN3_A_091.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_70.tif': 'files/primary/sub-P866/histology/P866_Nodose_070.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_166.tif': 'files/primary/sub-P866/histology/P866_Nodose_166.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_123_black.tif': 'files/primary/sub-P866/histology/P866_VN1_B_123.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_69_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_B_069.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_13_black.tif': 'files/primary/sub-P866/histology/P866_VN1_B_013.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_30_black.tif': 'files/primary/sub-P866/histology/P866_VN1_B_030.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_180_blue.tif': 'files/primary/sub-P866/histology/P866_VN4_A_180.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_184_blue.tif': 'files/primary/sub-P866/histology/P866_VN4_A_184.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_84.tif': 'files/primary/sub-P866/histology/P866_Nodose_084.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_9.tif': 'files/primary/sub-P866/histology/P866_Nodose_009.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_187_blue.tif': 'files/primary/sub-P866/histology/P866_VN4_A_187.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_189_blue.tif': 'files/primary/sub-P866/histology/P866_VN4_A_189.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_135.tif': 'files/primary/sub-P866/histology/P866_VN1_C_135.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_60_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_C_060.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_7_black.tif': 'files/primary/sub-P866/histology/P866_VN1_B_007.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_231_black.tif': 'files/primary/sub-P866/histology/P866_VN1_A_231.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_158.tif': 'files/primary/sub-P866/histology/P866_Nodose_158.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_95_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_C_095.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_109_black.tif': 'files/primary/sub-P866/histology/P866_VN4_A_109.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_137_folded.tif': 'files/primary/sub-P866/histology/P866_VN1_A_137.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_19_black.tif': 'files/primary/sub-P866/histology/P866_VN1_B_019.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_217_black.tif': 'files/primary/sub-P866/histology/P866_VN4_A_217.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_11_black.tif': 'files/primary/sub-P866/histology/P866_VN1_B_011.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_39_black.tif': 'files/primary/sub-P866/histology/P866_VN1_B_039.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_130_blue.tif': 'files/primary/sub-P866/histology/P866_VN3_A_130.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_103.tif': 'files/primary/sub-P866/histology/P866_Nodose_103.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_94_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_C_094.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_207_black.tif': 'files/primary/sub-P866/histology/P866_VN4_A_207.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_174_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_A_174.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_111_blue_black.tif': 'files/primary/sub-P866/histology/P866_VN3_A_111.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_30.tif': 'files/primary/sub-P866/histology/P866_Nodose_030.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_184_black.tif': 'files/primary/sub-P866/histology/P866_VN3_A_184.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_10.tif': 'files/primary/sub-P866/histology/P866_Nodose_010.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_86.tif': 'files/primary/sub-P866/histology/P866_Nodose_086.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_139.tif': 'files/primary/sub-P866/histology/P866_VN4_A_139.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_44_black.tif': 'files/primary/sub-P866/histology/P866_VN1_B_044.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_37.tif': 'files/primary/sub-P866/histology/P866_Nodose_037.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_101.tif': 'files/primary/sub-P866/histology/P866_VN4_A_101.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_20.tif': 'files/primary/sub-P866/histology/P866_VN1_C_020.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_66_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_B_066.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_33_black.tif': 'files/primary/sub-P866/histology/P866_VN1_C_033.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_88_blue_black.tif': 'files/primary/sub-P866/histology/P866_VN1_A_088.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_27_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_A_027.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_244.tif': 'files/primary/sub-P866/histology/P866_VN1_A_244.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_19.tif': 'files/primary/sub-P866/histology/P866_VN1_C_019.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_142_black.tif': 'files/primary/sub-P866/histology/P866_VN1_B_142.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_177_blue.tif': 'files/primary/sub-P866/histology/P866_VN3_A_177.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_143_blue.tif': 'files/primary/sub-P866/histology/P866_VN3_A_143.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_82_blue_black.tif': 'files/primary/sub-P866/histology/P866_VN1_A_082.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_161_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_A_161.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_95_black.tif': 'files/primary/sub-P866/histology/P866_VN3_A_095.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_98_black.tif': 'files/primary/sub-P866/histology/P866_VN1_A_098.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_188_blue.tif': 'files/primary/sub-P866/histology/P866_VN4_A_188.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_144.tif': 'files/primary/sub-P866/histology/P866_VN4_A_144.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_85.tif': 'files/primary/sub-P866/histology/P866_VN4_A_085.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_10_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_A_010.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_157.tif': 'files/primary/sub-P866/histology/P866_Nodose_157.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_141_blue.tif': 'files/primary/sub-P866/histology/P866_VN3_A_141.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_78_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_B_078.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_91_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_C_091.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_113_black.tif': 'files/primary/sub-P866/histology/P866_VN1_A_113.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_146_black.tif': 'files/primary/sub-P866/histology/P866_VN4_A_146.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_129.tif': 'files/primary/sub-P866/histology/P866_VN4_A_129.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_3.tif': 'files/primary/sub-P866/histology/P866_VN1_C_003.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_11.tif': 'files/primary/sub-P866/histology/P866_VN1_C_011.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_130_black.tif': 'files/primary/sub-P866/histology/P866_VN1_B_130.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_65_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_A_065.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_84_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_C_084.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_81.tif': 'files/primary/sub-P866/histology/P866_VN3_A_081.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_61_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_C_061.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_193_black.tif': 'files/primary/sub-P866/histology/P866_VN1_A_193.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_134_black.tif': 'files/primary/sub-P866/histology/P866_VN1_A_134.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_85_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_C_085.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_57_black.tif': 'files/primary/sub-P866/histology/P866_VN1_B_057.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_115_small_blue_large_black.tif': 'files/primary/sub-P866/histology/P866_VN1_B_115.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_16.tif': 'files/primary/sub-P866/histology/P866_Nodose_016.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_87.tif': 'files/primary/sub-P866/histology/P866_VN4_A_087.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_91_blue_black.tif': 'files/primary/sub-P866/histology/P866_VN1_A_091.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_106_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_C_106.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_190_black.tif': 'files/primary/sub-P866/histology/P866_VN1_A_190.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_81_blue_black.tif': 'files/primary/sub-P866/histology/P866_VN1_A_081.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_6_black.tif': 'files/primary/sub-P866/histology/P866_VN1_B_006.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_72_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_A_072.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_86_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_B_086.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_259.tif': 'files/primary/sub-P866/histology/P866_VN1_A_259.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_161.tif': 'files/primary/sub-P866/histology/P866_Nodose_161.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_121_black.tif': 'files/primary/sub-P866/histology/P866_VN1_B_121.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_225.tif': 'files/primary/sub-P866/histology/P866_VN4_A_225.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_96_black.tif': 'files/primary/sub-P866/histology/P866_VN3_A_096.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_93_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_C_093.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_222_black.tif': 'files/primary/sub-P866/histology/P866_VN1_A_222.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_213_black.tif': 'files/primary/sub-P866/histology/P866_VN3_A_213.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_110.tif': 'files/primary/sub-P866/histology/P866_VN4_A_110.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_286.tif': 'files/primary/sub-P866/histology/P866_VN1_A_286.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_263.tif': 'files/primary/sub-P866/histology/P866_VN1_A_263.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_304.tif': 'files/primary/sub-P866/histology/P866_VN1_A_304.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_58_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_A_058.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_89_blue_black.tif': 'files/primary/sub-P866/histology/P866_VN1_A_089.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_106_black.tif': 'files/primary/sub-P866/histology/P866_VN4_A_106.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_223.tif': 'files/primary/sub-P866/histology/P866_VN1_A_223.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_179_blue.tif': 'files/primary/sub-P866/histology/P866_VN4_A_179.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_31.tif': 'files/primary/sub-P866/histology/P866_Nodose_031.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_114.tif': 'files/primary/sub-P866/histology/P866_Nodose_114.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_208_black.tif': 'files/primary/sub-P866/histology/P866_VN1_A_208.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_195.tif': 'files/primary/sub-P866/histology/P866_VN1_A_195.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_159_blue.tif': 'files/primary/sub-P866/histology/P866_VN4_A_159.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_257_black.tif': 'files/primary/sub-P866/histology/P866_VN1_A_257.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_182_black.tif': 'files/primary/sub-P866/histology/P866_VN1_A_182.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_214.tif': 'files/primary/sub-P866/histology/P866_VN3_A_214.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_81_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_B_081.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_305.tif': 'files/primary/sub-P866/histology/P866_VN1_A_305.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_168_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_A_168.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_100.tif': 'files/primary/sub-P866/histology/P866_VN4_A_100.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_101.tif': 'files/primary/sub-P866/histology/P866_Nodose_101.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_202.tif': 'files/primary/sub-P866/histology/P866_VN1_A_202.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_71_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_A_071.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_83_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_C_083.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_10.tif': 'files/primary/sub-P866/histology/P866_VN1_C_010.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_33_black.tif': 'files/primary/sub-P866/histology/P866_VN1_B_033.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_80_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_B_080.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_60.tif': 'files/primary/sub-P866/histology/P866_Nodose_060.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_152_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_A_152.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_99.tif': 'files/primary/sub-P866/histology/P866_Nodose_099.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_104.tif': 'files/primary/sub-P866/histology/P866_VN4_A_104.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_186_blue.tif': 'files/primary/sub-P866/histology/P866_VN4_A_186.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_32_black.tif': 'files/primary/sub-P866/histology/P866_VN1_C_032.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_78.tif': 'files/primary/sub-P866/histology/P866_Nodose_078.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_125.tif': 'files/primary/sub-P866/histology/P866_Nodose_125.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_89_black.tif': 'files/primary/sub-P866/histology/P866_VN3_A_089.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_44.tif': 'files/primary/sub-P866/histology/P866_Nodose_044.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_97_black.tif': 'files/primary/sub-P866/histology/P866_VN3_A_097.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_18_black.tif': 'files/primary/sub-P866/histology/P866_VN1_B_018.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_224.tif': 'files/primary/sub-P866/histology/P866_VN1_A_224.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_155_blue.tif': 'files/primary/sub-P866/histology/P866_VN4_A_155.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_66_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_A_066.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_79_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_B_079.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_12.tif': 'files/primary/sub-P866/histology/P866_VN1_C_012.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_60_black.tif': 'files/primary/sub-P866/histology/P866_VN1_B_060.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_100_blue_black.tif': 'files/primary/sub-P866/histology/P866_VN3_A_100.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_163_blue.tif': 'files/primary/sub-P866/histology/P866_VN3_A_163.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_239.tif': 'files/primary/sub-P866/histology/P866_VN1_A_239.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_68.tif': 'files/primary/sub-P866/histology/P866_Nodose_068.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_260_black.tif': 'files/primary/sub-P866/histology/P866_VN1_A_260.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_12_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_A_012.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_167_blue.tif': 'files/primary/sub-P866/histology/P866_VN4_A_167.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_1.tif': 'files/primary/sub-P866/histology/P866_VN1_C_001.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_83.tif': 'files/primary/sub-P866/histology/P866_Nodose_083.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_124_black.tif': 'files/primary/sub-P866/histology/P866_VN1_A_124.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_22_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_A_022.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_126.tif': 'files/primary/sub-P866/histology/P866_VN4_A_126.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_167.tif': 'files/primary/sub-P866/histology/P866_Nodose_167.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_240_black.tif': 'files/primary/sub-P866/histology/P866_VN1_A_240.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_88_blue_black.tif': 'files/primary/sub-P866/histology/P866_VN1_B_088.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_123_blue_black.tif': 'files/primary/sub-P866/histology/P866_VN3_A_123.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_135_black.tif': 'files/primary/sub-P866/histology/P866_VN1_A_135.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_14_black.tif': 'files/primary/sub-P866/histology/P866_VN1_B_014.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_242.tif': 'files/primary/sub-P866/histology/P866_VN1_A_242.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_206_black.tif': 'files/primary/sub-P866/histology/P866_VN4_A_206.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_59_black.tif': 'files/primary/sub-P866/histology/P866_VN1_B_059.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_165_blue.tif': 'files/primary/sub-P866/histology/P866_VN3_A_165.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_107_black.tif': 'files/primary/sub-P866/histology/P866_VN1_A_107.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_71_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_C_071.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_21_black.tif': 'files/primary/sub-P866/histology/P866_VN1_C_021.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_59_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_C_059.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_38_black.tif': 'files/primary/sub-P866/histology/P866_VN1_B_038.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_256.tif': 'files/primary/sub-P866/histology/P866_VN1_A_256.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_145.tif': 'files/primary/sub-P866/histology/P866_Nodose_145.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_133_black.tif': 'files/primary/sub-P866/histology/P866_VN1_A_133.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_136.tif': 'files/primary/sub-P866/histology/P866_VN1_C_136.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_61_black.tif': 'files/primary/sub-P866/histology/P866_VN1_B_061.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_119_blue_black.tif': 'files/primary/sub-P866/histology/P866_VN3_A_119.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_182_black.tif': 'files/primary/sub-P866/histology/P866_VN3_A_182.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_115_black.tif': 'files/primary/sub-P866/histology/P866_VN1_C_115.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_77.tif': 'files/primary/sub-P866/histology/P866_Nodose_077.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_56_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_A_056.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_53_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_A_053.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_2_ripped.tif': 'files/primary/sub-P866/histology/P866_VN1_A_002.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_9.tif': 'files/primary/sub-P866/histology/P866_VN1_C_009.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_122_black.tif': 'files/primary/sub-P866/histology/P866_VN1_B_122.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_176_blue.tif': 'files/primary/sub-P866/histology/P866_VN3_A_176.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_131_black.tif': 'files/primary/sub-P866/histology/P866_VN1_B_131.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_103.tif': 'files/primary/sub-P866/histology/P866_VN4_A_103.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_107.tif': 'files/primary/sub-P866/histology/P866_VN4_A_107.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_165_blue.tif': 'files/primary/sub-P866/histology/P866_VN4_A_165.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_108_small_blue_black.tif': 'files/primary/sub-P866/histology/P866_VN1_B_108.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_217.tif': 'files/primary/sub-P866/histology/P866_VN1_A_217.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_189.tif': 'files/primary/sub-P866/histology/P866_VN1_A_189.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_105_black.tif': 'files/primary/sub-P866/histology/P866_VN1_A_105.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_232.tif': 'files/primary/sub-P866/histology/P866_VN1_A_232.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_309_black.tif': 'files/primary/sub-P866/histology/P866_VN1_A_309.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_181_black.tif': 'files/primary/sub-P866/histology/P866_VN1_A_181.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_108.tif': 'files/primary/sub-P866/histology/P866_VN4_A_108.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_17.tif': 'files/primary/sub-P866/histology/P866_Nodose_017.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_43_black.tif': 'files/primary/sub-P866/histology/P866_VN1_C_043.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_135.tif': 'files/primary/sub-P866/histology/P866_Nodose_135.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_292_black.tif': 'files/primary/sub-P866/histology/P866_VN1_A_292.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_243.tif': 'files/primary/sub-P866/histology/P866_VN1_A_243.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_109_small_blue_black.tif': 'files/primary/sub-P866/histology/P866_VN1_B_109.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_132_black.tif': 'files/primary/sub-P866/histology/P866_VN1_A_132.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_100.tif': 'files/primary/sub-P866/histology/P866_Nodose_100.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_115.tif': 'files/primary/sub-P866/histology/P866_Nodose_115.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_99_black.tif': 'files/primary/sub-P866/histology/P866_VN1_A_099.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_201.tif': 'files/primary/sub-P866/histology/P866_VN1_A_201.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_98.tif': 'files/primary/sub-P866/histology/P866_Nodose_098.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_11_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_A_011.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_113_black.tif': 'files/primary/sub-P866/histology/P866_VN1_C_113.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_121_blue_black.tif': 'files/primary/sub-P866/histology/P866_VN3_A_121.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_121.tif': 'files/primary/sub-P866/histology/P866_VN4_A_121.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_45.tif': 'files/primary/sub-P866/histology/P866_Nodose_045.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_209_black.tif': 'files/primary/sub-P866/histology/P866_VN3_A_209.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_79.tif': 'files/primary/sub-P866/histology/P866_VN3_A_079.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_300_black.tif': 'files/primary/sub-P866/histology/P866_VN1_A_300.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_147_blue_black.tif': 'files/primary/sub-P866/histology/P866_VN1_A_147.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_215_black.tif': 'files/primary/sub-P866/histology/P866_VN1_A_215.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_49_blue_black.tif': 'files/primary/sub-P866/histology/P866_VN1_C_049.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_110_blue_black.tif': 'files/primary/sub-P866/histology/P866_VN3_A_110.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_188_black.tif': 'files/primary/sub-P866/histology/P866_VN3_A_188.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_153_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_A_153.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_75.tif': 'files/primary/sub-P866/histology/P866_VN3_A_075.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_33_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_A_033.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_40_black.tif': 'files/primary/sub-P866/histology/P866_VN1_C_040.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_288.tif': 'files/primary/sub-P866/histology/P866_VN1_A_288.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_15.tif': 'files/primary/sub-P866/histology/P866_Nodose_015.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_95.tif': 'files/primary/sub-P866/histology/P866_Nodose_095.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_3_ripped.tif': 'files/primary/sub-P866/histology/P866_VN1_A_003.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_307.tif': 'files/primary/sub-P866/histology/P866_VN1_A_307.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_83_blue_black.tif': 'files/primary/sub-P866/histology/P866_VN1_A_083.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_149_blue_black.tif': 'files/primary/sub-P866/histology/P866_VN4_A_149.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_167_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_A_167.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_171_blue.tif': 'files/primary/sub-P866/histology/P866_VN4_A_171.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_144_black.tif': 'files/primary/sub-P866/histology/P866_VN1_B_144.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_196_blue.tif': 'files/primary/sub-P866/histology/P866_VN4_A_196.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_80_blue_black.tif': 'files/primary/sub-P866/histology/P866_VN1_A_080.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_250.tif': 'files/primary/sub-P866/histology/P866_VN1_A_250.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_105_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_C_105.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_173_blue.tif': 'files/primary/sub-P866/histology/P866_VN3_A_173.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_120.tif': 'files/primary/sub-P866/histology/P866_VN4_A_120.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_189_black.tif': 'files/primary/sub-P866/histology/P866_VN3_A_189.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_152_blue.tif': 'files/primary/sub-P866/histology/P866_VN3_A_152.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_26.tif': 'files/primary/sub-P866/histology/P866_Nodose_026.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_131_blue.tif': 'files/primary/sub-P866/histology/P866_VN3_A_131.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_112_black.tif': 'files/primary/sub-P866/histology/P866_VN1_A_112.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_50_black.tif': 'files/primary/sub-P866/histology/P866_VN1_C_050.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_42_folded.tif': 'files/primary/sub-P866/histology/P866_VN1_B_042.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_114_black.tif': 'files/primary/sub-P866/histology/P866_VN1_A_114.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_128.tif': 'files/primary/sub-P866/histology/P866_VN4_A_128.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_142_blue.tif': 'files/primary/sub-P866/histology/P866_VN3_A_142.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_55_blue_black.tif': 'files/primary/sub-P866/histology/P866_VN1_C_055.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_104_black.tif': 'files/primary/sub-P866/histology/P866_VN1_A_104.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_127_black.tif': 'files/primary/sub-P866/histology/P866_VN1_A_127.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_220_black.tif': 'files/primary/sub-P866/histology/P866_VN3_A_220.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_119_black.tif': 'files/primary/sub-P866/histology/P866_VN1_C_119.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_145_blue_black.tif': 'files/primary/sub-P866/histology/P866_VN1_A_145.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_183_black.tif': 'files/primary/sub-P866/histology/P866_VN3_A_183.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_161_blue.tif': 'files/primary/sub-P866/histology/P866_VN3_A_161.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_133_black.tif': 'files/primary/sub-P866/histology/P866_VN1_B_133.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_211.tif': 'files/primary/sub-P866/histology/P866_VN4_A_211.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_73_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_C_073.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_230.tif': 'files/primary/sub-P866/histology/P866_VN1_A_230.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_166_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_A_166.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_125_black.tif': 'files/primary/sub-P866/histology/P866_VN4_A_125.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_48_blue_black.tif': 'files/primary/sub-P866/histology/P866_VN1_C_048.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_79.tif': 'files/primary/sub-P866/histology/P866_Nodose_079.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_47_black.tif': 'files/primary/sub-P866/histology/P866_VN1_C_047.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_73.tif': 'files/primary/sub-P866/histology/P866_VN3_A_073.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_199_blue.tif': 'files/primary/sub-P866/histology/P866_VN4_A_199.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_146.tif': 'files/primary/sub-P866/histology/P866_Nodose_146.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_82_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_C_082.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_151_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_A_151.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_129_black.tif': 'files/primary/sub-P866/histology/P866_VN1_B_129.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_298.tif': 'files/primary/sub-P866/histology/P866_VN1_A_298.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_173_blue.tif': 'files/primary/sub-P866/histology/P866_VN4_A_173.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_241.tif': 'files/primary/sub-P866/histology/P866_VN1_A_241.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_64_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_A_064.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_69.tif': 'files/primary/sub-P866/histology/P866_Nodose_069.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_115_black.tif': 'files/primary/sub-P866/histology/P866_VN1_A_115.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_152.tif': 'files/primary/sub-P866/histology/P866_Nodose_152.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_42_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_A_042.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_42_black.tif': 'files/primary/sub-P866/histology/P866_VN1_C_042.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_122_blue_black.tif': 'files/primary/sub-P866/histology/P866_VN3_A_122.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_70_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_A_070.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_252.tif': 'files/primary/sub-P866/histology/P866_VN1_A_252.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_158_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_A_158.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_57.tif': 'files/primary/sub-P866/histology/P866_Nodose_057.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_74.tif': 'files/primary/sub-P866/histology/P866_VN3_A_074.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_126.tif': 'files/primary/sub-P866/histology/P866_VN1_C_126.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_106_blue_black.tif': 'files/primary/sub-P866/histology/P866_VN3_A_106.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_202.tif': 'files/primary/sub-P866/histology/P866_VN3_A_202.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_100_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_C_100.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_291.tif': 'files/primary/sub-P866/histology/P866_VN1_A_291.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_2.tif': 'files/primary/sub-P866/histology/P866_VN1_C_002.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_73_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_A_073.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_21_black.tif': 'files/primary/sub-P866/histology/P866_VN1_B_021.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_90_black.tif': 'files/primary/sub-P866/histology/P866_VN3_A_090.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_306_black.tif': 'files/primary/sub-P866/histology/P866_VN1_A_306.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_1.tif': 'files/primary/sub-P866/histology/P866_Nodose_001.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_112_black.tif': 'files/primary/sub-P866/histology/P866_VN4_A_112.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_88.tif': 'files/primary/sub-P866/histology/P866_VN3_A_088.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_21_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_A_021.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_148_blue_black.tif': 'files/primary/sub-P866/histology/P866_VN4_A_148.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_35_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_A_035.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_88.tif': 'files/primary/sub-P866/histology/P866_Nodose_088.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_213.tif': 'files/primary/sub-P866/histology/P866_VN4_A_213.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_104_blue.tif': 'files/primary/sub-P866/histology/P866_VN3_A_104.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_3.tif': 'files/primary/sub-P866/histology/P866_Nodose_003.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_89_blue_black.tif': 'files/primary/sub-P866/histology/P866_VN1_B_089.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_46.tif': 'files/primary/sub-P866/histology/P866_Nodose_046.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_279.tif': 'files/primary/sub-P866/histology/P866_VN1_A_279.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_85.tif': 'files/primary/sub-P866/histology/P866_Nodose_085.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_139_blue_black.tif': 'files/primary/sub-P866/histology/P866_VN1_A_139.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_58_blue_black.tif': 'files/primary/sub-P866/histology/P866_VN1_C_058.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_126_black.tif': 'files/primary/sub-P866/histology/P866_VN1_A_126.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_55.tif': 'files/primary/sub-P866/histology/P866_Nodose_055.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_68_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_B_068.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_164_blue.tif': 'files/primary/sub-P866/histology/P866_VN3_A_164.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_117_small_blue_large_black.tif': 'files/primary/sub-P866/histology/P866_VN1_B_117.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_140.tif': 'files/primary/sub-P866/histology/P866_Nodose_140.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_159_blue.tif': 'files/primary/sub-P866/histology/P866_VN3_A_159.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_11.tif': 'files/primary/sub-P866/histology/P866_Nodose_011.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_67_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_B_067.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_270.tif': 'files/primary/sub-P866/histology/P866_VN1_A_270.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_92_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_C_092.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_90_blue_black.tif': 'files/primary/sub-P866/histology/P866_VN1_A_090.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_114_black.tif': 'files/primary/sub-P866/histology/P866_VN1_C_114.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_110_small_blue_black.tif': 'files/primary/sub-P866/histology/P866_VN1_B_110.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_101_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_C_101.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_198_blue.tif': 'files/primary/sub-P866/histology/P866_VN4_A_198.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_290.tif': 'files/primary/sub-P866/histology/P866_VN1_A_290.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_B_54_black.tif': 'files/primary/sub-P866/histology/P866_VN1_B_054.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_24.tif': 'files/primary/sub-P866/histology/P866_Nodose_024.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_280_black.tif': 'files/primary/sub-P866/histology/P866_VN1_A_280.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_174_blue.tif': 'files/primary/sub-P866/histology/P866_VN3_A_174.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_140_blue.tif': 'files/primary/sub-P866/histology/P866_VN3_A_140.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_127.tif': 'files/primary/sub-P866/histology/P866_VN1_C_127.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_267_black.tif': 'files/primary/sub-P866/histology/P866_VN1_A_267.tif',
-            'files/primary/sub-P866/histology/19P866_VN4_A_218.tif': 'files/primary/sub-P866/histology/P866_VN4_A_218.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_106_black.tif': 'files/primary/sub-P866/histology/P866_VN1_A_106.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_175_blue.tif': 'files/primary/sub-P866/histology/P866_VN3_A_175.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_218_black.tif': 'files/primary/sub-P866/histology/P866_VN3_A_218.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_C_97_blue_black.tif': 'files/primary/sub-P866/histology/P866_VN1_C_097.tif',
-            'files/primary/sub-P866/histology/19P866_VN3_A_120_blue_black.tif': 'files/primary/sub-P866/histology/P866_VN3_A_120.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_61.tif': 'files/primary/sub-P866/histology/P866_Nodose_061.tif',
-            'files/primary/sub-P866/histology/19P866_Nodose_62.tif': 'files/primary/sub-P866/histology/P866_Nodose_062.tif',
-            'files/primary/sub-P845/histology/19P845_RL_22.tif': 'files/primary/sub-P845/histology/P845_RL_22.tif',
-            'files/primary/sub-P845/histology/19P845_Nodose_SL_16.tif': 'files/primary/sub-P845/histology/P845_Nodose_SL_16.tif',
-            'files/primary/sub-P845/histology/19P845_RL_3.tif': 'files/primary/sub-P845/histology/P845_RL_03.tif',
-            'files/primary/sub-P845/histology/19P845_Nodose_SL_13.tif': 'files/primary/sub-P845/histology/P845_Nodose_SL_13.tif',
-            'files/primary/sub-P845/histology/19P845_Nodose_SL_35.tif': 'files/primary/sub-P845/histology/P845_Nodose_SL_35.tif',
-            'files/primary/sub-P845/histology/19P845_RL_4.tif': 'files/primary/sub-P845/histology/P845_RL_04.tif',
-            'files/primary/sub-P866/histology/19P866_VN1_A_41_blue.tif': 'files/primary/sub-P866/histology/P866_VN1_A_041.tif',
-            'files/primary/sub-P845/P845_Embedding_Schematic.pptx': 'files/primary/sub-P845/P845 Embedding Schematic.pptx',
-            'files/primary/sub-P845/histology/19P845_Nodose_SL_1.tif': 'files/primary/sub-P845/histology/P845_Nodose_SL_01.tif',
-            'files/primary/sub-P845/histology/19P845_RL_13.tif': 'files/primary/sub-P845/histology/P845_RL_13.tif',
-            'files/primary/sub-P845/histology/19P845_RL_16.tif': 'files/primary/sub-P845/histology/P845_RL_16.tif',
-            'files/primary/sub-P845/histology/19P845_Nodose_SL_20.tif': 'files/primary/sub-P845/histology/P845_Nodose_SL_20.tif',
-            'files/primary/sub-P845/histology/19P845_VagusA_3.tif': 'files/primary/sub-P845/histology/P845_VagusA_03.tif',
-            'files/primary/sub-P845/histology/19P845_VagusB_7.tif': 'files/primary/sub-P845/histology/P845_VagusB_07.tif',
-            'files/primary/sub-P845/histology/19P845_Nodose_SL_23.tif': 'files/primary/sub-P845/histology/P845_Nodose_SL_23.tif',
-            'files/primary/sub-P845/histology/19P845_RL_24.tif': 'files/primary/sub-P845/histology/P845_RL_24.tif',
-            'files/primary/sub-P845/histology/19P845_Nodose_SL_30.tif': 'files/primary/sub-P845/histology/P845_Nodose_SL_30.tif',
-            'files/primary/sub-P845/histology/19P845_RL_18.tif': 'files/primary/sub-P845/histology/P845_RL_18.tif',
-            'files/primary/sub-P845/histology/19P845_VagusA_7.tif': 'files/primary/sub-P845/histology/P845_VagusA_07.tif',
-            'files/primary/sub-P845/histology/19P845_VagusC_3.tif': 'files/primary/sub-P845/histology/P845_VagusC_03.tif',
-            'files/primary/sub-P845/histology/19P845_Nodose_SL_18.tif': 'files/primary/sub-P845/histology/P845_Nodose_SL_18.tif',
-            'files/primary/sub-P845/histology/19P845_VagusA_5.tif': 'files/primary/sub-P845/histology/P845_VagusA_05.tif',
-            'files/primary/sub-P845/histology/19P845_Nodose_SL_11.tif': 'files/primary/sub-P845/histology/P845_Nodose_SL_11.tif',
-            'files/primary/sub-P845/histology/19P845_RL_19.tif': 'files/primary/sub-P845/histology/P845_RL_19.tif',
-            'files/primary/sub-P845/histology/19P845_Nodose_SL_36.tif': 'files/primary/sub-P845/histology/P845_Nodose_SL_36.tif',
-            'files/primary/sub-P845/histology/19P845_Nodose_SL_32.tif': 'files/primary/sub-P845/histology/P845_Nodose_SL_32.tif',
-            'files/primary/sub-P845/histology/19P845_Nodose_SL_15.tif': 'files/primary/sub-P845/histology/P845_Nodose_SL_15.tif',
-            'files/primary/sub-P845/histology/19P845_Nodose_SL_3.tif': 'files/primary/sub-P845/histology/P845_Nodose_SL_03.tif',
-            'files/primary/sub-P845/histology/19P845_VagusC_6.tif': 'files/primary/sub-P845/histology/P845_VagusC_06.tif',
-            'files/primary/sub-P845/histology/19P845_Nodose_SL_5.tif': 'files/primary/sub-P845/histology/P845_Nodose_SL_05.tif',
-            'files/primary/sub-P845/histology/19P845_RL_7.tif': 'files/primary/sub-P845/histology/P845_RL_07.tif',
-            'files/primary/sub-P845/histology/19P845_RL_6.tif': 'files/primary/sub-P845/histology/P845_RL_06.tif',
-            'files/primary/sub-P845/histology/19P845_Nodose_SL_27.tif': 'files/primary/sub-P845/histology/P845_Nodose_SL_27.tif',
-            'files/primary/sub-P845/histology/19P845_Nodose_SL_34.tif': 'files/primary/sub-P845/histology/P845_Nodose_SL_34.tif',
-            'files/primary/sub-P845/histology/19P845_Nodose_SL_29.tif': 'files/primary/sub-P845/histology/P845_Nodose_SL_29.tif',
-            'files/primary/sub-P845/histology/19P845_VagusA_1.tif': 'files/primary/sub-P845/histology/P845_VagusA_01.tif',
-            'files/primary/sub-P845/histology/19P845_RL_10.tif': 'files/primary/sub-P845/histology/P845_RL_10.tif',
-            'files/primary/sub-P845/histology/19P845_RL_15.tif': 'files/primary/sub-P845/histology/P845_RL_15.tif',
-            'files/primary/sub-P845/histology/19P845_RL_12.tif': 'files/primary/sub-P845/histology/P845_RL_12.tif',
-            'files/primary/sub-P845/histology/19P845_VagusB_6.tif': 'files/primary/sub-P845/histology/P845_VagusB_06.tif',
-            'files/primary/sub-P845/histology/19P845_RL_21.tif': 'files/primary/sub-P845/histology/P845_RL_21.tif',
-            'files/primary/sub-P845/histology/19P845_Nodose_SL_40.tif': 'files/primary/sub-P845/histology/P845_Nodose_SL_40.tif',
-            'files/primary/sub-P845/histology/19P845_Nodose_SL_38.tif': 'files/primary/sub-P845/histology/P845_Nodose_SL_38.tif',
-            'files/primary/sub-P845/histology/19P845_Nodose_SL_25.tif': 'files/primary/sub-P845/histology/P845_Nodose_SL_25.tif',
-            'files/primary/sub-P845/histology/19P845_RL_1.tif': 'files/primary/sub-P845/histology/P845_RL_01.tif',
-            'files/primary/sub-P845/histology/19P845_RL_27.tif': 'files/primary/sub-P845/histology/P845_RL_27.tif',
-            'files/primary/sub-P845/histology/19P845_RL_9.tif': 'files/primary/sub-P845/histology/P845_RL_09.tif',
-            'files/primary/sub-P845/histology/19P845_Nodose_SL_10.tif': 'files/primary/sub-P845/histology/P845_Nodose_SL_10.tif',
-            'files/primary/sub-P845/histology/19P845_Nodose_SL_8.tif': 'files/primary/sub-P845/histology/P845_Nodose_SL_08.tif',
-            'files/primary/sub-P845/histology/19P845_Nodose_SL_21.tif': 'files/primary/sub-P845/histology/P845_Nodose_SL_21.tif',
-            'files/primary/sub-P845/histology/19P845_Nodose_SL_6.tif': 'files/primary/sub-P845/histology/P845_Nodose_SL_06.tif',
-            'files/primary/sub-P845/histology/19P845_VagusC_7.tif': 'files/primary/sub-P845/histology/P845_VagusC_07.tif',
-            'files/primary/sub-P845/histology/19P845_VagusB_3.tif': 'files/primary/sub-P845/histology/P845_VagusB_03.tif',
-            'files/primary/sub-P845/histology/19P845_RL_25.tif': 'files/primary/sub-P845/histology/P845_RL_25.tif',
-            'files/primary/sub-P853/histology/19P853_ESL_11.tif': 'files/primary/sub-P853/histology/P853_ESL_011.tif',
-            'files/primary/sub-P853/P853_Embedding_Schematic.pptx': 'files/primary/sub-P853/P853 Embedding Schematic.pptx',
-            'files/primary/sub-P853/histology/19P853_ISL_6.tif': 'files/primary/sub-P853/histology/P853_ISL_006.tif',
-            'files/primary/sub-P853/histology/19P853_VN_17.tif': 'files/primary/sub-P853/histology/P853_VNa_017.tif',
-            'files/primary/sub-P853/histology/19P853_ISL_15.tif': 'files/primary/sub-P853/histology/P853_ISL_015.tif',
-            'files/primary/sub-P853/histology/19P853_VN_27.tif': 'files/primary/sub-P853/histology/P853_VNa_027.tif',
-            'files/primary/sub-P853/histology/19P853_ISL_13.tif': 'files/primary/sub-P853/histology/P853_ISL_013.tif',
-            'files/primary/sub-P853/histology/19P853_VN_12.tif': 'files/primary/sub-P853/histology/P853_VNa_012.tif',
-            'files/primary/sub-P853/histology/19P853_VN_18.tif': 'files/primary/sub-P853/histology/P853_VNa_018.tif',
-            'files/primary/sub-P853/histology/19P853_VNb_7.tif': 'files/primary/sub-P853/histology/P853_VNb_007.tif',
-            'files/primary/sub-P853/histology/19P853_ISL_9.tif': 'files/primary/sub-P853/histology/P853_ISL_009.tif',
-            'files/primary/sub-P853/histology/19P853_ESL_16.tif': 'files/primary/sub-P853/histology/P853_ESL_016.tif',
-            'files/primary/sub-P853/histology/19P853_VNb_1.tif': 'files/primary/sub-P853/histology/P853_VNb_001.tif',
-            'files/primary/sub-P853/histology/19P853_ESL_5.tif': 'files/primary/sub-P853/histology/P853_ESL_005.tif',
-            'files/primary/sub-P853/histology/19P853_ISL_8.tif': 'files/primary/sub-P853/histology/P853_ISL_008.tif',
-            'files/primary/sub-P853/histology/19P853_ESL_15.tif': 'files/primary/sub-P853/histology/P853_ESL_015.tif',
-            'files/primary/sub-P853/histology/19P853_ISL_1.tif': 'files/primary/sub-P853/histology/P853_ISL_001.tif',
-            'files/primary/sub-P853/histology/19P853_VNb_15.tif': 'files/primary/sub-P853/histology/P853_VNb_015.tif',
-            'files/primary/sub-P853/histology/19P853_ISL_11.tif': 'files/primary/sub-P853/histology/P853_ISL_011.tif',
-            'files/primary/sub-P853/histology/19P853_ESL_9.tif': 'files/primary/sub-P853/histology/P853_ESL_009.tif',
-            'files/primary/sub-P853/histology/19P853_VNb_12.tif': 'files/primary/sub-P853/histology/P853_VNb_012.tif',
-            'files/primary/sub-P853/histology/19P853_ESL_1.tif': 'files/primary/sub-P853/histology/P853_ESL_001.tif',
-            'files/primary/sub-P853/histology/19P853_ESL_6.tif': 'files/primary/sub-P853/histology/P853_ESL_006.tif',
-            'files/primary/sub-P853/histology/19P853_VNb_4.tif': 'files/primary/sub-P853/histology/P853_VNb_004.tif',
-            'files/primary/sub-P853/histology/19P853_VNb_5.tif': 'files/primary/sub-P853/histology/P853_VNb_005.tif',
-            'files/primary/sub-P853/histology/19P853_ISL_3.tif': 'files/primary/sub-P853/histology/P853_ISL_003.tif',
-            'files/primary/sub-P853/histology/19P853_VN_1.tif': 'files/primary/sub-P853/histology/P853_VNa_001.tif',
-            'files/primary/sub-P853/histology/19P853_ESL_19.tif': 'files/primary/sub-P853/histology/P853_ESL_019.tif',
-            'files/primary/sub-P853/histology/19P853_VN_9.tif': 'files/primary/sub-P853/histology/P853_VNa_009.tif',
-            'files/primary/sub-P853/histology/19P853_VN_5.tif': 'files/primary/sub-P853/histology/P853_VNa_005.tif',
-            'files/primary/sub-P853/histology/19P853_ESL_3.tif': 'files/primary/sub-P853/histology/P853_ESL_003.tif',
-            'files/primary/sub-P853/histology/19P853_VN_21.tif': 'files/primary/sub-P853/histology/P853_VNa_021.tif',
-            'files/primary/sub-P853/histology/19P853_VNb_11.tif': 'files/primary/sub-P853/histology/P853_VNb_011.tif',
-            'files/primary/sub-P853/histology/19P853_ISL_5.tif': 'files/primary/sub-P853/histology/P853_ISL_005.tif',
-            'files/primary/sub-P853/histology/19P853_ESL_20.tif': 'files/primary/sub-P853/histology/P853_ESL_020.tif',
-            'files/primary/sub-P853/histology/19P853_VN_10.tif': 'files/primary/sub-P853/histology/P853_VNa_010.tif',
-            'files/primary/sub-P853/histology/19P853_VN_4.tif': 'files/primary/sub-P853/histology/P853_VNa_004.tif',
-            'files/primary/sub-P853/histology/19P853_VNb_8.tif': 'files/primary/sub-P853/histology/P853_VNb_008.tif',
-            'files/primary/sub-P853/histology/19P853_VN_23.tif': 'files/primary/sub-P853/histology/P853_VNa_023.tif',
-            'files/primary/sub-P853/histology/19P853_ESL_13.tif': 'files/primary/sub-P853/histology/P853_ESL_013.tif',
-            'files/primary/sub-P853/histology/19P853_VN_25.tif': 'files/primary/sub-P853/histology/P853_VNa_025.tif',
-            'files/primary/sub-P853/histology/19P853_VN_14.tif': 'files/primary/sub-P853/histology/P853_VNa_014.tif',
-            'files/primary/sub-P786/histology/19P786_LV2a_Cranial_Nodose.tif': 'files/primary/sub-P786/histology/19P786_LV2a.tif',
-            'files/primary/sub-P786/histology/19P786_LV2b_Caudal_Nodose_w_SL_new.tif': 'files/primary/sub-P786/histology/19P786_LV2b.tif',
-            'files/primary/sub-P786/histology/19P786_LV3a_a_RL_and_VN_separately.tif': 'files/primary/sub-P786/histology/19P786_LV3a_a.tif',
-            'files/primary/sub-P786/19P786_Embedding_Schematic.pptx': 'files/primary/sub-P786/P786 Embedding Schematic.pptx',
-            'files/primary/sub-P786/histology/19P786_LV1b_LivaNova_caudal_half.tif': 'files/primary/sub-P786/histology/19P786_LV1b.tif',
-            'files/primary/sub-P786/histology/19P786_LV1a_LivaNova_cranial_half.tif': 'files/primary/sub-P786/histology/19P786_LV1a.tif',
-            'files/primary/sub-P786/histology/19P786_LV3a_b_RL_and_VN_separately.tif': 'files/primary/sub-P786/histology/19P786_LV3a_b.tif',
-            'files/primary/sub-P858/histology/19P858_LivaNova_7.tif': 'files/primary/sub-P858/histology/P858_LivaNova_007.tif',
-            'files/primary/sub-P786/histology/19P786_LV3_RL_bifurcation.tif': 'files/primary/sub-P786/histology/19P786_LV3.tif',
-            'files/primary/sub-P858/histology/19P858_Nodose_18.tif': 'files/primary/sub-P858/histology/P858_Nodose_018.tif',
-            'files/primary/sub-P858/histology/19P858_LivaNova_28.tif': 'files/primary/sub-P858/histology/P858_LivaNova_028.tif',
-            'files/primary/sub-P858/histology/19P858_Nodose2_15.tif': 'files/primary/sub-P858/histology/P858_Nodose_b_015.tif',
-            'files/primary/sub-P858/histology/19P858_RL_25.tif': 'files/primary/sub-P858/histology/P858_RL_025.tif',
-            'files/primary/sub-P858/histology/19P858_Nodose2_31.tif': 'files/primary/sub-P858/histology/P858_Nodose_b_031.tif',
-            'files/primary/sub-P858/histology/19P858_LivaNova_16.tif': 'files/primary/sub-P858/histology/P858_LivaNova_016.tif',
-            'files/primary/sub-P858/histology/19P858_Nodose_33.tif': 'files/primary/sub-P858/histology/P858_Nodose_033.tif',
-            'files/primary/sub-P858/histology/19P858_LivaNova_30.tif': 'files/primary/sub-P858/histology/P858_LivaNova_030.tif',
-            'files/primary/sub-P858/histology/19P858_LivaNova_3.tif': 'files/primary/sub-P858/histology/P858_LivaNova_003.tif',
-            'files/primary/sub-P858/histology/19P858_RL_15.tif': 'files/primary/sub-P858/histology/P858_RL_015.tif',
-            'files/primary/sub-P858/histology/19P858_RL_33.tif': 'files/primary/sub-P858/histology/P858_RL_033.tif',
-            'files/primary/sub-P858/histology/19P858_RL_17.tif': 'files/primary/sub-P858/histology/P858_RL_017.tif',
-            'files/primary/sub-P858/histology/19P858_RL_26.tif': 'files/primary/sub-P858/histology/P858_RL_026.tif',
-            'files/primary/sub-P858/histology/19P858_RL_31.tif': 'files/primary/sub-P858/histology/P858_RL_031.tif',
-            'files/primary/sub-P858/histology/19P858_Nodose2_13.tif': 'files/primary/sub-P858/histology/P858_Nodose_b_013.tif',
-            'files/primary/sub-P858/histology/19P858_Nodose_28.tif': 'files/primary/sub-P858/histology/P858_Nodose_028.tif',
-            'files/primary/sub-P858/histology/19P858_Nodose2_18.tif': 'files/primary/sub-P858/histology/P858_Nodose_b_018.tif',
-            'files/primary/sub-P858/histology/19P858_Nodose_14.tif': 'files/primary/sub-P858/histology/P858_Nodose_014.tif',
-            'files/primary/sub-P858/histology/19P858_Nodose2_25.tif': 'files/primary/sub-P858/histology/P858_Nodose_b_025.tif',
-            'files/primary/sub-P858/histology/19P858_LivaNova_15.tif': 'files/primary/sub-P858/histology/P858_LivaNova_015.tif',
-            'files/primary/sub-P858/histology/19P858_Nodose_20.tif': 'files/primary/sub-P858/histology/P858_Nodose_020.tif',
-            'files/primary/sub-P858/histology/19P858_LivaNova_13.tif': 'files/primary/sub-P858/histology/P858_LivaNova_013.tif',
-            'files/primary/sub-P858/histology/19P858_Nodose_6.tif': 'files/primary/sub-P858/histology/P858_Nodose_006.tif',
-            'files/primary/sub-P858/histology/19P858_Nodose_12.tif': 'files/primary/sub-P858/histology/P858_Nodose_012.tif',
-            'files/primary/sub-P858/histology/19P858_LivaNova_23.tif': 'files/primary/sub-P858/histology/P858_LivaNova_023.tif',
-            'files/primary/sub-P858/histology/19P858_LivaNova_26.tif': 'files/primary/sub-P858/histology/P858_LivaNova_026.tif',
-            'files/primary/sub-P858/histology/19P858_Nodose_5.tif': 'files/primary/sub-P858/histology/P858_Nodose_005.tif',
-            'files/primary/sub-P858/histology/19P858_LivaNova_10.tif': 'files/primary/sub-P858/histology/P858_LivaNova_010.tif',
-            'files/primary/sub-P858/histology/19P858_LivaNova_45.tif': 'files/primary/sub-P858/histology/P858_LivaNova_045.tif',
-            'files/primary/sub-P858/histology/19P858_LivaNova_35.tif': 'files/primary/sub-P858/histology/P858_LivaNova_035.tif',
-            'files/primary/sub-P858/histology/19P858_Nodose_26.tif': 'files/primary/sub-P858/histology/P858_Nodose_026.tif',
-            'files/primary/sub-P858/histology/19P858_LivaNova_36.tif': 'files/primary/sub-P858/histology/P858_LivaNova_036.tif',
-            'files/primary/sub-P858/histology/19P858_3.5cm_9.tif': 'files/primary/sub-P858/histology/P858_35mm_009.tif',
-            'files/primary/sub-P858/histology/19P858_LivaNova_31.tif': 'files/primary/sub-P858/histology/P858_LivaNova_031.tif',
-            'files/primary/sub-P858/histology/19P858_Nodose2_33.tif': 'files/primary/sub-P858/histology/P858_Nodose_b_033.tif',
-            'files/primary/sub-P858/histology/19P858_3.5cm_5.tif': 'files/primary/sub-P858/histology/P858_35mm_005.tif',
-            'files/primary/sub-P858/histology/19P858_Nodose2_35.tif': 'files/primary/sub-P858/histology/P858_Nodose_b_035.tif',
-            'files/primary/sub-P858/histology/19P858_Nodose_30.tif': 'files/primary/sub-P858/histology/P858_Nodose_030.tif',
-            'files/primary/sub-P858/histology/19P858_RL_19.tif': 'files/primary/sub-P858/histology/P858_RL_019.tif',
-            'files/primary/sub-P858/histology/19P858_RL_10.tif': 'files/primary/sub-P858/histology/P858_RL_010.tif',
-            'files/primary/sub-P858/histology/19P858_RL_20.tif': 'files/primary/sub-P858/histology/P858_RL_020.tif',
-            'files/primary/sub-P858/histology/19P858_RL_13.tif': 'files/primary/sub-P858/histology/P858_RL_013.tif',
-            'files/primary/sub-P858/histology/19P858_Nodose_3.tif': 'files/primary/sub-P858/histology/P858_Nodose_003.tif',
-            'files/primary/sub-P858/histology/19P858_LivaNova_5.tif': 'files/primary/sub-P858/histology/P858_LivaNova_005.tif',
-            'files/primary/sub-P858/histology/19P858_Nodose_21.tif': 'files/primary/sub-P858/histology/P858_Nodose_021.tif',
-            'files/primary/sub-P858/histology/19P858_LivaNova_18.tif': 'files/primary/sub-P858/histology/P858_LivaNova_018.tif',
-            'files/primary/sub-P858/histology/19P858_LivaNova_33.tif': 'files/primary/sub-P858/histology/P858_LivaNova_033.tif',
-            'files/primary/sub-P858/histology/19P858_RL_30.tif': 'files/primary/sub-P858/histology/P858_RL_030.tif',
-            'files/primary/sub-P858/histology/19P858_Nodose2_1.tif': 'files/primary/sub-P858/histology/P858_Nodose_b_001.tif',
-            'files/primary/sub-P858/histology/19P858_RL_6.tif': 'files/primary/sub-P858/histology/P858_RL_006.tif',
-            'files/primary/sub-P858/histology/19P858_RL_22.tif': 'files/primary/sub-P858/histology/P858_RL_022.tif',
-            'files/primary/sub-P858/histology/19P858_Nodose2_26.tif': 'files/primary/sub-P858/histology/P858_Nodose_b_026.tif',
-            'files/primary/sub-P858/histology/19P858_RL_11.tif': 'files/primary/sub-P858/histology/P858_RL_011.tif',
-            'files/primary/sub-P858/histology/19P858_RL_24.tif': 'files/primary/sub-P858/histology/P858_RL_024.tif',
-            'files/primary/sub-P858/histology/19P858_LivaNova_12.tif': 'files/primary/sub-P858/histology/P858_LivaNova_012.tif',
-            'files/primary/sub-P858/histology/19P858_Nodose2_16.tif': 'files/primary/sub-P858/histology/P858_Nodose_b_016.tif',
-            'files/primary/sub-P858/histology/19P858_LivaNova_41.tif': 'files/primary/sub-P858/histology/P858_LivaNova_041.tif',
-            'files/primary/sub-P858/histology/19P858_3.5cm_6.tif': 'files/primary/sub-P858/histology/P858_35mm_006.tif',
-            'files/primary/sub-P858/histology/19P858_LivaNova_20.tif': 'files/primary/sub-P858/histology/P858_LivaNova_020.tif',
-            'files/primary/sub-P858/histology/19P858_3.5cm_10.tif': 'files/primary/sub-P858/histology/P858_35mm_010.tif',
-            'files/primary/sub-P858/histology/19P858_LivaNova_43.tif': 'files/primary/sub-P858/histology/P858_LivaNova_043.tif',
-            'files/primary/sub-P858/histology/19P858_Nodose2_3.tif': 'files/primary/sub-P858/histology/P858_Nodose_b_003.tif',
-            'files/primary/sub-P858/histology/19P858_Nodose2_29.tif': 'files/primary/sub-P858/histology/P858_Nodose_b_029.tif',
-            'files/primary/sub-P858/histology/19P858_Nodose2_10.tif': 'files/primary/sub-P858/histology/P858_Nodose_b_010.tif',
-            'files/primary/sub-P858/histology/19P858_Nodose_23.tif': 'files/primary/sub-P858/histology/P858_Nodose_023.tif',
-            'files/primary/sub-P858/histology/19P858_RL_1.tif': 'files/primary/sub-P858/histology/P858_RL_001.tif',
-            'files/primary/sub-P858/histology/19P858_Nodose2_22.tif': 'files/primary/sub-P858/histology/P858_Nodose_b_022.tif',
-            'files/primary/sub-P858/histology/19P858_LivaNova_40.tif': 'files/primary/sub-P858/histology/P858_LivaNova_040.tif',
-            'files/primary/sub-P858/histology/19P858_Nodose_16.tif': 'files/primary/sub-P858/histology/P858_Nodose_016.tif',
-            'files/primary/sub-P858/histology/19P858_LivaNova_25.tif': 'files/primary/sub-P858/histology/P858_LivaNova_025.tif',
-            'files/primary/sub-P858/histology/19P858_LivaNova_1.tif': 'files/primary/sub-P858/histology/P858_LivaNova_001.tif',
-            'files/primary/sub-P858/histology/19P858_Nodose_15.tif': 'files/primary/sub-P858/histology/P858_Nodose_015.tif',
-            'files/primary/sub-P858/histology/19P858_Nodose_9.tif': 'files/primary/sub-P858/histology/P858_Nodose_009.tif',
-            'files/primary/sub-P858/histology/19P858_Nodose_1.tif': 'files/primary/sub-P858/histology/P858_Nodose_001.tif',
-            'files/primary/sub-P858/histology/19P858_Nodose2_6.tif': 'files/primary/sub-P858/histology/P858_Nodose_b_006.tif',
-            'files/primary/sub-P858/histology/19P858_LivaNova_38.tif': 'files/primary/sub-P858/histology/P858_LivaNova_038.tif',
-            'files/primary/sub-P858/histology/19P858_3.5cm_2.tif': 'files/primary/sub-P858/histology/P858_35mm_002.tif',
-            'files/primary/sub-P858/histology/19P858_3.5cm_4.tif': 'files/primary/sub-P858/histology/P858_35mm_004.tif',
-            'files/primary/sub-P858/histology/19P858_RL_5.tif': 'files/primary/sub-P858/histology/P858_RL_005.tif',
-            'files/primary/sub-P858/histology/19P858_RL_3.tif': 'files/primary/sub-P858/histology/P858_RL_003.tif',
-            'files/primary/sub-P858/histology/19P858_Nodose2_5.tif': 'files/primary/sub-P858/histology/P858_Nodose_b_005.tif',
-            'files/primary/sub-P858/histology/19P858_RL_35.tif': 'files/primary/sub-P858/histology/P858_RL_035.tif',
-            'files/primary/sub-P858/histology/19P858_Nodose2_19.tif': 'files/primary/sub-P858/histology/P858_Nodose_b_019.tif',
-            'files/primary/sub-P858/histology/19P858_LivaNova_21.tif': 'files/primary/sub-P858/histology/P858_LivaNova_021.tif',
-            'files/primary/sub-P858/histology/19P858_Nodose2_28.tif': 'files/primary/sub-P858/histology/P858_Nodose_b_028.tif',
-            'files/primary/sub-P858/histology/19P858_Nodose_8.tif': 'files/primary/sub-P858/histology/P858_Nodose_008.tif',
-            'files/primary/sub-P858/histology/19P858_Nodose2_24.tif': 'files/primary/sub-P858/histology/P858_Nodose_b_024.tif',
-            'files/primary/sub-P858/histology/19P858_RL_28.tif': 'files/primary/sub-P858/histology/P858_RL_028.tif',
-            'files/primary/sub-P858/histology/19P858_RL_8.tif': 'files/primary/sub-P858/histology/P858_RL_008.tif',
-            'files/primary/sub-P858/histology/19P858_Nodose2_12.tif': 'files/primary/sub-P858/histology/P858_Nodose_b_012.tif',
-            'files/primary/sub-P858/histology/19P858_Nodose_35.tif': 'files/primary/sub-P858/histology/P858_Nodose_035.tif',
-            'files/primary/sub-P858/histology/19P858_LivaNova_9.tif': 'files/primary/sub-P858/histology/P858_LivaNova_009.tif',
-            'files/primary/sub-P858/histology/19P858_Nodose_25.tif': 'files/primary/sub-P858/histology/P858_Nodose_025.tif',
-            'files/primary/sub-P818/histology/19P818_LV2_RL_5.tif': 'files/primary/sub-P818/histology/P818_LV2_RL_05.tif',
-            'files/primary/sub-P818/histology/19P818_LV2_RL_11.tif': 'files/primary/sub-P818/histology/P818_LV2_RL_11.tif',
-            'files/primary/sub-P858/P858_Embedding_Schematic.pptx': 'files/primary/sub-P858/P858_Embedding Schematic.pptx',
-            'files/primary/sub-P858/histology/19P858_Nodose2_8.tif': 'files/primary/sub-P858/histology/P858_Nodose_b_008.tif',
-            'files/primary/sub-P818/histology/19P818_LV2_RL_10.tif': 'files/primary/sub-P818/histology/P818_LV2_RL_10.tif',
-            'files/primary/sub-P818/histology/19P818_LV2_RL_9b.tif': 'files/primary/sub-P818/histology/P818_LV2_RL_09b.tif',
-            'files/primary/sub-P818/histology/19P818_LV3a_RL.tif': 'files/primary/sub-P818/histology/P818_LV3a_RL.tif',
-            'files/primary/sub-P818/histology/19P818_LV2_RL_6.tif': 'files/primary/sub-P818/histology/P818_LV2_RL_06.tif',
-            'files/primary/sub-P818/histology/19P818_LV8.tif': 'files/primary/sub-P818/histology/P818_LV8.tif',
-            'files/primary/sub-P818/histology/19P818_LV6.tif': 'files/primary/sub-P818/histology/P818_LV6.tif',
-            'files/primary/sub-P818/histology/19P818_LV5b.tif': 'files/primary/sub-P818/histology/P818_LV5b.tif',
-            'files/primary/sub-P818/histology/19P818_LV2_RL_4.tif': 'files/primary/sub-P818/histology/P818_LV2_RL_04.tif',
-            'files/primary/sub-P818/histology/19P818_LV2_RL_1.tif': 'files/primary/sub-P818/histology/P818_LV2_RL_01.tif',
-            'files/primary/sub-P818/histology/19P818_LV5a.tif': 'files/primary/sub-P818/histology/P818_LV5a.tif',
-            'files/primary/sub-P818/histology/19P818_LV1_RL.tif': 'files/primary/sub-P818/histology/P818_LV1_RL.tif',
-            'files/primary/sub-P818/histology/19P818_LV2_RL_3.tif': 'files/primary/sub-P818/histology/P818_LV2_RL_03.tif',
-            'files/primary/sub-P818/histology/19P818_LV2_RL_8.tif': 'files/primary/sub-P818/histology/P818_LV2_RL_08.tif',
-            'files/primary/sub-P818/histology/19P818_LV2_RL_2.tif': 'files/primary/sub-P818/histology/P818_LV2_RL_02.tif',
-            'files/primary/sub-P818/histology/19P818_LV7a.tif': 'files/primary/sub-P818/histology/P818_LV7a.tif',
-            'files/primary/sub-P818/histology/19P818_LV3b.tif': 'files/primary/sub-P818/histology/P818_LV3b.tif',
-            'files/primary/sub-P818/histology/19P818_LV2_RL_9a.tif': 'files/primary/sub-P818/histology/P818_LV2_RL_09a.tif',
-            'files/primary/sub-P818/histology/19P818_LV2_RL_7.tif': 'files/primary/sub-P818/histology/P818_LV2_RL_07.tif',
-            'files/primary/sub-P818/histology/19P818_LV7b.tif': 'files/primary/sub-P818/histology/P818_LV7b.tif',
-            'files/primary/sub-P818/histology/19P818_LV7c.tif': 'files/primary/sub-P818/histology/P818_LV7c.tif',
-            'files/primary/sub-P818/P818_Embedding_Schematic.pptx': 'files/primary/sub-P818/P818 Embedding Schematic.pptx',
-            'files/primary/sub-P818/histology/19P818_LV4.tif': 'files/primary/sub-P818/histology/P818_LV4.tif',
-            'files/primary/sub-P824/histology/19P824_Nodose_a_2.tif': 'files/primary/sub-P824/histology/P824_Nodose_a_02.tif',
-            'files/primary/sub-P824/histology/19824_LRL_1.tif': 'files/primary/sub-P824/histology/P824_LRL_01.tif',
-            'files/primary/sub-P824/histology/19P824_RL_VN1_1.tif': 'files/primary/sub-P824/histology/P824_RL_VN1_01.tif',
-            'files/primary/sub-P824/histology/19P824_Nodose_SL_1.tif': 'files/primary/sub-P824/histology/P824_Nodose_SL_01.tif',
-            'files/primary/sub-P824/histology/19P824_LRL2_1.tif': 'files/primary/sub-P824/histology/P824_LRL2_01.tif',
-            'files/primary/sub-P824/histology/19824_Nodose_b_2.tif': 'files/primary/sub-P824/histology/P824_Nodose_b_02.tif',
-            'files/primary/sub-P839/histology/19P839_LV_2a_1.tif': 'files/primary/sub-P839/histology/P839_LV_2a_01.tif',
-            'files/primary/sub-P839/P839_Embedding_Schematic.pptx': 'files/primary/sub-P839/P839_Embedding Schematic.pptx',
-            'files/primary/sub-P839/histology/19P839_Nodose_18.tif': 'files/primary/sub-P839/histology/P839_Nodose_18.tif',
-            'files/primary/sub-P839/histology/19P839_Nodose_2.tif': 'files/primary/sub-P839/histology/P839_Nodose_02.tif',
-            'files/primary/sub-P839/histology/19P839_Nodose_41.tif': 'files/primary/sub-P839/histology/P839_Nodose_41.tif',
-            'files/primary/sub-P839/histology/19P839_LV_2a_3.tif': 'files/primary/sub-P839/histology/P839_LV_2a_03.tif',
-            'files/primary/sub-P839/histology/19P839_Nodose_50.tif': 'files/primary/sub-P839/histology/P839_Nodose_50.tif',
-            'files/primary/sub-P839/histology/19P839_LV_2b_5.tif': 'files/primary/sub-P839/histology/P839_LV_2b_05.tif',
-            'files/primary/sub-P839/histology/19P839_LV_2b_6.tif': 'files/primary/sub-P839/histology/P839_LV_2b_06.tif',
-            'files/primary/sub-P839/histology/19P839_Nodose_47.tif': 'files/primary/sub-P839/histology/P839_Nodose_47.tif',
-            'files/primary/sub-P839/histology/19P839_Nodose_35.tif': 'files/primary/sub-P839/histology/P839_Nodose_35.tif',
-            'files/primary/sub-P839/histology/19P839_Nodose_25.tif': 'files/primary/sub-P839/histology/P839_Nodose_25.tif',
-            'files/primary/sub-P839/histology/19P839_Nodose_37.tif': 'files/primary/sub-P839/histology/P839_Nodose_37.tif',
-            'files/primary/sub-P839/histology/19P839_Nodose_30.tif': 'files/primary/sub-P839/histology/P839_Nodose_30.tif',
-            'files/primary/sub-P839/histology/19P839_LV_2a_4.tif': 'files/primary/sub-P839/histology/P839_LV_2a_04.tif',
-            'files/primary/sub-P839/histology/19P839_LV_2b_1.tif': 'files/primary/sub-P839/histology/P839_LV_2b_01.tif',
-            'files/primary/sub-P839/histology/19P839_Nodose_21.tif': 'files/primary/sub-P839/histology/P839_Nodose_21.tif',
-            'files/primary/sub-P839/histology/19P839_LV_2a_6.tif': 'files/primary/sub-P839/histology/P839_LV_2a_06.tif',
-            'files/primary/sub-P839/histology/19P839_Nodose_45.tif': 'files/primary/sub-P839/histology/P839_Nodose_45.tif',
-            'files/primary/sub-P839/histology/19P839_Nodose_6.tif': 'files/primary/sub-P839/histology/P839_Nodose_06.tif',
-            'files/primary/sub-P839/histology/19P839_Nodose_5.tif': 'files/primary/sub-P839/histology/P839_Nodose_05.tif',
-            'files/primary/sub-P839/histology/19P839_LV_2a_9.tif': 'files/primary/sub-P839/histology/P839_LV_2a_09.tif',
-            'files/primary/sub-P839/histology/19P839_Nodose_32.tif': 'files/primary/sub-P839/histology/P839_Nodose_32.tif',
-            'files/primary/sub-P839/histology/19P839_LV_2a_8.tif': 'files/primary/sub-P839/histology/P839_LV_2a_08.tif',
-            'files/primary/sub-P839/histology/19P839_Nodose_15.tif': 'files/primary/sub-P839/histology/P839_Nodose_15.tif',
-            'files/primary/sub-P839/histology/19P839_Nodose_46.tif': 'files/primary/sub-P839/histology/P839_Nodose_46.tif',
-            'files/primary/sub-P839/histology/19P839_Nodose_43.tif': 'files/primary/sub-P839/histology/P839_Nodose_43.tif',
-            'files/primary/sub-P839/histology/19P839_Nodose_11.tif': 'files/primary/sub-P839/histology/P839_Nodose_11.tif',
-            'files/primary/sub-P839/histology/19P839_Nodose_3.tif': 'files/primary/sub-P839/histology/P839_Nodose_03.tif',
-            'files/primary/sub-P839/histology/19P839_Nodose_7.tif': 'files/primary/sub-P839/histology/P839_Nodose_07.tif',
-            'files/primary/sub-P839/histology/19P839_LV_2b_4.tif': 'files/primary/sub-P839/histology/P839_LV_2b_04.tif',
-            'files/primary/sub-P839/histology/19P839_Nodose_40.tif': 'files/primary/sub-P839/histology/P839_Nodose_40.tif',
-            'files/primary/sub-P839/histology/19P839_Nodose_23.tif': 'files/primary/sub-P839/histology/P839_Nodose_23.tif',
-            'files/primary/sub-P839/histology/19P839_Nodose_4.tif': 'files/primary/sub-P839/histology/P839_Nodose_04.tif',
-            'files/primary/sub-P839/histology/19P839_Nodose_17.tif': 'files/primary/sub-P839/histology/P839_Nodose_17.tif',
-            'files/primary/sub-P839/histology/19P839_Nodose_14.tif': 'files/primary/sub-P839/histology/P839_Nodose_14.tif',
-            'files/primary/sub-P839/histology/19P839_LV_2a_2.tif': 'files/primary/sub-P839/histology/P839_LV_2a_02.tif',
-            'files/primary/sub-P839/histology/19P839_LV_2b_3.tif': 'files/primary/sub-P839/histology/P839_LV_2b_03.tif',
-            'files/primary/sub-P839/histology/19P839_Nodose_38.tif': 'files/primary/sub-P839/histology/P839_Nodose_38.tif',
-            'files/primary/sub-P839/histology/19P839_Nodose_20.tif': 'files/primary/sub-P839/histology/P839_Nodose_20.tif',
-            'files/primary/sub-P839/histology/19P839_Nodose_33.tif': 'files/primary/sub-P839/histology/P839_Nodose_33.tif',
-            'files/primary/sub-P839/histology/19P839_Nodose_27.tif': 'files/primary/sub-P839/histology/P839_Nodose_27.tif',
-            'files/primary/sub-P839/histology/19P839_Nodose_29.tif': 'files/primary/sub-P839/histology/P839_Nodose_29.tif',
-            'files/derivative/sub-P866/P866_VN1_C_125.jp2': 'files/derivative/sub-P866/P866_VN1_C_125 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_B_031.jp2': 'files/derivative/sub-P866/P866_VN1_B_031 (1).jp2',
-            'files/derivative/sub-P866/P866_VN3_A_075.jp2': 'files/derivative/sub-P866/P866_VN3_A_075 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_012.jp2': 'files/derivative/sub-P866/P866_VN1_A_012 (1).jp2',
-            'files/derivative/sub-P866/P866_VN3_A_210.jp2': 'files/derivative/sub-P866/P866_VN3_A_210 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_224.jp2': 'files/derivative/sub-P866/P866_VN1_A_224 (1).jp2',
-            'files/derivative/sub-P866/P866_VN4_A_199.jp2': 'files/derivative/sub-P866/P866_VN4_A_199 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_B_087.jp2': 'files/derivative/sub-P866/P866_VN1_B_087 (1).jp2',
-            'files/derivative/sub-P866/P866_VN3_A_173.jp2': 'files/derivative/sub-P866/P866_VN3_A_173 (1).jp2',
-            'files/derivative/sub-P866/P866_VN3_A_218.jp2': 'files/derivative/sub-P866/P866_VN3_A_218 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_B_038.jp2': 'files/derivative/sub-P866/P866_VN1_B_038 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_299.jp2': 'files/derivative/sub-P866/P866_VN1_A_299 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_229.jp2': 'files/derivative/sub-P866/P866_VN1_A_229 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_B_021.jp2': 'files/derivative/sub-P866/P866_VN1_B_021 (1).jp2',
-            'files/derivative/sub-P866/P866_Nodose_057.jp2': 'files/derivative/sub-P866/P866_Nodose_057 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_C_002.jp2': 'files/derivative/sub-P866/P866_VN1_C_002 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_C_019.jp2': 'files/derivative/sub-P866/P866_VN1_C_019 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_B_045.jp2': 'files/derivative/sub-P866/P866_VN1_B_045 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_C_061.jp2': 'files/derivative/sub-P866/P866_VN1_C_061 (1).jp2',
-            'files/derivative/sub-P866/P866_Nodose_097.jp2': 'files/derivative/sub-P866/P866_Nodose_097 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_C_134.jp2': 'files/derivative/sub-P866/P866_VN1_C_134 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_195.jp2': 'files/derivative/sub-P866/P866_VN1_A_195 (1).jp2',
-            'files/derivative/sub-P866/P866_Nodose_133.jp2': 'files/derivative/sub-P866/P866_Nodose_133 (1).jp2',
-            'files/derivative/sub-P866/P866_VN4_A_219.jp2': 'files/derivative/sub-P866/P866_VN4_A_219 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_052.jp2': 'files/derivative/sub-P866/P866_VN1_A_052 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_C_114.jp2': 'files/derivative/sub-P866/P866_VN1_C_114 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_C_003.jp2': 'files/derivative/sub-P866/P866_VN1_C_003 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_C_094.jp2': 'files/derivative/sub-P866/P866_VN1_C_094 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_028.jp2': 'files/derivative/sub-P866/P866_VN1_A_028 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_C_073.jp2': 'files/derivative/sub-P866/P866_VN1_C_073 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_C_107.jp2': 'files/derivative/sub-P866/P866_VN1_C_107 (1).jp2',
-            'files/derivative/sub-P866/P866_Nodose_086.jp2': 'files/derivative/sub-P866/P866_Nodose_086 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_C_090.jp2': 'files/derivative/sub-P866/P866_VN1_C_090 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_B_066.jp2': 'files/derivative/sub-P866/P866_VN1_B_066 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_B_104.jp2': 'files/derivative/sub-P866/P866_VN1_B_104 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_134.jp2': 'files/derivative/sub-P866/P866_VN1_A_134 (1).jp2',
-            'files/derivative/sub-P866/P866_VN3_A_124.jp2': 'files/derivative/sub-P866/P866_VN3_A_124 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_239.jp2': 'files/derivative/sub-P866/P866_VN1_A_239 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_B_117.jp2': 'files/derivative/sub-P866/P866_VN1_B_117 (1).jp2',
-            'files/derivative/sub-P866/P866_VN4_A_161.jp2': 'files/derivative/sub-P866/P866_VN4_A_161 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_287.jp2': 'files/derivative/sub-P866/P866_VN1_A_287 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_C_004.jp2': 'files/derivative/sub-P866/P866_VN1_C_004 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_158.jp2': 'files/derivative/sub-P866/P866_VN1_A_158 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_C_020.jp2': 'files/derivative/sub-P866/P866_VN1_C_020 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_147.jp2': 'files/derivative/sub-P866/P866_VN1_A_147 (1).jp2',
-            'files/derivative/sub-P866/P866_VN3_A_088.jp2': 'files/derivative/sub-P866/P866_VN3_A_088 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_C_089.jp2': 'files/derivative/sub-P866/P866_VN1_C_089 (1).jp2',
-            'files/derivative/sub-P866/P866_VN4_A_144.jp2': 'files/derivative/sub-P866/P866_VN4_A_144 (1).jp2',
-            'files/derivative/sub-P866/P866_VN4_A_109.jp2': 'files/derivative/sub-P866/P866_VN4_A_109 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_230.jp2': 'files/derivative/sub-P866/P866_VN1_A_230 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_215.jp2': 'files/derivative/sub-P866/P866_VN1_A_215 (1).jp2',
-            'files/derivative/sub-P866/P866_Nodose_134.jp2': 'files/derivative/sub-P866/P866_Nodose_134 (1).jp2',
-            'files/derivative/sub-P866/P866_Nodose_002.jp2': 'files/derivative/sub-P866/P866_Nodose_002 (1).jp2',
-            'files/derivative/sub-P866/P866_VN4_A_153.jp2': 'files/derivative/sub-P866/P866_VN4_A_153 (1).jp2',
-            'files/derivative/sub-P866/P866_Nodose_047.jp2': 'files/derivative/sub-P866/P866_Nodose_047 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_C_034.jp2': 'files/derivative/sub-P866/P866_VN1_C_034 (1).jp2',
-            'files/derivative/sub-P866/P866_Nodose_060.jp2': 'files/derivative/sub-P866/P866_Nodose_060 (1).jp2',
-            'files/derivative/sub-P866/P866_Nodose_096.jp2': 'files/derivative/sub-P866/P866_Nodose_096 (1).jp2',
-            'files/derivative/sub-P866/P866_Nodose_026.jp2': 'files/derivative/sub-P866/P866_Nodose_026 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_C_102.jp2': 'files/derivative/sub-P866/P866_VN1_C_102 (1).jp2',
-            'files/derivative/sub-P866/P866_VN3_A_160.jp2': 'files/derivative/sub-P866/P866_VN3_A_160 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_C_012.jp2': 'files/derivative/sub-P866/P866_VN1_C_012 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_259.jp2': 'files/derivative/sub-P866/P866_VN1_A_259 (1).jp2',
-            'files/derivative/sub-P866/P866_VN4_A_119.jp2': 'files/derivative/sub-P866/P866_VN4_A_119 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_135.jp2': 'files/derivative/sub-P866/P866_VN1_A_135 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_C_135.jp2': 'files/derivative/sub-P866/P866_VN1_C_135 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_C_021.jp2': 'files/derivative/sub-P866/P866_VN1_C_021 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_285.jp2': 'files/derivative/sub-P866/P866_VN1_A_285 (1).jp2',
-            'files/derivative/sub-P866/P866_VN3_A_214.jp2': 'files/derivative/sub-P866/P866_VN3_A_214 (1).jp2',
-            'files/derivative/sub-P866/P866_VN3_A_174.jp2': 'files/derivative/sub-P866/P866_VN3_A_174 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_C_040.jp2': 'files/derivative/sub-P866/P866_VN1_C_040 (1).jp2',
-            'files/derivative/sub-P866/P866_Nodose_145.jp2': 'files/derivative/sub-P866/P866_Nodose_145 (1).jp2',
-            'files/derivative/sub-P866/P866_VN4_A_086.jp2': 'files/derivative/sub-P866/P866_VN4_A_086 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_B_042.jp2': 'files/derivative/sub-P866/P866_VN1_B_042 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_C_071.jp2': 'files/derivative/sub-P866/P866_VN1_C_071 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_B_060.jp2': 'files/derivative/sub-P866/P866_VN1_B_060 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_003.jp2': 'files/derivative/sub-P866/P866_VN1_A_003 (1).jp2',
-            'files/derivative/sub-P866/P866_VN4_A_188.jp2': 'files/derivative/sub-P866/P866_VN4_A_188 (1).jp2',
-            'files/derivative/sub-P866/P866_Nodose_010.jp2': 'files/derivative/sub-P866/P866_Nodose_010 (1).jp2',
-            'files/derivative/sub-P866/P866_VN4_A_121.jp2': 'files/derivative/sub-P866/P866_VN4_A_121 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_C_092.jp2': 'files/derivative/sub-P866/P866_VN1_C_092 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_022.jp2': 'files/derivative/sub-P866/P866_VN1_A_022 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_C_047.jp2': 'files/derivative/sub-P866/P866_VN1_C_047 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_125.jp2': 'files/derivative/sub-P866/P866_VN1_A_125 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_238.jp2': 'files/derivative/sub-P866/P866_VN1_A_238 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_C_096.jp2': 'files/derivative/sub-P866/P866_VN1_C_096 (1).jp2',
-            'files/derivative/sub-P866/P866_VN4_A_197.jp2': 'files/derivative/sub-P866/P866_VN4_A_197 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_B_056.jp2': 'files/derivative/sub-P866/P866_VN1_B_056 (1).jp2',
-            'files/derivative/sub-P866/P866_VN4_A_108.jp2': 'files/derivative/sub-P866/P866_VN4_A_108 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_054.jp2': 'files/derivative/sub-P866/P866_VN1_A_054 (1).jp2',
-            'files/derivative/sub-P866/P866_Nodose_044.jp2': 'files/derivative/sub-P866/P866_Nodose_044 (1).jp2',
-            'files/derivative/sub-P866/P866_VN3_A_130.jp2': 'files/derivative/sub-P866/P866_VN3_A_130 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_113.jp2': 'files/derivative/sub-P866/P866_VN1_A_113 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_209.jp2': 'files/derivative/sub-P866/P866_VN1_A_209 (1).jp2',
-            'files/derivative/sub-P866/P866_VN3_A_139.jp2': 'files/derivative/sub-P866/P866_VN3_A_139 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_064.jp2': 'files/derivative/sub-P866/P866_VN1_A_064 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_175.jp2': 'files/derivative/sub-P866/P866_VN1_A_175 (1).jp2',
-            'files/derivative/sub-P866/P866_VN3_A_200.jp2': 'files/derivative/sub-P866/P866_VN3_A_200 (1).jp2',
-            'files/derivative/sub-P866/P866_VN4_A_207.jp2': 'files/derivative/sub-P866/P866_VN4_A_207 (1).jp2',
-            'files/derivative/sub-P866/P866_VN3_A_099.jp2': 'files/derivative/sub-P866/P866_VN3_A_099 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_C_018.jp2': 'files/derivative/sub-P866/P866_VN1_C_018 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_189.jp2': 'files/derivative/sub-P866/P866_VN1_A_189 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_023.jp2': 'files/derivative/sub-P866/P866_VN1_A_023 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_C_042.jp2': 'files/derivative/sub-P866/P866_VN1_C_042 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_053.jp2': 'files/derivative/sub-P866/P866_VN1_A_053 (1).jp2',
-            'files/derivative/sub-P866/P866_Nodose_070.jp2': 'files/derivative/sub-P866/P866_Nodose_070 (1).jp2',
-            'files/derivative/sub-P866/P866_Nodose_083.jp2': 'files/derivative/sub-P866/P866_Nodose_083 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_165.jp2': 'files/derivative/sub-P866/P866_VN1_A_165 (1).jp2',
-            'files/derivative/sub-P866/P866_VN4_A_224.jp2': 'files/derivative/sub-P866/P866_VN4_A_224 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_C_105.jp2': 'files/derivative/sub-P866/P866_VN1_C_105 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_174.jp2': 'files/derivative/sub-P866/P866_VN1_A_174 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_256.jp2': 'files/derivative/sub-P866/P866_VN1_A_256 (1).jp2',
-            'files/derivative/sub-P866/P866_VN3_A_123.jp2': 'files/derivative/sub-P866/P866_VN3_A_123 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_B_130.jp2': 'files/derivative/sub-P866/P866_VN1_B_130 (1).jp2',
-            'files/derivative/sub-P866/P866_VN4_A_198.jp2': 'files/derivative/sub-P866/P866_VN4_A_198 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_114.jp2': 'files/derivative/sub-P866/P866_VN1_A_114 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_C_070.jp2': 'files/derivative/sub-P866/P866_VN1_C_070 (1).jp2',
-            'files/derivative/sub-P866/P866_Nodose_015.jp2': 'files/derivative/sub-P866/P866_Nodose_015 (1).jp2',
-            'files/derivative/sub-P866/P866_Nodose_055.jp2': 'files/derivative/sub-P866/P866_Nodose_055 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_B_043.jp2': 'files/derivative/sub-P866/P866_VN1_B_043 (1).jp2',
-            'files/derivative/sub-P866/P866_VN3_A_159.jp2': 'files/derivative/sub-P866/P866_VN3_A_159 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_081.jp2': 'files/derivative/sub-P866/P866_VN1_A_081 (1).jp2',
-            'files/derivative/sub-P866/P866_VN4_A_178.jp2': 'files/derivative/sub-P866/P866_VN4_A_178 (1).jp2',
-            'files/derivative/sub-P866/P866_Nodose_084.jp2': 'files/derivative/sub-P866/P866_Nodose_084 (1).jp2',
-            'files/derivative/sub-P866/P866_VN3_A_080.jp2': 'files/derivative/sub-P866/P866_VN3_A_080 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_222.jp2': 'files/derivative/sub-P866/P866_VN1_A_222 (1).jp2',
-            'files/derivative/sub-P866/P866_Nodose_003.jp2': 'files/derivative/sub-P866/P866_Nodose_003 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_059.jp2': 'files/derivative/sub-P866/P866_VN1_A_059 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_082.jp2': 'files/derivative/sub-P866/P866_VN1_A_082 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_201.jp2': 'files/derivative/sub-P866/P866_VN1_A_201 (1).jp2',
-            'files/derivative/sub-P866/P866_VN4_A_154.jp2': 'files/derivative/sub-P866/P866_VN4_A_154 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_C_001.jp2': 'files/derivative/sub-P866/P866_VN1_C_001 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_C_009.jp2': 'files/derivative/sub-P866/P866_VN1_C_009 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_B_069.jp2': 'files/derivative/sub-P866/P866_VN1_B_069 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_C_056.jp2': 'files/derivative/sub-P866/P866_VN1_C_056 (1).jp2',
-            'files/derivative/sub-P866/P866_Nodose_048.jp2': 'files/derivative/sub-P866/P866_Nodose_048 (1).jp2',
-            'files/derivative/sub-P866/P866_VN4_A_167.jp2': 'files/derivative/sub-P866/P866_VN4_A_167 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_181.jp2': 'files/derivative/sub-P866/P866_VN1_A_181 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_133.jp2': 'files/derivative/sub-P866/P866_VN1_A_133 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_286.jp2': 'files/derivative/sub-P866/P866_VN1_A_286 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_242.jp2': 'files/derivative/sub-P866/P866_VN1_A_242 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_139.jp2': 'files/derivative/sub-P866/P866_VN1_A_139 (1).jp2',
-            'files/derivative/sub-P866/P866_VN4_A_155.jp2': 'files/derivative/sub-P866/P866_VN4_A_155 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_097.jp2': 'files/derivative/sub-P866/P866_VN1_A_097 (1).jp2',
-            'files/derivative/sub-P866/P866_VN4_A_177.jp2': 'files/derivative/sub-P866/P866_VN4_A_177 (1).jp2',
-            'files/derivative/sub-P866/P866_VN4_A_166.jp2': 'files/derivative/sub-P866/P866_VN4_A_166 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_124.jp2': 'files/derivative/sub-P866/P866_VN1_A_124 (1).jp2',
-            'files/derivative/sub-P866/P866_Nodose_159.jp2': 'files/derivative/sub-P866/P866_Nodose_159 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_B_006.jp2': 'files/derivative/sub-P866/P866_VN1_B_006 (1).jp2',
-            'files/derivative/sub-P866/P866_VN4_A_147.jp2': 'files/derivative/sub-P866/P866_VN4_A_147 (1).jp2',
-            'files/derivative/sub-P866/P866_VN4_A_112.jp2': 'files/derivative/sub-P866/P866_VN4_A_112 (1).jp2',
-            'files/derivative/sub-P866/P866_Nodose_160.jp2': 'files/derivative/sub-P866/P866_Nodose_160 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_C_126.jp2': 'files/derivative/sub-P866/P866_VN1_C_126 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_C_113.jp2': 'files/derivative/sub-P866/P866_VN1_C_113 (1).jp2',
-            'files/derivative/sub-P866/P866_VN4_A_127.jp2': 'files/derivative/sub-P866/P866_VN4_A_127 (1).jp2',
-            'files/derivative/sub-P866/P866_VN3_A_104.jp2': 'files/derivative/sub-P866/P866_VN3_A_104 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_260.jp2': 'files/derivative/sub-P866/P866_VN1_A_260 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_C_058.jp2': 'files/derivative/sub-P866/P866_VN1_C_058 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_071.jp2': 'files/derivative/sub-P866/P866_VN1_A_071 (1).jp2',
-            'files/derivative/sub-P866/P866_VN3_A_097.jp2': 'files/derivative/sub-P866/P866_VN3_A_097 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_C_049.jp2': 'files/derivative/sub-P866/P866_VN1_C_049 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_C_041.jp2': 'files/derivative/sub-P866/P866_VN1_C_041 (1).jp2',
-            'files/derivative/sub-P866/P866_Nodose_153.jp2': 'files/derivative/sub-P866/P866_Nodose_153 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_073.jp2': 'files/derivative/sub-P866/P866_VN1_A_073 (1).jp2',
-            'files/derivative/sub-P866/P866_VN4_A_102B.jp2': 'files/derivative/sub-P866/P866_VN4_A_102B (1).jp2',
-            'files/derivative/sub-P866/P866_VN4_A_107.jp2': 'files/derivative/sub-P866/P866_VN4_A_107 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_099.jp2': 'files/derivative/sub-P866/P866_VN1_A_099 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_166.jp2': 'files/derivative/sub-P866/P866_VN1_A_166 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_115.jp2': 'files/derivative/sub-P866/P866_VN1_A_115 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_280.jp2': 'files/derivative/sub-P866/P866_VN1_A_280 (1).jp2',
-            'files/derivative/sub-P866/P866_VN3_A_144.jp2': 'files/derivative/sub-P866/P866_VN3_A_144 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_B_143.jp2': 'files/derivative/sub-P866/P866_VN1_B_143 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_B_079.jp2': 'files/derivative/sub-P866/P866_VN1_B_079 (1).jp2',
-            'files/derivative/sub-P866/P866_VN3_A_177.jp2': 'files/derivative/sub-P866/P866_VN3_A_177 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_288.jp2': 'files/derivative/sub-P866/P866_VN1_A_288 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_C_093.jp2': 'files/derivative/sub-P866/P866_VN1_C_093 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_208.jp2': 'files/derivative/sub-P866/P866_VN1_A_208 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_151.jp2': 'files/derivative/sub-P866/P866_VN1_A_151 (1).jp2',
-            'files/derivative/sub-P866/P866_VN4_A_087.jp2': 'files/derivative/sub-P866/P866_VN4_A_087 (1).jp2',
-            'files/derivative/sub-P866/P866_VN3_A_100.jp2': 'files/derivative/sub-P866/P866_VN3_A_100 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_233.jp2': 'files/derivative/sub-P866/P866_VN1_A_233 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_090.jp2': 'files/derivative/sub-P866/P866_VN1_A_090 (1).jp2',
-            'files/derivative/sub-P866/P866_Nodose_025.jp2': 'files/derivative/sub-P866/P866_Nodose_025 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_C_136.jp2': 'files/derivative/sub-P866/P866_VN1_C_136 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_B_011.jp2': 'files/derivative/sub-P866/P866_VN1_B_011 (1).jp2',
-            'files/derivative/sub-P866/P866_VN4_A_128.jp2': 'files/derivative/sub-P866/P866_VN4_A_128 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_C_085.jp2': 'files/derivative/sub-P866/P866_VN1_C_085 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_C_011.jp2': 'files/derivative/sub-P866/P866_VN1_C_011 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_B_089.jp2': 'files/derivative/sub-P866/P866_VN1_B_089 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_055.jp2': 'files/derivative/sub-P866/P866_VN1_A_055 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_C_057.jp2': 'files/derivative/sub-P866/P866_VN1_C_057 (1).jp2',
-            'files/derivative/sub-P866/P866_VN3_A_184.jp2': 'files/derivative/sub-P866/P866_VN3_A_184 (1).jp2',
-            'files/derivative/sub-P866/P866_VN4_A_110.jp2': 'files/derivative/sub-P866/P866_VN4_A_110 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_B_144.jp2': 'files/derivative/sub-P866/P866_VN1_B_144 (1).jp2',
-            'files/derivative/sub-P866/P866_VN3_A_143.jp2': 'files/derivative/sub-P866/P866_VN3_A_143 (1).jp2',
-            'files/derivative/sub-P866/P866_VN4_A_126.jp2': 'files/derivative/sub-P866/P866_VN4_A_126 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_B_013.jp2': 'files/derivative/sub-P866/P866_VN1_B_013 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_182.jp2': 'files/derivative/sub-P866/P866_VN1_A_182 (1).jp2',
-            'files/derivative/sub-P866/P866_Nodose_061.jp2': 'files/derivative/sub-P866/P866_Nodose_061 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_104.jp2': 'files/derivative/sub-P866/P866_VN1_A_104 (1).jp2',
-            'files/derivative/sub-P866/P866_VN4_A_172.jp2': 'files/derivative/sub-P866/P866_VN4_A_172 (1).jp2',
-            'files/derivative/sub-P866/P866_VN3_A_106.jp2': 'files/derivative/sub-P866/P866_VN3_A_106 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_136.jp2': 'files/derivative/sub-P866/P866_VN1_A_136 (1).jp2',
-            'files/derivative/sub-P866/P866_VN3_A_189.jp2': 'files/derivative/sub-P866/P866_VN3_A_189 (1).jp2',
-            'files/derivative/sub-P866/P866_VN3_A_132.jp2': 'files/derivative/sub-P866/P866_VN3_A_132 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_228.jp2': 'files/derivative/sub-P866/P866_VN1_A_228 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_257.jp2': 'files/derivative/sub-P866/P866_VN1_A_257 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_036.jp2': 'files/derivative/sub-P866/P866_VN1_A_036 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_B_142.jp2': 'files/derivative/sub-P866/P866_VN1_B_142 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_B_109.jp2': 'files/derivative/sub-P866/P866_VN1_B_109 (1).jp2',
-            'files/derivative/sub-P866/P866_VN3_A_089.jp2': 'files/derivative/sub-P866/P866_VN3_A_089 (1).jp2',
-            'files/derivative/sub-P866/P866_Nodose_011.jp2': 'files/derivative/sub-P866/P866_Nodose_011 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_154.jp2': 'files/derivative/sub-P866/P866_VN1_A_154 (1).jp2',
-            'files/derivative/sub-P866/P866_Nodose_095.jp2': 'files/derivative/sub-P866/P866_Nodose_095 (1).jp2',
-            'files/derivative/sub-P866/P866_Nodose_162.jp2': 'files/derivative/sub-P866/P866_Nodose_162 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_026.jp2': 'files/derivative/sub-P866/P866_VN1_A_026 (1).jp2',
-            'files/derivative/sub-P866/P866_VN3_A_212.jp2': 'files/derivative/sub-P866/P866_VN3_A_212 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_138.jp2': 'files/derivative/sub-P866/P866_VN1_A_138 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_258.jp2': 'files/derivative/sub-P866/P866_VN1_A_258 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_292.jp2': 'files/derivative/sub-P866/P866_VN1_A_292 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_072.jp2': 'files/derivative/sub-P866/P866_VN1_A_072 (1).jp2',
-            'files/derivative/sub-P866/P866_VN3_A_140.jp2': 'files/derivative/sub-P866/P866_VN3_A_140 (1).jp2',
-            'files/derivative/sub-P866/P866_VN3_A_163.jp2': 'files/derivative/sub-P866/P866_VN3_A_163 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_C_048.jp2': 'files/derivative/sub-P866/P866_VN1_C_048 (1).jp2',
-            'files/derivative/sub-P866/P866_Nodose_139.jp2': 'files/derivative/sub-P866/P866_Nodose_139 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_B_030.jp2': 'files/derivative/sub-P866/P866_VN1_B_030 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_210.jp2': 'files/derivative/sub-P866/P866_VN1_A_210 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_232.jp2': 'files/derivative/sub-P866/P866_VN1_A_232 (1).jp2',
-            'files/derivative/sub-P866/P866_VN4_A_130.jp2': 'files/derivative/sub-P866/P866_VN4_A_130 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_070.jp2': 'files/derivative/sub-P866/P866_VN1_A_070 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_B_131.jp2': 'files/derivative/sub-P866/P866_VN1_B_131 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_B_103.jp2': 'files/derivative/sub-P866/P866_VN1_B_103 (1).jp2',
-            'files/derivative/sub-P866/P866_VN3_A_110.jp2': 'files/derivative/sub-P866/P866_VN3_A_110 (1).jp2',
-            'files/derivative/sub-P866/P866_VN3_A_098.jp2': 'files/derivative/sub-P866/P866_VN3_A_098 (1).jp2',
-            'files/derivative/sub-P866/P866_Nodose_112.jp2': 'files/derivative/sub-P866/P866_Nodose_112 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_241.jp2': 'files/derivative/sub-P866/P866_VN1_A_241 (1).jp2',
-            'files/derivative/sub-P866/P866_VN4_A_138.jp2': 'files/derivative/sub-P866/P866_VN4_A_138 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_A_223.jp2': 'files/derivative/sub-P866/P866_VN1_A_223 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_B_004.jp2': 'files/derivative/sub-P866/P866_VN1_B_004 (1).jp2',
-            'files/derivative/sub-P866/P866_VN4_A_145.jp2': 'files/derivative/sub-P866/P866_VN4_A_145 (1).jp2',
-            'files/derivative/sub-P866/P866_VN1_C_127.jp2': 'files/derivative/sub-P866/P866_VN1_C_127 (1).jp2',
-            'files/derivative/sub-P866/P866_VN3_A_182.jp2': 'files/derivative/sub-P866/P866_VN3_A_182 (1).jp2',
-            'files/primary/sub-10682/sam-09vosx/manifest__12_.csv': 'files/primary/sub-10682/sam-09vosx/manifest.csv',
-            'files/primary/sub-10063/sam-ywopfv/manifest__5_.csv': 'files/primary/sub-10063/sam-ywopfv/manifest.csv',
-            'files/primary/sub-9519/sam-1wokh7/manifest__13_.csv': 'files/primary/sub-9519/sam-1wokh7/manifest.csv',
-            'files/primary/sub-10532/sam-lk4jhl/manifest__11_.csv': 'files/primary/sub-10532/sam-lk4jhl/manifest.csv',
-            'files/primary/sub-10149/sam-678xu3/manifest__7_.csv': 'files/primary/sub-10149/sam-678xu3/manifest.csv',
-            'files/primary/sub-10311/sam-5wk7sv/manifest__10_.csv': 'files/primary/sub-10311/sam-5wk7sv/manifest.csv',
-            'files/primary/manifest_2-28-20.csv': 'files/primary/manifest.csv',
-            'files/primary/sub-10137/sam-xz57ug/manifest__6_.csv': 'files/primary/sub-10137/sam-xz57ug/manifest.csv',
-            'files/primary/sub-10156/sam-4zw3t8/manifest__9_.csv': 'files/primary/sub-10156/sam-4zw3t8/manifest.csv',
-            'files/primary/sub-10019/sam-2pqwc4/manifest__2_.csv': 'files/primary/sub-10019/sam-2pqwc4/manifest.csv',
-            'files/primary/sub-10155/sam-3nzgb2/manifest__8_.csv': 'files/primary/sub-10155/sam-3nzgb2/manifest.csv',
-            'files/primary/sub-10035/sam-5wvjtv/manifest__3_.csv': 'files/primary/sub-10035/sam-5wvjtv/manifest.csv',
-            'files/primary/sub-10035/sam-k1gztg/manifest__4_.csv': 'files/primary/sub-10035/sam-k1gztg/manifest.csv',
-            'files/derivative/Efferent_data_updated.xlsx': 'files/derivative/Efferent_data.xlsx',
-            'files/derivative/manifest_file_for_derivatives_folder.xlsx': 'files/derivative/manifest.xlsx',
-            'files/Corrected_sample_sheet_for_efferents_2-27-20.xlsx': 'files/samples.xlsx', 'files/docs/Neurite_Map_Efferents.jpg': 'files/docs/Neurite Map Efferents.jpg',
-            'files/source/DRG L13/CTB-IP-1W-L13-3.ims': 'files/source/DRG L13/CTB-IP-1W-L13-3 (1).ims',
-            'files/source/DRG L13/CTB-IP-1W-L13-1.ims': 'files/source/DRG L13/CTB-IP-1W-L13-1 (1).ims',
-            'files/source/DRG L13/CTB-IP-1W-L13-2.ims': 'files/source/DRG L13/CTB-IP-1W-L13-2 (1).ims',
-            'files/source/DRG R13/CTB-IP-1W-R13-2.ims': 'files/source/DRG R13/CTB-IP-1W-R13-2 (1).ims',
-            'files/source/DRG R13/CTB-IP-1W-R13-5.ims': 'files/source/DRG R13/CTB-IP-1W-R13-5 (1).ims',
-            'files/source/DRG R13/CTB-IP-1W-R13-3.ims': 'files/source/DRG R13/CTB-IP-1W-R13-3 (1).ims',
-            'files/source/DRG R13/CTB-IP-1W-R13-1.ims': 'files/source/DRG R13/CTB-IP-1W-R13-1 (1).ims',
-            'files/source/DRG L13/CTB-IP-1W-L13-5.ims': 'files/source/DRG L13/CTB-IP-1W-L13-5 (1).ims',
-            'files/source/DRG R13/CTB-IP-1W-R13-4.ims': 'files/source/DRG R13/CTB-IP-1W-R13-4 (1).ims',
-            'files/source/Left Nodose/CTB-IP-1W-LN-4.ims': 'files/source/Left Nodose/CTB-IP-1W-LN-4 (1).ims',
-            'files/source/DRG L10/CTB-IP-1W-L10-1.ims': 'files/source/DRG L10/CTB-IP-1W-L10-1 (1).ims',
-            'files/source/DRG L10/CTB-IP-1W-L10-4.ims': 'files/source/DRG L10/CTB-IP-1W-L10-4 (1).ims',
-            'files/source/DRG L10/CTB-IP-1W-L10-3.ims': 'files/source/DRG L10/CTB-IP-1W-L10-3 (1).ims',
-            'files/source/Right Nodose/CTB-IP-1W-RN-4.ims': 'files/source/Right Nodose/CTB-IP-1W-RN-4 (1).ims',
-            'files/source/DRG L10/CTB-IP-1W-L10-2.ims': 'files/source/DRG L10/CTB-IP-1W-L10-2 (1).ims',
-            'files/source/Coeliac Ganglia/CTB-IP-1W-CG-1.ims': 'files/source/Coeliac Ganglia/CTB-IP-1W-CG-1 (1).ims',
-            'files/source/Right Nodose/CTB-IP-1W-RN-1.ims': 'files/source/Right Nodose/CTB-IP-1W-RN-1 (1).ims',
-            'files/source/Right Nodose/CTB-IP-1W-RN-5.ims': 'files/source/Right Nodose/CTB-IP-1W-RN-5 (1).ims',
-            'files/derivative/1_wk_quantification_CTb_Intrapancreatic.pzfx': 'files/derivative/1 wk quantification CTb Intrapancreatic.pzfx',
-            'files/primary/CTB-IP-1W-5/CTB-IP-1W-5.jpg': 'files/primary/CTB-IP-1W-5/CTB-IP-1W-5 (1).jpg',
-            'files/primary/CTB-IP-1W-1/CTB-IP-1W-1.jpg': 'files/primary/CTB-IP-1W-1/CTB-IP-1W-1 (1).jpg',
-            'files/primary/CTB-IP-1W-3/CTB-IP-1W-3.jpg': 'files/primary/CTB-IP-1W-3/CTB-IP-1W-3 (1).jpg',
-            'files/primary/CTB-IP-1W-4/CTB-IP-1W-4.jpg': 'files/primary/CTB-IP-1W-4/CTB-IP-1W-4 (1).jpg',
-            'files/primary/CTB-IP-1W-6/CTB-IP-1W-6.jpg': 'files/primary/CTB-IP-1W-6/CTB-IP-1W-6 (1).jpg',
-            'files/primary/CTB-IP-1W-2/CTB-IP-1W-2.jpg': 'files/primary/CTB-IP-1W-2/CTB-IP-1W-2 (1).jpg',
-            'files/source/DRG R10/DRG_R10_Samples_list.csv': 'files/source/DRG R10/DRG R10 Samples list.csv',
-            'files/source/DRG L13/DRG_L13_Samples_list.csv': 'files/source/DRG L13/DRG L13 Samples list.csv',
-            'files/source/DRG R10/CTB-IP-1W-R10-2_.czi': 'files/source/DRG R10/CTB-IP-1W-R10-2.czi',
-            'files/source/DRG R13/DRG_R13_Samples_list.csv': 'files/source/DRG R13/DRG R13 Samples list.csv',
-            'files/source/Left Nodose/Left_Nodose_Samples_list.csv': 'files/source/Left Nodose/Left Nodose Samples list.csv',
-            'files/source/Coeliac Ganglia/Coeliac_Ganglia_Samples_list.csv': 'files/source/Coeliac Ganglia/Coeliac Ganglia Samples list.csv',
-            'files/source/Right Nodose/Right_Nodose_Samples_list.csv': 'files/source/Right Nodose/Right Nodose Samples list.csv',
-            'files/derivative/CTb_Intrapancreatic_1week_Image.tif': 'files/derivative/CTb Intrapancreatic 1week Image.tif',
-            'files/derivative/1_wk_quantification_CTb_Intrapancreatic.csv': 'files/derivative/1 wk quantification CTb Intrapancreatic.csv',
-            'files/docs/Participants_CTb_Intrapancreatic1week.csv': 'files/docs/Participants CTb Intrapancreatic1week.csv',
-            'files/docs/CTb_Intrapancreatic_1_week_Image.png': 'files/docs/CTb Intrapancreatic 1 week Image.png',
-            'files/protocol/PROTOCOL_CTb_intrapancreatic__1week.pdf': 'files/protocol/PROTOCOL CTb intrapancreatic 1week.pdf',
-            'files/primary/sub-iBAT88/Imaris Images/SPARC_BAT88_Ventral_Upper_Spine.ims': 'files/primary/sub-iBAT88/Imaris Images/SPARC_BAT88_Ventral Upper Spine.ims',
-            'files/primary/sub-iBAT87/Imaris Images/SPARC_BAT87_Ventral_Upper_Spine.ims': 'files/primary/sub-iBAT87/Imaris Images/SPARC_BAT87_Ventral Upper Spine.ims',
-            'files/primary/sub-iBAT88/Imaris Images/SPARC_BAT_88_Ventral_Lower_Spine.ims': 'files/primary/sub-iBAT88/Imaris Images/SPARC_BAT_88_Ventral Lower Spine.ims',
-            'files/primary/sub-iBAT87/Imaris Images/SPARC_BAT87_Dorsal_Upper_Spine.ims': 'files/primary/sub-iBAT87/Imaris Images/SPARC_BAT87_Dorsal Upper Spine.ims',
-            'files/primary/sub-iBAT3/Imaris images/SPARC_BAT3_Dorsal_Upper_Spine.ims': 'files/primary/sub-iBAT3/Imaris images/SPARC_BAT3_Dorsal Upper Spine.ims',
-            'files/primary/sub-iBAT88/Imaris Images/SPARC_BAT88_Dorsal_Lower_Spine.ims': 'files/primary/sub-iBAT88/Imaris Images/SPARC_BAT88_Dorsal Lower Spine.ims',
-            'files/primary/sub-iBAT3/Imaris images/SPARC_BAT3_Dorsal_Lower_Spine.ims': 'files/primary/sub-iBAT3/Imaris images/SPARC_BAT3_Dorsal Lower Spine.ims',
-            'files/primary/sub-iBAT88/Imaris Images/SPARC_BAT88_Dorsal_Upper_Spine.ims': 'files/primary/sub-iBAT88/Imaris Images/SPARC_BAT88_Dorsal Upper Spine.ims',
-            'files/primary/sub-iBAT3/Imaris images/SPARC_BAT3_Ventral_Upper_Spine.ims': 'files/primary/sub-iBAT3/Imaris images/SPARC_BAT3_Ventral Upper Spine.ims',
-            'files/primary/sub-iBAT91/Imaris Images/SPARC_BAT_91_Dorsal_Upper_Spine.ims': 'files/primary/sub-iBAT91/Imaris Images/SPARC_BAT_91_Dorsal Upper Spine.ims',
-            'files/primary/sub-iBAT91/Imaris Images/SPARC_BAT91_Dorsal_Lower_Spine.ims': 'files/primary/sub-iBAT91/Imaris Images/SPARC_BAT91_Dorsal Lower Spine.ims',
-            'files/primary/sub-iBAT92/Imaris Images/SPARC_BAT92_Ventral_Upper_Spine.ims': 'files/primary/sub-iBAT92/Imaris Images/SPARC_BAT92_Ventral Upper Spine.ims',
-            'files/primary/sub-iBAT91/Imaris Images/SPARC_BAT_91_Ventral_Upper_Spine.ims': 'files/primary/sub-iBAT91/Imaris Images/SPARC_BAT_91_Ventral Upper Spine.ims',
-            'files/primary/sub-iBAT92/Imaris Images/SPARC_BAT92_Ventral_Lower_Spine.ims': 'files/primary/sub-iBAT92/Imaris Images/SPARC_BAT92_Ventral Lower Spine.ims',
-            'files/primary/sub-iBAT92/Imaris Images/SPARC_BAT92_Dorsal_Upper_Spine.ims': 'files/primary/sub-iBAT92/Imaris Images/SPARC_BAT92_Dorsal Upper Spine.ims',
-            'files/primary/sub-iBAT14/Imaris Images/SPARC_BAT14_Ventral_Lower_Spine.ims': 'files/primary/sub-iBAT14/Imaris Images/SPARC_BAT14_Ventral Lower Spine.ims',
-            'files/primary/sub-iBAT14/Imaris Images/SPARC_BAT14_Dorsal_Lower_Spine.ims': 'files/primary/sub-iBAT14/Imaris Images/SPARC_BAT14_Dorsal Lower Spine.ims',
-            'files/primary/sub-iBAT14/Imaris Images/SPARC_BAT14_Dorsal_Upper_Spine.ims': 'files/primary/sub-iBAT14/Imaris Images/SPARC_BAT14_Dorsal Upper Spine.ims',
-            'files/primary/sub-iBAT14/Imaris Images/SPARC_BAT14_Ventral_Upper_Spine.ims': 'files/primary/sub-iBAT14/Imaris Images/SPARC_BAT14_Ventral Upper Spine.ims',
-            'files/primary/sub-iBAT25/Imaris Images/SPARC_BAT25_Dorsal_Upper_Spine.ims': 'files/primary/sub-iBAT25/Imaris Images/SPARC_BAT25_Dorsal Upper Spine.ims',
-            'files/primary/sub-iBAT7/Imaris images/SPARC_BAT7_Ventral_Lower_Spine.ims': 'files/primary/sub-iBAT7/Imaris images/SPARC_BAT7_Ventral Lower Spine.ims',
-            'files/primary/sub-iBAT7/Imaris images/SPARC_BAT7_Dorsal_Upper_Spine.ims': 'files/primary/sub-iBAT7/Imaris images/SPARC_BAT7_Dorsal Upper Spine.ims',
-            'files/primary/sub-iBAT7/Imaris images/SPARC_BAT7_Dorsal_Lower_Spine.ims': 'files/primary/sub-iBAT7/Imaris images/SPARC_BAT7_Dorsal Lower Spine.ims',
-            'files/primary/sub-iBAT7/Imaris images/SPARC_BAT7_Ventral_Upper_Spine.ims': 'files/primary/sub-iBAT7/Imaris images/SPARC_BAT7_Ventral Upper Spine.ims',
-            'files/primary/sub-iBAT25/Imaris Images/SPARC_BAT25_Dorsal_Lower_Spine.ims': 'files/primary/sub-iBAT25/Imaris Images/SPARC_BAT25_Dorsal Lower Spine.ims',
-            'files/primary/sub-iBAT25/Imaris Images/SPARC_BAT25_Ventral_Upper_Spine.ims': 'files/primary/sub-iBAT25/Imaris Images/SPARC_BAT25_Ventral Upper Spine.ims',
-            'files/primary/sub-iBAT89/Imaris Images/SPARC_BAT89_Ventral_Upper_Spine.ims': 'files/primary/sub-iBAT89/Imaris Images/SPARC_BAT89_Ventral Upper Spine.ims',
-            'files/primary/sub-iBAT89/Imaris Images/SPARC_BAT89_Dorsal_Upper_Spine.ims': 'files/primary/sub-iBAT89/Imaris Images/SPARC_BAT89_Dorsal Upper Spine.ims',
-            'files/primary/sub-iBAT25/Imaris Images/SPARC_BAT25_Ventral_Lower_Spine.ims': 'files/primary/sub-iBAT25/Imaris Images/SPARC_BAT25_Ventral Lower Spine.ims',
-            'files/primary/sub-iBAT89/Imaris Images/SPARC_BAT89_Dorsal_Lower_Spine.ims': 'files/primary/sub-iBAT89/Imaris Images/SPARC_BAT89_Dorsal Lower Spine.ims',
-            'files/primary/sub-iBAT89/Imaris Images/SPARC_BAT89_Ventral_Lower_Spine.ims': 'files/primary/sub-iBAT89/Imaris Images/SPARC_BAT89_Ventral Lower Spine.ims',
-            'files/primary/sub-iBAT26/Imaris images/SPARC_BAT26_Ventral_Lower_Spine.ims': 'files/primary/sub-iBAT26/Imaris images/SPARC_BAT26_Ventral Lower Spine.ims',
-            'files/primary/sub-iBAT26/Imaris images/SPARC_BAT26_Dorsal_Lower_Spine.ims': 'files/primary/sub-iBAT26/Imaris images/SPARC_BAT26_Dorsal Lower Spine.ims',
-            'files/primary/sub-iBAT26/Imaris images/SPARC_BAT26_Dorsal_Upper_Spine.ims': 'files/primary/sub-iBAT26/Imaris images/SPARC_BAT26_Dorsal Upper Spine.ims',
-            'files/primary/sub-iBAT26/Imaris images/SPARC_BAT26_Ventral_Upper_Spine.ims': 'files/primary/sub-iBAT26/Imaris images/SPARC_BAT26_Ventral Upper Spine.ims',
-            'files/primary/sub-iBAT90/Imaris Images/SPARC_BAT_90_Ventral_Upper_Spine.ims': 'files/primary/sub-iBAT90/Imaris Images/SPARC_BAT_90_Ventral Upper Spine.ims',
-            'files/primary/sub-iBAT90/Imaris Images/SPARC_BAT90_Ventral_Lower_Spine.ims': 'files/primary/sub-iBAT90/Imaris Images/SPARC_BAT90_Ventral Lower Spine.ims',
-            'files/primary/sub-iBAT90/Imaris Images/SPARC_BAT_90_Dorsal_Upper_Spine.ims': 'files/primary/sub-iBAT90/Imaris Images/SPARC_BAT_90_Dorsal Upper Spine.ims',
-            'files/docs/SPARC_BAT_91_Dorsal_Upper_Spine.ims': 'files/docs/SPARC_BAT_91_Dorsal Upper Spine.ims',
-            'files/primary/sub-iBAT90/Imaris Images/SPARC_BAT90_Dorsal_Lower_Spine.ims': 'files/primary/sub-iBAT90/Imaris Images/SPARC_BAT90_Dorsal Lower Spine.ims',
-            'files/primary/sub-iBAT87/TIFF Images/SPARC_BAT87_Ventral_Upper_Spine.tif': 'files/primary/sub-iBAT87/TIFF Images/SPARC_BAT87_Ventral Upper Spine.tif',
-            'files/primary/sub-iBAT87/TIFF Images/SPARC_BAT87_Dorsal_Upper_Spine.tif': 'files/primary/sub-iBAT87/TIFF Images/SPARC_BAT87_Dorsal Upper Spine.tif',
-            'files/primary/sub-iBAT88/TIFF Images/SPARC_BAT88_Dorsal_Upper_Spine.tif': 'files/primary/sub-iBAT88/TIFF Images/SPARC_BAT88_Dorsal Upper Spine.tif',
-            'files/primary/sub-iBAT88/TIFF Images/SPARC_BAT88_Dorsal_Lower_Spine.tif': 'files/primary/sub-iBAT88/TIFF Images/SPARC_BAT88_Dorsal Lower Spine.tif',
-            'files/primary/sub-iBAT3/TIFF images/SPARC_BAT3_Ventral_Upper_Spine.tif': 'files/primary/sub-iBAT3/TIFF images/SPARC_BAT3_Ventral Upper Spine.tif',
-            'files/primary/sub-iBAT88/TIFF Images/SPARC_BAT88_Ventral_Lower_Spine.tif': 'files/primary/sub-iBAT88/TIFF Images/SPARC_BAT88_Ventral Lower Spine.tif',
-            'files/primary/sub-iBAT3/TIFF images/SPARC_BAT3_Dorsal_Lower_Spine.tif': 'files/primary/sub-iBAT3/TIFF images/SPARC_BAT3_Dorsal Lower Spine.tif',
-            'files/primary/sub-iBAT88/TIFF Images/SPARC_BAT88_Ventral_Upper_Spine.tif': 'files/primary/sub-iBAT88/TIFF Images/SPARC_BAT88_Ventral Upper Spine.tif',
-            'files/primary/sub-iBAT3/TIFF images/SPARC_BAT3_Dorsal_Upper_Spine.tif': 'files/primary/sub-iBAT3/TIFF images/SPARC_BAT3_Dorsal Upper Spine.tif',
-            'files/primary/sub-iBAT91/TIFF Images/SPARC_BAT91_Ventral_Lower_Spine.tif': 'files/primary/sub-iBAT91/TIFF Images/SPARC_BAT91_Ventral Lower Spine.tif',
-            'files/primary/sub-iBAT91/TIFF Images/SPARC_BAT91_Dorsal_Upper_Spine.tif': 'files/primary/sub-iBAT91/TIFF Images/SPARC_BAT91_Dorsal Upper Spine.tif',
-            'files/primary/sub-iBAT91/TIFF Images/SPARC_BAT91_Ventral_Upper_Spine.tif': 'files/primary/sub-iBAT91/TIFF Images/SPARC_BAT91_Ventral Upper Spine.tif',
-            'files/primary/sub-iBAT91/TIFF Images/SPARC_BAT91_Dorsal_Lower_Spine.tif': 'files/primary/sub-iBAT91/TIFF Images/SPARC_BAT91_Dorsal Lower Spine.tif',
-            'files/primary/sub-iBAT92/TIFF Images/SPARC_BAT92_Ventral_Upper_Spine.tif': 'files/primary/sub-iBAT92/TIFF Images/SPARC_BAT92_Ventral Upper Spine.tif',
-            'files/primary/sub-iBAT92/TIFF Images/SPARC_BAT92_Dorsal_Upper_Spine.tif': 'files/primary/sub-iBAT92/TIFF Images/SPARC_BAT92_Dorsal Upper Spine.tif',
-            'files/primary/sub-iBAT14/TIFF Images/SPARC_BAT14_Dorsal_Lower_Spine.tif': 'files/primary/sub-iBAT14/TIFF Images/SPARC_BAT14_Dorsal Lower Spine.tif',
-            'files/primary/sub-iBAT92/TIFF Images/SPARC_BAT92_Ventral_Lower_Spine.tif': 'files/primary/sub-iBAT92/TIFF Images/SPARC_BAT92_Ventral Lower Spine.tif',
-            'files/primary/sub-iBAT14/TIFF Images/SPARC_BAT14_Upper_Dorsal_SP5_5x_512_TH1Ch1_CGRPCh2_GFPCh3_dr_TileScan_009_Merging001_2019-01-14T16-21-58.471.tif': 'files/primary/sub-iBAT14/TIFF Images/SPARC_BAT14_Upper Dorsal_SP5_5x_512_TH1Ch1_CGRPCh2_GFPCh3_dr_TileScan_009_Merging001_2019-01-14T16-21-58.471.tif',
-            'files/primary/sub-iBAT14/TIFF Images/SPARC_BAT14_Ventral_Lower_Spine.tif': 'files/primary/sub-iBAT14/TIFF Images/SPARC_BAT14_Ventral Lower Spine.tif',
-            'files/primary/sub-iBAT14/TIFF Images/SPARC_BAT14_Ventral_Upper_Spine_Representative_Figure.tif': 'files/primary/sub-iBAT14/TIFF Images/SPARC_BAT14_Ventral Upper Spine_Representative Figure.tif',
-            'files/primary/sub-iBAT14/TIFF Images/SPARC_BAT14_Ventral_Upper_Spine.tif': 'files/primary/sub-iBAT14/TIFF Images/SPARC_BAT14_Ventral Upper Spine.tif',
-            'files/primary/sub-iBAT14/TIFF Images/SPARC_BAT14_Dorsal_Upper_Spine.tif': 'files/primary/sub-iBAT14/TIFF Images/SPARC_BAT14_Dorsal Upper Spine.tif',
-            'files/primary/sub-iBAT7/TIFF images/SPARC_BAT7_Ventral_Upper_Spine.tif': 'files/primary/sub-iBAT7/TIFF images/SPARC_BAT7_Ventral Upper Spine.tif',
-            'files/primary/sub-iBAT7/TIFF images/SPARC_BAT7_Ventral_Lower_Spine.tif': 'files/primary/sub-iBAT7/TIFF images/SPARC_BAT7_Ventral Lower Spine.tif',
-            'files/primary/sub-iBAT7/TIFF images/SPARC_BAT7_Dorsal_Upper_Spine.tif': 'files/primary/sub-iBAT7/TIFF images/SPARC_BAT7_Dorsal Upper Spine.tif',
-            'files/primary/sub-iBAT25/TIFF Images/SPARC_BAT25_Dorsal_Upper_Spine.tif': 'files/primary/sub-iBAT25/TIFF Images/SPARC_BAT25_Dorsal Upper Spine.tif',
-            'files/primary/sub-iBAT25/TIFF Images/SPARC_BAT25_Dorsal_Lower_Spine.tif': 'files/primary/sub-iBAT25/TIFF Images/SPARC_BAT25_Dorsal Lower Spine.tif',
-            'files/primary/sub-iBAT25/TIFF Images/SPARC_BAT25_Ventral_Upper_Spine.tif': 'files/primary/sub-iBAT25/TIFF Images/SPARC_BAT25_Ventral Upper Spine.tif',
-            'files/primary/sub-iBAT7/TIFF images/SPARC_BAT7_Dorsal_Lower_Spine.tif': 'files/primary/sub-iBAT7/TIFF images/SPARC_BAT7_Dorsal Lower Spine.tif',
-            'files/primary/sub-iBAT89/TIFF Images/SPARC_BAT89_Dorsal_Upper_Spine.tif': 'files/primary/sub-iBAT89/TIFF Images/SPARC_BAT89_Dorsal Upper Spine.tif',
-            'files/primary/sub-iBAT89/TIFF Images/SPARC_BAT89_Ventral_Lower_Spine.tif': 'files/primary/sub-iBAT89/TIFF Images/SPARC_BAT89_Ventral Lower Spine.tif',
-            'files/primary/sub-iBAT25/TIFF Images/SPARC_BAT25_Ventral_Lower_Spine.tif': 'files/primary/sub-iBAT25/TIFF Images/SPARC_BAT25_Ventral Lower Spine.tif',
-            'files/primary/sub-iBAT89/TIFF Images/SPARC_BAT89_Ventral_Upper_Spine.tif': 'files/primary/sub-iBAT89/TIFF Images/SPARC_BAT89_Ventral Upper Spine.tif',
-            'files/primary/sub-iBAT89/TIFF Images/SPARC_BAT89_Dorsal_Lower_Spine.tif': 'files/primary/sub-iBAT89/TIFF Images/SPARC_BAT89_Dorsal Lower Spine.tif',
-            'files/primary/sub-iBAT26/TIFF images/SPARC_BAT26_Dorsal_Lower_Spine.tif': 'files/primary/sub-iBAT26/TIFF images/SPARC_BAT26_Dorsal Lower Spine.tif',
-            'files/primary/sub-iBAT26/TIFF images/SPARC_BAT26_Dorsal_Upper_Spine.tif': 'files/primary/sub-iBAT26/TIFF images/SPARC_BAT26_Dorsal Upper Spine.tif',
-            'files/primary/sub-iBAT26/TIFF images/SPARC_BAT26_Ventral_Lower_Spine.tif': 'files/primary/sub-iBAT26/TIFF images/SPARC_BAT26_Ventral Lower Spine.tif',
-            'files/primary/sub-iBAT90/TIFF Images/SPARC_BAT90_Dorsal_Upper_Spine.tif': 'files/primary/sub-iBAT90/TIFF Images/SPARC_BAT90_Dorsal Upper Spine.tif',
-            'files/primary/sub-iBAT26/TIFF images/SPARC_BAT26_Ventral_Upper_Spine.tif': 'files/primary/sub-iBAT26/TIFF images/SPARC_BAT26_Ventral Upper Spine.tif',
-            'files/derivative/sub-iBAT87/SPARC_BAT87_Ventral_Upper_Spine.jpx': 'files/derivative/sub-iBAT87/SPARC_BAT87_Ventral Upper Spine.jpx',
-            'files/derivative/sub-iBAT87/AVI video files/sub-iBAT87_Ventral_Upper_Spine.mp4': 'files/derivative/sub-iBAT87/AVI video files/sub-iBAT87_Ventral Upper Spine.mp4',
-            'files/derivative/sub-iBAT87/manifest-bat87.xlsx': 'files/derivative/sub-iBAT87/manifest.xlsx',
-            'files/derivative/sub-iBAT87/SPARC_BAT87_Dorsal_Upper_Spine.jpx': 'files/derivative/sub-iBAT87/SPARC_BAT87_Dorsal Upper Spine.jpx',
-            'files/derivative/sub-iBAT88/AVI video files/sub-iBAT88_iBAT_side_1.mp4': 'files/derivative/sub-iBAT88/AVI video files/sub-iBAT88_iBAT_side 1.mp4',
-            'files/derivative/sub-iBAT88/AVI video files/sub-iBAT88_iBAT_side_2.mp4': 'files/derivative/sub-iBAT88/AVI video files/sub-iBAT88_iBAT_side 2.mp4',
-            'files/derivative/sub-iBAT88/AVI video files/sub-iBAT88_Ventral_Upper_Spine.mp4': 'files/derivative/sub-iBAT88/AVI video files/sub-iBAT88_Ventral Upper Spine.mp4',
-            'files/derivative/sub-iBAT3/SPARC_BAT3_Dorsal_Upper_Spine.jpx': 'files/derivative/sub-iBAT3/SPARC_BAT3_Dorsal Upper Spine.jpx',
-            'files/derivative/sub-iBAT3/manifest-bat3.xlsx': 'files/derivative/sub-iBAT3/manifest.xlsx',
-            'files/derivative/sub-iBAT3/SPARC_BAT3_Ventral_Upper_Spine.jpx': 'files/derivative/sub-iBAT3/SPARC_BAT3_Ventral Upper Spine.jpx',
-            'files/derivative/sub-iBAT3/SPARC_BAT3_Dorsal_Lower_Spine.jpx': 'files/derivative/sub-iBAT3/SPARC_BAT3_Dorsal Lower Spine.jpx',
-            'files/derivative/sub-iBAT3/AVI video files/sub-iBAT3_Ventral_Upper_Spine.mp4': 'files/derivative/sub-iBAT3/AVI video files/sub-iBAT3_Ventral Upper Spine.mp4',
-            'files/derivative/sub-iBAT7/SPARC_BAT7_Ventral_Lower_Spine.jpx': 'files/derivative/sub-iBAT7/SPARC_BAT7_Ventral Lower Spine.jpx',
-            'files/derivative/sub-iBAT7/SPARC_BAT7_Ventral_Upper_Spine.jpx': 'files/derivative/sub-iBAT7/SPARC_BAT7_Ventral Upper Spine.jpx',
-            'files/derivative/sub-iBAT7/SPARC_BAT7_Dorsal_Lower_Spine.jpx': 'files/derivative/sub-iBAT7/SPARC_BAT7_Dorsal Lower Spine.jpx',
-            'files/derivative/sub-iBAT14/AVI video files/sub-iBAT14_Ventral_Upper_Spine.mp4': 'files/derivative/sub-iBAT14/AVI video files/sub-iBAT14_Ventral Upper Spine.mp4',
-            'files/derivative/sub-iBAT7/manifest-bat7.xlsx': 'files/derivative/sub-iBAT7/manifest.xlsx',
-            'files/derivative/sub-iBAT7/SPARC_BAT7_Dorsal_Upper_Spine.jpx': 'files/derivative/sub-iBAT7/SPARC_BAT7_Dorsal Upper Spine.jpx',
-            'files/derivative/sub-iBAT90/AVI video files/sub-iBAT90_Ventral_Upper_Spine.mp4': 'files/derivative/sub-iBAT90/AVI video files/sub-iBAT90_Ventral Upper Spine.mp4',
-            'files/derivative/sub-iBAT26/AVI video files/sub-iBAT26_Ventral_Upper_Spine.mp4': 'files/derivative/sub-iBAT26/AVI video files/sub-iBAT26_Ventral Upper Spine.mp4',
-            'files/derivative/sub-iBAT90/AVI video files/sub-iBAT90_iBAT_side_2.mp4': 'files/derivative/sub-iBAT90/AVI video files/sub-iBAT90_iBAT side 2.mp4',
-            'files/derivative/sub-iBAT25/AVI video files/sub-iBAT25_Ventral_Upper_Spine.mp4': 'files/derivative/sub-iBAT25/AVI video files/sub-iBAT25_Ventral Upper Spine.mp4',
-            'files/derivative/sub-iBAT90/AVI video files/sub-iBAT90_iBAT_side_1.mp4': 'files/derivative/sub-iBAT90/AVI video files/sub-iBAT90_iBAT side 1.mp4',
-            'files/docs/PRVGFP_iBAT_labeling_checklist.xlsx': 'files/docs/PRVGFP_iBAT_labeling checklist.xlsx',
-            'files/docs/PRVGFP_iBAT_SCG_cell_counts.xlsx': 'files/docs/PRVGFP_iBAT_SCG cell counts.xlsx',
-            'files/protocol/Surgery_PRV-GFP_injection_into_iBAT_Protocol.io.docx': 'files/protocol/Surgery_PRV-GFP injection into iBAT_Protocol.io.docx',
-            'files/protocol/IDISCO_Protocol_Protocol.io.docx': 'files/protocol/IDISCO Protocol_Protocol.io.docx',
-            'files/protocol/Light_Sheet_Protocol_Protocol.io.docx': 'files/protocol/Light Sheet Protocol_Protocol.io.docx',
-            'files/derivative/sub-iBAT7/AVI video files/sub-iBAT7_Ventral_Upper_Spine.mp4': 'files/derivative/sub-iBAT7/AVI video files/sub-iBAT7_Ventral Upper Spine.mp4',
-            'files/docs/Neurite_Map_IGLEs.jpg': 'files/docs/Neurite Map IGLEs.jpg', 'files/primary/46_F_15021952/F_15021952.txt': 'files/primary/46_F_15021952/46_F_15021952.txt',
-            'files/primary/46_F_15021952/F_15021952_params.txt': 'files/primary/46_F_15021952/46_F_15021952_params.txt',
-            'files/primary/63_F_30051973/F_30051973_1_params.txt': 'files/primary/63_F_30051973/63_F_30051973_1_params.txt',
-            'files/primary/63_F_30051973/F_30051973_1.txt': 'files/primary/63_F_30051973/63_F_30051973_1.txt',
-            'files/primary/01_F_31071947/F_31071947.txt': 'files/primary/01_F_31071947/01_F_31071947.txt',
-            'files/primary/01_F_31071947/F_31071947_params.txt': 'files/primary/01_F_31071947/01_F_31071947_params.txt',
-            'files/docs/Description_of_data_files.docx': 'files/docs/Description of data files.docx',
-            'files/protocol/Human_colon_ex-vivo_protocol.docx': 'files/protocol/Human colon ex-vivo protocol.docx',
-            'files/primary/sub-16/sam-3/microscopy/sub-16_sam-3_R16-3Slide2p1MT20x.nd2': 'files/primary/sub-16/sam-3/microscopy/sub-16_sam-3_R16-3Slide2p1MT20x (1).nd2',
-            'files/primary/sub-16/sam-1/microscopy/sub-16_sam-1_Posterior_R16-1Slide2p1MT20x.tif': 'files/primary/sub-16/sam-1/microscopy/sub-16_sam-1_Posterior_R16-1Slide2p1MT20x (1).tif',
-            'files/primary/sub-16/sam-1/microscopy/sub-16_sam-1_Anterior_R16-1Slide2p1MT20x.tif': 'files/primary/sub-16/sam-1/microscopy/sub-16_sam-1_Anterior_R16-1Slide2p1MT20x (1).tif',
-            'files/primary/sub-16/sam-2/microscopy/sub-16_sam-2_R16-2Slide2p1MT20x.tif': 'files/primary/sub-16/sam-2/microscopy/sub-16_sam-2_R16-2Slide2p1MT20x (1).tif',
-            'files/primary/sub-25/sam-3/microscopy/sub-25_sam-3_R25-3Slide2P1MT20x.nd2': 'files/primary/sub-25/sam-3/microscopy/sub-25_sam-3_R25-3Slide2P1MT20x (1).nd2',
-            'files/primary/sub-18/sam-2/microscopy/sub-18_sam-2_R18-2Slide2p2MT20x.nd2': 'files/primary/sub-18/sam-2/microscopy/sub-18_sam-2_R18-2Slide2p2MT20x (1).nd2',
-            'files/primary/sub-18/sam-1/microscopy/sub-18_sam-1_R18-1Slide2p2MT20x.tif': 'files/primary/sub-18/sam-1/microscopy/sub-18_sam-1_R18-1Slide2p2MT20x (1).tif',
-            'files/primary/sub-25/sam-1/microscopy/sub-25_sam-1_Posterior_R25-1Slide2p1MT20x.tif': 'files/primary/sub-25/sam-1/microscopy/sub-25_sam-1_Posterior_R25-1Slide2p1MT20x (1).tif',
-            'files/primary/sub-25/sam-1/microscopy/sub-25_sam-1_Anterior_R25-1Slide1P1MT20x.tif': 'files/primary/sub-25/sam-1/microscopy/sub-25_sam-1_Anterior_R25-1Slide1P1MT20x (1).tif',
-            'files/primary/sub-25/sam-2/microscopy/sub-25_sam-2_R25-2Slide2P1MT20x.nd2': 'files/primary/sub-25/sam-2/microscopy/sub-25_sam-2_R25-2Slide2P1MT20x (1).nd2',
-            'files/primary/sub-21/sam-3/microscopy/sub-21_sam-3_R21-3Slide2p1MT20x.tif': 'files/primary/sub-21/sam-3/microscopy/sub-21_sam-3_R21-3Slide2p1MT20x (1).tif',
-            'files/primary/sub-21/sam-1/microscopy/sub-21_sam-1_Anterior_R21-1Slide2p1MT20x.nd2': 'files/primary/sub-21/sam-1/microscopy/sub-21_sam-1_Anterior_R21-1Slide2p1MT20x (1).nd2',
-            'files/primary/sub-21/sam-1/microscopy/sub-21_sam-1_Posterior_R21-1Slide2p1MT20x.nd2': 'files/primary/sub-21/sam-1/microscopy/sub-21_sam-1_Posterior_R21-1Slide2p1MT20x (1).nd2',
-            'files/primary/sub-21/sam-2/microscopy/sub-21_sam-2_R21-2Slide2p1MT20x.tif': 'files/primary/sub-21/sam-2/microscopy/sub-21_sam-2_R21-2Slide2p1MT20x (1).tif',
-            'files/primary/sub-20/sam-1/microscopy/sub-20_sam-1_Anterior_R20-1Slide2p3MT20x.nd2': 'files/primary/sub-20/sam-1/microscopy/sub-20_sam-1_Anterior_R20-1Slide2p3MT20x (1).nd2',
-            'files/primary/sub-20/sam-3/microscopy/sub-20_sam-3_R20-3Slide2p1MT20x.nd2': 'files/primary/sub-20/sam-3/microscopy/sub-20_sam-3_R20-3Slide2p1MT20x (1).nd2',
-            'files/primary/sub-20/sam-1/microscopy/sub-20_sam-1_Posterior_R20-1Slide2p3MT20x.nd2': 'files/primary/sub-20/sam-1/microscopy/sub-20_sam-1_Posterior_R20-1Slide2p3MT20x (1).nd2',
-            'files/primary/sub-20/sam-2/microscopy/sub-20_sam-2_R20-2Slide2p2MT20x.tif': 'files/primary/sub-20/sam-2/microscopy/sub-20_sam-2_R20-2Slide2p2MT20x (1).tif',
-            'files/primary/sub-26/sam-1/microscopy/sub-26_sam-1_Posterior_R26-1Slide2p1MT20x.nd2': 'files/primary/sub-26/sam-1/microscopy/sub-26_sam-1_Posterior_R26-1Slide2p1MT20x (1).nd2',
-            'files/primary/sub-26/sam-1/microscopy/sub-26_sam-1_Anterior_R26-1Slide2P4MT20x.nd2': 'files/primary/sub-26/sam-1/microscopy/sub-26_sam-1_Anterior_R26-1Slide2P4MT20x (1).nd2',
-            'files/primary/sub-17/sam-3/microscopy/sub-17_sam-3_R17-3Slide2p2MT20x.tif': 'files/primary/sub-17/sam-3/microscopy/sub-17_sam-3_R17-3Slide2p2MT20x (1).tif',
-            'files/primary/sub-17/sam-1/microscopy/sub-17_sam-1_Posterior_R17-1Slide2p1MT20x.nd2': 'files/primary/sub-17/sam-1/microscopy/sub-17_sam-1_Posterior_R17-1Slide2p1MT20x (1).nd2',
-            'files/primary/sub-17/sam-1/microscopy/sub-17_sam-1_Anterior_R17-1slide2p1MT20x.nd2': 'files/primary/sub-17/sam-1/microscopy/sub-17_sam-1_Anterior_R17-1slide2p1MT20x (1).nd2',
-            'files/primary/sub-17/sam-2/microscopy/sub-17_sam-2_R17-2Slide2p2MT20x.tif': 'files/primary/sub-17/sam-2/microscopy/sub-17_sam-2_R17-2Slide2p2MT20x (1).tif',
-            'files/primary/sub-24/sam-3/microscopy/sub-24_sam-3_R24-3Slide2P1MT20x.tif': 'files/primary/sub-24/sam-3/microscopy/sub-24_sam-3_R24-3Slide2P1MT20x (1).tif',
-            'files/primary/sub-24/sam-1/microscopy/sub-24_sam-1_Anterior_R24-1Slide2P1MT20x.nd2': 'files/primary/sub-24/sam-1/microscopy/sub-24_sam-1_Anterior_R24-1Slide2P1MT20x (1).nd2',
-            'files/primary/sub-24/sam-1/microscopy/sub-24_sam-1_Posterior_R24-1Slide2P1MT20x.tif': 'files/primary/sub-24/sam-1/microscopy/sub-24_sam-1_Posterior_R24-1Slide2P1MT20x (1).tif',
-            'files/primary/sub-24/sam-2/microscopy/sub-24_sam-2_R24-2Slide2P1MT20x.tif': 'files/primary/sub-24/sam-2/microscopy/sub-24_sam-2_R24-2Slide2P1MT20x (1).tif',
-            'files/primary/sub-23/sam-3/microscopy/sub-23_sam-3_R23-3Slide2P1MT20x.tif': 'files/primary/sub-23/sam-3/microscopy/sub-23_sam-3_R23-3Slide2P1MT20x (1).tif',
-            'files/primary/sub-23/sam-1/microscopy/sub-23_sam-1_Anterior_R23-1Slide2P1MT20x.tif': 'files/primary/sub-23/sam-1/microscopy/sub-23_sam-1_Anterior_R23-1Slide2P1MT20x (1).tif',
-            'files/primary/sub-23/sam-1/microscopy/sub-23_sam-1_Posterior_R23-1Slide2P1MT20x.nd2': 'files/primary/sub-23/sam-1/microscopy/sub-23_sam-1_Posterior_R23-1Slide2P1MT20x (1).nd2',
-            'files/primary/sub-23/sam-2/microscopy/sub-23_sam-2_R23-2Slide2P1MT20x.tif': 'files/primary/sub-23/sam-2/microscopy/sub-23_sam-2_R23-2Slide2P1MT20x (1).tif',
-            'files/primary/sub-22/sam-3/microscopy/sub-22_sam-3_R22-3Slide2p1MT20x.tif': 'files/primary/sub-22/sam-3/microscopy/sub-22_sam-3_R22-3Slide2p1MT20x (1).tif',
-            'files/primary/sub-22/sam-1/microscopy/sub-22_sam-1_Anterior_R22-1Slide14p1.tif': 'files/primary/sub-22/sam-1/microscopy/sub-22_sam-1_Anterior_R22-1Slide14p1 (1).tif',
-            'files/primary/sub-22/sam-2/microscopy/sub-22_sam-2_R22-2Slide2p1MT20x.nd2': 'files/primary/sub-22/sam-2/microscopy/sub-22_sam-2_R22-2Slide2p1MT20x (1).nd2',
-            'files/primary/sub-cat7/sam-2_cat7/DamaserSPARC_Cat 7.2 Day 14 UDS trial 2 4%25-4_23_2019-10_45_04 AM.dat.csv': 'files/primary/sub-cat7/sam-2_cat7/DamaserSPARC_Cat 7.2 Day 14 UDS trial 2 4%25-4_23_2019-10_45_04 AM.dat',
-            'files/primary/sub-cat8/sam-mult_cat8/DamaserSPARC_Cat8 3 days post op ambulatory-9_26_2019-2_43_24 PM.tsv.csv': 'files/primary/sub-cat8/sam-mult_cat8/DamaserSPARC_Cat8 3 days post op ambulatory-9_26_2019-2_43_24 PM.tsv',
-            'files/primary/sub-cat8/sam-mult_cat8/DamaserSPARC_Cat8 11 days post op 10-4-19-10_4_2019-12_53_25 PM.tsv.csv': 'files/primary/sub-cat8/sam-mult_cat8/DamaserSPARC_Cat8 11 days post op 10-4-19-10_4_2019-12_53_25 PM.tsv',
-            'files/primary/sub-cat7/sam-2_cat7/DamaserSPARC_Cat 7.2 Day 14 UDS trial 1 4%25-4_23_2019-10_15_08 AM.dat.csv': 'files/primary/sub-cat7/sam-2_cat7/DamaserSPARC_Cat 7.2 Day 14 UDS trial 1 4%25-4_23_2019-10_15_08 AM.dat',
-            'files/derivative/sub-cat7/sam-2_cat7/DamaserSPARC_Cat 7.2 Day 14 UDS trial 1 4%25-4_23_2019-10_15_08 AM.xlsx': 'files/derivative/sub-cat7/sam-2_cat7/DamaserSPARC_Cat 7.2 Day 14 UDS trial 1 4%25-4_23_2019-10_15_08 AM',
-            'files/derivative/sub-cat7/sam-2_cat7/Fluoro Cat 7.2 bladder%2C device%2Ccoil3.jpg': 'files/derivative/sub-cat7/sam-2_cat7/Fluoro Cat 7.2 bladder%2C device%2Ccoil3',
-            'files/derivative/sub-cat7/sam-2_cat7/Fluoro Cat 7.2 bladder%2C device.jpg': 'files/derivative/sub-cat7/sam-2_cat7/Fluoro Cat 7.2 bladder%2C device',
-            'files/derivative/sub-cat7/sam-2_cat7/Fluoro Cat 7.2 bladder%2C device%2Ccoil2.jpg': 'files/derivative/sub-cat7/sam-2_cat7/Fluoro Cat 7.2 bladder%2C device%2Ccoil2',
-            'files/derivative/sub-cat7/sam-2_cat7/Fluoro Cat 7.2 bladder%2C device side view.jpg': 'files/derivative/sub-cat7/sam-2_cat7/Fluoro Cat 7.2 bladder%2C device side view',
-            'files/derivative/sub-cat7/sam-2_cat7/DamaserSPARC_Cat 7.2 Day 14 UDS trial 2 4%25-4_23_2019-10_45_04 AM.xlsx': 'files/derivative/sub-cat7/sam-2_cat7/DamaserSPARC_Cat 7.2 Day 14 UDS trial 2 4%25-4_23_2019-10_45_04 AM',
-            'files/derivative/sub-cat7/sam-3_cat7/Fluoro Cat 7.3 bladder%2C UroMOCA side view.jpg': 'files/derivative/sub-cat7/sam-3_cat7/Fluoro Cat 7.3 bladder%2C UroMOCA side view',
-            'files/derivative/sub-cat7/sam-3_cat7/Fluoro Cat 7.3 bladder%2C UroMOCA.jpg': 'files/derivative/sub-cat7/sam-3_cat7/Fluoro Cat 7.3 bladder%2C UroMOCA',
-            'files/primary/sub-keastlab-r18-291/czi/sam-20180718-NW-cFos-th-010_.czi': 'files/primary/sub-keastlab-r18-291/czi/sam-20180718-NW-cFos-th-010.czi',
-            'files/derivative/sub-keastlab-r19-421/sam-20190403-NW-cFos-egr1-01.tif': 'files/derivative/sub-keastlab-r19-421/sam-20190403-NW-cFos-egr1-01 (1).tif',
-            'files/derivative/sub-keastlab-r19-421/sam-20190403-NW-cFos-egr1-15.tif': 'files/derivative/sub-keastlab-r19-421/sam-20190403-NW-cFos-egr1-15 (1).tif',
-            'files/derivative/sub-keastlab-r19-421/sam-20190403-NW-cFos-egr1-17.tif': 'files/derivative/sub-keastlab-r19-421/sam-20190403-NW-cFos-egr1-17 (1).tif',
-            'files/derivative/sub-keastlab-r19-421/sam-20190403-NW-cFos-egr1-10.tif': 'files/derivative/sub-keastlab-r19-421/sam-20190403-NW-cFos-egr1-10 (1).tif',
-            'files/derivative/sub-keastlab-r19-421/sam-20190403-NW-cFos-egr1-05.tif': 'files/derivative/sub-keastlab-r19-421/sam-20190403-NW-cFos-egr1-05 (1).tif',
-            'files/derivative/sub-keastlab-r19-421/sam-20190403-NW-cFos-egr1-12.tif': 'files/derivative/sub-keastlab-r19-421/sam-20190403-NW-cFos-egr1-12 (1).tif',
-            'files/derivative/sub-keastlab-r19-421/sam-20190403-NW-cFos-egr1-18.tif': 'files/derivative/sub-keastlab-r19-421/sam-20190403-NW-cFos-egr1-18 (1).tif',
-            'files/derivative/sub-keastlab-r19-421/sam-20190403-NW-cFos-egr1-08.tif': 'files/derivative/sub-keastlab-r19-421/sam-20190403-NW-cFos-egr1-08 (1).tif',
-            'files/derivative/sub-keastlab-r19-421/sam-20190403-NW-cFos-egr1-03.tif': 'files/derivative/sub-keastlab-r19-421/sam-20190403-NW-cFos-egr1-03 (1).tif',
-            'files/derivative/sub-keastlab-r19-421/sam-20190403-NW-cFos-egr1-19.tif': 'files/derivative/sub-keastlab-r19-421/sam-20190403-NW-cFos-egr1-19 (1).tif',
-            'files/derivative/sub-keastlab-r19-421/sam-20190403-NW-cFos-egr1-11.tif': 'files/derivative/sub-keastlab-r19-421/sam-20190403-NW-cFos-egr1-11 (1).tif',
-            'files/derivative/sub-keastlab-r19-421/sam-20190403-NW-cFos-egr1-04.jp2': 'files/derivative/sub-keastlab-r19-421/sam-20190403-NW-cFos-egr1-04 (1).jp2',
-            'files/derivative/sub-keastlab-r19-421/sam-20190403-NW-cFos-egr1-20.tif': 'files/derivative/sub-keastlab-r19-421/sam-20190403-NW-cFos-egr1-20 (1).tif',
-            'files/derivative/sub-keastlab-r19-421/sam-20190403-NW-cFos-egr1-02.tif': 'files/derivative/sub-keastlab-r19-421/sam-20190403-NW-cFos-egr1-02 (1).tif',
-            'files/derivative/sub-keastlab-r19-421/sam-20190403-NW-cFos-egr1-06.tif': 'files/derivative/sub-keastlab-r19-421/sam-20190403-NW-cFos-egr1-06 (1).tif',
-            'files/derivative/sub-keastlab-r19-421/sam-20190403-NW-cFos-egr1-13.tif': 'files/derivative/sub-keastlab-r19-421/sam-20190403-NW-cFos-egr1-13 (1).tif',
-            'files/derivative/sub-keastlab-r19-421/sam-20190403-NW-cFos-egr1-14.tif': 'files/derivative/sub-keastlab-r19-421/sam-20190403-NW-cFos-egr1-14 (1).tif',
-            'files/derivative/sub-keastlab-r19-421/sam-20190403-NW-cFos-egr1-09.tif': 'files/derivative/sub-keastlab-r19-421/sam-20190403-NW-cFos-egr1-09 (1).tif',
-            'files/derivative/sub-keastlab-r19-421/sam-20190403-NW-cFos-egr1-07.tif': 'files/derivative/sub-keastlab-r19-421/sam-20190403-NW-cFos-egr1-07 (1).tif',
-            'files/derivative/sub-keastlab-r19-421/sam-20190403-NW-cFos-egr1-16.tif': 'files/derivative/sub-keastlab-r19-421/sam-20190403-NW-cFos-egr1-16 (1).tif',
-            'files/derivative/sub-keastlab-r19-425/sam-20190401-NW-cFos-egr1-02.tif': 'files/derivative/sub-keastlab-r19-425/sam-20190401-NW-cFos-egr1-02 (1).tif',
-            'files/derivative/sub-keastlab-r19-425/sam-20190401-NW-cFos-egr1-03.tif': 'files/derivative/sub-keastlab-r19-425/sam-20190401-NW-cFos-egr1-03 (1).tif',
-            'files/derivative/sub-keastlab-r19-425/sam-20190401-NW-cFos-egr1-14.tif': 'files/derivative/sub-keastlab-r19-425/sam-20190401-NW-cFos-egr1-14 (1).tif',
-            'files/derivative/sub-keastlab-r19-425/sam-20190401-NW-cFos-egr1-06.tif': 'files/derivative/sub-keastlab-r19-425/sam-20190401-NW-cFos-egr1-06 (1).tif',
-            'files/derivative/sub-keastlab-r19-425/sam-20190401-NW-cFos-egr1-11.tif': 'files/derivative/sub-keastlab-r19-425/sam-20190401-NW-cFos-egr1-11 (1).tif',
-            'files/derivative/sub-keastlab-r19-425/sam-20190401-NW-cFos-egr1-04.jp2': 'files/derivative/sub-keastlab-r19-425/sam-20190401-NW-cFos-egr1-04 (1).jp2',
-            'files/derivative/sub-keastlab-r19-425/sam-20190401-NW-cFos-egr1-16.tif': 'files/derivative/sub-keastlab-r19-425/sam-20190401-NW-cFos-egr1-16 (1).tif',
-            'files/derivative/sub-keastlab-r19-425/sam-20190401-NW-cFos-egr1-15.tif': 'files/derivative/sub-keastlab-r19-425/sam-20190401-NW-cFos-egr1-15 (1).tif',
-            'files/derivative/sub-keastlab-r19-425/sam-20190401-NW-cFos-egr1-18.tif': 'files/derivative/sub-keastlab-r19-425/sam-20190401-NW-cFos-egr1-18 (1).tif',
-            'files/derivative/sub-keastlab-r19-425/sam-20190401-NW-cFos-egr1-13.tif': 'files/derivative/sub-keastlab-r19-425/sam-20190401-NW-cFos-egr1-13 (1).tif',
-            'files/derivative/sub-keastlab-r19-425/sam-20190401-NW-cFos-egr1-08.tif': 'files/derivative/sub-keastlab-r19-425/sam-20190401-NW-cFos-egr1-08 (1).tif',
-            'files/derivative/sub-keastlab-r19-425/sam-20190401-NW-cFos-egr1-07.tif': 'files/derivative/sub-keastlab-r19-425/sam-20190401-NW-cFos-egr1-07 (1).tif',
-            'files/derivative/sub-keastlab-r19-425/sam-20190401-NW-cFos-egr1-01.tif': 'files/derivative/sub-keastlab-r19-425/sam-20190401-NW-cFos-egr1-01 (1).tif',
-            'files/derivative/sub-keastlab-r19-425/sam-20190401-NW-cFos-egr1-17.tif': 'files/derivative/sub-keastlab-r19-425/sam-20190401-NW-cFos-egr1-17 (1).tif',
-            'files/derivative/sub-keastlab-r19-425/sam-20190401-NW-cFos-egr1-10.tif': 'files/derivative/sub-keastlab-r19-425/sam-20190401-NW-cFos-egr1-10 (1).tif',
-            'files/derivative/sub-keastlab-r19-425/sam-20190401-NW-cFos-egr1-12.tif': 'files/derivative/sub-keastlab-r19-425/sam-20190401-NW-cFos-egr1-12 (1).tif',
-            'files/derivative/sub-keastlab-r19-425/sam-20190401-NW-cFos-egr1-05.tif': 'files/derivative/sub-keastlab-r19-425/sam-20190401-NW-cFos-egr1-05 (1).tif',
-            'files/derivative/sub-keastlab-r18-314/sam-20180907-NW-cFos-egr1-19.tif': 'files/derivative/sub-keastlab-r18-314/sam-20180907-NW-cFos-egr1-19 (1).tif',
-            'files/derivative/sub-keastlab-r19-425/sam-20190401-NW-cFos-egr1-09.tif': 'files/derivative/sub-keastlab-r19-425/sam-20190401-NW-cFos-egr1-09 (1).tif',
-            'files/derivative/sub-keastlab-r18-314/sam-20180907-NW-cFos-egr1-02.tif': 'files/derivative/sub-keastlab-r18-314/sam-20180907-NW-cFos-egr1-02 (1).tif',
-            'files/derivative/sub-keastlab-r18-314/sam-20180907-NW-cFos-egr1-10.tif': 'files/derivative/sub-keastlab-r18-314/sam-20180907-NW-cFos-egr1-10 (1).tif',
-            'files/derivative/sub-keastlab-r18-314/sam-20180907-NW-cFos-egr1-11.tif': 'files/derivative/sub-keastlab-r18-314/sam-20180907-NW-cFos-egr1-11 (1).tif',
-            'files/derivative/sub-keastlab-r18-314/sam-20180907-NW-cFos-egr1-01.tif': 'files/derivative/sub-keastlab-r18-314/sam-20180907-NW-cFos-egr1-01 (1).tif',
-            'files/derivative/sub-keastlab-r18-314/sam-20180907-NW-cFos-egr1-18.tif': 'files/derivative/sub-keastlab-r18-314/sam-20180907-NW-cFos-egr1-18 (1).tif',
-            'files/derivative/sub-keastlab-r18-314/sam-20180907-NW-cFos-egr1-03.tif': 'files/derivative/sub-keastlab-r18-314/sam-20180907-NW-cFos-egr1-03 (1).tif',
-            'files/derivative/sub-keastlab-r18-314/sam-20180907-NW-cFos-egr1-15.tif': 'files/derivative/sub-keastlab-r18-314/sam-20180907-NW-cFos-egr1-15 (1).tif',
-            'files/derivative/sub-keastlab-r18-314/sam-20180907-NW-cFos-egr1-07.tif': 'files/derivative/sub-keastlab-r18-314/sam-20180907-NW-cFos-egr1-07 (1).tif',
-            'files/derivative/sub-keastlab-r18-314/sam-20180907-NW-cFos-egr1-16.tif': 'files/derivative/sub-keastlab-r18-314/sam-20180907-NW-cFos-egr1-16 (1).tif',
-            'files/derivative/sub-keastlab-r18-314/sam-20180907-NW-cFos-egr1-09.tif': 'files/derivative/sub-keastlab-r18-314/sam-20180907-NW-cFos-egr1-09 (1).tif',
-            'files/derivative/sub-keastlab-r18-314/sam-20180907-NW-cFos-egr1-08.tif': 'files/derivative/sub-keastlab-r18-314/sam-20180907-NW-cFos-egr1-08 (1).tif',
-            'files/derivative/sub-keastlab-r18-314/sam-20180907-NW-cFos-egr1-14.tif': 'files/derivative/sub-keastlab-r18-314/sam-20180907-NW-cFos-egr1-14 (1).tif',
-            'files/derivative/sub-keastlab-r18-314/sam-20180907-NW-cFos-egr1-04.tif': 'files/derivative/sub-keastlab-r18-314/sam-20180907-NW-cFos-egr1-04 (1).tif',
-            'files/derivative/sub-keastlab-r18-314/sam-20180907-NW-cFos-egr1-12.tif': 'files/derivative/sub-keastlab-r18-314/sam-20180907-NW-cFos-egr1-12 (1).tif',
-            'files/derivative/sub-keastlab-r18-314/sam-20180907-NW-cFos-egr1-05.tif': 'files/derivative/sub-keastlab-r18-314/sam-20180907-NW-cFos-egr1-05 (1).tif',
-            'files/derivative/sub-keastlab-r18-314/sam-20180907-NW-cFos-egr1-17.tif': 'files/derivative/sub-keastlab-r18-314/sam-20180907-NW-cFos-egr1-17 (1).tif',
-            'files/derivative/sub-keastlab-r18-314/sam-20180907-NW-cFos-egr1-13.tif': 'files/derivative/sub-keastlab-r18-314/sam-20180907-NW-cFos-egr1-13 (1).tif',
-            'files/derivative/sub-keastlab-r18-314/sam-20180907-NW-cFos-egr1-06.tif': 'files/derivative/sub-keastlab-r18-314/sam-20180907-NW-cFos-egr1-06 (1).tif',
-            'files/derivative/sub-keastlab-r19-420/sam-20190403-NW-cFos-egr1-37.tif': 'files/derivative/sub-keastlab-r19-420/sam-20190403-NW-cFos-egr1-37 (1).tif',
-            'files/derivative/sub-keastlab-r19-420/sam-20190403-NW-cFos-egr1-23.tif': 'files/derivative/sub-keastlab-r19-420/sam-20190403-NW-cFos-egr1-23 (1).tif',
-            'files/derivative/sub-keastlab-r19-420/sam-20190403-NW-cFos-egr1-36.tif': 'files/derivative/sub-keastlab-r19-420/sam-20190403-NW-cFos-egr1-36 (1).tif',
-            'files/derivative/sub-keastlab-r19-420/sam-20190403-NW-cFos-egr1-33.tif': 'files/derivative/sub-keastlab-r19-420/sam-20190403-NW-cFos-egr1-33 (1).tif',
-            'files/derivative/sub-keastlab-r19-420/sam-20190403-NW-cFos-egr1-24.tif': 'files/derivative/sub-keastlab-r19-420/sam-20190403-NW-cFos-egr1-24 (1).tif',
-            'files/derivative/sub-keastlab-r19-420/sam-20190403-NW-cFos-egr1-21.tif': 'files/derivative/sub-keastlab-r19-420/sam-20190403-NW-cFos-egr1-21 (1).tif',
-            'files/derivative/sub-keastlab-r19-420/sam-20190403-NW-cFos-egr1-39.tif': 'files/derivative/sub-keastlab-r19-420/sam-20190403-NW-cFos-egr1-39 (1).tif',
-            'files/derivative/sub-keastlab-r19-420/sam-20190403-NW-cFos-egr1-40.tif': 'files/derivative/sub-keastlab-r19-420/sam-20190403-NW-cFos-egr1-40 (1).tif',
-            'files/derivative/sub-keastlab-r19-420/sam-20190403-NW-cFos-egr1-27.tif': 'files/derivative/sub-keastlab-r19-420/sam-20190403-NW-cFos-egr1-27 (1).tif',
-            'files/derivative/sub-keastlab-r19-420/sam-20190403-NW-cFos-egr1-29.tif': 'files/derivative/sub-keastlab-r19-420/sam-20190403-NW-cFos-egr1-29 (1).tif',
-            'files/derivative/sub-keastlab-r19-420/sam-20190403-NW-cFos-egr1-25.tif': 'files/derivative/sub-keastlab-r19-420/sam-20190403-NW-cFos-egr1-25 (1).tif',
-            'files/derivative/sub-keastlab-r19-420/sam-20190403-NW-cFos-egr1-38.tif': 'files/derivative/sub-keastlab-r19-420/sam-20190403-NW-cFos-egr1-38 (1).tif',
-            'files/derivative/sub-keastlab-r19-420/sam-20190403-NW-cFos-egr1-28.tif': 'files/derivative/sub-keastlab-r19-420/sam-20190403-NW-cFos-egr1-28 (1).tif',
-            'files/derivative/sub-keastlab-r19-420/sam-20190403-NW-cFos-egr1-34.tif': 'files/derivative/sub-keastlab-r19-420/sam-20190403-NW-cFos-egr1-34 (1).tif',
-            'files/derivative/sub-keastlab-r19-420/sam-20190403-NW-cFos-egr1-31.tif': 'files/derivative/sub-keastlab-r19-420/sam-20190403-NW-cFos-egr1-31 (1).tif',
-            'files/derivative/sub-keastlab-r19-420/sam-20190403-NW-cFos-egr1-35.tif': 'files/derivative/sub-keastlab-r19-420/sam-20190403-NW-cFos-egr1-35 (1).tif',
-            'files/derivative/sub-keastlab-r19-420/sam-20190403-NW-cFos-egr1-30.tif': 'files/derivative/sub-keastlab-r19-420/sam-20190403-NW-cFos-egr1-30 (1).tif',
-            'files/derivative/sub-keastlab-r19-420/sam-20190403-NW-cFos-egr1-22.tif': 'files/derivative/sub-keastlab-r19-420/sam-20190403-NW-cFos-egr1-22 (1).tif',
-            'files/derivative/sub-keastlab-r19-420/sam-20190403-NW-cFos-egr1-26.tif': 'files/derivative/sub-keastlab-r19-420/sam-20190403-NW-cFos-egr1-26 (1).tif',
-            'files/derivative/sub-keastlab-r19-420/sam-20190403-NW-cFos-egr1-32.tif': 'files/derivative/sub-keastlab-r19-420/sam-20190403-NW-cFos-egr1-32 (1).tif',
-            'files/derivative/sub-keastlab-r17-179/sam-20190125-NW-cFos-th-24.tif': 'files/derivative/sub-keastlab-r17-179/sam-20190125-NW-cFos-th-24 (1).tif',
-            'files/derivative/sub-keastlab-r17-179/sam-20190206-NW-cFos-pax2-16.tif': 'files/derivative/sub-keastlab-r17-179/sam-20190206-NW-cFos-pax2-16 (1).tif',
-            'files/derivative/sub-keastlab-r17-179/sam-20190206-NW-cFos-pax2-13.tif': 'files/derivative/sub-keastlab-r17-179/sam-20190206-NW-cFos-pax2-13 (1).tif',
-            'files/derivative/sub-keastlab-r17-179/sam-20190206-NW-cFos-pax2-15.tif': 'files/derivative/sub-keastlab-r17-179/sam-20190206-NW-cFos-pax2-15 (1).tif',
-            'files/derivative/sub-keastlab-r17-179/sam-20190206-NW-cFos-pax2-09.tif': 'files/derivative/sub-keastlab-r17-179/sam-20190206-NW-cFos-pax2-09 (1).tif',
-            'files/derivative/sub-keastlab-r17-179/sam-20190206-NW-cFos-pax2-07.tif': 'files/derivative/sub-keastlab-r17-179/sam-20190206-NW-cFos-pax2-07 (1).tif',
-            'files/derivative/sub-keastlab-r17-179/sam-20190206-NW-cFos-pax2-14.tif': 'files/derivative/sub-keastlab-r17-179/sam-20190206-NW-cFos-pax2-14 (1).tif',
-            'files/derivative/sub-keastlab-r17-179/sam-20190125-NW-cFos-th-28.tif': 'files/derivative/sub-keastlab-r17-179/sam-20190125-NW-cFos-th-28 (1).tif',
-            'files/derivative/sub-keastlab-r17-179/sam-20190206-NW-cFos-pax2-11.tif': 'files/derivative/sub-keastlab-r17-179/sam-20190206-NW-cFos-pax2-11 (1).tif',
-            'files/derivative/sub-keastlab-r17-179/sam-20190206-NW-cFos-pax2-19.jp2': 'files/derivative/sub-keastlab-r17-179/sam-20190206-NW-cFos-pax2-19 (1).jp2',
-            'files/derivative/sub-keastlab-r17-179/sam-20190206-NW-cFos-pax2-21.tif': 'files/derivative/sub-keastlab-r17-179/sam-20190206-NW-cFos-pax2-21 (1).tif',
-            'files/derivative/sub-keastlab-r17-179/sam-20190206-NW-cFos-pax2-10.tif': 'files/derivative/sub-keastlab-r17-179/sam-20190206-NW-cFos-pax2-10 (1).tif',
-            'files/derivative/sub-keastlab-r17-179/sam-20190125-NW-cFos-th-22.tif': 'files/derivative/sub-keastlab-r17-179/sam-20190125-NW-cFos-th-22 (1).tif',
-            'files/derivative/sub-keastlab-r17-179/sam-20190125-NW-cFos-th-40.tif': 'files/derivative/sub-keastlab-r17-179/sam-20190125-NW-cFos-th-40 (1).tif',
-            'files/derivative/sub-keastlab-r17-179/sam-20190206-NW-cFos-pax2-18.tif': 'files/derivative/sub-keastlab-r17-179/sam-20190206-NW-cFos-pax2-18 (1).tif',
-            'files/derivative/sub-keastlab-r17-179/sam-20190206-NW-cFos-pax2-17.tif': 'files/derivative/sub-keastlab-r17-179/sam-20190206-NW-cFos-pax2-17 (1).tif',
-            'files/derivative/sub-keastlab-r17-179/sam-20190206-NW-cFos-pax2-23.tif': 'files/derivative/sub-keastlab-r17-179/sam-20190206-NW-cFos-pax2-23 (1).tif',
-            'files/derivative/sub-keastlab-r17-179/sam-20190125-NW-cFos-th-26.tif': 'files/derivative/sub-keastlab-r17-179/sam-20190125-NW-cFos-th-26 (1).tif',
-            'files/derivative/sub-keastlab-r17-179/sam-20190206-NW-cFos-pax2-22.tif': 'files/derivative/sub-keastlab-r17-179/sam-20190206-NW-cFos-pax2-22 (1).tif',
-            'files/derivative/sub-keastlab-r17-179/sam-20190125-NW-cFos-th-18.tif': 'files/derivative/sub-keastlab-r17-179/sam-20190125-NW-cFos-th-18 (1).tif',
-            'files/derivative/sub-keastlab-r17-179/sam-20190206-NW-cFos-pax2-24.tif': 'files/derivative/sub-keastlab-r17-179/sam-20190206-NW-cFos-pax2-24 (1).tif',
-            'files/derivative/sub-keastlab-r17-179/sam-20190125-NW-cFos-th-20.tif': 'files/derivative/sub-keastlab-r17-179/sam-20190125-NW-cFos-th-20 (1).tif',
-            'files/derivative/sub-keastlab-r17-179/sam-20190125-NW-cFos-th-30.tif': 'files/derivative/sub-keastlab-r17-179/sam-20190125-NW-cFos-th-30 (1).tif',
-            'files/derivative/sub-keastlab-r17-179/sam-20190206-NW-cFos-pax2-08.tif': 'files/derivative/sub-keastlab-r17-179/sam-20190206-NW-cFos-pax2-08 (1).tif',
-            'files/derivative/sub-keastlab-r17-179/sam-20190206-NW-cFos-pax2-12.tif': 'files/derivative/sub-keastlab-r17-179/sam-20190206-NW-cFos-pax2-12 (1).tif',
-            'files/derivative/sub-keastlab-r17-179/sam-20190206-NW-cFos-pax2-06.tif': 'files/derivative/sub-keastlab-r17-179/sam-20190206-NW-cFos-pax2-06 (1).tif',
-            'files/derivative/sub-keastlab-r17-179/sam-20190125-NW-cFos-th-16.tif': 'files/derivative/sub-keastlab-r17-179/sam-20190125-NW-cFos-th-16 (1).tif',
-            'files/derivative/sub-keastlab-r17-179/sam-20190125-NW-cFos-th-14.tif': 'files/derivative/sub-keastlab-r17-179/sam-20190125-NW-cFos-th-14 (1).tif',
-            'files/derivative/sub-keastlab-r18-382/sam-20181120-NW-cFos-egr1-07.tif': 'files/derivative/sub-keastlab-r18-382/sam-20181120-NW-cFos-egr1-07 (1).tif',
-            'files/derivative/sub-keastlab-r18-382/sam-20181120-NW-cFos-egr1-11.tif': 'files/derivative/sub-keastlab-r18-382/sam-20181120-NW-cFos-egr1-11 (1).tif',
-            'files/derivative/sub-keastlab-r18-382/sam-20181120-NW-cFos-egr1-17.tif': 'files/derivative/sub-keastlab-r18-382/sam-20181120-NW-cFos-egr1-17 (1).tif',
-            'files/derivative/sub-keastlab-r18-382/sam-20181120-NW-cFos-egr1-10.tif': 'files/derivative/sub-keastlab-r18-382/sam-20181120-NW-cFos-egr1-10 (1).tif',
-            'files/derivative/sub-keastlab-r17-179/sam-20190206-NW-cFos-pax2-20.tif': 'files/derivative/sub-keastlab-r17-179/sam-20190206-NW-cFos-pax2-20 (1).tif',
-            'files/derivative/sub-keastlab-r18-382/sam-20181120-NW-cFos-egr1-08.tif': 'files/derivative/sub-keastlab-r18-382/sam-20181120-NW-cFos-egr1-08 (1).tif',
-            'files/derivative/sub-keastlab-r18-382/sam-20181120-NW-cFos-egr1-04.tif': 'files/derivative/sub-keastlab-r18-382/sam-20181120-NW-cFos-egr1-04 (1).tif',
-            'files/derivative/sub-keastlab-r18-382/sam-20181120-NW-cFos-egr1-03.tif': 'files/derivative/sub-keastlab-r18-382/sam-20181120-NW-cFos-egr1-03 (1).tif',
-            'files/derivative/sub-keastlab-r18-382/sam-20181120-NW-cFos-egr1-09.tif': 'files/derivative/sub-keastlab-r18-382/sam-20181120-NW-cFos-egr1-09 (1).tif',
-            'files/derivative/sub-keastlab-r18-382/sam-20181120-NW-cFos-egr1-02.tif': 'files/derivative/sub-keastlab-r18-382/sam-20181120-NW-cFos-egr1-02 (1).tif',
-            'files/derivative/sub-keastlab-r18-382/sam-20181120-NW-cFos-egr1-15.tif': 'files/derivative/sub-keastlab-r18-382/sam-20181120-NW-cFos-egr1-15 (1).tif',
-            'files/derivative/sub-keastlab-r18-382/sam-20181120-NW-cFos-egr1-06.jp2': 'files/derivative/sub-keastlab-r18-382/sam-20181120-NW-cFos-egr1-06 (1).jp2',
-            'files/derivative/sub-keastlab-r18-382/sam-20181120-NW-cFos-egr1-16.tif': 'files/derivative/sub-keastlab-r18-382/sam-20181120-NW-cFos-egr1-16 (1).tif',
-            'files/derivative/sub-keastlab-r18-382/sam-20181120-NW-cFos-egr1-12.tif': 'files/derivative/sub-keastlab-r18-382/sam-20181120-NW-cFos-egr1-12 (1).tif',
-            'files/derivative/sub-keastlab-r18-382/sam-20181120-NW-cFos-egr1-14.tif': 'files/derivative/sub-keastlab-r18-382/sam-20181120-NW-cFos-egr1-14 (1).tif',
-            'files/derivative/sub-keastlab-r18-382/sam-20181120-NW-cFos-egr1-13.tif': 'files/derivative/sub-keastlab-r18-382/sam-20181120-NW-cFos-egr1-13 (1).tif',
-            'files/derivative/sub-keastlab-r18-382/sam-20181120-NW-cFos-egr1-05.tif': 'files/derivative/sub-keastlab-r18-382/sam-20181120-NW-cFos-egr1-05 (1).tif',
-            'files/derivative/sub-keastlab-r18-382/sam-20181120-NW-cFos-egr1-01.tif': 'files/derivative/sub-keastlab-r18-382/sam-20181120-NW-cFos-egr1-01 (1).tif',
-            'files/derivative/sub-keastlab-r18-190/sam-20180208-NW-cFos-pax2-05.tif': 'files/derivative/sub-keastlab-r18-190/sam-20180208-NW-cFos-pax2-05 (1).tif',
-            'files/derivative/sub-keastlab-r18-190/sam-20180208-NW-cFos-pax2-10.tif': 'files/derivative/sub-keastlab-r18-190/sam-20180208-NW-cFos-pax2-10 (1).tif',
-            'files/derivative/sub-keastlab-r18-190/sam-20180906-NW-cFos-th-3.tif': 'files/derivative/sub-keastlab-r18-190/sam-20180906-NW-cFos-th-3 (1).tif',
-            'files/derivative/sub-keastlab-r18-190/sam-20180927-NW-cFos-egr1-11.tif': 'files/derivative/sub-keastlab-r18-190/sam-20180927-NW-cFos-egr1-11 (1).tif',
-            'files/derivative/sub-keastlab-r18-190/sam-20180208-NW-cFos-pax2-03.tif': 'files/derivative/sub-keastlab-r18-190/sam-20180208-NW-cFos-pax2-03 (1).tif',
-            'files/derivative/sub-keastlab-r18-190/sam-20180208-NW-cFos-pax2-08.tif': 'files/derivative/sub-keastlab-r18-190/sam-20180208-NW-cFos-pax2-08 (1).tif',
-            'files/derivative/sub-keastlab-r18-190/sam-20180906-NW-cFos-th-8.tif': 'files/derivative/sub-keastlab-r18-190/sam-20180906-NW-cFos-th-8 (1).tif',
-            'files/derivative/sub-keastlab-r18-190/sam-20180927-NW-cFos-egr1-10.tif': 'files/derivative/sub-keastlab-r18-190/sam-20180927-NW-cFos-egr1-10 (1).tif',
-            'files/derivative/sub-keastlab-r18-190/sam-20180208-NW-cFos-pax2-16.tif': 'files/derivative/sub-keastlab-r18-190/sam-20180208-NW-cFos-pax2-16 (1).tif',
-            'files/derivative/sub-keastlab-r18-190/sam-20180927-NW-cFos-egr1-19.tif': 'files/derivative/sub-keastlab-r18-190/sam-20180927-NW-cFos-egr1-19 (1).tif',
-            'files/derivative/sub-keastlab-r18-190/sam-20180927-NW-cFos-egr1-16.tif': 'files/derivative/sub-keastlab-r18-190/sam-20180927-NW-cFos-egr1-16 (1).tif',
-            'files/derivative/sub-keastlab-r18-190/sam-20180927-NW-cFos-egr1-12.tif': 'files/derivative/sub-keastlab-r18-190/sam-20180927-NW-cFos-egr1-12 (1).tif',
-            'files/derivative/sub-keastlab-r18-190/sam-20180208-NW-cFos-pax2-09.tif': 'files/derivative/sub-keastlab-r18-190/sam-20180208-NW-cFos-pax2-09 (1).tif',
-            'files/derivative/sub-keastlab-r18-190/sam-20180927-NW-cFos-egr1-07.tif': 'files/derivative/sub-keastlab-r18-190/sam-20180927-NW-cFos-egr1-07 (1).tif',
-            'files/derivative/sub-keastlab-r18-190/sam-20180927-NW-cFos-egr1-14.tif': 'files/derivative/sub-keastlab-r18-190/sam-20180927-NW-cFos-egr1-14 (1).tif',
-            'files/derivative/sub-keastlab-r18-190/sam-20180208-NW-cFos-pax2-15.tif': 'files/derivative/sub-keastlab-r18-190/sam-20180208-NW-cFos-pax2-15 (1).tif',
-            'files/derivative/sub-keastlab-r18-190/sam-20180208-NW-cFos-pax2-17.tif': 'files/derivative/sub-keastlab-r18-190/sam-20180208-NW-cFos-pax2-17 (1).tif',
-            'files/derivative/sub-keastlab-r18-190/sam-20180208-NW-cFos-pax2-02.tif': 'files/derivative/sub-keastlab-r18-190/sam-20180208-NW-cFos-pax2-02 (1).tif',
-            'files/derivative/sub-keastlab-r18-190/sam-20180208-NW-cFos-pax2-12.tif': 'files/derivative/sub-keastlab-r18-190/sam-20180208-NW-cFos-pax2-12 (1).tif',
-            'files/derivative/sub-keastlab-r18-190/sam-20180208-NW-cFos-pax2-06.tif': 'files/derivative/sub-keastlab-r18-190/sam-20180208-NW-cFos-pax2-06 (1).tif',
-            'files/derivative/sub-keastlab-r18-190/sam-20180927-NW-cFos-egr1-05.tif': 'files/derivative/sub-keastlab-r18-190/sam-20180927-NW-cFos-egr1-05 (1).tif',
-            'files/derivative/sub-keastlab-r18-190/sam-20180208-NW-cFos-pax2-19.tif': 'files/derivative/sub-keastlab-r18-190/sam-20180208-NW-cFos-pax2-19 (1).tif',
-            'files/derivative/sub-keastlab-r18-190/sam-20180208-NW-cFos-pax2-07.tif': 'files/derivative/sub-keastlab-r18-190/sam-20180208-NW-cFos-pax2-07 (1).tif',
-            'files/derivative/sub-keastlab-r18-190/sam-20180906-NW-cFos-th-1.tif': 'files/derivative/sub-keastlab-r18-190/sam-20180906-NW-cFos-th-1 (1).tif',
-            'files/derivative/sub-keastlab-r18-190/sam-20180927-NW-cFos-egr1-20.tif': 'files/derivative/sub-keastlab-r18-190/sam-20180927-NW-cFos-egr1-20 (1).tif',
-            'files/derivative/sub-keastlab-r18-190/sam-20180927-NW-cFos-egr1-18.tif': 'files/derivative/sub-keastlab-r18-190/sam-20180927-NW-cFos-egr1-18 (1).tif',
-            'files/derivative/sub-keastlab-r18-190/sam-20180927-NW-cFos-egr1-17.tif': 'files/derivative/sub-keastlab-r18-190/sam-20180927-NW-cFos-egr1-17 (1).tif',
-            'files/derivative/sub-keastlab-r18-190/sam-20180208-NW-cFos-pax2-13.tif': 'files/derivative/sub-keastlab-r18-190/sam-20180208-NW-cFos-pax2-13 (1).tif',
-            'files/derivative/sub-keastlab-r18-190/sam-20180927-NW-cFos-egr1-09.tif': 'files/derivative/sub-keastlab-r18-190/sam-20180927-NW-cFos-egr1-09 (1).tif',
-            'files/derivative/sub-keastlab-r18-190/sam-20180906-NW-cFos-th-7.tif': 'files/derivative/sub-keastlab-r18-190/sam-20180906-NW-cFos-th-7 (1).tif',
-            'files/derivative/sub-keastlab-r18-190/sam-20180927-NW-cFos-egr1-03.tif': 'files/derivative/sub-keastlab-r18-190/sam-20180927-NW-cFos-egr1-03 (1).tif',
-            'files/derivative/sub-keastlab-r18-190/sam-20180208-NW-cFos-pax2-20.tif': 'files/derivative/sub-keastlab-r18-190/sam-20180208-NW-cFos-pax2-20 (1).tif',
-            'files/derivative/sub-keastlab-r18-190/sam-20180208-NW-cFos-pax2-11.tif': 'files/derivative/sub-keastlab-r18-190/sam-20180208-NW-cFos-pax2-11 (1).tif',
-            'files/derivative/sub-keastlab-r18-190/sam-20180906-NW-cFos-th-9.tif': 'files/derivative/sub-keastlab-r18-190/sam-20180906-NW-cFos-th-9 (1).tif',
-            'files/derivative/sub-keastlab-r18-190/sam-20180927-NW-cFos-egr1-08.tif': 'files/derivative/sub-keastlab-r18-190/sam-20180927-NW-cFos-egr1-08 (1).tif',
-            'files/derivative/sub-keastlab-r18-190/sam-20180208-NW-cFos-pax2-18.tif': 'files/derivative/sub-keastlab-r18-190/sam-20180208-NW-cFos-pax2-18 (1).tif',
-            'files/derivative/sub-keastlab-r18-190/sam-20180927-NW-cFos-egr1-21.tif': 'files/derivative/sub-keastlab-r18-190/sam-20180927-NW-cFos-egr1-21 (1).tif',
-            'files/derivative/sub-keastlab-r18-190/sam-20180927-NW-cFos-egr1-06.tif': 'files/derivative/sub-keastlab-r18-190/sam-20180927-NW-cFos-egr1-06 (1).tif',
-            'files/derivative/sub-keastlab-r18-190/sam-20180927-NW-cFos-egr1-04.tif': 'files/derivative/sub-keastlab-r18-190/sam-20180927-NW-cFos-egr1-04 (1).tif',
-            'files/derivative/sub-keastlab-r18-190/sam-20180906-NW-cFos-th-4.tif': 'files/derivative/sub-keastlab-r18-190/sam-20180906-NW-cFos-th-4 (1).tif',
-            'files/derivative/sub-keastlab-r18-190/sam-20180927-NW-cFos-egr1-13.tif': 'files/derivative/sub-keastlab-r18-190/sam-20180927-NW-cFos-egr1-13 (1).tif',
-            'files/derivative/sub-keastlab-r18-190/sam-20180906-NW-cFos-th-5.tif': 'files/derivative/sub-keastlab-r18-190/sam-20180906-NW-cFos-th-5 (1).tif',
-            'files/derivative/sub-keastlab-r18-190/sam-20180208-NW-cFos-pax2-01.tif': 'files/derivative/sub-keastlab-r18-190/sam-20180208-NW-cFos-pax2-01 (1).tif',
-            'files/derivative/sub-keastlab-r18-190/sam-20180927-NW-cFos-egr1-02.tif': 'files/derivative/sub-keastlab-r18-190/sam-20180927-NW-cFos-egr1-02 (1).tif',
-            'files/derivative/sub-keastlab-r18-190/sam-20180208-NW-cFos-pax2-04.tif': 'files/derivative/sub-keastlab-r18-190/sam-20180208-NW-cFos-pax2-04 (1).tif',
-            'files/derivative/sub-keastlab-r18-190/sam-20180906-NW-cFos-th-2.tif': 'files/derivative/sub-keastlab-r18-190/sam-20180906-NW-cFos-th-2 (1).tif',
-            'files/derivative/sub-keastlab-r18-190/sam-20180906-NW-cFos-th-6.tif': 'files/derivative/sub-keastlab-r18-190/sam-20180906-NW-cFos-th-6 (1).tif',
-            'files/derivative/sub-keastlab-r18-190/sam-20180927-NW-cFos-egr1-15.tif': 'files/derivative/sub-keastlab-r18-190/sam-20180927-NW-cFos-egr1-15 (1).tif',
-            'files/derivative/sub-keastlab-r18-313/sam-20181001-NW-cFos-egr1-12.tif': 'files/derivative/sub-keastlab-r18-313/sam-20181001-NW-cFos-egr1-12 (1).tif',
-            'files/derivative/sub-keastlab-r18-313/sam-20181001-NW-cFos-egr1-04.tif': 'files/derivative/sub-keastlab-r18-313/sam-20181001-NW-cFos-egr1-04 (1).tif',
-            'files/derivative/sub-keastlab-r18-313/sam-20181001-NW-cFos-egr1-13.tif': 'files/derivative/sub-keastlab-r18-313/sam-20181001-NW-cFos-egr1-13 (1).tif',
-            'files/derivative/sub-keastlab-r18-313/sam-20181001-NW-cFos-egr1-16.tif': 'files/derivative/sub-keastlab-r18-313/sam-20181001-NW-cFos-egr1-16 (1).tif',
-            'files/derivative/sub-keastlab-r18-313/sam-20181001-NW-cFos-egr1-09.tif': 'files/derivative/sub-keastlab-r18-313/sam-20181001-NW-cFos-egr1-09 (1).tif',
-            'files/derivative/sub-keastlab-r18-313/sam-20181001-NW-cFos-egr1-14.tif': 'files/derivative/sub-keastlab-r18-313/sam-20181001-NW-cFos-egr1-14 (1).tif',
-            'files/derivative/sub-keastlab-r18-313/sam-20181001-NW-cFos-egr1-06.tif': 'files/derivative/sub-keastlab-r18-313/sam-20181001-NW-cFos-egr1-06 (1).tif',
-            'files/derivative/sub-keastlab-r18-313/sam-20181001-NW-cFos-egr1-15.tif': 'files/derivative/sub-keastlab-r18-313/sam-20181001-NW-cFos-egr1-15 (1).tif',
-            'files/derivative/sub-keastlab-r18-313/sam-20181001-NW-cFos-egr1-10.tif': 'files/derivative/sub-keastlab-r18-313/sam-20181001-NW-cFos-egr1-10 (1).tif',
-            'files/derivative/sub-keastlab-r18-313/sam-20181001-NW-cFos-egr1-17.tif': 'files/derivative/sub-keastlab-r18-313/sam-20181001-NW-cFos-egr1-17 (1).tif',
-            'files/derivative/sub-keastlab-r18-313/sam-20181001-NW-cFos-egr1-19.tif': 'files/derivative/sub-keastlab-r18-313/sam-20181001-NW-cFos-egr1-19 (1).tif',
-            'files/derivative/sub-keastlab-r18-313/sam-20181001-NW-cFos-egr1-08.tif': 'files/derivative/sub-keastlab-r18-313/sam-20181001-NW-cFos-egr1-08 (1).tif',
-            'files/derivative/sub-keastlab-r18-313/sam-20181001-NW-cFos-egr1-02.tif': 'files/derivative/sub-keastlab-r18-313/sam-20181001-NW-cFos-egr1-02 (1).tif',
-            'files/derivative/sub-keastlab-r18-313/sam-20181001-NW-cFos-egr1-11.tif': 'files/derivative/sub-keastlab-r18-313/sam-20181001-NW-cFos-egr1-11 (1).tif',
-            'files/derivative/sub-keastlab-r18-313/sam-20181001-NW-cFos-egr1-05.jp2': 'files/derivative/sub-keastlab-r18-313/sam-20181001-NW-cFos-egr1-05 (1).jp2',
-            'files/derivative/sub-keastlab-r18-313/sam-20181001-NW-cFos-egr1-07.tif': 'files/derivative/sub-keastlab-r18-313/sam-20181001-NW-cFos-egr1-07 (1).tif',
-            'files/derivative/sub-keastlab-r18-313/sam-20181001-NW-cFos-egr1-18.tif': 'files/derivative/sub-keastlab-r18-313/sam-20181001-NW-cFos-egr1-18 (1).tif',
-            'files/derivative/sub-keastlab-r18-313/sam-20181001-NW-cFos-egr1-03.tif': 'files/derivative/sub-keastlab-r18-313/sam-20181001-NW-cFos-egr1-03 (1).tif',
-            'files/derivative/sub-keastlab-r19-423/sam-20190404-NW-cFos-egr1-09.tif': 'files/derivative/sub-keastlab-r19-423/sam-20190404-NW-cFos-egr1-09 (1).tif',
-            'files/derivative/sub-keastlab-r19-423/sam-20190404-NW-cFos-egr1-05.tif': 'files/derivative/sub-keastlab-r19-423/sam-20190404-NW-cFos-egr1-05 (1).tif',
-            'files/derivative/sub-keastlab-r19-423/sam-20190404-NW-cFos-egr1-16.tif': 'files/derivative/sub-keastlab-r19-423/sam-20190404-NW-cFos-egr1-16 (1).tif',
-            'files/derivative/sub-keastlab-r19-423/sam-20190404-NW-cFos-egr1-14.tif': 'files/derivative/sub-keastlab-r19-423/sam-20190404-NW-cFos-egr1-14 (1).tif',
-            'files/derivative/sub-keastlab-r19-423/sam-20190404-NW-cFos-egr1-11.tif': 'files/derivative/sub-keastlab-r19-423/sam-20190404-NW-cFos-egr1-11 (1).tif',
-            'files/derivative/sub-keastlab-r19-423/sam-20190404-NW-cFos-egr1-10.tif': 'files/derivative/sub-keastlab-r19-423/sam-20190404-NW-cFos-egr1-10 (1).tif',
-            'files/derivative/sub-keastlab-r19-423/sam-20190404-NW-cFos-egr1-01.tif': 'files/derivative/sub-keastlab-r19-423/sam-20190404-NW-cFos-egr1-01 (1).tif',
-            'files/derivative/sub-keastlab-r19-423/sam-20190404-NW-cFos-egr1-20.tif': 'files/derivative/sub-keastlab-r19-423/sam-20190404-NW-cFos-egr1-20 (1).tif',
-            'files/derivative/sub-keastlab-r19-423/sam-20190404-NW-cFos-egr1-15.tif': 'files/derivative/sub-keastlab-r19-423/sam-20190404-NW-cFos-egr1-15 (1).tif',
-            'files/derivative/sub-keastlab-r19-423/sam-20190404-NW-cFos-egr1-18.tif': 'files/derivative/sub-keastlab-r19-423/sam-20190404-NW-cFos-egr1-18 (1).tif',
-            'files/derivative/sub-keastlab-r19-423/sam-20190404-NW-cFos-egr1-03.tif': 'files/derivative/sub-keastlab-r19-423/sam-20190404-NW-cFos-egr1-03 (1).tif',
-            'files/derivative/sub-keastlab-r19-423/sam-20190404-NW-cFos-egr1-02.tif': 'files/derivative/sub-keastlab-r19-423/sam-20190404-NW-cFos-egr1-02 (1).tif',
-            'files/derivative/sub-keastlab-r19-423/sam-20190404-NW-cFos-egr1-19.tif': 'files/derivative/sub-keastlab-r19-423/sam-20190404-NW-cFos-egr1-19 (1).tif',
-            'files/derivative/sub-keastlab-r19-423/sam-20190404-NW-cFos-egr1-08.tif': 'files/derivative/sub-keastlab-r19-423/sam-20190404-NW-cFos-egr1-08 (1).tif',
-            'files/derivative/sub-keastlab-r19-423/sam-20190404-NW-cFos-egr1-04.tif': 'files/derivative/sub-keastlab-r19-423/sam-20190404-NW-cFos-egr1-04 (1).tif',
-            'files/derivative/sub-keastlab-r19-423/sam-20190404-NW-cFos-egr1-13.tif': 'files/derivative/sub-keastlab-r19-423/sam-20190404-NW-cFos-egr1-13 (1).tif',
-            'files/derivative/sub-keastlab-r17-162/sam-20190116-NW-cFos-th-03.tif': 'files/derivative/sub-keastlab-r17-162/sam-20190116-NW-cFos-th-03 (1).tif',
-            'files/derivative/sub-keastlab-r17-162/sam-20190131-NW-cFos-pax2-15.tif': 'files/derivative/sub-keastlab-r17-162/sam-20190131-NW-cFos-pax2-15 (1).tif',
-            'files/derivative/sub-keastlab-r17-162/sam-20190131-NW-cFos-pax2-08.tif': 'files/derivative/sub-keastlab-r17-162/sam-20190131-NW-cFos-pax2-08 (1).tif',
-            'files/derivative/sub-keastlab-r19-423/sam-20190404-NW-cFos-egr1-07.tif': 'files/derivative/sub-keastlab-r19-423/sam-20190404-NW-cFos-egr1-07 (1).tif',
-            'files/derivative/sub-keastlab-r17-162/sam-20190131-NW-cFos-pax2-20.tif': 'files/derivative/sub-keastlab-r17-162/sam-20190131-NW-cFos-pax2-20 (1).tif',
-            'files/derivative/sub-keastlab-r19-423/sam-20190404-NW-cFos-egr1-17.tif': 'files/derivative/sub-keastlab-r19-423/sam-20190404-NW-cFos-egr1-17 (1).tif',
-            'files/derivative/sub-keastlab-r17-162/sam-20190131-NW-cFos-pax2-17.tif': 'files/derivative/sub-keastlab-r17-162/sam-20190131-NW-cFos-pax2-17 (1).tif',
-            'files/derivative/sub-keastlab-r17-162/sam-20190116-NW-cFos-th-04.jp2': 'files/derivative/sub-keastlab-r17-162/sam-20190116-NW-cFos-th-04 (1).jp2',
-            'files/derivative/sub-keastlab-r17-162/sam-20190131-NW-cFos-pax2-10.tif': 'files/derivative/sub-keastlab-r17-162/sam-20190131-NW-cFos-pax2-10 (1).tif',
-            'files/derivative/sub-keastlab-r17-162/sam-20190116-NW-cFos-th-07.tif': 'files/derivative/sub-keastlab-r17-162/sam-20190116-NW-cFos-th-07 (1).tif',
-            'files/derivative/sub-keastlab-r17-162/sam-20190131-NW-cFos-pax2-06.tif': 'files/derivative/sub-keastlab-r17-162/sam-20190131-NW-cFos-pax2-06 (1).tif',
-            'files/derivative/sub-keastlab-r17-162/sam-20190131-NW-cFos-pax2-01.tif': 'files/derivative/sub-keastlab-r17-162/sam-20190131-NW-cFos-pax2-01 (1).tif',
-            'files/derivative/sub-keastlab-r17-162/sam-20190131-NW-cFos-pax2-09.tif': 'files/derivative/sub-keastlab-r17-162/sam-20190131-NW-cFos-pax2-09 (1).tif',
-            'files/derivative/sub-keastlab-r17-162/sam-20190116-NW-cFos-th-08.tif': 'files/derivative/sub-keastlab-r17-162/sam-20190116-NW-cFos-th-08 (1).tif',
-            'files/derivative/sub-keastlab-r17-162/sam-20190131-NW-cFos-pax2-07.tif': 'files/derivative/sub-keastlab-r17-162/sam-20190131-NW-cFos-pax2-07 (1).tif',
-            'files/derivative/sub-keastlab-r17-162/sam-20190116-NW-cFos-th-02.tif': 'files/derivative/sub-keastlab-r17-162/sam-20190116-NW-cFos-th-02 (1).tif',
-            'files/derivative/sub-keastlab-r17-162/sam-20190116-NW-cFos-th-06.tif': 'files/derivative/sub-keastlab-r17-162/sam-20190116-NW-cFos-th-06 (1).tif',
-            'files/derivative/sub-keastlab-r17-162/sam-20190131-NW-cFos-pax2-11.tif': 'files/derivative/sub-keastlab-r17-162/sam-20190131-NW-cFos-pax2-11 (1).tif',
-            'files/derivative/sub-keastlab-r17-162/sam-20190131-NW-cFos-pax2-05.tif': 'files/derivative/sub-keastlab-r17-162/sam-20190131-NW-cFos-pax2-05 (1).tif',
-            'files/derivative/sub-keastlab-r17-162/sam-20190116-NW-cFos-th-01.tif': 'files/derivative/sub-keastlab-r17-162/sam-20190116-NW-cFos-th-01 (1).tif',
-            'files/derivative/sub-keastlab-r17-162/sam-20190131-NW-cFos-pax2-18.tif': 'files/derivative/sub-keastlab-r17-162/sam-20190131-NW-cFos-pax2-18 (1).tif',
-            'files/derivative/sub-keastlab-r17-162/sam-20190131-NW-cFos-pax2-19.tif': 'files/derivative/sub-keastlab-r17-162/sam-20190131-NW-cFos-pax2-19 (1).tif',
-            'files/derivative/sub-keastlab-r17-162/sam-20190116-NW-cFos-th-09.tif': 'files/derivative/sub-keastlab-r17-162/sam-20190116-NW-cFos-th-09 (1).tif',
-            'files/derivative/sub-keastlab-r17-162/sam-20190131-NW-cFos-pax2-16.tif': 'files/derivative/sub-keastlab-r17-162/sam-20190131-NW-cFos-pax2-16 (1).tif',
-            'files/derivative/sub-keastlab-r17-162/sam-20190131-NW-cFos-pax2-04.tif': 'files/derivative/sub-keastlab-r17-162/sam-20190131-NW-cFos-pax2-04 (1).tif',
-            'files/derivative/sub-keastlab-r17-162/sam-20190116-NW-cFos-th-05.tif': 'files/derivative/sub-keastlab-r17-162/sam-20190116-NW-cFos-th-05 (1).tif',
-            'files/derivative/sub-keastlab-r17-162/sam-20190116-NW-cFos-th-10.tif': 'files/derivative/sub-keastlab-r17-162/sam-20190116-NW-cFos-th-10 (1).tif',
-            'files/derivative/sub-keastlab-r17-162/sam-20190131-NW-cFos-pax2-14.tif': 'files/derivative/sub-keastlab-r17-162/sam-20190131-NW-cFos-pax2-14 (1).tif',
-            'files/derivative/sub-keastlab-r17-162/sam-20190131-NW-cFos-pax2-13.tif': 'files/derivative/sub-keastlab-r17-162/sam-20190131-NW-cFos-pax2-13 (1).tif',
-            'files/derivative/sub-keastlab-r17-162/sam-20190131-NW-cFos-pax2-02.tif': 'files/derivative/sub-keastlab-r17-162/sam-20190131-NW-cFos-pax2-02 (1).tif',
-            'files/derivative/sub-keastlab-r17-162/sam-20190131-NW-cFos-pax2-12.tif': 'files/derivative/sub-keastlab-r17-162/sam-20190131-NW-cFos-pax2-12 (1).tif',
-            'files/derivative/sub-keastlab-r18-383/sam-20181121-NW-cFos-egr1-10.tif': 'files/derivative/sub-keastlab-r18-383/sam-20181121-NW-cFos-egr1-10 (1).tif',
-            'files/derivative/sub-keastlab-r17-162/sam-20190131-NW-cFos-pax2-03.tif': 'files/derivative/sub-keastlab-r17-162/sam-20190131-NW-cFos-pax2-03 (1).tif',
-            'files/derivative/sub-keastlab-r18-383/sam-20181121-NW-cFos-egr1-17.tif': 'files/derivative/sub-keastlab-r18-383/sam-20181121-NW-cFos-egr1-17 (1).tif',
-            'files/derivative/sub-keastlab-r18-383/sam-20181121-NW-cFos-egr1-13.tif': 'files/derivative/sub-keastlab-r18-383/sam-20181121-NW-cFos-egr1-13 (1).tif',
-            'files/derivative/sub-keastlab-r18-383/sam-20181121-NW-cFos-egr1-09.tif': 'files/derivative/sub-keastlab-r18-383/sam-20181121-NW-cFos-egr1-09 (1).tif',
-            'files/derivative/sub-keastlab-r18-383/sam-20181121-NW-cFos-egr1-05.tif': 'files/derivative/sub-keastlab-r18-383/sam-20181121-NW-cFos-egr1-05 (1).tif',
-            'files/derivative/sub-keastlab-r18-383/sam-20181121-NW-cFos-egr1-07.tif': 'files/derivative/sub-keastlab-r18-383/sam-20181121-NW-cFos-egr1-07 (1).tif',
-            'files/derivative/sub-keastlab-r18-383/sam-20181121-NW-cFos-egr1-11.tif': 'files/derivative/sub-keastlab-r18-383/sam-20181121-NW-cFos-egr1-11 (1).tif',
-            'files/derivative/sub-keastlab-r18-383/sam-20181121-NW-cFos-egr1-06.tif': 'files/derivative/sub-keastlab-r18-383/sam-20181121-NW-cFos-egr1-06 (1).tif',
-            'files/derivative/sub-keastlab-r18-383/sam-20181121-NW-cFos-egr1-20.tif': 'files/derivative/sub-keastlab-r18-383/sam-20181121-NW-cFos-egr1-20 (1).tif',
-            'files/derivative/sub-keastlab-r18-383/sam-20181121-NW-cFos-egr1-04.tif': 'files/derivative/sub-keastlab-r18-383/sam-20181121-NW-cFos-egr1-04 (1).tif',
-            'files/derivative/sub-keastlab-r18-383/sam-20181121-NW-cFos-egr1-21.tif': 'files/derivative/sub-keastlab-r18-383/sam-20181121-NW-cFos-egr1-21 (1).tif',
-            'files/derivative/sub-keastlab-r18-383/sam-20181121-NW-cFos-egr1-18.tif': 'files/derivative/sub-keastlab-r18-383/sam-20181121-NW-cFos-egr1-18 (1).tif',
-            'files/derivative/sub-keastlab-r18-383/sam-20181121-NW-cFos-egr1-02.tif': 'files/derivative/sub-keastlab-r18-383/sam-20181121-NW-cFos-egr1-02 (1).tif',
-            'files/derivative/sub-keastlab-r18-383/sam-20181121-NW-cFos-egr1-08.tif': 'files/derivative/sub-keastlab-r18-383/sam-20181121-NW-cFos-egr1-08 (1).tif',
-            'files/derivative/sub-keastlab-r18-383/sam-20181121-NW-cFos-egr1-14.tif': 'files/derivative/sub-keastlab-r18-383/sam-20181121-NW-cFos-egr1-14 (1).tif',
-            'files/derivative/sub-keastlab-r18-383/sam-20181121-NW-cFos-egr1-15.jp2': 'files/derivative/sub-keastlab-r18-383/sam-20181121-NW-cFos-egr1-15 (1).jp2',
-            'files/derivative/sub-keastlab-r18-383/sam-20181121-NW-cFos-egr1-12.tif': 'files/derivative/sub-keastlab-r18-383/sam-20181121-NW-cFos-egr1-12 (1).tif',
-            'files/derivative/sub-keastlab-r17-163/sam-20190123-NW-cFos-th-02.tif': 'files/derivative/sub-keastlab-r17-163/sam-20190123-NW-cFos-th-02 (1).tif',
-            'files/derivative/sub-keastlab-r17-163/sam-20190402-NW-cFos-pax2-09.jp2': 'files/derivative/sub-keastlab-r17-163/sam-20190402-NW-cFos-pax2-09 (1).jp2',
-            'files/derivative/sub-keastlab-r18-383/sam-20181121-NW-cFos-egr1-19.tif': 'files/derivative/sub-keastlab-r18-383/sam-20181121-NW-cFos-egr1-19 (1).tif',
-            'files/derivative/sub-keastlab-r17-163/sam-20190402-NW-cFos-pax2-18.tif': 'files/derivative/sub-keastlab-r17-163/sam-20190402-NW-cFos-pax2-18 (1).tif',
-            'files/derivative/sub-keastlab-r17-163/sam-20190402-NW-cFos-pax2-10.tif': 'files/derivative/sub-keastlab-r17-163/sam-20190402-NW-cFos-pax2-10 (1).tif',
-            'files/derivative/sub-keastlab-r17-163/sam-20190402-NW-cFos-pax2-06.tif': 'files/derivative/sub-keastlab-r17-163/sam-20190402-NW-cFos-pax2-06 (1).tif',
-            'files/derivative/sub-keastlab-r17-163/sam-20190402-NW-cFos-pax2-14.tif': 'files/derivative/sub-keastlab-r17-163/sam-20190402-NW-cFos-pax2-14 (1).tif',
-            'files/derivative/sub-keastlab-r17-163/sam-20190402-NW-cFos-pax2-21.tif': 'files/derivative/sub-keastlab-r17-163/sam-20190402-NW-cFos-pax2-21 (1).tif',
-            'files/derivative/sub-keastlab-r17-163/sam-20190123-NW-cFos-th-08.tif': 'files/derivative/sub-keastlab-r17-163/sam-20190123-NW-cFos-th-08 (1).tif',
-            'files/derivative/sub-keastlab-r17-163/sam-20190402-NW-cFos-pax2-20.tif': 'files/derivative/sub-keastlab-r17-163/sam-20190402-NW-cFos-pax2-20 (1).tif',
-            'files/derivative/sub-keastlab-r17-163/sam-20190402-NW-cFos-pax2-17.tif': 'files/derivative/sub-keastlab-r17-163/sam-20190402-NW-cFos-pax2-17 (1).tif',
-            'files/derivative/sub-keastlab-r17-163/sam-20190402-NW-cFos-pax2-05.tif': 'files/derivative/sub-keastlab-r17-163/sam-20190402-NW-cFos-pax2-05 (1).tif',
-            'files/derivative/sub-keastlab-r17-163/sam-20190402-NW-cFos-pax2-12.tif': 'files/derivative/sub-keastlab-r17-163/sam-20190402-NW-cFos-pax2-12 (1).tif',
-            'files/derivative/sub-keastlab-r17-163/sam-20190402-NW-cFos-pax2-19.tif': 'files/derivative/sub-keastlab-r17-163/sam-20190402-NW-cFos-pax2-19 (1).tif',
-            'files/derivative/sub-keastlab-r17-163/sam-20190123-NW-cFos-th-05.tif': 'files/derivative/sub-keastlab-r17-163/sam-20190123-NW-cFos-th-05 (1).tif',
-            'files/derivative/sub-keastlab-r17-163/sam-20190402-NW-cFos-pax2-07.tif': 'files/derivative/sub-keastlab-r17-163/sam-20190402-NW-cFos-pax2-07 (1).tif',
-            'files/derivative/sub-keastlab-r17-163/sam-20190402-NW-cFos-pax2-11.tif': 'files/derivative/sub-keastlab-r17-163/sam-20190402-NW-cFos-pax2-11 (1).tif',
-            'files/derivative/sub-keastlab-r17-163/sam-20190402-NW-cFos-pax2-23.tif': 'files/derivative/sub-keastlab-r17-163/sam-20190402-NW-cFos-pax2-23 (1).tif',
-            'files/derivative/sub-keastlab-r17-163/sam-20190123-NW-cFos-th-01.tif': 'files/derivative/sub-keastlab-r17-163/sam-20190123-NW-cFos-th-01 (1).tif',
-            'files/derivative/sub-keastlab-r17-163/sam-20190402-NW-cFos-pax2-04.tif': 'files/derivative/sub-keastlab-r17-163/sam-20190402-NW-cFos-pax2-04 (1).tif',
-            'files/derivative/sub-keastlab-r17-163/sam-20190123-NW-cFos-th-03.tif': 'files/derivative/sub-keastlab-r17-163/sam-20190123-NW-cFos-th-03 (1).tif',
-            'files/derivative/sub-keastlab-r17-163/sam-20190402-NW-cFos-pax2-13.tif': 'files/derivative/sub-keastlab-r17-163/sam-20190402-NW-cFos-pax2-13 (1).tif',
-            'files/derivative/sub-keastlab-r17-163/sam-20190123-NW-cFos-th-09.tif': 'files/derivative/sub-keastlab-r17-163/sam-20190123-NW-cFos-th-09 (1).tif',
-            'files/derivative/sub-keastlab-r17-163/sam-20190402-NW-cFos-pax2-22.tif': 'files/derivative/sub-keastlab-r17-163/sam-20190402-NW-cFos-pax2-22 (1).tif',
-            'files/derivative/sub-keastlab-r17-163/sam-20190402-NW-cFos-pax2-15.tif': 'files/derivative/sub-keastlab-r17-163/sam-20190402-NW-cFos-pax2-15 (1).tif',
-            'files/derivative/sub-keastlab-r17-163/sam-20190402-NW-cFos-pax2-08.tif': 'files/derivative/sub-keastlab-r17-163/sam-20190402-NW-cFos-pax2-08 (1).tif',
-            'files/derivative/sub-keastlab-r17-163/sam-20190123-NW-cFos-th-04.tif': 'files/derivative/sub-keastlab-r17-163/sam-20190123-NW-cFos-th-04 (1).tif',
-            'files/derivative/sub-keastlab-r17-163/sam-20190123-NW-cFos-th-06.tif': 'files/derivative/sub-keastlab-r17-163/sam-20190123-NW-cFos-th-06 (1).tif',
-            'files/derivative/sub-keastlab-r17-163/sam-20190402-NW-cFos-pax2-16.tif': 'files/derivative/sub-keastlab-r17-163/sam-20190402-NW-cFos-pax2-16 (1).tif',
-            'files/derivative/sub-keastlab-r17-163/sam-20190123-NW-cFos-th-010.jp2': 'files/derivative/sub-keastlab-r17-163/sam-20190123-NW-cFos-th-010 (1).jp2',
-            'files/derivative/sub-keastlab-r18-249/sam-20180710-NW-cFos-egr1-06.tif': 'files/derivative/sub-keastlab-r18-249/sam-20180710-NW-cFos-egr1-06 (1).tif',
-            'files/derivative/sub-keastlab-r18-249/sam-20180920-NW-cFos-pax2-10.tif': 'files/derivative/sub-keastlab-r18-249/sam-20180920-NW-cFos-pax2-10 (1).tif',
-            'files/derivative/sub-keastlab-r18-249/sam-20180920-NW-cFos-pax2-12.tif': 'files/derivative/sub-keastlab-r18-249/sam-20180920-NW-cFos-pax2-12 (1).tif',
-            'files/derivative/sub-keastlab-r18-249/sam-20180920-NW-cFos-pax2-16.tif': 'files/derivative/sub-keastlab-r18-249/sam-20180920-NW-cFos-pax2-16 (1).tif',
-            'files/derivative/sub-keastlab-r18-249/sam-20180920-NW-cFos-pax2-09.tif': 'files/derivative/sub-keastlab-r18-249/sam-20180920-NW-cFos-pax2-09 (1).tif',
-            'files/derivative/sub-keastlab-r18-249/sam-20180710-NW-cFos-egr1-02.tif': 'files/derivative/sub-keastlab-r18-249/sam-20180710-NW-cFos-egr1-02 (1).tif',
-            'files/derivative/sub-keastlab-r18-249/sam-20180710-NW-cFos-egr1-03.tif': 'files/derivative/sub-keastlab-r18-249/sam-20180710-NW-cFos-egr1-03 (1).tif',
-            'files/derivative/sub-keastlab-r18-249/sam-20180710-NW-cFos-egr1-25.tif': 'files/derivative/sub-keastlab-r18-249/sam-20180710-NW-cFos-egr1-25 (1).tif',
-            'files/derivative/sub-keastlab-r18-249/sam-20180710-NW-cFos-egr1-17.tif': 'files/derivative/sub-keastlab-r18-249/sam-20180710-NW-cFos-egr1-17 (1).tif',
-            'files/derivative/sub-keastlab-r18-249/sam-20180920-NW-cFos-pax2-02.tif': 'files/derivative/sub-keastlab-r18-249/sam-20180920-NW-cFos-pax2-02 (1).tif',
-            'files/derivative/sub-keastlab-r18-249/sam-20180828-NW-cFos-th-08.tif': 'files/derivative/sub-keastlab-r18-249/sam-20180828-NW-cFos-th-08 (1).tif',
-            'files/derivative/sub-keastlab-r18-249/sam-20180828-NW-cFos-th-02.tif': 'files/derivative/sub-keastlab-r18-249/sam-20180828-NW-cFos-th-02 (1).tif',
-            'files/derivative/sub-keastlab-r18-249/sam-20180710-NW-cFos-egr1-19.tif': 'files/derivative/sub-keastlab-r18-249/sam-20180710-NW-cFos-egr1-19 (1).tif',
-            'files/derivative/sub-keastlab-r18-249/sam-20180920-NW-cFos-pax2-15.tif': 'files/derivative/sub-keastlab-r18-249/sam-20180920-NW-cFos-pax2-15 (1).tif',
-            'files/derivative/sub-keastlab-r18-249/sam-20180710-NW-cFos-egr1-16.tif': 'files/derivative/sub-keastlab-r18-249/sam-20180710-NW-cFos-egr1-16 (1).tif',
-            'files/derivative/sub-keastlab-r18-249/sam-20180710-NW-cFos-egr1-15.tif': 'files/derivative/sub-keastlab-r18-249/sam-20180710-NW-cFos-egr1-15 (1).tif',
-            'files/derivative/sub-keastlab-r18-249/sam-20180920-NW-cFos-pax2-19.tif': 'files/derivative/sub-keastlab-r18-249/sam-20180920-NW-cFos-pax2-19 (1).tif',
-            'files/derivative/sub-keastlab-r18-249/sam-20180920-NW-cFos-pax2-04.tif': 'files/derivative/sub-keastlab-r18-249/sam-20180920-NW-cFos-pax2-04 (1).tif',
-            'files/derivative/sub-keastlab-r18-249/sam-20180828-NW-cFos-th-07.tif': 'files/derivative/sub-keastlab-r18-249/sam-20180828-NW-cFos-th-07 (1).tif',
-            'files/derivative/sub-keastlab-r18-249/sam-20180920-NW-cFos-pax2-18.tif': 'files/derivative/sub-keastlab-r18-249/sam-20180920-NW-cFos-pax2-18 (1).tif',
-            'files/derivative/sub-keastlab-r18-249/sam-20180710-NW-cFos-egr1-11.tif': 'files/derivative/sub-keastlab-r18-249/sam-20180710-NW-cFos-egr1-11 (1).tif',
-            'files/derivative/sub-keastlab-r18-249/sam-20180920-NW-cFos-pax2-13.tif': 'files/derivative/sub-keastlab-r18-249/sam-20180920-NW-cFos-pax2-13 (1).tif',
-            'files/derivative/sub-keastlab-r18-249/sam-20180920-NW-cFos-pax2-11.tif': 'files/derivative/sub-keastlab-r18-249/sam-20180920-NW-cFos-pax2-11 (1).tif',
-            'files/derivative/sub-keastlab-r18-249/sam-20180710-NW-cFos-egr1-22.tif': 'files/derivative/sub-keastlab-r18-249/sam-20180710-NW-cFos-egr1-22 (1).tif',
-            'files/derivative/sub-keastlab-r18-249/sam-20180828-NW-cFos-th-05.tif': 'files/derivative/sub-keastlab-r18-249/sam-20180828-NW-cFos-th-05 (1).tif',
-            'files/derivative/sub-keastlab-r18-249/sam-20180920-NW-cFos-pax2-20.tif': 'files/derivative/sub-keastlab-r18-249/sam-20180920-NW-cFos-pax2-20 (1).tif',
-            'files/derivative/sub-keastlab-r18-249/sam-20180710-NW-cFos-egr1-20.tif': 'files/derivative/sub-keastlab-r18-249/sam-20180710-NW-cFos-egr1-20 (1).tif',
-            'files/derivative/sub-keastlab-r18-249/sam-20180920-NW-cFos-pax2-07.tif': 'files/derivative/sub-keastlab-r18-249/sam-20180920-NW-cFos-pax2-07 (1).tif',
-            'files/derivative/sub-keastlab-r18-249/sam-20180710-NW-cFos-egr1-24.tif': 'files/derivative/sub-keastlab-r18-249/sam-20180710-NW-cFos-egr1-24 (1).tif',
-            'files/derivative/sub-keastlab-r18-249/sam-20180920-NW-cFos-pax2-03.tif': 'files/derivative/sub-keastlab-r18-249/sam-20180920-NW-cFos-pax2-03 (1).tif',
-            'files/derivative/sub-keastlab-r18-249/sam-20180828-NW-cFos-th-01.tif': 'files/derivative/sub-keastlab-r18-249/sam-20180828-NW-cFos-th-01 (1).tif',
-            'files/derivative/sub-keastlab-r18-249/sam-20180710-NW-cFos-egr1-12.tif': 'files/derivative/sub-keastlab-r18-249/sam-20180710-NW-cFos-egr1-12 (1).tif',
-            'files/derivative/sub-keastlab-r18-249/sam-20180710-NW-cFos-egr1-08.tif': 'files/derivative/sub-keastlab-r18-249/sam-20180710-NW-cFos-egr1-08 (1).tif',
-            'files/derivative/sub-keastlab-r18-249/sam-20180710-NW-cFos-egr1-26.tif': 'files/derivative/sub-keastlab-r18-249/sam-20180710-NW-cFos-egr1-26 (1).tif',
-            'files/derivative/sub-keastlab-r18-249/sam-20180920-NW-cFos-pax2-05.tif': 'files/derivative/sub-keastlab-r18-249/sam-20180920-NW-cFos-pax2-05 (1).tif',
-            'files/derivative/sub-keastlab-r18-249/sam-20180828-NW-cFos-th-06.tif': 'files/derivative/sub-keastlab-r18-249/sam-20180828-NW-cFos-th-06 (1).tif',
-            'files/derivative/sub-keastlab-r18-249/sam-20180828-NW-cFos-th-04.tif': 'files/derivative/sub-keastlab-r18-249/sam-20180828-NW-cFos-th-04 (1).tif',
-            'files/derivative/sub-keastlab-r18-249/sam-20180920-NW-cFos-pax2-17.tif': 'files/derivative/sub-keastlab-r18-249/sam-20180920-NW-cFos-pax2-17 (1).tif',
-            'files/derivative/sub-keastlab-r18-249/sam-20180710-NW-cFos-egr1-04.tif': 'files/derivative/sub-keastlab-r18-249/sam-20180710-NW-cFos-egr1-04 (1).tif',
-            'files/derivative/sub-keastlab-r18-249/sam-20180920-NW-cFos-pax2-08.tif': 'files/derivative/sub-keastlab-r18-249/sam-20180920-NW-cFos-pax2-08 (1).tif',
-            'files/derivative/sub-keastlab-r18-249/sam-20180710-NW-cFos-egr1-18.tif': 'files/derivative/sub-keastlab-r18-249/sam-20180710-NW-cFos-egr1-18 (1).tif',
-            'files/derivative/sub-keastlab-r18-249/sam-20180828-NW-cFos-th-10.tif': 'files/derivative/sub-keastlab-r18-249/sam-20180828-NW-cFos-th-10 (1).tif',
-            'files/derivative/sub-keastlab-r18-249/sam-20180710-NW-cFos-egr1-27.tif': 'files/derivative/sub-keastlab-r18-249/sam-20180710-NW-cFos-egr1-27 (1).tif',
-            'files/derivative/sub-keastlab-r18-249/sam-20180920-NW-cFos-pax2-14.tif': 'files/derivative/sub-keastlab-r18-249/sam-20180920-NW-cFos-pax2-14 (1).tif',
-            'files/derivative/sub-keastlab-r18-249/sam-20180710-NW-cFos-egr1-05.tif': 'files/derivative/sub-keastlab-r18-249/sam-20180710-NW-cFos-egr1-05 (1).tif',
-            'files/derivative/sub-keastlab-r18-249/sam-20180710-NW-cFos-egr1-14.tif': 'files/derivative/sub-keastlab-r18-249/sam-20180710-NW-cFos-egr1-14 (1).tif',
-            'files/derivative/sub-keastlab-r19-422/sam-20190402-NW-cFos-egr1-11.tif': 'files/derivative/sub-keastlab-r19-422/sam-20190402-NW-cFos-egr1-11 (1).tif',
-            'files/derivative/sub-keastlab-r18-249/sam-20180920-NW-cFos-pax2-01.tif': 'files/derivative/sub-keastlab-r18-249/sam-20180920-NW-cFos-pax2-01 (1).tif',
-            'files/derivative/sub-keastlab-r19-422/sam-20190402-NW-cFos-egr1-18.tif': 'files/derivative/sub-keastlab-r19-422/sam-20190402-NW-cFos-egr1-18 (1).tif',
-            'files/derivative/sub-keastlab-r19-422/sam-20190402-NW-cFos-egr1-13.tif': 'files/derivative/sub-keastlab-r19-422/sam-20190402-NW-cFos-egr1-13 (1).tif',
-            'files/derivative/sub-keastlab-r19-422/sam-20190402-NW-cFos-egr1-03.tif': 'files/derivative/sub-keastlab-r19-422/sam-20190402-NW-cFos-egr1-03 (1).tif',
-            'files/derivative/sub-keastlab-r19-422/sam-20190402-NW-cFos-egr1-02.tif': 'files/derivative/sub-keastlab-r19-422/sam-20190402-NW-cFos-egr1-02 (1).tif',
-            'files/derivative/sub-keastlab-r19-422/sam-20190402-NW-cFos-egr1-01.tif': 'files/derivative/sub-keastlab-r19-422/sam-20190402-NW-cFos-egr1-01 (1).tif',
-            'files/derivative/sub-keastlab-r19-422/sam-20190402-NW-cFos-egr1-04.jp2': 'files/derivative/sub-keastlab-r19-422/sam-20190402-NW-cFos-egr1-04 (1).jp2',
-            'files/derivative/sub-keastlab-r19-422/sam-20190402-NW-cFos-egr1-05.tif': 'files/derivative/sub-keastlab-r19-422/sam-20190402-NW-cFos-egr1-05 (1).tif',
-            'files/derivative/sub-keastlab-r19-422/sam-20190402-NW-cFos-egr1-15.tif': 'files/derivative/sub-keastlab-r19-422/sam-20190402-NW-cFos-egr1-15 (1).tif',
-            'files/derivative/sub-keastlab-r19-422/sam-20190402-NW-cFos-egr1-16.tif': 'files/derivative/sub-keastlab-r19-422/sam-20190402-NW-cFos-egr1-16 (1).tif',
-            'files/derivative/sub-keastlab-r19-422/sam-20190402-NW-cFos-egr1-17.tif': 'files/derivative/sub-keastlab-r19-422/sam-20190402-NW-cFos-egr1-17 (1).tif',
-            'files/derivative/sub-keastlab-r19-422/sam-20190402-NW-cFos-egr1-08.tif': 'files/derivative/sub-keastlab-r19-422/sam-20190402-NW-cFos-egr1-08 (1).tif',
-            'files/derivative/sub-keastlab-r19-422/sam-20190402-NW-cFos-egr1-06.tif': 'files/derivative/sub-keastlab-r19-422/sam-20190402-NW-cFos-egr1-06 (1).tif',
-            'files/derivative/sub-keastlab-r19-422/R19-422-TissueMakerStack.tif': 'files/derivative/sub-keastlab-r19-422/R19-422-TissueMakerStack (1).tif',
-            'files/derivative/sub-keastlab-r19-422/sam-20190402-NW-cFos-egr1-14.tif': 'files/derivative/sub-keastlab-r19-422/sam-20190402-NW-cFos-egr1-14 (1).tif',
-            'files/derivative/sub-keastlab-r19-422/sam-20190402-NW-cFos-egr1-10.tif': 'files/derivative/sub-keastlab-r19-422/sam-20190402-NW-cFos-egr1-10 (1).tif',
-            'files/derivative/sub-keastlab-r19-422/sam-20190402-NW-cFos-egr1-07.tif': 'files/derivative/sub-keastlab-r19-422/sam-20190402-NW-cFos-egr1-07 (1).tif',
-            'files/derivative/sub-keastlab-r19-422/sam-20190402-NW-cFos-egr1-12.tif': 'files/derivative/sub-keastlab-r19-422/sam-20190402-NW-cFos-egr1-12 (1).tif',
-            'files/derivative/sub-keastlab-r19-422/sam-20190402-NW-cFos-egr1-20.tif': 'files/derivative/sub-keastlab-r19-422/sam-20190402-NW-cFos-egr1-20 (1).tif',
-            'files/derivative/sub-keastlab-r19-422/sam-20190402-NW-cFos-egr1-09.tif': 'files/derivative/sub-keastlab-r19-422/sam-20190402-NW-cFos-egr1-09 (1).tif',
-            'files/derivative/sub-keastlab-r19-422/sam-20190402-NW-cFos-egr1-19.tif': 'files/derivative/sub-keastlab-r19-422/sam-20190402-NW-cFos-egr1-19 (1).tif',
-            'files/derivative/sub-keastlab-r18-251/sam-20180927-NW-cFos-pax2-07.tif': 'files/derivative/sub-keastlab-r18-251/sam-20180927-NW-cFos-pax2-07 (1).tif',
-            'files/derivative/sub-keastlab-r18-251/sam-20180713-NW-cFos-egr1-11.tif': 'files/derivative/sub-keastlab-r18-251/sam-20180713-NW-cFos-egr1-11 (1).tif',
-            'files/derivative/sub-keastlab-r18-251/sam-20180713-NW-cFos-egr1-01.tif': 'files/derivative/sub-keastlab-r18-251/sam-20180713-NW-cFos-egr1-01 (1).tif',
-            'files/derivative/sub-keastlab-r18-251/sam-20180927-NW-cFos-pax2-20.tif': 'files/derivative/sub-keastlab-r18-251/sam-20180927-NW-cFos-pax2-20 (1).tif',
-            'files/derivative/sub-keastlab-r18-251/sam-20180831-NW-cFos-th-08.tif': 'files/derivative/sub-keastlab-r18-251/sam-20180831-NW-cFos-th-08 (1).tif',
-            'files/derivative/sub-keastlab-r18-251/sam-20180713-NW-cFos-egr1-07.tif': 'files/derivative/sub-keastlab-r18-251/sam-20180713-NW-cFos-egr1-07 (1).tif',
-            'files/derivative/sub-keastlab-r18-251/sam-20180927-NW-cFos-pax2-19.tif': 'files/derivative/sub-keastlab-r18-251/sam-20180927-NW-cFos-pax2-19 (1).tif',
-            'files/derivative/sub-keastlab-r18-251/sam-20180927-NW-cFos-pax2-03.tif': 'files/derivative/sub-keastlab-r18-251/sam-20180927-NW-cFos-pax2-03 (1).tif',
-            'files/derivative/sub-keastlab-r18-251/sam-20180927-NW-cFos-pax2-11.tif': 'files/derivative/sub-keastlab-r18-251/sam-20180927-NW-cFos-pax2-11 (1).tif',
-            'files/derivative/sub-keastlab-r18-251/sam-20180927-NW-cFos-pax2-16.tif': 'files/derivative/sub-keastlab-r18-251/sam-20180927-NW-cFos-pax2-16 (1).tif',
-            'files/derivative/sub-keastlab-r18-251/sam-20180713-NW-cFos-egr1-10.tif': 'files/derivative/sub-keastlab-r18-251/sam-20180713-NW-cFos-egr1-10 (1).tif',
-            'files/derivative/sub-keastlab-r18-251/sam-20180927-NW-cFos-pax2-06.tif': 'files/derivative/sub-keastlab-r18-251/sam-20180927-NW-cFos-pax2-06 (1).tif',
-            'files/derivative/sub-keastlab-r18-251/sam-20180927-NW-cFos-pax2-09.tif': 'files/derivative/sub-keastlab-r18-251/sam-20180927-NW-cFos-pax2-09 (1).tif',
-            'files/derivative/sub-keastlab-r18-251/sam-20180927-NW-cFos-pax2-18.tif': 'files/derivative/sub-keastlab-r18-251/sam-20180927-NW-cFos-pax2-18 (1).tif',
-            'files/derivative/sub-keastlab-r18-251/sam-20180927-NW-cFos-pax2-17.tif': 'files/derivative/sub-keastlab-r18-251/sam-20180927-NW-cFos-pax2-17 (1).tif',
-            'files/derivative/sub-keastlab-r18-251/sam-20180713-NW-cFos-egr1-05.tif': 'files/derivative/sub-keastlab-r18-251/sam-20180713-NW-cFos-egr1-05 (1).tif',
-            'files/derivative/sub-keastlab-r18-251/sam-20180713-NW-cFos-egr1-04.tif': 'files/derivative/sub-keastlab-r18-251/sam-20180713-NW-cFos-egr1-04 (1).tif',
-            'files/derivative/sub-keastlab-r18-251/sam-20180713-NW-cFos-egr1-16.tif': 'files/derivative/sub-keastlab-r18-251/sam-20180713-NW-cFos-egr1-16 (1).tif',
-            'files/derivative/sub-keastlab-r18-251/sam-20180831-NW-cFos-th-05.tif': 'files/derivative/sub-keastlab-r18-251/sam-20180831-NW-cFos-th-05 (1).tif',
-            'files/derivative/sub-keastlab-r18-251/sam-20180831-NW-cFos-th-02.tif': 'files/derivative/sub-keastlab-r18-251/sam-20180831-NW-cFos-th-02 (1).tif',
-            'files/derivative/sub-keastlab-r18-251/sam-20180831-NW-cFos-th-07.tif': 'files/derivative/sub-keastlab-r18-251/sam-20180831-NW-cFos-th-07 (1).tif',
-            'files/derivative/sub-keastlab-r18-251/sam-20180831-NW-cFos-th-01.tif': 'files/derivative/sub-keastlab-r18-251/sam-20180831-NW-cFos-th-01 (1).tif',
-            'files/derivative/sub-keastlab-r18-251/sam-20180831-NW-cFos-th-09.tif': 'files/derivative/sub-keastlab-r18-251/sam-20180831-NW-cFos-th-09 (1).tif',
-            'files/derivative/sub-keastlab-r18-251/sam-20180831-NW-cFos-th-06.tif': 'files/derivative/sub-keastlab-r18-251/sam-20180831-NW-cFos-th-06 (1).tif',
-            'files/derivative/sub-keastlab-r18-251/sam-20180927-NW-cFos-pax2-10.tif': 'files/derivative/sub-keastlab-r18-251/sam-20180927-NW-cFos-pax2-10 (1).tif',
-            'files/derivative/sub-keastlab-r18-251/sam-20180927-NW-cFos-pax2-05.tif': 'files/derivative/sub-keastlab-r18-251/sam-20180927-NW-cFos-pax2-05 (1).tif',
-            'files/derivative/sub-keastlab-r18-251/sam-20180927-NW-cFos-pax2-01.tif': 'files/derivative/sub-keastlab-r18-251/sam-20180927-NW-cFos-pax2-01 (1).tif',
-            'files/derivative/sub-keastlab-r18-251/sam-20180713-NW-cFos-egr1-17.tif': 'files/derivative/sub-keastlab-r18-251/sam-20180713-NW-cFos-egr1-17 (1).tif',
-            'files/derivative/sub-keastlab-r18-251/sam-20180831-NW-cFos-th-010.tif': 'files/derivative/sub-keastlab-r18-251/sam-20180831-NW-cFos-th-010 (1).tif',
-            'files/derivative/sub-keastlab-r18-251/sam-20180927-NW-cFos-pax2-13.tif': 'files/derivative/sub-keastlab-r18-251/sam-20180927-NW-cFos-pax2-13 (1).tif',
-            'files/derivative/sub-keastlab-r18-251/sam-20180927-NW-cFos-pax2-14.tif': 'files/derivative/sub-keastlab-r18-251/sam-20180927-NW-cFos-pax2-14 (1).tif',
-            'files/derivative/sub-keastlab-r18-251/sam-20180713-NW-cFos-egr1-18.tif': 'files/derivative/sub-keastlab-r18-251/sam-20180713-NW-cFos-egr1-18 (1).tif',
-            'files/derivative/sub-keastlab-r18-251/sam-20180831-NW-cFos-th-04.tif': 'files/derivative/sub-keastlab-r18-251/sam-20180831-NW-cFos-th-04 (1).tif',
-            'files/derivative/sub-keastlab-r18-251/sam-20180713-NW-cFos-egr1-09.tif': 'files/derivative/sub-keastlab-r18-251/sam-20180713-NW-cFos-egr1-09 (1).tif',
-            'files/derivative/sub-keastlab-r18-251/sam-20180713-NW-cFos-egr1-14.tif': 'files/derivative/sub-keastlab-r18-251/sam-20180713-NW-cFos-egr1-14 (1).tif',
-            'files/derivative/sub-keastlab-r18-251/sam-20180927-NW-cFos-pax2-08.tif': 'files/derivative/sub-keastlab-r18-251/sam-20180927-NW-cFos-pax2-08 (1).tif',
-            'files/derivative/sub-keastlab-r18-251/sam-20180713-NW-cFos-egr1-15.tif': 'files/derivative/sub-keastlab-r18-251/sam-20180713-NW-cFos-egr1-15 (1).tif',
-            'files/derivative/sub-keastlab-r18-251/sam-20180713-NW-cFos-egr1-13.tif': 'files/derivative/sub-keastlab-r18-251/sam-20180713-NW-cFos-egr1-13 (1).tif',
-            'files/derivative/sub-keastlab-r18-251/sam-20180927-NW-cFos-pax2-12.tif': 'files/derivative/sub-keastlab-r18-251/sam-20180927-NW-cFos-pax2-12 (1).tif',
-            'files/derivative/sub-keastlab-r18-251/sam-20180713-NW-cFos-egr1-06.jp2': 'files/derivative/sub-keastlab-r18-251/sam-20180713-NW-cFos-egr1-06 (1).jp2',
-            'files/derivative/sub-keastlab-r18-251/sam-20180713-NW-cFos-egr1-12.tif': 'files/derivative/sub-keastlab-r18-251/sam-20180713-NW-cFos-egr1-12 (1).tif',
-            'files/derivative/sub-keastlab-r18-251/sam-20180713-NW-cFos-egr1-03.tif': 'files/derivative/sub-keastlab-r18-251/sam-20180713-NW-cFos-egr1-03 (1).tif',
-            'files/derivative/sub-keastlab-r18-251/sam-20180831-NW-cFos-th-03.tif': 'files/derivative/sub-keastlab-r18-251/sam-20180831-NW-cFos-th-03 (1).tif',
-            'files/derivative/sub-keastlab-r18-251/sam-20180713-NW-cFos-egr1-02.tif': 'files/derivative/sub-keastlab-r18-251/sam-20180713-NW-cFos-egr1-02 (1).tif',
-            'files/derivative/sub-keastlab-r18-251/sam-20180927-NW-cFos-pax2-04.tif': 'files/derivative/sub-keastlab-r18-251/sam-20180927-NW-cFos-pax2-04 (1).tif',
-            'files/derivative/sub-keastlab-r18-251/sam-20180927-NW-cFos-pax2-15.tif': 'files/derivative/sub-keastlab-r18-251/sam-20180927-NW-cFos-pax2-15 (1).tif',
-            'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-pax2-13.tif': 'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-pax2-13 (1).tif',
-            'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-th-43.tif': 'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-th-43 (1).tif',
-            'files/derivative/sub-keastlab-r18-251/sam-20180927-NW-cFos-pax2-02.tif': 'files/derivative/sub-keastlab-r18-251/sam-20180927-NW-cFos-pax2-02 (1).tif',
-            'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-pax2-18.tif': 'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-pax2-18 (1).tif',
-            'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-pax2-20.tif': 'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-pax2-20 (1).tif',
-            'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-pax2-04.tif': 'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-pax2-04 (1).tif',
-            'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-th-32.tif': 'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-th-32 (1).tif',
-            'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-pax2-10.tif': 'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-pax2-10 (1).tif',
-            'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-th-39.tif': 'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-th-39 (1).tif',
-            'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-pax2-12.tif': 'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-pax2-12 (1).tif',
-            'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-pax2-05.tif': 'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-pax2-05 (1).tif',
-            'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-th-37.tif': 'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-th-37 (1).tif',
-            'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-pax2-08.tif': 'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-pax2-08 (1).tif',
-            'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-pax2-06.tif': 'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-pax2-06 (1).tif',
-            'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-th-51.tif': 'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-th-51 (1).tif',
-            'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-pax2-07.tif': 'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-pax2-07 (1).tif',
-            'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-pax2-11.tif': 'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-pax2-11 (1).tif',
-            'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-pax2-02.tif': 'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-pax2-02 (1).tif',
-            'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-pax2-09.tif': 'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-pax2-09 (1).tif',
-            'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-pax2-03.tif': 'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-pax2-03 (1).tif',
-            'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-pax2-17.tif': 'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-pax2-17 (1).tif',
-            'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-th-49.tif': 'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-th-49 (1).tif',
-            'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-pax2-19.tif': 'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-pax2-19 (1).tif',
-            'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-th-47.tif': 'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-th-47 (1).tif',
-            'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-pax2-14.tif': 'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-pax2-14 (1).tif',
-            'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-pax2-15.tif': 'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-pax2-15 (1).tif',
-            'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-th-41.tif': 'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-th-41 (1).tif',
-            'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-pax2-01.tif': 'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-pax2-01 (1).tif',
-            'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-th-45.tif': 'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-th-45 (1).tif',
-            'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-pax2-16.tif': 'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-pax2-16 (1).tif',
-            'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-th-35.tif': 'files/derivative/sub-keastlab-r17-164/sam-20190124-NW-cFos-th-35 (1).tif',
-            'files/derivative/sub-keastlab-r17-164/R17-164-TissueMakerStack.tif': 'files/derivative/sub-keastlab-r17-164/R17-164-TissueMakerStack (1).tif',
-            'files/derivative/sub-keastlab-r18-312/sam-20180927-NW-cFos-egr1-11.tif': 'files/derivative/sub-keastlab-r18-312/sam-20180927-NW-cFos-egr1-11 (1).tif',
-            'files/derivative/sub-keastlab-r18-312/sam-20180927-NW-cFos-egr1-07.tif': 'files/derivative/sub-keastlab-r18-312/sam-20180927-NW-cFos-egr1-07 (1).tif',
-            'files/derivative/sub-keastlab-r18-312/sam-20180927-NW-cFos-egr1-16.tif': 'files/derivative/sub-keastlab-r18-312/sam-20180927-NW-cFos-egr1-16 (1).tif',
-            'files/derivative/sub-keastlab-r18-312/sam-20180927-NW-cFos-egr1-05.tif': 'files/derivative/sub-keastlab-r18-312/sam-20180927-NW-cFos-egr1-05 (1).tif',
-            'files/derivative/sub-keastlab-r18-312/sam-20180927-NW-cFos-egr1-14.tif': 'files/derivative/sub-keastlab-r18-312/sam-20180927-NW-cFos-egr1-14 (1).tif',
-            'files/derivative/sub-keastlab-r18-312/R18-312-TissueMakerStack.tif': 'files/derivative/sub-keastlab-r18-312/R18-312-TissueMakerStack (1).tif',
-            'files/derivative/sub-keastlab-r18-312/sam-20180927-NW-cFos-egr1-03.tif': 'files/derivative/sub-keastlab-r18-312/sam-20180927-NW-cFos-egr1-03 (1).tif',
-            'files/derivative/sub-keastlab-r18-312/sam-20180927-NW-cFos-egr1-17.tif': 'files/derivative/sub-keastlab-r18-312/sam-20180927-NW-cFos-egr1-17 (1).tif',
-            'files/derivative/sub-keastlab-r18-312/sam-20180927-NW-cFos-egr1-10.jp2': 'files/derivative/sub-keastlab-r18-312/sam-20180927-NW-cFos-egr1-10 (1).jp2',
-            'files/derivative/sub-keastlab-r18-312/sam-20180927-NW-cFos-egr1-01.tif': 'files/derivative/sub-keastlab-r18-312/sam-20180927-NW-cFos-egr1-01 (1).tif',
-            'files/derivative/sub-keastlab-r18-312/sam-20180927-NW-cFos-egr1-06.tif': 'files/derivative/sub-keastlab-r18-312/sam-20180927-NW-cFos-egr1-06 (1).tif',
-            'files/derivative/sub-keastlab-r18-312/sam-20180927-NW-cFos-egr1-13.tif': 'files/derivative/sub-keastlab-r18-312/sam-20180927-NW-cFos-egr1-13 (1).tif',
-            'files/derivative/sub-keastlab-r18-312/sam-20180927-NW-cFos-egr1-08.tif': 'files/derivative/sub-keastlab-r18-312/sam-20180927-NW-cFos-egr1-08 (1).tif',
-            'files/derivative/sub-keastlab-r18-312/sam-20180927-NW-cFos-egr1-15.tif': 'files/derivative/sub-keastlab-r18-312/sam-20180927-NW-cFos-egr1-15 (1).tif',
-            'files/derivative/sub-keastlab-r18-312/sam-20180927-NW-cFos-egr1-02.tif': 'files/derivative/sub-keastlab-r18-312/sam-20180927-NW-cFos-egr1-02 (1).tif',
-            'files/derivative/sub-keastlab-r18-290/sam-20180816-NW-cFos-th-010.tif': 'files/derivative/sub-keastlab-r18-290/sam-20180816-NW-cFos-th-010 (1).tif',
-            'files/derivative/sub-keastlab-r18-290/sam-20180816-NW-cFos-th-07.tif': 'files/derivative/sub-keastlab-r18-290/sam-20180816-NW-cFos-th-07 (1).tif',
-            'files/derivative/sub-keastlab-r18-290/sam-20180724-NW-cFos-pax2-06.tif': 'files/derivative/sub-keastlab-r18-290/sam-20180724-NW-cFos-pax2-06 (1).tif',
-            'files/derivative/sub-keastlab-r18-290/sam-20181017-NW-cFos-egr1-20.tif': 'files/derivative/sub-keastlab-r18-290/sam-20181017-NW-cFos-egr1-20 (1).tif',
-            'files/derivative/sub-keastlab-r18-290/sam-20180724-NW-cFos-pax2-12.tif': 'files/derivative/sub-keastlab-r18-290/sam-20180724-NW-cFos-pax2-12 (1).tif',
-            'files/derivative/sub-keastlab-r18-290/sam-20181017-NW-cFos-egr1-03.tif': 'files/derivative/sub-keastlab-r18-290/sam-20181017-NW-cFos-egr1-03 (1).tif',
-            'files/derivative/sub-keastlab-r18-290/sam-20180724-NW-cFos-pax2-09.tif': 'files/derivative/sub-keastlab-r18-290/sam-20180724-NW-cFos-pax2-09 (1).tif',
-            'files/derivative/sub-keastlab-r18-290/sam-20180724-NW-cFos-pax2-11.tif': 'files/derivative/sub-keastlab-r18-290/sam-20180724-NW-cFos-pax2-11 (1).tif',
-            'files/derivative/sub-keastlab-r18-290/sam-20180724-NW-cFos-pax2-15.tif': 'files/derivative/sub-keastlab-r18-290/sam-20180724-NW-cFos-pax2-15 (1).tif',
-            'files/derivative/sub-keastlab-r18-290/sam-20181017-NW-cFos-egr1-14.tif': 'files/derivative/sub-keastlab-r18-290/sam-20181017-NW-cFos-egr1-14 (1).tif',
-            'files/derivative/sub-keastlab-r18-290/sam-20180724-NW-cFos-pax2-16.tif': 'files/derivative/sub-keastlab-r18-290/sam-20180724-NW-cFos-pax2-16 (1).tif',
-            'files/derivative/sub-keastlab-r18-290/sam-20180724-NW-cFos-pax2-03.tif': 'files/derivative/sub-keastlab-r18-290/sam-20180724-NW-cFos-pax2-03 (1).tif',
-            'files/derivative/sub-keastlab-r18-290/sam-20180724-NW-cFos-pax2-20.tif': 'files/derivative/sub-keastlab-r18-290/sam-20180724-NW-cFos-pax2-20 (1).tif',
-            'files/derivative/sub-keastlab-r18-290/sam-20181017-NW-cFos-egr1-19.tif': 'files/derivative/sub-keastlab-r18-290/sam-20181017-NW-cFos-egr1-19 (1).tif',
-            'files/derivative/sub-keastlab-r18-290/sam-20181017-NW-cFos-egr1-15.tif': 'files/derivative/sub-keastlab-r18-290/sam-20181017-NW-cFos-egr1-15 (1).tif',
-            'files/derivative/sub-keastlab-r18-290/sam-20181017-NW-cFos-egr1-01.tif': 'files/derivative/sub-keastlab-r18-290/sam-20181017-NW-cFos-egr1-01 (1).tif',
-            'files/derivative/sub-keastlab-r18-290/sam-20180724-NW-cFos-pax2-01.tif': 'files/derivative/sub-keastlab-r18-290/sam-20180724-NW-cFos-pax2-01 (1).tif',
-            'files/derivative/sub-keastlab-r18-290/sam-20181017-NW-cFos-egr1-02.tif': 'files/derivative/sub-keastlab-r18-290/sam-20181017-NW-cFos-egr1-02 (1).tif',
-            'files/derivative/sub-keastlab-r18-290/sam-20180816-NW-cFos-th-01.tif': 'files/derivative/sub-keastlab-r18-290/sam-20180816-NW-cFos-th-01 (1).tif',
-            'files/derivative/sub-keastlab-r18-290/sam-20181017-NW-cFos-egr1-07.tif': 'files/derivative/sub-keastlab-r18-290/sam-20181017-NW-cFos-egr1-07 (1).tif',
-            'files/derivative/sub-keastlab-r18-290/sam-20181017-NW-cFos-egr1-17.tif': 'files/derivative/sub-keastlab-r18-290/sam-20181017-NW-cFos-egr1-17 (1).tif',
-            'files/derivative/sub-keastlab-r18-290/sam-20180816-NW-cFos-th-03.tif': 'files/derivative/sub-keastlab-r18-290/sam-20180816-NW-cFos-th-03 (1).tif',
-            'files/derivative/sub-keastlab-r18-290/sam-20180724-NW-cFos-pax2-05.tif': 'files/derivative/sub-keastlab-r18-290/sam-20180724-NW-cFos-pax2-05 (1).tif',
-            'files/derivative/sub-keastlab-r18-290/sam-20180816-NW-cFos-th-02.tif': 'files/derivative/sub-keastlab-r18-290/sam-20180816-NW-cFos-th-02 (1).tif',
-            'files/derivative/sub-keastlab-r18-290/sam-20180724-NW-cFos-pax2-13.tif': 'files/derivative/sub-keastlab-r18-290/sam-20180724-NW-cFos-pax2-13 (1).tif',
-            'files/derivative/sub-keastlab-r18-290/sam-20181017-NW-cFos-egr1-11.tif': 'files/derivative/sub-keastlab-r18-290/sam-20181017-NW-cFos-egr1-11 (1).tif',
-            'files/derivative/sub-keastlab-r18-290/sam-20181017-NW-cFos-egr1-23.tif': 'files/derivative/sub-keastlab-r18-290/sam-20181017-NW-cFos-egr1-23 (1).tif',
-            'files/derivative/sub-keastlab-r18-290/sam-20181017-NW-cFos-egr1-04.tif': 'files/derivative/sub-keastlab-r18-290/sam-20181017-NW-cFos-egr1-04 (1).tif',
-            'files/derivative/sub-keastlab-r18-290/sam-20181017-NW-cFos-egr1-05.tif': 'files/derivative/sub-keastlab-r18-290/sam-20181017-NW-cFos-egr1-05 (1).tif',
-            'files/derivative/sub-keastlab-r18-290/sam-20180816-NW-cFos-th-05.tif': 'files/derivative/sub-keastlab-r18-290/sam-20180816-NW-cFos-th-05 (1).tif',
-            'files/derivative/sub-keastlab-r18-290/sam-20181017-NW-cFos-egr1-18.tif': 'files/derivative/sub-keastlab-r18-290/sam-20181017-NW-cFos-egr1-18 (1).tif',
-            'files/derivative/sub-keastlab-r18-290/sam-20181017-NW-cFos-egr1-13.tif': 'files/derivative/sub-keastlab-r18-290/sam-20181017-NW-cFos-egr1-13 (1).tif',
-            'files/derivative/sub-keastlab-r18-290/sam-20181017-NW-cFos-egr1-12.tif': 'files/derivative/sub-keastlab-r18-290/sam-20181017-NW-cFos-egr1-12 (1).tif',
-            'files/derivative/sub-keastlab-r18-290/sam-20181017-NW-cFos-egr1-06.tif': 'files/derivative/sub-keastlab-r18-290/sam-20181017-NW-cFos-egr1-06 (1).tif',
-            'files/derivative/sub-keastlab-r18-290/sam-20181017-NW-cFos-egr1-08.tif': 'files/derivative/sub-keastlab-r18-290/sam-20181017-NW-cFos-egr1-08 (1).tif',
-            'files/derivative/sub-keastlab-r18-290/sam-20180816-NW-cFos-th-09.tif': 'files/derivative/sub-keastlab-r18-290/sam-20180816-NW-cFos-th-09 (1).tif',
-            'files/derivative/sub-keastlab-r18-290/sam-20181017-NW-cFos-egr1-22.tif': 'files/derivative/sub-keastlab-r18-290/sam-20181017-NW-cFos-egr1-22 (1).tif',
-            'files/derivative/sub-keastlab-r18-290/sam-20180724-NW-cFos-pax2-17.tif': 'files/derivative/sub-keastlab-r18-290/sam-20180724-NW-cFos-pax2-17 (1).tif',
-            'files/derivative/sub-keastlab-r18-290/sam-20180724-NW-cFos-pax2-02.tif': 'files/derivative/sub-keastlab-r18-290/sam-20180724-NW-cFos-pax2-02 (1).tif',
-            'files/derivative/sub-keastlab-r18-290/sam-20180724-NW-cFos-pax2-04.tif': 'files/derivative/sub-keastlab-r18-290/sam-20180724-NW-cFos-pax2-04 (1).tif',
-            'files/derivative/sub-keastlab-r18-290/sam-20181017-NW-cFos-egr1-24.tif': 'files/derivative/sub-keastlab-r18-290/sam-20181017-NW-cFos-egr1-24 (1).tif',
-            'files/derivative/sub-keastlab-r18-290/sam-20181017-NW-cFos-egr1-16.tif': 'files/derivative/sub-keastlab-r18-290/sam-20181017-NW-cFos-egr1-16 (1).tif',
-            'files/derivative/sub-keastlab-r18-290/sam-20180724-NW-cFos-pax2-10.tif': 'files/derivative/sub-keastlab-r18-290/sam-20180724-NW-cFos-pax2-10 (1).tif',
-            'files/derivative/sub-keastlab-r18-290/sam-20181017-NW-cFos-egr1-21.tif': 'files/derivative/sub-keastlab-r18-290/sam-20181017-NW-cFos-egr1-21 (1).tif',
-            'files/derivative/sub-keastlab-r18-290/sam-20180816-NW-cFos-th-08.tif': 'files/derivative/sub-keastlab-r18-290/sam-20180816-NW-cFos-th-08 (1).tif',
-            'files/derivative/sub-keastlab-r18-290/sam-20181017-NW-cFos-egr1-10.tif': 'files/derivative/sub-keastlab-r18-290/sam-20181017-NW-cFos-egr1-10 (1).tif',
-            'files/derivative/sub-keastlab-r18-290/sam-20180724-NW-cFos-pax2-18.tif': 'files/derivative/sub-keastlab-r18-290/sam-20180724-NW-cFos-pax2-18 (1).tif',
-            'files/derivative/sub-keastlab-r18-290/sam-20181017-NW-cFos-egr1-09.tif': 'files/derivative/sub-keastlab-r18-290/sam-20181017-NW-cFos-egr1-09 (1).tif',
-            'files/derivative/sub-keastlab-r18-290/sam-20180816-NW-cFos-th-06.tif': 'files/derivative/sub-keastlab-r18-290/sam-20180816-NW-cFos-th-06 (1).tif',
-            'files/derivative/sub-keastlab-r18-290/sam-20180816-NW-cFos-th-04.tif': 'files/derivative/sub-keastlab-r18-290/sam-20180816-NW-cFos-th-04 (1).tif',
-            'files/derivative/sub-keastlab-r18-290/sam-20180724-NW-cFos-pax2-08.tif': 'files/derivative/sub-keastlab-r18-290/sam-20180724-NW-cFos-pax2-08 (1).tif',
-            'files/derivative/sub-keastlab-r18-290/sam-20180724-NW-cFos-pax2-14.tif': 'files/derivative/sub-keastlab-r18-290/sam-20180724-NW-cFos-pax2-14 (1).tif',
-            'files/derivative/sub-keastlab-r18-290/sam-20180724-NW-cFos-pax2-07.tif': 'files/derivative/sub-keastlab-r18-290/sam-20180724-NW-cFos-pax2-07 (1).tif',
-            'files/derivative/sub-keastlab-r18-290/sam-20180724-NW-cFos-pax2-19.tif': 'files/derivative/sub-keastlab-r18-290/sam-20180724-NW-cFos-pax2-19 (1).tif',
-            'files/derivative/sub-keastlab-r17-161/sam-20190102-NW-cFos-pax2-07.tif': 'files/derivative/sub-keastlab-r17-161/sam-20190102-NW-cFos-pax2-07 (1).tif',
-            'files/derivative/sub-keastlab-r17-161/sam-20190102-NW-cFos-pax2-05.tif': 'files/derivative/sub-keastlab-r17-161/sam-20190102-NW-cFos-pax2-05 (1).tif',
-            'files/derivative/sub-keastlab-r17-161/sam-20190102-NW-cFos-pax2-10.tif': 'files/derivative/sub-keastlab-r17-161/sam-20190102-NW-cFos-pax2-10 (1).tif',
-            'files/derivative/sub-keastlab-r17-161/sam-20190102-NW-cFos-pax2-16.tif': 'files/derivative/sub-keastlab-r17-161/sam-20190102-NW-cFos-pax2-16 (1).tif',
-            'files/derivative/sub-keastlab-r17-161/sam-20190110-NW-cFos-th-08.tif': 'files/derivative/sub-keastlab-r17-161/sam-20190110-NW-cFos-th-08 (1).tif',
-            'files/derivative/sub-keastlab-r17-161/sam-20190102-NW-cFos-pax2-20.tif': 'files/derivative/sub-keastlab-r17-161/sam-20190102-NW-cFos-pax2-20 (1).tif',
-            'files/derivative/sub-keastlab-r17-161/sam-20190102-NW-cFos-pax2-22.tif': 'files/derivative/sub-keastlab-r17-161/sam-20190102-NW-cFos-pax2-22 (1).tif',
-            'files/derivative/sub-keastlab-r17-161/sam-20190110-NW-cFos-th-010.tif': 'files/derivative/sub-keastlab-r17-161/sam-20190110-NW-cFos-th-010 (1).tif',
-            'files/derivative/sub-keastlab-r17-161/sam-20190102-NW-cFos-pax2-03.tif': 'files/derivative/sub-keastlab-r17-161/sam-20190102-NW-cFos-pax2-03 (1).tif',
-            'files/derivative/sub-keastlab-r17-161/sam-20190110-NW-cFos-th-09.tif': 'files/derivative/sub-keastlab-r17-161/sam-20190110-NW-cFos-th-09 (1).tif',
-            'files/derivative/sub-keastlab-r17-161/sam-20190102-NW-cFos-pax2-11.tif': 'files/derivative/sub-keastlab-r17-161/sam-20190102-NW-cFos-pax2-11 (1).tif',
-            'files/derivative/sub-keastlab-r17-161/sam-20190110-NW-cFos-th-04.tif': 'files/derivative/sub-keastlab-r17-161/sam-20190110-NW-cFos-th-04 (1).tif',
-            'files/derivative/sub-keastlab-r17-161/sam-20190102-NW-cFos-pax2-17.tif': 'files/derivative/sub-keastlab-r17-161/sam-20190102-NW-cFos-pax2-17 (1).tif',
-            'files/derivative/sub-keastlab-r17-161/sam-20190110-NW-cFos-th-06.tif': 'files/derivative/sub-keastlab-r17-161/sam-20190110-NW-cFos-th-06 (1).tif',
-            'files/derivative/sub-keastlab-r17-161/sam-20190110-NW-cFos-th-05.jp2': 'files/derivative/sub-keastlab-r17-161/sam-20190110-NW-cFos-th-05 (1).jp2',
-            'files/derivative/sub-keastlab-r17-161/sam-20190102-NW-cFos-pax2-15.tif': 'files/derivative/sub-keastlab-r17-161/sam-20190102-NW-cFos-pax2-15 (1).tif',
-            'files/derivative/sub-keastlab-r17-161/sam-20190102-NW-cFos-pax2-23.tif': 'files/derivative/sub-keastlab-r17-161/sam-20190102-NW-cFos-pax2-23 (1).tif',
-            'files/derivative/sub-keastlab-r17-161/sam-20190102-NW-cFos-pax2-04.tif': 'files/derivative/sub-keastlab-r17-161/sam-20190102-NW-cFos-pax2-04 (1).tif',
-            'files/derivative/sub-keastlab-r17-161/sam-20190102-NW-cFos-pax2-08.tif': 'files/derivative/sub-keastlab-r17-161/sam-20190102-NW-cFos-pax2-08 (1).tif',
-            'files/derivative/sub-keastlab-r17-161/sam-20190110-NW-cFos-th-01.tif': 'files/derivative/sub-keastlab-r17-161/sam-20190110-NW-cFos-th-01 (1).tif',
-            'files/derivative/sub-keastlab-r17-161/sam-20190102-NW-cFos-pax2-18.tif': 'files/derivative/sub-keastlab-r17-161/sam-20190102-NW-cFos-pax2-18 (1).tif',
-            'files/derivative/sub-keastlab-r17-161/sam-20190110-NW-cFos-th-02.tif': 'files/derivative/sub-keastlab-r17-161/sam-20190110-NW-cFos-th-02 (1).tif',
-            'files/derivative/sub-keastlab-r17-161/sam-20190110-NW-cFos-th-03.tif': 'files/derivative/sub-keastlab-r17-161/sam-20190110-NW-cFos-th-03 (1).tif',
-            'files/derivative/sub-keastlab-r17-161/sam-20190102-NW-cFos-pax2-09.tif': 'files/derivative/sub-keastlab-r17-161/sam-20190102-NW-cFos-pax2-09 (1).tif',
-            'files/derivative/sub-keastlab-r17-161/sam-20190102-NW-cFos-pax2-19.tif': 'files/derivative/sub-keastlab-r17-161/sam-20190102-NW-cFos-pax2-19 (1).tif',
-            'files/derivative/sub-keastlab-r17-161/sam-20190102-NW-cFos-pax2-21.tif': 'files/derivative/sub-keastlab-r17-161/sam-20190102-NW-cFos-pax2-21 (1).tif',
-            'files/derivative/sub-keastlab-r17-161/sam-20190102-NW-cFos-pax2-12.tif': 'files/derivative/sub-keastlab-r17-161/sam-20190102-NW-cFos-pax2-12 (1).tif',
-            'files/derivative/sub-keastlab-r17-161/sam-20190102-NW-cFos-pax2-06.tif': 'files/derivative/sub-keastlab-r17-161/sam-20190102-NW-cFos-pax2-06 (1).tif',
-            'files/derivative/sub-keastlab-r17-161/sam-20190110-NW-cFos-th-07.tif': 'files/derivative/sub-keastlab-r17-161/sam-20190110-NW-cFos-th-07 (1).tif',
-            'files/derivative/sub-keastlab-r17-161/sam-20190102-NW-cFos-pax2-14.tif': 'files/derivative/sub-keastlab-r17-161/sam-20190102-NW-cFos-pax2-14 (1).tif',
-            'files/derivative/sub-keastlab-r18-291/sam-20180718-NW-cFos-egr1-65.tif': 'files/derivative/sub-keastlab-r18-291/sam-20180718-NW-cFos-egr1-65 (1).tif',
-            'files/derivative/sub-keastlab-r18-291/sam-20180718-NW-cFos-th-05.tif': 'files/derivative/sub-keastlab-r18-291/sam-20180718-NW-cFos-th-05 (1).tif',
-            'files/derivative/sub-keastlab-r18-291/sam-20180718-NW-cFos-egr1-63.tif': 'files/derivative/sub-keastlab-r18-291/sam-20180718-NW-cFos-egr1-63 (1).tif',
-            'files/derivative/sub-keastlab-r18-291/sam-20180727-NW-cFos-pax2-20.tif': 'files/derivative/sub-keastlab-r18-291/sam-20180727-NW-cFos-pax2-20 (1).tif',
-            'files/derivative/sub-keastlab-r18-291/sam-20180727-NW-cFos-pax2-09.tif': 'files/derivative/sub-keastlab-r18-291/sam-20180727-NW-cFos-pax2-09 (1).tif',
-            'files/derivative/sub-keastlab-r18-291/sam-20180718-NW-cFos-th-07.tif': 'files/derivative/sub-keastlab-r18-291/sam-20180718-NW-cFos-th-07 (1).tif',
-            'files/derivative/sub-keastlab-r18-291/sam-20180727-NW-cFos-pax2-19.tif': 'files/derivative/sub-keastlab-r18-291/sam-20180727-NW-cFos-pax2-19 (1).tif',
-            'files/derivative/sub-keastlab-r18-291/sam-20180727-NW-cFos-pax2-02.tif': 'files/derivative/sub-keastlab-r18-291/sam-20180727-NW-cFos-pax2-02 (1).tif',
-            'files/derivative/sub-keastlab-r18-291/sam-20180718-NW-cFos-egr1-62.tif': 'files/derivative/sub-keastlab-r18-291/sam-20180718-NW-cFos-egr1-62 (1).tif',
-            'files/derivative/sub-keastlab-r18-291/sam-20180718-NW-cFos-egr1-74.tif': 'files/derivative/sub-keastlab-r18-291/sam-20180718-NW-cFos-egr1-74 (1).tif',
-            'files/derivative/sub-keastlab-r18-291/sam-20180718-NW-cFos-egr1-60.tif': 'files/derivative/sub-keastlab-r18-291/sam-20180718-NW-cFos-egr1-60 (1).tif',
-            'files/derivative/sub-keastlab-r18-291/sam-20180718-NW-cFos-egr1-64.tif': 'files/derivative/sub-keastlab-r18-291/sam-20180718-NW-cFos-egr1-64 (1).tif',
-            'files/derivative/sub-keastlab-r18-291/sam-20180718-NW-cFos-th-01.tif': 'files/derivative/sub-keastlab-r18-291/sam-20180718-NW-cFos-th-01 (1).tif',
-            'files/derivative/sub-keastlab-r18-291/sam-20180727-NW-cFos-pax2-10.tif': 'files/derivative/sub-keastlab-r18-291/sam-20180727-NW-cFos-pax2-10 (1).tif',
-            'files/derivative/sub-keastlab-r18-291/sam-20180718-NW-cFos-egr1-72.tif': 'files/derivative/sub-keastlab-r18-291/sam-20180718-NW-cFos-egr1-72 (1).tif',
-            'files/derivative/sub-keastlab-r18-291/sam-20180718-NW-cFos-egr1-75.tif': 'files/derivative/sub-keastlab-r18-291/sam-20180718-NW-cFos-egr1-75 (1).tif',
-            'files/derivative/sub-keastlab-r18-291/sam-20180718-NW-cFos-egr1-71.tif': 'files/derivative/sub-keastlab-r18-291/sam-20180718-NW-cFos-egr1-71 (1).tif',
-            'files/derivative/sub-keastlab-r18-291/sam-20180718-NW-cFos-egr1-61.tif': 'files/derivative/sub-keastlab-r18-291/sam-20180718-NW-cFos-egr1-61 (1).tif',
-            'files/derivative/sub-keastlab-r18-291/sam-20180718-NW-cFos-egr1-55.tif': 'files/derivative/sub-keastlab-r18-291/sam-20180718-NW-cFos-egr1-55 (1).tif',
-            'files/derivative/sub-keastlab-r18-291/sam-20180718-NW-cFos-egr1-73.tif': 'files/derivative/sub-keastlab-r18-291/sam-20180718-NW-cFos-egr1-73 (1).tif',
-            'files/derivative/sub-keastlab-r18-291/sam-20180727-NW-cFos-pax2-08.tif': 'files/derivative/sub-keastlab-r18-291/sam-20180727-NW-cFos-pax2-08 (1).tif',
-            'files/derivative/sub-keastlab-r18-291/sam-20180727-NW-cFos-pax2-15.tif': 'files/derivative/sub-keastlab-r18-291/sam-20180727-NW-cFos-pax2-15 (1).tif',
-            'files/derivative/sub-keastlab-r18-291/sam-20180718-NW-cFos-egr1-67.tif': 'files/derivative/sub-keastlab-r18-291/sam-20180718-NW-cFos-egr1-67 (1).tif',
-            'files/derivative/sub-keastlab-r18-291/sam-20180718-NW-cFos-egr1-69.tif': 'files/derivative/sub-keastlab-r18-291/sam-20180718-NW-cFos-egr1-69 (1).tif',
-            'files/derivative/sub-keastlab-r18-291/sam-20180718-NW-cFos-th-09.tif': 'files/derivative/sub-keastlab-r18-291/sam-20180718-NW-cFos-th-09 (1).tif',
-            'files/derivative/sub-keastlab-r18-291/sam-20180718-NW-cFos-egr1-66.tif': 'files/derivative/sub-keastlab-r18-291/sam-20180718-NW-cFos-egr1-66 (1).tif',
-            'files/derivative/sub-keastlab-r18-291/sam-20180727-NW-cFos-pax2-04.tif': 'files/derivative/sub-keastlab-r18-291/sam-20180727-NW-cFos-pax2-04 (1).tif',
-            'files/derivative/sub-keastlab-r18-291/sam-20180727-NW-cFos-pax2-11.tif': 'files/derivative/sub-keastlab-r18-291/sam-20180727-NW-cFos-pax2-11 (1).tif',
-            'files/derivative/sub-keastlab-r18-291/sam-20180718-NW-cFos-th-02.tif': 'files/derivative/sub-keastlab-r18-291/sam-20180718-NW-cFos-th-02 (1).tif',
-            'files/derivative/sub-keastlab-r18-291/sam-20180727-NW-cFos-pax2-13.tif': 'files/derivative/sub-keastlab-r18-291/sam-20180727-NW-cFos-pax2-13 (1).tif',
-            'files/derivative/sub-keastlab-r18-291/sam-20180718-NW-cFos-egr1-56.tif': 'files/derivative/sub-keastlab-r18-291/sam-20180718-NW-cFos-egr1-56 (1).tif',
-            'files/derivative/sub-keastlab-r18-291/sam-20180718-NW-cFos-egr1-54.tif': 'files/derivative/sub-keastlab-r18-291/sam-20180718-NW-cFos-egr1-54 (1).tif',
-            'files/derivative/sub-keastlab-r18-291/sam-20180727-NW-cFos-pax2-07.tif': 'files/derivative/sub-keastlab-r18-291/sam-20180727-NW-cFos-pax2-07 (1).tif',
-            'files/derivative/sub-keastlab-r18-291/sam-20180718-NW-cFos-th-06.tif': 'files/derivative/sub-keastlab-r18-291/sam-20180718-NW-cFos-th-06 (1).tif',
-            'files/derivative/sub-keastlab-r18-291/sam-20180727-NW-cFos-pax2-06.tif': 'files/derivative/sub-keastlab-r18-291/sam-20180727-NW-cFos-pax2-06 (1).tif',
-            'files/derivative/sub-keastlab-r18-291/sam-20180727-NW-cFos-pax2-01.tif': 'files/derivative/sub-keastlab-r18-291/sam-20180727-NW-cFos-pax2-01 (1).tif',
-            'files/derivative/sub-keastlab-r18-291/sam-20180727-NW-cFos-pax2-03.tif': 'files/derivative/sub-keastlab-r18-291/sam-20180727-NW-cFos-pax2-03 (1).tif',
-            'files/derivative/sub-keastlab-r18-291/sam-20180727-NW-cFos-pax2-05.tif': 'files/derivative/sub-keastlab-r18-291/sam-20180727-NW-cFos-pax2-05 (1).tif',
-            'files/derivative/sub-keastlab-r18-291/sam-20180718-NW-cFos-egr1-53.tif': 'files/derivative/sub-keastlab-r18-291/sam-20180718-NW-cFos-egr1-53 (1).tif',
-            'files/derivative/sub-keastlab-r18-291/sam-20180718-NW-cFos-th-08.tif': 'files/derivative/sub-keastlab-r18-291/sam-20180718-NW-cFos-th-08 (1).tif',
-            'files/derivative/sub-keastlab-r18-291/sam-20180727-NW-cFos-pax2-16.tif': 'files/derivative/sub-keastlab-r18-291/sam-20180727-NW-cFos-pax2-16 (1).tif',
-            'files/derivative/sub-keastlab-r18-291/sam-20180718-NW-cFos-th-010_.tif': 'files/derivative/sub-keastlab-r18-291/sam-20180718-NW-cFos-th-010_ (1).tif',
-            'files/derivative/sub-keastlab-r18-291/sam-20180718-NW-cFos-egr1-57.jp2': 'files/derivative/sub-keastlab-r18-291/sam-20180718-NW-cFos-egr1-57 (1).jp2',
-            'files/derivative/sub-keastlab-r17-180/sam-20190205-NW-cFos-pax2-04.tif': 'files/derivative/sub-keastlab-r17-180/sam-20190205-NW-cFos-pax2-04 (1).tif',
-            'files/derivative/sub-keastlab-r18-291/sam-20180718-NW-cFos-egr1-68.tif': 'files/derivative/sub-keastlab-r18-291/sam-20180718-NW-cFos-egr1-68 (1).tif',
-            'files/derivative/sub-keastlab-r17-180/sam-20190205-NW-cFos-pax2-011.tif': 'files/derivative/sub-keastlab-r17-180/sam-20190205-NW-cFos-pax2-011 (1).tif',
-            'files/derivative/sub-keastlab-r17-180/sam-20190129-NW-cFos-th-28.tif': 'files/derivative/sub-keastlab-r17-180/sam-20190129-NW-cFos-th-28 (1).tif',
-            'files/derivative/sub-keastlab-r17-180/sam-20190205-NW-cFos-pax2-015.tif': 'files/derivative/sub-keastlab-r17-180/sam-20190205-NW-cFos-pax2-015 (1).tif',
-            'files/derivative/sub-keastlab-r17-180/sam-20190129-NW-cFos-th-38.tif': 'files/derivative/sub-keastlab-r17-180/sam-20190129-NW-cFos-th-38 (1).tif',
-            'files/derivative/sub-keastlab-r17-180/sam-20190129-NW-cFos-th-36.tif': 'files/derivative/sub-keastlab-r17-180/sam-20190129-NW-cFos-th-36 (1).tif',
-            'files/derivative/sub-keastlab-r17-180/sam-20190129-NW-cFos-th-26.tif': 'files/derivative/sub-keastlab-r17-180/sam-20190129-NW-cFos-th-26 (1).tif',
-            'files/derivative/sub-keastlab-r17-180/sam-20190205-NW-cFos-pax2-012.tif': 'files/derivative/sub-keastlab-r17-180/sam-20190205-NW-cFos-pax2-012 (1).tif',
-            'files/derivative/sub-keastlab-r17-180/sam-20190205-NW-cFos-pax2-014.tif': 'files/derivative/sub-keastlab-r17-180/sam-20190205-NW-cFos-pax2-014 (1).tif',
-            'files/derivative/sub-keastlab-r17-180/sam-20190205-NW-cFos-pax2-06.tif': 'files/derivative/sub-keastlab-r17-180/sam-20190205-NW-cFos-pax2-06 (1).tif',
-            'files/derivative/sub-keastlab-r17-180/sam-20190205-NW-cFos-pax2-07.tif': 'files/derivative/sub-keastlab-r17-180/sam-20190205-NW-cFos-pax2-07 (1).tif',
-            'files/derivative/sub-keastlab-r17-180/sam-20190205-NW-cFos-pax2-019.tif': 'files/derivative/sub-keastlab-r17-180/sam-20190205-NW-cFos-pax2-019 (1).tif',
-            'files/derivative/sub-keastlab-r17-180/sam-20190205-NW-cFos-pax2-016.tif': 'files/derivative/sub-keastlab-r17-180/sam-20190205-NW-cFos-pax2-016 (1).tif',
-            'files/derivative/sub-keastlab-r17-180/sam-20190129-NW-cFos-th-34.tif': 'files/derivative/sub-keastlab-r17-180/sam-20190129-NW-cFos-th-34 (1).tif',
-            'files/derivative/sub-keastlab-r17-180/sam-20190129-NW-cFos-th-44.tif': 'files/derivative/sub-keastlab-r17-180/sam-20190129-NW-cFos-th-44 (1).tif',
-            'files/derivative/sub-keastlab-r17-180/sam-20190205-NW-cFos-pax2-02.tif': 'files/derivative/sub-keastlab-r17-180/sam-20190205-NW-cFos-pax2-02 (1).tif',
-            'files/derivative/sub-keastlab-r17-180/sam-20190205-NW-cFos-pax2-010.tif': 'files/derivative/sub-keastlab-r17-180/sam-20190205-NW-cFos-pax2-010 (1).tif',
-            'files/derivative/sub-keastlab-r17-180/sam-20190205-NW-cFos-pax2-08.tif': 'files/derivative/sub-keastlab-r17-180/sam-20190205-NW-cFos-pax2-08 (1).tif',
-            'files/derivative/sub-keastlab-r17-180/sam-20190205-NW-cFos-pax2-03.tif': 'files/derivative/sub-keastlab-r17-180/sam-20190205-NW-cFos-pax2-03 (1).tif',
-            'files/derivative/sub-keastlab-r17-180/sam-20190129-NW-cFos-th-40.tif': 'files/derivative/sub-keastlab-r17-180/sam-20190129-NW-cFos-th-40 (1).tif',
-            'files/derivative/sub-keastlab-r17-180/sam-20190205-NW-cFos-pax2-017.tif': 'files/derivative/sub-keastlab-r17-180/sam-20190205-NW-cFos-pax2-017 (1).tif',
-            'files/derivative/sub-keastlab-r17-180/sam-20190205-NW-cFos-pax2-09.tif': 'files/derivative/sub-keastlab-r17-180/sam-20190205-NW-cFos-pax2-09 (1).tif',
-            'files/derivative/sub-keastlab-r17-180/sam-20190205-NW-cFos-pax2-018.tif': 'files/derivative/sub-keastlab-r17-180/sam-20190205-NW-cFos-pax2-018 (1).tif',
-            'files/derivative/sub-keastlab-r17-180/sam-20190205-NW-cFos-pax2-01.tif': 'files/derivative/sub-keastlab-r17-180/sam-20190205-NW-cFos-pax2-01 (1).tif',
-            'files/derivative/sub-keastlab-r17-180/sam-20190129-NW-cFos-th-20.tif': 'files/derivative/sub-keastlab-r17-180/sam-20190129-NW-cFos-th-20 (1).tif',
-            'files/derivative/sub-keastlab-r17-180/sam-20190205-NW-cFos-pax2-05.tif': 'files/derivative/sub-keastlab-r17-180/sam-20190205-NW-cFos-pax2-05 (1).tif',
-            'files/derivative/sub-keastlab-r17-180/sam-20190129-NW-cFos-th-32.tif': 'files/derivative/sub-keastlab-r17-180/sam-20190129-NW-cFos-th-32 (1).tif',
-            'files/derivative/sub-keastlab-r17-180/sam-20190205-NW-cFos-pax2-013.tif': 'files/derivative/sub-keastlab-r17-180/sam-20190205-NW-cFos-pax2-013 (1).tif',
-            'files/derivative/sub-keastlab-r17-180/sam-20190205-NW-cFos-pax2-020.tif': 'files/derivative/sub-keastlab-r17-180/sam-20190205-NW-cFos-pax2-020 (1).tif',
-            'files/derivative/sub-keastlab-r17-180/sam-20190129-NW-cFos-th-30.tif': 'files/derivative/sub-keastlab-r17-180/sam-20190129-NW-cFos-th-30 (1).tif',
-            'files/derivative/sub-keastlab-r19-424/sam-20190401-NW-cFos-egr1-37.tif': 'files/derivative/sub-keastlab-r19-424/sam-20190401-NW-cFos-egr1-37 (1).tif',
-            'files/derivative/sub-keastlab-r19-424/sam-20190401-NW-cFos-egr1-28.tif': 'files/derivative/sub-keastlab-r19-424/sam-20190401-NW-cFos-egr1-28 (1).tif',
-            'files/derivative/sub-keastlab-r19-424/sam-20190401-NW-cFos-egr1-30.tif': 'files/derivative/sub-keastlab-r19-424/sam-20190401-NW-cFos-egr1-30 (1).tif',
-            'files/derivative/sub-keastlab-r19-424/sam-20190401-NW-cFos-egr1-34.tif': 'files/derivative/sub-keastlab-r19-424/sam-20190401-NW-cFos-egr1-34 (1).tif',
-            'files/derivative/sub-keastlab-r19-424/sam-20190401-NW-cFos-egr1-26.tif': 'files/derivative/sub-keastlab-r19-424/sam-20190401-NW-cFos-egr1-26 (1).tif',
-            'files/derivative/sub-keastlab-r19-424/sam-20190401-NW-cFos-egr1-25.tif': 'files/derivative/sub-keastlab-r19-424/sam-20190401-NW-cFos-egr1-25 (1).tif',
-            'files/derivative/sub-keastlab-r19-424/sam-20190401-NW-cFos-egr1-22.tif': 'files/derivative/sub-keastlab-r19-424/sam-20190401-NW-cFos-egr1-22 (1).tif',
-            'files/derivative/sub-keastlab-r19-424/sam-20190401-NW-cFos-egr1-24.tif': 'files/derivative/sub-keastlab-r19-424/sam-20190401-NW-cFos-egr1-24 (1).tif',
-            'files/derivative/sub-keastlab-r19-424/sam-20190401-NW-cFos-egr1-36.tif': 'files/derivative/sub-keastlab-r19-424/sam-20190401-NW-cFos-egr1-36 (1).tif',
-            'files/derivative/sub-keastlab-r19-424/sam-20190401-NW-cFos-egr1-35.tif': 'files/derivative/sub-keastlab-r19-424/sam-20190401-NW-cFos-egr1-35 (1).tif',
-            'files/derivative/sub-keastlab-r19-424/sam-20190401-NW-cFos-egr1-32.tif': 'files/derivative/sub-keastlab-r19-424/sam-20190401-NW-cFos-egr1-32 (1).tif',
-            'files/derivative/sub-keastlab-r19-424/sam-20190401-NW-cFos-egr1-40.tif': 'files/derivative/sub-keastlab-r19-424/sam-20190401-NW-cFos-egr1-40 (1).tif',
-            'files/derivative/sub-keastlab-r19-424/sam-20190401-NW-cFos-egr1-33.tif': 'files/derivative/sub-keastlab-r19-424/sam-20190401-NW-cFos-egr1-33 (1).tif',
-            'files/derivative/sub-keastlab-r19-424/sam-20190401-NW-cFos-egr1-31.tif': 'files/derivative/sub-keastlab-r19-424/sam-20190401-NW-cFos-egr1-31 (1).tif',
-            'files/derivative/sub-keastlab-r19-424/sam-20190401-NW-cFos-egr1-38.tif': 'files/derivative/sub-keastlab-r19-424/sam-20190401-NW-cFos-egr1-38 (1).tif',
-            'files/derivative/sub-keastlab-r19-424/sam-20190401-NW-cFos-egr1-39.tif': 'files/derivative/sub-keastlab-r19-424/sam-20190401-NW-cFos-egr1-39 (1).tif',
-            'files/derivative/sub-keastlab-r19-424/sam-20190401-NW-cFos-egr1-27.tif': 'files/derivative/sub-keastlab-r19-424/sam-20190401-NW-cFos-egr1-27 (1).tif',
-            'files/derivative/sub-keastlab-r19-424/sam-20190401-NW-cFos-egr1-41.tif': 'files/derivative/sub-keastlab-r19-424/sam-20190401-NW-cFos-egr1-41 (1).tif',
-            'files/derivative/sub-keastlab-r19-424/sam-20190401-NW-cFos-egr1-23.jp2': 'files/derivative/sub-keastlab-r19-424/sam-20190401-NW-cFos-egr1-23 (1).jp2',
-            'files/derivative/sub-keastlab-r19-424/sam-20190401-NW-cFos-egr1-29.tif': 'files/derivative/sub-keastlab-r19-424/sam-20190401-NW-cFos-egr1-29 (1).tif',
-            'files/derivative/sub-keastlab-r18-381/sam-20181119-NW-cFos-egr1-11.tif': 'files/derivative/sub-keastlab-r18-381/sam-20181119-NW-cFos-egr1-11 (1).tif',
-            'files/derivative/sub-keastlab-r18-381/sam-20181119-NW-cFos-egr1-03.tif': 'files/derivative/sub-keastlab-r18-381/sam-20181119-NW-cFos-egr1-03 (1).tif',
-            'files/derivative/sub-keastlab-r18-381/sam-20181119-NW-cFos-egr1-14.tif': 'files/derivative/sub-keastlab-r18-381/sam-20181119-NW-cFos-egr1-14 (1).tif',
-            'files/derivative/sub-keastlab-r18-381/sam-20181119-NW-cFos-egr1-08.tif': 'files/derivative/sub-keastlab-r18-381/sam-20181119-NW-cFos-egr1-08 (1).tif',
-            'files/derivative/sub-keastlab-r18-381/sam-20181119-NW-cFos-egr1-12.tif': 'files/derivative/sub-keastlab-r18-381/sam-20181119-NW-cFos-egr1-12 (1).tif',
-            'files/derivative/sub-keastlab-r18-381/sam-20181119-NW-cFos-egr1-07.tif': 'files/derivative/sub-keastlab-r18-381/sam-20181119-NW-cFos-egr1-07 (1).tif',
-            'files/derivative/sub-keastlab-r18-381/sam-20181119-NW-cFos-egr1-04.tif': 'files/derivative/sub-keastlab-r18-381/sam-20181119-NW-cFos-egr1-04 (1).tif',
-            'files/derivative/sub-keastlab-r18-381/sam-20181119-NW-cFos-egr1-17.tif': 'files/derivative/sub-keastlab-r18-381/sam-20181119-NW-cFos-egr1-17 (1).tif',
-            'files/derivative/sub-keastlab-r18-381/sam-20181119-NW-cFos-egr1-01.tif': 'files/derivative/sub-keastlab-r18-381/sam-20181119-NW-cFos-egr1-01 (1).tif',
-            'files/derivative/sub-keastlab-r18-381/sam-20181119-NW-cFos-egr1-21.tif': 'files/derivative/sub-keastlab-r18-381/sam-20181119-NW-cFos-egr1-21 (1).tif',
-            'files/derivative/sub-keastlab-r18-381/sam-20181119-NW-cFos-egr1-09.tif': 'files/derivative/sub-keastlab-r18-381/sam-20181119-NW-cFos-egr1-09 (1).tif',
-            'files/derivative/sub-keastlab-r18-381/sam-20181119-NW-cFos-egr1-16.tif': 'files/derivative/sub-keastlab-r18-381/sam-20181119-NW-cFos-egr1-16 (1).tif',
-            'files/derivative/sub-keastlab-r18-381/sam-20181119-NW-cFos-egr1-10.tif': 'files/derivative/sub-keastlab-r18-381/sam-20181119-NW-cFos-egr1-10 (1).tif',
-            'files/derivative/sub-keastlab-r18-381/sam-20181119-NW-cFos-egr1-06.tif': 'files/derivative/sub-keastlab-r18-381/sam-20181119-NW-cFos-egr1-06 (1).tif',
-            'files/derivative/sub-keastlab-r18-381/sam-20181119-NW-cFos-egr1-05.tif': 'files/derivative/sub-keastlab-r18-381/sam-20181119-NW-cFos-egr1-05 (1).tif',
-            'files/derivative/sub-keastlab-r18-381/sam-20181119-NW-cFos-egr1-15.tif': 'files/derivative/sub-keastlab-r18-381/sam-20181119-NW-cFos-egr1-15 (1).tif',
-            'files/derivative/sub-keastlab-r18-381/sam-20181119-NW-cFos-egr1-13.tif': 'files/derivative/sub-keastlab-r18-381/sam-20181119-NW-cFos-egr1-13 (1).tif',
-            'files/derivative/sub-keastlab-r18-381/sam-20181119-NW-cFos-egr1-19.tif': 'files/derivative/sub-keastlab-r18-381/sam-20181119-NW-cFos-egr1-19 (1).tif',
-            'files/derivative/sub-keastlab-r18-381/sam-20181119-NW-cFos-egr1-18.tif': 'files/derivative/sub-keastlab-r18-381/sam-20181119-NW-cFos-egr1-18 (1).tif',
-            'files/derivative/sub-keastlab-r18-250/sam-20180710-NW-cFos-egr1-39.tif': 'files/derivative/sub-keastlab-r18-250/sam-20180710-NW-cFos-egr1-39 (1).tif',
-            'files/derivative/sub-keastlab-r18-381/sam-20181119-NW-cFos-egr1-02.tif': 'files/derivative/sub-keastlab-r18-381/sam-20181119-NW-cFos-egr1-02 (1).tif',
-            'files/derivative/sub-keastlab-r18-250/sam-20180925-NW-cFos-pax2-06.tif': 'files/derivative/sub-keastlab-r18-250/sam-20180925-NW-cFos-pax2-06 (1).tif',
-            'files/derivative/sub-keastlab-r18-250/sam-20180911-NW-cFos-th-22.tif': 'files/derivative/sub-keastlab-r18-250/sam-20180911-NW-cFos-th-22 (1).tif',
-            'files/derivative/sub-keastlab-r18-250/sam-20180911-NW-cFos-th-20.tif': 'files/derivative/sub-keastlab-r18-250/sam-20180911-NW-cFos-th-20 (1).tif',
-            'files/derivative/sub-keastlab-r18-250/sam-20180925-NW-cFos-pax2-09.tif': 'files/derivative/sub-keastlab-r18-250/sam-20180925-NW-cFos-pax2-09 (1).tif',
-            'files/derivative/sub-keastlab-r18-250/sam-20180710-NW-cFos-egr1-36.tif': 'files/derivative/sub-keastlab-r18-250/sam-20180710-NW-cFos-egr1-36 (1).tif',
-            'files/derivative/sub-keastlab-r18-250/sam-20180925-NW-cFos-pax2-05.tif': 'files/derivative/sub-keastlab-r18-250/sam-20180925-NW-cFos-pax2-05 (1).tif',
-            'files/derivative/sub-keastlab-r18-250/sam-20180710-NW-cFos-egr1-41.tif': 'files/derivative/sub-keastlab-r18-250/sam-20180710-NW-cFos-egr1-41 (1).tif',
-            'files/derivative/sub-keastlab-r18-250/sam-20180925-NW-cFos-pax2-02.tif': 'files/derivative/sub-keastlab-r18-250/sam-20180925-NW-cFos-pax2-02 (1).tif',
-            'files/derivative/sub-keastlab-r18-250/sam-20180710-NW-cFos-egr1-44.tif': 'files/derivative/sub-keastlab-r18-250/sam-20180710-NW-cFos-egr1-44 (1).tif',
-            'files/derivative/sub-keastlab-r18-250/sam-20180710-NW-cFos-egr1-47.tif': 'files/derivative/sub-keastlab-r18-250/sam-20180710-NW-cFos-egr1-47 (1).tif',
-            'files/derivative/sub-keastlab-r18-250/sam-20180925-NW-cFos-pax2-10.tif': 'files/derivative/sub-keastlab-r18-250/sam-20180925-NW-cFos-pax2-10 (1).tif',
-            'files/derivative/sub-keastlab-r18-250/sam-20180925-NW-cFos-pax2-17.tif': 'files/derivative/sub-keastlab-r18-250/sam-20180925-NW-cFos-pax2-17 (1).tif',
-            'files/derivative/sub-keastlab-r18-250/sam-20180710-NW-cFos-egr1-45.tif': 'files/derivative/sub-keastlab-r18-250/sam-20180710-NW-cFos-egr1-45 (1).tif',
-            'files/derivative/sub-keastlab-r18-250/sam-20180710-NW-cFos-egr1-46.tif': 'files/derivative/sub-keastlab-r18-250/sam-20180710-NW-cFos-egr1-46 (1).tif',
-            'files/derivative/sub-keastlab-r18-250/sam-20180925-NW-cFos-pax2-03.tif': 'files/derivative/sub-keastlab-r18-250/sam-20180925-NW-cFos-pax2-03 (1).tif',
-            'files/derivative/sub-keastlab-r18-250/sam-20180925-NW-cFos-pax2-12.tif': 'files/derivative/sub-keastlab-r18-250/sam-20180925-NW-cFos-pax2-12 (1).tif',
-            'files/derivative/sub-keastlab-r18-250/sam-20180710-NW-cFos-egr1-43.tif': 'files/derivative/sub-keastlab-r18-250/sam-20180710-NW-cFos-egr1-43 (1).tif',
-            'files/derivative/sub-keastlab-r18-250/sam-20180710-NW-cFos-egr1-34.tif': 'files/derivative/sub-keastlab-r18-250/sam-20180710-NW-cFos-egr1-34 (1).tif',
-            'files/derivative/sub-keastlab-r18-250/sam-20180911-NW-cFos-th-14.tif': 'files/derivative/sub-keastlab-r18-250/sam-20180911-NW-cFos-th-14 (1).tif',
-            'files/derivative/sub-keastlab-r18-250/sam-20180925-NW-cFos-pax2-04.tif': 'files/derivative/sub-keastlab-r18-250/sam-20180925-NW-cFos-pax2-04 (1).tif',
-            'files/derivative/sub-keastlab-r18-250/sam-20180911-NW-cFos-th-06.tif': 'files/derivative/sub-keastlab-r18-250/sam-20180911-NW-cFos-th-06 (1).tif',
-            'files/derivative/sub-keastlab-r18-250/sam-20180925-NW-cFos-pax2-18.tif': 'files/derivative/sub-keastlab-r18-250/sam-20180925-NW-cFos-pax2-18 (1).tif',
-            'files/derivative/sub-keastlab-r18-250/sam-20180710-NW-cFos-egr1-35.tif': 'files/derivative/sub-keastlab-r18-250/sam-20180710-NW-cFos-egr1-35 (1).tif',
-            'files/derivative/sub-keastlab-r18-250/sam-20180925-NW-cFos-pax2-20.tif': 'files/derivative/sub-keastlab-r18-250/sam-20180925-NW-cFos-pax2-20 (1).tif',
-            'files/derivative/sub-keastlab-r18-250/sam-20180710-NW-cFos-egr1-31.tif': 'files/derivative/sub-keastlab-r18-250/sam-20180710-NW-cFos-egr1-31 (1).tif',
-            'files/derivative/sub-keastlab-r18-250/sam-20180925-NW-cFos-pax2-07.tif': 'files/derivative/sub-keastlab-r18-250/sam-20180925-NW-cFos-pax2-07 (1).tif',
-            'files/derivative/sub-keastlab-r18-250/sam-20180710-NW-cFos-egr1-42.tif': 'files/derivative/sub-keastlab-r18-250/sam-20180710-NW-cFos-egr1-42 (1).tif',
-            'files/derivative/sub-keastlab-r18-250/sam-20180710-NW-cFos-egr1-30.tif': 'files/derivative/sub-keastlab-r18-250/sam-20180710-NW-cFos-egr1-30 (1).tif',
-            'files/derivative/sub-keastlab-r18-250/sam-20180911-NW-cFos-th-12.tif': 'files/derivative/sub-keastlab-r18-250/sam-20180911-NW-cFos-th-12 (1).tif',
-            'files/derivative/sub-keastlab-r18-250/sam-20180710-NW-cFos-egr1-33.tif': 'files/derivative/sub-keastlab-r18-250/sam-20180710-NW-cFos-egr1-33 (1).tif',
-            'files/derivative/sub-keastlab-r18-250/sam-20180925-NW-cFos-pax2-11.tif': 'files/derivative/sub-keastlab-r18-250/sam-20180925-NW-cFos-pax2-11 (1).tif',
-            'files/derivative/sub-keastlab-r18-250/sam-20180710-NW-cFos-egr1-37.tif': 'files/derivative/sub-keastlab-r18-250/sam-20180710-NW-cFos-egr1-37 (1).tif',
-            'files/derivative/sub-keastlab-r18-250/sam-20180911-NW-cFos-th-16.tif': 'files/derivative/sub-keastlab-r18-250/sam-20180911-NW-cFos-th-16 (1).tif',
-            'files/derivative/sub-keastlab-r18-250/sam-20180710-NW-cFos-egr1-40.tif': 'files/derivative/sub-keastlab-r18-250/sam-20180710-NW-cFos-egr1-40 (1).tif',
-            'files/derivative/sub-keastlab-r18-250/sam-20180911-NW-cFos-th-10.tif': 'files/derivative/sub-keastlab-r18-250/sam-20180911-NW-cFos-th-10 (1).tif',
-            'files/derivative/sub-keastlab-r18-250/sam-20180911-NW-cFos-th-18.tif': 'files/derivative/sub-keastlab-r18-250/sam-20180911-NW-cFos-th-18 (1).tif',
-            'files/derivative/sub-keastlab-r18-250/sam-20180925-NW-cFos-pax2-19.tif': 'files/derivative/sub-keastlab-r18-250/sam-20180925-NW-cFos-pax2-19 (1).tif',
-            'files/derivative/sub-keastlab-r18-250/sam-20180710-NW-cFos-egr1-32.tif': 'files/derivative/sub-keastlab-r18-250/sam-20180710-NW-cFos-egr1-32 (1).tif',
-            'files/derivative/sub-keastlab-r18-250/sam-20180911-NW-cFos-th-04.tif': 'files/derivative/sub-keastlab-r18-250/sam-20180911-NW-cFos-th-04 (1).tif',
-            'files/derivative/sub-keastlab-r18-250/sam-20180710-NW-cFos-egr1-38.tif': 'files/derivative/sub-keastlab-r18-250/sam-20180710-NW-cFos-egr1-38 (1).tif',
-            'files/derivative/sub-keastlab-r18-250/sam-20180911-NW-cFos-th-08.tif': 'files/derivative/sub-keastlab-r18-250/sam-20180911-NW-cFos-th-08 (1).tif',
-            'files/derivative/sub-keastlab-r18-250/sam-20180925-NW-cFos-pax2-15.tif': 'files/derivative/sub-keastlab-r18-250/sam-20180925-NW-cFos-pax2-15 (1).tif',
-            'files/derivative/sub-keastlab-r18-250/sam-20180925-NW-cFos-pax2-13.tif': 'files/derivative/sub-keastlab-r18-250/sam-20180925-NW-cFos-pax2-13 (1).tif',
-            'files/derivative/sub-keastlab-r18-250/sam-20180925-NW-cFos-pax2-16.tif': 'files/derivative/sub-keastlab-r18-250/sam-20180925-NW-cFos-pax2-16 (1).tif',
-            'files/derivative/sub-keastlab-r18-250/sam-20180925-NW-cFos-pax2-01.tif': 'files/derivative/sub-keastlab-r18-250/sam-20180925-NW-cFos-pax2-01 (1).tif',
-            'files/derivative/perf-CBVN-stim_300us_5mA_PT/sub-all_CBVN-stim_300us_5_mA_PT_woB_manometry.xlsx': 'files/derivative/perf-CBVN-stim_300us_5mA_PT/sub-all_CBVN-stim_300us_5 mA_PT_woB_manometry.xlsx',
-            'files/derivative/perf-CBVN-stim_4ms_5mA_PT_wAB/sub-all_CBVN-stim_4_ms_5mA_PT_wAB_manometry.xlsx': 'files/derivative/perf-CBVN-stim_4ms_5mA_PT_wAB/sub-all_CBVN-stim_4 ms_5mA_PT_wAB_manometry.xlsx',
-            'files/docs/Microfil_Stomach.jpg': 'files/docs/Microfil Stomach.jpg',
-            'files/source/sub-PR1729/PR1729_Raw_Text_Files/_Book5_PR1729_BiMk_Ch3-RawData-1362518': 'files/source/sub-PR1729/PR1729_Raw_Text_Files/%5BBook5%5DPR1729_BiMk_Ch3-RawData-1362518',
-            'files/source/sub-PR1729/PR1729_BiMk_Ch2-08-27-191362518297/ChipRun.TM.Processed.bin': 'files/source/sub-PR1729/PR1729_BiMk_Ch2-08-27-191362518297/ChipRun.TM.Processed',
-            'files/source/sub-PR1729/PR1729_BiMk_Ch2-08-27-191362518297/ChipRun.Processed.bin': 'files/source/sub-PR1729/PR1729_BiMk_Ch2-08-27-191362518297/ChipRun.Processed',
-            'files/source/sub-PR1729/PR1729_BiMk_Ch1-08-26-19-1362518046/ChipRun.TM.Processed.bin': 'files/source/sub-PR1729/PR1729_BiMk_Ch1-08-26-19-1362518046/ChipRun.TM.Processed',
-            'files/source/sub-PR1729/PR1729_BiMk_Ch1-08-26-19-1362518046/ChipRun.Processed.bin': 'files/source/sub-PR1729/PR1729_BiMk_Ch1-08-26-19-1362518046/ChipRun.Processed',
-            'files/source/sub-PR1729/PR1729_BiMk_Ch3-08-27-19-1362518011/ChipRun.TM.Processed.bin': 'files/source/sub-PR1729/PR1729_BiMk_Ch3-08-27-19-1362518011/ChipRun.TM.Processed',
-            'files/source/sub-PR1729/PR1729_BiMk_Ch3-08-27-19-1362518011/ChipRun.Processed.bin': 'files/source/sub-PR1729/PR1729_BiMk_Ch3-08-27-19-1362518011/ChipRun.Processed',
-            'files/source/sub-PR1534/PR1534_BiMk_Ch4_03-30-19-1362356403/ChipRun.Processed.bin': 'files/source/sub-PR1534/PR1534_BiMk_Ch4_03-30-19-1362356403/ChipRun.Processed',
-            'files/source/sub-PR1534/PR1534_BiMk_Ch4_03-30-19-1362356403/ChipRun.TM.Processed.bin': 'files/source/sub-PR1534/PR1534_BiMk_Ch4_03-30-19-1362356403/ChipRun.TM.Processed',
-            'files/source/sub-PR1534/PR1534-_BiMk_Ch1_03-08-19-1362408579/ChipRun.Processed.bin': 'files/source/sub-PR1534/PR1534-_BiMk_Ch1_03-08-19-1362408579/ChipRun.Processed',
-            'files/source/sub-PR1534/PR1534-_BiMk_Ch1_03-08-19-1362408579/ChipRun.TM.Processed.bin': 'files/source/sub-PR1534/PR1534-_BiMk_Ch1_03-08-19-1362408579/ChipRun.TM.Processed',
-            'files/source/sub-PR1534/PR1534_BiMk_Ch6-04-02-19-1362238625/ChipRun.Processed.bin': 'files/source/sub-PR1534/PR1534_BiMk_Ch6-04-02-19-1362238625/ChipRun.Processed',
-            'files/source/sub-PR1534/PR1534_BiMk_Ch6-04-02-19-1362238625/ChipRun.TM.Processed.bin': 'files/source/sub-PR1534/PR1534_BiMk_Ch6-04-02-19-1362238625/ChipRun.TM.Processed',
-            'files/source/sub-PR1534/PR1534_BiMk_Ch5_04-01-19-1362408231/ChipRun.Processed.bin': 'files/source/sub-PR1534/PR1534_BiMk_Ch5_04-01-19-1362408231/ChipRun.Processed',
-            'files/source/sub-PR1534/PR1534_BiMk_Ch5_04-01-19-1362408231/ChipRun.TM.Processed.bin': 'files/source/sub-PR1534/PR1534_BiMk_Ch5_04-01-19-1362408231/ChipRun.TM.Processed',
-            'files/source/sub-PR1534/PR_1534_BiMl_Ch3_03_22_19-1362408232/ChipRun.TM.Processed.bin': 'files/source/sub-PR1534/PR_1534_BiMl_Ch3_03_22_19-1362408232/ChipRun.TM.Processed',
-            'files/source/sub-PR1534/PR_1534_BiMl_Ch3_03_22_19-1362408232/ChipRun.Processed.bin': 'files/source/sub-PR1534/PR_1534_BiMl_Ch3_03_22_19-1362408232/ChipRun.Processed',
-            'files/source/sub-PR1534/PR1534_BiMk_Ch2_03-13-19-1362408644/ChipRun.TM.Processed.bin': 'files/source/sub-PR1534/PR1534_BiMk_Ch2_03-13-19-1362408644/ChipRun.TM.Processed',
-            'files/source/sub-PR1534/PR1534_BiMk_Ch2_03-13-19-1362408644/ChipRun.Processed.bin': 'files/source/sub-PR1534/PR1534_BiMk_Ch2_03-13-19-1362408644/ChipRun.Processed',
-            'files/source/sub-PR1643/PR1634_BiMk_Ch1-04-23-19-1362419646/ChipRun.Processed.bin': 'files/source/sub-PR1643/PR1634_BiMk_Ch1-04-23-19-1362419646/ChipRun.Processed',
-            'files/source/sub-PR1643/PR1634_BiMk_Ch1-04-23-19-1362419646/ChipRun.TM.Processed.bin': 'files/source/sub-PR1643/PR1634_BiMk_Ch1-04-23-19-1362419646/ChipRun.TM.Processed',
-            'files/source/sub-PR1643/PR1634_BiMk_Ch2-0423-19-1362419042/ChipRun.Processed.bin': 'files/source/sub-PR1643/PR1634_BiMk_Ch2-0423-19-1362419042/ChipRun.Processed',
-            'files/source/sub-PR1643/PR1634_BiMk_Ch2-0423-19-1362419042/ChipRun.TM.Processed.bin': 'files/source/sub-PR1643/PR1634_BiMk_Ch2-0423-19-1362419042/ChipRun.TM.Processed',
-            'files/source/sub-PR1643/PR1643_BiMk_Ch3-04-24-2019-1362419019/ChipRun.TM.Processed.bin': 'files/source/sub-PR1643/PR1643_BiMk_Ch3-04-24-2019-1362419019/ChipRun.TM.Processed',
-            'files/source/sub-PR1643/PR1643_BiMk_Ch3-04-24-2019-1362419019/ChipRun.Processed.bin': 'files/source/sub-PR1643/PR1643_BiMk_Ch3-04-24-2019-1362419019/ChipRun.Processed',
-            'files/source/sub-PR1643/PR1634_BiMk_Ch5-04-25-191362419054/ChipRun.Processed.bin': 'files/source/sub-PR1643/PR1634_BiMk_Ch5-04-25-191362419054/ChipRun.Processed',
-            'files/source/sub-PR1643/PR1634_BiMk_Ch5-04-25-191362419054/ChipRun.TM.Processed.bin': 'files/source/sub-PR1643/PR1634_BiMk_Ch5-04-25-191362419054/ChipRun.TM.Processed',
-            'files/source/sub-PR1643/PR1643_BiMk_Ch4-04-25-2019-1362419084/ChipRun.TM.Processed.bin': 'files/source/sub-PR1643/PR1643_BiMk_Ch4-04-25-2019-1362419084/ChipRun.TM.Processed',
-            'files/source/sub-PR1643/PR1643_BiMk_Ch4-04-25-2019-1362419084/ChipRun.Processed.bin': 'files/source/sub-PR1643/PR1643_BiMk_Ch4-04-25-2019-1362419084/ChipRun.Processed',
-            'files/source/sub-PR1643/PR1643_BiMk_Ch6-04-26-2019-1362416353/ChipRun.TM.Processed.bin': 'files/source/sub-PR1643/PR1643_BiMk_Ch6-04-26-2019-1362416353/ChipRun.TM.Processed',
-            'files/source/sub-PR1643/PR1643_BiMk_Ch6-04-26-2019-1362416353/ChipRun.Processed.bin': 'files/source/sub-PR1643/PR1643_BiMk_Ch6-04-26-2019-1362416353/ChipRun.Processed',
-            'files/source/sub-PR1705/PR1705_BiMk_Ch5-06-28-2019-1362416347/ChipRun.Processed.bin': 'files/source/sub-PR1705/PR1705_BiMk_Ch5-06-28-2019-1362416347/ChipRun.Processed',
-            'files/source/sub-PR1705/PR1705_BiMk_Ch5-06-28-2019-1362416347/ChipRun.TM.Processed.bin': 'files/source/sub-PR1705/PR1705_BiMk_Ch5-06-28-2019-1362416347/ChipRun.TM.Processed',
-            'files/source/sub-PR1705/PR1705_BiMk_Ch1-06-26-2019-1362416320/ChipRun.TM.Processed.bin': 'files/source/sub-PR1705/PR1705_BiMk_Ch1-06-26-2019-1362416320/ChipRun.TM.Processed',
-            'files/source/sub-PR1705/PR1705_BiMk_Ch1-06-26-2019-1362416320/ChipRun.Processed.bin': 'files/source/sub-PR1705/PR1705_BiMk_Ch1-06-26-2019-1362416320/ChipRun.Processed',
-            'files/source/sub-PR1705/PR1705_BiMk_Ch3-06-27-2019-1362416394/ChipRun.TM.Processed.bin': 'files/source/sub-PR1705/PR1705_BiMk_Ch3-06-27-2019-1362416394/ChipRun.TM.Processed',
-            'files/source/sub-PR1705/PR1705_BiMk_Ch3-06-27-2019-1362416394/ChipRun.Processed.bin': 'files/source/sub-PR1705/PR1705_BiMk_Ch3-06-27-2019-1362416394/ChipRun.Processed',
-            'files/source/sub-PR1705/PR1705_BiMk_Ch6-06-28-2019-1362416056/ChipRun.TM.Processed.bin': 'files/source/sub-PR1705/PR1705_BiMk_Ch6-06-28-2019-1362416056/ChipRun.TM.Processed',
-            'files/source/sub-PR1705/PR1705_BiMk_Ch6-06-28-2019-1362416056/ChipRun.Processed.bin': 'files/source/sub-PR1705/PR1705_BiMk_Ch6-06-28-2019-1362416056/ChipRun.Processed',
-            'files/source/sub-PR1705/PR1705_BiMk_Ch2-06-26-2019-1362416367/ChipRun.TM.Processed.bin': 'files/source/sub-PR1705/PR1705_BiMk_Ch2-06-26-2019-1362416367/ChipRun.TM.Processed',
-            'files/source/sub-PR1705/PR1705_BiMk_Ch2-06-26-2019-1362416367/ChipRun.Processed.bin': 'files/source/sub-PR1705/PR1705_BiMk_Ch2-06-26-2019-1362416367/ChipRun.Processed',
-            'files/source/sub-PR1705/PR1705_BiMk_Ch4-06-27-2019-1362416369/ChipRun.TM.Processed.bin': 'files/source/sub-PR1705/PR1705_BiMk_Ch4-06-27-2019-1362416369/ChipRun.TM.Processed',
-            'files/source/sub-PR1705/PR1705_BiMk_Ch4-06-27-2019-1362416369/ChipRun.Processed.bin': 'files/source/sub-PR1705/PR1705_BiMk_Ch4-06-27-2019-1362416369/ChipRun.Processed',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI/sub-H2102/sam-H2102/SPARC_H2102B_LM_NOS_ChAT_DiI.xlsx': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI/sub-H2102/sam-H2102/SPARC_H2102B_LM_NOS%26ChAT_DiI.xlsx',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI/sub-H2100/sam-H2100/SPARC_H2100A_LM_NOS_ChAT_DiI.xlsx': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI/sub-H2100/sam-H2100/SPARC_H2100A_LM_NOS%26ChAT_DiI.xlsx',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI/sub-H2111/sam-H2111/SPARC_H2111A_LM_NOS_ChAT_DiI.xlsx': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI/sub-H2111/sam-H2111/SPARC_H2111A_LM_NOS%26ChAT_DiI.xlsx',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI/sub-H2107/sam-H2107/SPARC_H2107C_LM_NOS_ChAT_DiI.xlsx': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI/sub-H2107/sam-H2107/SPARC_H2107C_LM_NOS%26ChAT_DiI.xlsx',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI/sub-H2104/sam-H2104/SPARC_H2104B_LM_NOS_ChAT_DiI.xlsx': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI/sub-H2104/sam-H2104/SPARC_H2104B_LM_NOS%26ChAT_DiI.xlsx',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.082Y-2.086_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.082Y-2.086_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI/sub-H2109/sam-H2109/SPARC_H2109B_LM_NOS_ChAT_DiI.xlsx': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI/sub-H2109/sam-H2109/SPARC_H2109B_LM_NOS%26ChAT_DiI.xlsx',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.629Y1.98_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.629Y1.98_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.017Y-2.098_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.017Y-2.098_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.137Y-1.425_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.137Y-1.425_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.089Y-1.488_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.089Y-1.488_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.629Y1.98_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.629Y1.98_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.835Y-5.578_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.835Y-5.578_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.006Y-2.157_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.006Y-2.157_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.101Y-2.214_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.101Y-2.214_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.004Y-1.567_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.004Y-1.567_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-2.028Y-2.156_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-2.028Y-2.156_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X2.252Y-3.797_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X2.252Y-3.797_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.64Y2.68_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.64Y2.68_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.715Y-3.678_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.715Y-3.678_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.184Y-1.568_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.184Y-1.568_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.342Y-3.276_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.342Y-3.276_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-1.307Y1.243_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-1.307Y1.243_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.124Y-2.119_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.124Y-2.119_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.01Y-2.302_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.01Y-2.302_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.667Y2.673_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.667Y2.673_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.092Y-2.115_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.092Y-2.115_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X2.252Y-3.797_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X2.252Y-3.797_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.048Y3.337_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.048Y3.337_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.006Y-2.157_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.006Y-2.157_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.835Y-5.578_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.835Y-5.578_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.667Y2.707_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.667Y2.707_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.017Y-2.098_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.017Y-2.098_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.532Y-2.339_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.532Y-2.339_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.766Y-3.325_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.766Y-3.325_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.031Y-2.237_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.031Y-2.237_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.144Y-2.398_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.144Y-2.398_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.071Y-1.508_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.071Y-1.508_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-1.03Y-0.642_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-1.03Y-0.642_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.007Y2.74_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.007Y2.74_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.705Y2.334_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.705Y2.334_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.715Y-3.678_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.715Y-3.678_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.345Y-2.942_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.345Y-2.942_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.238Y-1.126_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.238Y-1.126_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.345Y-2.942_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.345Y-2.942_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.048Y3.337_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.048Y3.337_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.041Y-2.242_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.041Y-2.242_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.101Y-2.214_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.101Y-2.214_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.089Y-1.488_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.089Y-1.488_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.124Y-2.119_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.124Y-2.119_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.004Y-1.567_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.004Y-1.567_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.002Y-2.103_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.002Y-2.103_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.705Y2.334_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.705Y2.334_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.184Y-1.568_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.184Y-1.568_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.034Y-2.094_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.034Y-2.094_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.255Y-3.047_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.255Y-3.047_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.015Y-2.026_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.015Y-2.026_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.027Y-1.999_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.027Y-1.999_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-1.864Y-2.007_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-1.864Y-2.007_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.089Y-1.926_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.089Y-1.926_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.904Y-2.306_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.904Y-2.306_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.144Y-2.398_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.144Y-2.398_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.683Y4.426_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.683Y4.426_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-2.028Y-2.156_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-2.028Y-2.156_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.092Y-1.966_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.092Y-1.966_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X2.502Y5.679_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X2.502Y5.679_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.937Y4.376_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.937Y4.376_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.704Y2.381_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.704Y2.381_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.156Y1.659_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.156Y1.659_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.017Y-2.098_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.017Y-2.098_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X1.114Y-2.151_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X1.114Y-2.151_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.282Y-0.969_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.282Y-0.969_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.144Y-2.398_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.144Y-2.398_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.092Y-1.966_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.092Y-1.966_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.904Y-2.306_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.904Y-2.306_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.261Y-2.282_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.261Y-2.282_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.092Y-2.115_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.092Y-2.115_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.078Y-2.33_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.078Y-2.33_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-1.379Y-1.292_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-1.379Y-1.292_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X1.114Y-2.151_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X1.114Y-2.151_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.156Y1.659_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.156Y1.659_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.006Y-2.157_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.006Y-2.157_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X2.462Y5.707_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X2.462Y5.707_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.849Y2.616_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.849Y2.616_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.849Y2.616_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.849Y2.616_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.904Y-2.306_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.904Y-2.306_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-1.864Y-2.007_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-1.864Y-2.007_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X2.502Y5.679_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X2.502Y5.679_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.87Y2.517_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.87Y2.517_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.342Y-3.276_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.342Y-3.276_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.282Y-0.969_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.282Y-0.969_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.279Y-0.932_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.279Y-0.932_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.87Y2.517_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.87Y2.517_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.683Y4.426_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.683Y4.426_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.238Y-1.126_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.238Y-1.126_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.87Y2.517_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.87Y2.517_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.532Y-2.339_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.532Y-2.339_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.002Y-2.103_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.002Y-2.103_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.146Y2.945_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.146Y2.945_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.15Y-2.143_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.15Y-2.143_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.261Y-2.282_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.261Y-2.282_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.071Y-1.508_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.071Y-1.508_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.532Y-2.339_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.532Y-2.339_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.64Y2.68_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.64Y2.68_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.233Y-1.065_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.233Y-1.065_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.672Y4.456_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.672Y4.456_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.101Y-2.214_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.101Y-2.214_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.25Y-2.947_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.25Y-2.947_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.068Y3.636_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.068Y3.636_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.239Y-2.958_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.239Y-2.958_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.052Y-1.565_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.052Y-1.565_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.25Y-2.947_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.25Y-2.947_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-1.091Y-5.212_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-1.091Y-5.212_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.144Y-1.498_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.144Y-1.498_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.239Y-2.958_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.239Y-2.958_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.345Y-2.942_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.345Y-2.942_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.667Y2.707_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.667Y2.707_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.031Y-2.237_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.031Y-2.237_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.071Y-1.508_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.071Y-1.508_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.937Y4.376_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.937Y4.376_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.255Y-3.047_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.255Y-3.047_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.672Y4.456_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.672Y4.456_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.256Y-2.154_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.256Y-2.154_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.25Y-2.947_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.25Y-2.947_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.256Y-2.154_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.256Y-2.154_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-1.091Y-5.212_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-1.091Y-5.212_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X1.114Y-2.151_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X1.114Y-2.151_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.137Y-1.425_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.137Y-1.425_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.089Y-1.926_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.089Y-1.926_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-1.379Y-1.292_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-1.379Y-1.292_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.704Y2.381_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.704Y2.381_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.715Y-3.678_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.715Y-3.678_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X2.502Y5.679_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X2.502Y5.679_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.225Y-1.208_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.225Y-1.208_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.667Y2.707_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.667Y2.707_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.092Y-2.115_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.092Y-2.115_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.766Y-3.325_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.766Y-3.325_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.144Y-1.498_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.144Y-1.498_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.089Y-1.926_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.089Y-1.926_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.092Y-1.966_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.092Y-1.966_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.64Y2.68_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.64Y2.68_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.342Y-3.276_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.342Y-3.276_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.107Y-1.485_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.107Y-1.485_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.184Y-1.568_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.184Y-1.568_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.027Y-1.999_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.027Y-1.999_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.068Y3.636_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.068Y3.636_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.107Y-1.485_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.107Y-1.485_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.156Y1.659_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.156Y1.659_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-1.091Y-5.212_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-1.091Y-5.212_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.15Y-2.143_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.15Y-2.143_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X1.487Y3.417_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X1.487Y3.417_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.144Y-1.498_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.144Y-1.498_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.672Y4.456_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.672Y4.456_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X2.252Y-3.797_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X2.252Y-3.797_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.225Y-1.208_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.225Y-1.208_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.078Y-2.33_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.078Y-2.33_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.667Y2.673_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.667Y2.673_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.704Y2.381_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.704Y2.381_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.01Y-2.302_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.01Y-2.302_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.004Y-1.567_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.004Y-1.567_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-1.307Y1.243_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-1.307Y1.243_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.629Y1.98_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.629Y1.98_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.239Y-2.958_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.239Y-2.958_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.041Y-2.242_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.041Y-2.242_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.007Y2.74_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.007Y2.74_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.01Y-2.302_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.01Y-2.302_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-1.307Y1.243_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-1.307Y1.243_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.225Y-1.208_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.225Y-1.208_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-2.028Y-2.156_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-2.028Y-2.156_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.238Y-1.126_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.238Y-1.126_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X2.462Y5.707_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X2.462Y5.707_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.089Y-1.488_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.089Y-1.488_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.031Y-2.237_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.031Y-2.237_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X2.462Y5.707_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X2.462Y5.707_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-1.864Y-2.007_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-1.864Y-2.007_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.082Y-2.086_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.082Y-2.086_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.034Y-2.094_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.034Y-2.094_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.146Y2.945_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.146Y2.945_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.015Y-2.026_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.015Y-2.026_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.052Y-1.565_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.052Y-1.565_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.683Y4.426_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.683Y4.426_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.124Y-2.119_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.124Y-2.119_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X1.487Y3.417_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X1.487Y3.417_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.107Y-1.485_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.107Y-1.485_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.027Y-1.999_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.027Y-1.999_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.034Y-2.094_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.034Y-2.094_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.041Y-2.242_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.041Y-2.242_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-1.379Y-1.292_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-1.379Y-1.292_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.261Y-2.282_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.261Y-2.282_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.279Y-0.932_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.279Y-0.932_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.048Y3.337_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.048Y3.337_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.082Y-2.086_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.082Y-2.086_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-1.03Y-0.642_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-1.03Y-0.642_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.233Y-1.065_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.233Y-1.065_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-1.03Y-0.642_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-1.03Y-0.642_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X1.487Y3.417_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X1.487Y3.417_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.705Y2.334_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.705Y2.334_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.849Y2.616_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.849Y2.616_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.255Y-3.047_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.255Y-3.047_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.015Y-2.026_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.015Y-2.026_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.667Y2.673_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.667Y2.673_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.146Y2.945_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.146Y2.945_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.256Y-2.154_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.256Y-2.154_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.279Y-0.932_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.279Y-0.932_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.15Y-2.143_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.15Y-2.143_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.002Y-2.103_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.002Y-2.103_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.052Y-1.565_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.052Y-1.565_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.937Y4.376_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.937Y4.376_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.233Y-1.065_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.233Y-1.065_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.835Y-5.578_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.835Y-5.578_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.137Y-1.425_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.137Y-1.425_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.078Y-2.33_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.078Y-2.33_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.007Y2.74_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.007Y2.74_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.068Y3.636_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X0.068Y3.636_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.282Y-0.969_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.282Y-0.969_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2100/sam-H2100/SPARC_H2100A_LM_MICROGRAPHS/SPARC_H2100A_LM_X0.172Y-2.895_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2100/sam-H2100/SPARC_H2100A_LM_MICROGRAPHS/SPARC_H2100A_LM_X0.172Y-2.895_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2100/sam-H2100/SPARC_H2100A_LM_MICROGRAPHS/SPARC_H2100A_LM_X1.267Y-5.624_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2100/sam-H2100/SPARC_H2100A_LM_MICROGRAPHS/SPARC_H2100A_LM_X1.267Y-5.624_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.766Y-3.325_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2115/sam-H2115/SPARC_H2115A_LM_MICROGRAPHS/SPARC_H2115A_LM_X-0.766Y-3.325_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2100/sam-H2100/SPARC_H2100A_LM_MICROGRAPHS/SPARC_H2100A_LM_X-0.303Y-4.213_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2100/sam-H2100/SPARC_H2100A_LM_MICROGRAPHS/SPARC_H2100A_LM_X-0.303Y-4.213_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2100/sam-H2100/SPARC_H2100A_LM_MICROGRAPHS/SPARC_H2100A_LM_X0.121Y3.363_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2100/sam-H2100/SPARC_H2100A_LM_MICROGRAPHS/SPARC_H2100A_LM_X0.121Y3.363_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2100/sam-H2100/SPARC_H2100A_LM_MICROGRAPHS/SPARC_H2100A_LM_X0.172Y-2.895_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2100/sam-H2100/SPARC_H2100A_LM_MICROGRAPHS/SPARC_H2100A_LM_X0.172Y-2.895_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2100/sam-H2100/SPARC_H2100A_LM_MICROGRAPHS/SPARC_H2100A_LM_X0.121Y3.363_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2100/sam-H2100/SPARC_H2100A_LM_MICROGRAPHS/SPARC_H2100A_LM_X0.121Y3.363_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2100/sam-H2100/SPARC_H2100A_LM_MICROGRAPHS/SPARC_H2100A_LM_X0.172Y-2.895_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2100/sam-H2100/SPARC_H2100A_LM_MICROGRAPHS/SPARC_H2100A_LM_X0.172Y-2.895_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2100/sam-H2100/SPARC_H2100A_LM_MICROGRAPHS/SPARC_H2100A_LM_X-0.303Y-4.213_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2100/sam-H2100/SPARC_H2100A_LM_MICROGRAPHS/SPARC_H2100A_LM_X-0.303Y-4.213_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2100/sam-H2100/SPARC_H2100A_LM_MICROGRAPHS/SPARC_H2100A_LM_X-0.303Y-4.213_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2100/sam-H2100/SPARC_H2100A_LM_MICROGRAPHS/SPARC_H2100A_LM_X-0.303Y-4.213_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X0.624Y-2.736_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X0.624Y-2.736_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X-0.854Y-1.613_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X-0.854Y-1.613_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X1.158Y1.333_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X1.158Y1.333_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2100/sam-H2100/SPARC_H2100A_LM_MICROGRAPHS/SPARC_H2100A_LM_X0.121Y3.363_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2100/sam-H2100/SPARC_H2100A_LM_MICROGRAPHS/SPARC_H2100A_LM_X0.121Y3.363_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X-0.886Y-1.507_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X-0.886Y-1.507_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2100/sam-H2100/SPARC_H2100A_LM_MICROGRAPHS/SPARC_H2100A_LM_X1.267Y-5.624_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2100/sam-H2100/SPARC_H2100A_LM_MICROGRAPHS/SPARC_H2100A_LM_X1.267Y-5.624_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X1.201Y-3.396_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X1.201Y-3.396_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2100/sam-H2100/SPARC_H2100A_LM_MICROGRAPHS/SPARC_H2100A_LM_X1.267Y-5.624_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2100/sam-H2100/SPARC_H2100A_LM_MICROGRAPHS/SPARC_H2100A_LM_X1.267Y-5.624_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X-0.886Y-1.507_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X-0.886Y-1.507_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X-0.39Y1.115_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X-0.39Y1.115_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X1.447Y-1.677_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X1.447Y-1.677_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X-0.39Y1.115_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X-0.39Y1.115_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X1.201Y-3.396_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X1.201Y-3.396_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X-1.302Y0.29_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X-1.302Y0.29_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X1.158Y1.333_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X1.158Y1.333_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X1.447Y-1.677_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X1.447Y-1.677_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X-0.854Y-1.613_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X-0.854Y-1.613_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X-0.865Y-2.213_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X-0.865Y-2.213_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X-1.302Y0.29_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X-1.302Y0.29_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X-0.155Y-1.606_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X-0.155Y-1.606_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X-0.155Y-1.606_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X-0.155Y-1.606_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X-0.39Y1.115_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X-0.39Y1.115_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X-0.865Y-2.213_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X-0.865Y-2.213_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X1.447Y-1.677_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X1.447Y-1.677_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X0.624Y-2.736_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X0.624Y-2.736_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X1.201Y-3.396_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X1.201Y-3.396_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X-0.865Y-2.213_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X-0.865Y-2.213_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X-1.302Y0.29_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X-1.302Y0.29_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X1.158Y1.333_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X1.158Y1.333_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2101/sam-H2101/SPARC_H2101D_LM_MICROGRAPHS/SPARC_H2101D_LM_X-0.349Y3.4_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2101/sam-H2101/SPARC_H2101D_LM_MICROGRAPHS/SPARC_H2101D_LM_X-0.349Y3.4_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X-0.886Y-1.507_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X-0.886Y-1.507_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2101/sam-H2101/SPARC_H2101D_LM_MICROGRAPHS/SPARC_H2101D_LM_X-0.307Y10.076_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2101/sam-H2101/SPARC_H2101D_LM_MICROGRAPHS/SPARC_H2101D_LM_X-0.307Y10.076_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2101/sam-H2101/SPARC_H2101D_LM_MICROGRAPHS/SPARC_H2101D_LM_X0.037Y8.754_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2101/sam-H2101/SPARC_H2101D_LM_MICROGRAPHS/SPARC_H2101D_LM_X0.037Y8.754_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X0.624Y-2.736_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X0.624Y-2.736_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X-0.854Y-1.613_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X-0.854Y-1.613_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2101/sam-H2101/SPARC_H2101D_LM_MICROGRAPHS/SPARC_H2101D_LM_X-0.307Y10.076_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2101/sam-H2101/SPARC_H2101D_LM_MICROGRAPHS/SPARC_H2101D_LM_X-0.307Y10.076_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X-0.155Y-1.606_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2102/sam-H2102/SPARC_H2102B_LM_MICROGRAPHS/SPARC_H2102B_LM_X-0.155Y-1.606_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2101/sam-H2101/SPARC_H2101D_LM_MICROGRAPHS/SPARC_H2101D_LM_X-0.312Y-1.53_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2101/sam-H2101/SPARC_H2101D_LM_MICROGRAPHS/SPARC_H2101D_LM_X-0.312Y-1.53_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2101/sam-H2101/SPARC_H2101D_LM_MICROGRAPHS/SPARC_H2101D_LM_X0.631Y5.198_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2101/sam-H2101/SPARC_H2101D_LM_MICROGRAPHS/SPARC_H2101D_LM_X0.631Y5.198_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2101/sam-H2101/SPARC_H2101D_LM_MICROGRAPHS/SPARC_H2101D_LM_X-0.307Y10.076_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2101/sam-H2101/SPARC_H2101D_LM_MICROGRAPHS/SPARC_H2101D_LM_X-0.307Y10.076_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2101/sam-H2101/SPARC_H2101D_LM_MICROGRAPHS/SPARC_H2101D_LM_X-0.349Y3.4_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2101/sam-H2101/SPARC_H2101D_LM_MICROGRAPHS/SPARC_H2101D_LM_X-0.349Y3.4_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2101/sam-H2101/SPARC_H2101D_LM_MICROGRAPHS/SPARC_H2101D_LM_X-1.188Y5.336_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2101/sam-H2101/SPARC_H2101D_LM_MICROGRAPHS/SPARC_H2101D_LM_X-1.188Y5.336_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2101/sam-H2101/SPARC_H2101D_LM_MICROGRAPHS/SPARC_H2101D_LM_X0.037Y8.754_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2101/sam-H2101/SPARC_H2101D_LM_MICROGRAPHS/SPARC_H2101D_LM_X0.037Y8.754_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2101/sam-H2101/SPARC_H2101D_LM_MICROGRAPHS/SPARC_H2101D_LM_X-0.312Y-1.53_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2101/sam-H2101/SPARC_H2101D_LM_MICROGRAPHS/SPARC_H2101D_LM_X-0.312Y-1.53_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2101/sam-H2101/SPARC_H2101D_LM_MICROGRAPHS/SPARC_H2101D_LM_X-0.027Y3.425_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2101/sam-H2101/SPARC_H2101D_LM_MICROGRAPHS/SPARC_H2101D_LM_X-0.027Y3.425_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2101/sam-H2101/SPARC_H2101D_LM_MICROGRAPHS/SPARC_H2101D_LM_X0.073Y3.42_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2101/sam-H2101/SPARC_H2101D_LM_MICROGRAPHS/SPARC_H2101D_LM_X0.073Y3.42_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2101/sam-H2101/SPARC_H2101D_LM_MICROGRAPHS/SPARC_H2101D_LM_X0.073Y3.42_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2101/sam-H2101/SPARC_H2101D_LM_MICROGRAPHS/SPARC_H2101D_LM_X0.073Y3.42_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2101/sam-H2101/SPARC_H2101D_LM_MICROGRAPHS/SPARC_H2101D_LM_X0.037Y8.754_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2101/sam-H2101/SPARC_H2101D_LM_MICROGRAPHS/SPARC_H2101D_LM_X0.037Y8.754_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2101/sam-H2101/SPARC_H2101D_LM_MICROGRAPHS/SPARC_H2101D_LM_X0.076Y8.696_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2101/sam-H2101/SPARC_H2101D_LM_MICROGRAPHS/SPARC_H2101D_LM_X0.076Y8.696_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2101/sam-H2101/SPARC_H2101D_LM_MICROGRAPHS/SPARC_H2101D_LM_X-0.349Y3.4_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2101/sam-H2101/SPARC_H2101D_LM_MICROGRAPHS/SPARC_H2101D_LM_X-0.349Y3.4_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2101/sam-H2101/SPARC_H2101D_LM_MICROGRAPHS/SPARC_H2101D_LM_X0.073Y3.42_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2101/sam-H2101/SPARC_H2101D_LM_MICROGRAPHS/SPARC_H2101D_LM_X0.073Y3.42_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2101/sam-H2101/SPARC_H2101D_LM_MICROGRAPHS/SPARC_H2101D_LM_X-0.312Y-1.53_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2101/sam-H2101/SPARC_H2101D_LM_MICROGRAPHS/SPARC_H2101D_LM_X-0.312Y-1.53_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2101/sam-H2101/SPARC_H2101D_LM_MICROGRAPHS/SPARC_H2101D_LM_X0.631Y5.198_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2101/sam-H2101/SPARC_H2101D_LM_MICROGRAPHS/SPARC_H2101D_LM_X0.631Y5.198_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2101/sam-H2101/SPARC_H2101D_LM_MICROGRAPHS/SPARC_H2101D_LM_X-1.188Y5.336_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2101/sam-H2101/SPARC_H2101D_LM_MICROGRAPHS/SPARC_H2101D_LM_X-1.188Y5.336_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2101/sam-H2101/SPARC_H2101D_LM_MICROGRAPHS/SPARC_H2101D_LM_X0.631Y5.198_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2101/sam-H2101/SPARC_H2101D_LM_MICROGRAPHS/SPARC_H2101D_LM_X0.631Y5.198_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2101/sam-H2101/SPARC_H2101D_LM_MICROGRAPHS/SPARC_H2101D_LM_X0.076Y8.696_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2101/sam-H2101/SPARC_H2101D_LM_MICROGRAPHS/SPARC_H2101D_LM_X0.076Y8.696_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2101/sam-H2101/SPARC_H2101D_LM_MICROGRAPHS/SPARC_H2101D_LM_X0.076Y8.696_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2101/sam-H2101/SPARC_H2101D_LM_MICROGRAPHS/SPARC_H2101D_LM_X0.076Y8.696_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2101/sam-H2101/SPARC_H2101D_LM_MICROGRAPHS/SPARC_H2101D_LM_X-0.027Y3.425_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2101/sam-H2101/SPARC_H2101D_LM_MICROGRAPHS/SPARC_H2101D_LM_X-0.027Y3.425_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-1.047Y-1.45_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-1.047Y-1.45_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X1.565Y-5.857_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X1.565Y-5.857_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X3.483Y-12.563_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X3.483Y-12.563_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2101/sam-H2101/SPARC_H2101D_LM_MICROGRAPHS/SPARC_H2101D_LM_X-1.188Y5.336_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2101/sam-H2101/SPARC_H2101D_LM_MICROGRAPHS/SPARC_H2101D_LM_X-1.188Y5.336_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.263Y-1.76_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.263Y-1.76_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.522Y-1.851_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.522Y-1.851_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-1.039Y-11.543_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-1.039Y-11.543_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2101/sam-H2101/SPARC_H2101D_LM_MICROGRAPHS/SPARC_H2101D_LM_X-0.027Y3.425_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2101/sam-H2101/SPARC_H2101D_LM_MICROGRAPHS/SPARC_H2101D_LM_X-0.027Y3.425_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-3.37Y-9.468_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-3.37Y-9.468_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X1.361Y-2.352_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X1.361Y-2.352_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.249Y-1.918_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.249Y-1.918_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X8.093Y0.964_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X8.093Y0.964_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X0.196Y-0.513_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X0.196Y-0.513_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.116Y-1.685_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.116Y-1.685_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.967Y-6.602_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.967Y-6.602_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.263Y-1.76_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.263Y-1.76_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-1.039Y-11.543_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-1.039Y-11.543_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X2.175Y-0.948_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X2.175Y-0.948_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-2.353Y-0.14_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-2.353Y-0.14_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.286Y-1.918_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.286Y-1.918_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-2.353Y-0.14_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-2.353Y-0.14_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X0.198Y-0.435_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X0.198Y-0.435_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X0.198Y-0.435_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X0.198Y-0.435_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X1.501Y-8.364_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X1.501Y-8.364_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-2.353Y-0.14_NOS_2.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-2.353Y-0.14_NOS 2',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-1.039Y-11.543_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-1.039Y-11.543_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X1.322Y-8.643_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X1.322Y-8.643_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X0.189Y-0.513_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X0.189Y-0.513_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X1.11Y-6.153_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X1.11Y-6.153_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X1.297Y-3.782_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X1.297Y-3.782_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X1.501Y-8.364_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X1.501Y-8.364_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X2.231Y-0.975_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X2.231Y-0.975_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-2.006Y-0.701_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-2.006Y-0.701_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-1.424Y-4.114_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-1.424Y-4.114_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X0.196Y-0.513_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X0.196Y-0.513_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X1.299Y-3.692_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X1.299Y-3.692_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X3.58Y-1.219_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X3.58Y-1.219_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X1.322Y-8.643_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X1.322Y-8.643_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X1.299Y-3.692_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X1.299Y-3.692_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X1.297Y-3.782_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X1.297Y-3.782_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X1.361Y-2.352_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X1.361Y-2.352_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.249Y-1.918_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.249Y-1.918_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X1.501Y-8.364_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X1.501Y-8.364_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X0.189Y-0.513_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X0.189Y-0.513_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X0.198Y-0.435_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X0.198Y-0.435_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.322Y-0.019_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.322Y-0.019_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X0.196Y-0.513_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X0.196Y-0.513_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-2.006Y-0.701_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-2.006Y-0.701_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-2.569Y-0.192_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-2.569Y-0.192_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.286Y-1.918_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.286Y-1.918_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.322Y-0.019_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.322Y-0.019_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-2.006Y-0.701_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-2.006Y-0.701_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.263Y-1.76_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.263Y-1.76_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X1.322Y-8.643_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X1.322Y-8.643_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-1.805Y-7.008_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-1.805Y-7.008_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.534Y-4.983_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.534Y-4.983_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.522Y-1.851_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.522Y-1.851_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X0.189Y-0.513_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X0.189Y-0.513_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X3.483Y-12.563_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X3.483Y-12.563_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X3.483Y-12.563_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X3.483Y-12.563_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-1.805Y-7.008_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-1.805Y-7.008_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X2.231Y-0.975_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X2.231Y-0.975_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-2.569Y-0.192_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-2.569Y-0.192_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X8.093Y0.964_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X8.093Y0.964_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.286Y-1.918_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.286Y-1.918_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X1.11Y-6.153_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X1.11Y-6.153_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-3.37Y-9.468_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-3.37Y-9.468_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.967Y-6.602_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.967Y-6.602_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-1.805Y-7.008_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-1.805Y-7.008_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-2.353Y-0.14_DiI_2.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-2.353Y-0.14_DiI 2',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X1.297Y-3.782_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X1.297Y-3.782_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X1.565Y-5.857_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X1.565Y-5.857_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-3.37Y-9.468_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-3.37Y-9.468_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X1.361Y-2.352_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X1.361Y-2.352_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X0.431Y-3.813_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X0.431Y-3.813_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.249Y-1.918_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.249Y-1.918_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X2.175Y-0.948_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X2.175Y-0.948_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.962Y-1.103_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.962Y-1.103_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-1.424Y-4.114_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-1.424Y-4.114_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X2.231Y-0.975_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X2.231Y-0.975_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X1.11Y-6.153_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X1.11Y-6.153_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.267Y-1.858_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.267Y-1.858_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X5.495Y4.004_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X5.495Y4.004_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X2.175Y-0.948_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X2.175Y-0.948_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.116Y-1.685_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.116Y-1.685_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-2.353Y-0.14_ChAT_2.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-2.353Y-0.14_ChAT 2',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.267Y-1.858_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.267Y-1.858_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X0.431Y-3.813_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X0.431Y-3.813_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.962Y-1.103_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.962Y-1.103_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X0.431Y-3.813_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X0.431Y-3.813_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X1.299Y-3.692_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X1.299Y-3.692_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.267Y-1.858_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.267Y-1.858_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-2.569Y-0.192_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-2.569Y-0.192_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.967Y-6.602_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.967Y-6.602_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-1.047Y-1.45_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-1.047Y-1.45_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.534Y-4.983_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.534Y-4.983_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-1.424Y-4.114_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-1.424Y-4.114_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X3.58Y-1.219_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X3.58Y-1.219_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-1.047Y-1.45_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-1.047Y-1.45_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X5.495Y4.004_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X5.495Y4.004_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.962Y-1.103_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.962Y-1.103_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.116Y-1.685_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.116Y-1.685_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X5.495Y4.004_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X5.495Y4.004_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.522Y-1.851_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.522Y-1.851_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X8.093Y0.964_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X8.093Y0.964_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X1.565Y-5.857_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X1.565Y-5.857_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-2.675Y-1.063_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-2.675Y-1.063_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.534Y-4.983_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.534Y-4.983_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.322Y-0.019_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-0.322Y-0.019_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-2.675Y-1.063_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-2.675Y-1.063_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X3.58Y-1.219_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X3.58Y-1.219_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-2.675Y-1.063_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2111/sam-H2111/SPARC_H2111A_LM_MICROGRAPHS/SPARC_H2111A_LM_X-2.675Y-1.063_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X0.128Y-2.366_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X0.128Y-2.366_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X0.128Y-2.366_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X0.128Y-2.366_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X0.772Y-2.2_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X0.772Y-2.2_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X-2.034Y0.883_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X-2.034Y0.883_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X0.528Y-2.116_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X0.528Y-2.116_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X0.726Y-1.141_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X0.726Y-1.141_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X4.65Y-5.308_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X4.65Y-5.308_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X0.701Y-1.135_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X0.701Y-1.135_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X-0.555Y-2.366_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X-0.555Y-2.366_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X0.629Y-1.078_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X0.629Y-1.078_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X-2.034Y0.883_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X-2.034Y0.883_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X-0.597Y0.862_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X-0.597Y0.862_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X-0.597Y0.862_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X-0.597Y0.862_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X-0.774Y0.981_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X-0.774Y0.981_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X0.519Y-2.246_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X0.519Y-2.246_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X0.726Y-1.141_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X0.726Y-1.141_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X0.701Y-1.135_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X0.701Y-1.135_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X-0.774Y0.981_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X-0.774Y0.981_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X0.528Y-2.116_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X0.528Y-2.116_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X-0.779Y0.975_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X-0.779Y0.975_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X0.519Y-2.246_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X0.519Y-2.246_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X0.772Y-2.2_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X0.772Y-2.2_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X0.528Y-2.116_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X0.528Y-2.116_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X-2.034Y0.883_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X-2.034Y0.883_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X4.65Y-5.308_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X4.65Y-5.308_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X-0.636Y1.152_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X-0.636Y1.152_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X0.519Y-2.246_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X0.519Y-2.246_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X0.701Y-1.135_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X0.701Y-1.135_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X-0.597Y0.862_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X-0.597Y0.862_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X-0.636Y1.152_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X-0.636Y1.152_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X-0.555Y-2.366_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X-0.555Y-2.366_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X-0.636Y1.152_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X-0.636Y1.152_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X-0.555Y-2.366_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X-0.555Y-2.366_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X-1.137Y-2.297_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X-1.137Y-2.297_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X-1.137Y-2.297_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X-1.137Y-2.297_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X0.128Y-2.366_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X0.128Y-2.366_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X-1.137Y-2.297_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X-1.137Y-2.297_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X0.772Y-2.2_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X0.772Y-2.2_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X-0.779Y0.975_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X-0.779Y0.975_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X4.65Y-5.308_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X4.65Y-5.308_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X0.726Y-1.141_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X0.726Y-1.141_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X0.629Y-1.078_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X0.629Y-1.078_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-0.15Y-0.864_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-0.15Y-0.864_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X0.629Y-1.078_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X0.629Y-1.078_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X-0.774Y0.981_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2104/sam-H2104/SPARC_H2104B_LM_MICROGRAPHS/SPARC_H2104B_LM_X-0.774Y0.981_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X3.095Y-4.484_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X3.095Y-4.484_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X1.176Y-3.782_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X1.176Y-3.782_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X0.808Y-0.219_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X0.808Y-0.219_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X0.808Y-0.219_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X0.808Y-0.219_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-1.248Y0.962_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-1.248Y0.962_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-0.589Y0.791_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-0.589Y0.791_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-0.176Y-1.003_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-0.176Y-1.003_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X3.095Y-4.484_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X3.095Y-4.484_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X1Y-2.155_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X1Y-2.155_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-1.284Y0.378_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-1.284Y0.378_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-1.827Y0.207_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-1.827Y0.207_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X0.94Y-0.993_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X0.94Y-0.993_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X3.095Y-4.484_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X3.095Y-4.484_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X0.813Y-0.198_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X0.813Y-0.198_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X0.941Y-1.158_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X0.941Y-1.158_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-0.595Y0.809_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-0.595Y0.809_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X1.096Y-0.257_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X1.096Y-0.257_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X3.194Y-3.065_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X3.194Y-3.065_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X1.911Y-2.995_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X1.911Y-2.995_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X0.941Y-1.175_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X0.941Y-1.175_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-0.595Y0.809_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-0.595Y0.809_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X1.03Y-2.136_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X1.03Y-2.136_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X0.997Y-0.257_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X0.997Y-0.257_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X4.559Y-1.158_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X4.559Y-1.158_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X0.983Y-0.145_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X0.983Y-0.145_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X0.983Y-0.145_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X0.983Y-0.145_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X1.096Y-0.257_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X1.096Y-0.257_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X1.03Y-2.136_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X1.03Y-2.136_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X1.176Y-3.782_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X1.176Y-3.782_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X0.667Y-2.708_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X0.667Y-2.708_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-0.245Y-3.287_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-0.245Y-3.287_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-0.15Y-0.864_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-0.15Y-0.864_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X0.983Y-0.145_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X0.983Y-0.145_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-0.176Y-1.003_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-0.176Y-1.003_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-1.183Y0.952_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-1.183Y0.952_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-1.301Y-0.085_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-1.301Y-0.085_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-1.183Y0.952_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-1.183Y0.952_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X0.997Y-0.257_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X0.997Y-0.257_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-0.396Y3.211_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-0.396Y3.211_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-1.248Y0.962_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-1.248Y0.962_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-1.284Y0.378_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-1.284Y0.378_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-1.248Y0.962_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-1.248Y0.962_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-1.301Y-0.085_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-1.301Y-0.085_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-0.396Y3.211_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-0.396Y3.211_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X0.667Y-2.708_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X0.667Y-2.708_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X0.941Y-1.158_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X0.941Y-1.158_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X0.808Y-0.219_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X0.808Y-0.219_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X1.095Y-0.265_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X1.095Y-0.265_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X0.941Y-1.158_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X0.941Y-1.158_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-0.245Y-3.287_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-0.245Y-3.287_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X0.997Y-0.257_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X0.997Y-0.257_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X0.494Y-1.553_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X0.494Y-1.553_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X1.176Y-3.782_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X1.176Y-3.782_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X1.096Y-0.257_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X1.096Y-0.257_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X0.494Y-1.553_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X0.494Y-1.553_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X1.012Y-0.183_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X1.012Y-0.183_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-0.595Y0.809_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-0.595Y0.809_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X0.813Y-0.198_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X0.813Y-0.198_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X4.559Y-1.158_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X4.559Y-1.158_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X0.94Y-0.993_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X0.94Y-0.993_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X0.941Y-1.175_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X0.941Y-1.175_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X1.911Y-2.995_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X1.911Y-2.995_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X1.911Y-2.995_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X1.911Y-2.995_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-0.589Y0.791_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-0.589Y0.791_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-1.301Y-0.085_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-1.301Y-0.085_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X1.012Y-0.183_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X1.012Y-0.183_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-0.176Y-1.003_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-0.176Y-1.003_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X1Y-2.155_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X1Y-2.155_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X1.095Y-0.265_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X1.095Y-0.265_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-0.589Y0.791_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-0.589Y0.791_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X0.94Y-0.993_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X0.94Y-0.993_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X4.738Y-1.275_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X4.738Y-1.275_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X1.03Y-2.136_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X1.03Y-2.136_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-1.827Y0.207_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-1.827Y0.207_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X0.494Y-1.553_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X0.494Y-1.553_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X4.559Y-1.158_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X4.559Y-1.158_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X1.012Y-0.183_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X1.012Y-0.183_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X1.095Y-0.265_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X1.095Y-0.265_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X3.194Y-3.065_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X3.194Y-3.065_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-0.15Y-0.864_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-0.15Y-0.864_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X0.667Y-2.708_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X0.667Y-2.708_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X0.813Y-0.198_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X0.813Y-0.198_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-1.284Y0.378_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-1.284Y0.378_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X0.941Y-1.175_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X0.941Y-1.175_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X4.738Y-1.275_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X4.738Y-1.275_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X3.194Y-3.065_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X3.194Y-3.065_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-0.245Y-3.287_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-0.245Y-3.287_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-1.827Y0.207_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X-1.827Y0.207_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.558Y-1.696_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.558Y-1.696_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.657Y-1.404_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.657Y-1.404_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X1Y-2.155_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2109/sam-H2109/SPARC_H2109B_LM_MICROGRAPHS/SPARC_H2109B_LM_X1Y-2.155_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.321Y-1.634_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.321Y-1.634_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.054Y-3.193_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.054Y-3.193_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.505Y-1.407_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.505Y-1.407_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.547Y-2.855_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.547Y-2.855_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X1.165Y-2.325_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X1.165Y-2.325_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.516Y-4.271_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.516Y-4.271_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.521Y-1.597_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.521Y-1.597_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.323Y-1.986_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.323Y-1.986_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.709Y-1.754_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.709Y-1.754_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.464Y-2.14_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.464Y-2.14_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X1.762Y-5.053_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X1.762Y-5.053_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.558Y-1.696_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.558Y-1.696_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.521Y-4.671_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.521Y-4.671_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.424Y-4.544_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.424Y-4.544_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.482Y-1.626_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.482Y-1.626_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.526Y-1.527_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.526Y-1.527_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.739Y-6.254_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.739Y-6.254_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.521Y-4.671_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.521Y-4.671_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.721Y-5.783_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.721Y-5.783_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-3.263Y-0.475_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-3.263Y-0.475_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.559Y-4.676_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.559Y-4.676_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-3.263Y-0.475_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-3.263Y-0.475_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.423Y-4.444_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.423Y-4.444_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.424Y-1.638_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.424Y-1.638_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.516Y-4.271_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.516Y-4.271_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X1.19Y-1.845_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X1.19Y-1.845_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.8Y-1.895_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.8Y-1.895_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.521Y-4.671_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.521Y-4.671_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X1.762Y-5.053_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X1.762Y-5.053_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.679Y-1.347_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.679Y-1.347_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.159Y-5.8_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.159Y-5.8_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.516Y-4.271_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.516Y-4.271_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X2.83Y-2.604_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X2.83Y-2.604_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X1.762Y-5.053_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X1.762Y-5.053_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.029Y-5.936_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.029Y-5.936_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.526Y-1.527_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.526Y-1.527_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.721Y-5.783_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.721Y-5.783_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.545Y-1.641_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.545Y-1.641_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.529Y-1.562_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.529Y-1.562_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.159Y-5.8_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.159Y-5.8_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.602Y-2.317_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.602Y-2.317_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.424Y-1.638_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.424Y-1.638_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.521Y-1.597_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.521Y-1.597_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.464Y-2.14_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.464Y-2.14_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.521Y-1.597_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.521Y-1.597_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.602Y-2.317_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.602Y-2.317_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X1.19Y-1.845_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X1.19Y-1.845_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.423Y-4.444_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.423Y-4.444_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.344Y-1.48_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.344Y-1.48_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.321Y-1.634_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.321Y-1.634_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.323Y-1.986_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.323Y-1.986_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X2.83Y-2.604_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X2.83Y-2.604_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X1.187Y-1.824_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X1.187Y-1.824_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.496Y-4.512_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.496Y-4.512_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.545Y-1.641_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.545Y-1.641_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.558Y-1.696_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.558Y-1.696_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.547Y-2.855_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.547Y-2.855_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.054Y-3.193_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.054Y-3.193_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.561Y-1.733_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.561Y-1.733_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.505Y-1.407_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.505Y-1.407_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.046Y-1.752_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.046Y-1.752_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.561Y-1.733_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.561Y-1.733_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.321Y-1.634_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.321Y-1.634_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.657Y-1.404_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.657Y-1.404_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-3.263Y-0.475_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-3.263Y-0.475_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.046Y-1.752_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.046Y-1.752_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.602Y-2.317_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.602Y-2.317_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.709Y-1.754_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.709Y-1.754_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.561Y-1.733_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.561Y-1.733_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X1.165Y-2.325_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X1.165Y-2.325_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.529Y-1.562_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.529Y-1.562_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.709Y-1.754_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.709Y-1.754_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.344Y3.865_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.344Y3.865_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.455Y-4.494_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.455Y-4.494_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.559Y-4.676_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.559Y-4.676_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.344Y-1.48_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.344Y-1.48_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.423Y-4.444_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.423Y-4.444_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.8Y-1.895_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.8Y-1.895_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X2.83Y-2.604_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X2.83Y-2.604_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.559Y-4.676_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.559Y-4.676_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X1.165Y-2.325_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X1.165Y-2.325_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.842Y0.686_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.842Y0.686_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.526Y-1.527_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.526Y-1.527_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.464Y-2.14_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.464Y-2.14_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.679Y-1.347_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.679Y-1.347_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.038Y-5.865_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.038Y-5.865_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.038Y-5.865_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.038Y-5.865_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X1.187Y-1.824_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X1.187Y-1.824_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.505Y-1.407_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.505Y-1.407_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.657Y-1.404_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.657Y-1.404_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.344Y3.865_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.344Y3.865_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.054Y-3.193_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.054Y-3.193_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.794Y1.212_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.794Y1.212_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.323Y-1.986_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.323Y-1.986_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.482Y-1.626_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.482Y-1.626_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.794Y1.212_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.794Y1.212_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.455Y-4.494_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.455Y-4.494_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.424Y-4.544_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.424Y-4.544_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.344Y3.865_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.344Y3.865_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.496Y-4.512_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.496Y-4.512_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.721Y-5.783_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.721Y-5.783_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.529Y-1.562_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.529Y-1.562_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X1.19Y-1.845_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X1.19Y-1.845_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.679Y-1.347_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.679Y-1.347_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.424Y-1.638_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.424Y-1.638_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.424Y-4.544_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.424Y-4.544_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.344Y-1.48_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.344Y-1.48_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.739Y-6.254_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.739Y-6.254_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.038Y-5.865_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.038Y-5.865_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.8Y-1.895_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.8Y-1.895_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.545Y-1.641_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.545Y-1.641_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X1.187Y-1.824_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X1.187Y-1.824_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.482Y-1.626_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.482Y-1.626_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.794Y1.212_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.794Y1.212_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.046Y-1.752_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.046Y-1.752_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.739Y-6.254_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.739Y-6.254_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.455Y-4.494_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.455Y-4.494_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.029Y-5.936_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.029Y-5.936_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.547Y-2.855_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.547Y-2.855_DiI',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.029Y-5.936_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.029Y-5.936_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.159Y-5.8_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.159Y-5.8_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.842Y0.686_ChAT.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.842Y0.686_ChAT',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.496Y-4.512_NOS.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X-0.496Y-4.512_NOS',
-            'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.842Y0.686_DiI.tif': 'files/primary/LMMNs_Inter-taenial ChAT NOS DiI MICROGRAPHS/sub-H2107/sam-H2107/SPARC_H2107C_LM_MICROGRAPHS/SPARC_H2107C_LM_X0.842Y0.686_DiI',
-            'files/primary/LMMNs_Tenia NOS VIP DiI/sub-H2146/sam-H2146/SPARC_H2146b_LM__Taeniae__DiI_VIP_NOS.xlsx': 'files/primary/LMMNs_Tenia NOS VIP DiI/sub-H2146/sam-H2146/SPARC_H2146b_LM (Taeniae)_DiI VIP%26NOS.xlsx',
-            'files/primary/LMMNs_Tenia NOS VIP DiI/sub-H2139/sam-H2139/SPARC_H2139c_LM__Taeniae__DiI_VIP_NOS.xlsx': 'files/primary/LMMNs_Tenia NOS VIP DiI/sub-H2139/sam-H2139/SPARC_H2139c_LM (Taeniae)_DiI VIP%26NOS.xlsx',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI/README_revised2.txt': 'files/primary/LMMNs_Tenia ChAT NOS DiI/README.txt',
-            'files/primary/LMMNs_Tenia NOS VIP DiI/sub-H2149/sam-H2149B/SPARC_H2149b_LM__Taeniae__DiI_VIP_NOS.xlsx': 'files/primary/LMMNs_Tenia NOS VIP DiI/sub-H2149/sam-H2149B/SPARC_H2149b_LM (Taeniae)_DiI VIP%26NOS.xlsx',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI/sub-H2150/sam-H2150/SPARC_H2150c_LM__Taeniae__DiI_ChAT_NOS.xlsx': 'files/primary/LMMNs_Tenia ChAT NOS DiI/sub-H2150/sam-H2150/SPARC_H2150c_LM (Taeniae)_DiI ChAT%26NOS.xlsx',
-            'files/primary/LMMNs_Tenia NOS VIP DiI/sub-H2145/sam-H2145B/SPARC_H2145b_LM__Taeniae__DiI_VIP_NOS.xlsx': 'files/primary/LMMNs_Tenia NOS VIP DiI/sub-H2145/sam-H2145B/SPARC_H2145b_LM (Taeniae)_DiI VIP%26NOS.xlsx',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI/sub-H2162/sam-H2162/SPARC_H2162a_LM__Taeniae__DiI_ChAT_NOS.xlsx': 'files/primary/LMMNs_Tenia ChAT NOS DiI/sub-H2162/sam-H2162/SPARC_H2162a_LM (Taeniae)_DiI ChAT%26NOS.xlsx',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI/sub-H2151/sam-H2151C/SPARC_H2151c_LM__Taeniae__DiI_ChAT_NOS.xlsx': 'files/primary/LMMNs_Tenia ChAT NOS DiI/sub-H2151/sam-H2151C/SPARC_H2151c_LM (Taeniae)_DiI ChAT%26NOS.xlsx',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI/sub-H2145/sam-H2145/SPARC_H2145c_LM__Taeniae__DiI_ChAT_NOS.xlsx': 'files/primary/LMMNs_Tenia ChAT NOS DiI/sub-H2145/sam-H2145/SPARC_H2145c_LM (Taeniae)_DiI ChAT%26NOS.xlsx',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI/sub-H2149/sam-H2149/SPARC_H2149c_LM__Taeniae__DiI_ChAT_NOS.xlsx': 'files/primary/LMMNs_Tenia ChAT NOS DiI/sub-H2149/sam-H2149/SPARC_H2149c_LM (Taeniae)_DiI ChAT%26NOS.xlsx',
-            'files/primary/Tertiary_Plexus_density_from_immunohistochemistry/pool-Tertiary_Plexus_density_from_immunohistochemistry/README(7).txt': 'files/primary/Tertiary_Plexus_density_from_immunohistochemistry/pool-Tertiary_Plexus_density_from_immunohistochemistry/README.txt',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI/sub-H2151/sam-H2151/SPARC_H2151b_LM__Taeniae__DiI_ChAT_NOS.xlsx': 'files/primary/LMMNs_Tenia ChAT NOS DiI/sub-H2151/sam-H2151/SPARC_H2151b_LM (Taeniae)_DiI ChAT%26NOS.xlsx',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2150/sam-H2150/SPARC_H2150_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2150C_LM (Taeniae)_X0.273Y-3.291_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2150/sam-H2150/SPARC_H2150_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2150C_LM (Taeniae)_X0.273Y-3.291_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2150/sam-H2150/SPARC_H2150_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2150C_LM (Taeniae)_X1.535Y-4.105_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2150/sam-H2150/SPARC_H2150_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2150C_LM (Taeniae)_X1.535Y-4.105_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2150/sam-H2150/SPARC_H2150_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2150C_LM (Taeniae)_X3.042Y-6.37_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2150/sam-H2150/SPARC_H2150_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2150C_LM (Taeniae)_X3.042Y-6.37_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2150/sam-H2150/SPARC_H2150_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2150C_LM (Taeniae)_X3.042Y-6.37_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2150/sam-H2150/SPARC_H2150_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2150C_LM (Taeniae)_X3.042Y-6.37_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2150/sam-H2150/SPARC_H2150_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2150C_LM (Taeniae)_X0.678Y-3.099_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2150/sam-H2150/SPARC_H2150_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2150C_LM (Taeniae)_X0.678Y-3.099_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2150/sam-H2150/SPARC_H2150_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2150C_LM (Taeniae)_X0.678Y-3.099_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2150/sam-H2150/SPARC_H2150_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2150C_LM (Taeniae)_X0.678Y-3.099_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2150/sam-H2150/SPARC_H2150_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2150C_LM (Taeniae)_X2.919Y-5.987_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2150/sam-H2150/SPARC_H2150_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2150C_LM (Taeniae)_X2.919Y-5.987_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2150/sam-H2150/SPARC_H2150_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2150C_LM (Taeniae)_X3.042Y-6.37_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2150/sam-H2150/SPARC_H2150_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2150C_LM (Taeniae)_X3.042Y-6.37_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2150/sam-H2150/SPARC_H2150_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2150C_LM (Taeniae)_X1.535Y-4.105_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2150/sam-H2150/SPARC_H2150_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2150C_LM (Taeniae)_X1.535Y-4.105_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2150/sam-H2150/SPARC_H2150_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2150C_LM (Taeniae)_X0.273Y-3.291_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2150/sam-H2150/SPARC_H2150_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2150C_LM (Taeniae)_X0.273Y-3.291_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2150/sam-H2150/SPARC_H2150_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2150C_LM (Taeniae)_X2.919Y-5.987_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2150/sam-H2150/SPARC_H2150_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2150C_LM (Taeniae)_X2.919Y-5.987_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2150/sam-H2150/SPARC_H2150_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2150C_LM (Taeniae)_X0.678Y-3.099_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2150/sam-H2150/SPARC_H2150_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2150C_LM (Taeniae)_X0.678Y-3.099_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2150/sam-H2150/SPARC_H2150_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2150C_LM (Taeniae)_X0.273Y-3.291_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2150/sam-H2150/SPARC_H2150_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2150C_LM (Taeniae)_X0.273Y-3.291_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2150/sam-H2150/SPARC_H2150_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2150C_LM (Taeniae)_X1.535Y-4.105_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2150/sam-H2150/SPARC_H2150_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2150C_LM (Taeniae)_X1.535Y-4.105_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/README_revised2.txt': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/README.txt',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2150/sam-H2150/SPARC_H2150_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2150C_LM (Taeniae)_X2.919Y-5.987_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2150/sam-H2150/SPARC_H2150_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2150C_LM (Taeniae)_X2.919Y-5.987_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2162/sam-H2162/SPARC_H2162_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2162A_LM (Taeniae)_X3.054Y6.671_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2162/sam-H2162/SPARC_H2162_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2162A_LM (Taeniae)_X3.054Y6.671_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2162/sam-H2162/SPARC_H2162_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2162A_LM (Taeniae)_X0.542Y8.058_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2162/sam-H2162/SPARC_H2162_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2162A_LM (Taeniae)_X0.542Y8.058_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2162/sam-H2162/SPARC_H2162_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2162A_LM (Taeniae)_X5.477Y2.049_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2162/sam-H2162/SPARC_H2162_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2162A_LM (Taeniae)_X5.477Y2.049_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2162/sam-H2162/SPARC_H2162_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2162A_LM (Taeniae)_X0.826Y-1.647_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2162/sam-H2162/SPARC_H2162_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2162A_LM (Taeniae)_X0.826Y-1.647_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2162/sam-H2162/SPARC_H2162_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2162A_LM (Taeniae)_X0.843Y-4.203_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2162/sam-H2162/SPARC_H2162_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2162A_LM (Taeniae)_X0.843Y-4.203_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2162/sam-H2162/SPARC_H2162_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2162A_LM (Taeniae)_X3.054Y6.671_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2162/sam-H2162/SPARC_H2162_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2162A_LM (Taeniae)_X3.054Y6.671_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2162/sam-H2162/SPARC_H2162_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2162A_LM (Taeniae)_X0.609Y-3.065_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2162/sam-H2162/SPARC_H2162_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2162A_LM (Taeniae)_X0.609Y-3.065_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2162/sam-H2162/SPARC_H2162_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2162A_LM (Taeniae)_X0.59Y2.734_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2162/sam-H2162/SPARC_H2162_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2162A_LM (Taeniae)_X0.59Y2.734_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2162/sam-H2162/SPARC_H2162_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2162A_LM (Taeniae)_X3.054Y6.671_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2162/sam-H2162/SPARC_H2162_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2162A_LM (Taeniae)_X3.054Y6.671_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2162/sam-H2162/SPARC_H2162_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2162A_LM (Taeniae)_X5.477Y2.049_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2162/sam-H2162/SPARC_H2162_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2162A_LM (Taeniae)_X5.477Y2.049_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2162/sam-H2162/SPARC_H2162_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2162A_LM (Taeniae)_X0.609Y-3.065_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2162/sam-H2162/SPARC_H2162_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2162A_LM (Taeniae)_X0.609Y-3.065_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2162/sam-H2162/SPARC_H2162_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2162A_LM (Taeniae)_X0.542Y8.058_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2162/sam-H2162/SPARC_H2162_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2162A_LM (Taeniae)_X0.542Y8.058_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2162/sam-H2162/SPARC_H2162_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2162A_LM (Taeniae)_X0.59Y2.734_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2162/sam-H2162/SPARC_H2162_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2162A_LM (Taeniae)_X0.59Y2.734_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2162/sam-H2162/SPARC_H2162_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2162A_LM (Taeniae)_X0.328Y5.26_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2162/sam-H2162/SPARC_H2162_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2162A_LM (Taeniae)_X0.328Y5.26_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2162/sam-H2162/SPARC_H2162_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2162A_LM (Taeniae)_X0.843Y-4.203_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2162/sam-H2162/SPARC_H2162_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2162A_LM (Taeniae)_X0.843Y-4.203_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2162/sam-H2162/SPARC_H2162_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2162A_LM (Taeniae)_X0.542Y8.058_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2162/sam-H2162/SPARC_H2162_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2162A_LM (Taeniae)_X0.542Y8.058_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2162/sam-H2162/SPARC_H2162_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2162A_LM (Taeniae)_X0.826Y-1.647_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2162/sam-H2162/SPARC_H2162_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2162A_LM (Taeniae)_X0.826Y-1.647_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2162/sam-H2162/SPARC_H2162_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2162A_LM (Taeniae)_X0.915Y3.648_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2162/sam-H2162/SPARC_H2162_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2162A_LM (Taeniae)_X0.915Y3.648_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2162/sam-H2162/SPARC_H2162_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2162A_LM (Taeniae)_X0.915Y3.648_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2162/sam-H2162/SPARC_H2162_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2162A_LM (Taeniae)_X0.915Y3.648_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2162/sam-H2162/SPARC_H2162_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2162A_LM (Taeniae)_X0.328Y5.26_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2162/sam-H2162/SPARC_H2162_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2162A_LM (Taeniae)_X0.328Y5.26_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2162/sam-H2162/SPARC_H2162_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2162A_LM (Taeniae)_X0.843Y-4.203_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2162/sam-H2162/SPARC_H2162_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2162A_LM (Taeniae)_X0.843Y-4.203_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2162/sam-H2162/SPARC_H2162_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2162A_LM (Taeniae)_X0.915Y3.648_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2162/sam-H2162/SPARC_H2162_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2162A_LM (Taeniae)_X0.915Y3.648_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2162/sam-H2162/SPARC_H2162_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2162A_LM (Taeniae)_X0.609Y-3.065_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2162/sam-H2162/SPARC_H2162_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2162A_LM (Taeniae)_X0.609Y-3.065_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2162/sam-H2162/SPARC_H2162_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2162A_LM (Taeniae)_X0.328Y5.26_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2162/sam-H2162/SPARC_H2162_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2162A_LM (Taeniae)_X0.328Y5.26_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2162/sam-H2162/SPARC_H2162_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2162A_LM (Taeniae)_X0.59Y2.734_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2162/sam-H2162/SPARC_H2162_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2162A_LM (Taeniae)_X0.59Y2.734_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2162/sam-H2162/SPARC_H2162_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2162A_LM (Taeniae)_X0.826Y-1.647_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2162/sam-H2162/SPARC_H2162_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2162A_LM (Taeniae)_X0.826Y-1.647_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151C/SPARC_H2151c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151C_LM (Taeniae)_X1.292Y5.039_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151C/SPARC_H2151c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151C_LM (Taeniae)_X1.292Y5.039_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2162/sam-H2162/SPARC_H2162_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2162A_LM (Taeniae)_X5.477Y2.049_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2162/sam-H2162/SPARC_H2162_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2162A_LM (Taeniae)_X5.477Y2.049_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151C/SPARC_H2151c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151C_LM (Taeniae)_-0.322-5.669_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151C/SPARC_H2151c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151C_LM (Taeniae)_-0.322-5.669_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151C/SPARC_H2151c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151C_LM (Taeniae)_X1.292Y5.039_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151C/SPARC_H2151c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151C_LM (Taeniae)_X1.292Y5.039_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151C/SPARC_H2151c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151C_LM (Taeniae)_X0.251Y-4.889_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151C/SPARC_H2151c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151C_LM (Taeniae)_X0.251Y-4.889_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151C/SPARC_H2151c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151C_LM (Taeniae)_X1.633Y5.54_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151C/SPARC_H2151c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151C_LM (Taeniae)_X1.633Y5.54_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151C/SPARC_H2151c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151C_LM (Taeniae)_-1.16-3.039_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151C/SPARC_H2151c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151C_LM (Taeniae)_-1.16-3.039_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151C/SPARC_H2151c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151C_LM (Taeniae)_X-0.326Y1.671_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151C/SPARC_H2151c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151C_LM (Taeniae)_X-0.326Y1.671_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151C/SPARC_H2151c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151C_LM (Taeniae)_X-0.455Y-3.978_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151C/SPARC_H2151c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151C_LM (Taeniae)_X-0.455Y-3.978_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151C/SPARC_H2151c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151C_LM (Taeniae)_X0.251Y-4.889_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151C/SPARC_H2151c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151C_LM (Taeniae)_X0.251Y-4.889_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151C/SPARC_H2151c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151C_LM (Taeniae)_X0.273Y2.366_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151C/SPARC_H2151c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151C_LM (Taeniae)_X0.273Y2.366_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151C/SPARC_H2151c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151C_LM (Taeniae)_X-0.455Y-3.978_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151C/SPARC_H2151c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151C_LM (Taeniae)_X-0.455Y-3.978_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151C/SPARC_H2151c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151C_LM (Taeniae)_-1.16-3.039_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151C/SPARC_H2151c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151C_LM (Taeniae)_-1.16-3.039_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151C/SPARC_H2151c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151C_LM (Taeniae)_X-0.269Y-3.724_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151C/SPARC_H2151c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151C_LM (Taeniae)_X-0.269Y-3.724_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151C/SPARC_H2151c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151C_LM (Taeniae)_-1.16-3.039_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151C/SPARC_H2151c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151C_LM (Taeniae)_-1.16-3.039_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151C/SPARC_H2151c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151C_LM (Taeniae)_X-0.455Y-3.978_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151C/SPARC_H2151c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151C_LM (Taeniae)_X-0.455Y-3.978_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151C/SPARC_H2151c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151C_LM (Taeniae)_X0.273Y2.366_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151C/SPARC_H2151c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151C_LM (Taeniae)_X0.273Y2.366_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151C/SPARC_H2151c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151C_LM (Taeniae)_X-0.326Y1.671_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151C/SPARC_H2151c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151C_LM (Taeniae)_X-0.326Y1.671_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151C/SPARC_H2151c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151C_LM (Taeniae)_-0.322-5.669_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151C/SPARC_H2151c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151C_LM (Taeniae)_-0.322-5.669_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151C/SPARC_H2151c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151C_LM (Taeniae)_X-0.269Y-3.724_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151C/SPARC_H2151c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151C_LM (Taeniae)_X-0.269Y-3.724_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151C/SPARC_H2151c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151C_LM (Taeniae)_X0.251Y-4.889_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151C/SPARC_H2151c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151C_LM (Taeniae)_X0.251Y-4.889_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151C/SPARC_H2151c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151C_LM (Taeniae)_X1.633Y5.54_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151C/SPARC_H2151c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151C_LM (Taeniae)_X1.633Y5.54_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151C/SPARC_H2151c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151C_LM (Taeniae)_X1.633Y5.54_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151C/SPARC_H2151c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151C_LM (Taeniae)_X1.633Y5.54_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151C/SPARC_H2151c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151C_LM (Taeniae)_X-0.269Y-3.724_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151C/SPARC_H2151c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151C_LM (Taeniae)_X-0.269Y-3.724_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151C/SPARC_H2151c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151C_LM (Taeniae)_X-0.326Y1.671_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151C/SPARC_H2151c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151C_LM (Taeniae)_X-0.326Y1.671_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151C/SPARC_H2151c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151C_LM (Taeniae)_X1.292Y5.039_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151C/SPARC_H2151c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151C_LM (Taeniae)_X1.292Y5.039_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151C/SPARC_H2151c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151C_LM (Taeniae)_-0.322-5.669_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151C/SPARC_H2151c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151C_LM (Taeniae)_-0.322-5.669_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151/SPARC_H2151b_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151B_LM (Taeniae)_X0.348Y-9.115_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151/SPARC_H2151b_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151B_LM (Taeniae)_X0.348Y-9.115_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151C/SPARC_H2151c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151C_LM (Taeniae)_X0.273Y2.366_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151C/SPARC_H2151c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151C_LM (Taeniae)_X0.273Y2.366_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151/SPARC_H2151b_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151B_LM (Taeniae)_X0.348Y-9.115_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151/SPARC_H2151b_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151B_LM (Taeniae)_X0.348Y-9.115_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151/SPARC_H2151b_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151B_LM (Taeniae)_X0.348Y-9.115_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151/SPARC_H2151b_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151B_LM (Taeniae)_X0.348Y-9.115_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151/SPARC_H2151b_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151B_LM (Taeniae)_X0.408Y-9.803_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151/SPARC_H2151b_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151B_LM (Taeniae)_X0.408Y-9.803_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151/SPARC_H2151b_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151B_LM (Taeniae)_X0.408Y-9.803_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151/SPARC_H2151b_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151B_LM (Taeniae)_X0.408Y-9.803_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151/SPARC_H2151b_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151B_LM (Taeniae)_X0.455Y-10.085_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151/SPARC_H2151b_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151B_LM (Taeniae)_X0.455Y-10.085_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X-0.618Y3.042_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X-0.618Y3.042_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151/SPARC_H2151b_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151B_LM (Taeniae)_X0.408Y-9.803_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151/SPARC_H2151b_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151B_LM (Taeniae)_X0.408Y-9.803_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151/SPARC_H2151b_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151B_LM (Taeniae)_X0.455Y-10.085_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151/SPARC_H2151b_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151B_LM (Taeniae)_X0.455Y-10.085_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.776Y-5.13_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.776Y-5.13_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151/SPARC_H2151b_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151B_LM (Taeniae)_X0.455Y-10.085_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2151/sam-H2151/SPARC_H2151b_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2151B_LM (Taeniae)_X0.455Y-10.085_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.309Y-6.257_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.309Y-6.257_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.666Y8.025_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.666Y8.025_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.249Y-6.076_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.249Y-6.076_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.309Y-6.257_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.309Y-6.257_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X1.095Y-2.411_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X1.095Y-2.411_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.472Y-3.286_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.472Y-3.286_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.286Y2.996_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.286Y2.996_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.166Y5.192_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.166Y5.192_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.286Y2.996_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.286Y2.996_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.666Y8.025_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.666Y8.025_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.286Y2.996_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.286Y2.996_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.234Y-7.277_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.234Y-7.277_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.454Y-6.827_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.454Y-6.827_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.078Y-4.696_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.078Y-4.696_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.234Y-7.277_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.234Y-7.277_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.309Y-6.257_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.309Y-6.257_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X1.095Y-2.411_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X1.095Y-2.411_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X-0.618Y3.042_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X-0.618Y3.042_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.555Y4.966_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.555Y4.966_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.166Y5.192_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.166Y5.192_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.454Y-6.827_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.454Y-6.827_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.466Y-2.887_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.466Y-2.887_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.078Y-4.696_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.078Y-4.696_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X-0.053Y-6.436_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X-0.053Y-6.436_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.249Y-6.076_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.249Y-6.076_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.776Y-5.13_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.776Y-5.13_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X-0.236Y-5.122_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X-0.236Y-5.122_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X-0.193Y3.814_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X-0.193Y3.814_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X-0.053Y-6.436_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X-0.053Y-6.436_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.249Y-6.076_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.249Y-6.076_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X-0.618Y3.042_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X-0.618Y3.042_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.555Y4.966_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.555Y4.966_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.666Y8.025_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.666Y8.025_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.234Y-7.277_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.234Y-7.277_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X1.095Y-2.411_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X1.095Y-2.411_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.454Y-6.827_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.454Y-6.827_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.166Y5.192_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.166Y5.192_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X-0.193Y3.814_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X-0.193Y3.814_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X-0.236Y-5.122_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X-0.236Y-5.122_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.555Y4.966_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.555Y4.966_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.776Y-5.13_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.776Y-5.13_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.07Y-5.932_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.07Y-5.932_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.078Y-4.696_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.078Y-4.696_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.472Y-3.286_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.472Y-3.286_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.466Y-2.887_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.466Y-2.887_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X-0.053Y-6.436_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X-0.053Y-6.436_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.466Y-2.887_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.466Y-2.887_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X-0.193Y3.814_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X-0.193Y3.814_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.472Y-3.286_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.472Y-3.286_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.07Y-5.932_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.07Y-5.932_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X-0.236Y-5.122_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X-0.236Y-5.122_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X2.452Y-4.279_DiI x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X2.452Y-4.279_DiI x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X0.388Y1.941_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X0.388Y1.941_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.07Y-5.932_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2149/sam-H2149/SPARC_H2149c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2149C_LM (Taeniae)_X0.07Y-5.932_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X2.204Y-3.5_NOS_x20tif.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X2.204Y-3.5_NOS_x20tif',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.561Y-3.491_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.561Y-3.491_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.437Y-5.971_DiI x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.437Y-5.971_DiI x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.437Y-5.971_NOS x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.437Y-5.971_NOS x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.561Y-3.491_NOS_x20tif.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.561Y-3.491_NOS_x20tif',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.393Y-4.482_ChAT x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.393Y-4.482_ChAT x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.829Y-2.194_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.829Y-2.194_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.245Y-1.278_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.245Y-1.278_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.212Y-6.313_NOS x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.212Y-6.313_NOS x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.437Y-5.971_ChAT x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.437Y-5.971_ChAT x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.393Y-4.482_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.393Y-4.482_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.391Y-5.649_ChAT x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.391Y-5.649_ChAT x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X0.574Y-3.137a_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X0.574Y-3.137a_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.083Y-4.502_DiI x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.083Y-4.502_DiI x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X0.802Y-6.18_NOS x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X0.802Y-6.18_NOS x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X2.565Y-2.05_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X2.565Y-2.05_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X2.565Y-2.05_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X2.565Y-2.05_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X2.204Y-3.5_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X2.204Y-3.5_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.393Y-4.482_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.393Y-4.482_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X2.145Y2.16_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X2.145Y2.16_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X2.085Y-1.982_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X2.085Y-1.982_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.697Y-1.913_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.697Y-1.913_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X2.204Y-3.5_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X2.204Y-3.5_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.391Y-5.649_NOS x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.391Y-5.649_NOS x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X0.965Y-3.374_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X0.965Y-3.374_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.829Y-2.194_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.829Y-2.194_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.212Y-6.313_DiI x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.212Y-6.313_DiI x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X0.965Y-3.374_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X0.965Y-3.374_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X2.145Y2.16_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X2.145Y2.16_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X2.033Y-3.478_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X2.033Y-3.478_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X0.574Y-3.137a_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X0.574Y-3.137a_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X0.388Y1.941_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X0.388Y1.941_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X0.388Y1.941_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X0.388Y1.941_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.128Y-2.631_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.128Y-2.631_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.77Y-3.518_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.77Y-3.518_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.128Y-2.631_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.128Y-2.631_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.77Y-3.518_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.77Y-3.518_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.468Y-1.727_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.468Y-1.727_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.468Y-1.841_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.468Y-1.841_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X2.085Y-1.982_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X2.085Y-1.982_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.083Y-4.502_NOS x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.083Y-4.502_NOS x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X0.965Y-3.374_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X0.965Y-3.374_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.697Y-1.913_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.697Y-1.913_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.393Y-4.482_NOS x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.393Y-4.482_NOS x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X2.452Y-4.279_ChAT x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X2.452Y-4.279_ChAT x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.083Y-4.502_ChAT x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.083Y-4.502_ChAT x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.391Y-5.649_DiI x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.391Y-5.649_DiI x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X0.836Y1.697_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X0.836Y1.697_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.094Y-5.042_ChAT x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.094Y-5.042_ChAT x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.468Y-1.841_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.468Y-1.841_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X2.754Y-3.997_DiI x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X2.754Y-3.997_DiI x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X2.145Y2.16_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X2.145Y2.16_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.128Y-2.631_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.128Y-2.631_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X0.763Y-2.41_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X0.763Y-2.41_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X0.836Y1.697_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X0.836Y1.697_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X2.033Y-3.478_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X2.033Y-3.478_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.094Y-5.042_NOS x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.094Y-5.042_NOS x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.468Y-1.727_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.468Y-1.727_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X2.452Y-4.279_NOS x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X2.452Y-4.279_NOS x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.393Y-4.482_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.393Y-4.482_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.245Y-1.278_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.245Y-1.278_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.468Y-1.727_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.468Y-1.727_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X2.754Y-3.997_NOS x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X2.754Y-3.997_NOS x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X0.836Y1.697_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X0.836Y1.697_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X0.574Y-3.137a_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X0.574Y-3.137a_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.829Y-2.194_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.829Y-2.194_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X0.763Y-2.41_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X0.763Y-2.41_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X0.802Y-6.18_ChAT x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X0.802Y-6.18_ChAT x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.212Y-6.313_ChAT x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.212Y-6.313_ChAT x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.697Y-1.913_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.697Y-1.913_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.77Y-3.518_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.77Y-3.518_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.094Y-5.042_DiI x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.094Y-5.042_DiI x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.393Y-4.482_DiI x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.393Y-4.482_DiI x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X0.763Y-2.41_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X0.763Y-2.41_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.245Y-1.278_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.245Y-1.278_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X2.085Y-1.982_ChAT_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X2.085Y-1.982_ChAT_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.561Y-3.491_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.561Y-3.491_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X2.033Y-3.478_NOS_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X2.033Y-3.478_NOS_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X2.565Y-2.05_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X2.565Y-2.05_DiI_x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X2.754Y-3.997_ChAT x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X2.754Y-3.997_ChAT x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X0.802Y-6.18_DiI x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X0.802Y-6.18_DiI x20',
-            'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.468Y-1.841_DiI_x20.tif': 'files/primary/LMMNs_Tenia ChAT NOS DiI MICROGRAPHS/sub-H2145/sam-H2145/SPARC_H2145c_DiI_Taenia_ChAT_NOS_MICROGRAPHS/SPARC_H2145C_LM (Taeniae)_X1.468Y-1.841_DiI_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X-0.507Y2.466_VIP_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X-0.507Y2.466_VIP_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X0.589Y-1.921_NOS_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X0.589Y-1.921_NOS_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X0.751Y-3.422_VIP_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X0.751Y-3.422_VIP_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X-0.107Y4.503_VIP_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X-0.107Y4.503_VIP_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X-0.036Y2.922_VIP_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X-0.036Y2.922_VIP_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X0.866Y-3.413_NOS_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X0.866Y-3.413_NOS_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X0.534Y2.365_NOS_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X0.534Y2.365_NOS_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X0.179Y2.731_VIP_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X0.179Y2.731_VIP_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X0.751Y-3.422_DiI_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X0.751Y-3.422_DiI_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X-0.237Y3.809_NOS_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X-0.237Y3.809_NOS_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X0.751Y-3.422_NOS_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X0.751Y-3.422_NOS_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X-0.036Y2.922_DiI_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X-0.036Y2.922_DiI_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X-0.036Y2.922_NOS_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X-0.036Y2.922_NOS_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X-0.107Y4.503_NOS_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X-0.107Y4.503_NOS_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X0.179Y2.731_DiI_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X0.179Y2.731_DiI_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X-0.624Y1.643_VIP_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X-0.624Y1.643_VIP_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X-0.147Y4.534_DiI_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X-0.147Y4.534_DiI_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X0.589Y-1.921_DiI_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X0.589Y-1.921_DiI_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X-0.507Y2.466_DiI_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X-0.507Y2.466_DiI_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X-0.147Y4.534_NOS_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X-0.147Y4.534_NOS_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X0.534Y2.365_DiI_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X0.534Y2.365_DiI_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X-0.237Y3.809_DiI_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X-0.237Y3.809_DiI_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X-0.624Y1.643_NOS_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X-0.624Y1.643_NOS_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X-0.107Y4.503_DiI_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X-0.107Y4.503_DiI_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X-0.147Y4.534_VIP_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X-0.147Y4.534_VIP_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X-0.507Y2.466_NOS_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X-0.507Y2.466_NOS_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X0.589Y-1.921_VIP_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X0.589Y-1.921_VIP_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X-0.624Y1.643_DiI_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X-0.624Y1.643_DiI_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X0.179Y2.731_NOS_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X0.179Y2.731_NOS_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-1.004Y3.239_VIP_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-1.004Y3.239_VIP_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X0.866Y-3.413_DiI_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X0.866Y-3.413_DiI_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X0.534Y2.365_VIP_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X0.534Y2.365_VIP_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X0.866Y-3.413_VIP_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X0.866Y-3.413_VIP_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X0.482Y2.724_VIP_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X0.482Y2.724_VIP_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X-0.237Y3.809_VIP_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2139/sam-H2139/SPARC_H2139c_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2139C_LM (Taeniae)_X-0.237Y3.809_VIP_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-0.574Y8.745_VIP_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-0.574Y8.745_VIP_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-1.402Y4.542_NOS_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-1.402Y4.542_NOS_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X0.482Y2.724_DiI_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X0.482Y2.724_DiI_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X0.482Y2.724_NOS_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X0.482Y2.724_NOS_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-1.305Y5.075_VIP_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-1.305Y5.075_VIP_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-0.574Y8.745_DiI_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-0.574Y8.745_DiI_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-0.219Y4.632_NOS_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-0.219Y4.632_NOS_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-1.949Y10.23_DiI_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-1.949Y10.23_DiI_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-0.514Y8.868_VIP_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-0.514Y8.868_VIP_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-0.219Y4.632_DiI_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-0.219Y4.632_DiI_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-1.305Y5.075_DiI_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-1.305Y5.075_DiI_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-1.402Y4.542_DiI_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-1.402Y4.542_DiI_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-1.413Y4.123_NOS_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-1.413Y4.123_NOS_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-1.305Y5.075_NOS_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-1.305Y5.075_NOS_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-1.01Y5.213_VIP_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-1.01Y5.213_VIP_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-0.799Y5.236_DiI_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-0.799Y5.236_DiI_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-1.413Y4.123_VIP_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-1.413Y4.123_VIP_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-1.402Y4.542_VIP_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-1.402Y4.542_VIP_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-0.799Y5.236_NOS_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-0.799Y5.236_NOS_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X0.073Y5.026_NOS_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X0.073Y5.026_NOS_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-1.413Y4.123_DiI_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-1.413Y4.123_DiI_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-1.004Y3.239_NOS_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-1.004Y3.239_NOS_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-1.42Y5.309_NOS_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-1.42Y5.309_NOS_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X0.073Y5.026_VIP_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X0.073Y5.026_VIP_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-1.42Y5.309_DiI_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-1.42Y5.309_DiI_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-0.514Y8.868_NOS_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-0.514Y8.868_NOS_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-1.42Y5.309_VIP_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-1.42Y5.309_VIP_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-0.514Y8.868_DiI_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-0.514Y8.868_DiI_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-0.574Y8.745_NOS_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-0.574Y8.745_NOS_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-1.01Y5.213_NOS_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-1.01Y5.213_NOS_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-0.219Y4.632_VIP_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-0.219Y4.632_VIP_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-1.01Y5.213_DiI_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-1.01Y5.213_DiI_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-1.004Y3.239_DiI_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-1.004Y3.239_DiI_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-0.799Y5.236_VIP_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X-0.799Y5.236_VIP_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X0.073Y5.026_DiI_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2146/sam-H2146/SPARC_H2146b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2146B_LM (Taeniae)_X0.073Y5.026_DiI_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2149/sam-H2149B/SPARC_H2149b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2149B_LM (Taeniae)_X-1.566Y9.593_DiI_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2149/sam-H2149B/SPARC_H2149b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2149B_LM (Taeniae)_X-1.566Y9.593_DiI_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2149/sam-H2149B/SPARC_H2149b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2149B_LM (Taeniae)_X0.813Y-5.601_VIP_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2149/sam-H2149B/SPARC_H2149b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2149B_LM (Taeniae)_X0.813Y-5.601_VIP_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2149/sam-H2149B/SPARC_H2149b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2149B_LM (Taeniae)_X0.813Y-5.601_DiI_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2149/sam-H2149B/SPARC_H2149b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2149B_LM (Taeniae)_X0.813Y-5.601_DiI_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2149/sam-H2149B/SPARC_H2149b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2149B_LM (Taeniae)_X-0.812Y3.071_NOS_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2149/sam-H2149B/SPARC_H2149b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2149B_LM (Taeniae)_X-0.812Y3.071_NOS_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2149/sam-H2149B/SPARC_H2149b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2149B_LM (Taeniae)_X0.813Y-5.601_NOS_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2149/sam-H2149B/SPARC_H2149b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2149B_LM (Taeniae)_X0.813Y-5.601_NOS_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2149/sam-H2149B/SPARC_H2149b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2149B_LM (Taeniae)_X-0.229Y3.645_VIP_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2149/sam-H2149B/SPARC_H2149b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2149B_LM (Taeniae)_X-0.229Y3.645_VIP_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2149/sam-H2149B/SPARC_H2149b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2149B_LM (Taeniae)_X-1.438Y-3.858_DiI_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2149/sam-H2149B/SPARC_H2149b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2149B_LM (Taeniae)_X-1.438Y-3.858_DiI_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2149/sam-H2149B/SPARC_H2149b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2149B_LM (Taeniae)_X-0.258Y3.997_VIP_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2149/sam-H2149B/SPARC_H2149b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2149B_LM (Taeniae)_X-0.258Y3.997_VIP_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2149/sam-H2149B/SPARC_H2149b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2149B_LM (Taeniae)_X-1.438Y-3.858_NOS_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2149/sam-H2149B/SPARC_H2149b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2149B_LM (Taeniae)_X-1.438Y-3.858_NOS_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2149/sam-H2149B/SPARC_H2149b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2149B_LM (Taeniae)_X-0.812Y3.071_DiI_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2149/sam-H2149B/SPARC_H2149b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2149B_LM (Taeniae)_X-0.812Y3.071_DiI_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2149/sam-H2149B/SPARC_H2149b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2149B_LM (Taeniae)_X0.908Y1.084_NOS_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2149/sam-H2149B/SPARC_H2149b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2149B_LM (Taeniae)_X0.908Y1.084_NOS_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2149/sam-H2149B/SPARC_H2149b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2149B_LM (Taeniae)_X-1.438Y-3.858_VIP_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2149/sam-H2149B/SPARC_H2149b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2149B_LM (Taeniae)_X-1.438Y-3.858_VIP_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2149/sam-H2149B/SPARC_H2149b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2149B_LM (Taeniae)_X-1.414Y4.148_DiI_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2149/sam-H2149B/SPARC_H2149b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2149B_LM (Taeniae)_X-1.414Y4.148_DiI_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2149/sam-H2149B/SPARC_H2149b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2149B_LM (Taeniae)_X0.908Y1.084_VIP_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2149/sam-H2149B/SPARC_H2149b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2149B_LM (Taeniae)_X0.908Y1.084_VIP_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2149/sam-H2149B/SPARC_H2149b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2149B_LM (Taeniae)_X-0.258Y3.997_DiI_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2149/sam-H2149B/SPARC_H2149b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2149B_LM (Taeniae)_X-0.258Y3.997_DiI_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2149/sam-H2149B/SPARC_H2149b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2149B_LM (Taeniae)_X-1.414Y4.148_NOS_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2149/sam-H2149B/SPARC_H2149b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2149B_LM (Taeniae)_X-1.414Y4.148_NOS_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2149/sam-H2149B/SPARC_H2149b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2149B_LM (Taeniae)_X0.908Y1.084_DiI_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2149/sam-H2149B/SPARC_H2149b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2149B_LM (Taeniae)_X0.908Y1.084_DiI_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2149/sam-H2149B/SPARC_H2149b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2149B_LM (Taeniae)_X-1.388Y2.882_DiI_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2149/sam-H2149B/SPARC_H2149b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2149B_LM (Taeniae)_X-1.388Y2.882_DiI_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2149/sam-H2149B/SPARC_H2149b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2149B_LM (Taeniae)_X-0.229Y3.645_DiI_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2149/sam-H2149B/SPARC_H2149b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2149B_LM (Taeniae)_X-0.229Y3.645_DiI_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2149/sam-H2149B/SPARC_H2149b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2149B_LM (Taeniae)_X0.219Y9.772_DiI_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2149/sam-H2149B/SPARC_H2149b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2149B_LM (Taeniae)_X0.219Y9.772_DiI_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2149/sam-H2149B/SPARC_H2149b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2149B_LM (Taeniae)_X-0.812Y3.071_VIP_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2149/sam-H2149B/SPARC_H2149b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2149B_LM (Taeniae)_X-0.812Y3.071_VIP_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2149/sam-H2149B/SPARC_H2149b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2149B_LM (Taeniae)_X-0.229Y3.645_NOS_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2149/sam-H2149B/SPARC_H2149b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2149B_LM (Taeniae)_X-0.229Y3.645_NOS_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X-0.129Y-7.716_DiI_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X-0.129Y-7.716_DiI_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2149/sam-H2149B/SPARC_H2149b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2149B_LM (Taeniae)_X-0.258Y3.997_NOS_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2149/sam-H2149B/SPARC_H2149b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2149B_LM (Taeniae)_X-0.258Y3.997_NOS_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2149/sam-H2149B/SPARC_H2149b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2149B_LM (Taeniae)_X-0.709Y9.589_DiI_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2149/sam-H2149B/SPARC_H2149b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2149B_LM (Taeniae)_X-0.709Y9.589_DiI_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2149/sam-H2149B/SPARC_H2149b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2149B_LM (Taeniae)_X-1.414Y4.148_VIP_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2149/sam-H2149B/SPARC_H2149b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2149B_LM (Taeniae)_X-1.414Y4.148_VIP_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X1.463Y3.385_VIP_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X1.463Y3.385_VIP_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X1.752Y-0.607_NOS_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X1.752Y-0.607_NOS_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X0.47Y3.293_NOS_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X0.47Y3.293_NOS_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X1.752Y-0.607_DiI_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X1.752Y-0.607_DiI_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X0.445Y3.208_NOS_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X0.445Y3.208_NOS_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X2.096Y-2.426_NOS_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X2.096Y-2.426_NOS_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X1.536Y-4.719_NOS_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X1.536Y-4.719_NOS_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X1.078Y-1.592_VIP_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X1.078Y-1.592_VIP_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X0.454Y-7.795_DiI_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X0.454Y-7.795_DiI_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X1.078Y-1.592_NOS_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X1.078Y-1.592_NOS_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X0.445Y3.208_DiI_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X0.445Y3.208_DiI_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X1.536Y-4.719_VIP_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X1.536Y-4.719_VIP_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X2.096Y-2.426_VIP_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X2.096Y-2.426_VIP_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X0.137Y-1.53_VIP_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X0.137Y-1.53_VIP_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X1.185Y3.167_DiI_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X1.185Y3.167_DiI_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X0.445Y3.208_VIP_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X0.445Y3.208_VIP_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X0.322Y-8.246_NOS_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X0.322Y-8.246_NOS_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X-0.364Y6.677_NOS_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X-0.364Y6.677_NOS_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X0.322Y-8.246_DiI_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X0.322Y-8.246_DiI_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X0.454Y-7.795_VIP_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X0.454Y-7.795_VIP_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X0.849Y4.522_NOS_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X0.849Y4.522_NOS_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X0.292Y4.701_VIP_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X0.292Y4.701_VIP_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X-0.365Y6.716_DiI_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X-0.365Y6.716_DiI_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X0.47Y3.293_DiI_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X0.47Y3.293_DiI_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X0.292Y4.701_DiI_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X0.292Y4.701_DiI_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X1.463Y3.385_NOS_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X1.463Y3.385_NOS_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X1.752Y-0.607_VIP_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X1.752Y-0.607_VIP_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X1.536Y-4.719_DiI_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X1.536Y-4.719_DiI_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X2.096Y-2.426_DiI_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X2.096Y-2.426_DiI_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X-0.129Y-7.716_VIP_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X-0.129Y-7.716_VIP_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X0.292Y4.701_NOS_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X0.292Y4.701_NOS_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X0.137Y-1.53_NOS_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X0.137Y-1.53_NOS_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X-0.364Y6.677_DiI_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X-0.364Y6.677_DiI_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X1.185Y3.167_NOS_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X1.185Y3.167_NOS_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X1.776Y3.267_DiI_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X1.776Y3.267_DiI_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X-0.364Y6.677_VIP_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X-0.364Y6.677_VIP_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X-0.129Y-7.716_NOS_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X-0.129Y-7.716_NOS_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X0.322Y-8.246_VIP_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X0.322Y-8.246_VIP_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X0.137Y-1.53_DiI_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X0.137Y-1.53_DiI_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X1.185Y3.167_VIP_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X1.185Y3.167_VIP_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X1.078Y-1.592_DiI_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X1.078Y-1.592_DiI_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X0.849Y4.522_DiI_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X0.849Y4.522_DiI_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X1.776Y3.267_NOS_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X1.776Y3.267_NOS_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X1.776Y3.267_VIP_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X1.776Y3.267_VIP_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X0.47Y3.293_VIP_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X0.47Y3.293_VIP_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X0.454Y-7.795_NOS_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X0.454Y-7.795_NOS_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X1.463Y3.385_DiI_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X1.463Y3.385_DiI_x20',
-            'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X0.849Y4.522_VIP_x20.tif': 'files/primary/LMMNs_Tenia NOS VIP DiI MICROGRAPHS/sub-H2145/sam-H2145B/SPARC_H2145b_DiI_Taenia_VIP_NOS_MICROGRAPHS/SPARC_H2145B_LM (Taeniae)_X0.849Y4.522_VIP_x20',
-            'files/source/HB-ICN-Ch2-1362238629-Raw_Data.csv': 'files/source/HB-ICN-Ch2-1362238629-Raw Data.csv',
-            'files/source/HB-ICN-Ch4-1362238626-Raw_Data.csv': 'files/source/HB-ICN-Ch4-1362238626-Raw Data.csv', 'files/source/manifest_.xlsx': 'files/source/manifest.xlsx',
-            'files/source/HB-ICN-Ch3-1362238627-Raw_Data.csv': 'files/source/HB-ICN-Ch3-1362238627-Raw Data.csv',
-            'files/source/HB-ICN-CH1-1362238630-Raw_Data.csv': 'files/source/HB-ICN-CH1-1362238630-Raw Data.csv',
-            'files/primary/sub-Cadaver-Subject-1/Ultrasound_raw_Cadaver_Subject 1.mp4': 'files/primary/sub-Cadaver-Subject-1/Ultrasound_raw_Cadaver_Subject_1.mp4',
-            'files/primary/sub-Cadaver-Subject-2/Ultrasound_raw_Cadaver_Subject 2.mp4': 'files/primary/sub-Cadaver-Subject-2/Ultrasound_raw_Cadaver_Subject_2.mp4',
-            'files/primary/sub-Cadaver-Subject-3/Ultrasound_raw_Cadaver_Subject 3.mp4': 'files/primary/sub-Cadaver-Subject-3/Ultrasound_raw_Cadaver_Subject_3.mp4',
-            'files/derivative/sam-P21 BAT/ses-Pgp9.5/P21-3_Pgp9.5.jpx': 'files/derivative/sam-P21 BAT/ses-Pgp9.5/P21-3 Pgp9.5.jpx',
-            'files/derivative/sam-P21 BAT/ses-Pgp9.5/P21-4_Pgp9.5.jpx': 'files/derivative/sam-P21 BAT/ses-Pgp9.5/P21-4 Pgp9.5.jpx',
-            'files/derivative/mapped_Pig 7_thumbnail.jpeg': 'files/derivative/mapped_Pig_7_thumbnail.jpeg',
-            'files/derivative/mapped_Pig 16_thumbnail.jpeg': 'files/derivative/mapped_Pig_16_thumbnail.jpeg',
-            'files/derivative/sub-16_sam-1_Anterior_R16-1Slide2p1MT20x.jp2': 'files/derivative/sub-16/sam-1/sub-16_sam-1_Anterior_R16-1Slide2p1MT20x.jp2',
-            'files/derivative/sub-16_sam-3_R16-3Slide2p1MT20x.jp2': 'files/derivative/sub-16/sam-3/sub-16_sam-3_R16-3Slide2p1MT20x.jp2',
-            'files/derivative/sub-17_sam-1_Anterior_R17-1slide2p1MT20x.jp2': 'files/derivative/sub-17/sam-1/sub-17_sam-1_Anterior_R17-1slide2p1MT20x.jp2',
-            'files/derivative/sub-17_sam-3_R17-3Slide2p2MT20x.jp2': 'files/derivative/sub-17/sam-3/sub-17_sam-3_R17-3Slide2p2MT20x.jp2',
-            'files/derivative/sub-18_sam-1_R18-1Slide2p2MT20x.jp2': 'files/derivative/sub-18/sam-1/sub-18_sam-1_R18-1Slide2p2MT20x.jp2',
-            'files/derivative/sub-20_sam-1_Anterior_R20-1Slide2p3MT20x.jp2': 'files/derivative/sub-20/sam-1/sub-20_sam-1_Anterior_R20-1Slide2p3MT20x.jp2',
-            'files/derivative/sub-20_sam-3_R20-3Slide2p1MT20x.jp2': 'files/derivative/sub-20/sam-3/sub-20_sam-3_R20-3Slide2p1MT20x.jp2',
-            'files/derivative/sub-21_sam-1_Anterior_R21-1Slide2p1MT20x.jp2': 'files/derivative/sub-21/sam-1/sub-21_sam-1_Anterior_R21-1Slide2p1MT20x.jp2',
-            'files/derivative/sub-21_sam-3_R21-3Slide2p1MT20x.jp2': 'files/derivative/sub-21/sam-3/sub-21_sam-3_R21-3Slide2p1MT20x.jp2',
-            'files/derivative/sub-22_sam-1_Anterior_R22-1Slide14p1.jp2': 'files/derivative/sub-22/sam-1/sub-22_sam-1_Anterior_R22-1Slide14p1.jp2',
-            'files/derivative/sub-22_sam-3_R22-3Slide2p1MT20x.jp2': 'files/derivative/sub-22/sam-3/sub-22_sam-3_R22-3Slide2p1MT20x.jp2',
-            'files/derivative/sub-23_sam-1_Anterior_R23-1Slide2P1MT20x.jp2': 'files/derivative/sub-23/sam-1/sub-23_sam-1_Anterior_R23-1Slide2P1MT20x.jp2',
-            'files/derivative/sub-23_sam-3_R23-3Slide2P1MT20x.jp2': 'files/derivative/sub-23/sam-3/sub-23_sam-3_R23-3Slide2P1MT20x.jp2',
-            'files/derivative/sub-24_sam-1_Anterior_R24-1Slide2P1MT20x.jp2': 'files/derivative/sub-24/sam-1/sub-24_sam-1_Anterior_R24-1Slide2P1MT20x.jp2',
-            'files/derivative/sub-24_sam-3_R24-3Slide2P1MT20x.jp2': 'files/derivative/sub-24/sam-3/sub-24_sam-3_R24-3Slide2P1MT20x.jp2',
-            'files/derivative/sub-25_sam-1_Anterior_R25-1Slide1P1MT20x.jp2': 'files/derivative/sub-25/sam-1/sub-25_sam-1_Anterior_R25-1Slide1P1MT20x.jp2',
-            'files/derivative/sub-25_sam-3_R25-3Slide2P1MT20x.jp2': 'files/derivative/sub-25/sam-3/sub-25_sam-3_R25-3Slide2P1MT20x.jp2',
-            'files/derivative/sub-26_sam-1_Anterior_R26-1Slide2P4MT20x.jp2': 'files/derivative/sub-26/sam-1/sub-26_sam-1_Anterior_R26-1Slide2P4MT20x.jp2',
-            'files/derivative/sub-4sam-3P4-3Slide2p1_10x.jp2': 'files/derivative/sub-4/sam-3/sub-4sam-3P4-3Slide2p1_10x.jp2',
-            'files/derivative/sub-5sam-1P5-1Slide2p2_10x.jp2': 'files/derivative/sub-5/sam-1/sub-5sam-1P5-1Slide2p2_10x.jp2',
-            'files/derivative/sub-5sam-3P5-3Slide2p1_10x.jp2': 'files/derivative/sub-5/sam-3/sub-5sam-3P5-3Slide2p1_10x.jp2',
-            'files/derivative/sub-6sam-7P6-7Slide2p3_10x.jp2': 'files/derivative/sub-6/sam-7/sub-6sam-7P6-7Slide2p3_10x.jp2',
-            'files/derivative/sub-8sam-1P8-1Slide2p3_10x.jp2': 'files/derivative/sub-8/sam-1/sub-8sam-1P8-1Slide2p3_10x.jp2',
-            'files/derivative/sub-8sam-7P8-7Slide2p1_10x.jp2': 'files/derivative/sub-8/sam-7/sub-8sam-7P8-7Slide2p1_10x.jp2',
-            'files/derivative/sub-9sam-3P9-3Slide2p3MT10x.jp2': 'files/derivative/sub-9/sam-3/sub-9sam-3P9-3Slide2p3MT10x.jp2',
-            'files/derivative/sub-10sam-1P10-1Slide2p3MT10x.jp2': 'files/derivative/sub-10/sam-1/sub-10sam-1P10-1Slide2p3MT10x.jp2',
-            'files/derivative/sub-11sam-1P11-1Slide2P1_10x.jp2': 'files/derivative/sub-11/sam-1/sub-11sam-1P11-1Slide2P1_10x.jp2',
-            'files/derivative/sub-11sam-3P11-3Slide2P1_10x.jp2': 'files/derivative/sub-11/sam-3/sub-11sam-3P11-3Slide2P1_10x.jp2',
-            'files/derivative/sub-12sam-1P12-1Slide2P1_10x.jp2': 'files/derivative/sub-12/sam-1/sub-12sam-1P12-1Slide2P1_10x.jp2',
-            'files/derivative/sub-12sam-3P12-3Slide2P2_10x.jp2': 'files/derivative/sub-12/sam-3/sub-12sam-3P12-3Slide2P2_10x.jp2',
-            'files/derivative/sub-13sam-1P13-1Slide2P4_10x.jp2': 'files/derivative/sub-13/sam-1/sub-13sam-1P13-1Slide2P4_10x.jp2',
-            'files/derivative/sub-13sam-3P13-3Slide2P3_10x.jp2': 'files/derivative/sub-13/sam-3/sub-13sam-3P13-3Slide2P3_10x.jp2',
-            'files/derivative/sub-14sam-2P14-2Slide2P1MT10x.jp2': 'files/derivative/sub-14/sam-2/sub-14sam-2P14-2Slide2P1MT10x.jp2',
-            'files/derivative/sub-14sam-3P14-3Slide2P3MT10x.jp2': 'files/derivative/sub-14/sam-3/sub-14sam-3P14-3Slide2P3MT10x.jp2',
-            'files/derivative/sub-15sam-2P15-2Slide2P2MT10x.jp2': 'files/derivative/sub-15/sam-2/sub-15sam-2P15-2Slide2P2MT10x.jp2',
-            'files/derivative/sub-15sam-3P15-3Slide14P4MT10x.jp2': 'files/derivative/sub-15/sam-3/sub-15sam-3P15-3Slide14P4MT10x.jp2',
-            'files/derivative/image conversion/sub-rat55/sam-fund55/sam-fund55_ses-hu594.jpx': 'files/derivative/image_conversion/sub-rat55/sam-fund55/sam-fund55_ses-hu594.jpx',
-            'files/derivative/image conversion/sub-rat47/sam-fund47/sam-fund47_ses-hu594.jpx': 'files/derivative/image_conversion/sub-rat47/sam-fund47/sam-fund47_ses-hu594.jpx',
-            'files/derivative/image conversion/sub-rat47/sam-corp47/sam-corp47_ses-hu594.jpx': 'files/derivative/image_conversion/sub-rat47/sam-corp47/sam-corp47_ses-hu594.jpx',
-            'files/derivative/image conversion/sub-rat47/sam-ant47/sam-ant47_ses-hu594.jpx': 'files/derivative/image_conversion/sub-rat47/sam-ant47/sam-ant47_ses-hu594.jpx',
-            'files/derivative/image conversion/sub-rat57/sam-fund57/sam-fund57_ses-hu594.jpx': 'files/derivative/image_conversion/sub-rat57/sam-fund57/sam-fund57_ses-hu594.jpx',
-            'files/derivative/image conversion/sam-fund39C40C-ses-hu594/sam-fund39C40C_ses-hu594(2).jpx': 'files/derivative/image_conversion/sam-fund39C40C-ses-hu594/sam-fund39C40C_ses-hu594(2).jpx',
-            'files/derivative/image conversion/sam-fund39C40C-ses-hu594/sam-fund39C40C_ses-hu594(1).jpx': 'files/derivative/image_conversion/sam-fund39C40C-ses-hu594/sam-fund39C40C_ses-hu594(1).jpx',
-            'files/derivative/image conversion/sub-rat33/sam-ant33/sam-ant33C_ses-hu594(1).jpx': 'files/derivative/image_conversion/sub-rat33/sam-ant33/sam-ant33C_ses-hu594(1).jpx',
-            'files/derivative/image conversion/sub-rat48/sam-ant48/sam-ant48_ses-hu594.jpx': 'files/derivative/image_conversion/sub-rat48/sam-ant48/sam-ant48_ses-hu594.jpx',
-            'files/derivative/image conversion/sub-rat48/sam-corp48/sam-corp48_ses-hu594.jpx': 'files/derivative/image_conversion/sub-rat48/sam-corp48/sam-corp48_ses-hu594.jpx',
-            'files/derivative/image conversion/sub-rat48/sam-fund48/sam-fund48_ses-hu594.jpx': 'files/derivative/image_conversion/sub-rat48/sam-fund48/sam-fund48_ses-hu594.jpx',
-            'files/derivative/image conversion/sam-corp33C34C3C-ses-hu594/sam-corp33C34C3C_ses-hu594(3).jpx': 'files/derivative/image_conversion/sam-corp33C34C3C-ses-hu594/sam-corp33C34C3C_ses-hu594(3).jpx',
-            'files/derivative/image conversion/sam-corp33C34C3C-ses-hu594/sam-corp33C34C3C_ses-hu594(1).jpx': 'files/derivative/image_conversion/sam-corp33C34C3C-ses-hu594/sam-corp33C34C3C_ses-hu594(1).jpx',
-            'files/derivative/image conversion/sub-rat58/sam-fund58/sam-fund58_ses-hu594.jpx': 'files/derivative/image_conversion/sub-rat58/sam-fund58/sam-fund58_ses-hu594.jpx',
-            'files/derivative/image conversion/sub-rat56/sam-fund56/sam-fund56_ses-hu594.jpx': 'files/derivative/image_conversion/sub-rat56/sam-fund56/sam-fund56_ses-hu594.jpx',
-            'files/derivative/image conversion/sub-rat45/sam-ant45/sam-ant45_ses-hu594.jpx': 'files/derivative/image_conversion/sub-rat45/sam-ant45/sam-ant45_ses-hu594.jpx',
-            'files/derivative/image conversion/sub-rat45/sam-fund45/sam-fund45_ses-hu594.jpx': 'files/derivative/image_conversion/sub-rat45/sam-fund45/sam-fund45_ses-hu594.jpx',
-            'files/derivative/image conversion/sub-rat45/sam-corp45/sam-corp45_ses-hu594.jpx': 'files/derivative/image_conversion/sub-rat45/sam-corp45/sam-corp45_ses-hu594.jpx',
-            'files/derivative/image conversion/sam-corp4C-ant3C4C-ses-hu594/sam-corp4C-ant3C4C_ses-hu594(3).jpx': 'files/derivative/image_conversion/sam-corp4C-ant3C4C-ses-hu594/sam-corp4C-ant3C4C_ses-hu594(3).jpx',
-            'files/derivative/image conversion/sam-corp4C-ant3C4C-ses-hu594/sam-corp4C-ant3C4C_ses-hu594(1).jpx': 'files/derivative/image_conversion/sam-corp4C-ant3C4C-ses-hu594/sam-corp4C-ant3C4C_ses-hu594(1).jpx',
-            'files/derivative/image conversion/sam-corp4C-ant3C4C-ses-hu594/sam-corp4C-ant3C4C_ses-hu594(2).jpx': 'files/derivative/image_conversion/sam-corp4C-ant3C4C-ses-hu594/sam-corp4C-ant3C4C_ses-hu594(2).jpx',
-            'files/derivative/image conversion/sub-rat46/sam-corp46/sam-corp46_ses-hu594.jpx': 'files/derivative/image_conversion/sub-rat46/sam-corp46/sam-corp46_ses-hu594.jpx',
-            'files/derivative/image conversion/sub-rat46/sam-ant46/sam-ant46_ses-hu594.jpx': 'files/derivative/image_conversion/sub-rat46/sam-ant46/sam-ant46_ses-hu594.jpx',
-            'files/derivative/image conversion/sub-rat46/sam-fund46/sam-fund46_ses-hu594.jpx': 'files/derivative/image_conversion/sub-rat46/sam-fund46/sam-fund46_ses-hu594.jpx',
-            'files/derivative/image conversion/sub-rat34/sam-ant34/sam-ant34C_ses-hu594(1).jpx': 'files/derivative/image_conversion/sub-rat34/sam-ant34/sam-ant34C_ses-hu594(1).jpx',
-            r'files/derivative/sub-4\sam-3\sub-4_sam-3_ChAT_P4-3p1_20x.jp2': 'files/derivative/sub-4/sam-3/sub-4_sam-3_ChAT_P4-3p1_20x.jp2',
-            r'files/derivative/sub-4\sam-3\sub-4_sam-3_TH_P4-3p1_20x.jp2': 'files/derivative/sub-4/sam-3/sub-4_sam-3_TH_P4-3p1_20x.jp2',
-            r'files/derivative/sub-5\sam-1\sub-5_sam-1_ChAT_P5-1p1_20x.jp2': 'files/derivative/sub-5/sam-1/sub-5_sam-1_ChAT_P5-1p1_20x.jp2',
-            r'files/derivative/sub-5\sam-1\sub-5_sam-1_TH_P5-1p4_20x.jp2': 'files/derivative/sub-5/sam-1/sub-5_sam-1_TH_P5-1p4_20x.jp2',
-            r'files/derivative/sub-5\sam-3\sub-5_sam-3_ChAT_P5-3p1_20x.jp2': 'files/derivative/sub-5/sam-3/sub-5_sam-3_ChAT_P5-3p1_20x.jp2',
-            r'files/derivative/sub-5\sam-3\sub-5_sam-3_TH_P5-3p1_20x.jp2': 'files/derivative/sub-5/sam-3/sub-5_sam-3_TH_P5-3p1_20x.jp2',
-            r'files/derivative/sub-6\sam-1\sub-6_sam-1_ChAT_NPcontrol_P6-1p1_20x.jp2': 'files/derivative/sub-6/sam-1/sub-6_sam-1_ChAT_NPcontrol_P6-1p1_20x.jp2',
-            r'files/derivative/sub-6\sam-1\sub-6_sam-1_TH_NPcontrol_P6-1p1_20x.jp2': 'files/derivative/sub-6/sam-1/sub-6_sam-1_TH_NPcontrol_P6-1p1_20x.jp2',
-            r'files/derivative/sub-6\sam-7\sub-6_sam-7_ChAT_P6-7p1_20x.jp2': 'files/derivative/sub-6/sam-7/sub-6_sam-7_ChAT_P6-7p1_20x.jp2',
-            r'files/derivative/sub-6\sam-7\sub-6_sam-7_TH_P6-7p1_20x.jp2': 'files/derivative/sub-6/sam-7/sub-6_sam-7_TH_P6-7p1_20x.jp2',
-            r'files/derivative/sub-7\sam-7\sub-7_sam-7_ChAT_NPcontrol_P7-7p4_20x.jp2': 'files/derivative/sub-7/sam-7/sub-7_sam-7_ChAT_NPcontrol_P7-7p4_20x.jp2',
-            r'files/derivative/sub-7\sam-7\sub-7_sam-7_TH_NPcontrol_P7-7p1_20x.jp2': 'files/derivative/sub-7/sam-7/sub-7_sam-7_TH_NPcontrol_P7-7p1_20x.jp2',
-            r'files/derivative/sub-8\sam-7\sub-8\sam-1\sub-8_sam-1_ChAT_P8-1p1_20x.jp2': 'files/derivative/sub-8/sam-1/sub-8_sam-1_ChAT_P8-1p1_20x (1).jp2',
-            r'files/derivative/sub-8\sam-7\sub-8\sam-1\sub-8_sam-1_TH_P8-1p1_20x.jp2': 'files/derivative/sub-8/sam-1/sub-8_sam-1_TH_P8-1p1_20x.jp2',
-            r'files/derivative/sub-8\sam-7\sub-8\sam-7\sub-8_sam-7_ChAT_P8-7p1_20x.jp2': 'files/derivative/sub-8/sam-7/sub-8_sam-7_ChAT_P8-7p1_20x.jp2',
-            r'files/derivative/sub-8\sam-7\sub-8_sam-7_TH_P8-7p1_20x.jp2': 'files/derivative/sub-8/sam-7/sub-8_sam-7_TH_P8-7p1_20x.jp2',
-            r'files/derivative/sub-9\sam-3\sub-9_sam-3_ChAT_P9-3p1_20x.jp2': 'files/derivative/sub-9/sam-3/sub-9_sam-3_ChAT_P9-3p1_20x.jp2',
-            r'files/derivative/sub-9\sam-3\sub-9_sam-3_TH_P9-3p3_20x.jp2': 'files/derivative/sub-9/sam-3/sub-9_sam-3_TH_P9-3p3_20x.jp2',
-            r'files/derivative/sub-10\sam-1\sub-10_sam-1_ChAT_P10-1p1_20x.jp2': 'files/derivative/sub-10/sam-1/sub-10_sam-1_ChAT_P10-1p1_20x (1).jp2',
-            r'files/derivative/sub-10\sam-1\sub-10_sam-1_TH_P10-1p1_20x.jp2': 'files/derivative/sub-10/sam-1/sub-10_sam-1_TH_P10-1p1_20x.jp2',
-            r'files/derivative/sub-11\sam-1\sub-11_sam-1_ChAT_P11-1p2_20x.jp2': 'files/derivative/sub-11/sam-1/sub-11_sam-1_ChAT_P11-1p2_20x.jp2',
-            r'files/derivative/sub-11\sam-1\sub-11_sam-1_TH_P11-1p1_20x.jp2': 'files/derivative/sub-11/sam-1/sub-11_sam-1_TH_P11-1p1_20x.jp2',
-            r'files/derivative/sub-11\sam-3\sub-11_sam-3_ChAT_P11-3p3_20x.jp2': 'files/derivative/sub-11/sam-3/sub-11_sam-3_ChAT_P11-3p3_20x.jp2',
-            r'files/derivative/sub-11\sam-3\sub-11_sam-3_TH_P11-3p1_20x.jp2': 'files/derivative/sub-11/sam-3/sub-11_sam-3_TH_P11-3p1_20x (1).jp2',
-            r'files/derivative/sub-12\sam-1\sub-12_sam-1_ChAT_P12-1p1_20x.jp2': 'files/derivative/sub-12/sam-1/sub-12_sam-1_ChAT_P12-1p1_20x.jp2',
-            r'files/derivative/sub-12\sam-1\sub-12_sam-1_TH_P12-1p1_20x.jp2': 'files/derivative/sub-12/sam-1/sub-12_sam-1_TH_P12-1p1_20x.jp2',
-            r'files/derivative/sub-12\sam-3\sub-12_sam-3_ChAT_P12-3p3_20x.jp2': 'files/derivative/sub-12/sam-3/sub-12_sam-3_ChAT_P12-3p3_20x.jp2',
-            r'files/derivative/sub-12\sam-3\sub-12_sam-3_TH_P12-3p1_20x.jp2': 'files/derivative/sub-12/sam-3/sub-12_sam-3_TH_P12-3p1_20x.jp2',
-            r'files/derivative/sub-13\sam-1\sub-13_sam-1_ChAT_P13-1p1_20x.jp2': 'files/derivative/sub-13/sam-1/sub-13_sam-1_ChAT_P13-1p1_20x.jp2',
-            r'files/derivative/sub-13\sam-1\sub-13_sam-1_TH_P13-1p1_20x.jp2': 'files/derivative/sub-13/sam-1/sub-13_sam-1_TH_P13-1p1_20x.jp2',
-            r'files/derivative/sub-13\sam-3\sub-13_sam-3_ChAT_P13-3p3_20x.jp2': 'files/derivative/sub-13/sam-3/sub-13_sam-3_ChAT_P13-3p3_20x.jp2',
-            r'files/derivative/sub-13\sam-3\sub-13_sam-3_TH_P13-3p1_20x.jp2': 'files/derivative/sub-13/sam-3/sub-13_sam-3_TH_P13-3p1_20x.jp2',
-            r'files/derivative/sub-14\sam-2\sub-14_sam-2_ChAT_P14-2p1_20x.jp2': 'files/derivative/sub-14/sam-2/sub-14_sam-2_ChAT_P14-2p1_20x.jp2',
-            r'files/derivative/sub-14\sam-2\sub-14_sam-2_TH_P14-2p1_20x.jp2': 'files/derivative/sub-14/sam-2/sub-14_sam-2_TH_P14-2p1_20x.jp2',
-            r'files/derivative/sub-14\sam-3\sub-14_sam-3_ChAT_P14-3p3_20x.jp2': 'files/derivative/sub-14/sam-3/sub-14_sam-3_ChAT_P14-3p3_20x (1).jp2',
-            r'files/derivative/sub-14\sam-3\sub-14_sam-3_TH_P14-3p1_20x.jp2': 'files/derivative/sub-14/sam-3/sub-14_sam-3_TH_P14-3p1_20x.jp2',
-            r'files/derivative/sub-15\sam-2\sub-15_sam-2_ChAT_P15-2p2_20x.jp2': 'files/derivative/sub-15/sam-2/sub-15_sam-2_ChAT_P15-2p2_20x.jp2',
-            r'files/derivative/sub-15\sam-2\sub-15_sam-2_TH_P15-2p1_20x.jp2': 'files/derivative/sub-15/sam-2/sub-15_sam-2_TH_P15-2p1_20x.jp2',
-            r'files/derivative/sub-15\sam-3\sub-15_sam-3_ChAT_P15-3p3_20x.jp2': 'files/derivative/sub-15/sam-3/sub-15_sam-3_ChAT_P15-3p3_20x.jp2',
-            r'files/derivative/sub-15\sam-3\sub-15_sam-3_TH_P15-3p1_20x.jp2': 'files/derivative/sub-15/sam-3/sub-15_sam-3_TH_P15-3p1_20x.jp2',
-            'files/derivative/sub-218/sam-c-Kit_NeuN_M218/c-Kit NeuN pC MP M218 20X0.6Z 201021_201028.jpx': 'files/derivative/sub-218/sam-c-Kit_NeuN_M218/c-Kit NeuN pC am-MP M218 20X0.6Z 201021_201028.jpx',
-            'files/derivative/Claudin_C46-2_1-50_10xp2.jp2': 'files/derivative/sub-46/sam-2/Claudin_C46-2_1-50_10xp2.jp2', 
-            'files/derivative/Claudin_C47-2_1-50_10xp2.jp2': 'files/derivative/sub-47/sam-2/Claudin_C47-2_1-50_10xp2.jp2', 
-            'files/derivative/Claudin_C50-2_1-50_10xp2.jp2': 'files/derivative/sub-50/sam-2/Claudin_C50-2_1-50_10xp2.jp2', 
-            'files/derivative/Claudin_C53-2_1-50_10xp3.jp2': 'files/derivative/sub-53/sam-2/Claudin_C53-2_1-50_10xp3.jp2', 
-            'files/derivative/Claudin_C54-2_1-50_10xp1.jp2': 'files/derivative/sub-54/sam-2/Claudin_C54-2_1-50_10xp1.jp2', 
-            'files/derivative/Claudin_C54-3_1-50_10xp4.jp2': 'files/derivative/sub-54/sam-3/Claudin_C54-3_1-50_10xp4.jp2', 
-            'files/derivative/Claudin_C55-1_1-50_10xp1_CONTROL.jp2': 'files/derivative/sub-55/sam-1/Claudin_C55-1_1-50_10xp1_CONTROL.jp2', 
-            'files/derivative/Claudin_C55-3_1-50_10xp2.jp2': 'files/derivative/sub-55/sam-3/Claudin_C55-3_1-50_10xp2.jp2', 
-            'files/derivative/Claudin_C56-1_1-50_10xp3.jp2': 'files/derivative/sub-56/sam-1/Claudin_C56-1_1-50_10xp3.jp2', 
-            'files/derivative/Claudin_C56-3_1-50_10xp2.jp2': 'files/derivative/sub-56/sam-3/Claudin_C56-3_1-50_10xp2.jp2', 
-            'files/derivative/Claudin_C57-1_1-50_10xp1.jp2': 'files/derivative/sub-57/sam-1/Claudin_C57-1_1-50_10xp1.jp2', 
-            'files/derivative/Claudin_C57-3_1-50_10xp2.jp2': 'files/derivative/sub-57/sam-3/Claudin_C57-3_1-50_10xp2.jp2', 
-            'files/derivative/Claudin_C58-1_1-50_10xp4.jp2': 'files/derivative/sub-58/sam-1/Claudin_C58-1_1-50_10xp4.jp2', 
-            'files/derivative/Claudin_C58-3_1-50_10xp2.jp2': 'files/derivative/sub-58/sam-3/Claudin_C58-3_1-50_10xp2.jp2', 
-            'files/derivative/Claudin_C60-3_1-50_10xp3_control.jp2': 'files/derivative/sub-60/sam-3/Claudin_C60-3_1-50_10xp3_control.jp2', 
-            'files/derivative/Claudin_C63-1_1-50_10xp3.jp2': 'files/derivative/sub-63/sam-1/Claudin_C63-1_1-50_10xp3.jp2', 
-            'files/derivative/Claudin_C64-1_1-50_10xp1.jp2': 'files/derivative/sub-64/sam-1/Claudin_C64-1_1-50_10xp1.jp2', 
-            'files/derivative/Claudin_C65-1_1-50_10xp1.jp2': 'files/derivative/sub-65/sam-1/Claudin_C65-1_1-50_10xp1.jp2', 
-            'files/derivative/Claudin_C69-1_1-50_10xp2.jp2': 'files/derivative/sub-69/sam-1/Claudin_C69-1_1-50_10xp2.jp2', 
-            'files/derivative/Claudin_C70-1_1-50_10xp3.jp2': 'files/derivative/sub-70/sam-1/Claudin_C70-1_1-50_10xp3.jp2',
-            # 31
-            'files/derivative/sub-20171129P/sam-20171129P-pC/20171129P-pC-1.2_ISP_ PGP9.5_10x.xml': 'files/derivative/sub-20171129P/sam-20171129P-pC/20171129P-pC-1.2_ISP__PGP9.5_10x.xml',
-            # 125
-            'files/derivative/sub-H2115/sam-H2115/SPARC_H2115A_LM_NOS%26ChAT_DiI.xml': 'files/derivative/sub-H2115/sam-H2115/SPARC_H2115A_LM_NOS_26ChAT_DiI.xml',
-            'files/derivative/sub-H2100/sam-H2100/SPARC_H2100A_LM_NOS%26ChAT_DiI.xml': 'files/derivative/sub-H2100/sam-H2100/SPARC_H2100A_LM_NOS_26ChAT_DiI.xml',
-            'files/derivative/sub-H2150/sam-H2150/SPARC_H2150c_LM (Taeniae)_DiI ChAT%26NOS.xml': 'files/derivative/sub-H2150/sam-H2150/SPARC_H2150c_LM_(Taeniae)_DiI_ChAT_26NOS.xml',
-            'files/derivative/sub-H2102/sam-H2102/SPARC_H2102B_LM_NOS%26ChAT_DiI.xml': 'files/derivative/sub-H2102/sam-H2102/SPARC_H2102B_LM_NOS_26ChAT_DiI.xml',
-            'files/derivative/sub-H2101/sam-H2101/SPARC_H2101D_LM_NOS%26ChAT_DiI.xml': 'files/derivative/sub-H2101/sam-H2101/SPARC_H2101D_LM_NOS_26ChAT_DiI.xml',
-            'files/derivative/sub-H2162/sam-H2162/SPARC_H2162a_LM (Taeniae)_DiI ChAT%26NOS.xml': 'files/derivative/sub-H2162/sam-H2162/SPARC_H2162a_LM_(Taeniae)_DiI_ChAT_26NOS.xml',
-            'files/derivative/sub-H2139/sam-H2139/SPARC_H2139c_LM (Taeniae)_DiI VIP%26NOS.xml': 'files/derivative/sub-H2139/sam-H2139/SPARC_H2139c_LM_(Taeniae)_DiI_VIP_26NOS.xml',
-            'files/derivative/sub-H2146/sam-H2146/SPARC_H2146b_LM (Taeniae)_DiI VIP%26NOS.xml': 'files/derivative/sub-H2146/sam-H2146/SPARC_H2146b_LM_(Taeniae)_DiI_VIP_26NOS.xml',
-            'files/derivative/sub-H2111/sam-H2111/SPARC_H2111A_LM_NOS%26ChAT_DiI.xml': 'files/derivative/sub-H2111/sam-H2111/SPARC_H2111A_LM_NOS_26ChAT_DiI.xml',
-            'files/derivative/sub-H2104/sam-H2104/SPARC_H2104B_LM_NOS%26ChAT_DiI.xml': 'files/derivative/sub-H2104/sam-H2104/SPARC_H2104B_LM_NOS_26ChAT_DiI.xml',
-            'files/derivative/sub-H2109/sam-H2109/SPARC_H2109B_LM_NOS%26ChAT_DiI.xml': 'files/derivative/sub-H2109/sam-H2109/SPARC_H2109B_LM_NOS_26ChAT_DiI.xml',
-            'files/derivative/sub-H2151/sam-H2151C/SPARC_H2151c_LM (Taeniae)_DiI ChAT%26NOS.xml': 'files/derivative/sub-H2151/sam-H2151C/SPARC_H2151c_LM_(Taeniae)_DiI_ChAT_26NOS.xml',
-            'files/derivative/sub-H2151/sam-H2151/SPARC_H2151b_LM (Taeniae)_DiI ChAT%26NOS.xml': 'files/derivative/sub-H2151/sam-H2151/SPARC_H2151b_LM_(Taeniae)_DiI_ChAT_26NOS.xml',
-            'files/derivative/sub-H2149/sam-H2149/SPARC_H2149c_LM (Taeniae)_DiI ChAT%26NOS.xml': 'files/derivative/sub-H2149/sam-H2149/SPARC_H2149c_LM_(Taeniae)_DiI_ChAT_26NOS.xml',
-            'files/derivative/sub-H2149/sam-H2149B/SPARC_H2149b_LM (Taeniae)_DiI VIP%26NOS.xml': 'files/derivative/sub-H2149/sam-H2149B/SPARC_H2149b_LM_(Taeniae)_DiI_VIP_26NOS.xml',
-            'files/derivative/sub-H2107/sam-H2107/SPARC_H2107C_LM_NOS%26ChAT_DiI.xml': 'files/derivative/sub-H2107/sam-H2107/SPARC_H2107C_LM_NOS_26ChAT_DiI.xml',
-            'files/derivative/sub-H2145/sam-H2145/SPARC_H2145c_LM (Taeniae)_DiI ChAT%26NOS.xml': 'files/derivative/sub-H2145/sam-H2145/SPARC_H2145c_LM_(Taeniae)_DiI_ChAT_26NOS.xml',
-            'files/derivative/sub-H2145/sam-H2145B/SPARC_H2145b_LM (Taeniae)_DiI VIP%26NOS.xml': 'files/derivative/sub-H2145/sam-H2145B/SPARC_H2145b_LM_(Taeniae)_DiI_VIP_26NOS.xml',
-            # 314
-            'files/primary/sub-20/sam-20Ventricle/20 mouse left ventricle TH.xml': 'files/primary/sub-20/sam-20Ventricle/20_mouse_left_ventricle_TH.xml',
-            'files/primary/sub-208/sam-208Atria/208 mice atria TH tracing.xml': 'files/primary/sub-208/sam-208Atria/208_mice_atria_TH_tracing.xml',
-            'files/primary/sub-23/sam-23Ventricle/23 mouse right ventricle TH.xml': 'files/primary/sub-23/sam-23Ventricle/23_mouse_right_ventricle_TH.xml',
-            'files/primary/sub-23/sam-23Septum/23 Septum TH.xml': 'files/primary/sub-23/sam-23Septum/23_Septum_TH.xml',
-            # 120
-            'files/derivative/sub-cat9/perf-3-cat9/Cat 9.3.2_20ml rename.xml': 'files/derivative/sub-cat9/perf-3-cat9/Cat_9.3.2_20ml_rename.xml',
-            'files/derivative/sub-cat9/perf-3-cat9/Cat 9.3.1_10ml rename.xml': 'files/derivative/sub-cat9/perf-3-cat9/Cat_9.3.1_10ml_rename.xml',
-            # 230
-            'files/primary/sub-dorsal-1/sam-CGRP-Mouse-Dorsal-1/3D scaffold - CGRP-Mice-Dorsal-1.xml': 'files/primary/sub-dorsal-1/sam-CGRP-Mouse-Dorsal-1/3D_scaffold_-_CGRP-Mice-Dorsal-1.xml',
-            'files/primary/sub-dorsal-4/sam-CGRP-Mouse-Dorsal-4/3D scaffold - CGRP-Mice-Dorsal-4.xml': 'files/primary/sub-dorsal-4/sam-CGRP-Mouse-Dorsal-4/3D_scaffold_-_CGRP-Mice-Dorsal-4.xml',
-            'files/primary/sub-ventral-3/sam-CGRP-Mouse-Ventral-3/3D scaffold - CGRP-Mice-Ventral-3.xml': 'files/primary/sub-ventral-3/sam-CGRP-Mouse-Ventral-3/3D_scaffold_-_CGRP-Mice-Ventral-3.xml',
-            'files/primary/sub-dorsal-3/sam-CGRP-Mouse-Dorsal-3/3D scaffold - CGRP-Mice-Dorsal-3.xml': 'files/primary/sub-dorsal-3/sam-CGRP-Mouse-Dorsal-3/3D_scaffold_-_CGRP-Mice-Dorsal-3.xml',
-            'files/primary/sub-ventral-1/sam-CGRP-Mouse-Ventral-1/3D scaffold - CGRP-Mice-Ventral-1.xml': 'files/primary/sub-ventral-1/sam-CGRP-Mouse-Ventral-1/3D_scaffold_-_CGRP-Mice-Ventral-1.xml',
-            'files/primary/sub-ventral-2/sam-CGRP-Mouse-Ventral-2/3D scaffold - CGRP-Mice-Ventral-2.xml': 'files/primary/sub-ventral-2/sam-CGRP-Mouse-Ventral-2/3D_scaffold_-_CGRP-Mice-Ventral-2.xml',
-            'files/primary/sub-dorsal-2/sam-CGRP-Mouse-Dorsal-2/3D scaffold - CGRP-Mice-Dorsal-2.xml': 'files/primary/sub-dorsal-2/sam-CGRP-Mouse-Dorsal-2/3D_scaffold_-_CGRP-Mice-Dorsal-2.xml',
-            # 221
-            'files/derivative/sub-M11/sam-pCm11/digital-traces/pC PHPS XFP M11 20XZ 180425_180713_2_NL_20.xml': 'files/derivative/sub-M11/sam-pCm11/digital-traces/pC_PHPS_XFP_M11_20XZ_180425_180713_2_NL_20.xml',
-            'files/derivative/sub-M11/sam-pCm11/digital-traces/pC PHPS XFP M11 20XZ 180425_180713_2_NL_IGNE.xml': 'files/derivative/sub-M11/sam-pCm11/digital-traces/pC_PHPS_XFP_M11_20XZ_180425_180713_2_NL_IGNE.xml',
-            'files/derivative/sub-M11/sam-pCm11/digital-traces/pC PHPS XFP M11 20XZ 180425_180713_2_NL_N1,2,3.xml': 'files/derivative/sub-M11/sam-pCm11/digital-traces/pC_PHPS_XFP_M11_20XZ_180425_180713_2_NL_N1_2_3.xml',
-            'files/derivative/sub-M11/sam-pCm11/digital-traces/pC PHPS XFP M11 20XZ 180425_180713_2_NL_N4.xml': 'files/derivative/sub-M11/sam-pCm11/digital-traces/pC_PHPS_XFP_M11_20XZ_180425_180713_2_NL_N4.xml',
-            'files/derivative/sub-M11/sam-pCm11/digital-traces/pC PHPS XFP M11 20XZ 180425_180713_2_NL_N5 connex.xml': 'files/derivative/sub-M11/sam-pCm11/digital-traces/pC_PHPS_XFP_M11_20XZ_180425_180713_2_NL_N5_connex.xml',
-            'files/derivative/sub-M11/sam-pCm11/digital-traces/pC PHPS XFP M11 20XZ 180425_180713_2_NL_N5.xml': 'files/derivative/sub-M11/sam-pCm11/digital-traces/pC_PHPS_XFP_M11_20XZ_180425_180713_2_NL_N5.xml',
-            'files/derivative/sub-M11/sam-pCm11/digital-traces/pC PHPS XFP M11 20XZ 180425_180713_2_NL_N8,9,10.xml': 'files/derivative/sub-M11/sam-pCm11/digital-traces/pC_PHPS_XFP_M11_20XZ_180425_180713_2_NL_N8_9_10.xml',
-            'files/derivative/sub-M134/sam-pCm134/digital-traces/pC XFP M134 20XZ 190806_191012_200130D_lx_F G.xml': 'files/derivative/sub-M134/sam-pCm134/digital-traces/pC_XFP_M134_20XZ_190806_191012_200130D_lx_F_G.xml',
-            'files/derivative/sub-M134/sam-pCm134/digital-traces/pC XFP M134 20XZ 190806_191012_200130D_lx_F O.xml': 'files/derivative/sub-M134/sam-pCm134/digital-traces/pC_XFP_M134_20XZ_190806_191012_200130D_lx_F_O.xml',
-            'files/derivative/sub-M134/sam-pCm134/digital-traces/pC XFP M134 20XZ 190806_191012_200130D_lx.xml': 'files/derivative/sub-M134/sam-pCm134/digital-traces/pC_XFP_M134_20XZ_190806_191012_200130D_lx.xml',
-            'files/derivative/sub-M16/sam-pCm16/digital-traces/pC PHPS XFP M16 20XZ 180425_180524.xml': 'files/derivative/sub-M16/sam-pCm16/digital-traces/pC_PHPS_XFP_M16_20XZ_180425_180524.xml',
-            'files/derivative/sub-M163/sam-pCm163/digital-traces/pCm163_AAV_Z_20x_20200206_S3_F peach.png.xml': 'files/derivative/sub-M163/sam-pCm163/digital-traces/pCm163_AAV_Z_20x_20200206_S3_F_peach.png.xml',
-            'files/derivative/sub-M163/sam-pCm163/digital-traces/pCm163_AAV_Z_20x_20200206_S3_N12 connex.xml': 'files/derivative/sub-M163/sam-pCm163/digital-traces/pCm163_AAV_Z_20x_20200206_S3_N12_connex.xml',
-            'files/derivative/sub-M168/digital-traces/pCm168_AAV_Z_20x_191211_S3B_lx_F beige.xml': 'files/derivative/sub-M168/digital-traces/pCm168_AAV_Z_20x_191211_S3B_lx_F_beige.xml',
-            'files/derivative/sub-M168/digital-traces/pCm168_AAV_Z_20x_191211_S3B_lx_F G.xml': 'files/derivative/sub-M168/digital-traces/pCm168_AAV_Z_20x_191211_S3B_lx_F_G.xml',
-            'files/derivative/sub-M168/digital-traces/pCm168_AAV_Z_20x_191211_S3B_lx_IG connex.xml': 'files/derivative/sub-M168/digital-traces/pCm168_AAV_Z_20x_191211_S3B_lx_IG_connex.xml',
-            # 347
-            'files/primary/sub-111/sam-DB-rat-ventral-111/3D scaffold_sub111VM.xml': 'files/primary/sub-111/sam-DB-rat-ventral-111/3D_scaffold_sub111VM.xml',
-            'files/primary/sub-115/sam-DB-rat-ventral-115/3D scaffold_sub115VM.xml': 'files/primary/sub-115/sam-DB-rat-ventral-115/3D_scaffold_sub115VM.xml',
-            'files/primary/sub-123/sam-DB-rat-ventral-123/3D scaffold_sub123VM.xml': 'files/primary/sub-123/sam-DB-rat-ventral-123/3D_scaffold_sub123VM.xml',
-            'files/primary/sub-124/sam-DB-rat-ventral-124/3D scaffold_sub124VM.xml': 'files/primary/sub-124/sam-DB-rat-ventral-124/3D_scaffold_sub124VM.xml',
-            'files/primary/sub-116/sam-DB-rat-ventral-116/3D scaffold_sub116VM.xml': 'files/primary/sub-116/sam-DB-rat-ventral-116/3D_scaffold_sub116VM.xml',
-            'files/primary/sub-112/sam-DB-rat-ventral-112/3D scaffold_sub112VM.xml': 'files/primary/sub-112/sam-DB-rat-ventral-112/3D_scaffold_sub112VM.xml'
-}
+import json
+import os
+import threading
 
-biolucida_name_map = {
-    # 178
-    'File 124 05-22-2019 PYF 3 6 Phox2b YFP Pr GFP-g Hu-b_TileScan_001_Merging001_Pro': 'File 124 05-22-2019 PYF 3 6 Phox2b YFP Pr GFP-g Hu-b_TileScan_001_Merging001_ProjMax001_3.jp2',
-    'File 118 10-14-2019 DYM 12 8 Chat YFP Pr 1 GFP-g CalB-r Hu-b 63x_Series015_ProjM': 'File 118 10-14-2019 DYM 12 8 Chat YFP Pr 1 GFP-g CalB-r Hu-b 63x_Series015_ProjMax001_8.jp2',
-    'File 152 02-17-20 A DYM 8 6 Distal Chat-g CalB-r CalR-b_TileScan_001_Merging001_': 'File 152 02-17-20 A DYM 8 6 Distal Chat-g CalB-r CalR-b_TileScan_001_Merging001_ProjMax001_3.jp2',
-    'File_78_05-23-2018_Chat-r_Hu-b__TileScan_001_Merging002_Merged001_Processed001_4': 'File_78_05-23-2018_Chat-r_Hu-b__TileScan_001_Merging002_Merged001_Processed001_4.jp2',
-    'File 170 02-12-19 KYM 3 1 Prox2 GGRP-g Hu-b_TileScan_002_Merging001_ProjMax001_1': 'File 170 02-12-19 KYM 3 1 Prox2 GGRP-g Hu-b_TileScan_002_Merging001_ProjMax001_10.jp2',
-    'File 170 02-12-19 KYM 3 1 Prox2 GGRP-g Hu-b_TileScan_001_Merging001_ProjMax001_3': 'File 170 02-12-19 KYM 3 1 Prox2 GGRP-g Hu-b_TileScan_001_Merging001_ProjMax001_3.jp2',
-    'File 173 03-8-19 KM3 Mid CGRP-g Hu-b SYT1-r_10X prox region of Mid Colon_ProjMax': 'File 173 03-8-19 KM3 Mid CGRP-g Hu-b SYT1-r_10X prox region of Mid Colon_ProjMax001_17.jp2',
-    'File_154_10-3-19_WTM_2_9_Prox_GABA-g_SST-r_Hu-b_TileScan_001_Merging001_Processe': 'File_154_10-3-19_WTM_2_9_Prox_GABA-g_SST-r_Hu-b_TileScan_001_Merging001_Processed001_3.jp2',
-    # 204
-    '20171222_MTF47ChATChR2_heartdorsal_ICganglia_DAPI405_ChR2EYFP_PGPCy3_GFP647_10X_': '20171222_MTF47ChATChR2_heartdorsal_ICganglia_DAPI405_ChR2EYFP_PGPCy3_GFP647_10X_01.jpx',
-    '20180319_MTF61ChATChR2_Rvagus_ChR2EYFP488_PGPCy3_GFP647_10X_01_Stitch_Subset_Max': '20180319_MTF61ChATChR2_Rvagus_ChR2EYFP488_PGPCy3_GFP647_10X_01_Stitch_Subset_Maximum intensity projection 2.jp2',
-    '20180319_MTF52ChATChR2_heartdorsal_ICganglion_ChR2EYFP488_PGPCy3_GFP647_10X_01.j': '20180319_MTF52ChATChR2_heartdorsal_ICganglion_ChR2EYFP488_PGPCy3_GFP647_10X_01.jpx',
-    '20180319_MTF51ChATChR2_heartdorsal_ICganglion_ChR2EYFP488_PGPCy3_GFP647_10X_01_M': '20180319_MTF51ChATChR2_heartdorsal_ICganglion_ChR2EYFP488_PGPCy3_GFP647_10X_01_Maximum intensity projection.jp2',
-    # 108
-    '2019-11-01 ACh sensor staining in SMG 02 - Same Thresholds.jpx': '2019-11-01-ACh sensor staining in SMG 02 Same Thresholds.jpx',
-}
+from collections.abc import Mapping
+
+# Manually mapped names, grouped by the dataset they were found in ('' when unknown)
+NAME_MAP_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'manifest_name_to_discover_name.json')
+
+nameMaps = None
+nameMapsLock = threading.Lock()
+
+def load_name_maps():
+    global nameMaps
+
+    with nameMapsLock:
+        if nameMaps is None:
+            with open(NAME_MAP_FILE) as mapFile:
+                nameMaps = json.load(mapFile)
+
+    return nameMaps
+
+
+class NameMap(Mapping):
+    '''
+    Read only mapping over one of the maps of the name map file.
+    The file is only read on the first lookup, so importing the suites
+    stays cheap when the mapping implementations are switched off.
+    '''
+
+    def __init__(self, name):
+        self.name = name
+        self.mapping = None
+        self.reverseMapping = None
+        self.lock = threading.Lock()
+
+    def load(self):
+        with self.lock:
+            if self.mapping is None:
+                mapping = {}
+                for names in load_name_maps()[self.name].values():
+                    mapping.update(names)
+                self.mapping = mapping
+
+        return self.mapping
+
+    def __getitem__(self, name):
+        return self.load()[name]
+
+    def __contains__(self, name):
+        return name in self.load()
+
+    def __iter__(self):
+        return iter(self.load())
+
+    def __len__(self):
+        return len(self.load())
+
+    # The names mapped to the given name
+    def reverse(self, name):
+        mapping = self.load()
+        with self.lock:
+            if self.reverseMapping is None:
+                reverseMapping = {}
+                for key, value in mapping.items():
+                    reverseMapping.setdefault(value, []).append(key)
+                self.reverseMapping = reverseMapping
+
+        return self.reverseMapping.get(name, [])
+
+
+# Manifest file path -> Pennsieve Discover file path
+name_map = NameMap('name_map')
+# Biolucida image name -> manifest file name
+biolucida_name_map = NameMap('biolucida_name_map')
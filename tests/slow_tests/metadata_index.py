@@ -0,0 +1,74 @@
+import re
+
+# Length of the n-grams used by the inverted index
+NGRAM = 3
+
+# Keep letters, digits and dots only, so minor differences in separators still match
+def normalise(text):
+    return ' '.join(re.findall('[.a-zA-Z0-9]+', text))
+
+def ngrams(text):
+    return {text[i:i + NGRAM] for i in range(len(text) - NGRAM + 1)}
+
+
+class SubstringIndex(object):
+    '''
+    Finds the first of a list of texts containing a string, the n-gram
+    inverted index narrows down the texts to check to the few sharing
+    all the n-grams of the string.
+    '''
+
+    def __init__(self, texts):
+        self.texts = texts
+        self.postings = {}
+        for index, text in enumerate(texts):
+            for gram in ngrams(text):
+                self.postings.setdefault(gram, set()).add(index)
+
+    def first(self, query, before=None):
+        end = len(self.texts) if before is None else before
+
+        if len(query) < NGRAM:
+            candidates = range(end)
+        else:
+            postings = sorted((self.postings.get(gram, set()) for gram in ngrams(query)), key=len)
+            candidates = sorted(i for i in set.intersection(*postings) if i < end)
+
+        for index in candidates:
+            if query in self.texts[index]:
+                return index
+
+        return None
+
+
+class MetadataIndex(object):
+    '''
+    Index of the files in the metadata of a Pennsieve dataset version, built once
+    per version. find() returns the path of the first file whose path contains
+    the file name, or whose normalised path contains the normalised file name.
+    '''
+
+    def __init__(self, files_metadata):
+        self.paths = [file_metadata['path'] for file_metadata in files_metadata]
+        self.basenames = {}
+        for index, path in enumerate(self.paths):
+            self.basenames.setdefault(path.rsplit('/', 1)[-1], index)
+        self.pathIndex = SubstringIndex(self.paths)
+        self.normalisedIndex = SubstringIndex([normalise(path) for path in self.paths])
+
+    def __len__(self):
+        return len(self.paths)
+
+    def find(self, fileName):
+        # A matching basename bounds the search to the files listed before it
+        found = self.basenames.get(fileName)
+
+        index = self.pathIndex.first(fileName, found)
+        if index is not None:
+            found = index
+
+        index = self.normalisedIndex.first(normalise(fileName), found)
+        if index is not None:
+            found = index
+
+        return None if found is None else self.paths[found]
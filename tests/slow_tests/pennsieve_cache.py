@@ -0,0 +1,102 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from tests.clients import get_session
+from tests.config import Config
+
+
+class PennsieveCache(object):
+    '''
+    On-disk cache of the Pennsieve files/browse responses.
+    Published dataset versions do not change, so entries keyed by
+    (dataset_id, version, folder) never expire, they are only evicted
+    least recently used first once the cache holds more than maxEntries.
+    '''
+
+    def __init__(self, path, maxEntries):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.maxEntries = maxEntries
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.execute('''
+            CREATE TABLE IF NOT EXISTS browse (
+                dataset_id TEXT,
+                version TEXT,
+                folder TEXT,
+                files TEXT,
+                accessed REAL,
+                PRIMARY KEY (dataset_id, version, folder)
+            )''')
+        self.connection.execute('CREATE INDEX IF NOT EXISTS browse_accessed ON browse (accessed)')
+        self.entries = self.connection.execute('SELECT COUNT(*) FROM browse').fetchone()[0]
+
+    def get(self, dataset_id, version, folder):
+        key = (str(dataset_id), str(version), folder)
+        with self.lock:
+            row = self.connection.execute(
+                'SELECT files FROM browse WHERE dataset_id=? AND version=? AND folder=?', key).fetchone()
+            if row is None:
+                self.misses = self.misses + 1
+                return None
+
+            self.hits = self.hits + 1
+            self.connection.execute(
+                'UPDATE browse SET accessed=? WHERE dataset_id=? AND version=? AND folder=?', (time.time(),) + key)
+            return json.loads(row[0])
+
+    def put(self, dataset_id, version, folder, files):
+        key = (str(dataset_id), str(version), folder)
+        with self.lock:
+            cursor = self.connection.execute(
+                'INSERT OR IGNORE INTO browse VALUES (?, ?, ?, ?, ?)', key + (json.dumps(files), time.time()))
+            self.entries = self.entries + cursor.rowcount
+            if self.entries > self.maxEntries:
+                self.connection.execute(
+                    'DELETE FROM browse WHERE rowid IN (SELECT rowid FROM browse ORDER BY accessed LIMIT ?)',
+                    (self.entries - self.maxEntries,))
+                self.entries = self.maxEntries
+
+    def stats(self):
+        return {
+            'Hits': self.hits,
+            'Misses': self.misses,
+            'Entries': self.entries
+        }
+
+
+pennsieveCache = None
+pennsieveCacheLock = threading.Lock()
+
+def get_pennsieve_cache():
+    global pennsieveCache
+
+    with pennsieveCacheLock:
+        if pennsieveCache is None:
+            pennsieveCache = PennsieveCache(Config.PENNSIEVE_CACHE, Config.PENNSIEVE_CACHE_SIZE)
+
+    return pennsieveCache
+
+# Files in the folder of a published dataset version, from the cache when possible
+def fetch_browse_files(dataset_id, version, folder_path):
+    cache = get_pennsieve_cache()
+
+    files = cache.get(dataset_id, version, folder_path)
+    if files is None:
+        files = []
+        fileUrl = f'{Config.PENNSIEVE_API_HOST}/datasets/{dataset_id}/versions/{version}/files/browse?path={folder_path}'
+        file_response = get_session().get(fileUrl)
+        files_info = file_response.json()
+        if 'files' in files_info:
+            files = files_info['files']
+            if len(files) > 0:
+                cache.put(dataset_id, version, folder_path, files)
+
+    return files
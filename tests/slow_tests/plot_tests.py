@@ -1,24 +1,19 @@
 import unittest
-import requests
-import botocore
-import boto3
-import json
-import urllib.parse
-import os
-import re
 
-from urllib.parse import urljoin
+from functools import partial
 
-from tests.config import Config
+from tests.clients import get_endpoint_timer, get_s3_client
+from tests.profiling import profiled
+from tests.scicrunch import get_snapshot_datasets
+from tests.slow_tests.incremental import FingerprintStore, validate_dataset
+from tests.slow_tests.report_stream import ReportStream, dataset_failed, dump_report
+from tests.slow_tests.runner import validate_datasets
+from tests.slow_tests.s3_keys import DatasetKeys
 
-doc_link = 'https://github.com/ABI-Software/scicrunch-knowledge-testing/tree/doc_v1'
+# Functions timed when the suite is profiled or benchmarked
+PROFILED_FUNCTIONS = ['test_datasets_information', 'test_plot_list', 'test_plot_thumbnail', 'test_plot_thumbnail_s3file']
 
-s3 = boto3.client(
-    "s3",
-    aws_access_key_id=Config.AWS_KEY,
-    aws_secret_access_key=Config.AWS_SECRET,
-    region_name="us-east-1",
-)
+doc_link = 'https://github.com/ABI-Software/scicrunch-knowledge-testing/tree/doc_v1'
 
 S3_BUCKET_NAME = "prd-sparc-discover50-use1"
 
@@ -34,64 +29,25 @@ COMMON_TO_THUMBNAIL = {
     'image/png': 'image/x.vnd.abi.thumbnail+png'
 }
 
-def get_datasets(start, size):
-
-    headers = {'accept': 'application/json'}
-    params = {'api_key': Config.SCICRUNCH_API_KEY}
-
-    scicrunch_host = Config.SCICRUNCH_API_HOST + '/'
-
-    scicrunch_request = {
-        "from": start,
-        "size": size,
-        "_source": [
-            "item.curie",
-            "item.name",
-            "item.types",
-            "objects.name",
-            "objects.datacite",
-            "objects.additional_mimetype",
-            "objects.mimetype",
-            "objects.dataset",
-            "pennsieve.version",
-            "pennsieve.identifier",
-            "pennsieve.uri"
-        ]
-    }
-
-    return requests.post(urljoin(scicrunch_host, '_search?preference=abiknowledgetesting'), json=scicrunch_request, params=params, headers=headers)
-
 def extract_bucket_name(original_name):
     return original_name.split('/')[2]
 
-def test_plot_thumbnail_s3file(dataset_id, thumbnail_object, s3_bucket):
+def test_plot_thumbnail_s3file(dataset_id, thumbnail_object, keys):
     scicrunch_path = thumbnail_object['dataset']['path']
     if "files/" not in scicrunch_path:
         scicrunch_path = "files/" + scicrunch_path
     scicrunch_path = f'{dataset_id}/' + scicrunch_path
 
-    try:
-        head_response = s3.head_object(
-            Bucket=s3_bucket,
-            Key=scicrunch_path,
-            RequestPayer="requester"
-        )
-        if head_response and 'ResponseMetadata' in head_response and 200 == head_response['ResponseMetadata']['HTTPStatusCode']:
-            pass
-        else:
-            return {
-                'S3Path': scicrunch_path,
-                'Reason': 'Invalid response',
-            }
-    except botocore.exceptions.ClientError as error:
+    reason = keys.find(scicrunch_path)
+    if reason:
         return {
             'S3Path': scicrunch_path,
-            'Reason': f"{error}",
+            'Reason': reason,
         }
 
     return None
 
-def test_plot_thumbnail(dataset_id, plot_object, object_list, s3_bucket):
+def test_plot_thumbnail(dataset_id, plot_object, object_list, keys):
     responses = []
 
     thumbnail_name = None
@@ -139,17 +95,32 @@ def test_plot_thumbnail(dataset_id, plot_object, object_list, s3_bucket):
                 responses.append(error_response)
 
                 # Check if the file exists in s3
-                error = test_plot_thumbnail_s3file(dataset_id, thumbnail_object, s3_bucket)
+                error = test_plot_thumbnail_s3file(dataset_id, thumbnail_object, keys)
                 if error:
                     responses.append(error)
 
                 return responses
 
+# The S3 key of a thumbnail is only looked up when its additional mimetype is outdated
+def count_thumbnail_lookups(object_list):
+    lookups = 0
+    for thumbnail_object in object_list:
+        if thumbnail_object.get('datacite', {}).get('isDerivedFrom', {}).get('path', NOT_SPECIFIED) == NOT_SPECIFIED:
+            continue
+        mime_type = thumbnail_object.get('additional_mimetype', NOT_SPECIFIED)
+        if mime_type != NOT_SPECIFIED:
+            mime_type = mime_type.get('name')
+        if not mime_type or mime_type not in COMMON_TO_THUMBNAIL.values():
+            lookups = lookups + 1
+
+    return lookups
+
 def test_plot_list(dataset_id, object_list, s3_bucket):
     objectErrors = []
     datasetErrors = []
 
     PlotFound = False
+    keys = DatasetKeys(get_s3_client(), s3_bucket, dataset_id, count_thumbnail_lookups(object_list), len(object_list))
 
     for plot_object in object_list:
         # Check if the object is a segmentation file
@@ -161,7 +132,7 @@ def test_plot_list(dataset_id, object_list, s3_bucket):
 
         if mime_type in PLOT_FILE:
             PlotFound = True
-            error = test_plot_thumbnail(dataset_id, plot_object, object_list, s3_bucket)
+            error = test_plot_thumbnail(dataset_id, plot_object, object_list, keys)
             if error:
                 objectErrors.extend(error)
 
@@ -212,17 +183,23 @@ class PlotDatasetFilesTest(unittest.TestCase):
     def __init__(self, *args, **kwds):
         super().__init__(*args, **kwds)
 
+    @profiled('reports/plot_profile', PROFILED_FUNCTIONS)
     def test_files_information(self):
         global path_mapping
-        start = 0
         size = 20
-        keepGoing = True
         totalSize = 0
         reportOutput = 'reports/plot_reports.json'
+        reportStreamOutput = 'reports/plot_reports.jsonl'
+        summaryOutput = 'reports/plot_reports_summary.json'
         pathMappingOutput = 'reports/plot_path_mapping.json'
+        fingerprintOutput = 'reports/plot_fingerprints.json'
         reports = {'Tested': 0, 'Failed': 0, 'FailedIds':[], 'Datasets':[]}
         testSize = 2000
         totalPlot = 0
+        fingerprints = FingerprintStore(fingerprintOutput, reportStreamOutput)
+        stream = ReportStream(reportStreamOutput, fingerprints=fingerprints)
+        # Only the calls of this suite are in its Timing section
+        get_endpoint_timer().reset()
 
         # '''
         # Test selected datasets
@@ -268,35 +245,25 @@ class PlotDatasetFilesTest(unittest.TestCase):
         '''
         Test all the datasets
         '''
-        while keepGoing :
-            scicrunch_response = get_datasets(start, size)
-            self.assertEqual(200, scicrunch_response.status_code)
-
-            data = scicrunch_response.json()
-
-            #No more result, stop
-            if size > len(data['hits']['hits']):
-                keepGoing = False
-
-            #keepGoing= False
-
-            start = start + size
+        # Each report is on disk as soon as its dataset is validated
+        totalSize = len(stream.ids)
+        try:
+            for report in validate_datasets(stream.pending(get_snapshot_datasets(size, search_after=stream.cursor)), partial(validate_dataset, fingerprints, test_datasets_information)):
+                stream.write(report)
+                totalSize = totalSize + 1
+
+                if totalSize >= testSize:
+                    break
+        finally:
+            stream.close()
+
+        # Generate the report from the stream
+        for report in stream.reports():
+            if 'Plot' in report and report['Plot']:
+                totalPlot = totalPlot + 1
+            if dataset_failed(report):
+                reports['FailedIds'].append(report['Id'])
 
-            for dataset in data['hits']['hits']:
-                report = test_datasets_information(dataset)
-                if 'Plot' in report and report['Plot']:
-                    totalPlot = totalPlot + 1
-                print(f"Reports generated for {report['Id']}")
-                if len(report['Errors']) > 0 or report['ObjectErrors']['Total'] > 0:
-                    reports['FailedIds'].append(report['Id'])
-                    reports['Datasets'].append(report)
-
-            totalSize = totalSize + len(data['hits']['hits'])
-
-            if totalSize >= testSize:
-                keepGoing = False
-
-        # Generate the report
         reports['Tested'] = totalSize
         reports['Tested Datasets with Plot'] = totalPlot
         print(f"Number of datasets tested: {reports['Tested']}")
@@ -305,9 +272,12 @@ class PlotDatasetFilesTest(unittest.TestCase):
         if reports['Failed'] > 0:
             print(f"Failed Datasets: {reports['FailedIds']}")
             
-        os.makedirs(os.path.dirname(reportOutput), exist_ok=True)
-        with open(reportOutput, 'w') as outfile:
-            json.dump(reports, outfile, indent=4)
+        reports['Datasets'] = stream.reports(dataset_failed)
+        reports['Timing'] = get_endpoint_timer().stats()
+        stream.write_summary(summaryOutput, reports)
+        dump_report(reports, reportOutput)
+
+        fingerprints.save()
     
         print(f"Full report has been generated at {reportOutput}")
 
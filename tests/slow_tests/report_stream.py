@@ -0,0 +1,140 @@
+import json
+import os
+
+from collections import deque
+
+from tests.config import Config
+from tests.slow_tests.incremental import dataset_fingerprint
+
+JSON_TYPES = (list, dict, str, int, float, bool, type(None))
+
+def indented(value, depth):
+    return json.dumps(value, indent=4).replace('\n', '\n' + ' ' * 4 * depth)
+
+# Same output as json.dump(report, outfile, indent=4), but the values which are
+# generators are written one item at a time instead of being held in memory
+def dump_report(report, path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmpPath = f'{path}.{os.getpid()}.tmp'
+    with open(tmpPath, 'w') as outfile:
+        outfile.write('{')
+        for position, (key, value) in enumerate(report.items()):
+            outfile.write(',\n    ' if position else '\n    ')
+            outfile.write(json.dumps(key) + ': ')
+            if isinstance(value, JSON_TYPES):
+                outfile.write(indented(value, 1))
+            else:
+                empty = True
+                for item in value:
+                    outfile.write(',\n        ' if not empty else '[\n        ')
+                    outfile.write(indented(item, 2))
+                    empty = False
+                outfile.write('[]' if empty else '\n    ]')
+        outfile.write('\n}' if report else '}')
+    os.replace(tmpPath, path)
+
+
+# A dataset failed when it has errors of its own or in its objects
+def dataset_failed(report):
+    return len(report['Errors']) > 0 or report['ObjectErrors']['Total'] > 0
+
+
+class ReportStream(object):
+    '''
+    Append only JSON lines file of the dataset reports of a slow suite, which is
+    also the checkpoint of the run. Every line holds the report, the mapping state
+    of the dataset, its fingerprint and the SciCrunch sort of its hit, and is flushed to disk as soon
+    as it is written. With REPORT_RESUME set, the reports already in the file are
+    kept, their datasets are not validated again and the datasets are fetched
+    from the cursor of the last line onwards.
+    Reports are keyed by the SciCrunch document _id, which every dataset has.
+    The offset of every line is handed to the fingerprint store when given.
+    '''
+
+    def __init__(self, path, resume=None, fingerprints=None):
+        self.path = path
+        self.fingerprints = fingerprints
+        self.ids = set()
+        self.offsets = {}
+        # Sort of the last dataset written, and sort and fingerprint of the datasets handed out for validation
+        self.cursor = None
+        self.cursors = deque()
+        resume = Config.REPORT_RESUME if resume is None else resume
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        if resume and os.path.exists(path):
+            self.load()
+        elif fingerprints:
+            fingerprints.rotate()
+        self.outfile = open(path, 'a' if resume else 'w')
+
+    def load(self):
+        end = 0
+        with open(self.path, 'rb') as infile:
+            for line in infile:
+                # The last line of a crashed run may be incomplete
+                if not line.endswith(b'\n'):
+                    break
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    break
+                self.ids.add(entry['_id'])
+                self.offsets[entry['_id']] = end
+                self.cursor = entry.get('Cursor')
+                if self.fingerprints:
+                    self.fingerprints.record(entry.get('Fingerprint'), end)
+                end = end + len(line)
+
+        with open(self.path, 'r+b') as infile:
+            infile.truncate(end)
+
+    # The datasets without a report yet, their reports must be written in the same order
+    def pending(self, datasets):
+        for dataset in datasets:
+            if dataset['_id'] not in self.ids:
+                self.cursors.append((dataset.get('sort'), dataset_fingerprint(dataset)))
+                yield dataset
+
+    def write(self, report, state=None):
+        fingerprint = None
+        if self.cursors:
+            self.cursor, fingerprint = self.cursors.popleft()
+        line = json.dumps({
+            '_id': report['_id'],
+            'Cursor': self.cursor,
+            'Fingerprint': fingerprint,
+            'Report': report,
+            'State': state
+        }) + '\n'
+        offset = self.outfile.tell()
+        self.offsets[report['_id']] = offset
+        self.outfile.write(line)
+        self.outfile.flush()
+        os.fsync(self.outfile.fileno())
+        self.ids.add(report['_id'])
+        if self.fingerprints:
+            self.fingerprints.record(fingerprint, offset)
+
+    def close(self):
+        self.outfile.close()
+
+    # (Report, State) of every dataset in the file
+    def entries(self):
+        with open(self.path) as infile:
+            for line in infile:
+                entry = json.loads(line)
+                yield entry['Report'], entry['State']
+
+    # The reports in the file, only those accepted by select when given
+    def reports(self, select=None):
+        for report, _ in self.entries():
+            if select is None or select(report):
+                yield report
+
+    # Small index of the run: the summary without the streamed values and the offset of each report in the file
+    def write_summary(self, path, summary):
+        index = {key: value for key, value in summary.items() if isinstance(value, JSON_TYPES)}
+        index['Reports'] = self.path
+        index['Offsets'] = self.offsets
+        dump_report(index, path)
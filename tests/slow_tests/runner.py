@@ -0,0 +1,25 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from tests.config import Config
+
+# Validate the datasets with a bounded pool of workers. Reports are yielded in the
+# same order as the datasets so the merged reports do not depend on timing, and
+# at most a couple of datasets per worker are in flight at any time.
+def validate_datasets(datasets, validate, workers=None):
+    workers = workers or Config.VALIDATION_WORKERS
+
+    if workers <= 1:
+        for dataset in datasets:
+            yield validate(dataset)
+        return
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for dataset in datasets:
+            pending.append(executor.submit(validate, dataset))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+
+        while pending:
+            yield pending.popleft().result()
@@ -0,0 +1,74 @@
+import math
+
+import botocore.exceptions
+
+# Same reason as a failed HeadObject call so existing reports and documentation still apply
+KEY_NOT_FOUND = 'An error occurred (404) when calling the HeadObject operation: Not Found'
+# Keys returned by one ListObjectsV2 call
+S3_LIST_PAGE_SIZE = 1000
+
+def dataset_prefix(dataset_id):
+    return f'{dataset_id}/files/'
+
+# List all the keys of a dataset with a handful of paginated LIST calls
+# instead of one HEAD call per file. None is returned if the listing fails.
+def list_dataset_keys(s3, bucket, dataset_id):
+    keys = set()
+    try:
+        paginator = s3.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=bucket, Prefix=dataset_prefix(dataset_id), RequestPayer='requester'):
+            for content in page.get('Contents', []):
+                keys.add(content['Key'])
+    except botocore.exceptions.ClientError as error:
+        print(f"Cannot list {dataset_prefix(dataset_id)} in {bucket}, checking files one by one: {error}")
+        keys = None
+
+    return keys
+
+def head_key(s3, bucket, key):
+    try:
+        head_response = s3.head_object(
+            Bucket=bucket,
+            Key=key,
+            RequestPayer="requester"
+        )
+        if head_response and 'ResponseMetadata' in head_response \
+            and 200 == head_response['ResponseMetadata']['HTTPStatusCode']:
+            pass
+        else:
+            return 'Invalid response'
+    except botocore.exceptions.ClientError as error:
+        return f"{error}"
+
+    return None
+
+
+
+class DatasetKeys(object):
+    '''
+    Keys of a dataset in its bucket, listed on the first lookup. One is made per
+    dataset when its objects are tested and passed down to the checks, so the
+    listing lives exactly as long as the validation of the dataset whatever the
+    number of datasets validated concurrently.
+    The dataset is only listed when the checks expect more lookups than the LIST
+    calls needed for its files, otherwise each key is checked with a HEAD call.
+    '''
+
+    def __init__(self, s3, bucket, dataset_id, lookups, files):
+        self.s3 = s3
+        self.bucket = bucket
+        self.dataset_id = dataset_id
+        self.keys = None
+        # Without more lookups than LIST calls, keys stays None and every key gets a HEAD call
+        self.listed = lookups <= max(1, math.ceil(files / S3_LIST_PAGE_SIZE))
+
+    # Check if the key exists in the bucket, returns None if it does otherwise the reason
+    def find(self, key):
+        if key.startswith(dataset_prefix(self.dataset_id)):
+            if not self.listed:
+                self.keys = list_dataset_keys(self.s3, self.bucket, self.dataset_id)
+                self.listed = True
+            if self.keys is not None:
+                return None if key in self.keys else KEY_NOT_FOUND
+
+        return head_key(self.s3, self.bucket, key)
@@ -1,28 +1,31 @@
 import unittest
-import requests
 import json
-import boto3
-import botocore
-import urllib.parse
 import os
 import re
+import threading
 
-from urllib.parse import urljoin
+from functools import partial
 
+from tests.clients import get_endpoint_timer, get_s3_client, get_session
 from tests.config import Config
+from tests.profiling import profiled
+from tests.scicrunch import get_snapshot_datasets
+from tests.slow_tests.incremental import FingerprintStore, validate_dataset
+from tests.slow_tests.report_stream import ReportStream, dataset_failed, dump_report
+from tests.slow_tests.pennsieve_cache import fetch_browse_files, get_pennsieve_cache
+from tests.slow_tests.runner import validate_datasets
+from tests.slow_tests.s3_keys import DatasetKeys
 from tests.slow_tests.manifest_name_to_discover_name import name_map
 
-pennsieve_cache = {}
+# Functions timed when the suite is profiled or benchmarked
+PROFILED_FUNCTIONS = ['test_datasets_information', 'test_segmentation_list', 'test_segmentation', 'test_segmentation_s3file',
+                      'test_scicrunch_and_neurolucida', 'test_scicrunch_and_pennsieve']
+
+# Module state is shared by the validation workers, guard it with the locks below
 path_mapping = {}
+mapping_lock = threading.Lock()
 doc_link = 'https://github.com/ABI-Software/scicrunch-knowledge-testing/tree/doc_v1'
 
-s3 = boto3.client(
-    "s3",
-    aws_access_key_id=Config.AWS_KEY,
-    aws_secret_access_key=Config.AWS_SECRET,
-    region_name="us-east-1",
-)
-
 S3_BUCKET_NAME = "prd-sparc-discover50-use1"
 
 NOT_SPECIFIED = 'not-specified'
@@ -37,31 +40,6 @@ SEGMENTATION_FILES = [
 # And make sure the mapping file is up-to-date.
 MAPPING_IMPLEMENTATION = False
 
-def get_datasets(start, size):
-
-    headers = {'accept': 'application/json'}
-    params = {'api_key': Config.SCICRUNCH_API_KEY}
-
-    scicrunch_host = Config.SCICRUNCH_API_HOST + '/'
-
-    scicrunch_request = {
-        "from": start,
-        "size": size,
-        "_source": [
-            "item.curie",
-            "item.name",
-            "item.types",
-            "objects.additional_mimetype",
-            "objects.mimetype",
-            "objects.dataset",
-            "pennsieve.version",
-            "pennsieve.identifier",
-            "pennsieve.uri"
-        ]
-    }
-
-    return requests.post(urljoin(scicrunch_host, '_search?preference=abiknowledgetesting'), json=scicrunch_request, params=params, headers=headers)
-
 def generate_redundant_detail(paths):
     redundant_detail = {}
 
@@ -78,29 +56,17 @@ def generate_redundant_detail(paths):
 def extract_bucket_name(original_name):
     return original_name.split('/')[2]
 
-def test_segmentation_s3file(dataset_id, segmentation_object, bucket, scicrunch_path):
+def test_segmentation_s3file(dataset_id, segmentation_object, keys, scicrunch_path):
     # When mapping not implemented, use the pathMapping cache to get the Pennsieve file path to test S3 file
     if not MAPPING_IMPLEMENTATION and dataset_id in path_mapping and scicrunch_path in path_mapping[dataset_id]:
         scicrunch_path = path_mapping[dataset_id][scicrunch_path]
     scicrunch_path = f'{dataset_id}/' + scicrunch_path
-    
-    try:
-        head_response = s3.head_object(
-            Bucket=bucket,
-            Key=scicrunch_path,
-            RequestPayer="requester"
-        )
-        if head_response and 'ResponseMetadata' in head_response and 200 == head_response['ResponseMetadata']['HTTPStatusCode']:
-            pass
-        else:
-            return {
-                'S3Path': scicrunch_path,
-                'Reason': 'Invalid response',
-            }
-    except botocore.exceptions.ClientError as error:
+
+    reason = keys.find(scicrunch_path)
+    if reason:
         return {
             'S3Path': scicrunch_path,
-            'Reason': f'{error}',
+            'Reason': reason,
         }
 
     return None
@@ -116,7 +82,7 @@ def test_scicrunch_and_neurolucida(dataset_id, version, scicrunch_path):
         ('path', scicrunch_path)
     ]
     url = f"{Config.NEUROLUCIDA_HOST}/thumbnail"
-    response = requests.get(url, params=query_args)
+    response = get_session().get(url, params=query_args)
     if response.status_code != 200:
         return {
             'ScicrunchPath': scicrunch_path,
@@ -127,23 +93,7 @@ def test_scicrunch_and_neurolucida(dataset_id, version, scicrunch_path):
     return None
 
 def fetch_files_from_pennsieve(dataset_id, version, folder_path):
-    global pennsieve_cache
-
-    files = []
-
-    if folder_path in pennsieve_cache:
-        files = pennsieve_cache[folder_path]
-    else:
-        fileUrl = f'{Config.PENNSIEVE_API_HOST}/datasets/{dataset_id}/versions/{version}/files/browse?path={folder_path}'
-        file_response = requests.get(fileUrl)
-        files_info = file_response.json()
-        #print(files_info)
-        if 'files' in files_info:
-            files = files_info['files']
-            if len(files) > 0:
-                pennsieve_cache[folder_path] = files
-
-    return files
+    return fetch_browse_files(dataset_id, version, folder_path)
 
 def test_scicrunch_and_pennsieve(dataset_id, version, bucket, scicrunch_path):
     error_response = {
@@ -175,9 +125,10 @@ def test_scicrunch_and_pennsieve(dataset_id, version, bucket, scicrunch_path):
             error_response['Reason'] = 'File path cannot be found on Pennsieve.'
 
             # Then generate the path mapping between Scicrunch and S3
-            if dataset_id not in path_mapping:
-                path_mapping[dataset_id] = {}
-            path_mapping[dataset_id][scicrunch_path] = s3file_path
+            with mapping_lock:
+                if dataset_id not in path_mapping:
+                    path_mapping[dataset_id] = {}
+                path_mapping[dataset_id][scicrunch_path] = s3file_path
 
             error_response['MappingRequired'] = 'Please check the path mapping file output for more information.'
             # Check if the file path is known to be inconsistent
@@ -191,10 +142,9 @@ def test_scicrunch_and_pennsieve(dataset_id, version, bucket, scicrunch_path):
         return error_response
 
 # Test object to check for any possible error
-def test_segmentation(dataset_id, version, segmentation_object, bucket):
+def test_segmentation(dataset_id, version, segmentation_object, bucket, keys):
     global path_mapping
 
-    pennsieve_cache = {}
     responses = []
 
     error_response = None
@@ -219,7 +169,7 @@ def test_segmentation(dataset_id, version, segmentation_object, bucket):
         error2 = test_scicrunch_and_neurolucida(dataset_id, version, scicrunch_path)
         if error2:
             responses.append(error2)
-        error3 = test_segmentation_s3file(dataset_id, segmentation_object, bucket, scicrunch_path)
+        error3 = test_segmentation_s3file(dataset_id, segmentation_object, keys, scicrunch_path)
         if error3:
             responses.append(error3)
 
@@ -231,9 +181,16 @@ def test_segmentation(dataset_id, version, segmentation_object, bucket):
 
     return responses
 
-def test_segmentation_list(dataset_id, version, object_list, bucket):
-    global pennsieve_cache
+def get_object_mimetype(segmentation_object):
+    mime_type = segmentation_object.get('additional_mimetype', NOT_SPECIFIED)
+    if mime_type != NOT_SPECIFIED:
+        mime_type = mime_type.get('name')
+    if not mime_type:
+        mime_type = segmentation_object['mimetype'].get('name', NOT_SPECIFIED)
+
+    return mime_type
 
+def test_segmentation_list(dataset_id, version, object_list, bucket):
     objectErrors = []
     datasetErrors = []
     segmentation_path = []
@@ -241,14 +198,13 @@ def test_segmentation_list(dataset_id, version, object_list, bucket):
 
     SegmentationFound = False
     duplicateFound = False
+    # The S3 key of every segmentation file is looked up
+    lookups = sum(1 for segmentation_object in object_list if get_object_mimetype(segmentation_object) in SEGMENTATION_FILES)
+    keys = DatasetKeys(get_s3_client(), bucket, dataset_id, lookups, len(object_list))
 
     for segmentation_object in object_list:
         # Check if the object is a segmentation file
-        mime_type = segmentation_object.get('additional_mimetype', NOT_SPECIFIED)
-        if mime_type != NOT_SPECIFIED:
-            mime_type = mime_type.get('name')
-        if not mime_type:
-            mime_type = segmentation_object['mimetype'].get('name', NOT_SPECIFIED)
+        mime_type = get_object_mimetype(segmentation_object)
 
         if mime_type in SEGMENTATION_FILES:
             SegmentationFound = True
@@ -260,7 +216,7 @@ def test_segmentation_list(dataset_id, version, object_list, bucket):
                 duplicateFound = True
                 redundant_path.append(full_path)
 
-            error = test_segmentation(dataset_id, version, segmentation_object, bucket)
+            error = test_segmentation(dataset_id, version, segmentation_object, bucket, keys)
             if error:
                 objectErrors.extend(error)
 
@@ -293,6 +249,16 @@ def test_segmentation_list(dataset_id, version, object_list, bucket):
 
     return {"FileReports": fileReports, "DatasetErrors": datasetErrors, "SegmentationFound": SegmentationFound}
                 
+# The path mapping found for a dataset, recorded with its report
+def get_mapping_state(dataset_id):
+    with mapping_lock:
+        return path_mapping.get(dataset_id)
+
+def restore_mapping_state(dataset_id, state):
+    if state:
+        with mapping_lock:
+            path_mapping[dataset_id] = state
+
 #Test the dataset 
 def test_datasets_information(dataset):
     report = {
@@ -333,17 +299,23 @@ class SegmentationDatasetFilesTest(unittest.TestCase):
     def __init__(self, *args, **kwds):
         super().__init__(*args, **kwds)
 
+    @profiled('reports/segmentation_profile', PROFILED_FUNCTIONS)
     def test_files_information(self):
         global path_mapping
-        start = 0
         size = 20
-        keepGoing = True
         totalSize = 0
         reportOutput = 'reports/segmentation_reports.json'
+        reportStreamOutput = 'reports/segmentation_reports.jsonl'
+        summaryOutput = 'reports/segmentation_reports_summary.json'
         pathMappingOutput = 'reports/segmentation_path_mapping.json'
+        fingerprintOutput = 'reports/segmentation_fingerprints.json'
         reports = {'Tested': 0, 'Failed': 0, 'FailedIds':[], 'Datasets':[]}
         testSize = 2000
         totalSegmentation = 0
+        fingerprints = FingerprintStore(fingerprintOutput, reportStreamOutput)
+        stream = ReportStream(reportStreamOutput, fingerprints=fingerprints)
+        # Only the calls of this suite are in its Timing section
+        get_endpoint_timer().reset()
 
         # '''
         # Test selected datasets
@@ -389,35 +361,29 @@ class SegmentationDatasetFilesTest(unittest.TestCase):
         '''
         Test all the datasets
         '''
-        while keepGoing :
-            scicrunch_response = get_datasets(start, size)
-            self.assertEqual(200, scicrunch_response.status_code)
-
-            data = scicrunch_response.json()
-
-            #No more result, stop
-            if size > len(data['hits']['hits']):
-                keepGoing = False
+        # Each report is on disk as soon as its dataset is validated, the mappings
+        # found by a previous run are restored for the datasets it already reported
+        for report, state in stream.entries():
+            restore_mapping_state(report['Id'], state)
+        totalSize = len(stream.ids)
+        validate = partial(validate_dataset, fingerprints, test_datasets_information, restore_state=restore_mapping_state)
+        try:
+            for report in validate_datasets(stream.pending(get_snapshot_datasets(size, search_after=stream.cursor)), validate):
+                stream.write(report, get_mapping_state(report['Id']))
+                totalSize = totalSize + 1
+
+                if totalSize >= testSize:
+                    break
+        finally:
+            stream.close()
+
+        # Generate the report from the stream
+        for report in stream.reports():
+            if 'Segmentation' in report and report['Segmentation']:
+                totalSegmentation = totalSegmentation + 1
+            if dataset_failed(report):
+                reports['FailedIds'].append(report['Id'])
 
-            #keepGoing= False
-
-            start = start + size
-
-            for dataset in data['hits']['hits']:
-                report = test_datasets_information(dataset)
-                if 'Segmentation' in report and report['Segmentation']:
-                    totalSegmentation = totalSegmentation + 1
-                print(f"Reports generated for {report['Id']}")
-                if len(report['Errors']) > 0 or report['ObjectErrors']['Total'] > 0:
-                    reports['FailedIds'].append(report['Id'])
-                    reports['Datasets'].append(report)
-
-            totalSize = totalSize + len(data['hits']['hits'])
-
-            if totalSize >= testSize:
-                keepGoing = False
-
-        # Generate the report
         reports['Tested'] = totalSize
         reports['Tested Datasets with Segmentation'] = totalSegmentation
         print(f"Number of datasets tested: {reports['Tested']}")
@@ -426,15 +392,19 @@ class SegmentationDatasetFilesTest(unittest.TestCase):
         if reports['Failed'] > 0:
             print(f"Failed Datasets: {reports['FailedIds']}")
             
-        os.makedirs(os.path.dirname(reportOutput), exist_ok=True)
-        with open(reportOutput, 'w') as outfile:
-            json.dump(reports, outfile, indent=4)
+        reports['Datasets'] = stream.reports(dataset_failed)
+        reports['Timing'] = get_endpoint_timer().stats()
+        stream.write_summary(summaryOutput, reports)
+        dump_report(reports, reportOutput)
         
         # This will generate a mapping file to list all required file path changes
         os.makedirs(os.path.dirname(pathMappingOutput), exist_ok=True)
         with open(pathMappingOutput, 'w') as outfile:
             json.dump(path_mapping, outfile, indent=4)
+
+        fingerprints.save()
     
+        print(f"Pennsieve cache: {get_pennsieve_cache().stats()}")
         print(f"Full report has been generated at {reportOutput}")
 
         self.assertEqual(0, len(reports['FailedIds']))
@@ -1,27 +1,24 @@
 import unittest
-import requests
-import botocore
-import boto3
-import json
 import urllib.parse
-import os
 
-from urllib.parse import urljoin
+from functools import partial
 
-from tests.config import Config
+from tests.clients import get_endpoint_timer, get_s3_client
+from tests.profiling import profiled
+from tests.scicrunch import get_snapshot_datasets
+from tests.slow_tests.incremental import FingerprintStore, validate_dataset
+from tests.slow_tests.report_stream import ReportStream, dataset_failed, dump_report
+from tests.slow_tests.runner import validate_datasets
+from tests.slow_tests.s3_keys import DatasetKeys
+
+# Functions timed when the suite is profiled or benchmarked
+PROFILED_FUNCTIONS = ['test_datasets_information', 'test_obj_list', 'testObj', 'getFileResponse', 'getDataciteReport']
 
 error_report = {}
 doc_link = 'https://github.com/ABI-Software/scicrunch-knowledge-testing/tree/doc_v1'
 #the following should either be a falsy value or a string containg dataset number
 checkDatasetOnly = False
 
-s3 = boto3.client(
-    "s3",
-    aws_access_key_id=Config.AWS_KEY,
-    aws_secret_access_key=Config.AWS_SECRET,
-    region_name="us-east-1",
-)
-
 S3_BUCKET_NAME = "pennsieve-prod-discover-publish-use1"
 
 CONTEXT_FILE = 'abi-context-file'
@@ -49,42 +46,17 @@ TEST_MIME_TYPES = {
 }
 
 
-def getDatasets(start, size):
-
-    headers = {'accept': 'application/json'}
-    params = {'api_key': Config.SCICRUNCH_API_KEY}
-
-    scicrunch_host = Config.SCICRUNCH_API_HOST + '/'
-
-    scicrunch_request = {
-        "from": start,
-        "size": size,
-        #For checking specific dataset
-
-        "_source": [
-            "item.curie",
-            "item.name",
-            "item.types",
-            "objects.datacite",
-            "objects.additional_mimetype",
-            "objects.dataset",
-            "pennsieve.version",
-            "pennsieve.identifier",
-            "pennsieve.uri"
-        ]
-    }
-
+def getDatasetsQuery():
+    #For checking specific dataset
     if checkDatasetOnly:
-        query = {
+        return {
             "match": {
                 "pennsieve.identifier.aggregate": {
                     "query": checkDatasetOnly
                 }
            }
         }
-        scicrunch_request["query"] = query
-
-    return requests.post(urljoin(scicrunch_host, '_search?preference=abiknowledgetesting'), json=scicrunch_request, params=params, headers=headers)
+    return None
 
 def extract_bucket_name(original_name):
     return original_name.split('/')[2]
@@ -103,30 +75,21 @@ def map_mime_type(mime_type):
 
     return NOT_SPECIFIED
 
-#Get file header response from s3 bucket
-def getFileResponse(localPath, path, mime_type, bucket):
-    try:
-        head_response = s3.head_object(
-            Bucket=bucket,
-            Key=path,
-            RequestPayer="requester"
-        )
-
-        if head_response and 'ResponseMetadata' in head_response \
-            and 200 == head_response['ResponseMetadata']['HTTPStatusCode']:
-            pass
-        else:
-            return {
-                'Mimetype': mime_type,
-                'Path': localPath,
-                'Reason': 'Invalid response',
-                'ReasonDetails': doc_link + '#reason-invalid-response'
-            }
-    except botocore.exceptions.ClientError as error:
+#Check the file exists in the s3 bucket
+def getFileResponse(localPath, path, mime_type, keys):
+    reason = keys.find(path)
+    if reason == 'Invalid response':
         return {
             'Mimetype': mime_type,
             'Path': localPath,
-            'Reason': f"{error}",
+            'Reason': reason,
+            'ReasonDetails': doc_link + '#reason-invalid-response'
+        }
+    elif reason:
+        return {
+            'Mimetype': mime_type,
+            'Path': localPath,
+            'Reason': reason,
             'ReasonDetails': doc_link + '#reason-an-error-occurred-404-when-calling-the-headobject-operation-not-found'
         }
     return None
@@ -138,8 +101,17 @@ def getObjectMimeType(obj):
         mime_type = mime_type.get('name')
     return  mime_type
 
+#Index the objects by their path, built once per dataset for datacite and thumbnail checks
+def buildPathIndex(obj_list):
+    pathIndex = {}
+    for item in obj_list:
+        if 'dataset' in item and 'path' in item['dataset']:
+            #Keep the first object with the path
+            pathIndex.setdefault(item['dataset']['path'], item)
+    return pathIndex
+
 #Check if any of the item in isSourceOf is a thumbnail for the object
-def checkForThumbnail(obj, obj_list):
+def checkForThumbnail(obj, pathIndex):
     local_mapped_type = map_mime_type(getObjectMimeType(obj))
     if local_mapped_type == THUMBNAIL_IMAGE:
         #Thumbnail found
@@ -153,14 +125,14 @@ def checkForThumbnail(obj, obj_list):
                 if 'relative' in isSourceOf and 'path' in isSourceOf['relative']:
                     for path in isSourceOf['relative']['path']:
                         actualPath = urllib.parse.urljoin(localPath, path)
-                        found = next((i for i, item in enumerate(obj_list) if item['dataset']['path'] == actualPath), None)
-                        if found and map_mime_type(getObjectMimeType(obj_list[found])):
+                        found = pathIndex.get(actualPath)
+                        if found is not None and map_mime_type(getObjectMimeType(found)):
                             return True
     
     return False
 
 #Generate report for datacite in the object
-def getDataciteReport(obj_list, obj, mapped_mimetype, filePath):
+def getDataciteReport(pathIndex, obj, mapped_mimetype, filePath):
     keysToCheck = { 'isDerivedFrom': 0, 'isSourceOf': 0}
     reports = {'TotalErrors':0, 'ThumbnailError': 'None', 'ItemTested':0, 'isDerivedFrom': [], 'isSourceOf': [] }
     thumbnailFound = False
@@ -175,8 +147,8 @@ def getDataciteReport(obj_list, obj, mapped_mimetype, filePath):
                         reports['ItemTested'] += 1
                         try:
                             actualPath = urllib.parse.urljoin(filePath, path)
-                            found = next((i for i, item in enumerate(obj_list) if item['dataset']['path'] == actualPath), None)
-                            if found == None:
+                            found = pathIndex.get(actualPath)
+                            if found is None:
                                 reports[key].append(
                                     {
                                         'RelativePath': path,
@@ -187,7 +159,7 @@ def getDataciteReport(obj_list, obj, mapped_mimetype, filePath):
                                 reports['TotalErrors'] +=1
                             elif key == 'isSourceOf':
                                 #Check for thumbnail
-                                thumbnailFound = checkForThumbnail(obj_list[found], obj_list)
+                                thumbnailFound = checkForThumbnail(found, pathIndex)
                         except:
                             reports[key].append(
                                 {
@@ -211,15 +183,15 @@ def getDataciteReport(obj_list, obj, mapped_mimetype, filePath):
     return reports
 
 #Test object to check for any possible error
-def testObj(obj_list, obj, mime_type, mapped_mime_type, prefix, bucket):
+def testObj(pathIndex, obj, mime_type, mapped_mime_type, id, keys):
     dataciteReport = None
     fileResponse = None
 
     if 'dataset' in obj and 'path' in obj['dataset']:
         localPath = obj['dataset']['path']
-        path = f"{prefix}/{localPath}"
-        fileResponse = getFileResponse(localPath, path, mime_type, bucket)
-        dataciteReport = getDataciteReport(obj_list, obj, mapped_mime_type, localPath)
+        path = f"{id}/files/{localPath}"
+        fileResponse = getFileResponse(localPath, path, mime_type, keys)
+        dataciteReport = getDataciteReport(pathIndex, obj, mapped_mime_type, localPath)
         if dataciteReport['TotalErrors'] > 0:
             if fileResponse == None:
                 fileResponse = {
@@ -239,10 +211,13 @@ def testObj(obj_list, obj, mime_type, mapped_mime_type, prefix, bucket):
 
 def test_obj_list(id, version, obj_list, scaffoldTag, bucket):
     objectErrors = []
-    prefix = f"{id}/files"
     foundScaffold = False
     foundContextInfo = False
     datasetErrors = []
+    pathIndex = buildPathIndex(obj_list)
+    # testObj looks up the S3 key of every object with a path and a mimetype to test
+    lookups = sum(1 for obj in obj_list if 'path' in obj.get('dataset', {}) and map_mime_type(getObjectMimeType(obj)) != NOT_SPECIFIED)
+    keys = DatasetKeys(get_s3_client(), bucket, id, lookups, len(obj_list))
 
     for obj in obj_list:
         mime_type = getObjectMimeType(obj)
@@ -254,7 +229,7 @@ def test_obj_list(id, version, obj_list, scaffoldTag, bucket):
                 foundScaffold = True
             if mapped_mime_type == CONTEXT_FILE:
                 foundContextInfo = True
-            error = testObj(obj_list, obj, mime_type, mapped_mime_type, prefix, bucket)
+            error = testObj(pathIndex, obj, mime_type, mapped_mime_type, id, keys)
             if error:
                 objectErrors.append(error)
     
@@ -327,49 +302,45 @@ class SciCrunchDatasetFilesTest(unittest.TestCase):
     def __init__(self, *args, **kwds):
         super().__init__(*args, **kwds)
 
+    @profiled('reports/error_profile', PROFILED_FUNCTIONS)
     def test_files_information(self):
 
-        start = 0
         size = 20
-        keepGoing = True
-        totalSize = 0
         reportOutput = 'reports/error_reports.json'
+        reportStreamOutput = 'reports/error_reports.jsonl'
+        summaryOutput = 'reports/error_reports_summary.json'
+        fingerprintOutput = 'reports/error_fingerprints.json'
         reports = {'Tested': 0, 'Failed': 0, 'FailedIds':[], 'Datasets':[]}
+        fingerprints = FingerprintStore(fingerprintOutput, reportStreamOutput)
+        stream = ReportStream(reportStreamOutput, fingerprints=fingerprints)
+        # Only the calls of this suite are in its Timing section
+        get_endpoint_timer().reset()
+
+        # Each report is on disk as soon as its dataset is validated
+        try:
+            for report in validate_datasets(stream.pending(get_snapshot_datasets(size, getDatasetsQuery(), stream.cursor)), partial(validate_dataset, fingerprints, test_datasets_information)):
+                stream.write(report)
+        finally:
+            stream.close()
+
+        # Generate the report from the stream
+        for report in stream.reports():
+            if dataset_failed(report):
+                reports['FailedIds'].append(report['Id'])
+            reports['Tested'] = reports['Tested'] + 1
 
-
-        while keepGoing:
-            scicrunch_response = getDatasets(start, size)
-            self.assertEqual(200, scicrunch_response.status_code)
-
-            data = scicrunch_response.json()
-
-            #No more result, stop
-            if size > len(data['hits']['hits']):
-                keepGoing = False
-
-            #keepGoing= False
-
-            start = start + size
-
-            for dataset in data['hits']['hits']:
-                report = test_datasets_information(dataset)
-                print(f"Reports generated for {report['Id']}")
-                if len(report['Errors']) > 0 or report['ObjectErrors']['Total'] > 0:
-                    reports['FailedIds'].append(report['Id'])
-                    reports['Datasets'].append(report)
-
-
-        # Generate the report
-        reports['Tested'] = totalSize
         print(f"Number of datasets tested: {reports['Tested']}")
         reports['Failed'] = len(reports['FailedIds'])
         print(f"Number of dataset with erros: {reports['Failed']}")
         if reports['Failed'] > 0:
             print(f"Failed Datasets: {reports['FailedIds']}")
             
-        os.makedirs(os.path.dirname(reportOutput), exist_ok=True)
-        with open(reportOutput, 'w') as outfile:
-            json.dump(reports, outfile, indent=4)
+        reports['Datasets'] = stream.reports(dataset_failed)
+        reports['Timing'] = get_endpoint_timer().stats()
+        stream.write_summary(summaryOutput, reports)
+        dump_report(reports, reportOutput)
+
+        fingerprints.save()
     
         print(f"Full report has been generated at {reportOutput}")
 
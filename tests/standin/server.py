@@ -0,0 +1,306 @@
+'''
+Local stand-ins of the services called by the suites, served from a corpus
+directory such as the one written by tests.benchmarks.synthetic_corpus or the
+reports directory of a previous run holding scicrunch_snapshot.jsonl:
+
+  python -m tests.standin.server reports/synthetic --port 8000
+
+prints the settings pointing the suites at the stand-ins. Every service is
+served under its own path of one threading HTTP server:
+
+  /scicrunch    Elastic _search, with search_after and the DOI composite aggregation
+  /discover     Pennsieve Discover datasets, metrics, files/browse and metadata
+  /biolucida    Biolucida image/info and imagemap/search_dataset
+  /neurolucida  Neurolucida thumbnail
+  /<bucket>     S3 ListObjectsV2 and HeadObject with path style addressing
+'''
+
+import argparse
+import bisect
+import json
+import time
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, quote, unquote, urlsplit
+from xml.sax.saxutils import escape
+
+from tests.standin.state import StandinState
+
+S3_MAX_KEYS = 1000
+# A transparent 1x1 PNG
+THUMBNAIL = bytes.fromhex(
+    '89504e470d0a1a0a0000000d4948445200000001000000010806000000'
+    '1f15c4890000000d49444154789c6360000002000001e5273bd20000000049454e44ae426082'
+)
+
+def filter_source(value, paths):
+    # Keep the fields named by the dotted paths of _source, through lists of objects
+    if not paths or any(len(path) == 0 for path in paths):
+        return value
+    if isinstance(value, list):
+        return [filter_source(item, paths) for item in value]
+    if not isinstance(value, dict):
+        return value
+
+    result = {}
+    for key in value:
+        nested = [path[1:] for path in paths if path[0] == key]
+        if nested:
+            result[key] = filter_source(value[key], nested)
+    return result
+
+def query_identifier(query):
+    # The suites only query a single dataset, with match or term on its identifier
+    for kind in ('match', 'term'):
+        if kind in query and 'pennsieve.identifier.aggregate' in query[kind]:
+            value = query[kind]['pennsieve.identifier.aggregate']
+            if isinstance(value, dict):
+                value = value.get('query', value.get('value'))
+            return str(value)
+    raise ValueError(f'Unsupported query: {json.dumps(query)}')
+
+
+class StandinServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, state, latency=0):
+        self.state = state
+        self.latency = latency
+        super().__init__(address, StandinHandler)
+
+
+class StandinHandler(BaseHTTPRequestHandler):
+    # Keep-alive, so the connection pools of the suites are exercised as with the services
+    protocol_version = 'HTTP/1.1'
+    # Headers and body are written separately, without this every response waits for a delayed ACK
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_body(self, status, body=b'', contentType='application/json'):
+        self.send_response(status)
+        self.send_header('Content-Type', contentType)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+
+    def send_json(self, status, value):
+        self.send_body(status, json.dumps(value).encode('utf-8'))
+
+    def send_xml(self, status, xml):
+        self.send_body(status, ('<?xml version="1.0" encoding="UTF-8"?>\n' + xml).encode('utf-8'), 'application/xml')
+
+    def read_json(self):
+        length = int(self.headers.get('Content-Length', 0))
+        return json.loads(self.rfile.read(length)) if length else {}
+
+    def dispatch(self):
+        if self.server.latency:
+            time.sleep(self.server.latency)
+
+        parts = urlsplit(self.path)
+        self.query = {name: values[-1] for name, values in parse_qs(parts.query, keep_blank_values=True).items()}
+        service, _, rest = parts.path.lstrip('/').partition('/')
+        route = [unquote(part) for part in rest.split('/')] if rest else []
+        handler = {
+            'scicrunch': self.scicrunch,
+            'discover': self.discover,
+            'biolucida': self.biolucida,
+            'neurolucida': self.neurolucida
+        }.get(service)
+
+        try:
+            if handler:
+                handler(route)
+            else:
+                self.s3(unquote(service), unquote(rest))
+        except (KeyError, ValueError) as e:
+            self.send_json(400, {'message': str(e)})
+
+    do_GET = dispatch
+    do_POST = dispatch
+    do_HEAD = dispatch
+
+    def not_found(self, message='Not found'):
+        self.send_json(404, {'message': message})
+
+    def scicrunch(self, route):
+        if route != ['_search']:
+            return self.not_found()
+
+        state = self.server.state
+        request = self.read_json()
+        if 'aggregations' in request:
+            return self.send_json(200, self.doi_aggregation(request['aggregations']['doi']['composite']))
+
+        size = request.get('size', 10)
+        if 'query' in request:
+            index = state.hitIndex.get(query_identifier(request['query']))
+            positions = [] if index is None else [index]
+        else:
+            start = state.search_after(request['search_after']) if 'search_after' in request else 0
+            positions = range(start, min(start + size, len(state.hitLines)))
+
+        source = request.get('_source')
+        paths = [field.split('.') for field in source] if source else None
+        total = len(positions) if 'query' in request else len(state.hitLines)
+        hits = []
+        for position in positions[:size]:
+            hit = state.hit(position)
+            hit['_source'] = filter_source(hit['_source'], paths)
+            hits.append(hit)
+
+        self.send_json(200, {
+            'took': 1,
+            'timed_out': False,
+            'hits': {'total': {'value': total, 'relation': 'eq'}, 'hits': hits}
+        })
+
+    def doi_aggregation(self, composite):
+        curies = self.server.state.curies
+        start = 0
+        if 'after' in composite:
+            start = bisect.bisect_right(curies, composite['after']['curie'])
+        buckets = [{'key': {'curie': curie}, 'doc_count': 1} for curie in curies[start:start + composite.get('size', 10)]]
+
+        aggregation = {'buckets': buckets}
+        if buckets:
+            aggregation['after_key'] = buckets[-1]['key']
+        return {'took': 1, 'hits': {'hits': []}, 'aggregations': {'doi': aggregation}}
+
+    def discover(self, route):
+        state = self.server.state
+        if route == ['datasets']:
+            limit = int(self.query.get('limit', 10))
+            offset = int(self.query.get('offset', 0))
+            return self.send_json(200, {
+                'limit': limit,
+                'offset': offset,
+                'totalCount': len(state.datasets),
+                'datasets': state.datasets[offset:offset + limit]
+            })
+
+        if len(route) == 4 and route[0] == 'organizations' and route[2:] == ['datasets', 'metrics']:
+            return self.send_json(200, {'datasets': [{'id': dataset['id']} for dataset in state.datasets]})
+
+        if len(route) >= 5 and route[0] == 'datasets' and route[2] == 'versions':
+            dataset = state.dataset_state(route[1])
+            if dataset is None or str(dataset['Version']) != route[3]:
+                return self.not_found(f'Dataset {route[1]} version {route[3]} not found')
+            if route[4:] == ['files', 'browse']:
+                files = dataset['Folders'].get(self.query.get('path', 'files'), [])
+                return self.send_json(200, {'totalCount': len(files), 'files': files})
+            if route[4:] == ['metadata']:
+                return self.send_json(200, {'id': dataset['Dataset'], 'version': dataset['Version'], 'files': dataset['Files']})
+
+        self.not_found()
+
+    def biolucida(self, route):
+        state = self.server.state
+        if len(route) == 3 and route[:2] == ['image', 'info']:
+            image = state.image(route[2])
+            if image is None:
+                return self.not_found(f'Image {route[2]} not found')
+            return self.send_json(200, image)
+
+        if len(route) == 4 and route[:3] == ['imagemap', 'search_dataset', 'discover']:
+            dataset = state.dataset_state(route[3])
+            if dataset is None or not dataset['Images']:
+                return self.send_json(200, {'status': 'error', 'message': 'No images found for this dataset'})
+            return self.send_json(200, {
+                'status': 'success',
+                'dataset_images': [{'image_id': image['image_id'], 'discover_dataset_id': dataset['Dataset']} for image in dataset['Images']]
+            })
+
+        self.not_found()
+
+    def neurolucida(self, route):
+        if route != ['thumbnail']:
+            return self.not_found()
+
+        dataset = self.server.state.dataset_state(self.query.get('datasetId'))
+        if dataset is None or str(dataset['Version']) != self.query.get('version') or self.query.get('path') not in dataset['Paths']:
+            return self.send_body(404, b'File not found', 'text/plain')
+        self.send_body(200, THUMBNAIL, 'image/png')
+
+    # Path style S3, /<bucket>?list-type=2 and /<bucket>/<key>
+    def s3(self, bucket, key):
+        state = self.server.state
+        if not key and self.command == 'GET' and self.query.get('list-type') == '2':
+            return self.list_objects(bucket)
+
+        if key and self.command == 'HEAD':
+            file = state.find_key(bucket, key)
+            if file is None:
+                return self.send_body(404, contentType='application/xml')
+            self.send_response(200)
+            self.send_header('Content-Type', 'binary/octet-stream')
+            self.send_header('Content-Length', str(file['size']))
+            self.end_headers()
+            return
+
+        self.send_xml(501, '<Error><Code>NotImplemented</Code>'
+                           '<Message>Only ListObjectsV2 and HeadObject are served</Message></Error>')
+
+    def list_objects(self, bucket):
+        state = self.server.state
+        prefix = self.query.get('prefix', '')
+        maxKeys = int(self.query.get('max-keys', S3_MAX_KEYS))
+        after = self.query.get('continuation-token') or self.query.get('start-after')
+        keys = state.list_keys(bucket, prefix, after)
+        truncated = len(keys) > maxKeys
+        keys = keys[:maxKeys]
+
+        # botocore asks for url encoded keys and decodes them
+        encode = quote if self.query.get('encoding-type') == 'url' else str
+        contents = []
+        for key in keys:
+            file = state.find_key(bucket, key)
+            contents.append(f'<Contents><Key>{escape(encode(key))}</Key><Size>{file["size"]}</Size>'
+                            f'<StorageClass>STANDARD</StorageClass></Contents>')
+        xml = (f'<ListBucketResult xmlns="http://s3.amazonaws.com/doc/2006-03-01/">'
+               f'<Name>{escape(bucket)}</Name><Prefix>{escape(encode(prefix))}</Prefix>'
+               f'<KeyCount>{len(keys)}</KeyCount><MaxKeys>{maxKeys}</MaxKeys>'
+               f'<IsTruncated>{"true" if truncated else "false"}</IsTruncated>'
+               + ('<EncodingType>url</EncodingType>' if encode is quote else '')
+               + (f'<NextContinuationToken>{escape(keys[-1])}</NextContinuationToken>' if truncated else '')
+               + ''.join(contents) + '</ListBucketResult>')
+        self.send_xml(200, xml)
+
+# Settings pointing the suites at the stand-ins
+def standin_settings(host, port):
+    base = f'http://{host}:{port}'
+    return {
+        'SCICRUNCH_API_HOST': f'{base}/scicrunch',
+        'PENNSIEVE_API_HOST': f'{base}/discover',
+        'BIOLUCIDA_ENDPOINT': f'{base}/biolucida',
+        'NEUROLUCIDA_HOST': f'{base}/neurolucida',
+        'AWS_S3_ENDPOINT': base
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve local stand-ins of the services called by the suites.')
+    parser.add_argument('path', help='Directory holding scicrunch_snapshot.jsonl and optionally datasets.jsonl')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--latency', type=float, default=0, help='Milliseconds added to every response')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    state = StandinState(args.path)
+    server = StandinServer((args.host, args.port), state, args.latency / 1000)
+    print(f'Serving {len(state.hitLines)} datasets from {args.path}, indexed in {time.perf_counter() - start:.1f}s')
+    for name, value in standin_settings(args.host, server.server_port).items():
+        print(f'export {name}={value}')
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == '__main__':
+    main()
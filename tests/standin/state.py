@@ -0,0 +1,192 @@
+import bisect
+import json
+import os
+import threading
+
+from collections import OrderedDict
+
+# Number of parsed datasets kept in memory
+STATE_CACHE_SIZE = 1024
+
+def sort_key(values):
+    # Missing values sort last, as with "missing": "_last"
+    return tuple((value is None, value if value is not None else '') for value in values)
+
+
+class StandinState(object):
+    '''
+    What the stand-in services serve, read from a corpus directory: the SciCrunch
+    snapshot and, for a synthetic corpus, datasets.jsonl with the files and images
+    of every dataset. Without datasets.jsonl, e.g. for the snapshot of a real run,
+    every object of a dataset is taken to exist on Pennsieve, S3 and Biolucida.
+    Only the position of every line is kept in memory, the lines themselves are
+    read and parsed on demand.
+    '''
+
+    def __init__(self, path):
+        self.snapshotPath = os.path.join(path, 'scicrunch_snapshot.jsonl')
+        self.statePath = os.path.join(path, 'datasets.jsonl')
+        if not os.path.exists(self.statePath):
+            self.statePath = None
+
+        # Hits in snapshot order, which is the SciCrunch sort order
+        self.sortKeys = []
+        self.hitLines = []
+        self.hitIndex = {}
+        self.stateLines = {}
+        self.curies = set()
+        self.datasets = []
+        self.images = {}
+        self.cache = OrderedDict()
+        self.lock = threading.Lock()
+
+        self.snapshotFile = os.open(self.snapshotPath, os.O_RDONLY)
+        self.stateFile = os.open(self.statePath, os.O_RDONLY) if self.statePath else None
+        self.index()
+
+    def index(self):
+        for offset, line in self.lines(self.snapshotPath, skip=1):
+            hit = json.loads(line)
+            source = hit['_source']
+            dataset_id = str(source.get('pennsieve', {}).get('identifier'))
+            self.sortKeys.append(sort_key(hit.get('sort', [dataset_id])))
+            self.hitLines.append((offset, len(line)))
+            self.hitIndex[dataset_id] = len(self.hitLines) - 1
+            curie = source.get('item', {}).get('curie')
+            if curie:
+                self.curies.add(curie)
+            self.datasets.append({
+                'id': int(dataset_id) if dataset_id.isdigit() else dataset_id,
+                'name': source.get('item', {}).get('name'),
+                'doi': curie.split(':', 1)[-1] if curie else None,
+                'version': source.get('pennsieve', {}).get('version', {}).get('identifier')
+            })
+            if not self.statePath:
+                for image in self.derive_state(hit)['Images']:
+                    self.images[image['image_id']] = dataset_id
+
+        if self.statePath:
+            for offset, line in self.lines(self.statePath):
+                state = json.loads(line)
+                self.stateLines[state['Dataset']] = (offset, len(line))
+                for image in state['Images']:
+                    self.images[image['image_id']] = state['Dataset']
+
+        self.curies = sorted(self.curies)
+
+    def lines(self, path, skip=0):
+        offset = 0
+        with open(path, 'rb') as infile:
+            for position, line in enumerate(infile):
+                if position >= skip:
+                    yield offset, line
+                offset = offset + len(line)
+
+    def read(self, fd, position):
+        offset, length = position
+        return json.loads(os.pread(fd, length, offset))
+
+    def hit(self, index):
+        return self.read(self.snapshotFile, self.hitLines[index])
+
+    # Position of the first hit after the given sort values
+    def search_after(self, values):
+        return bisect.bisect_right(self.sortKeys, sort_key(values))
+
+    def derive_state(self, hit):
+        source = hit['_source']
+        pennsieve = source.get('pennsieve', {})
+        dataset_id = str(pennsieve.get('identifier'))
+        bucket = pennsieve.get('uri', 's3://standin').split('/')[2]
+        files = []
+        images = {}
+        for obj in source.get('objects', []):
+            path = obj.get('dataset', {}).get('path')
+            if not path:
+                continue
+            if not path.startswith('files/'):
+                path = 'files/' + path
+            name = path.rsplit('/', 1)[-1]
+            files.append({
+                'path': path,
+                'name': name,
+                'uri': f's3://{bucket}/{dataset_id}/{path}',
+                'fileType': 'XML' if name.lower().endswith('.xml') else 'Other',
+                'size': 1
+            })
+            image_id = obj.get('biolucida', {}).get('identifier')
+            if image_id and image_id not in images:
+                images[image_id] = {'image_id': image_id, 'name': name, 'status': 'success'}
+
+        return {
+            'Dataset': dataset_id,
+            'Version': pennsieve.get('version', {}).get('identifier'),
+            'Bucket': bucket,
+            'Files': files,
+            'Images': list(images.values())
+        }
+
+    # Files and images of a dataset, with the files indexed by path and folder
+    def dataset_state(self, dataset_id):
+        dataset_id = str(dataset_id)
+        with self.lock:
+            if dataset_id in self.cache:
+                self.cache.move_to_end(dataset_id)
+                return self.cache[dataset_id]
+
+        if self.statePath:
+            if dataset_id not in self.stateLines:
+                return None
+            state = self.read(self.stateFile, self.stateLines[dataset_id])
+        else:
+            if dataset_id not in self.hitIndex:
+                return None
+            state = self.derive_state(self.hit(self.hitIndex[dataset_id]))
+
+        state['Paths'] = {file['path']: file for file in state['Files']}
+        state['Folders'] = {}
+        for file in state['Files']:
+            state['Folders'].setdefault(file['path'].rsplit('/', 1)[0], []).append(file)
+        state['Keys'] = sorted(f"{dataset_id}/{file['path']}" for file in state['Files'])
+
+        with self.lock:
+            self.cache[dataset_id] = state
+            while len(self.cache) > STATE_CACHE_SIZE:
+                self.cache.popitem(last=False)
+
+        return state
+
+    def image(self, image_id):
+        dataset_id = self.images.get(image_id)
+        if dataset_id is None:
+            return None
+        for image in self.dataset_state(dataset_id)['Images']:
+            if image['image_id'] == image_id:
+                return image
+        return None
+
+    # S3 keys of a bucket starting with the prefix, the keys are read from the
+    # dataset named by the first part of the prefix
+    def list_keys(self, bucket, prefix, after=None):
+        dataset_id = prefix.split('/', 1)[0]
+        state = self.dataset_state(dataset_id) if dataset_id else None
+        if state is None or state['Bucket'] != bucket:
+            return []
+
+        keys = state['Keys']
+        start = bisect.bisect_right(keys, after) if after else bisect.bisect_left(keys, prefix)
+        result = []
+        for key in keys[start:]:
+            if not key.startswith(prefix):
+                break
+            result.append(key)
+        return result
+
+    def find_key(self, bucket, key):
+        if '/' not in key:
+            return None
+        dataset_id, path = key.split('/', 1)
+        state = self.dataset_state(dataset_id)
+        if state is None or state['Bucket'] != bucket:
+            return None
+        return state['Paths'].get(path)
@@ -0,0 +1,145 @@
+import functools
+import math
+import threading
+import time
+
+from urllib.parse import urlsplit
+
+
+class StageTimer(object):
+    '''
+    Wall clock time spent in named functions, for the benchmarks and profiling.
+    The functions are wrapped in place in their module, so calls made from within
+    the module are timed too. Times are inclusive of the timed functions they call
+    and are summed over all the threads, so with several validation workers the
+    total of a stage can be larger than the run itself.
+    '''
+
+    def __init__(self):
+        self.stages = {}
+        self.lock = threading.Lock()
+
+    def add(self, stage, seconds):
+        with self.lock:
+            count, total = self.stages.get(stage, (0, 0.0))
+            self.stages[stage] = (count + 1, total + seconds)
+
+    def timed(self, stage, function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.add(stage, time.perf_counter() - start)
+
+        return wrapper
+
+    # Time spent waiting for each item of an iterator, e.g. the datasets of a suite
+    def timed_iterator(self, stage, iterator):
+        iterator = iter(iterator)
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                self.add(stage, time.perf_counter() - start)
+            yield item
+
+    def wrap(self, module, names):
+        for name in names:
+            setattr(module, name, self.timed(name, getattr(module, name)))
+
+    def wrap_iterator(self, module, name, stage=None):
+        function = getattr(module, name)
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            return self.timed_iterator(stage or name, function(*args, **kwargs))
+
+        setattr(module, name, wrapper)
+
+    def stats(self):
+        with self.lock:
+            return {
+                stage: {
+                    'Count': count,
+                    'Seconds': round(total, 3),
+                    'Mean': round(total / count, 6)
+                } for stage, (count, total) in sorted(self.stages.items(), key=lambda item: -item[1][1])
+            }
+
+# Nearest rank percentile of sorted values
+def percentile(values, rank):
+    return values[max(0, math.ceil(rank / 100 * len(values)) - 1)]
+
+# The URL of a call with its identifiers and query left out, e.g. datasets/{id}/versions/{id}/files/browse
+def endpoint_template(method, url):
+    parts = urlsplit(url)
+    path = '/'.join('{id}' if segment.isdigit() else segment for segment in parts.path.split('/'))
+    return f'{method.upper()} {parts.scheme}://{parts.netloc}{path}'
+
+
+class EndpointTimer(object):
+    '''
+    Count, bytes, status codes and latency of the outbound calls per endpoint,
+    for the Timing section of the slow suite reports. The latency of a call is
+    measured until its body is read and reported in milliseconds, S3 calls which
+    fail without a response are counted under the status Error.
+    '''
+
+    def __init__(self):
+        self.endpoints = {}
+        self.lock = threading.Lock()
+
+    def add(self, endpoint, status, size, seconds):
+        with self.lock:
+            stats = self.endpoints.setdefault(endpoint, {'Bytes': 0, 'Status': {}, 'Latencies': []})
+            stats['Bytes'] = stats['Bytes'] + size
+            stats['Status'][str(status)] = stats['Status'].get(str(status), 0) + 1
+            stats['Latencies'].append(seconds)
+
+    def reset(self):
+        with self.lock:
+            self.endpoints = {}
+
+    # Response hook of the shared HTTP session
+    def record_response(self, response, *args, **kwargs):
+        start = time.perf_counter()
+        size = len(response.content)
+        seconds = response.elapsed.total_seconds() + time.perf_counter() - start
+        self.add(endpoint_template(response.request.method, response.request.url), response.status_code, size, seconds)
+
+    # before-call and after-call handlers of the S3 client, per operation
+    def start_s3_call(self, model, context, **kwargs):
+        context['Endpoint'] = f'S3 {model.name}'
+        context['EndpointStart'] = time.perf_counter()
+
+    def record_s3_call(self, http_response, context, **kwargs):
+        self.add(context['Endpoint'], http_response.status_code, len(http_response.content),
+                 time.perf_counter() - context['EndpointStart'])
+
+    def record_s3_error(self, context, **kwargs):
+        self.add(context['Endpoint'], 'Error', 0, time.perf_counter() - context['EndpointStart'])
+
+    def stats(self):
+        with self.lock:
+            endpoints = sorted(self.endpoints.items(), key=lambda item: -sum(item[1]['Latencies']))
+            result = {}
+            for endpoint, stats in endpoints:
+                latencies = sorted(stats['Latencies'])
+                result[endpoint] = {
+                    'Count': len(latencies),
+                    'Bytes': stats['Bytes'],
+                    'Status': dict(sorted(stats['Status'].items())),
+                    'Seconds': round(sum(latencies), 3),
+                    'Latency': {
+                        'p50': round(percentile(latencies, 50) * 1000, 1),
+                        'p95': round(percentile(latencies, 95) * 1000, 1),
+                        'p99': round(percentile(latencies, 99) * 1000, 1),
+                        'Max': round(latencies[-1] * 1000, 1)
+                    }
+                }
+            return result